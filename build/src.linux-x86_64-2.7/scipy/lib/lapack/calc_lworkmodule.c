@@ -0,0 +1,1410 @@
+/* File: calc_lworkmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * See http://cens.ioc.ee/projects/f2py2e/
+ * Generation date: Fri Oct 16 23:09:54 2026
+ * $Revision:$
+ * $Date:$
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <string.h>
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *calc_lwork_error;
+static PyObject *calc_lwork_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef char * string;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+\
+#define FAILNULL(p) do {                                            \
+    if ((p) == NULL) {                                              \
+        PyErr_SetString(PyExc_MemoryError, "NULL pointer found");   \
+        goto capi_fail;                                             \
+    }                                                               \
+} while (0)
+
+#define STRINGMALLOC(str,len)\
+  if ((str = (string)malloc(sizeof(char)*(len+1))) == NULL) {\
+    PyErr_SetString(PyExc_MemoryError, "out of memory");\
+    goto capi_fail;\
+  } else {\
+    (str)[len] = '\0';\
+  }
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define STRINGFREE(str) do {if (!(str == NULL)) free(str);} while (0)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+  PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+  fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define STRINGCOPYN(to,from,buf_size)                           \
+    do {                                                        \
+        int _m = (buf_size);                                    \
+        char *_to = (to);                                       \
+        char *_from = (from);                                   \
+        FAILNULL(_to); FAILNULL(_from);                         \
+        (void)strncpy(_to, _from, sizeof(char)*_m);             \
+        _to[_m-1] = '\0';                                      \
+        /* Padding with spaces instead of nulls */              \
+        for (_m -= 2; _m >= 0 && _to[_m] == '\0'; _m--) {      \
+            _to[_m] = ' ';                                      \
+        }                                                       \
+    } while (0)
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+  PyObject* tmp = NULL;
+  if (PyInt_Check(obj)) {
+    *v = (int)PyInt_AS_LONG(obj);
+    return 1;
+  }
+  tmp = PyNumber_Int(obj);
+  if (tmp) {
+    *v = PyInt_AS_LONG(tmp);
+    Py_DECREF(tmp);
+    return 1;
+  }
+  if (PyComplex_Check(obj))
+    tmp = PyObject_GetAttrString(obj,"real");
+  else if (PyString_Check(obj) || PyUnicode_Check(obj))
+    /*pass*/;
+  else if (PySequence_Check(obj))
+    tmp = PySequence_GetItem(obj,0);
+  if (tmp) {
+    PyErr_Clear();
+    if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+    Py_DECREF(tmp);
+  }
+  {
+    PyObject* err = PyErr_Occurred();
+    if (err==NULL) err = calc_lwork_error;
+    PyErr_SetString(err,errmess);
+  }
+  return 0;
+}
+
+static int string_from_pyobj(string *str,int *len,const string inistr,PyObject *obj,const char *errmess) {
+  PyArrayObject *arr = NULL;
+  PyObject *tmp = NULL;
+#ifdef DEBUGCFUNCS
+fprintf(stderr,"string_from_pyobj(str='%s',len=%d,inistr='%s',obj=%p)\n",(char*)str,*len,(char *)inistr,obj);
+#endif
+  if (obj == Py_None) {
+    if (*len == -1)
+      *len = strlen(inistr); /* Will this cause problems? */
+    STRINGMALLOC(*str,*len);
+    STRINGCOPYN(*str,inistr,*len+1);
+    return 1;
+  }
+  if (PyArray_Check(obj)) {
+    if ((arr = (PyArrayObject *)obj) == NULL)
+      goto capi_fail;
+    if (!ISCONTIGUOUS(arr)) {
+      PyErr_SetString(PyExc_ValueError,"array object is non-contiguous.");
+      goto capi_fail;
+    }
+    if (*len == -1)
+      *len = (PyArray_ITEMSIZE(arr))*PyArray_SIZE(arr);
+    STRINGMALLOC(*str,*len);
+    STRINGCOPYN(*str,PyArray_DATA(arr),*len+1);
+    return 1;
+  }
+  if (PyString_Check(obj)) {
+    tmp = obj;
+    Py_INCREF(tmp);
+  }
+#if PY_VERSION_HEX >= 0x03000000
+  else if (PyUnicode_Check(obj)) {
+    tmp = PyUnicode_AsASCIIString(obj);
+  }
+  else {
+    PyObject *tmp2;
+    tmp2 = PyObject_Str(obj);
+    if (tmp2) {
+      tmp = PyUnicode_AsASCIIString(tmp2);
+      Py_DECREF(tmp2);
+    }
+    else {
+      tmp = NULL;
+    }
+  }
+#else
+  else {
+    tmp = PyObject_Str(obj);
+  }
+#endif
+  if (tmp == NULL) goto capi_fail;
+  if (*len == -1)
+    *len = PyString_GET_SIZE(tmp);
+  STRINGMALLOC(*str,*len);
+  STRINGCOPYN(*str,PyString_AS_STRING(tmp),*len+1);
+  Py_DECREF(tmp);
+  return 1;
+capi_fail:
+  Py_XDECREF(tmp);
+  {
+    PyObject* err = PyErr_Occurred();
+    if (err==NULL) err = calc_lwork_error;
+    PyErr_SetString(err,errmess);
+  }
+  return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(gehrd,GEHRD)(int*,int*,string,int*,int*,int*,size_t);
+extern void F_FUNC(gesdd,GESDD)(int*,int*,char*,int*,int*,int*);
+extern void F_FUNC(gelss,GELSS)(int*,int*,char*,int*,int*,int*);
+extern void F_FUNC(getri,GETRI)(int*,int*,char*,int*);
+extern void F_FUNC(geev,GEEV)(int*,int*,char*,int*,int*,int*);
+extern void F_FUNC(heev,HEEV)(int*,int*,char*,int*,int*);
+extern void F_FUNC(syev,SYEV)(int*,int*,char*,int*,int*);
+extern void F_FUNC(gees,GEES)(int*,int*,char*,int*,int*);
+extern void F_FUNC(geqrf,GEQRF)(int*,int*,char*,int*,int*);
+extern void F_FUNC(gqr,GQR)(int*,int*,char*,int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** gehrd ***********************************/
+static char doc_f2py_rout_calc_lwork_gehrd[] = "\
+minwrk,maxwrk = gehrd(prefix,n,[lo,hi])\n\nWrapper for ``gehrd``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"n : input int\n"
+"\nOther Parameters\n----------------\n"
+"lo : input int, optional\n    Default: 0\n"
+"hi : input int, optional\n    Default: n-1\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(gehrd,GEHRD)(int*,int*,string,int*,int*,int*,size_t); */
+static PyObject *f2py_rout_calc_lwork_gehrd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,string,int*,int*,int*,size_t)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int lo = 0;
+  PyObject *lo_capi = Py_None;
+  int hi = 0;
+  PyObject *hi_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","n","lo","hi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OO:calc_lwork.gehrd",\
+    capi_kwlist,&prefix_capi,&n_capi,&lo_capi,&hi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable min_lwork */
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.gehrd() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable max_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.gehrd to C string");
+  if (f2py_success) {
+  /* Processing variable lo */
+  if (lo_capi == Py_None) lo = 0; else
+    f2py_success = int_from_pyobj(&lo,lo_capi,"calc_lwork.gehrd() 1st keyword (lo) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable hi */
+  if (hi_capi == Py_None) hi = n-1; else
+    f2py_success = int_from_pyobj(&hi,hi_capi,"calc_lwork.gehrd() 2nd keyword (hi) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&lo,&hi,slen(prefix));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of hi*/
+  /* End of cleaning variable hi */
+  } /*if (f2py_success) of lo*/
+  /* End of cleaning variable lo */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable max_lwork */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable min_lwork */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of gehrd ********************************/
+
+/*********************************** gesdd ***********************************/
+static char doc_f2py_rout_calc_lwork_gesdd[] = "\
+minwrk,maxwrk = gesdd(prefix,m,n,[compute_uv])\n\nWrapper for ``gesdd``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"m : input int\n"
+"n : input int\n"
+"\nOther Parameters\n----------------\n"
+"compute_uv : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(gesdd,GESDD)(int*,int*,char*,int*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_gesdd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int m = 0;
+  PyObject *m_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int compute_uv = 0;
+  PyObject *compute_uv_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","m","n","compute_uv",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|O:calc_lwork.gesdd",\
+    capi_kwlist,&prefix_capi,&m_capi,&n_capi,&compute_uv_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable min_lwork */
+  /* Processing variable m */
+    f2py_success = int_from_pyobj(&m,m_capi,"calc_lwork.gesdd() 2nd argument (m) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.gesdd() 3rd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.gesdd to C string");
+  if (f2py_success) {
+  /* Processing variable max_lwork */
+  /* Processing variable compute_uv */
+  if (compute_uv_capi == Py_None) compute_uv = 1; else
+    f2py_success = int_from_pyobj(&compute_uv,compute_uv_capi,"calc_lwork.gesdd() 1st keyword (compute_uv) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n,&compute_uv);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n,&compute_uv,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of compute_uv*/
+  /* End of cleaning variable compute_uv */
+  /* End of cleaning variable max_lwork */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of m*/
+  /* End of cleaning variable m */
+  /* End of cleaning variable min_lwork */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of gesdd ********************************/
+
+/*********************************** gelss ***********************************/
+static char doc_f2py_rout_calc_lwork_gelss[] = "\
+minwrk,maxwrk = gelss(prefix,m,n,nrhs)\n\nWrapper for ``gelss``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"m : input int\n"
+"n : input int\n"
+"nrhs : input int\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(gelss,GELSS)(int*,int*,char*,int*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_gelss(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int m = 0;
+  PyObject *m_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int nrhs = 0;
+  PyObject *nrhs_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","m","n","nrhs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:calc_lwork.gelss",\
+    capi_kwlist,&prefix_capi,&m_capi,&n_capi,&nrhs_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable min_lwork */
+  /* Processing variable nrhs */
+    f2py_success = int_from_pyobj(&nrhs,nrhs_capi,"calc_lwork.gelss() 4th argument (nrhs) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+    f2py_success = int_from_pyobj(&m,m_capi,"calc_lwork.gelss() 2nd argument (m) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.gelss to C string");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.gelss() 3rd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable max_lwork */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n,&nrhs);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n,&nrhs,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable max_lwork */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  } /*if (f2py_success) of m*/
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of nrhs*/
+  /* End of cleaning variable nrhs */
+  /* End of cleaning variable min_lwork */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of gelss ********************************/
+
+/*********************************** getri ***********************************/
+static char doc_f2py_rout_calc_lwork_getri[] = "\
+minwrk,maxwrk = getri(prefix,n)\n\nWrapper for ``getri``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"n : input int\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(getri,GETRI)(int*,int*,char*,int*); */
+static PyObject *f2py_rout_calc_lwork_getri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:calc_lwork.getri",\
+    capi_kwlist,&prefix_capi,&n_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable max_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.getri to C string");
+  if (f2py_success) {
+  /* Processing variable min_lwork */
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.getri() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&n);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&n,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable min_lwork */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable max_lwork */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of getri ********************************/
+
+/************************************ geev ************************************/
+static char doc_f2py_rout_calc_lwork_geev[] = "\
+minwrk,maxwrk = geev(prefix,n,[compute_vl,compute_vr])\n\nWrapper for ``geev``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"n : input int\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(geev,GEEV)(int*,int*,char*,int*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_geev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","n","compute_vl","compute_vr",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OO:calc_lwork.geev",\
+    capi_kwlist,&prefix_capi,&n_capi,&compute_vl_capi,&compute_vr_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"calc_lwork.geev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable min_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.geev to C string");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.geev() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable max_lwork */
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"calc_lwork.geev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&compute_vl,&compute_vr);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&compute_vl,&compute_vr,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  /* End of cleaning variable max_lwork */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable min_lwork */
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of geev ********************************/
+
+/************************************ heev ************************************/
+static char doc_f2py_rout_calc_lwork_heev[] = "\
+minwrk,maxwrk = heev(prefix,n,[lower])\n\nWrapper for ``heev``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"n : input int\n"
+"\nOther Parameters\n----------------\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(heev,HEEV)(int*,int*,char*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_heev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","n","lower",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|O:calc_lwork.heev",\
+    capi_kwlist,&prefix_capi,&n_capi,&lower_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"calc_lwork.heev() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable min_lwork */
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.heev() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable max_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.heev to C string");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&lower);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&lower,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable max_lwork */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable min_lwork */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of heev ********************************/
+
+/************************************ syev ************************************/
+static char doc_f2py_rout_calc_lwork_syev[] = "\
+minwrk,maxwrk = syev(prefix,n,[lower])\n\nWrapper for ``syev``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"n : input int\n"
+"\nOther Parameters\n----------------\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(syev,SYEV)(int*,int*,char*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_syev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","n","lower",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|O:calc_lwork.syev",\
+    capi_kwlist,&prefix_capi,&n_capi,&lower_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"calc_lwork.syev() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable min_lwork */
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.syev() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable max_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.syev to C string");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&lower);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&lower,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable max_lwork */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable min_lwork */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of syev ********************************/
+
+/************************************ gees ************************************/
+static char doc_f2py_rout_calc_lwork_gees[] = "\
+minwrk,maxwrk = gees(prefix,n,[compute_v])\n\nWrapper for ``gees``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"n : input int\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(gees,GEES)(int*,int*,char*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_gees(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","n","compute_v",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|O:calc_lwork.gees",\
+    capi_kwlist,&prefix_capi,&n_capi,&compute_v_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable min_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.gees to C string");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.gees() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable max_lwork */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"calc_lwork.gees() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&compute_v);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&n,&compute_v,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable max_lwork */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable min_lwork */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of gees ********************************/
+
+/*********************************** geqrf ***********************************/
+static char doc_f2py_rout_calc_lwork_geqrf[] = "\
+minwrk,maxwrk = geqrf(prefix,m,n)\n\nWrapper for ``geqrf``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"m : input int\n"
+"n : input int\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(geqrf,GEQRF)(int*,int*,char*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_geqrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int m = 0;
+  PyObject *m_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","m","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:calc_lwork.geqrf",\
+    capi_kwlist,&prefix_capi,&m_capi,&n_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable max_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.geqrf to C string");
+  if (f2py_success) {
+  /* Processing variable min_lwork */
+  /* Processing variable m */
+    f2py_success = int_from_pyobj(&m,m_capi,"calc_lwork.geqrf() 2nd argument (m) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.geqrf() 3rd argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of m*/
+  /* End of cleaning variable m */
+  /* End of cleaning variable min_lwork */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable max_lwork */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of geqrf ********************************/
+
+/************************************ gqr ************************************/
+static char doc_f2py_rout_calc_lwork_gqr[] = "\
+minwrk,maxwrk = gqr(prefix,m,n)\n\nWrapper for ``gqr``.\
+\n\nParameters\n----------\n"
+"prefix : input string(len=1)\n"
+"m : input int\n"
+"n : input int\n"
+"\nReturns\n-------\n"
+"minwrk : int\n"
+"maxwrk : int";
+/* extern void F_FUNC(gqr,GQR)(int*,int*,char*,int*,int*); */
+static PyObject *f2py_rout_calc_lwork_gqr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,char*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int min_lwork = 0;
+  int max_lwork = 0;
+  string prefix = NULL;
+  int slen(prefix);
+  PyObject *prefix_capi = Py_None;
+  int m = 0;
+  PyObject *m_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  static char *capi_kwlist[] = {"prefix","m","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:calc_lwork.gqr",\
+    capi_kwlist,&prefix_capi,&m_capi,&n_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable max_lwork */
+  /* Processing variable prefix */
+  slen(prefix) = 1;
+  f2py_success = string_from_pyobj(&prefix,&slen(prefix),"",prefix_capi,"string_from_pyobj failed in converting 1st argument `prefix' of calc_lwork.gqr to C string");
+  if (f2py_success) {
+  /* Processing variable min_lwork */
+  /* Processing variable m */
+    f2py_success = int_from_pyobj(&m,m_capi,"calc_lwork.gqr() 2nd argument (m) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"calc_lwork.gqr() 3rd argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n);
+        /*(*f2py_func)(&min_lwork,&max_lwork,prefix,&m,&n,slen(prefix));*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ii",min_lwork,max_lwork);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of m*/
+  /* End of cleaning variable m */
+  /* End of cleaning variable min_lwork */
+    STRINGFREE(prefix);
+  }  /*if (f2py_success) of prefix*/
+  /* End of cleaning variable prefix */
+  /* End of cleaning variable max_lwork */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/********************************* end of gqr *********************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"gehrd",-1,{{-1}},0,(char *)F_FUNC(gehrd,GEHRD),(f2py_init_func)f2py_rout_calc_lwork_gehrd,doc_f2py_rout_calc_lwork_gehrd},
+  {"gesdd",-1,{{-1}},0,(char *)F_FUNC(gesdd,GESDD),(f2py_init_func)f2py_rout_calc_lwork_gesdd,doc_f2py_rout_calc_lwork_gesdd},
+  {"gelss",-1,{{-1}},0,(char *)F_FUNC(gelss,GELSS),(f2py_init_func)f2py_rout_calc_lwork_gelss,doc_f2py_rout_calc_lwork_gelss},
+  {"getri",-1,{{-1}},0,(char *)F_FUNC(getri,GETRI),(f2py_init_func)f2py_rout_calc_lwork_getri,doc_f2py_rout_calc_lwork_getri},
+  {"geev",-1,{{-1}},0,(char *)F_FUNC(geev,GEEV),(f2py_init_func)f2py_rout_calc_lwork_geev,doc_f2py_rout_calc_lwork_geev},
+  {"heev",-1,{{-1}},0,(char *)F_FUNC(heev,HEEV),(f2py_init_func)f2py_rout_calc_lwork_heev,doc_f2py_rout_calc_lwork_heev},
+  {"syev",-1,{{-1}},0,(char *)F_FUNC(syev,SYEV),(f2py_init_func)f2py_rout_calc_lwork_syev,doc_f2py_rout_calc_lwork_syev},
+  {"gees",-1,{{-1}},0,(char *)F_FUNC(gees,GEES),(f2py_init_func)f2py_rout_calc_lwork_gees,doc_f2py_rout_calc_lwork_gees},
+  {"geqrf",-1,{{-1}},0,(char *)F_FUNC(geqrf,GEQRF),(f2py_init_func)f2py_rout_calc_lwork_geqrf,doc_f2py_rout_calc_lwork_geqrf},
+  {"gqr",-1,{{-1}},0,(char *)F_FUNC(gqr,GQR),(f2py_init_func)f2py_rout_calc_lwork_gqr,doc_f2py_rout_calc_lwork_gqr},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "calc_lwork",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_calc_lwork(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initcalc_lwork(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = calc_lwork_module = PyModule_Create(&moduledef);
+#else
+  m = calc_lwork_module = Py_InitModule("calc_lwork", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module calc_lwork (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'calc_lwork' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  minwrk,maxwrk = gehrd(prefix,n,lo=0,hi=n-1)\n"
+"  minwrk,maxwrk = gesdd(prefix,m,n,compute_uv=1)\n"
+"  minwrk,maxwrk = gelss(prefix,m,n,nrhs)\n"
+"  minwrk,maxwrk = getri(prefix,n)\n"
+"  minwrk,maxwrk = geev(prefix,n,compute_vl=1,compute_vr=1)\n"
+"  minwrk,maxwrk = heev(prefix,n,lower=0)\n"
+"  minwrk,maxwrk = syev(prefix,n,lower=0)\n"
+"  minwrk,maxwrk = gees(prefix,n,compute_v=1)\n"
+"  minwrk,maxwrk = geqrf(prefix,m,n)\n"
+"  minwrk,maxwrk = gqr(prefix,m,n)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  calc_lwork_error = PyErr_NewException ("calc_lwork.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"calc_lwork");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
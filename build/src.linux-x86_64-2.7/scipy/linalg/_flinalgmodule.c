@@ -0,0 +1,2019 @@
+/* File: _flinalgmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * See http://cens.ioc.ee/projects/f2py2e/
+ * Generation date: Fri Oct 16 23:09:54 2026
+ * $Revision:$
+ * $Date:$
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *_flinalg_error;
+static PyObject *_flinalg_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {float r,i;} complex_float;
+typedef struct {double r,i;} complex_double;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKARRAY(check,tcheck,name) \
+  if (!(check)) {\
+    PyErr_SetString(_flinalg_error,"("tcheck") failed for "name);\
+    /*goto capi_fail;*/\
+  } else 
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+  PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+  fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define pyobj_from_complex_double1(v) (PyComplex_FromDoubles(v.r,v.i))
+#define pyobj_from_complex_float1(v) (PyComplex_FromDoubles(v.r,v.i))
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+  PyObject* tmp = NULL;
+  if (PyInt_Check(obj)) {
+    *v = (int)PyInt_AS_LONG(obj);
+    return 1;
+  }
+  tmp = PyNumber_Int(obj);
+  if (tmp) {
+    *v = PyInt_AS_LONG(tmp);
+    Py_DECREF(tmp);
+    return 1;
+  }
+  if (PyComplex_Check(obj))
+    tmp = PyObject_GetAttrString(obj,"real");
+  else if (PyString_Check(obj) || PyUnicode_Check(obj))
+    /*pass*/;
+  else if (PySequence_Check(obj))
+    tmp = PySequence_GetItem(obj,0);
+  if (tmp) {
+    PyErr_Clear();
+    if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+    Py_DECREF(tmp);
+  }
+  {
+    PyObject* err = PyErr_Occurred();
+    if (err==NULL) err = _flinalg_error;
+    PyErr_SetString(err,errmess);
+  }
+  return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC_US(ddet_c,DDET_C)(double*,double*,int*,int*,int*);
+extern void F_FUNC_US(ddet_r,DDET_R)(double*,double*,int*,int*,int*);
+extern void F_FUNC_US(sdet_c,SDET_C)(float*,float*,int*,int*,int*);
+extern void F_FUNC_US(sdet_r,SDET_R)(float*,float*,int*,int*,int*);
+extern void F_FUNC_US(zdet_c,ZDET_C)(complex_double*,complex_double*,int*,int*,int*);
+extern void F_FUNC_US(zdet_r,ZDET_R)(complex_double*,complex_double*,int*,int*,int*);
+extern void F_FUNC_US(cdet_c,CDET_C)(complex_float*,complex_float*,int*,int*,int*);
+extern void F_FUNC_US(cdet_r,CDET_R)(complex_float*,complex_float*,int*,int*,int*);
+extern void F_FUNC_US(dlu_c,DLU_C)(double*,double*,double*,double*,int*,int*,int*,int*,int*,int*,int*);
+extern void F_FUNC_US(zlu_c,ZLU_C)(double*,complex_double*,complex_double*,complex_double*,int*,int*,int*,int*,int*,int*,int*);
+extern void F_FUNC_US(slu_c,SLU_C)(float*,float*,float*,float*,int*,int*,int*,int*,int*,int*,int*);
+extern void F_FUNC_US(clu_c,CLU_C)(float*,complex_float*,complex_float*,complex_float*,int*,int*,int*,int*,int*,int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** ddet_c ***********************************/
+static char doc_f2py_rout__flinalg_ddet_c[] = "\
+det,info = ddet_c(a,[overwrite_a])\n\nWrapper for ``ddet_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : float\n"
+"info : int";
+/* extern void F_FUNC_US(ddet_c,DDET_C)(double*,double*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_ddet_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double det = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.ddet_c",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.ddet_c to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.ddet_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("di",det,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of ddet_c *******************************/
+
+/*********************************** ddet_r ***********************************/
+static char doc_f2py_rout__flinalg_ddet_r[] = "\
+det,info = ddet_r(a,[overwrite_a])\n\nWrapper for ``ddet_r``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : float\n"
+"info : int";
+/* extern void F_FUNC_US(ddet_r,DDET_R)(double*,double*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_ddet_r(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double det = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.ddet_r",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_C;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.ddet_r to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.ddet_r to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("di",det,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of ddet_r *******************************/
+
+/*********************************** sdet_c ***********************************/
+static char doc_f2py_rout__flinalg_sdet_c[] = "\
+det,info = sdet_c(a,[overwrite_a])\n\nWrapper for ``sdet_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : float\n"
+"info : int";
+/* extern void F_FUNC_US(sdet_c,SDET_C)(float*,float*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_sdet_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,float*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float det = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.sdet_c",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.sdet_c to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.sdet_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("fi",det,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sdet_c *******************************/
+
+/*********************************** sdet_r ***********************************/
+static char doc_f2py_rout__flinalg_sdet_r[] = "\
+det,info = sdet_r(a,[overwrite_a])\n\nWrapper for ``sdet_r``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : float\n"
+"info : int";
+/* extern void F_FUNC_US(sdet_r,SDET_R)(float*,float*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_sdet_r(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,float*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float det = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.sdet_r",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_C;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.sdet_r to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.sdet_r to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("fi",det,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sdet_r *******************************/
+
+/*********************************** zdet_c ***********************************/
+static char doc_f2py_rout__flinalg_zdet_c[] = "\
+det,info = zdet_c(a,[overwrite_a])\n\nWrapper for ``zdet_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : complex\n"
+"info : int";
+/* extern void F_FUNC_US(zdet_c,ZDET_C)(complex_double*,complex_double*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_zdet_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,complex_double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double det;
+  PyObject *det_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.zdet_c",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.zdet_c to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.zdet_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  det_capi = pyobj_from_complex_double1(det);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",det_capi,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zdet_c *******************************/
+
+/*********************************** zdet_r ***********************************/
+static char doc_f2py_rout__flinalg_zdet_r[] = "\
+det,info = zdet_r(a,[overwrite_a])\n\nWrapper for ``zdet_r``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : complex\n"
+"info : int";
+/* extern void F_FUNC_US(zdet_r,ZDET_R)(complex_double*,complex_double*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_zdet_r(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,complex_double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double det;
+  PyObject *det_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.zdet_r",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_C;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.zdet_r to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.zdet_r to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  det_capi = pyobj_from_complex_double1(det);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",det_capi,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zdet_r *******************************/
+
+/*********************************** cdet_c ***********************************/
+static char doc_f2py_rout__flinalg_cdet_c[] = "\
+det,info = cdet_c(a,[overwrite_a])\n\nWrapper for ``cdet_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : complex\n"
+"info : int";
+/* extern void F_FUNC_US(cdet_c,CDET_C)(complex_float*,complex_float*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_cdet_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,complex_float*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_float det;
+  PyObject *det_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.cdet_c",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.cdet_c to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.cdet_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  det_capi = pyobj_from_complex_float1(det);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",det_capi,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cdet_c *******************************/
+
+/*********************************** cdet_r ***********************************/
+static char doc_f2py_rout__flinalg_cdet_r[] = "\
+det,info = cdet_r(a,[overwrite_a])\n\nWrapper for ``cdet_r``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"det : complex\n"
+"info : int";
+/* extern void F_FUNC_US(cdet_r,CDET_R)(complex_float*,complex_float*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_cdet_r(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,complex_float*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_float det;
+  PyObject *det_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:_flinalg.cdet_r",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_C;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.cdet_r to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable det */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.cdet_r to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&det,a,&n,piv,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  det_capi = pyobj_from_complex_float1(det);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",det_capi,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable det */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cdet_r *******************************/
+
+/*********************************** dlu_c ***********************************/
+static char doc_f2py_rout__flinalg_dlu_c[] = "\
+p,l,u,info = dlu_c(a,[permute_l,overwrite_a])\n\nWrapper for ``dlu_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"permute_l : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"p : rank-2 array('d') with bounds (m1,m1)\n"
+"l : rank-2 array('d') with bounds (m,k)\n"
+"u : rank-2 array('d') with bounds (k,n)\n"
+"info : int";
+/* extern void F_FUNC_US(dlu_c,DLU_C)(double*,double*,double*,double*,int*,int*,int*,int*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_dlu_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,int*,int*,int*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *p = NULL;
+  npy_intp p_Dims[2] = {-1, -1};
+  const int p_Rank = 2;
+  PyArrayObject *capi_p_tmp = NULL;
+  int capi_p_intent = 0;
+  double *l = NULL;
+  npy_intp l_Dims[2] = {-1, -1};
+  const int l_Rank = 2;
+  PyArrayObject *capi_l_tmp = NULL;
+  int capi_l_intent = 0;
+  double *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  int permute_l = 0;
+  PyObject *permute_l_capi = Py_None;
+  int m1 = 0;
+  static char *capi_kwlist[] = {"a","permute_l","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:_flinalg.dlu_c",\
+    capi_kwlist,&a_capi,&permute_l_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.dlu_c to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable permute_l */
+  if (permute_l_capi == Py_None) permute_l = 0; else
+    f2py_success = int_from_pyobj(&permute_l,permute_l_capi,"_flinalg.dlu_c() 1st keyword (permute_l) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable m1 */
+  m1 = (permute_l?1:m);
+  /* Processing variable k */
+  k = (m<n?m:n);
+  /* Processing variable l */
+  l_Dims[0]=m,l_Dims[1]=k;
+  capi_l_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_l_tmp = array_from_pyobj(NPY_DOUBLE,l_Dims,l_Rank,capi_l_intent,Py_None);
+  if (capi_l_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `l' of _flinalg.dlu_c to C/Fortran array" );
+  } else {
+    l = (double *)(PyArray_DATA(capi_l_tmp));
+
+  /* Processing variable p */
+  p_Dims[0]=m1,p_Dims[1]=m1;
+  capi_p_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_p_tmp = array_from_pyobj(NPY_DOUBLE,p_Dims,p_Rank,capi_p_intent,Py_None);
+  if (capi_p_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `p' of _flinalg.dlu_c to C/Fortran array" );
+  } else {
+    p = (double *)(PyArray_DATA(capi_p_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=k,u_Dims[1]=n;
+  capi_u_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_u_tmp = array_from_pyobj(NPY_DOUBLE,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `u' of _flinalg.dlu_c to C/Fortran array" );
+  } else {
+    u = (double *)(PyArray_DATA(capi_u_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=k;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.dlu_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(p,l,u,a,&m,&n,&k,piv,&info,&permute_l,&m1);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_p_tmp,capi_l_tmp,capi_u_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+  }  /*if (capi_p_tmp == NULL) ... else of p*/
+  /* End of cleaning variable p */
+  }  /*if (capi_l_tmp == NULL) ... else of l*/
+  /* End of cleaning variable l */
+  /* End of cleaning variable k */
+  /* End of cleaning variable m1 */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of permute_l*/
+  /* End of cleaning variable permute_l */
+  /* End of cleaning variable info */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dlu_c ********************************/
+
+/*********************************** zlu_c ***********************************/
+static char doc_f2py_rout__flinalg_zlu_c[] = "\
+p,l,u,info = zlu_c(a,[permute_l,overwrite_a])\n\nWrapper for ``zlu_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"permute_l : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"p : rank-2 array('d') with bounds (m1,m1)\n"
+"l : rank-2 array('D') with bounds (m,k)\n"
+"u : rank-2 array('D') with bounds (k,n)\n"
+"info : int";
+/* extern void F_FUNC_US(zlu_c,ZLU_C)(double*,complex_double*,complex_double*,complex_double*,int*,int*,int*,int*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_zlu_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,complex_double*,complex_double*,complex_double*,int*,int*,int*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *p = NULL;
+  npy_intp p_Dims[2] = {-1, -1};
+  const int p_Rank = 2;
+  PyArrayObject *capi_p_tmp = NULL;
+  int capi_p_intent = 0;
+  complex_double *l = NULL;
+  npy_intp l_Dims[2] = {-1, -1};
+  const int l_Rank = 2;
+  PyArrayObject *capi_l_tmp = NULL;
+  int capi_l_intent = 0;
+  complex_double *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  int permute_l = 0;
+  PyObject *permute_l_capi = Py_None;
+  int m1 = 0;
+  static char *capi_kwlist[] = {"a","permute_l","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:_flinalg.zlu_c",\
+    capi_kwlist,&a_capi,&permute_l_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable permute_l */
+  if (permute_l_capi == Py_None) permute_l = 0; else
+    f2py_success = int_from_pyobj(&permute_l,permute_l_capi,"_flinalg.zlu_c() 1st keyword (permute_l) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.zlu_c to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable m1 */
+  m1 = (permute_l?1:m);
+  /* Processing variable k */
+  k = (m<n?m:n);
+  /* Processing variable l */
+  l_Dims[0]=m,l_Dims[1]=k;
+  capi_l_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_l_tmp = array_from_pyobj(NPY_CDOUBLE,l_Dims,l_Rank,capi_l_intent,Py_None);
+  if (capi_l_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `l' of _flinalg.zlu_c to C/Fortran array" );
+  } else {
+    l = (complex_double *)(PyArray_DATA(capi_l_tmp));
+
+  /* Processing variable p */
+  p_Dims[0]=m1,p_Dims[1]=m1;
+  capi_p_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_p_tmp = array_from_pyobj(NPY_DOUBLE,p_Dims,p_Rank,capi_p_intent,Py_None);
+  if (capi_p_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `p' of _flinalg.zlu_c to C/Fortran array" );
+  } else {
+    p = (double *)(PyArray_DATA(capi_p_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=k,u_Dims[1]=n;
+  capi_u_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_u_tmp = array_from_pyobj(NPY_CDOUBLE,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `u' of _flinalg.zlu_c to C/Fortran array" );
+  } else {
+    u = (complex_double *)(PyArray_DATA(capi_u_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=k;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.zlu_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(p,l,u,a,&m,&n,&k,piv,&info,&permute_l,&m1);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_p_tmp,capi_l_tmp,capi_u_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+  }  /*if (capi_p_tmp == NULL) ... else of p*/
+  /* End of cleaning variable p */
+  }  /*if (capi_l_tmp == NULL) ... else of l*/
+  /* End of cleaning variable l */
+  /* End of cleaning variable k */
+  /* End of cleaning variable m1 */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*if (f2py_success) of permute_l*/
+  /* End of cleaning variable permute_l */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zlu_c ********************************/
+
+/*********************************** slu_c ***********************************/
+static char doc_f2py_rout__flinalg_slu_c[] = "\
+p,l,u,info = slu_c(a,[permute_l,overwrite_a])\n\nWrapper for ``slu_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"permute_l : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"p : rank-2 array('f') with bounds (m1,m1)\n"
+"l : rank-2 array('f') with bounds (m,k)\n"
+"u : rank-2 array('f') with bounds (k,n)\n"
+"info : int";
+/* extern void F_FUNC_US(slu_c,SLU_C)(float*,float*,float*,float*,int*,int*,int*,int*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_slu_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,float*,float*,float*,int*,int*,int*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float *p = NULL;
+  npy_intp p_Dims[2] = {-1, -1};
+  const int p_Rank = 2;
+  PyArrayObject *capi_p_tmp = NULL;
+  int capi_p_intent = 0;
+  float *l = NULL;
+  npy_intp l_Dims[2] = {-1, -1};
+  const int l_Rank = 2;
+  PyArrayObject *capi_l_tmp = NULL;
+  int capi_l_intent = 0;
+  float *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  int permute_l = 0;
+  PyObject *permute_l_capi = Py_None;
+  int m1 = 0;
+  static char *capi_kwlist[] = {"a","permute_l","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:_flinalg.slu_c",\
+    capi_kwlist,&a_capi,&permute_l_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.slu_c to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable permute_l */
+  if (permute_l_capi == Py_None) permute_l = 0; else
+    f2py_success = int_from_pyobj(&permute_l,permute_l_capi,"_flinalg.slu_c() 1st keyword (permute_l) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable m1 */
+  m1 = (permute_l?1:m);
+  /* Processing variable k */
+  k = (m<n?m:n);
+  /* Processing variable l */
+  l_Dims[0]=m,l_Dims[1]=k;
+  capi_l_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_l_tmp = array_from_pyobj(NPY_FLOAT,l_Dims,l_Rank,capi_l_intent,Py_None);
+  if (capi_l_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `l' of _flinalg.slu_c to C/Fortran array" );
+  } else {
+    l = (float *)(PyArray_DATA(capi_l_tmp));
+
+  /* Processing variable p */
+  p_Dims[0]=m1,p_Dims[1]=m1;
+  capi_p_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_p_tmp = array_from_pyobj(NPY_FLOAT,p_Dims,p_Rank,capi_p_intent,Py_None);
+  if (capi_p_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `p' of _flinalg.slu_c to C/Fortran array" );
+  } else {
+    p = (float *)(PyArray_DATA(capi_p_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=k,u_Dims[1]=n;
+  capi_u_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_u_tmp = array_from_pyobj(NPY_FLOAT,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `u' of _flinalg.slu_c to C/Fortran array" );
+  } else {
+    u = (float *)(PyArray_DATA(capi_u_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=k;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.slu_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(p,l,u,a,&m,&n,&k,piv,&info,&permute_l,&m1);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_p_tmp,capi_l_tmp,capi_u_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+  }  /*if (capi_p_tmp == NULL) ... else of p*/
+  /* End of cleaning variable p */
+  }  /*if (capi_l_tmp == NULL) ... else of l*/
+  /* End of cleaning variable l */
+  /* End of cleaning variable k */
+  /* End of cleaning variable m1 */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of permute_l*/
+  /* End of cleaning variable permute_l */
+  /* End of cleaning variable info */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of slu_c ********************************/
+
+/*********************************** clu_c ***********************************/
+static char doc_f2py_rout__flinalg_clu_c[] = "\
+p,l,u,info = clu_c(a,[permute_l,overwrite_a])\n\nWrapper for ``clu_c``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"permute_l : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"p : rank-2 array('f') with bounds (m1,m1)\n"
+"l : rank-2 array('F') with bounds (m,k)\n"
+"u : rank-2 array('F') with bounds (k,n)\n"
+"info : int";
+/* extern void F_FUNC_US(clu_c,CLU_C)(float*,complex_float*,complex_float*,complex_float*,int*,int*,int*,int*,int*,int*,int*); */
+static PyObject *f2py_rout__flinalg_clu_c(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,complex_float*,complex_float*,complex_float*,int*,int*,int*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float *p = NULL;
+  npy_intp p_Dims[2] = {-1, -1};
+  const int p_Rank = 2;
+  PyArrayObject *capi_p_tmp = NULL;
+  int capi_p_intent = 0;
+  complex_float *l = NULL;
+  npy_intp l_Dims[2] = {-1, -1};
+  const int l_Rank = 2;
+  PyArrayObject *capi_l_tmp = NULL;
+  int capi_l_intent = 0;
+  complex_float *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  int permute_l = 0;
+  PyObject *permute_l_capi = Py_None;
+  int m1 = 0;
+  static char *capi_kwlist[] = {"a","permute_l","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:_flinalg.clu_c",\
+    capi_kwlist,&a_capi,&permute_l_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable permute_l */
+  if (permute_l_capi == Py_None) permute_l = 0; else
+    f2py_success = int_from_pyobj(&permute_l,permute_l_capi,"_flinalg.clu_c() 1st keyword (permute_l) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting 1st argument `a' of _flinalg.clu_c to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable m1 */
+  m1 = (permute_l?1:m);
+  /* Processing variable k */
+  k = (m<n?m:n);
+  /* Processing variable l */
+  l_Dims[0]=m,l_Dims[1]=k;
+  capi_l_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_l_tmp = array_from_pyobj(NPY_CFLOAT,l_Dims,l_Rank,capi_l_intent,Py_None);
+  if (capi_l_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `l' of _flinalg.clu_c to C/Fortran array" );
+  } else {
+    l = (complex_float *)(PyArray_DATA(capi_l_tmp));
+
+  /* Processing variable p */
+  p_Dims[0]=m1,p_Dims[1]=m1;
+  capi_p_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_p_tmp = array_from_pyobj(NPY_FLOAT,p_Dims,p_Rank,capi_p_intent,Py_None);
+  if (capi_p_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `p' of _flinalg.clu_c to C/Fortran array" );
+  } else {
+    p = (float *)(PyArray_DATA(capi_p_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=k,u_Dims[1]=n;
+  capi_u_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_u_tmp = array_from_pyobj(NPY_CFLOAT,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `u' of _flinalg.clu_c to C/Fortran array" );
+  } else {
+    u = (complex_float *)(PyArray_DATA(capi_u_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=k;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_CACHE;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_flinalg_error,"failed in converting hidden `piv' of _flinalg.clu_c to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(p,l,u,a,&m,&n,&k,piv,&info,&permute_l,&m1);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_p_tmp,capi_l_tmp,capi_u_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_piv_tmp);
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+  }  /*if (capi_p_tmp == NULL) ... else of p*/
+  /* End of cleaning variable p */
+  }  /*if (capi_l_tmp == NULL) ... else of l*/
+  /* End of cleaning variable l */
+  /* End of cleaning variable k */
+  /* End of cleaning variable m1 */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*if (f2py_success) of permute_l*/
+  /* End of cleaning variable permute_l */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of clu_c ********************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"ddet_c",-1,{{-1}},0,(char *)F_FUNC_US(ddet_c,DDET_C),(f2py_init_func)f2py_rout__flinalg_ddet_c,doc_f2py_rout__flinalg_ddet_c},
+  {"ddet_r",-1,{{-1}},0,(char *)F_FUNC_US(ddet_r,DDET_R),(f2py_init_func)f2py_rout__flinalg_ddet_r,doc_f2py_rout__flinalg_ddet_r},
+  {"sdet_c",-1,{{-1}},0,(char *)F_FUNC_US(sdet_c,SDET_C),(f2py_init_func)f2py_rout__flinalg_sdet_c,doc_f2py_rout__flinalg_sdet_c},
+  {"sdet_r",-1,{{-1}},0,(char *)F_FUNC_US(sdet_r,SDET_R),(f2py_init_func)f2py_rout__flinalg_sdet_r,doc_f2py_rout__flinalg_sdet_r},
+  {"zdet_c",-1,{{-1}},0,(char *)F_FUNC_US(zdet_c,ZDET_C),(f2py_init_func)f2py_rout__flinalg_zdet_c,doc_f2py_rout__flinalg_zdet_c},
+  {"zdet_r",-1,{{-1}},0,(char *)F_FUNC_US(zdet_r,ZDET_R),(f2py_init_func)f2py_rout__flinalg_zdet_r,doc_f2py_rout__flinalg_zdet_r},
+  {"cdet_c",-1,{{-1}},0,(char *)F_FUNC_US(cdet_c,CDET_C),(f2py_init_func)f2py_rout__flinalg_cdet_c,doc_f2py_rout__flinalg_cdet_c},
+  {"cdet_r",-1,{{-1}},0,(char *)F_FUNC_US(cdet_r,CDET_R),(f2py_init_func)f2py_rout__flinalg_cdet_r,doc_f2py_rout__flinalg_cdet_r},
+  {"dlu_c",-1,{{-1}},0,(char *)F_FUNC_US(dlu_c,DLU_C),(f2py_init_func)f2py_rout__flinalg_dlu_c,doc_f2py_rout__flinalg_dlu_c},
+  {"zlu_c",-1,{{-1}},0,(char *)F_FUNC_US(zlu_c,ZLU_C),(f2py_init_func)f2py_rout__flinalg_zlu_c,doc_f2py_rout__flinalg_zlu_c},
+  {"slu_c",-1,{{-1}},0,(char *)F_FUNC_US(slu_c,SLU_C),(f2py_init_func)f2py_rout__flinalg_slu_c,doc_f2py_rout__flinalg_slu_c},
+  {"clu_c",-1,{{-1}},0,(char *)F_FUNC_US(clu_c,CLU_C),(f2py_init_func)f2py_rout__flinalg_clu_c,doc_f2py_rout__flinalg_clu_c},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "_flinalg",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit__flinalg(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC init_flinalg(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = _flinalg_module = PyModule_Create(&moduledef);
+#else
+  m = _flinalg_module = Py_InitModule("_flinalg", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module _flinalg (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module '_flinalg' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  det,info = ddet_c(a,overwrite_a=0)\n"
+"  det,info = ddet_r(a,overwrite_a=0)\n"
+"  det,info = sdet_c(a,overwrite_a=0)\n"
+"  det,info = sdet_r(a,overwrite_a=0)\n"
+"  det,info = zdet_c(a,overwrite_a=0)\n"
+"  det,info = zdet_r(a,overwrite_a=0)\n"
+"  det,info = cdet_c(a,overwrite_a=0)\n"
+"  det,info = cdet_r(a,overwrite_a=0)\n"
+"  p,l,u,info = dlu_c(a,permute_l=0,overwrite_a=0)\n"
+"  p,l,u,info = zlu_c(a,permute_l=0,overwrite_a=0)\n"
+"  p,l,u,info = slu_c(a,permute_l=0,overwrite_a=0)\n"
+"  p,l,u,info = clu_c(a,permute_l=0,overwrite_a=0)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  _flinalg_error = PyErr_NewException ("_flinalg.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"_flinalg");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,455 @@
+/* File: futilmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * See http://cens.ioc.ee/projects/f2py2e/
+ * Generation date: Fri Oct 16 23:09:54 2026
+ * $Revision:$
+ * $Date:$
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *futil_error;
+static PyObject *futil_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+/*need_typedefs*/
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+  PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+  fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(dqsort,DQSORT)(int*,double*);
+extern void F_FUNC(dfreps,DFREPS)(double*,int*,double*,int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** dqsort ***********************************/
+static char doc_f2py_rout_futil_dqsort[] = "\
+arr = dqsort(arr,[overwrite_arr])\n\nWrapper for ``dqsort``.\
+\n\nParameters\n----------\n"
+"arr : input rank-1 array('d') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_arr : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"arr : rank-1 array('d') with bounds (n)";
+/* extern void F_FUNC(dqsort,DQSORT)(int*,double*); */
+static PyObject *f2py_rout_futil_dqsort(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *arr = NULL;
+  npy_intp arr_Dims[1] = {-1};
+  const int arr_Rank = 1;
+  PyArrayObject *capi_arr_tmp = NULL;
+  int capi_arr_intent = 0;
+  int capi_overwrite_arr = 0;
+  PyObject *arr_capi = Py_None;
+  static char *capi_kwlist[] = {"arr","overwrite_arr",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:futil.dqsort",\
+    capi_kwlist,&arr_capi,&capi_overwrite_arr))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable arr */
+  capi_arr_intent |= (capi_overwrite_arr?0:F2PY_INTENT_COPY);
+  ;
+  capi_arr_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_arr_tmp = array_from_pyobj(NPY_DOUBLE,arr_Dims,arr_Rank,capi_arr_intent,arr_capi);
+  if (capi_arr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(futil_error,"failed in converting 1st argument `arr' of futil.dqsort to C/Fortran array" );
+  } else {
+    arr = (double *)(PyArray_DATA(capi_arr_tmp));
+
+  /* Processing variable n */
+  n = len(arr);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,arr);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_arr_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  }  /*if (capi_arr_tmp == NULL) ... else of arr*/
+  /* End of cleaning variable arr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dqsort *******************************/
+
+/*********************************** dfreps ***********************************/
+static char doc_f2py_rout_futil_dfreps[] = "\
+replist,repnum,nlist = dfreps(arr)\n\nWrapper for ``dfreps``.\
+\n\nParameters\n----------\n"
+"arr : input rank-1 array('d') with bounds (n)\n"
+"\nReturns\n-------\n"
+"replist : rank-1 array('d') with bounds (n)\n"
+"repnum : rank-1 array('i') with bounds (n)\n"
+"nlist : int";
+/* extern void F_FUNC(dfreps,DFREPS)(double*,int*,double*,int*,int*); */
+static PyObject *f2py_rout_futil_dfreps(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *arr = NULL;
+  npy_intp arr_Dims[1] = {-1};
+  const int arr_Rank = 1;
+  PyArrayObject *capi_arr_tmp = NULL;
+  int capi_arr_intent = 0;
+  PyObject *arr_capi = Py_None;
+  int n = 0;
+  double *replist = NULL;
+  npy_intp replist_Dims[1] = {-1};
+  const int replist_Rank = 1;
+  PyArrayObject *capi_replist_tmp = NULL;
+  int capi_replist_intent = 0;
+  int *repnum = NULL;
+  npy_intp repnum_Dims[1] = {-1};
+  const int repnum_Rank = 1;
+  PyArrayObject *capi_repnum_tmp = NULL;
+  int capi_repnum_intent = 0;
+  int nlist = 0;
+  static char *capi_kwlist[] = {"arr",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O:futil.dfreps",\
+    capi_kwlist,&arr_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable arr */
+  ;
+  capi_arr_intent |= F2PY_INTENT_IN;
+  capi_arr_tmp = array_from_pyobj(NPY_DOUBLE,arr_Dims,arr_Rank,capi_arr_intent,arr_capi);
+  if (capi_arr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(futil_error,"failed in converting 1st argument `arr' of futil.dfreps to C/Fortran array" );
+  } else {
+    arr = (double *)(PyArray_DATA(capi_arr_tmp));
+
+  /* Processing variable nlist */
+  /* Processing variable n */
+  n = len(arr);
+  /* Processing variable repnum */
+  repnum_Dims[0]=n;
+  capi_repnum_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_repnum_tmp = array_from_pyobj(NPY_INT,repnum_Dims,repnum_Rank,capi_repnum_intent,Py_None);
+  if (capi_repnum_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(futil_error,"failed in converting hidden `repnum' of futil.dfreps to C/Fortran array" );
+  } else {
+    repnum = (int *)(PyArray_DATA(capi_repnum_tmp));
+
+  /* Processing variable replist */
+  replist_Dims[0]=n;
+  capi_replist_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_replist_tmp = array_from_pyobj(NPY_DOUBLE,replist_Dims,replist_Rank,capi_replist_intent,Py_None);
+  if (capi_replist_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(futil_error,"failed in converting hidden `replist' of futil.dfreps to C/Fortran array" );
+  } else {
+    replist = (double *)(PyArray_DATA(capi_replist_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(arr,&n,replist,repnum,&nlist);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_replist_tmp,capi_repnum_tmp,nlist);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_replist_tmp == NULL) ... else of replist*/
+  /* End of cleaning variable replist */
+  }  /*if (capi_repnum_tmp == NULL) ... else of repnum*/
+  /* End of cleaning variable repnum */
+  /* End of cleaning variable n */
+  /* End of cleaning variable nlist */
+  if((PyObject *)capi_arr_tmp!=arr_capi) {
+    Py_XDECREF(capi_arr_tmp); }
+  }  /*if (capi_arr_tmp == NULL) ... else of arr*/
+  /* End of cleaning variable arr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dfreps *******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"dqsort",-1,{{-1}},0,(char *)F_FUNC(dqsort,DQSORT),(f2py_init_func)f2py_rout_futil_dqsort,doc_f2py_rout_futil_dqsort},
+  {"dfreps",-1,{{-1}},0,(char *)F_FUNC(dfreps,DFREPS),(f2py_init_func)f2py_rout_futil_dfreps,doc_f2py_rout_futil_dfreps},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "futil",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_futil(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initfutil(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = futil_module = PyModule_Create(&moduledef);
+#else
+  m = futil_module = Py_InitModule("futil", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module futil (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'futil' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  arr = dqsort(arr,overwrite_arr=0)\n"
+"  replist,repnum,nlist = dfreps(arr)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  futil_error = PyErr_NewException ("futil.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"futil");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
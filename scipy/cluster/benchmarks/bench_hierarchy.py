@@ -0,0 +1,54 @@
+"""benchmarks for the linkage methods"""
+
+import time
+
+import numpy as np
+
+from numpy.testing import *
+
+from scipy.cluster.hierarchy import linkage
+from scipy.spatial.distance import pdist
+
+
+class BenchmarkLinkage(TestCase):
+    """Scaling of linkage with the number of observations"""
+
+    def bench_linkage(self):
+        np.random.seed(1234)
+        m = 3
+        # The condensed distance matrix of 50000 observations takes 10 GB,
+        # so the methods that need one stop at 20000.
+        sizes = [1000, 2000, 5000, 10000, 20000, 50000]
+        max_condensed = 20000
+        dm_methods = ['single', 'complete', 'average', 'weighted']
+        obs_methods = ['single', 'ward']
+
+        print
+        print '                     linkage time (sec)'
+        print '==================================================================================='
+        print '       |             condensed distance matrix            |     observations     '
+        print '   n   |   single  |  complete |  average  |  weighted    |   single  |    ward  '
+        print '-----------------------------------------------------------------------------------'
+
+        for n in sizes:
+            X = np.random.rand(n, m)
+            times = []
+            if n <= max_condensed:
+                y = pdist(X)
+                for method in dm_methods:
+                    start = time.clock()
+                    linkage(y, method)
+                    times.append('%9.3f' % (time.clock() - start))
+                del y
+            else:
+                times.extend(['%9s' % '-'] * len(dm_methods))
+            for method in obs_methods:
+                start = time.clock()
+                linkage(X, method)
+                times.append('%9.3f' % (time.clock() - start))
+            print ' %5d | %s    | %s' % (n, ' | '.join(times[:4]),
+                                         ' | '.join(times[4:]))
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -13,6 +13,7 @@ cluster ids of each observation.
    :toctree: generated/
 
    fcluster
+   fcluster_multi
    fclusterdata
    leaders
 
@@ -183,14 +184,19 @@ _cpy_non_euclid_methods = {'single': 0, 'complete': 1, 'average': 2,
 _cpy_euclid_methods = {'centroid': 3, 'median': 4, 'ward': 5}
 _cpy_linkage_methods = set(_cpy_non_euclid_methods.keys()).union(
     set(_cpy_euclid_methods.keys()))
+# Methods that are computed directly from euclidean observation vectors,
+# without forming the condensed distance matrix.
+_cpy_obs_methods = set(['single', 'centroid', 'median', 'ward'])
+_cpy_linkage_ids = dict(_cpy_non_euclid_methods, **_cpy_euclid_methods)
 
 __all__ = ['ClusterNode', 'average', 'centroid', 'complete', 'cophenet',
-           'correspond', 'dendrogram', 'fcluster', 'fclusterdata',
-           'from_mlab_linkage', 'inconsistent', 'is_isomorphic',
-           'is_monotonic', 'is_valid_im', 'is_valid_linkage', 'leaders',
-           'leaves_list', 'linkage', 'maxRstat', 'maxdists', 'maxinconsts',
-           'median', 'num_obs_linkage', 'set_link_color_palette', 'single',
-           'to_mlab_linkage', 'to_tree', 'ward', 'weighted', 'distance']
+           'correspond', 'dendrogram', 'fcluster', 'fcluster_multi',
+           'fclusterdata', 'from_mlab_linkage', 'inconsistent',
+           'is_isomorphic', 'is_monotonic', 'is_valid_im', 'is_valid_linkage',
+           'leaders', 'leaves_list', 'linkage', 'maxRstat', 'maxdists',
+           'maxinconsts', 'median', 'num_obs_linkage', 'set_link_color_palette',
+           'single', 'to_mlab_linkage', 'to_tree', 'ward', 'weighted',
+           'distance']
 
 
 def _warning(s):
@@ -587,7 +593,18 @@ def linkage(y, method='single', metric='euclidean'):
     Warning: When the minimum distance pair in the forest is chosen, there
     may be two or more pairs with the same minimum distance. This
     implementation may chose a different minimum than the MATLAB
-    version.
+    version.  The faster algorithms used since scipy 0.11 may also
+    chose a different minimum than older versions of scipy.  When all
+    the distances are distinct, the linkage is the same as before.
+    With ties, single linkage gives the same clustering, up to the
+    order of the merges at equal distances, but the other methods may
+    give a different clustering, as the distances to a merged cluster
+    depend on which pair was merged first.
+
+    When ``y`` holds observation vectors and the metric is euclidean,
+    the single, centroid, median and ward methods compute the
+    distances as they are needed instead of forming the distance
+    matrix, so only :math:`O(n)` memory is used.
 
     Parameters
     ----------
@@ -635,23 +652,22 @@ def linkage(y, method='single', metric='euclidean'):
         m = s[1]
         if method not in _cpy_linkage_methods:
             raise ValueError('Invalid method: %s' % method)
-        if method in _cpy_non_euclid_methods.keys():
+        if method in _cpy_obs_methods and metric == 'euclidean':
+            Z = np.zeros((n - 1, 4))
+            _hierarchy_wrap.linkage_obs_wrap(X, Z, m, n,
+                                             int(_cpy_linkage_ids[method]))
+        elif method in _cpy_non_euclid_methods.keys():
             dm = distance.pdist(X, metric)
             Z = np.zeros((n - 1, 4))
             _hierarchy_wrap.linkage_wrap(dm, Z, n, \
                                        int(_cpy_non_euclid_methods[method]))
-        elif method in _cpy_euclid_methods.keys():
-            if metric != 'euclidean':
-                raise ValueError(('Method %s requires the distance metric to '
-                                 'be euclidean') % s)
-            dm = distance.pdist(X, metric)
-            Z = np.zeros((n - 1, 4))
-            _hierarchy_wrap.linkage_euclid_wrap(dm, Z, X, m, n,
-                                              int(_cpy_euclid_methods[method]))
+        else:
+            raise ValueError(('Method %s requires the distance metric to '
+                             'be euclidean') % method)
     return Z
 
 
-class ClusterNode:
+class ClusterNode(object):
     """
     A tree node class for representing a cluster.
 
@@ -667,6 +683,9 @@ class ClusterNode:
 
     """
 
+    # Trees built from large linkages hold millions of nodes.
+    __slots__ = ('id', 'left', 'right', 'dist', 'count')
+
     def __init__(self, id, left=None, right=None, dist=0, count=1):
         if id < 0:
             raise ValueError('The id must be non-negative.')
@@ -688,6 +707,12 @@ class ClusterNode:
         else:
             self.count = left.count + right.count
 
+    def __getstate__(self):
+        return (self.id, self.left, self.right, self.dist, self.count)
+
+    def __setstate__(self, state):
+        self.id, self.left, self.right, self.dist, self.count = state
+
     def get_id(self):
         """
         The identifier of the target node.
@@ -786,35 +811,18 @@ class ClusterNode:
 
         """
 
-        # Do a preorder traversal, caching the result. To avoid having to do
-        # recursion, we'll store the previous index we've visited in a vector.
-        n = self.count
-
-        curNode = [None] * (2 * n)
-        lvisited = np.zeros((2 * n,), dtype=bool)
-        rvisited = np.zeros((2 * n,), dtype=bool)
-        curNode[0] = self
-        k = 0
+        # Do a preorder traversal with an explicit stack of the nodes still
+        # to be visited, pushing the right child first so that the left
+        # subtree is visited before it.
+        stack = [self]
         preorder = []
-        while k >= 0:
-            nd = curNode[k]
-            ndid = nd.id
-            if nd.is_leaf():
+        while stack:
+            nd = stack.pop()
+            if nd.left is None:
                 preorder.append(func(nd))
-                k = k - 1
             else:
-                if not lvisited[ndid]:
-                    curNode[k + 1] = nd.left
-                    lvisited[ndid] = True
-                    k = k + 1
-                elif not rvisited[ndid]:
-                    curNode[k + 1] = nd.right
-                    rvisited[ndid] = True
-                    k = k + 1
-                # If we've visited the left and right of this non-leaf
-                # node already, go up in the tree.
-                else:
-                    k = k - 1
+                stack.append(nd.right)
+                stack.append(nd.left)
 
         return preorder
 
@@ -877,9 +885,11 @@ def to_tree(Z, rd=False):
 
     nd = None
 
-    for i in xrange(0, n - 1):
-        fi = int(Z[i, 0])
-        fj = int(Z[i, 1])
+    # Reading the rows as Python floats is much faster than indexing Z
+    # element by element.
+    for i, (fi, fj, dist, count) in enumerate(Z.tolist()):
+        fi = int(fi)
+        fj = int(fj)
         if fi > i + n:
             raise ValueError(('Corrupt matrix Z. Index to derivative cluster '
                               'is used before it is formed. See row %d, '
@@ -888,9 +898,9 @@ def to_tree(Z, rd=False):
             raise ValueError(('Corrupt matrix Z. Index to derivative cluster '
                               'is used before it is formed. See row %d, '
                               'column 1') % fj)
-        nd = ClusterNode(i + n, d[fi], d[fj],  Z[i, 2])
+        nd = ClusterNode(i + n, d[fi], d[fj], dist)
         #          ^ id   ^ left ^ right ^ dist
-        if Z[i, 3] != nd.count:
+        if count != nd.count:
             raise ValueError(('Corrupt matrix Z. The count Z[%d,3] is '
                               'incorrect.') % i)
         d[n + i] = nd
@@ -1557,6 +1567,146 @@ def fcluster(Z, t, criterion='inconsistent', depth=2, R=None, monocrit=None):
     return T
 
 
+def fcluster_multi(Z, thresholds, criterion='inconsistent', depth=2, R=None,
+                   monocrit=None):
+    """
+    Forms flat clusters from the hierarchical clustering defined by
+    the linkage matrix ``Z`` for each of several thresholds.
+
+    ``fcluster_multi(Z, thresholds, criterion)[i]`` is the same as
+    ``fcluster(Z, thresholds[i], criterion)``, but the linkage is
+    validated and the criterion computed only once, and each threshold
+    is applied with vectorized operations.
+
+    Parameters
+    ----------
+    Z : ndarray
+        The hierarchical clustering encoded with the matrix returned
+        by the `linkage` function.
+    thresholds : array_like
+        A one-dimensional sequence of thresholds to apply when forming
+        flat clusters.
+    criterion : str, optional
+        The criterion to use in forming flat clusters. One of
+        'inconsistent' (default), 'distance', 'maxclust', 'monocrit'
+        or 'maxclust_monocrit'; see ``fcluster``.
+    depth : int, optional
+        The maximum depth to perform the inconsistency calculation.
+        It has no meaning for the other criteria. Default is 2.
+    R : ndarray, optional
+        The inconsistency matrix to use for the 'inconsistent'
+        criterion. This matrix is computed if not provided.
+    monocrit : ndarray, optional
+        An array of length n-1 used by the 'monocrit' and
+        'maxclust_monocrit' criteria; see ``fcluster``.
+
+    Returns
+    -------
+    T : ndarray
+        An array of shape ``(len(thresholds), n)``. ``T[i, j]`` is the
+        flat cluster number to which original observation ``j`` belongs
+        for the threshold ``thresholds[i]``.
+
+    """
+    Z = np.asarray(Z, order='c')
+    is_valid_linkage(Z, throw=True, name='Z')
+    thresholds = np.asarray(thresholds)
+    if thresholds.ndim != 1:
+        raise ValueError('thresholds must be one-dimensional.')
+
+    n = Z.shape[0] + 1
+    [Z] = _copy_arrays_if_base_present([Z])
+
+    # The criterion of each non-singleton cluster. It is monotonic, so the
+    # flat clusters for a threshold t are the clusters whose criterion is
+    # at most t while their parent's is not, and the observations outside
+    # of them.
+    crit = np.zeros((n - 1,))
+    if criterion == 'inconsistent':
+        if R is None:
+            R = inconsistent(Z, depth)
+        else:
+            R = np.asarray(R, order='c')
+            is_valid_im(R, throw=True, name='R')
+            [R] = _copy_arrays_if_base_present([R])
+        _hierarchy_wrap.get_max_Rfield_for_each_cluster_wrap(Z, R, crit,
+                                                             int(n), 3)
+    elif criterion in ('distance', 'maxclust'):
+        _hierarchy_wrap.get_max_dist_for_each_cluster_wrap(Z, crit, int(n))
+    elif criterion in ('monocrit', 'maxclust_monocrit'):
+        crit = np.asarray(monocrit, dtype=np.double)
+    else:
+        raise ValueError('Invalid cluster formation criterion: %s'
+                         % str(criterion))
+
+    if criterion in ('maxclust', 'maxclust_monocrit'):
+        # With m of the merges done, n - m flat clusters are formed, so
+        # the smallest threshold giving at most t clusters is the
+        # (n - t)-th smallest criterion.
+        scrit = np.sort(crit)
+        k = np.clip(n - thresholds.astype(int) - 1, 0, n - 2)
+        cutoffs = scrit[k]
+    else:
+        cutoffs = thresholds.astype(np.double)
+
+    # Number the flat clusters the way fcluster does. Its depth-first
+    # walk assigns a number to a flat cluster when it enters the
+    # cluster's root, and to an observation left on its own when it
+    # leaves the observation's parent. pre and post hold the times at
+    # which the walk enters and leaves each non-singleton cluster, and
+    # leaf the times at which it numbers each observation.
+    pre = np.zeros((n - 1,), dtype=int)
+    post = np.zeros((n - 1,), dtype=int)
+    leaf = np.zeros((n,), dtype=int)
+    rows = Z[:, :2].astype(int).tolist()
+    clock = 0
+    stack = [(2 * n - 2, False)]
+    while stack:
+        i, done = stack.pop()
+        lid, rid = rows[i - n]
+        if not done:
+            pre[i - n] = clock
+            clock += 1
+            stack.append((i, True))
+            if rid >= n:
+                stack.append((rid, False))
+            if lid >= n:
+                stack.append((lid, False))
+        else:
+            if lid < n:
+                leaf[lid] = clock
+                clock += 1
+            if rid < n:
+                leaf[rid] = clock
+                clock += 1
+            post[i - n] = clock
+
+    # The parent of each non-singleton cluster; the root points past the
+    # end, to a slot that is never below the threshold.
+    parent = np.zeros((2 * n - 1,), dtype=int)
+    parent[Z[:, :2].astype(int)] = np.arange(n - 1)[:, np.newaxis]
+    parent = parent[n:]
+    parent[-1] = n - 1
+
+    T = np.zeros((len(cutoffs), n), dtype='i')
+    below = np.zeros((n,), dtype=bool)
+    for i, cutoff in enumerate(cutoffs):
+        below[:-1] = crit <= cutoff
+        roots = np.nonzero(below[:-1] & ~below[parent])[0]
+        # The roots' time intervals are disjoint; find the one, if any,
+        # that contains the time each observation is numbered at.
+        order = np.argsort(pre[roots])
+        starts = pre[roots][order]
+        ends = post[roots][order]
+        j = np.searchsorted(starts, leaf, side='right') - 1
+        inside = j >= 0
+        inside[inside] = leaf[inside] < ends[j[inside]]
+        key = leaf.copy()
+        key[inside] = starts[j[inside]]
+        T[i] = np.unique(key, return_inverse=True)[1] + 1
+    return T
+
+
 def fclusterdata(X, t, criterion='inconsistent', \
                  metric='euclidean', depth=2, method='single', R=None):
     """
@@ -2207,15 +2357,14 @@ def _append_nonsingleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func,
 
 
 def _append_contraction_marks(Z, iv, i, n, contraction_marks):
-    _append_contraction_marks_sub(Z, iv, Z[i - n, 0], n, contraction_marks)
-    _append_contraction_marks_sub(Z, iv, Z[i - n, 1], n, contraction_marks)
-
-
-def _append_contraction_marks_sub(Z, iv, i, n, contraction_marks):
-    if i >= n:
-        contraction_marks.append((iv, Z[i - n, 2]))
-        _append_contraction_marks_sub(Z, iv, Z[i - n, 0], n, contraction_marks)
-        _append_contraction_marks_sub(Z, iv, Z[i - n, 1], n, contraction_marks)
+    # Visit the non-singleton clusters below cluster i in pre-order.
+    stack = [int(Z[i - n, 1]), int(Z[i - n, 0])]
+    while stack:
+        j = stack.pop()
+        if j >= n:
+            contraction_marks.append((iv, Z[j - n, 2]))
+            stack.append(int(Z[j - n, 1]))
+            stack.append(int(Z[j - n, 0]))
 
 
 def _dendrogram_calculate_info(Z, p, truncate_mode, \
@@ -2232,7 +2381,9 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
                                link_color_func=None):
     """
     Calculates the endpoints of the links as well as the labels for the
-    the dendrogram rooted at the node with index i. iv is the independent
+    the dendrogram rooted at the node with index i. The tree is walked
+    with an explicit stack rather than by recursion, so that linkages of
+    any size can be drawn. iv is the independent
     variable value to plot the left-most leaf node below the root node i
     (if orientation='top', this would be the left-most x value where the
     plotting of this root node i and its descendents should begin).
@@ -2273,6 +2424,68 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
     if i == -1:
         raise ValueError("Invalid root cluster index i.")
 
+    # Each frame on the stack is (i, iv, level, state, data). A frame in
+    # state 0 has not been visited yet, one in state 1 is waiting for its
+    # left subtree and one in state 2 for its right subtree. The value
+    # computed for the last finished subtree is passed up in result.
+    stack = [(int(i), iv, level, 0, None)]
+    result = None
+    while stack:
+        i, iv, level, state, data = stack.pop()
+        if state == 0:
+            result = _dendrogram_leaf(Z, p, truncate_mode, n, i, iv, level,
+                                      lvs, ivl, leaf_label_func, labels,
+                                      show_leaf_counts, contraction_marks)
+            if result is not None:
+                continue
+            ua, ub = _dendrogram_children(Z, n, i, count_sort, distance_sort)
+            stack.append((i, iv, level, 1, ub))
+            stack.append((ua, iv, level + 1, 0, None))
+        elif state == 1:
+            ub = data
+            # Updated iv variable and the amount of space used.
+            uwa = result[1]
+            h = Z[i - n, 2]
+            if h >= color_threshold or color_threshold <= 0:
+                c = 'b'
+
+                if currently_below_threshold[0]:
+                    current_color[0] = ((current_color[0] + 1) %
+                                        len(_link_line_colors))
+                currently_below_threshold[0] = False
+            else:
+                currently_below_threshold[0] = True
+                c = _link_line_colors[current_color[0]]
+            stack.append((i, iv, level, 2, (result, h, c)))
+            stack.append((ub, iv + uwa, level + 1, 0, None))
+        else:
+            (uiva, uwa, uah, uamd), h, c = data
+            (uivb, uwb, ubh, ubmd) = result
+
+            max_dist = max(uamd, ubmd, h)
+
+            icoord_list.append([uiva, uiva, uivb, uivb])
+            dcoord_list.append([uah, h, h, ubh])
+            if link_color_func is not None:
+                v = link_color_func(int(i))
+                if type(v) != types.StringType:
+                    raise TypeError("link_color_func must return a "
+                                    "matplotlib color string!")
+                color_list.append(v)
+            else:
+                color_list.append(c)
+            result = (((uiva + uivb) / 2), uwa + uwb, h, max_dist)
+    return result
+
+
+def _dendrogram_leaf(Z, p, truncate_mode, n, i, iv, level, lvs, ivl,
+                     leaf_label_func, labels, show_leaf_counts,
+                     contraction_marks):
+    """
+    Places cluster i as a leaf of the dendrogram if it is one, and
+    returns the tuple _dendrogram_calculate_info returns for it.
+    Returns None if cluster i is drawn as a link.
+    """
     if truncate_mode == 'lastp':
         # If the node is a leaf node but corresponds to a non-single cluster,
         # it's label is either the empty string or the number of original
@@ -2285,10 +2498,6 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
             if contraction_marks is not None:
                 _append_contraction_marks(Z, iv + 5.0, i, n, contraction_marks)
             return (iv + 5.0, 10.0, 0.0, d)
-        elif i < n:
-            _append_singleton_leaf_node(Z, p, n, level, lvs, ivl,
-                                        leaf_label_func, i, labels)
-            return (iv + 5.0, 10.0, 0.0, 0.0)
     elif truncate_mode in ('mtica', 'level'):
         if i > n and level > p:
             d = Z[i - n, 2]
@@ -2298,12 +2507,6 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
             if contraction_marks is not None:
                 _append_contraction_marks(Z, iv + 5.0, i, n, contraction_marks)
             return (iv + 5.0, 10.0, 0.0, d)
-        elif i < n:
-            _append_singleton_leaf_node(Z, p, n, level, lvs, ivl,
-                                        leaf_label_func, i, labels)
-            return (iv + 5.0, 10.0, 0.0, 0.0)
-    elif truncate_mode in ('mlab',):
-        pass
 
     # Otherwise, only truncate if we have a leaf node.
     #
@@ -2315,12 +2518,17 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
         _append_singleton_leaf_node(Z, p, n, level, lvs, ivl,
                                     leaf_label_func, i, labels)
         return (iv + 5.0, 10.0, 0.0, 0.0)
+    return None
 
-    # !!! Otherwise, we don't have a leaf node, so work on plotting a
-    # non-leaf node.
+
+def _dendrogram_children(Z, n, i, count_sort, distance_sort):
+    """
+    Returns the children (ua, ub) of the non-singleton cluster i in the
+    order they are drawn.
+    """
     # Actual indices of a and b
-    aa = Z[i - n, 0]
-    ab = Z[i - n, 1]
+    aa = int(Z[i - n, 0])
+    ab = int(Z[i - n, 1])
     if aa > n:
         # The number of singletons below cluster a
         na = Z[aa - n, 3]
@@ -2379,94 +2587,7 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
     else:
         ua = aa
         ub = ab
-
-    # The distance of the cluster to draw to the left (ua) is uad
-    # and its count is uan. Likewise, the cluster to draw to the
-    # right has distance ubd and count ubn.
-    if ua < n:
-        uad = 0.0
-        uan = 1
-    else:
-        uad = Z[ua - n, 2]
-        uan = Z[ua - n, 3]
-    if ub < n:
-        ubd = 0.0
-        ubn = 1
-    else:
-        ubd = Z[ub - n, 2]
-        ubn = Z[ub - n, 3]
-
-    # Updated iv variable and the amount of space used.
-    (uiva, uwa, uah, uamd) = \
-        _dendrogram_calculate_info(
-            Z=Z, p=p,
-            truncate_mode=truncate_mode,
-            color_threshold=color_threshold,
-            get_leaves=get_leaves,
-            orientation=orientation,
-            labels=labels,
-            count_sort=count_sort,
-            distance_sort=distance_sort,
-            show_leaf_counts=show_leaf_counts,
-            i=ua, iv=iv, ivl=ivl, n=n,
-            icoord_list=icoord_list,
-            dcoord_list=dcoord_list, lvs=lvs,
-            current_color=current_color,
-            color_list=color_list,
-            currently_below_threshold=currently_below_threshold,
-            leaf_label_func=leaf_label_func,
-            level=level + 1, contraction_marks=contraction_marks,
-            link_color_func=link_color_func)
-
-    h = Z[i - n, 2]
-    if h >= color_threshold or color_threshold <= 0:
-        c = 'b'
-
-        if currently_below_threshold[0]:
-            current_color[0] = (current_color[0] + 1) % len(_link_line_colors)
-        currently_below_threshold[0] = False
-    else:
-        currently_below_threshold[0] = True
-        c = _link_line_colors[current_color[0]]
-
-    (uivb, uwb, ubh, ubmd) = \
-        _dendrogram_calculate_info(
-            Z=Z, p=p,
-            truncate_mode=truncate_mode,
-            color_threshold=color_threshold,
-            get_leaves=get_leaves,
-            orientation=orientation,
-            labels=labels,
-            count_sort=count_sort,
-            distance_sort=distance_sort,
-            show_leaf_counts=show_leaf_counts,
-            i=ub, iv=iv + uwa, ivl=ivl, n=n,
-            icoord_list=icoord_list,
-            dcoord_list=dcoord_list, lvs=lvs,
-            current_color=current_color,
-            color_list=color_list,
-            currently_below_threshold=currently_below_threshold,
-            leaf_label_func=leaf_label_func,
-            level=level + 1, contraction_marks=contraction_marks,
-            link_color_func=link_color_func)
-
-    # The height of clusters a and b
-    ah = uad
-    bh = ubd
-
-    max_dist = max(uamd, ubmd, h)
-
-    icoord_list.append([uiva, uiva, uivb, uivb])
-    dcoord_list.append([uah, h, h, ubh])
-    if link_color_func is not None:
-        v = link_color_func(int(i))
-        if type(v) != types.StringType:
-            raise TypeError("link_color_func must return a matplotlib "
-                            "color string!")
-        color_list.append(v)
-    else:
-        color_list.append(c)
-    return (((uiva + uivb) / 2), uwa + uwb, h, max_dist)
+    return ua, ub
 
 
 def is_isomorphic(T1, T2):
@@ -2710,34 +2831,47 @@ def leaders(Z, T):
 
 def _leaders_test(Z, T):
     tr = to_tree(Z)
-    _leaders_test_recurs_mark(tr, T)
-    return tr
+    asgn = _leaders_test_recurs_mark(tr, T)
+    return (tr, asgn)
 
 
 def _leader_identify(tr, T):
-    if tr.is_leaf():
-        return T[tr.id]
-    else:
-        left = tr.get_left()
-        right = tr.get_right()
-        lfid = _leader_identify(left, T)
-        rfid = _leader_identify(right, T)
-        print 'ndid: %d lid: %d lfid: %d rid: %d rfid: %d' \
-              % (tr.get_id(), left.get_id(), lfid, right.get_id(), rfid)
-        if lfid != rfid:
-            if lfid != -1:
-                print 'leader: %d with tag %d' % (left.id, lfid)
-            if rfid != -1:
-                print 'leader: %d with tag %d' % (right.id, rfid)
-            return -1
+    # Walk the tree in post-order with an explicit stack. fid maps the id
+    # of each finished node to its flat cluster, or -1 if its leaves span
+    # several flat clusters.
+    fid = {}
+    stack = [(tr, False)]
+    while stack:
+        nd, expanded = stack.pop()
+        if nd.is_leaf():
+            fid[nd.id] = T[nd.id]
+        elif not expanded:
+            stack.append((nd, True))
+            stack.append((nd.get_right(), False))
+            stack.append((nd.get_left(), False))
         else:
-            return lfid
+            left = nd.get_left()
+            right = nd.get_right()
+            lfid = fid[left.get_id()]
+            rfid = fid[right.get_id()]
+            print 'ndid: %d lid: %d lfid: %d rid: %d rfid: %d' \
+                  % (nd.get_id(), left.get_id(), lfid, right.get_id(), rfid)
+            if lfid != rfid:
+                if lfid != -1:
+                    print 'leader: %d with tag %d' % (left.id, lfid)
+                if rfid != -1:
+                    print 'leader: %d with tag %d' % (right.id, rfid)
+                fid[nd.id] = -1
+            else:
+                fid[nd.id] = lfid
+    return fid[tr.id]
 
 
 def _leaders_test_recurs_mark(tr, T):
-    if tr.is_leaf():
-        tr.asgn = T[tr.id]
-    else:
-        tr.asgn = -1
-        _leaders_test_recurs_mark(tr.left, T)
-        _leaders_test_recurs_mark(tr.right, T)
+    # Returns the flat cluster of each node below tr indexed by node id,
+    # with -1 for the non-singleton nodes. The nodes have __slots__, so
+    # the assignments cannot be stored on them.
+    asgn = -np.ones((tr.id + 1,), dtype=int)
+    leaves = tr.pre_order()
+    asgn[leaves] = np.asarray(T)[leaves]
+    return asgn
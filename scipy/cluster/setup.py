@@ -13,6 +13,7 @@ def configuration(parent_package = '', top_path = None):
     config = Configuration('cluster', parent_package, top_path)
 
     config.add_data_dir('tests')
+    config.add_data_dir('benchmarks')
 
     config.add_extension('_vq',
         sources=[join('src', 'vq_module.c'), join('src', 'vq.c')],
@@ -634,6 +634,555 @@ finished:
   return result;
 }
 
+/** Finds the root of x in the union-find forest parent, halving the path
+    along the way. */
+static NPY_INLINE int uf_find(int *parent, int x) {
+  while (parent[x] != x) {
+    parent[x] = parent[parent[x]];
+    x = parent[x];
+  }
+  return x;
+}
+
+/** Orders the rows of an unlabelled linkage by merge distance, then by
+    the merge index stored in the count column, which keeps the sort
+    stable. */
+static int cmp_merge(const void *p, const void *q) {
+  const double *u = (const double*)p, *v = (const double*)q;
+  if (u[CPY_LIN_DIST] < v[CPY_LIN_DIST]) {
+    return -1;
+  }
+  if (u[CPY_LIN_DIST] > v[CPY_LIN_DIST]) {
+    return 1;
+  }
+  if (u[CPY_LIN_CNT] < v[CPY_LIN_CNT]) {
+    return -1;
+  }
+  return u[CPY_LIN_CNT] > v[CPY_LIN_CNT];
+}
+
+/** Turns a list of merges between observations into a linkage matrix.
+    Row k of Z holds the indices of two observations, one from each of
+    the clusters merged, and the merge distance. When sort is nonzero,
+    the rows are first ordered by distance. The observations are then
+    replaced by the ids of the clusters that contain them, the smaller
+    id on the left, and the cluster sizes are filled in. */
+int linkage_label(double *Z, int n, int sort) {
+  int k, a, b, t;
+  int *parent, *size;
+  double *Zrow;
+
+  parent = (int*)malloc(sizeof(int) * (2 * n - 1));
+  size = (int*)malloc(sizeof(int) * (2 * n - 1));
+  if (!parent || !size) {
+    free(parent);
+    free(size);
+    return -1;
+  }
+  if (sort) {
+    for (k = 0; k < n - 1; k++) {
+      Z[k * CPY_LIS + CPY_LIN_CNT] = k;
+    }
+    qsort(Z, n - 1, sizeof(double) * CPY_LIS, cmp_merge);
+  }
+  for (k = 0; k < 2 * n - 1; k++) {
+    parent[k] = k;
+    size[k] = 1;
+  }
+  for (k = 0; k < n - 1; k++) {
+    Zrow = Z + (k * CPY_LIS);
+    a = uf_find(parent, (int)Zrow[CPY_LIN_LEFT]);
+    b = uf_find(parent, (int)Zrow[CPY_LIN_RIGHT]);
+    if (a > b) {
+      t = a;
+      a = b;
+      b = t;
+    }
+    Zrow[CPY_LIN_LEFT] = a;
+    Zrow[CPY_LIN_RIGHT] = b;
+    size[n + k] = size[a] + size[b];
+    Zrow[CPY_LIN_CNT] = size[n + k];
+    parent[a] = n + k;
+    parent[b] = n + k;
+  }
+  free(parent);
+  free(size);
+  return 0;
+}
+
+/** Single linkage of the n observations in X (n by m) by Prim's
+    minimum spanning tree algorithm. The distances are computed as
+    they are needed, so only O(n) extra memory is used. The merges are
+    written to Z unlabelled; see linkage_label. */
+static int linkage_single_obs(const double *X, double *Z, int m, int n) {
+  int i, k, t, best, cur, nr;
+  int *rem;
+  double *D, d;
+  double *Zrow;
+
+  rem = (int*)malloc(sizeof(int) * n);
+  D = (double*)malloc(sizeof(double) * n);
+  if (!rem || !D) {
+    free(rem);
+    free(D);
+    return -1;
+  }
+  for (i = 0; i < n; i++) {
+    rem[i] = i;
+    D[i] = HUGE_VAL;
+  }
+  /** rem[0:nr] holds the observations not yet in the tree. */
+  cur = 0;
+  rem[0] = rem[n - 1];
+  nr = n - 1;
+  for (k = 0; k < n - 1; k++) {
+    best = 0;
+    for (t = 0; t < nr; t++) {
+      i = rem[t];
+      d = euclidean_distance(X + cur * m, X + i * m, m);
+      if (d < D[i]) {
+	D[i] = d;
+      }
+      if (D[i] < D[rem[best]]) {
+	best = t;
+      }
+    }
+    i = rem[best];
+    Zrow = Z + (k * CPY_LIS);
+    Zrow[CPY_LIN_LEFT] = cur;
+    Zrow[CPY_LIN_RIGHT] = i;
+    Zrow[CPY_LIN_DIST] = D[i];
+    rem[best] = rem[--nr];
+    cur = i;
+  }
+  free(rem);
+  free(D);
+  return 0;
+}
+
+static NPY_INLINE double ward_distance(const double *u, const double *v,
+				       double nu, double nv, int m) {
+  return sqrt(2.0 * nu * nv / (nu + nv)) * euclidean_distance(u, v, m);
+}
+
+/** Ward linkage of the n observations in X (n by m) by the nearest
+    neighbour chain algorithm. Each cluster is represented by its
+    centroid and size, stored in the slot of one of its observations.
+    A slot whose size is zero is no longer in use. The merges are
+    written to Z unlabelled; see linkage_label. */
+static int linkage_ward_obs(const double *X, double *Z, int m, int n) {
+  int a, b, c, k, len, first, t;
+  int *chain;
+  double *centroids, *size, d, min;
+  double *Zrow;
+
+  chain = (int*)malloc(sizeof(int) * n);
+  size = (double*)malloc(sizeof(double) * n);
+  centroids = (double*)malloc(sizeof(double) * n * m);
+  if (!chain || !size || !centroids) {
+    free(chain);
+    free(size);
+    free(centroids);
+    return -1;
+  }
+  memcpy(centroids, X, sizeof(double) * n * m);
+  for (c = 0; c < n; c++) {
+    size[c] = 1.0;
+  }
+
+  len = 0;
+  first = 0;
+  for (k = 0; k < n - 1; k++) {
+    if (len == 0) {
+      while (size[first] == 0.0) {
+	first++;
+      }
+      chain[len++] = first;
+    }
+    /** Grow the chain until its last two clusters are reciprocal
+	nearest neighbours. Ties are broken in favour of the previous
+	cluster in the chain, so that the chain cannot cycle. */
+    for (;;) {
+      a = chain[len - 1];
+      if (len > 1) {
+	b = chain[len - 2];
+	min = ward_distance(centroids + a * m, centroids + b * m,
+			    size[a], size[b], m);
+      }
+      else {
+	b = -1;
+	min = HUGE_VAL;
+      }
+      for (c = 0; c < n; c++) {
+	if (c == a || size[c] == 0.0) {
+	  continue;
+	}
+	d = ward_distance(centroids + a * m, centroids + c * m,
+			  size[a], size[c], m);
+	if (d < min) {
+	  min = d;
+	  b = c;
+	}
+      }
+      if (len > 1 && b == chain[len - 2]) {
+	break;
+      }
+      chain[len++] = b;
+    }
+    len -= 2;
+    if (a > b) {
+      t = a;
+      a = b;
+      b = t;
+    }
+    Zrow = Z + (k * CPY_LIS);
+    Zrow[CPY_LIN_LEFT] = a;
+    Zrow[CPY_LIN_RIGHT] = b;
+    Zrow[CPY_LIN_DIST] = min;
+    combine_centroids(centroids + b * m, centroids + a * m,
+		      centroids + b * m, size[a], size[b], m);
+    size[b] += size[a];
+    size[a] = 0.0;
+  }
+  free(chain);
+  free(size);
+  free(centroids);
+  return 0;
+}
+
+/** Finds the nearest neighbour of cluster i among the clusters in the
+    slots after it. */
+static void nn_update(const double *centroids, const double *size,
+		      int *nn, double *mind, int i, int m, int n) {
+  int j;
+  double d;
+  nn[i] = -1;
+  mind[i] = HUGE_VAL;
+  for (j = i + 1; j < n; j++) {
+    if (size[j] == 0.0) {
+      continue;
+    }
+    d = euclidean_distance(centroids + i * m, centroids + j * m, m);
+    if (d < mind[i]) {
+      mind[i] = d;
+      nn[i] = j;
+    }
+  }
+}
+
+/** Centroid or median linkage of the n observations in X (n by m).
+    These methods are not reducible, so the nearest neighbour chain
+    does not apply. Instead, the nearest neighbour among the later
+    slots is cached for every cluster and only refreshed for the
+    clusters a merge affects. The merges are written to Z, in order,
+    unlabelled; see linkage_label. */
+static int linkage_centroid_obs(const double *X, double *Z, int m, int n,
+				int method) {
+  int a, b, i, k;
+  int *nn;
+  double *centroids, *size, *mind, d;
+  double *Zrow;
+
+  nn = (int*)malloc(sizeof(int) * n);
+  mind = (double*)malloc(sizeof(double) * n);
+  size = (double*)malloc(sizeof(double) * n);
+  centroids = (double*)malloc(sizeof(double) * n * m);
+  if (!nn || !mind || !size || !centroids) {
+    free(nn);
+    free(mind);
+    free(size);
+    free(centroids);
+    return -1;
+  }
+  memcpy(centroids, X, sizeof(double) * n * m);
+  for (i = 0; i < n; i++) {
+    size[i] = 1.0;
+  }
+  for (i = 0; i < n; i++) {
+    nn_update(centroids, size, nn, mind, i, m, n);
+  }
+
+  for (k = 0; k < n - 1; k++) {
+    a = -1;
+    for (i = 0; i < n; i++) {
+      if (size[i] != 0.0 && nn[i] >= 0 && (a < 0 || mind[i] < mind[a])) {
+	a = i;
+      }
+    }
+    b = nn[a];
+    Zrow = Z + (k * CPY_LIS);
+    Zrow[CPY_LIN_LEFT] = a;
+    Zrow[CPY_LIN_RIGHT] = b;
+    Zrow[CPY_LIN_DIST] = mind[a];
+
+    /** The new cluster takes the slot of b. */
+    if (method == CPY_LINKAGE_MEDIAN) {
+      combine_centroids(centroids + b * m, centroids + a * m,
+			centroids + b * m, 1.0, 1.0, m);
+    }
+    else {
+      combine_centroids(centroids + b * m, centroids + a * m,
+			centroids + b * m, size[a], size[b], m);
+    }
+    size[b] += size[a];
+    size[a] = 0.0;
+
+    for (i = 0; i < b; i++) {
+      if (size[i] == 0.0) {
+	continue;
+      }
+      if (nn[i] == a || nn[i] == b) {
+	nn_update(centroids, size, nn, mind, i, m, n);
+      }
+      else {
+	d = euclidean_distance(centroids + i * m, centroids + b * m, m);
+	if (d < mind[i]) {
+	  mind[i] = d;
+	  nn[i] = b;
+	}
+      }
+    }
+    nn_update(centroids, size, nn, mind, b, m, n);
+  }
+  free(nn);
+  free(mind);
+  free(size);
+  free(centroids);
+  return 0;
+}
+
+/** Computes the linkage of the n observations in X (n by m) under the
+    euclidean metric without forming the distance matrix. The method
+    must be single, ward, centroid or median. Returns -1 if memory
+    cannot be allocated. */
+int linkage_obs(const double *X, double *Z, int m, int n, int method) {
+  int result;
+  switch (method) {
+  case CPY_LINKAGE_SINGLE:
+    result = linkage_single_obs(X, Z, m, n);
+    break;
+  case CPY_LINKAGE_WARD:
+    result = linkage_ward_obs(X, Z, m, n);
+    break;
+  case CPY_LINKAGE_CENTROID:
+  case CPY_LINKAGE_MEDIAN:
+    result = linkage_centroid_obs(X, Z, m, n, method);
+    break;
+  default:
+    result = -1;
+    break;
+  }
+  if (result == -1) {
+    return -1;
+  }
+  /** Centroid and median merges already come out in order; the merge
+      distances need not be monotonic for them. */
+  return linkage_label(Z, n, method == CPY_LINKAGE_SINGLE
+		       || method == CPY_LINKAGE_WARD);
+}
+
+/** The offset of the distance between observations i and j (i != j) in
+    a condensed distance matrix of n observations. */
+static NPY_INLINE npy_intp condensed_index(npy_intp n, npy_intp i, npy_intp j) {
+  if (i > j) {
+    return n * j - (j * (j + 1)) / 2 + i - j - 1;
+  }
+  return n * i - (i * (i + 1)) / 2 + j - i - 1;
+}
+
+/** Single linkage of the condensed distance matrix dm by Prim's minimum
+    spanning tree algorithm in O(n^2) time. The merges are written to Z
+    unlabelled; see linkage_label. */
+static int linkage_single_dm(const double *dm, double *Z, int n) {
+  int i, k, t, best, cur, nr;
+  int *rem;
+  double *D, d;
+  double *Zrow;
+
+  rem = (int*)malloc(sizeof(int) * n);
+  D = (double*)malloc(sizeof(double) * n);
+  if (!rem || !D) {
+    free(rem);
+    free(D);
+    return -1;
+  }
+  for (i = 0; i < n; i++) {
+    rem[i] = i;
+    D[i] = HUGE_VAL;
+  }
+  cur = 0;
+  rem[0] = rem[n - 1];
+  nr = n - 1;
+  for (k = 0; k < n - 1; k++) {
+    best = 0;
+    for (t = 0; t < nr; t++) {
+      i = rem[t];
+      d = dm[condensed_index(n, cur, i)];
+      if (d < D[i]) {
+	D[i] = d;
+      }
+      if (D[i] < D[rem[best]]) {
+	best = t;
+      }
+    }
+    i = rem[best];
+    Zrow = Z + (k * CPY_LIS);
+    Zrow[CPY_LIN_LEFT] = cur;
+    Zrow[CPY_LIN_RIGHT] = i;
+    Zrow[CPY_LIN_DIST] = D[i];
+    rem[best] = rem[--nr];
+    cur = i;
+  }
+  free(rem);
+  free(D);
+  return 0;
+}
+
+/** Complete, average, weighted or ward linkage of the condensed
+    distance matrix dm by the nearest neighbour chain algorithm in
+    O(n^2) time. These methods are reducible, so merging reciprocal
+    nearest neighbours as they are found gives the same tree as always
+    merging the closest pair. The new distances are computed with the
+    same formulas as dist_complete, dist_average, dist_weighted and
+    dist_ward. The merges are written to Z unlabelled; see
+    linkage_label. */
+static int linkage_nn_chain_dm(const double *dm, double *Z, int n,
+			       int method) {
+  int a, b, c, k, len, first, t;
+  int *chain;
+  double *D, *size, d, min, drx, dsx, rn, sn, xn, rf, sf, xf;
+  double *Zrow;
+
+  chain = (int*)malloc(sizeof(int) * n);
+  size = (double*)malloc(sizeof(double) * n);
+  D = (double*)malloc(sizeof(double) * NCHOOSE2((npy_intp)n));
+  if (!chain || !size || !D) {
+    free(chain);
+    free(size);
+    free(D);
+    return -1;
+  }
+  memcpy(D, dm, sizeof(double) * NCHOOSE2((npy_intp)n));
+  for (c = 0; c < n; c++) {
+    size[c] = 1.0;
+  }
+
+  len = 0;
+  first = 0;
+  for (k = 0; k < n - 1; k++) {
+    if (len == 0) {
+      while (size[first] == 0.0) {
+	first++;
+      }
+      chain[len++] = first;
+    }
+    /** Ties are broken in favour of the previous cluster in the chain,
+	so that the chain cannot cycle. */
+    for (;;) {
+      a = chain[len - 1];
+      if (len > 1) {
+	b = chain[len - 2];
+	min = D[condensed_index(n, a, b)];
+      }
+      else {
+	b = -1;
+	min = HUGE_VAL;
+      }
+      for (c = 0; c < n; c++) {
+	if (c == a || size[c] == 0.0) {
+	  continue;
+	}
+	d = D[condensed_index(n, a, c)];
+	if (d < min) {
+	  min = d;
+	  b = c;
+	}
+      }
+      if (len > 1 && b == chain[len - 2]) {
+	break;
+      }
+      chain[len++] = b;
+    }
+    len -= 2;
+    if (a > b) {
+      t = a;
+      a = b;
+      b = t;
+    }
+    Zrow = Z + (k * CPY_LIS);
+    Zrow[CPY_LIN_LEFT] = a;
+    Zrow[CPY_LIN_RIGHT] = b;
+    Zrow[CPY_LIN_DIST] = min;
+
+    /** The new cluster takes the slot of b. */
+    rn = size[a];
+    sn = size[b];
+    for (c = 0; c < n; c++) {
+      if (c == a || c == b || size[c] == 0.0) {
+	continue;
+      }
+      drx = D[condensed_index(n, c, a)];
+      dsx = D[condensed_index(n, c, b)];
+      switch (method) {
+      case CPY_LINKAGE_COMPLETE:
+	d = CPY_MAX(drx, dsx);
+	break;
+      case CPY_LINKAGE_AVERAGE:
+	xn = size[c];
+	d = ((double)1.0 / (xn * (rn + sn))) * ((drx * (rn * xn))
+						+ (dsx * (sn * xn)));
+	break;
+      case CPY_LINKAGE_WARD:
+	xn = size[c];
+	rf = (rn + xn) / (rn + sn + xn);
+	sf = (sn + xn) / (rn + sn + xn);
+	xf = -xn / (rn + sn + xn);
+	d = sqrt(rf * (drx * drx) +
+		 sf * (dsx * dsx) +
+		 xf * (min * min));
+	break;
+      case CPY_LINKAGE_WEIGHTED:
+      default:
+	d = (drx + dsx) / 2;
+	break;
+      }
+      D[condensed_index(n, c, b)] = d;
+    }
+    size[b] += size[a];
+    size[a] = 0.0;
+  }
+  free(chain);
+  free(size);
+  free(D);
+  return 0;
+}
+
+/** Computes the linkage of the condensed distance matrix dm of n
+    observations in O(n^2) time. The method must be single, complete,
+    average, weighted or ward. Returns -1 if memory cannot be
+    allocated. */
+int linkage_dm(const double *dm, double *Z, int n, int method) {
+  int result;
+  switch (method) {
+  case CPY_LINKAGE_SINGLE:
+    result = linkage_single_dm(dm, Z, n);
+    break;
+  case CPY_LINKAGE_COMPLETE:
+  case CPY_LINKAGE_AVERAGE:
+  case CPY_LINKAGE_WEIGHTED:
+  case CPY_LINKAGE_WARD:
+    result = linkage_nn_chain_dm(dm, Z, n, method);
+    break;
+  default:
+    result = -1;
+    break;
+  }
+  if (result == -1) {
+    return -1;
+  }
+  return linkage_label(Z, n, 1);
+}
+
 /** Trying to reimplement so that output is consistent with MATLAB's in
     cases where there are is than one correct choice to make at each
     iteration of the algorithm. This implementation is not active.
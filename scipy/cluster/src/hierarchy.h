@@ -104,6 +104,9 @@ int leaders(const double *Z, const int *T, int *L, int *M, int kk, int n);
 
 int linkage(double *dm, double *Z, double *X, int m, int n, int ml, int kc, distfunc dfunc, int method);
 void linkage_alt(double *dm, double *Z, double *X, int m, int n, int ml, int kc, distfunc dfunc, int method);
+int linkage_label(double *Z, int n, int sort);
+int linkage_obs(const double *X, double *Z, int m, int n, int method);
+int linkage_dm(const double *dm, double *Z, int n, int method);
 
 void cophenetic_distances(const double *Z, double *d, int n);
 void cpy_to_tree(const double *Z, cnode **tnodes, int n);
@@ -42,7 +42,6 @@
 extern PyObject *linkage_wrap(PyObject *self, PyObject *args) {
   int method, n;
   PyArrayObject *dm, *Z;
-  distfunc *df;
   if (!PyArg_ParseTuple(args, "O!O!ii",
 			&PyArray_Type, &dm,
 			&PyArray_Type, &Z,
@@ -51,6 +50,36 @@ extern PyObject *linkage_wrap(PyObject *self, PyObject *args) {
     return NULL;
   }
   else {
+    if (linkage_dm((const double*)dm->data, (double*)Z->data,
+                   n, method) == -1) {
+      PyErr_SetString(PyExc_MemoryError,
+                      "out of memory while computing linkage");
+      return NULL;
+    }
+  }
+  return Py_BuildValue("d", 0.0);
+}
+
+/** The original O(n^3) linkage algorithm, which is no longer used by
+    scipy.cluster.hierarchy.linkage.  It is kept to test the faster
+    algorithms against.  X may be None unless the method is centroid,
+    median or ward. */
+extern PyObject *linkage_generic_wrap(PyObject *self, PyObject *args) {
+  int method, m, n, euclid;
+  PyArrayObject *dm, *Z;
+  PyObject *X;
+  distfunc *df;
+  if (!PyArg_ParseTuple(args, "O!O!Oiii",
+			&PyArray_Type, &dm,
+			&PyArray_Type, &Z,
+			&X,
+			&m,
+			&n,
+			&method)) {
+    return NULL;
+  }
+  else {
+    euclid = 0;
     switch (method) {
     case CPY_LINKAGE_SINGLE:
       df = dist_single;
@@ -64,13 +93,27 @@ extern PyObject *linkage_wrap(PyObject *self, PyObject *args) {
     case CPY_LINKAGE_WEIGHTED:
       df = dist_weighted;
       break;
-    default:
-      /** Report an error. */
-      df = 0;
+    case CPY_LINKAGE_CENTROID:
+    case CPY_LINKAGE_MEDIAN:
+      df = dist_centroid;
+      euclid = 1;
       break;
+    case CPY_LINKAGE_WARD:
+      df = dist_ward;
+      euclid = 1;
+      break;
+    default:
+      PyErr_SetString(PyExc_ValueError, "invalid linkage method");
+      return NULL;
+    }
+    if (euclid && !PyArray_Check(X)) {
+      PyErr_SetString(PyExc_TypeError,
+                      "the observations are needed for this method");
+      return NULL;
     }
     if (linkage((double*)dm->data, (double*)Z->data,
-                0, 0, n, 0, 0, df, method) == -1) {
+                euclid ? (double*)((PyArrayObject*)X)->data : 0,
+                m, n, euclid, euclid, df, method) == -1) {
       PyErr_SetString(PyExc_MemoryError,
                       "out of memory while computing linkage");
       return NULL;
@@ -79,40 +122,20 @@ extern PyObject *linkage_wrap(PyObject *self, PyObject *args) {
   return Py_BuildValue("d", 0.0);
 }
 
-extern PyObject *linkage_euclid_wrap(PyObject *self, PyObject *args) {
-  int method, m, n, ml;
-  PyArrayObject *dm, *Z, *X;
-  distfunc *df;
-  if (!PyArg_ParseTuple(args, "O!O!O!iii",
-			&PyArray_Type, &dm,
-			&PyArray_Type, &Z,
+extern PyObject *linkage_obs_wrap(PyObject *self, PyObject *args) {
+  int method, m, n;
+  PyArrayObject *Z, *X;
+  if (!PyArg_ParseTuple(args, "O!O!iii",
 			&PyArray_Type, &X,
+			&PyArray_Type, &Z,
 			&m,
 			&n,
 			&method)) {
     return NULL;
   }
   else {
-    ml = 0;
-    /**    fprintf(stderr, "m: %d, n: %d\n", m, n);**/
-    switch (method) {
-    case CPY_LINKAGE_CENTROID:
-      df = dist_centroid;
-      break;
-    case CPY_LINKAGE_MEDIAN:
-      df = dist_centroid;
-      break;
-    case CPY_LINKAGE_WARD:
-      df = dist_ward;
-      //      ml = 1;
-      break;
-    default:
-      /** Report an error. */
-      df = 0;
-      break;
-    }
-    if (linkage((double*)dm->data, (double*)Z->data, (double*)X->data,
-	              m, n, 1, 1, df, method) == -1) {
+    if (linkage_obs((const double*)X->data, (double*)Z->data,
+                    m, n, method) == -1) {
       PyErr_SetString(PyExc_MemoryError,
                       "out of memory while computing linkage");
       return NULL;
@@ -376,7 +399,8 @@ static PyMethodDef _hierarchyWrapMethods[] = {
    get_max_Rfield_for_each_cluster_wrap, METH_VARARGS},
   {"inconsistent_wrap", inconsistent_wrap, METH_VARARGS},
   {"leaders_wrap", leaders_wrap, METH_VARARGS},
-  {"linkage_euclid_wrap", linkage_euclid_wrap, METH_VARARGS},
+  {"linkage_generic_wrap", linkage_generic_wrap, METH_VARARGS},
+  {"linkage_obs_wrap", linkage_obs_wrap, METH_VARARGS},
   {"linkage_wrap", linkage_wrap, METH_VARARGS},
   {"prelist_wrap", prelist_wrap, METH_VARARGS},
   {NULL, NULL}     /* Sentinel - marks the end of this structure */
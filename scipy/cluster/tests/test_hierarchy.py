@@ -34,15 +34,19 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import os.path
+import pickle
 
 import numpy as np
-from numpy.testing import TestCase, run_module_suite
+from numpy.testing import TestCase, run_module_suite, assert_, \
+        assert_equal, assert_almost_equal
 
 from scipy.cluster.hierarchy import linkage, from_mlab_linkage, to_mlab_linkage,\
         num_obs_linkage, inconsistent, cophenet, fclusterdata, fcluster, \
-        is_isomorphic, single, complete, weighted, centroid, leaders, \
-        correspond, is_monotonic, maxdists, maxinconsts, maxRstat, \
-        is_valid_linkage, is_valid_im, to_tree, leaves_list, dendrogram
+        fcluster_multi, is_isomorphic, single, complete, weighted, centroid, \
+        median, ward, leaders, correspond, is_monotonic, maxdists, \
+        maxinconsts, maxRstat, is_valid_linkage, is_valid_im, to_tree, \
+        leaves_list, dendrogram, _cpy_linkage_ids
+from scipy.cluster import _hierarchy_wrap
 from scipy.spatial.distance import squareform, pdist
 
 _tdist = np.array([[0,    662,  877,  255,  412,  996],
@@ -108,6 +112,69 @@ def load_testing_files():
 load_testing_files()
 
 
+_methods = ['single', 'complete', 'average', 'weighted', 'centroid',
+            'median', 'ward']
+
+def linkage_generic(X, method):
+    "The linkage of the observations X computed by the old O(n^3) algorithm."
+    n, m = X.shape
+    Z = np.zeros((n - 1, 4))
+    y = pdist(X)
+    if method not in ('centroid', 'median', 'ward'):
+        X = None
+    _hierarchy_wrap.linkage_generic_wrap(y, Z, X, m, n,
+                                         _cpy_linkage_ids[method])
+    return Z
+
+def check_greedy_merges(Z, X, method, tol=1e-10):
+    """Checks that every merge of Z joins two of the closest clusters
+    left, which holds for any order of merges at equal distances."""
+    n = X.shape[0]
+    euclid = method in ('centroid', 'median', 'ward')
+    D = np.empty((2 * n - 1, 2 * n - 1))
+    D.fill(np.inf)
+    D[:n, :n] = squareform(pdist(X))
+    if euclid:
+        # the Lance-Williams updates of these are on squared distances
+        D **= 2
+    D[np.arange(n), np.arange(n)] = np.inf
+    size = np.ones(2 * n - 1)
+    active = list(range(n))
+    for k in range(n - 1):
+        i, j = int(Z[k, 0]), int(Z[k, 1])
+        dmin = D[np.ix_(active, active)].min()
+        assert_(D[i, j] <= dmin + tol, "merge %d is not a closest pair" % k)
+        if euclid:
+            assert_almost_equal(Z[k, 2] ** 2, D[i, j])
+        else:
+            assert_almost_equal(Z[k, 2], D[i, j])
+        active.remove(i)
+        active.remove(j)
+        ni, nj = size[i], size[j]
+        for l in active:
+            nl, dil, djl, dij = size[l], D[i, l], D[j, l], D[i, j]
+            if method == 'single':
+                d = min(dil, djl)
+            elif method == 'complete':
+                d = max(dil, djl)
+            elif method == 'average':
+                d = (ni * dil + nj * djl) / (ni + nj)
+            elif method == 'weighted':
+                d = (dil + djl) / 2
+            elif method == 'centroid':
+                d = ((ni * dil + nj * djl) / (ni + nj) -
+                     ni * nj * dij / (ni + nj) ** 2)
+            elif method == 'median':
+                d = dil / 2 + djl / 2 - dij / 4
+            else:
+                d = ((ni + nl) * dil + (nj + nl) * djl - nl * dij) / \
+                    (ni + nj + nl)
+            D[n + k, l] = D[l, n + k] = d
+        size[n + k] = ni + nj
+        assert_equal(Z[k, 3], size[n + k])
+        active.append(n + k)
+
+
 class TestLinkage(TestCase):
     def test_linkage_empty_distance_matrix(self):
         "Tests linkage(Y) where Y is a 0x4 linkage matrix. Exception expected."
@@ -184,6 +251,72 @@ class TestLinkage(TestCase):
         expectedZ = from_mlab_linkage(Zmlab)
         self.assertTrue(within_tol(Z, expectedZ, eps))
 
+    def test_linkage_median_q(self):
+        "Tests linkage(Y, 'median') on the Q data set."
+        X = eo['Q-X']
+        Z = median(X)
+        Zmlab = eo['linkage-Q-median']
+        eps = 1e-07
+        expectedZ = from_mlab_linkage(Zmlab)
+        self.assertTrue(within_tol(Z, expectedZ, eps))
+
+    def test_linkage_ward_q(self):
+        "Tests linkage(Y, 'ward') on the Q data set."
+        X = eo['Q-X']
+        Z = ward(X)
+        Zmlab = eo['linkage-Q-ward']
+        eps = 1e-06
+        expectedZ = from_mlab_linkage(Zmlab)
+        self.assertTrue(within_tol(Z, expectedZ, eps))
+
+    def test_linkage_random_monotonic(self):
+        "Tests that the reducible methods give valid, monotonic linkages."
+        np.random.seed(1234)
+        y = np.random.rand(200 * 199 // 2)
+        for method in ['single', 'complete', 'average', 'weighted']:
+            Z = linkage(y, method)
+            self.assertTrue(is_valid_linkage(Z))
+            self.assertTrue(is_monotonic(Z))
+
+    def test_linkage_single_observations(self):
+        "Tests linkage(X, 'single') against linkage(pdist(X), 'single')."
+        np.random.seed(1234)
+        X = np.random.randn(200, 3)
+        Z = linkage(X, 'single')
+        expectedZ = linkage(pdist(X), 'single')
+        self.assertTrue(within_tol(Z, expectedZ, 1e-12))
+
+    def test_linkage_generic_random(self):
+        "Tests linkage against the old algorithm on distinct distances."
+        np.random.seed(1234)
+        for i in range(5):
+            X = np.random.rand(40, 3)
+            for method in _methods:
+                expectedZ = linkage_generic(X, method)
+                self.assertTrue(within_tol(linkage(X, method), expectedZ,
+                                           1e-10))
+                if method in ('single', 'complete', 'average', 'weighted'):
+                    Z = linkage(pdist(X), method)
+                    self.assertTrue(within_tol(Z, expectedZ, 1e-10))
+
+    def test_linkage_generic_ties(self):
+        "Tests linkage against the old algorithm on many equal distances."
+        np.random.seed(1234)
+        for i in range(5):
+            X = np.random.randint(0, 3, (40, 3)).astype(np.double)
+            for method in _methods:
+                Z = linkage(X, method)
+                expectedZ = linkage_generic(X, method)
+                # both merge two closest clusters at each step, but may
+                # choose different pairs among those at equal distances
+                check_greedy_merges(Z, X, method)
+                check_greedy_merges(expectedZ, X, method)
+                if method == 'single':
+                    # which does not change the single linkage clustering
+                    assert_almost_equal(cophenet(Z), cophenet(expectedZ))
+                    assert_almost_equal(np.sort(Z[:, 2]),
+                                        np.sort(expectedZ[:, 2]))
+
 
 class TestInconsistent(TestCase):
     def test_single_inconsistent_tdist_1(self):
@@ -424,6 +557,23 @@ class TestFcluster(TestCase):
         T = fcluster(Z, criterion='maxclust', t=4)
         self.assertTrue(is_isomorphic(T, expectedT))
 
+    def test_fcluster_multi(self):
+        "Tests fcluster_multi(Z, ts, criterion) against fcluster(Z, t, criterion)."
+        Z = linkage(pdist(eo['Q-X']))
+        R = inconsistent(Z)
+        tests = [('distance', np.linspace(0, Z[:, 2].max() * 1.1, 20), {}),
+                 ('inconsistent', np.linspace(0, R[:, 3].max() * 1.1, 20), {}),
+                 ('maxclust', np.arange(0, Z.shape[0] + 3), {}),
+                 ('monocrit', Z[:, 2], {'monocrit': maxdists(Z)}),
+                 ('maxclust_monocrit', np.arange(1, 10),
+                  {'monocrit': maxinconsts(Z, R)})]
+        for criterion, ts, kwargs in tests:
+            T = fcluster_multi(Z, ts, criterion, **kwargs)
+            self.assertEqual(T.shape, (len(ts), Z.shape[0] + 1))
+            for t, row in zip(ts, T):
+                expectedT = fcluster(Z, t, criterion, **kwargs)
+                self.assertTrue((row == expectedT).all())
+
 class TestLeaders(TestCase):
     def test_leaders_single(self):
         "Tests leaders using a flat clustering generated by single linkage."
@@ -771,6 +921,18 @@ class TestLeavesList(TestCase):
         node = to_tree(Z)
         self.assertTrue((node.pre_order() == leaves_list(Z)).all())
 
+    def test_to_tree_pickle(self):
+        "Tests that the tree returned by to_tree(Z) can be pickled."
+        Z = linkage(eo['iris'][:20], 'average')
+        node = to_tree(Z)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            node2 = pickle.loads(pickle.dumps(node, protocol))
+            self.assertEqual(node2.pre_order(), node.pre_order())
+            self.assertEqual(node2.get_count(), node.get_count())
+            self.assertEqual(node2.get_left().get_id(),
+                             node.get_left().get_id())
+            self.assertEqual(node2.dist, node.dist)
+
 
 class TestCorrespond(TestCase):
     def test_correspond_empty(self):
@@ -1364,6 +1526,19 @@ class TestDendrogram(TestCase):
         leaves = R["leaves"]
         self.assertEqual(leaves, [2, 5, 1, 0, 3, 4])
 
+    def test_dendrogram_deep_linkage(self):
+        "Tests dendrogram calculation on a linkage deeper than the recursion limit."
+        n = 5000
+        Z = np.zeros((n - 1, 4))
+        Z[0, :2] = [0, 1]
+        Z[1:, 0] = np.arange(n, 2 * n - 2)
+        Z[1:, 1] = np.arange(2, n)
+        Z[:, 2] = np.arange(1, n)
+        Z[:, 3] = np.arange(2, n + 1)
+        R = dendrogram(Z, no_plot=True)
+        self.assertEqual(R["leaves"], range(n))
+        self.assertEqual(to_tree(Z).pre_order(), range(n))
+
 
 def calculate_maximum_distances(Z):
     "Used for testing correctness of maxdists. Very slow."
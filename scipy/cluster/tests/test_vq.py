@@ -8,9 +8,11 @@ import warnings
 
 import numpy as np
 from numpy.testing import assert_array_equal, assert_array_almost_equal, \
-        TestCase, run_module_suite, assert_raises
+        TestCase, run_module_suite, assert_raises, assert_
 
-from scipy.cluster.vq import kmeans, kmeans2, py_vq, py_vq2, vq, ClusterError
+from scipy.cluster.vq import kmeans, kmeans2, py_vq, py_vq2, vq, ClusterError, \
+        minibatch_kmeans
+import scipy.cluster.vq as vq_module
 try:
     from scipy.cluster import _vq
     TESTC=True
@@ -171,11 +173,74 @@ class TestKMean(TestCase):
 
         kmeans2(data, 3, minit = 'random')
         kmeans2(data, 3, minit = 'points')
+        kmeans2(data, 3, minit = '++')
 
         # Check special case 1d
         data = data[:, :1]
         kmeans2(data, 3, minit = 'random')
         kmeans2(data, 3, minit = 'points')
+        kmeans2(data, 3, minit = '++')
+        kmeans2(data[:, 0], 3, minit = '++')
+
+    def test_kmeans2_kpp(self):
+        """k-means++ picks distinct observations, one per separated blob."""
+        np.random.seed(1234)
+        centers = np.array([[0., 0.], [100., 0.], [0., 100.], [100., 100.]])
+        data = np.concatenate([c + np.random.randn(50, 2) for c in centers])
+        for i in range(10):
+            code, label = kmeans2(data, 4, iter = 1, minit = '++')
+            assert_array_equal(np.sort(np.bincount(label)), [50, 50, 50, 50])
+            assert_array_almost_equal(np.sort(np.round(code / 100), axis=0),
+                                      np.sort(centers / 100, axis=0))
+
+    def test_kmeans2_kpp_dtype(self):
+        """k-means++ keeps the dtype of the data, like minit='points'."""
+        np.random.seed(1234)
+        data = np.random.randn(100, 3).astype(np.float32)
+        for minit in ['points', '++']:
+            code, label = kmeans2(data, 3, iter = 1, minit = minit)
+            self.assertEqual(code.dtype, np.float32)
+
+    def test_kmeans2_algorithms(self):
+        """The bounded algorithms give the same result as Lloyd's."""
+        np.random.seed(1234)
+        data = np.concatenate([c + np.random.randn(100, 5)
+                               for c in 4 * np.random.randn(10, 5)])
+        initc = data[np.random.permutation(len(data))[:10]]
+        code1, label1 = kmeans2(data, initc, iter = 10, minit = 'matrix')
+        for algorithm in ['elkan', 'hamerly']:
+            code2, label2 = kmeans2(data, initc, iter = 10, minit = 'matrix',
+                                    algorithm = algorithm)
+            assert_array_almost_equal(code2, code1)
+            assert_array_equal(label2, label1)
+
+        data1 = data[:, 0]
+        code1, label1 = kmeans2(data1, data1[:3], iter = 3)
+        for algorithm in ['elkan', 'hamerly']:
+            code2, label2 = kmeans2(data1, data1[:3], iter = 3,
+                                    algorithm = algorithm)
+            assert_array_almost_equal(code2, code1)
+            assert_array_equal(label2, label1)
+
+        assert_raises(ValueError, kmeans2, data, 3, algorithm = 'foo')
+
+    def test_kmeans2_hamerly_blocks(self):
+        """Hamerly's algorithm gives the same result when the distances
+        are computed for small blocks of observations."""
+        np.random.seed(1234)
+        data = np.concatenate([c + np.random.randn(100, 5)
+                               for c in 4 * np.random.randn(10, 5)])
+        initc = data[np.random.permutation(len(data))[:10]]
+        code1, label1 = kmeans2(data, initc, iter = 10, minit = 'matrix')
+        old_block = vq_module._DIST_BLOCK
+        vq_module._DIST_BLOCK = 64
+        try:
+            code2, label2 = kmeans2(data, initc, iter = 10, minit = 'matrix',
+                                    algorithm = 'hamerly')
+        finally:
+            vq_module._DIST_BLOCK = old_block
+        assert_array_almost_equal(code2, code1)
+        assert_array_equal(label2, label1)
 
     def test_kmeans2_empty(self):
         """Ticket #505."""
@@ -206,5 +271,38 @@ class TestKMean(TestCase):
         except ValueError:
             pass
 
+class TestMiniBatchKMeans(TestCase):
+    def test_single_batch(self):
+        """One batch holding all the data is one step of k-means."""
+        initc = np.concatenate(([[X[0]], [X[1]], [X[2]]]))
+        code, dist = minibatch_kmeans(X, initc, batch_size=len(X))
+        assert_array_almost_equal(code, CODET1)
+        assert_array_almost_equal(dist, vq(X, initc)[1].mean())
+
+    def test_batches(self):
+        np.random.seed(1234)
+        centers = np.array([[0., 0.], [10., 0.], [0., 10.]])
+        data = np.concatenate([c + np.random.randn(500, 2) for c in centers])
+        data = data[np.random.permutation(len(data))]
+        initc = data[:3].copy()
+        while len(np.unique(vq(initc, centers)[0])) < 3:
+            initc = data[np.random.permutation(len(data))[:3]]
+
+        for obs in [data, (data[i:i+100] for i in range(0, len(data), 100))]:
+            code, dist = minibatch_kmeans(obs, initc, batch_size=100, iter=3)
+            assert_array_almost_equal(np.sort(code, axis=0),
+                                      np.sort(centers, axis=0), decimal=0)
+            assert_(dist < 2)
+
+        code, dist = minibatch_kmeans(data, 3, batch_size=100)
+        assert_array_equal(code.shape, (3, 2))
+
+    def test_errors(self):
+        assert_raises(ValueError, minibatch_kmeans, X, 0)
+        assert_raises(ValueError, minibatch_kmeans, X, 20, batch_size=5)
+        assert_raises(ValueError, minibatch_kmeans, X, 2, batch_size=0)
+        assert_raises(ValueError, minibatch_kmeans, iter([]), 2)
+        assert_raises(ValueError, minibatch_kmeans, X, X[:2, :1])
+
 if __name__ == "__main__":
     run_module_suite()
@@ -15,6 +15,8 @@ centroids in a code book.
    kmeans -- Performs k-means on a set of observation vectors forming k clusters
    kmeans2 -- A different implementation of k-means with more methods
            -- for initializing centroids
+   minibatch_kmeans -- Performs k-means on batches of observations, for
+                    -- data sets that do not fit in memory
 
 Background information
 ======================
@@ -69,7 +71,7 @@ code book.
 """
 __docformat__ = 'restructuredtext'
 
-__all__ = ['whiten', 'vq', 'kmeans', 'kmeans2']
+__all__ = ['whiten', 'vq', 'kmeans', 'kmeans2', 'minibatch_kmeans']
 
 # TODO:
 #   - implements high level method for running several times k-means with
@@ -81,7 +83,7 @@ import warnings
 
 from numpy.random import randint
 from numpy import shape, zeros, sqrt, argmin, minimum, array, \
-     newaxis, arange, compress, equal, common_type, single, double, take, \
+     newaxis, common_type, single, double, take, \
      std, mean
 import numpy as np
 
@@ -344,6 +346,43 @@ def py_vq2(obs, code_book):
                                   # much difference.
     return code, min_dist
 
+def _cluster_sums(data, code, nc):
+    """Sizes and sums of the clusters of data labelled with code.
+
+    The observations are accumulated in a single pass over each feature,
+    instead of one pass per cluster.
+
+    Returns
+    -------
+    counts : ndarray
+        counts[i] is the number of observations in cluster i.
+    sums : ndarray
+        sums[i] is the sum of the observations in cluster i.
+
+    """
+    counts = zeros(nc, dtype=np.intp)
+    sums = zeros((nc,) + data.shape[1:])
+    if code.size == 0:
+        return counts, sums
+    n = np.bincount(code)
+    counts[:n.size] = n
+    flat = data.reshape(data.shape[0], -1)
+    flat_sums = sums.reshape(nc, -1)
+    for j in range(flat.shape[1]):
+        s = np.bincount(code, weights=flat[:, j])
+        flat_sums[:s.size, j] = s
+    return counts, sums
+
+def _cluster_centroids(data, code, nc):
+    """Sizes and centroids of the clusters of data labelled with code.
+
+    The centroids of empty clusters are zero.
+
+    """
+    counts, sums = _cluster_sums(data, code, nc)
+    shape = (nc,) + (1,) * (data.ndim - 1)
+    return counts, sums / np.maximum(counts, 1).reshape(shape)
+
 def _kmeans(obs, guess, thresh=1e-5):
     """ "raw" version of k-means.
 
@@ -389,14 +428,10 @@ def _kmeans(obs, guess, thresh=1e-5):
         avg_dist.append(mean(distort, axis=-1))
         #recalc code_book as centroids of associated obs
         if(diff > thresh):
-            has_members = []
-            for i in arange(nc):
-                cell_members = compress(equal(obs_code, i), obs, 0)
-                if cell_members.shape[0] > 0:
-                    code_book[i] = mean(cell_members, 0)
-                    has_members.append(i)
+            counts, centroids = _cluster_centroids(obs, obs_code, nc)
             #remove code_books that didn't have any members
-            code_book = take(code_book, has_members, 0)
+            has_members = counts > 0
+            code_book = centroids[has_members].astype(code_book.dtype)
         if len(avg_dist) > 1:
             diff = avg_dist[-2] - avg_dist[-1]
     #print avg_dist
@@ -581,7 +616,48 @@ def _krandinit(data, k):
     else:
         return init_rankn(data)
 
-_valid_init_meth = {'random': _krandinit, 'points': _kpoints}
+def _kpp(data, k):
+    """Picks k points in data with the k-means++ method.
+
+    The first point is picked at random, and each of the following ones
+    with a probability proportional to its squared distance from the
+    nearest point picked before.  This spreads the initial centroids over
+    the data, so that k-means needs fewer iterations to converge.
+
+    Parameters
+    ----------
+    data : ndarray
+        Expect a rank 1 or 2 array. Rank 1 are assumed to describe one
+        dimensional data, rank 2 multidimensional data, in which case one
+        row is one observation.
+    k : int
+        Number of samples to generate.
+
+    References
+    ----------
+    D. Arthur and S. Vassilvitskii, "k-means++: the advantages of careful
+    seeding", Proceedings of the eighteenth annual ACM-SIAM symposium on
+    Discrete algorithms, 2007.
+
+    """
+    n = data.shape[0]
+    flat = data.reshape(n, -1)
+    x = np.empty((k, flat.shape[1]), dtype=data.dtype)
+    x[0] = flat[randint(0, n)]
+    d2 = np.sum((flat - x[0])**2, axis=1)
+    for i in range(1, k):
+        total = d2.sum()
+        if total > 0:
+            j = np.searchsorted(np.cumsum(d2), np.random.rand() * total)
+            j = min(j, n - 1)
+        else:
+            # all points coincide with the ones picked so far
+            j = randint(0, n)
+        x[i] = flat[j]
+        d2 = np.minimum(d2, np.sum((flat - x[i])**2, axis=1))
+    return x.reshape((k,) + data.shape[1:])
+
+_valid_init_meth = {'random': _krandinit, 'points': _kpoints, '++': _kpp}
 
 def _missing_warn():
     """Print a warning when called."""
@@ -596,7 +672,7 @@ def _missing_raise():
 _valid_miss_meth = {'warn': _missing_warn, 'raise': _missing_raise}
 
 def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
-        missing = 'warn'):
+        missing = 'warn', algorithm = 'lloyd'):
     """
     Classify a set of observations into k clusters using the k-means algorithm.
 
@@ -622,7 +698,7 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
         (not used yet)
     minit : string
         Method for initialization. Available methods are 'random',
-        'points', 'uniform', and 'matrix':
+        'points', '++', 'uniform', and 'matrix':
 
         'random': generate k centroids from a Gaussian with mean and
         variance estimated from the data.
@@ -630,11 +706,44 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
         'points': choose k observations (rows) at random from data for
         the initial centroids.
 
+        '++': choose k observations with the k-means++ method: each
+        observation is chosen with a probability proportional to its
+        squared distance from the closest observation chosen before.
+        This usually reaches a lower distortion in fewer iterations.
+
         'uniform': generate k observations from the data from a uniform
         distribution defined by the data set (unsupported).
 
         'matrix': interpret the k parameter as a k by M (or length k
         array for one-dimensional data) array of initial centroids.
+    missing : string
+        Method to deal with empty clusters. Available methods are
+        'warn' and 'raise':
+
+        'warn': give a warning and continue.
+
+        'raise': raise an ClusterError and terminate the algorithm.
+    algorithm : string
+        How the observations are assigned to the closest centroids.
+        Available methods are 'lloyd', 'elkan' and 'hamerly':
+
+        'lloyd': compute the distances between all observations and all
+        centroids in every iteration.
+
+        'elkan': keep an upper bound on the distance between each
+        observation and its centroid, and lower bounds on its distances
+        to all other centroids, and skip the distances that the bounds
+        and the distances between the centroids show to be irrelevant.
+        After the first few iterations most distances are skipped, at
+        the cost of memory for 'M' by 'k' lower bounds.
+
+        'hamerly': like 'elkan', but with a single lower bound per
+        observation, on the distance to its second closest centroid.
+        This skips fewer distances, but only needs memory for 'M' lower
+        bounds, as the distances to all centroids are computed for
+        blocks of observations at a time.
+
+        All methods give the same result, up to ties in the distances.
 
     Returns
     -------
@@ -648,6 +757,8 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
     """
     if missing not in _valid_miss_meth.keys():
         raise ValueError("Unkown missing method: %s" % str(missing))
+    if algorithm not in ('lloyd', 'elkan', 'hamerly'):
+        raise ValueError("Unknown algorithm: %s" % str(algorithm))
     # If data is rank 1, then we have 1 dimension problem.
     nd  = np.ndim(data)
     if nd == 1:
@@ -694,7 +805,12 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
     if int(iter) < 1:
         raise ValueError("iter = %s is not valid.  iter must be a positive integer." % iter)
 
-    return _kmeans2(data, clusters, iter, nc, _valid_miss_meth[missing])
+    if algorithm == 'lloyd':
+        return _kmeans2(data, clusters, iter, nc, _valid_miss_meth[missing])
+    else:
+        return _kmeans2_bounded(data, clusters, iter, nc,
+                                _valid_miss_meth[missing],
+                                algorithm == 'elkan')
 
 def _kmeans2(data, code, niter, nc, missing):
     """ "raw" version of kmeans2. Do not use directly.
@@ -707,15 +823,288 @@ def _kmeans2(data, code, niter, nc, missing):
         # using the current code book
         label = vq(data, code)[0]
         # Update the code by computing centroids using the new code book
-        for j in range(nc):
-            mbs = np.where(label==j)
-            if mbs[0].size > 0:
-                code[j] = np.mean(data[mbs], axis=0)
-            else:
-                missing()
+        counts, centroids = _cluster_centroids(data, label, nc)
+        has_members = counts > 0
+        code[has_members] = centroids[has_members]
+        if not np.all(has_members):
+            missing()
 
     return code, label
 
+# number of distances that _nearest_two computes at once
+_DIST_BLOCK = 2**20
+
+def _distances(obs, code_book):
+    """Distances between all observations and all codes, one code at a time.
+
+    Returns
+    -------
+    dist : ndarray
+        dist[i, j] is the distance between obs[i] and code_book[j].
+
+    """
+    dist = np.empty((obs.shape[0], code_book.shape[0]))
+    for j in range(code_book.shape[0]):
+        dist[:, j] = sqrt(np.sum((obs - code_book[j]) ** 2, axis=1))
+    return dist
+
+def _elkan_assign(obs, code, label, upper, lower, code_dist, half_min):
+    """Update the labels and bounds of obs in place, with Elkan's tests.
+
+    upper[i] bounds the distance from obs[i] to its centroid from above and
+    lower[i, j] the distance to centroid j from below.
+
+    """
+    n = obs.shape[0]
+    tight = np.zeros(n, dtype=bool)
+    # no other centroid can be closer than twice half_min
+    active = np.nonzero(upper > half_min[label])[0]
+    for j in range(code.shape[0]):
+        idx = active[(label[active] != j) &
+                     (upper[active] > lower[active, j]) &
+                     (upper[active] > 0.5 * code_dist[label[active], j])]
+        if idx.size == 0:
+            continue
+        # tighten the upper bounds before computing distances to j
+        loose = idx[~tight[idx]]
+        if loose.size > 0:
+            d = sqrt(np.sum((obs[loose] - code[label[loose]]) ** 2, axis=1))
+            upper[loose] = d
+            lower[loose, label[loose]] = d
+            tight[loose] = True
+            idx = idx[(upper[idx] > lower[idx, j]) &
+                      (upper[idx] > 0.5 * code_dist[label[idx], j])]
+        d = sqrt(np.sum((obs[idx] - code[j]) ** 2, axis=1))
+        lower[idx, j] = d
+        closer = d < upper[idx]
+        label[idx[closer]] = j
+        upper[idx[closer]] = d[closer]
+
+def _nearest_two(obs, code_book, idx=None):
+    """Closest and second closest codes of the observations obs[idx].
+
+    The distances are computed for blocks of observations at a time, so
+    that no more than about _DIST_BLOCK of them are held in memory.
+
+    Returns
+    -------
+    label : ndarray
+        label[i] is the code closest to obs[idx[i]].
+    dist1, dist2 : ndarray
+        The distances from obs[idx[i]] to its closest and second closest
+        codes.
+
+    """
+    if idx is None:
+        idx = np.arange(obs.shape[0])
+    n = idx.size
+    label = np.empty(n, dtype=np.intp)
+    dist1 = np.empty(n)
+    dist2 = np.empty(n)
+    step = max(1, _DIST_BLOCK // code_book.shape[0])
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        dist = _distances(obs[idx[start:stop]], code_book)
+        rows = np.arange(stop - start)
+        nearest = argmin(dist, axis=1)
+        label[start:stop] = nearest
+        dist1[start:stop] = dist[rows, nearest]
+        dist[rows, nearest] = np.inf
+        dist2[start:stop] = dist.min(axis=1)
+    return label, dist1, dist2
+
+def _hamerly_assign(obs, code, label, upper, lower, code_dist, half_min):
+    """Update the labels and bounds of obs in place, with Hamerly's tests.
+
+    upper[i] bounds the distance from obs[i] to its centroid from above and
+    lower[i] the distance to the second closest centroid from below.
+
+    """
+    bound = np.maximum(half_min[label], lower)
+    idx = np.nonzero(upper > bound)[0]
+    upper[idx] = sqrt(np.sum((obs[idx] - code[label[idx]]) ** 2, axis=1))
+    idx = idx[upper[idx] > bound[idx]]
+    if idx.size > 0:
+        label[idx], upper[idx], lower[idx] = _nearest_two(obs, code, idx)
+
+def _kmeans2_bounded(data, code, niter, nc, missing, elkan):
+    """ "raw" version of kmeans2 with bounded distances. Do not use directly.
+
+    Run k-means with a given initial codebook, like _kmeans2, but keep
+    bounds on the distances between the observations and the centroids
+    from one iteration to the next.  After a centroid moves by some
+    distance, the distances to it change by at most as much, so the
+    bounds are only loosened by that amount.  Together with half the
+    distances between the centroids, they show most observations to keep
+    their centroid without computing any distances.  See Elkan, "Using
+    the triangle inequality to accelerate k-means", ICML 2003, and
+    Hamerly, "Making k-means even faster", SDM 2010.
+
+    """
+    obs = data.reshape(data.shape[0], -1)
+    book = np.array(code, dtype=np.double).reshape(nc, -1)
+
+    if elkan:
+        lower = _distances(obs, book)
+        label = argmin(lower, axis=1)
+        upper = lower[np.arange(obs.shape[0]), label]
+    else:
+        label, upper, lower = _nearest_two(obs, book)
+
+    for i in range(niter):
+        # Update the code by computing centroids using the labels
+        counts, centroids = _cluster_centroids(obs, label, nc)
+        has_members = counts > 0
+        if not np.all(has_members):
+            missing()
+        shift = sqrt(np.sum((centroids[has_members] -
+                             book[has_members]) ** 2, axis=1))
+        book[has_members] = centroids[has_members]
+        if i == niter - 1:
+            break
+
+        # Loosen the bounds by the distances the centroids moved
+        shifts = zeros(nc)
+        shifts[has_members] = shift
+        upper += shifts[label]
+        if elkan:
+            lower -= shifts
+        else:
+            lower -= shifts.max()
+        np.maximum(lower, 0, lower)
+
+        code_dist = _distances(book, book)
+        half_min = code_dist.copy()
+        half_min[np.arange(nc), np.arange(nc)] = np.inf
+        half_min = 0.5 * half_min.min(axis=1)
+        if elkan:
+            _elkan_assign(obs, book, label, upper, lower, code_dist,
+                          half_min)
+        else:
+            _hamerly_assign(obs, book, label, upper, lower, code_dist,
+                            half_min)
+
+    return book.reshape(code.shape).astype(code.dtype), label
+
+def _iter_batches(obs, batch_size, iter):
+    """Yield the number of the pass and the batches for minibatch_kmeans."""
+    if isinstance(obs, np.ndarray):
+        for i in range(iter):
+            for start in range(0, obs.shape[0], batch_size):
+                yield i, obs[start:start + batch_size]
+    else:
+        for batch in obs:
+            yield 0, batch
+
+def minibatch_kmeans(obs, k_or_guess, batch_size=1000, iter=1):
+    """
+    Performs k-means on batches of observations.
+
+    The observations are read one batch at a time, and each batch is used
+    to update the centroids incrementally: every centroid moves towards
+    the mean of the observations of the batch assigned to it, by a step
+    that decreases with the number of observations it has been assigned
+    so far.  Only one batch is held in memory at a time, so that very
+    large data sets can be clustered from disk.
+
+    Parameters
+    ----------
+    obs : ndarray or iterable of ndarrays
+       Each row of the M by N array is an observation vector, as for
+       `kmeans`.  The array is read in batches of `batch_size` rows, so it
+       can be a `numpy.memmap`.  Alternatively, an iterable (such as a
+       generator) of arrays with N columns can be given, each of which is
+       used as one batch.
+    k_or_guess : int or ndarray
+       The number of centroids to generate.  The initial k centroids are
+       chosen by randomly selecting observations from the first batch.
+       Alternatively, passing a k by N array specifies the initial k
+       centroids.
+    batch_size : int, optional
+       The number of rows of `obs` in each batch, if `obs` is an array.
+    iter : int, optional
+       The number of passes over `obs`, if it is an array.  An iterable
+       is only consumed once.
+
+    Returns
+    -------
+    codebook : ndarray
+       A k by N array of k centroids.  Centroids that were never assigned
+       an observation keep their initial value.
+    distortion : float
+       The mean distance between the observations of the last pass and
+       the centroids at the time their batch was read.
+
+    See Also
+    --------
+    kmeans : k-means on observations held in memory
+
+    Notes
+    -----
+    The updates are those of the mini-batch k-means of Sculley,
+    "Web-scale k-means clustering", WWW 2010.  The results depend on the
+    order of the observations, and are usually somewhat worse than those
+    of `kmeans` on the full data.
+
+    """
+    if int(batch_size) < 1:
+        raise ValueError("batch_size must be at least 1.")
+    if int(iter) < 1:
+        raise ValueError("iter must be at least 1.")
+
+    code_book = None
+    counts = None
+    last_pass = 0
+    total_dist = 0.
+    total_obs = 0
+    for i, batch in _iter_batches(obs, int(batch_size), int(iter)):
+        batch = np.asarray(batch)
+        if batch.ndim != 2:
+            raise ValueError("Batches of observations must be of rank 2")
+        if code_book is None:
+            if type(k_or_guess) == type(array([])):
+                code_book = array(k_or_guess, dtype=np.double, copy=True)
+                if code_book.size < 1:
+                    raise ValueError("Asked for 0 cluster ? initial book "
+                                     "was %s" % k_or_guess)
+            else:
+                k = int(k_or_guess)
+                if k < 1:
+                    raise ValueError("Asked for 0 cluster ? ")
+                if batch.shape[0] < k:
+                    raise ValueError("The first batch has fewer than k "
+                                     "observations")
+                code_book = _kpoints(batch, k).astype(np.double)
+            if code_book.ndim != 2 or code_book.shape[1] != batch.shape[1]:
+                raise ValueError("Code book and obs should have the same "
+                                 "number of features (eg columns)")
+            nc = code_book.shape[0]
+            counts = zeros(nc, dtype=np.intp)
+        if i != last_pass:
+            last_pass = i
+            total_dist = 0.
+            total_obs = 0
+        if batch.shape[0] == 0:
+            continue
+
+        batch_code, distort = vq(batch, code_book)
+        total_dist += np.sum(distort)
+        total_obs += batch.shape[0]
+
+        # move each centroid towards the mean of its observations in the
+        # batch, with a learning rate of 1/counts
+        n, sums = _cluster_sums(batch, batch_code, nc)
+        counts += n
+        has_members = n > 0
+        code_book[has_members] += (sums[has_members] -
+                                   n[has_members, newaxis] *
+                                   code_book[has_members]) / \
+                                  counts[has_members, newaxis]
+
+    if code_book is None:
+        raise ValueError("No observations given")
+    return code_book, total_dist / max(total_obs, 1)
+
 if __name__  == '__main__':
     pass
     #import _vq
@@ -0,0 +1,1736 @@
+/* File: vodemodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 22:52:11 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <string.h>
+#include <setjmp.h>
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *vode_error;
+static PyObject *vode_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {double r,i;} complex_double;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+typedef void(*cb_jac_in_zvode__user__routines_typedef)(int *,double *,complex_double *,int *,int *,complex_double *,int *,double *,int *);
+typedef void(*cb_f_in_zvode__user__routines_typedef)(int *,double *,complex_double *,complex_double *,double *,int *);
+typedef void(*cb_jac_in_dvode__user__routines_typedef)(int *,double *,double *,int *,int *,double *,int *,double *,int *);
+typedef void(*cb_f_in_dvode__user__routines_typedef)(int *,double *,double *,double *,double *,int *);
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define PRINTPYOBJERR(obj)\
+    fprintf(stderr,"vode.error is related to ");\
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+
+\
+#define FAILNULL(p) do {                                            \
+    if ((p) == NULL) {                                              \
+        PyErr_SetString(PyExc_MemoryError, "NULL pointer found");   \
+        goto capi_fail;                                             \
+    }                                                               \
+} while (0)
+
+#define pyobj_from_double1(v) (PyFloat_FromDouble(v))
+#define MEMCOPY(to,from,n)\
+    do { FAILNULL(to); FAILNULL(from); (void)memcpy(to,from,n); } while (0)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define SWAP(a,b,t) {\
+    t *c;\
+    c = a;\
+    a = b;\
+    b = c;}
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(vode_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#define CHECKARRAY(check,tcheck,name) \
+    if (!(check)) {\
+        PyErr_SetString(vode_error,"("tcheck") failed for "name);\
+        /*goto capi_fail;*/\
+    } else 
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = vode_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int create_cb_arglist(PyObject* fun,PyTupleObject* xa,const int maxnofargs,const int nofoptargs,int *nofargs,PyTupleObject **args,const char *errmess) {
+    PyObject *tmp = NULL;
+    PyObject *tmp_fun = NULL;
+    int tot,opt,ext,siz,i,di=0;
+    CFUNCSMESS("create_cb_arglist\n");
+    tot=opt=ext=siz=0;
+    /* Get the total number of arguments */
+    if (PyFunction_Check(fun))
+        tmp_fun = fun;
+    else {
+        di = 1;
+        if (PyObject_HasAttrString(fun,"im_func")) {
+            tmp_fun = PyObject_GetAttrString(fun,"im_func");
+        }
+        else if (PyObject_HasAttrString(fun,"__call__")) {
+            tmp = PyObject_GetAttrString(fun,"__call__");
+            if (PyObject_HasAttrString(tmp,"im_func"))
+                tmp_fun = PyObject_GetAttrString(tmp,"im_func");
+            else {
+                tmp_fun = fun; /* built-in function */
+                tot = maxnofargs;
+                if (xa != NULL)
+                    tot += PyTuple_Size((PyObject *)xa);
+            }
+            Py_XDECREF(tmp);
+        }
+        else if (PyFortran_Check(fun) || PyFortran_Check1(fun)) {
+            tot = maxnofargs;
+            if (xa != NULL)
+                tot += PyTuple_Size((PyObject *)xa);
+            tmp_fun = fun;
+        }
+        else if (F2PyCapsule_Check(fun)) {
+            tot = maxnofargs;
+            if (xa != NULL)
+                ext = PyTuple_Size((PyObject *)xa);
+            if(ext>0) {
+                fprintf(stderr,"extra arguments tuple cannot be used with CObject call-back\n");
+                goto capi_fail;
+            }
+            tmp_fun = fun;
+        }
+    }
+if (tmp_fun==NULL) {
+fprintf(stderr,"Call-back argument must be function|instance|instance.__call__|f2py-function but got %s.\n",(fun==NULL?"NULL":Py_TYPE(fun)->tp_name));
+goto capi_fail;
+}
+#if PY_VERSION_HEX >= 0x03000000
+    if (PyObject_HasAttrString(tmp_fun,"__code__")) {
+        if (PyObject_HasAttrString(tmp = PyObject_GetAttrString(tmp_fun,"__code__"),"co_argcount"))
+#else
+    if (PyObject_HasAttrString(tmp_fun,"func_code")) {
+        if (PyObject_HasAttrString(tmp = PyObject_GetAttrString(tmp_fun,"func_code"),"co_argcount"))
+#endif
+            tot = PyInt_AsLong(PyObject_GetAttrString(tmp,"co_argcount")) - di;
+        Py_XDECREF(tmp);
+    }
+    /* Get the number of optional arguments */
+#if PY_VERSION_HEX >= 0x03000000
+    if (PyObject_HasAttrString(tmp_fun,"__defaults__")) {
+        if (PyTuple_Check(tmp = PyObject_GetAttrString(tmp_fun,"__defaults__")))
+#else
+    if (PyObject_HasAttrString(tmp_fun,"func_defaults")) {
+        if (PyTuple_Check(tmp = PyObject_GetAttrString(tmp_fun,"func_defaults")))
+#endif
+            opt = PyTuple_Size(tmp);
+        Py_XDECREF(tmp);
+    }
+    /* Get the number of extra arguments */
+    if (xa != NULL)
+        ext = PyTuple_Size((PyObject *)xa);
+    /* Calculate the size of call-backs argument list */
+    siz = MIN(maxnofargs+ext,tot);
+    *nofargs = MAX(0,siz-ext);
+#ifdef DEBUGCFUNCS
+    fprintf(stderr,"debug-capi:create_cb_arglist:maxnofargs(-nofoptargs),tot,opt,ext,siz,nofargs=%d(-%d),%d,%d,%d,%d,%d\n",maxnofargs,nofoptargs,tot,opt,ext,siz,*nofargs);
+#endif
+    if (siz<tot-opt) {
+        fprintf(stderr,"create_cb_arglist: Failed to build argument list (siz) with enough arguments (tot-opt) required by user-supplied function (siz,tot,opt=%d,%d,%d).\n",siz,tot,opt);
+        goto capi_fail;
+    }
+    /* Initialize argument list */
+    *args = (PyTupleObject *)PyTuple_New(siz);
+    for (i=0;i<*nofargs;i++) {
+        Py_INCREF(Py_None);
+        PyTuple_SET_ITEM((PyObject *)(*args),i,Py_None);
+    }
+    if (xa != NULL)
+        for (i=(*nofargs);i<siz;i++) {
+            tmp = PyTuple_GetItem((PyObject *)xa,i-(*nofargs));
+            Py_INCREF(tmp);
+            PyTuple_SET_ITEM(*args,i,tmp);
+        }
+    CFUNCSMESS("create_cb_arglist-end\n");
+    return 1;
+capi_fail:
+    if ((PyErr_Occurred())==NULL)
+        PyErr_SetString(vode_error,errmess);
+    return 0;
+}
+
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = vode_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(dvode,DVODE)();
+extern void F_FUNC(zvode,ZVODE)();
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+
+/*********************** cb_f_in_dvode__user__routines ***********************/
+PyObject *cb_f_in_dvode__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_f_in_dvode__user__routines_args_capi = NULL;
+int cb_f_in_dvode__user__routines_nofargs = 0;
+jmp_buf cb_f_in_dvode__user__routines_jmpbuf;
+/*typedef void(*cb_f_in_dvode__user__routines_typedef)(int *,double *,double *,double *,double *,int *);*/
+static void cb_f_in_dvode__user__routines (int *n_cb_capi,double *t_cb_capi,double *y,double *ydot,double *rpar_cb_capi,int *ipar_cb_capi) {
+  PyTupleObject *capi_arglist = cb_f_in_dvode__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int n=(*n_cb_capi);
+  double t=(*t_cb_capi);
+  double rpar=(*rpar_cb_capi);
+  int ipar=(*ipar_cb_capi);
+  npy_intp y_Dims[1] = {-1};
+  npy_intp ydot_Dims[1] = {-1};
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_f_in_dvode__user__routines (maxnofargs=2(-0))\n");
+  CFUNCSMESSPY("cb:cb_f_in_dvode__user__routines_capi=",cb_f_in_dvode__user__routines_capi);
+  if (cb_f_in_dvode__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_f_in_dvode__user__routines_capi = PyObject_GetAttrString(vode_module,"f");
+  }
+  if (cb_f_in_dvode__user__routines_capi==NULL) {
+    PyErr_SetString(vode_error,"cb: Callback f not defined (as an argument or module vode attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_f_in_dvode__user__routines_capi)) {
+  cb_f_in_dvode__user__routines_typedef cb_f_in_dvode__user__routines_cptr;
+  cb_f_in_dvode__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_f_in_dvode__user__routines_capi);
+  (*cb_f_in_dvode__user__routines_cptr)(n_cb_capi,t_cb_capi,y,ydot,rpar_cb_capi,ipar_cb_capi);
+  return;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(vode_module,"f_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(vode_error,"Failed to convert vode.f_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(vode_error,"Callback f argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+  y_Dims[0]=n;
+  ydot_Dims[0]=n;
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_f_in_dvode__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_double1(t)))
+      goto capi_fail;
+  if (cb_f_in_dvode__user__routines_nofargs>capi_i) {
+    int itemsize_ = NPY_DOUBLE == NPY_STRING ? 1 : 0;
+    /*XXX: Hmm, what will destroy this array??? */
+    PyArrayObject *tmp_arr = (PyArrayObject *)PyArray_New(&PyArray_Type,1,y_Dims,NPY_DOUBLE,NULL,(char*)y,itemsize_,NPY_ARRAY_CARRAY,NULL);
+
+
+    if (tmp_arr==NULL)
+      goto capi_fail;
+    if (CAPI_ARGLIST_SETITEM(capi_i++,(PyObject *)tmp_arr))
+      goto capi_fail;
+}
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function f.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_f_in_dvode__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_f_in_dvode__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i) {
+    PyArrayObject *rv_cb_arr = NULL;
+    if ((capi_tmp = PyTuple_GetItem(capi_return,capi_i++))==NULL) goto capi_fail;
+    rv_cb_arr =  array_from_pyobj(NPY_DOUBLE,ydot_Dims,1,F2PY_INTENT_IN
+|F2PY_INTENT_C
+,capi_tmp);
+    if (rv_cb_arr == NULL) {
+      fprintf(stderr,"rv_cb_arr is NULL\n");
+      goto capi_fail;
+    }
+    MEMCOPY(ydot,PyArray_DATA(rv_cb_arr),PyArray_NBYTES(rv_cb_arr));
+    if (capi_tmp != (PyObject *)rv_cb_arr) {
+      Py_DECREF(rv_cb_arr);
+    }
+  }
+  CFUNCSMESS("cb:cb_f_in_dvode__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_f_in_dvode__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_f_in_dvode__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+return;
+}
+/******************** end of cb_f_in_dvode__user__routines ********************/
+
+
+/********************** cb_jac_in_dvode__user__routines **********************/
+PyObject *cb_jac_in_dvode__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_jac_in_dvode__user__routines_args_capi = NULL;
+int cb_jac_in_dvode__user__routines_nofargs = 0;
+jmp_buf cb_jac_in_dvode__user__routines_jmpbuf;
+/*typedef void(*cb_jac_in_dvode__user__routines_typedef)(int *,double *,double *,int *,int *,double *,int *,double *,int *);*/
+static void cb_jac_in_dvode__user__routines (int *n_cb_capi,double *t_cb_capi,double *y,int *ml_cb_capi,int *mu_cb_capi,double *jac,int *nrowpd_cb_capi,double *rpar_cb_capi,int *ipar_cb_capi) {
+  PyTupleObject *capi_arglist = cb_jac_in_dvode__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int n=(*n_cb_capi);
+  double t=(*t_cb_capi);
+  int ml=(*ml_cb_capi);
+  int mu=(*mu_cb_capi);
+  int nrowpd=(*nrowpd_cb_capi);
+  double rpar=(*rpar_cb_capi);
+  int ipar=(*ipar_cb_capi);
+  npy_intp y_Dims[1] = {-1};
+  npy_intp jac_Dims[2] = {-1, -1};
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_jac_in_dvode__user__routines (maxnofargs=2(-0))\n");
+  CFUNCSMESSPY("cb:cb_jac_in_dvode__user__routines_capi=",cb_jac_in_dvode__user__routines_capi);
+  if (cb_jac_in_dvode__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_jac_in_dvode__user__routines_capi = PyObject_GetAttrString(vode_module,"jac");
+  }
+  if (cb_jac_in_dvode__user__routines_capi==NULL) {
+    PyErr_SetString(vode_error,"cb: Callback jac not defined (as an argument or module vode attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_jac_in_dvode__user__routines_capi)) {
+  cb_jac_in_dvode__user__routines_typedef cb_jac_in_dvode__user__routines_cptr;
+  cb_jac_in_dvode__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_jac_in_dvode__user__routines_capi);
+  (*cb_jac_in_dvode__user__routines_cptr)(n_cb_capi,t_cb_capi,y,ml_cb_capi,mu_cb_capi,jac,nrowpd_cb_capi,rpar_cb_capi,ipar_cb_capi);
+  return;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(vode_module,"jac_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(vode_error,"Failed to convert vode.jac_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(vode_error,"Callback jac argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+  y_Dims[0]=n;
+  jac_Dims[0]=nrowpd,jac_Dims[1]=n;
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_jac_in_dvode__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_double1(t)))
+      goto capi_fail;
+  if (cb_jac_in_dvode__user__routines_nofargs>capi_i) {
+    int itemsize_ = NPY_DOUBLE == NPY_STRING ? 1 : 0;
+    /*XXX: Hmm, what will destroy this array??? */
+    PyArrayObject *tmp_arr = (PyArrayObject *)PyArray_New(&PyArray_Type,1,y_Dims,NPY_DOUBLE,NULL,(char*)y,itemsize_,NPY_ARRAY_CARRAY,NULL);
+
+
+    if (tmp_arr==NULL)
+      goto capi_fail;
+    if (CAPI_ARGLIST_SETITEM(capi_i++,(PyObject *)tmp_arr))
+      goto capi_fail;
+}
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function jac.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_jac_in_dvode__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_jac_in_dvode__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i) {
+    PyArrayObject *rv_cb_arr = NULL;
+    if ((capi_tmp = PyTuple_GetItem(capi_return,capi_i++))==NULL) goto capi_fail;
+    rv_cb_arr =  array_from_pyobj(NPY_DOUBLE,jac_Dims,2,F2PY_INTENT_IN
+,capi_tmp);
+    if (rv_cb_arr == NULL) {
+      fprintf(stderr,"rv_cb_arr is NULL\n");
+      goto capi_fail;
+    }
+    MEMCOPY(jac,PyArray_DATA(rv_cb_arr),PyArray_NBYTES(rv_cb_arr));
+    if (capi_tmp != (PyObject *)rv_cb_arr) {
+      Py_DECREF(rv_cb_arr);
+    }
+  }
+  CFUNCSMESS("cb:cb_jac_in_dvode__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_jac_in_dvode__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_jac_in_dvode__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+return;
+}
+/******************* end of cb_jac_in_dvode__user__routines *******************/
+
+
+/*********************** cb_f_in_zvode__user__routines ***********************/
+PyObject *cb_f_in_zvode__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_f_in_zvode__user__routines_args_capi = NULL;
+int cb_f_in_zvode__user__routines_nofargs = 0;
+jmp_buf cb_f_in_zvode__user__routines_jmpbuf;
+/*typedef void(*cb_f_in_zvode__user__routines_typedef)(int *,double *,complex_double *,complex_double *,double *,int *);*/
+static void cb_f_in_zvode__user__routines (int *n_cb_capi,double *t_cb_capi,complex_double *y,complex_double *ydot,double *rpar_cb_capi,int *ipar_cb_capi) {
+  PyTupleObject *capi_arglist = cb_f_in_zvode__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int n=(*n_cb_capi);
+  double t=(*t_cb_capi);
+  double rpar=(*rpar_cb_capi);
+  int ipar=(*ipar_cb_capi);
+  npy_intp y_Dims[1] = {-1};
+  npy_intp ydot_Dims[1] = {-1};
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_f_in_zvode__user__routines (maxnofargs=2(-0))\n");
+  CFUNCSMESSPY("cb:cb_f_in_zvode__user__routines_capi=",cb_f_in_zvode__user__routines_capi);
+  if (cb_f_in_zvode__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_f_in_zvode__user__routines_capi = PyObject_GetAttrString(vode_module,"f");
+  }
+  if (cb_f_in_zvode__user__routines_capi==NULL) {
+    PyErr_SetString(vode_error,"cb: Callback f not defined (as an argument or module vode attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_f_in_zvode__user__routines_capi)) {
+  cb_f_in_zvode__user__routines_typedef cb_f_in_zvode__user__routines_cptr;
+  cb_f_in_zvode__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_f_in_zvode__user__routines_capi);
+  (*cb_f_in_zvode__user__routines_cptr)(n_cb_capi,t_cb_capi,y,ydot,rpar_cb_capi,ipar_cb_capi);
+  return;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(vode_module,"f_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(vode_error,"Failed to convert vode.f_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(vode_error,"Callback f argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+  y_Dims[0]=n;
+  ydot_Dims[0]=n;
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_f_in_zvode__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_double1(t)))
+      goto capi_fail;
+  if (cb_f_in_zvode__user__routines_nofargs>capi_i) {
+    int itemsize_ = NPY_CDOUBLE == NPY_STRING ? 1 : 0;
+    /*XXX: Hmm, what will destroy this array??? */
+    PyArrayObject *tmp_arr = (PyArrayObject *)PyArray_New(&PyArray_Type,1,y_Dims,NPY_CDOUBLE,NULL,(char*)y,itemsize_,NPY_ARRAY_CARRAY,NULL);
+
+
+    if (tmp_arr==NULL)
+      goto capi_fail;
+    if (CAPI_ARGLIST_SETITEM(capi_i++,(PyObject *)tmp_arr))
+      goto capi_fail;
+}
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function f.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_f_in_zvode__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_f_in_zvode__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i) {
+    PyArrayObject *rv_cb_arr = NULL;
+    if ((capi_tmp = PyTuple_GetItem(capi_return,capi_i++))==NULL) goto capi_fail;
+    rv_cb_arr =  array_from_pyobj(NPY_CDOUBLE,ydot_Dims,1,F2PY_INTENT_IN
+|F2PY_INTENT_C
+,capi_tmp);
+    if (rv_cb_arr == NULL) {
+      fprintf(stderr,"rv_cb_arr is NULL\n");
+      goto capi_fail;
+    }
+    MEMCOPY(ydot,PyArray_DATA(rv_cb_arr),PyArray_NBYTES(rv_cb_arr));
+    if (capi_tmp != (PyObject *)rv_cb_arr) {
+      Py_DECREF(rv_cb_arr);
+    }
+  }
+  CFUNCSMESS("cb:cb_f_in_zvode__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_f_in_zvode__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_f_in_zvode__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+return;
+}
+/******************** end of cb_f_in_zvode__user__routines ********************/
+
+
+/********************** cb_jac_in_zvode__user__routines **********************/
+PyObject *cb_jac_in_zvode__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_jac_in_zvode__user__routines_args_capi = NULL;
+int cb_jac_in_zvode__user__routines_nofargs = 0;
+jmp_buf cb_jac_in_zvode__user__routines_jmpbuf;
+/*typedef void(*cb_jac_in_zvode__user__routines_typedef)(int *,double *,complex_double *,int *,int *,complex_double *,int *,double *,int *);*/
+static void cb_jac_in_zvode__user__routines (int *n_cb_capi,double *t_cb_capi,complex_double *y,int *ml_cb_capi,int *mu_cb_capi,complex_double *jac,int *nrowpd_cb_capi,double *rpar_cb_capi,int *ipar_cb_capi) {
+  PyTupleObject *capi_arglist = cb_jac_in_zvode__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int n=(*n_cb_capi);
+  double t=(*t_cb_capi);
+  int ml=(*ml_cb_capi);
+  int mu=(*mu_cb_capi);
+  int nrowpd=(*nrowpd_cb_capi);
+  double rpar=(*rpar_cb_capi);
+  int ipar=(*ipar_cb_capi);
+  npy_intp y_Dims[1] = {-1};
+  npy_intp jac_Dims[2] = {-1, -1};
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_jac_in_zvode__user__routines (maxnofargs=2(-0))\n");
+  CFUNCSMESSPY("cb:cb_jac_in_zvode__user__routines_capi=",cb_jac_in_zvode__user__routines_capi);
+  if (cb_jac_in_zvode__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_jac_in_zvode__user__routines_capi = PyObject_GetAttrString(vode_module,"jac");
+  }
+  if (cb_jac_in_zvode__user__routines_capi==NULL) {
+    PyErr_SetString(vode_error,"cb: Callback jac not defined (as an argument or module vode attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_jac_in_zvode__user__routines_capi)) {
+  cb_jac_in_zvode__user__routines_typedef cb_jac_in_zvode__user__routines_cptr;
+  cb_jac_in_zvode__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_jac_in_zvode__user__routines_capi);
+  (*cb_jac_in_zvode__user__routines_cptr)(n_cb_capi,t_cb_capi,y,ml_cb_capi,mu_cb_capi,jac,nrowpd_cb_capi,rpar_cb_capi,ipar_cb_capi);
+  return;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(vode_module,"jac_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(vode_error,"Failed to convert vode.jac_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(vode_error,"Callback jac argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+  y_Dims[0]=n;
+  jac_Dims[0]=nrowpd,jac_Dims[1]=n;
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_jac_in_zvode__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_double1(t)))
+      goto capi_fail;
+  if (cb_jac_in_zvode__user__routines_nofargs>capi_i) {
+    int itemsize_ = NPY_CDOUBLE == NPY_STRING ? 1 : 0;
+    /*XXX: Hmm, what will destroy this array??? */
+    PyArrayObject *tmp_arr = (PyArrayObject *)PyArray_New(&PyArray_Type,1,y_Dims,NPY_CDOUBLE,NULL,(char*)y,itemsize_,NPY_ARRAY_CARRAY,NULL);
+
+
+    if (tmp_arr==NULL)
+      goto capi_fail;
+    if (CAPI_ARGLIST_SETITEM(capi_i++,(PyObject *)tmp_arr))
+      goto capi_fail;
+}
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function jac.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_jac_in_zvode__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_jac_in_zvode__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i) {
+    PyArrayObject *rv_cb_arr = NULL;
+    if ((capi_tmp = PyTuple_GetItem(capi_return,capi_i++))==NULL) goto capi_fail;
+    rv_cb_arr =  array_from_pyobj(NPY_CDOUBLE,jac_Dims,2,F2PY_INTENT_IN
+,capi_tmp);
+    if (rv_cb_arr == NULL) {
+      fprintf(stderr,"rv_cb_arr is NULL\n");
+      goto capi_fail;
+    }
+    MEMCOPY(jac,PyArray_DATA(rv_cb_arr),PyArray_NBYTES(rv_cb_arr));
+    if (capi_tmp != (PyObject *)rv_cb_arr) {
+      Py_DECREF(rv_cb_arr);
+    }
+  }
+  CFUNCSMESS("cb:cb_jac_in_zvode__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_jac_in_zvode__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_jac_in_zvode__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+return;
+}
+/******************* end of cb_jac_in_zvode__user__routines *******************/
+
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** dvode ***********************************/
+static char doc_f2py_rout_vode_dvode[] = "\
+y,t,istate = dvode(f,jac,y,t,tout,rtol,atol,itask,istate,rwork,iwork,mf,[f_extra_args,jac_extra_args,overwrite_y])\n\nWrapper for ``dvode``.\
+\n\nParameters\n----------\n"
+"f : call-back function\n"
+"jac : call-back function\n"
+"y : input rank-1 array('d') with bounds (neq)\n"
+"t : input float\n"
+"tout : input float\n"
+"rtol : input rank-1 array('d') with bounds (*)\n"
+"atol : input rank-1 array('d') with bounds (*)\n"
+"itask : input int\n"
+"istate : input int\n"
+"rwork : input rank-1 array('d') with bounds (lrw)\n"
+"iwork : input rank-1 array('i') with bounds (liw)\n"
+"mf : input int\n"
+"\nOther Parameters\n----------------\n"
+"f_extra_args : input tuple, optional\n    Default: ()\n"
+"jac_extra_args : input tuple, optional\n    Default: ()\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('d') with bounds (neq)\n"
+"t : float\n"
+"istate : int\n"
+"\nNotes\n-----\nCall-back functions::\n\n"
+"  def f(t,y): return ydot\n\
+  Required arguments:\n"
+"    t : input float\n"
+"    y : input rank-1 array('d') with bounds (n)\n"
+"  Return objects:\n"
+"    ydot : rank-1 array('d') with bounds (n)\n"
+"  def jac(t,y): return jac\n\
+  Required arguments:\n"
+"    t : input float\n"
+"    y : input rank-1 array('d') with bounds (n)\n"
+"  Return objects:\n"
+"    jac : rank-2 array('d') with bounds (nrowpd,n)";
+/* extern void F_FUNC(dvode,DVODE)(); */
+static PyObject *f2py_rout_vode_dvode(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)()) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  PyObject *f_capi = Py_None;
+  PyTupleObject *f_xa_capi = NULL;
+  PyTupleObject *f_args_capi = NULL;
+  int f_nofargs_capi = 0;
+  cb_f_in_dvode__user__routines_typedef f_cptr;
+  PyObject *jac_capi = Py_None;
+  PyTupleObject *jac_xa_capi = NULL;
+  PyTupleObject *jac_args_capi = NULL;
+  int jac_nofargs_capi = 0;
+  cb_jac_in_dvode__user__routines_typedef jac_cptr;
+  int neq = 0;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  double t = 0;
+  PyObject *t_capi = Py_None;
+  double tout = 0;
+  PyObject *tout_capi = Py_None;
+  int itol = 0;
+  double *rtol = NULL;
+  npy_intp rtol_Dims[1] = {-1};
+  const int rtol_Rank = 1;
+  PyArrayObject *capi_rtol_tmp = NULL;
+  int capi_rtol_intent = 0;
+  PyObject *rtol_capi = Py_None;
+  double *atol = NULL;
+  npy_intp atol_Dims[1] = {-1};
+  const int atol_Rank = 1;
+  PyArrayObject *capi_atol_tmp = NULL;
+  int capi_atol_intent = 0;
+  PyObject *atol_capi = Py_None;
+  int itask = 0;
+  PyObject *itask_capi = Py_None;
+  int istate = 0;
+  PyObject *istate_capi = Py_None;
+  int iopt = 0;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  PyObject *rwork_capi = Py_None;
+  int lrw = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  PyObject *iwork_capi = Py_None;
+  int liw = 0;
+  int mf = 0;
+  PyObject *mf_capi = Py_None;
+  double rpar = 0;
+  int ipar = 0;
+  static char *capi_kwlist[] = {"f","jac","y","t","tout","rtol","atol","itask","istate","rwork","iwork","mf","f_extra_args","jac_extra_args","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOO|O!O!i:vode.dvode",\
+    capi_kwlist,&f_capi,&jac_capi,&y_capi,&t_capi,&tout_capi,&rtol_capi,&atol_capi,&itask_capi,&istate_capi,&rwork_capi,&iwork_capi,&mf_capi,&PyTuple_Type,&f_xa_capi,&PyTuple_Type,&jac_xa_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable rpar */
+  rpar = 0.0;
+  /* Processing variable iopt */
+  iopt = 1;
+  /* Processing variable iwork */
+  ;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_IN;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,iwork_capi);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 11st argument `iwork' of vode.dvode to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable mf */
+    f2py_success = int_from_pyobj(&mf,mf_capi,"vode.dvode() 12nd argument (mf) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable f */
+if(F2PyCapsule_Check(f_capi)) {
+  f_cptr = F2PyCapsule_AsVoidPtr(f_capi);
+} else {
+  f_cptr = cb_f_in_dvode__user__routines;
+}
+
+  f_nofargs_capi = cb_f_in_dvode__user__routines_nofargs;
+  if (create_cb_arglist(f_capi,f_xa_capi,2,0,&cb_f_in_dvode__user__routines_nofargs,&f_args_capi,"failed in processing argument list for call-back f.")) {
+    jmp_buf f_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `f`.\n");
+    SWAP(f_capi,cb_f_in_dvode__user__routines_capi,PyObject);
+    SWAP(f_args_capi,cb_f_in_dvode__user__routines_args_capi,PyTupleObject);
+    memcpy(&f_jmpbuf,&cb_f_in_dvode__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable itask */
+    f2py_success = int_from_pyobj(&itask,itask_capi,"vode.dvode() 8th argument (itask) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(itask>0 && itask<6,"itask>0 && itask<6","8th argument itask","dvode:itask=%d",itask) {
+  /* Processing variable rwork */
+  ;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_IN;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,rwork_capi);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 10th argument `rwork' of vode.dvode to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable istate */
+    f2py_success = int_from_pyobj(&istate,istate_capi,"vode.dvode() 9th argument (istate) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(istate>0 && istate<4,"istate>0 && istate<4","9th argument istate","dvode:istate=%d",istate) {
+  /* Processing variable tout */
+    f2py_success = double_from_pyobj(&tout,tout_capi,"vode.dvode() 5th argument (tout) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable t */
+    f2py_success = double_from_pyobj(&t,t_capi,"vode.dvode() 4th argument (t) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ipar */
+  ipar = 0;
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 3rd argument `y' of vode.dvode to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable jac */
+if(F2PyCapsule_Check(jac_capi)) {
+  jac_cptr = F2PyCapsule_AsVoidPtr(jac_capi);
+} else {
+  jac_cptr = cb_jac_in_dvode__user__routines;
+}
+
+  jac_nofargs_capi = cb_jac_in_dvode__user__routines_nofargs;
+  if (create_cb_arglist(jac_capi,jac_xa_capi,2,0,&cb_jac_in_dvode__user__routines_nofargs,&jac_args_capi,"failed in processing argument list for call-back jac.")) {
+    jmp_buf jac_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `jac`.\n");
+    SWAP(jac_capi,cb_jac_in_dvode__user__routines_capi,PyObject);
+    SWAP(jac_args_capi,cb_jac_in_dvode__user__routines_args_capi,PyTupleObject);
+    memcpy(&jac_jmpbuf,&cb_jac_in_dvode__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable lrw */
+  lrw = len(rwork);
+  CHECKSCALAR(len(rwork)>=lrw,"len(rwork)>=lrw","hidden lrw","dvode:lrw=%d",lrw) {
+  /* Processing variable liw */
+  liw = len(iwork);
+  CHECKSCALAR(len(iwork)>=liw,"len(iwork)>=liw","hidden liw","dvode:liw=%d",liw) {
+  /* Processing variable neq */
+  neq = len(y);
+  /* Processing variable atol */
+  ;
+  capi_atol_intent |= F2PY_INTENT_IN;
+  capi_atol_tmp = array_from_pyobj(NPY_DOUBLE,atol_Dims,atol_Rank,capi_atol_intent,atol_capi);
+  if (capi_atol_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 7th argument `atol' of vode.dvode to C/Fortran array" );
+  } else {
+    atol = (double *)(PyArray_DATA(capi_atol_tmp));
+
+  CHECKARRAY(len(atol)<=1||len(atol)>=neq,"len(atol)<=1||len(atol)>=neq","7th argument atol") {
+  /* Processing variable itol */
+  itol = (len(atol)<=1 && len(rtol)<=1?1:(len(rtol)<=1?2:(len(atol)<=1?3:4)));
+  /* Processing variable rtol */
+  ;
+  capi_rtol_intent |= F2PY_INTENT_IN;
+  capi_rtol_tmp = array_from_pyobj(NPY_DOUBLE,rtol_Dims,rtol_Rank,capi_rtol_intent,rtol_capi);
+  if (capi_rtol_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 6th argument `rtol' of vode.dvode to C/Fortran array" );
+  } else {
+    rtol = (double *)(PyArray_DATA(capi_rtol_tmp));
+
+  CHECKARRAY(len(rtol)<=1||len(rtol)>=neq,"len(rtol)<=1||len(rtol)>=neq","6th argument rtol") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    if ((setjmp(cb_f_in_dvode__user__routines_jmpbuf)) || (setjmp(cb_jac_in_dvode__user__routines_jmpbuf))) {
+      f2py_success = 0;
+    } else {
+        (*f2py_func)(cb_f_in_dvode__user__routines,&neq,y,&t,&tout,&itol,rtol,atol,&itask,&istate,&iopt,rwork,&lrw,iwork,&liw,cb_jac_in_dvode__user__routines,&mf,&rpar,&ipar) ;
+        /*(*f2py_func)(f_cptr,jac_cptr,&neq,y,&t,&tout,&itol,rtol,atol,&itask,&istate,&iopt,rwork,&lrw,iwork,&liw,&mf,&rpar,&ipar);*/
+    }
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ndi",capi_y_tmp,t,istate);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(len(rtol)<=1||len(rtol)>=neq)*/
+  if((PyObject *)capi_rtol_tmp!=rtol_capi) {
+    Py_XDECREF(capi_rtol_tmp); }
+  }  /*if (capi_rtol_tmp == NULL) ... else of rtol*/
+  /* End of cleaning variable rtol */
+  /* End of cleaning variable itol */
+  } /*CHECKARRAY(len(atol)<=1||len(atol)>=neq)*/
+  if((PyObject *)capi_atol_tmp!=atol_capi) {
+    Py_XDECREF(capi_atol_tmp); }
+  }  /*if (capi_atol_tmp == NULL) ... else of atol*/
+  /* End of cleaning variable atol */
+  /* End of cleaning variable neq */
+  } /*CHECKSCALAR(len(iwork)>=liw)*/
+  /* End of cleaning variable liw */
+  } /*CHECKSCALAR(len(rwork)>=lrw)*/
+  /* End of cleaning variable lrw */
+    CFUNCSMESS("Restoring jmpbuf for `jac`.\n");
+    cb_jac_in_dvode__user__routines_capi = jac_capi;
+    Py_DECREF(cb_jac_in_dvode__user__routines_args_capi);
+    cb_jac_in_dvode__user__routines_args_capi = jac_args_capi;
+    cb_jac_in_dvode__user__routines_nofargs = jac_nofargs_capi;
+    memcpy(&cb_jac_in_dvode__user__routines_jmpbuf,&jac_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable jac */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ipar */
+  } /*if (f2py_success) of t*/
+  /* End of cleaning variable t */
+  } /*if (f2py_success) of tout*/
+  /* End of cleaning variable tout */
+  } /*CHECKSCALAR(istate>0 && istate<4)*/
+  } /*if (f2py_success) of istate*/
+  /* End of cleaning variable istate */
+  if((PyObject *)capi_rwork_tmp!=rwork_capi) {
+    Py_XDECREF(capi_rwork_tmp); }
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+  } /*CHECKSCALAR(itask>0 && itask<6)*/
+  } /*if (f2py_success) of itask*/
+  /* End of cleaning variable itask */
+    CFUNCSMESS("Restoring jmpbuf for `f`.\n");
+    cb_f_in_dvode__user__routines_capi = f_capi;
+    Py_DECREF(cb_f_in_dvode__user__routines_args_capi);
+    cb_f_in_dvode__user__routines_args_capi = f_args_capi;
+    cb_f_in_dvode__user__routines_nofargs = f_nofargs_capi;
+    memcpy(&cb_f_in_dvode__user__routines_jmpbuf,&f_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable f */
+  } /*if (f2py_success) of mf*/
+  /* End of cleaning variable mf */
+  if((PyObject *)capi_iwork_tmp!=iwork_capi) {
+    Py_XDECREF(capi_iwork_tmp); }
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable rpar */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dvode ********************************/
+
+/*********************************** zvode ***********************************/
+static char doc_f2py_rout_vode_zvode[] = "\
+y,t,istate = zvode(f,jac,y,t,tout,rtol,atol,itask,istate,zwork,rwork,iwork,mf,[f_extra_args,jac_extra_args,overwrite_y])\n\nWrapper for ``zvode``.\
+\n\nParameters\n----------\n"
+"f : call-back function\n"
+"jac : call-back function\n"
+"y : input rank-1 array('D') with bounds (neq)\n"
+"t : input float\n"
+"tout : input float\n"
+"rtol : input rank-1 array('d') with bounds (*)\n"
+"atol : input rank-1 array('d') with bounds (*)\n"
+"itask : input int\n"
+"istate : input int\n"
+"zwork : input rank-1 array('D') with bounds (lzw)\n"
+"rwork : input rank-1 array('d') with bounds (lrw)\n"
+"iwork : input rank-1 array('i') with bounds (liw)\n"
+"mf : input int\n"
+"\nOther Parameters\n----------------\n"
+"f_extra_args : input tuple, optional\n    Default: ()\n"
+"jac_extra_args : input tuple, optional\n    Default: ()\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('D') with bounds (neq)\n"
+"t : float\n"
+"istate : int\n"
+"\nNotes\n-----\nCall-back functions::\n\n"
+"  def f(t,y): return ydot\n\
+  Required arguments:\n"
+"    t : input float\n"
+"    y : input rank-1 array('D') with bounds (n)\n"
+"  Return objects:\n"
+"    ydot : rank-1 array('D') with bounds (n)\n"
+"  def jac(t,y): return jac\n\
+  Required arguments:\n"
+"    t : input float\n"
+"    y : input rank-1 array('D') with bounds (n)\n"
+"  Return objects:\n"
+"    jac : rank-2 array('D') with bounds (nrowpd,n)";
+/* extern void F_FUNC(zvode,ZVODE)(); */
+static PyObject *f2py_rout_vode_zvode(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)()) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  PyObject *f_capi = Py_None;
+  PyTupleObject *f_xa_capi = NULL;
+  PyTupleObject *f_args_capi = NULL;
+  int f_nofargs_capi = 0;
+  cb_f_in_zvode__user__routines_typedef f_cptr;
+  PyObject *jac_capi = Py_None;
+  PyTupleObject *jac_xa_capi = NULL;
+  PyTupleObject *jac_args_capi = NULL;
+  int jac_nofargs_capi = 0;
+  cb_jac_in_zvode__user__routines_typedef jac_cptr;
+  int neq = 0;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  double t = 0;
+  PyObject *t_capi = Py_None;
+  double tout = 0;
+  PyObject *tout_capi = Py_None;
+  int itol = 0;
+  double *rtol = NULL;
+  npy_intp rtol_Dims[1] = {-1};
+  const int rtol_Rank = 1;
+  PyArrayObject *capi_rtol_tmp = NULL;
+  int capi_rtol_intent = 0;
+  PyObject *rtol_capi = Py_None;
+  double *atol = NULL;
+  npy_intp atol_Dims[1] = {-1};
+  const int atol_Rank = 1;
+  PyArrayObject *capi_atol_tmp = NULL;
+  int capi_atol_intent = 0;
+  PyObject *atol_capi = Py_None;
+  int itask = 0;
+  PyObject *itask_capi = Py_None;
+  int istate = 0;
+  PyObject *istate_capi = Py_None;
+  int iopt = 0;
+  complex_double *zwork = NULL;
+  npy_intp zwork_Dims[1] = {-1};
+  const int zwork_Rank = 1;
+  PyArrayObject *capi_zwork_tmp = NULL;
+  int capi_zwork_intent = 0;
+  PyObject *zwork_capi = Py_None;
+  int lzw = 0;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  PyObject *rwork_capi = Py_None;
+  int lrw = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  PyObject *iwork_capi = Py_None;
+  int liw = 0;
+  int mf = 0;
+  PyObject *mf_capi = Py_None;
+  double rpar = 0;
+  int ipar = 0;
+  static char *capi_kwlist[] = {"f","jac","y","t","tout","rtol","atol","itask","istate","zwork","rwork","iwork","mf","f_extra_args","jac_extra_args","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOOO|O!O!i:vode.zvode",\
+    capi_kwlist,&f_capi,&jac_capi,&y_capi,&t_capi,&tout_capi,&rtol_capi,&atol_capi,&itask_capi,&istate_capi,&zwork_capi,&rwork_capi,&iwork_capi,&mf_capi,&PyTuple_Type,&f_xa_capi,&PyTuple_Type,&jac_xa_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable rpar */
+  rpar = 0.0;
+  /* Processing variable iopt */
+  iopt = 1;
+  /* Processing variable iwork */
+  ;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_IN;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,iwork_capi);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 12nd argument `iwork' of vode.zvode to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable mf */
+    f2py_success = int_from_pyobj(&mf,mf_capi,"vode.zvode() 13rd argument (mf) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable f */
+if(F2PyCapsule_Check(f_capi)) {
+  f_cptr = F2PyCapsule_AsVoidPtr(f_capi);
+} else {
+  f_cptr = cb_f_in_zvode__user__routines;
+}
+
+  f_nofargs_capi = cb_f_in_zvode__user__routines_nofargs;
+  if (create_cb_arglist(f_capi,f_xa_capi,2,0,&cb_f_in_zvode__user__routines_nofargs,&f_args_capi,"failed in processing argument list for call-back f.")) {
+    jmp_buf f_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `f`.\n");
+    SWAP(f_capi,cb_f_in_zvode__user__routines_capi,PyObject);
+    SWAP(f_args_capi,cb_f_in_zvode__user__routines_args_capi,PyTupleObject);
+    memcpy(&f_jmpbuf,&cb_f_in_zvode__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable itask */
+    f2py_success = int_from_pyobj(&itask,itask_capi,"vode.zvode() 8th argument (itask) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(itask>0 && itask<6,"itask>0 && itask<6","8th argument itask","zvode:itask=%d",itask) {
+  /* Processing variable rwork */
+  ;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_IN;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,rwork_capi);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 11st argument `rwork' of vode.zvode to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable istate */
+    f2py_success = int_from_pyobj(&istate,istate_capi,"vode.zvode() 9th argument (istate) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(istate>0 && istate<4,"istate>0 && istate<4","9th argument istate","zvode:istate=%d",istate) {
+  /* Processing variable zwork */
+  ;
+  capi_zwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_IN;
+  capi_zwork_tmp = array_from_pyobj(NPY_CDOUBLE,zwork_Dims,zwork_Rank,capi_zwork_intent,zwork_capi);
+  if (capi_zwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 10th argument `zwork' of vode.zvode to C/Fortran array" );
+  } else {
+    zwork = (complex_double *)(PyArray_DATA(capi_zwork_tmp));
+
+  /* Processing variable t */
+    f2py_success = double_from_pyobj(&t,t_capi,"vode.zvode() 4th argument (t) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ipar */
+  ipar = 0;
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 3rd argument `y' of vode.zvode to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable tout */
+    f2py_success = double_from_pyobj(&tout,tout_capi,"vode.zvode() 5th argument (tout) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable jac */
+if(F2PyCapsule_Check(jac_capi)) {
+  jac_cptr = F2PyCapsule_AsVoidPtr(jac_capi);
+} else {
+  jac_cptr = cb_jac_in_zvode__user__routines;
+}
+
+  jac_nofargs_capi = cb_jac_in_zvode__user__routines_nofargs;
+  if (create_cb_arglist(jac_capi,jac_xa_capi,2,0,&cb_jac_in_zvode__user__routines_nofargs,&jac_args_capi,"failed in processing argument list for call-back jac.")) {
+    jmp_buf jac_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `jac`.\n");
+    SWAP(jac_capi,cb_jac_in_zvode__user__routines_capi,PyObject);
+    SWAP(jac_args_capi,cb_jac_in_zvode__user__routines_args_capi,PyTupleObject);
+    memcpy(&jac_jmpbuf,&cb_jac_in_zvode__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable lzw */
+  lzw = len(zwork);
+  CHECKSCALAR(len(zwork)>=lzw,"len(zwork)>=lzw","hidden lzw","zvode:lzw=%d",lzw) {
+  /* Processing variable lrw */
+  lrw = len(rwork);
+  CHECKSCALAR(len(rwork)>=lrw,"len(rwork)>=lrw","hidden lrw","zvode:lrw=%d",lrw) {
+  /* Processing variable liw */
+  liw = len(iwork);
+  CHECKSCALAR(len(iwork)>=liw,"len(iwork)>=liw","hidden liw","zvode:liw=%d",liw) {
+  /* Processing variable neq */
+  neq = len(y);
+  /* Processing variable atol */
+  ;
+  capi_atol_intent |= F2PY_INTENT_IN;
+  capi_atol_tmp = array_from_pyobj(NPY_DOUBLE,atol_Dims,atol_Rank,capi_atol_intent,atol_capi);
+  if (capi_atol_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 7th argument `atol' of vode.zvode to C/Fortran array" );
+  } else {
+    atol = (double *)(PyArray_DATA(capi_atol_tmp));
+
+  CHECKARRAY(len(atol)<=1||len(atol)>=neq,"len(atol)<=1||len(atol)>=neq","7th argument atol") {
+  /* Processing variable itol */
+  itol = (len(atol)<=1 && len(rtol)<=1?1:(len(rtol)<=1?2:(len(atol)<=1?3:4)));
+  /* Processing variable rtol */
+  ;
+  capi_rtol_intent |= F2PY_INTENT_IN;
+  capi_rtol_tmp = array_from_pyobj(NPY_DOUBLE,rtol_Dims,rtol_Rank,capi_rtol_intent,rtol_capi);
+  if (capi_rtol_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(vode_error,"failed in converting 6th argument `rtol' of vode.zvode to C/Fortran array" );
+  } else {
+    rtol = (double *)(PyArray_DATA(capi_rtol_tmp));
+
+  CHECKARRAY(len(rtol)<=1||len(rtol)>=neq,"len(rtol)<=1||len(rtol)>=neq","6th argument rtol") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    if ((setjmp(cb_f_in_zvode__user__routines_jmpbuf)) || (setjmp(cb_jac_in_zvode__user__routines_jmpbuf))) {
+      f2py_success = 0;
+    } else {
+        (*f2py_func)(cb_f_in_zvode__user__routines,&neq,y,&t,&tout,&itol,rtol,atol,&itask,&istate,&iopt,zwork,&lzw,rwork,&lrw,iwork,&liw,cb_jac_in_zvode__user__routines,&mf,&rpar,&ipar) ;
+        /*(*f2py_func)(f_cptr,jac_cptr,&neq,y,&t,&tout,&itol,rtol,atol,&itask,&istate,&iopt,zwork,&lzw,rwork,&lrw,iwork,&liw,&mf,&rpar,&ipar);*/
+    }
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ndi",capi_y_tmp,t,istate);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(len(rtol)<=1||len(rtol)>=neq)*/
+  if((PyObject *)capi_rtol_tmp!=rtol_capi) {
+    Py_XDECREF(capi_rtol_tmp); }
+  }  /*if (capi_rtol_tmp == NULL) ... else of rtol*/
+  /* End of cleaning variable rtol */
+  /* End of cleaning variable itol */
+  } /*CHECKARRAY(len(atol)<=1||len(atol)>=neq)*/
+  if((PyObject *)capi_atol_tmp!=atol_capi) {
+    Py_XDECREF(capi_atol_tmp); }
+  }  /*if (capi_atol_tmp == NULL) ... else of atol*/
+  /* End of cleaning variable atol */
+  /* End of cleaning variable neq */
+  } /*CHECKSCALAR(len(iwork)>=liw)*/
+  /* End of cleaning variable liw */
+  } /*CHECKSCALAR(len(rwork)>=lrw)*/
+  /* End of cleaning variable lrw */
+  } /*CHECKSCALAR(len(zwork)>=lzw)*/
+  /* End of cleaning variable lzw */
+    CFUNCSMESS("Restoring jmpbuf for `jac`.\n");
+    cb_jac_in_zvode__user__routines_capi = jac_capi;
+    Py_DECREF(cb_jac_in_zvode__user__routines_args_capi);
+    cb_jac_in_zvode__user__routines_args_capi = jac_args_capi;
+    cb_jac_in_zvode__user__routines_nofargs = jac_nofargs_capi;
+    memcpy(&cb_jac_in_zvode__user__routines_jmpbuf,&jac_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable jac */
+  } /*if (f2py_success) of tout*/
+  /* End of cleaning variable tout */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ipar */
+  } /*if (f2py_success) of t*/
+  /* End of cleaning variable t */
+  if((PyObject *)capi_zwork_tmp!=zwork_capi) {
+    Py_XDECREF(capi_zwork_tmp); }
+  }  /*if (capi_zwork_tmp == NULL) ... else of zwork*/
+  /* End of cleaning variable zwork */
+  } /*CHECKSCALAR(istate>0 && istate<4)*/
+  } /*if (f2py_success) of istate*/
+  /* End of cleaning variable istate */
+  if((PyObject *)capi_rwork_tmp!=rwork_capi) {
+    Py_XDECREF(capi_rwork_tmp); }
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+  } /*CHECKSCALAR(itask>0 && itask<6)*/
+  } /*if (f2py_success) of itask*/
+  /* End of cleaning variable itask */
+    CFUNCSMESS("Restoring jmpbuf for `f`.\n");
+    cb_f_in_zvode__user__routines_capi = f_capi;
+    Py_DECREF(cb_f_in_zvode__user__routines_args_capi);
+    cb_f_in_zvode__user__routines_args_capi = f_args_capi;
+    cb_f_in_zvode__user__routines_nofargs = f_nofargs_capi;
+    memcpy(&cb_f_in_zvode__user__routines_jmpbuf,&f_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable f */
+  } /*if (f2py_success) of mf*/
+  /* End of cleaning variable mf */
+  if((PyObject *)capi_iwork_tmp!=iwork_capi) {
+    Py_XDECREF(capi_iwork_tmp); }
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable rpar */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zvode ********************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"dvode",-1,{{-1}},0,(char *)F_FUNC(dvode,DVODE),(f2py_init_func)f2py_rout_vode_dvode,doc_f2py_rout_vode_dvode},
+  {"zvode",-1,{{-1}},0,(char *)F_FUNC(zvode,ZVODE),(f2py_init_func)f2py_rout_vode_zvode,doc_f2py_rout_vode_zvode},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "vode",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_vode(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initvode(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = vode_module = PyModule_Create(&moduledef);
+#else
+  m = vode_module = Py_InitModule("vode", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module vode (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'vode' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  y,t,istate = dvode(f,jac,y,t,tout,rtol,atol,itask,istate,rwork,iwork,mf,f_extra_args=(),jac_extra_args=(),overwrite_y=0)\n"
+"  y,t,istate = zvode(f,jac,y,t,tout,rtol,atol,itask,istate,zwork,rwork,iwork,mf,f_extra_args=(),jac_extra_args=(),overwrite_y=0)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  vode_error = PyErr_NewException ("vode.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"vode");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,5467 @@
+/* File: dfitpackmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 22:52:11 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *dfitpack_error;
+static PyObject *dfitpack_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+/*need_typedefs*/
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(dfitpack_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#define CHECKARRAY(check,tcheck,name) \
+    if (!(check)) {\
+        PyErr_SetString(dfitpack_error,"("tcheck") failed for "name);\
+        /*goto capi_fail;*/\
+    } else 
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) _F2PYWRAP##F
+#else
+#define F_WRAPPEDFUNC(f,F) _f2pywrap##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) _F2PYWRAP##F##_
+#else
+#define F_WRAPPEDFUNC(f,F) _f2pywrap##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) F2PYWRAP##F
+#else
+#define F_WRAPPEDFUNC(f,F) f2pywrap##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) F2PYWRAP##F##_
+#else
+#define F_WRAPPEDFUNC(f,F) f2pywrap##f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_WRAPPEDFUNC_US(f,F) F_WRAPPEDFUNC(f##_,F##_)
+#else
+#define F_WRAPPEDFUNC_US(f,F) F_WRAPPEDFUNC(f,F)
+#endif
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = dfitpack_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = dfitpack_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static struct { int nd;npy_intp *d;int *i,*i_tr,tr; } forcombcache;
+static int initforcomb(npy_intp *dims,int nd,int tr) {
+  int k;
+  if (dims==NULL) return 0;
+  if (nd<0) return 0;
+  forcombcache.nd = nd;
+  forcombcache.d = dims;
+  forcombcache.tr = tr;
+  if ((forcombcache.i = (int *)malloc(sizeof(int)*nd))==NULL) return 0;
+  if ((forcombcache.i_tr = (int *)malloc(sizeof(int)*nd))==NULL) return 0;
+  for (k=1;k<nd;k++) {
+    forcombcache.i[k] = forcombcache.i_tr[nd-k-1] = 0;
+  }
+  forcombcache.i[0] = forcombcache.i_tr[nd-1] = -1;
+  return 1;
+}
+static int *nextforcomb(void) {
+  int j,*i,*i_tr,k;
+  int nd=forcombcache.nd;
+  if ((i=forcombcache.i) == NULL) return NULL;
+  if ((i_tr=forcombcache.i_tr) == NULL) return NULL;
+  if (forcombcache.d == NULL) return NULL;
+  i[0]++;
+  if (i[0]==forcombcache.d[0]) {
+    j=1;
+    while ((j<nd) && (i[j]==forcombcache.d[j]-1)) j++;
+    if (j==nd) {
+      free(i);
+      free(i_tr);
+      return NULL;
+    }
+    for (k=0;k<j;k++) i[k] = i_tr[nd-k-1] = 0;
+    i[j]++;
+    i_tr[nd-j-1]++;
+  } else
+    i_tr[nd-1]++;
+  if (forcombcache.tr) return i_tr;
+  return i;
+}
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+  /* start usercode multiline (0) */
+ 
+
+static double dmax(double* seq,int len) {
+  double val;
+  int i;
+  if (len<1)
+    return -1e308;
+  val = seq[0];
+  for(i=1;i<len;++i)
+    if (seq[i]>val) val = seq[i];
+  return val;
+}
+static double dmin(double* seq,int len) {
+  double val;
+  int i;
+  if (len<1)
+    return 1e308;
+  val = seq[0];
+  for(i=1;i<len;++i)
+    if (seq[i]<val) val = seq[i];
+  return val;
+}
+static double calc_b(double* x,int m,double* tx,int nx) {
+  double val1 = dmin(x,m);
+  double val2 = dmin(tx,nx);
+  if (val2>val1) return val1;
+  val1 = dmax(tx,nx);
+  return val2 - (val1-val2)/nx;
+}
+static double calc_e(double* x,int m,double* tx,int nx) {
+  double val1 = dmax(x,m);
+  double val2 = dmax(tx,nx);
+  if (val2<val1) return val1;
+  val1 = dmin(tx,nx);
+  return val2 + (val2-val1)/nx;
+}
+static int imax(int i1,int i2) {
+  return MAX(i1,i2);
+}
+
+static int calc_surfit_lwrk1(int m, int kx, int ky, int nxest, int nyest) {
+ int u = nxest-kx-1;
+ int v = nyest-ky-1;
+ int km = MAX(kx,ky)+1;
+ int ne = MAX(nxest,nyest);
+ int bx = kx*v+ky+1;
+ int by = ky*u+kx+1;
+ int b1,b2;
+ if (bx<=by) {b1=bx;b2=bx+v-ky;}
+ else {b1=by;b2=by+u-kx;}
+ return u*v*(2+b1+b2)+2*(u+v+km*(m+ne)+ne-kx-ky)+b2+1;
+}
+static int calc_surfit_lwrk2(int m, int kx, int ky, int nxest, int nyest) {
+ int u = nxest-kx-1;
+ int v = nyest-ky-1;
+ int bx = kx*v+ky+1;
+ int by = ky*u+kx+1;
+ int b2 = (bx<=by?bx+v-ky:by+u-kx);
+ return u*v*(b2+1)+b2;
+}
+
+static int calc_regrid_lwrk(int mx, int my, int kx, int ky,
+                            int nxest, int nyest) {
+ int u = MAX(my, nxest);
+ return 4+nxest*(my+2*kx+5)+nyest*(2*ky+5)+mx*(kx+1)+my*(ky+1)+u;
+}
+
+  /* end multiline (0)*/
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(splev,SPLEV)(double*,int*,double*,int*,double*,double*,int*,int*,int*);
+extern void F_FUNC(splder,SPLDER)(double*,int*,double*,int*,int*,double*,double*,int*,int*,double*,int*);
+extern void F_WRAPPEDFUNC(splint,SPLINT)(double*,double*,int*,double*,int*,double*,double*,double*);
+extern void F_FUNC(sproot,SPROOT)(double*,int*,double*,double*,int*,int*,int*);
+extern void F_FUNC(spalde,SPALDE)(double*,int*,double*,int*,double*,double*,int* );
+extern void F_FUNC(curfit,CURFIT)(int*,int*,double*,double*,double*,double*,double*,int*,double*,int*,int*,double*,double*,double*,double*,int*,int*,int*);
+extern void F_FUNC(percur,PERCUR)(int*,int*,double*,double*,double*,int*,double*,int*,int*,double*,double*,double*,double*,int*,int*,int*);
+extern void F_FUNC(parcur,PARCUR)(int*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,double*,int*,double*,double*,double*,int*,int*,int*);
+extern void F_FUNC(fpcurf ,FPCURF )(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* );
+extern void F_FUNC(fpcurf ,FPCURF )(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* );
+extern void F_FUNC(fpcurf ,FPCURF )(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* );
+extern void F_FUNC(bispev,BISPEV)(double*,int*,double*,int*,double*,int*,int*,double*,int*,double*,int*,double*,double*,int*,int*,int*,int*);
+extern void F_FUNC(bispeu,BISPEU)(double*,int*,double*,int*,double*,int*,int*,double*,double*,double*,int*,double*,int*,int*);
+extern void F_FUNC(surfit ,SURFIT )(int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,int*,int*);
+extern void F_FUNC(surfit ,SURFIT )(int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,int*,int*);
+extern void F_FUNC(regrid ,REGRID )(int*,int*,double*,int*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,int*,int*,int*);
+extern void F_FUNC(spgrid ,SPGRID )(int*,int*,int*,double*,int*,double*,double*,double*,double*,double*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,int*,int*,int*);
+extern void F_WRAPPEDFUNC(dblint,DBLINT)(double*,double*,int*,double*,int*,double*,int*,int*,double*,double*,double*,double*,double*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** splev ***********************************/
+static char doc_f2py_rout_dfitpack_splev[] = "\
+y = splev(t,c,k,x,[e])\n\nWrapper for ``splev``.\
+\n\nParameters\n----------\n"
+"t : input rank-1 array('d') with bounds (n)\n"
+"c : input rank-1 array('d') with bounds (n)\n"
+"k : input int\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"\nOther Parameters\n----------------\n"
+"e : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('d') with bounds (m)";
+/* extern void F_FUNC(splev,SPLEV)(double*,int*,double*,int*,double*,double*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_splev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int*,double*,double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int m = 0;
+  int e = 0;
+  PyObject *e_capi = Py_None;
+  int ier = 0;
+  static char *capi_kwlist[] = {"t","c","k","x","e",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|O:dfitpack.splev",\
+    capi_kwlist,&t_capi,&c_capi,&k_capi,&x_capi,&e_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable e */
+  if (e_capi == Py_None) e = 0; else
+    f2py_success = int_from_pyobj(&e,e_capi,"dfitpack.splev() 1st keyword (e) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(0<=e && e<=2,"0<=e && e<=2","1st keyword e","splev:e=%d",e) {
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.splev() 3rd argument (k) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ier */
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_IN;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `t' of dfitpack.splev to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `x' of dfitpack.splev to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(t);
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,Py_None);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `y' of dfitpack.splev to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable c */
+  c_Dims[0]=n;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `c' of dfitpack.splev to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==n,"len(c)==n","2nd argument c") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(t,&n,c,&k,x,y,&m,&e,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(len(c)==n)*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  /* End of cleaning variable ier */
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  } /*CHECKSCALAR(0<=e && e<=2)*/
+  } /*if (f2py_success) of e*/
+  /* End of cleaning variable e */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of splev ********************************/
+
+/*********************************** splder ***********************************/
+static char doc_f2py_rout_dfitpack_splder[] = "\
+y = splder(t,c,k,x,[nu,e])\n\nWrapper for ``splder``.\
+\n\nParameters\n----------\n"
+"t : input rank-1 array('d') with bounds (n)\n"
+"c : input rank-1 array('d') with bounds (n)\n"
+"k : input int\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"\nOther Parameters\n----------------\n"
+"nu : input int, optional\n    Default: 1\n"
+"e : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('d') with bounds (m)";
+/* extern void F_FUNC(splder,SPLDER)(double*,int*,double*,int*,int*,double*,double*,int*,int*,double*,int*); */
+static PyObject *f2py_rout_dfitpack_splder(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int*,int*,double*,double*,int*,int*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  int nu = 0;
+  PyObject *nu_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int m = 0;
+  int e = 0;
+  PyObject *e_capi = Py_None;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"t","c","k","x","nu","e",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OO:dfitpack.splder",\
+    capi_kwlist,&t_capi,&c_capi,&k_capi,&x_capi,&nu_capi,&e_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable e */
+  if (e_capi == Py_None) e = 0; else
+    f2py_success = int_from_pyobj(&e,e_capi,"dfitpack.splder() 2nd keyword (e) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(0<=e && e<=2,"0<=e && e<=2","2nd keyword e","splder:e=%d",e) {
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.splder() 3rd argument (k) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ier */
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_IN;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `t' of dfitpack.splder to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `x' of dfitpack.splder to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(t);
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,Py_None);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `y' of dfitpack.splder to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable nu */
+  if (nu_capi == Py_None) nu = 1; else
+    f2py_success = int_from_pyobj(&nu,nu_capi,"dfitpack.splder() 1st keyword (nu) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(0<=nu && nu<=k,"0<=nu && nu<=k","1st keyword nu","splder:nu=%d",nu) {
+  /* Processing variable c */
+  c_Dims[0]=n;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `c' of dfitpack.splder to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==n,"len(c)==n","2nd argument c") {
+  /* Processing variable wrk */
+  wrk_Dims[0]=n;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.splder to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(t,&n,c,&k,&nu,x,y,&m,&e,wrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  } /*CHECKARRAY(len(c)==n)*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(0<=nu && nu<=k)*/
+  } /*if (f2py_success) of nu*/
+  /* End of cleaning variable nu */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  /* End of cleaning variable ier */
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  } /*CHECKSCALAR(0<=e && e<=2)*/
+  } /*if (f2py_success) of e*/
+  /* End of cleaning variable e */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of splder *******************************/
+
+/*********************************** splint ***********************************/
+static char doc_f2py_rout_dfitpack_splint[] = "\
+splint = splint(t,c,k,a,b)\n\nWrapper for ``splint``.\
+\n\nParameters\n----------\n"
+"t : input rank-1 array('d') with bounds (n)\n"
+"c : input rank-1 array('d') with bounds (n)\n"
+"k : input int\n"
+"a : input float\n"
+"b : input float\n"
+"\nReturns\n-------\n"
+"splint : float";
+/* extern void F_WRAPPEDFUNC(splint,SPLINT)(double*,double*,int*,double*,int*,double*,double*,double*); */
+static PyObject *f2py_rout_dfitpack_splint(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,double*,int*,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double splint = 0;
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double a = 0;
+  PyObject *a_capi = Py_None;
+  double b = 0;
+  PyObject *b_capi = Py_None;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  static char *capi_kwlist[] = {"t","c","k","a","b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:dfitpack.splint",\
+    capi_kwlist,&t_capi,&c_capi,&k_capi,&a_capi,&b_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = double_from_pyobj(&a,a_capi,"dfitpack.splint() 4th argument (a) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable b */
+    f2py_success = double_from_pyobj(&b,b_capi,"dfitpack.splint() 5th argument (b) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.splint() 3rd argument (k) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable splint */
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_IN;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `t' of dfitpack.splint to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable n */
+  n = len(t);
+  /* Processing variable c */
+  c_Dims[0]=n;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `c' of dfitpack.splint to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==n,"len(c)==n","2nd argument c") {
+  /* Processing variable wrk */
+  wrk_Dims[0]=n;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.splint to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&splint,t,&n,c,&k,&a,&b,wrk);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",splint);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  } /*CHECKARRAY(len(c)==n)*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  /* End of cleaning variable splint */
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  } /*if (f2py_success) of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of splint *******************************/
+
+/*********************************** sproot ***********************************/
+static char doc_f2py_rout_dfitpack_sproot[] = "\
+zero,m,ier = sproot(t,c,[mest])\n\nWrapper for ``sproot``.\
+\n\nParameters\n----------\n"
+"t : input rank-1 array('d') with bounds (n)\n"
+"c : input rank-1 array('d') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"mest : input int, optional\n    Default: 3*(n-7)\n"
+"\nReturns\n-------\n"
+"zero : rank-1 array('d') with bounds (mest)\n"
+"m : int\n"
+"ier : int";
+/* extern void F_FUNC(sproot,SPROOT)(double*,int*,double*,double*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_sproot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  double *zero = NULL;
+  npy_intp zero_Dims[1] = {-1};
+  const int zero_Rank = 1;
+  PyArrayObject *capi_zero_tmp = NULL;
+  int capi_zero_intent = 0;
+  int mest = 0;
+  PyObject *mest_capi = Py_None;
+  int m = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"t","c","mest",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|O:dfitpack.sproot",\
+    capi_kwlist,&t_capi,&c_capi,&mest_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_IN;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `t' of dfitpack.sproot to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable ier */
+  /* Processing variable m */
+  /* Processing variable n */
+  n = len(t);
+  CHECKSCALAR(n>=8,"n>=8","hidden n","sproot:n=%d",n) {
+  /* Processing variable mest */
+  if (mest_capi == Py_None) mest = 3*(n-7); else
+    f2py_success = int_from_pyobj(&mest,mest_capi,"dfitpack.sproot() 1st keyword (mest) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable c */
+  c_Dims[0]=n;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `c' of dfitpack.sproot to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==n,"len(c)==n","2nd argument c") {
+  /* Processing variable zero */
+  zero_Dims[0]=mest;
+  capi_zero_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_zero_tmp = array_from_pyobj(NPY_DOUBLE,zero_Dims,zero_Rank,capi_zero_intent,Py_None);
+  if (capi_zero_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `zero' of dfitpack.sproot to C/Fortran array" );
+  } else {
+    zero = (double *)(PyArray_DATA(capi_zero_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(t,&n,c,zero,&mest,&m,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nii",capi_zero_tmp,m,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_zero_tmp == NULL) ... else of zero*/
+  /* End of cleaning variable zero */
+  } /*CHECKARRAY(len(c)==n)*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*if (f2py_success) of mest*/
+  /* End of cleaning variable mest */
+  } /*CHECKSCALAR(n>=8)*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable ier */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sproot *******************************/
+
+/*********************************** spalde ***********************************/
+static char doc_f2py_rout_dfitpack_spalde[] = "\
+d,ier = spalde(t,c,k,x)\n\nWrapper for ``spalde``.\
+\n\nParameters\n----------\n"
+"t : input rank-1 array('d') with bounds (n)\n"
+"c : input rank-1 array('d') with bounds (n)\n"
+"k : input int\n"
+"x : input float\n"
+"\nReturns\n-------\n"
+"d : rank-1 array('d') with bounds (k + 1)\n"
+"ier : int";
+/* extern void F_FUNC(spalde,SPALDE)(double*,int*,double*,int*,double*,double*,int* ); */
+static PyObject *f2py_rout_dfitpack_spalde(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int*,double*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double x = 0;
+  PyObject *x_capi = Py_None;
+  double *d = NULL;
+  npy_intp d_Dims[1] = {-1};
+  const int d_Rank = 1;
+  PyArrayObject *capi_d_tmp = NULL;
+  int capi_d_intent = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"t","c","k","x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:dfitpack.spalde",\
+    capi_kwlist,&t_capi,&c_capi,&k_capi,&x_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_IN;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `t' of dfitpack.spalde to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable x */
+    f2py_success = double_from_pyobj(&x,x_capi,"dfitpack.spalde() 4th argument (x) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.spalde() 3rd argument (k) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ier */
+  /* Processing variable d */
+  d_Dims[0]=k + 1;
+  capi_d_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_d_tmp = array_from_pyobj(NPY_DOUBLE,d_Dims,d_Rank,capi_d_intent,Py_None);
+  if (capi_d_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `d' of dfitpack.spalde to C/Fortran array" );
+  } else {
+    d = (double *)(PyArray_DATA(capi_d_tmp));
+
+  /* Processing variable n */
+  n = len(t);
+  /* Processing variable c */
+  c_Dims[0]=n;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `c' of dfitpack.spalde to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==n,"len(c)==n","2nd argument c") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int k1=k+1; (*f2py_func)(t,&n,c,&k1,&x,d,&ier); } ;
+        /*(*f2py_func)(t,&n,c,&k,&x,d,&ier);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_d_tmp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(len(c)==n)*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable n */
+  }  /*if (capi_d_tmp == NULL) ... else of d*/
+  /* End of cleaning variable d */
+  /* End of cleaning variable ier */
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  } /*if (f2py_success) of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of spalde *******************************/
+
+/*********************************** curfit ***********************************/
+static char doc_f2py_rout_dfitpack_curfit[] = "\
+n,c,fp,ier = curfit(iopt,x,y,w,t,wrk,iwrk,[xb,xe,k,s])\n\nWrapper for ``curfit``.\
+\n\nParameters\n----------\n"
+"iopt : input int\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"w : input rank-1 array('d') with bounds (m)\n"
+"t : in/output rank-1 array('d') with bounds (nest)\n"
+"wrk : in/output rank-1 array('d') with bounds (lwrk)\n"
+"iwrk : in/output rank-1 array('i') with bounds (nest)\n"
+"\nOther Parameters\n----------------\n"
+"xb : input float, optional\n    Default: x[0]\n"
+"xe : input float, optional\n    Default: x[m-1]\n"
+"k : input int, optional\n    Default: 3\n"
+"s : input float, optional\n    Default: 0.0\n"
+"\nReturns\n-------\n"
+"n : int\n"
+"c : rank-1 array('d') with bounds (n)\n"
+"fp : float\n"
+"ier : int";
+/* extern void F_FUNC(curfit,CURFIT)(int*,int*,double*,double*,double*,double*,double*,int*,double*,int*,int*,double*,double*,double*,double*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_curfit(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,double*,double*,double*,int*,double*,int*,int*,double*,double*,double*,double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  PyObject *iopt_capi = Py_None;
+  int m = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  PyObject *w_capi = Py_None;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nest = 0;
+  int n = 0;
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  PyObject *wrk_capi = Py_None;
+  int lwrk = 0;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  PyObject *iwrk_capi = Py_None;
+  int ier = 0;
+  static char *capi_kwlist[] = {"iopt","x","y","w","t","wrk","iwrk","xb","xe","k","s",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOO|OOOO:dfitpack.curfit",\
+    capi_kwlist,&iopt_capi,&x_capi,&y_capi,&w_capi,&t_capi,&wrk_capi,&iwrk_capi,&xb_capi,&xe_capi,&k_capi,&s_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable iopt */
+    f2py_success = int_from_pyobj(&iopt,iopt_capi,"dfitpack.curfit() 1st argument (iopt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable k */
+  if (k_capi == Py_None) k = 3; else
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.curfit() 3rd keyword (k) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=k && k <=5,"1<=k && k <=5","3rd keyword k","curfit:k=%d",k) {
+  /* Processing variable ier */
+  /* Processing variable wrk */
+  ;
+  capi_wrk_intent |= F2PY_INTENT_INOUT;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,wrk_capi);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 6th argument `wrk' of dfitpack.curfit to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+  /* Processing variable s */
+  if (s_capi == Py_None) s = 0.0; else
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.curfit() 4th keyword (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(s>=0.0,"s>=0.0","4th keyword s","curfit:s=%g",s) {
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_INOUT;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 5th argument `t' of dfitpack.curfit to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `x' of dfitpack.curfit to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable xb */
+  if (xb_capi == Py_None) xb = x[0]; else
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.curfit() 1st keyword (xb) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(xb<=x[0],"xb<=x[0]","1st keyword xb","curfit:xb=%g",xb) {
+  /* Processing variable nest */
+  nest = len(t);
+  /* Processing variable m */
+  m = len(x);
+  CHECKSCALAR(m>k,"m>k","hidden m","curfit:m=%d",m) {
+  /* Processing variable lwrk */
+  lwrk = len(wrk);
+  /* Processing variable n */
+  n = nest;
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `w' of dfitpack.curfit to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  CHECKARRAY(len(w)==m,"len(w)==m","4th argument w") {
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=nest;
+  capi_iwrk_intent |= F2PY_INTENT_INOUT;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,iwrk_capi);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 7th argument `iwrk' of dfitpack.curfit to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `y' of dfitpack.curfit to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)==m,"len(y)==m","3rd argument y") {
+  /* Processing variable xe */
+  if (xe_capi == Py_None) xe = x[m-1]; else
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.curfit() 2nd keyword (xe) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(xe>=x[m-1],"xe>=x[m-1]","2nd keyword xe","curfit:xe=%g",xe) {
+  /* Processing variable c */
+  c_Dims[0]=n;
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.curfit to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,&m,x,y,w,&xb,&xe,&k,&s,&nest,&n,t,c,&fp,wrk,&lwrk,iwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("iNdi",n,capi_c_tmp,fp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(xe>=x[m-1])*/
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  } /*CHECKARRAY(len(y)==m)*/
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  if((PyObject *)capi_iwrk_tmp!=iwrk_capi) {
+    Py_XDECREF(capi_iwrk_tmp); }
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+  } /*CHECKARRAY(len(w)==m)*/
+  if((PyObject *)capi_w_tmp!=w_capi) {
+    Py_XDECREF(capi_w_tmp); }
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  /* End of cleaning variable lwrk */
+  } /*CHECKSCALAR(m>k)*/
+  /* End of cleaning variable m */
+  /* End of cleaning variable nest */
+  } /*CHECKSCALAR(xb<=x[0])*/
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  } /*CHECKSCALAR(s>=0.0)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  if((PyObject *)capi_wrk_tmp!=wrk_capi) {
+    Py_XDECREF(capi_wrk_tmp); }
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  /* End of cleaning variable ier */
+  } /*CHECKSCALAR(1<=k && k <=5)*/
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  } /*if (f2py_success) of iopt*/
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of curfit *******************************/
+
+/*********************************** percur ***********************************/
+static char doc_f2py_rout_dfitpack_percur[] = "\
+n,c,fp,ier = percur(iopt,x,y,w,t,wrk,iwrk,[k,s])\n\nWrapper for ``percur``.\
+\n\nParameters\n----------\n"
+"iopt : input int\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"w : input rank-1 array('d') with bounds (m)\n"
+"t : in/output rank-1 array('d') with bounds (nest)\n"
+"wrk : in/output rank-1 array('d') with bounds (lwrk)\n"
+"iwrk : in/output rank-1 array('i') with bounds (nest)\n"
+"\nOther Parameters\n----------------\n"
+"k : input int, optional\n    Default: 3\n"
+"s : input float, optional\n    Default: 0.0\n"
+"\nReturns\n-------\n"
+"n : int\n"
+"c : rank-1 array('d') with bounds (n)\n"
+"fp : float\n"
+"ier : int";
+/* extern void F_FUNC(percur,PERCUR)(int*,int*,double*,double*,double*,int*,double*,int*,int*,double*,double*,double*,double*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_percur(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,double*,int*,double*,int*,int*,double*,double*,double*,double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  PyObject *iopt_capi = Py_None;
+  int m = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  PyObject *w_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nest = 0;
+  int n = 0;
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  PyObject *wrk_capi = Py_None;
+  int lwrk = 0;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  PyObject *iwrk_capi = Py_None;
+  int ier = 0;
+  static char *capi_kwlist[] = {"iopt","x","y","w","t","wrk","iwrk","k","s",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOO|OO:dfitpack.percur",\
+    capi_kwlist,&iopt_capi,&x_capi,&y_capi,&w_capi,&t_capi,&wrk_capi,&iwrk_capi,&k_capi,&s_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable iopt */
+    f2py_success = int_from_pyobj(&iopt,iopt_capi,"dfitpack.percur() 1st argument (iopt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable k */
+  if (k_capi == Py_None) k = 3; else
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.percur() 1st keyword (k) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=k && k <=5,"1<=k && k <=5","1st keyword k","percur:k=%d",k) {
+  /* Processing variable ier */
+  /* Processing variable wrk */
+  ;
+  capi_wrk_intent |= F2PY_INTENT_INOUT;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,wrk_capi);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 6th argument `wrk' of dfitpack.percur to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+  /* Processing variable s */
+  if (s_capi == Py_None) s = 0.0; else
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.percur() 2nd keyword (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(s>=0.0,"s>=0.0","2nd keyword s","percur:s=%g",s) {
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_INOUT;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 5th argument `t' of dfitpack.percur to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `x' of dfitpack.percur to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable nest */
+  nest = len(t);
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=nest;
+  capi_iwrk_intent |= F2PY_INTENT_INOUT;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,iwrk_capi);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 7th argument `iwrk' of dfitpack.percur to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  CHECKSCALAR(m>k,"m>k","hidden m","percur:m=%d",m) {
+  /* Processing variable lwrk */
+  lwrk = len(wrk);
+  /* Processing variable n */
+  n = nest;
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `w' of dfitpack.percur to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  CHECKARRAY(len(w)==m,"len(w)==m","4th argument w") {
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `y' of dfitpack.percur to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)==m,"len(y)==m","3rd argument y") {
+  /* Processing variable c */
+  c_Dims[0]=n;
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.percur to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,&m,x,y,w,&k,&s,&nest,&n,t,c,&fp,wrk,&lwrk,iwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("iNdi",n,capi_c_tmp,fp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKARRAY(len(y)==m)*/
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKARRAY(len(w)==m)*/
+  if((PyObject *)capi_w_tmp!=w_capi) {
+    Py_XDECREF(capi_w_tmp); }
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  /* End of cleaning variable lwrk */
+  } /*CHECKSCALAR(m>k)*/
+  /* End of cleaning variable m */
+  if((PyObject *)capi_iwrk_tmp!=iwrk_capi) {
+    Py_XDECREF(capi_iwrk_tmp); }
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+  /* End of cleaning variable nest */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  } /*CHECKSCALAR(s>=0.0)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  if((PyObject *)capi_wrk_tmp!=wrk_capi) {
+    Py_XDECREF(capi_wrk_tmp); }
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  /* End of cleaning variable ier */
+  } /*CHECKSCALAR(1<=k && k <=5)*/
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  } /*if (f2py_success) of iopt*/
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of percur *******************************/
+
+/*********************************** parcur ***********************************/
+static char doc_f2py_rout_dfitpack_parcur[] = "\
+n,c,fp,ier = parcur(iopt,ipar,idim,u,x,w,ub,ue,t,wrk,iwrk,[k,s])\n\nWrapper for ``parcur``.\
+\n\nParameters\n----------\n"
+"iopt : input int\n"
+"ipar : input int\n"
+"idim : input int\n"
+"u : in/output rank-1 array('d') with bounds (m)\n"
+"x : input rank-1 array('d') with bounds (mx)\n"
+"w : input rank-1 array('d') with bounds (m)\n"
+"ub : input float\n"
+"ue : input float\n"
+"t : in/output rank-1 array('d') with bounds (nest)\n"
+"wrk : in/output rank-1 array('d') with bounds (lwrk)\n"
+"iwrk : in/output rank-1 array('i') with bounds (nest)\n"
+"\nOther Parameters\n----------------\n"
+"k : input int, optional\n    Default: 3.0\n"
+"s : input float, optional\n    Default: 0.0\n"
+"\nReturns\n-------\n"
+"n : int\n"
+"c : rank-1 array('d') with bounds (nc)\n"
+"fp : float\n"
+"ier : int";
+/* extern void F_FUNC(parcur,PARCUR)(int*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,double*,int*,double*,double*,double*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_parcur(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,double*,int*,double*,double*,double*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  PyObject *iopt_capi = Py_None;
+  int ipar = 0;
+  PyObject *ipar_capi = Py_None;
+  int idim = 0;
+  PyObject *idim_capi = Py_None;
+  int m = 0;
+  double *u = NULL;
+  npy_intp u_Dims[1] = {-1};
+  const int u_Rank = 1;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  PyObject *u_capi = Py_None;
+  int mx = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  PyObject *w_capi = Py_None;
+  double ub = 0;
+  PyObject *ub_capi = Py_None;
+  double ue = 0;
+  PyObject *ue_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nest = 0;
+  int n = 0;
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  PyObject *t_capi = Py_None;
+  int nc = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  PyObject *wrk_capi = Py_None;
+  int lwrk = 0;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  PyObject *iwrk_capi = Py_None;
+  int ier = 0;
+  static char *capi_kwlist[] = {"iopt","ipar","idim","u","x","w","ub","ue","t","wrk","iwrk","k","s",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOO|OO:dfitpack.parcur",\
+    capi_kwlist,&iopt_capi,&ipar_capi,&idim_capi,&u_capi,&x_capi,&w_capi,&ub_capi,&ue_capi,&t_capi,&wrk_capi,&iwrk_capi,&k_capi,&s_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable ier */
+  /* Processing variable iopt */
+    f2py_success = int_from_pyobj(&iopt,iopt_capi,"dfitpack.parcur() 1st argument (iopt) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(iopt>=-1 && iopt <= 1,"iopt>=-1 && iopt <= 1","1st argument iopt","parcur:iopt=%d",iopt) {
+  /* Processing variable c */
+  ;
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.parcur to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  /* Processing variable k */
+  if (k_capi == Py_None) k = 3.0; else
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.parcur() 1st keyword (k) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=k && k<=5,"1<=k && k<=5","1st keyword k","parcur:k=%d",k) {
+  /* Processing variable wrk */
+  ;
+  capi_wrk_intent |= F2PY_INTENT_INOUT;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,wrk_capi);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 10th argument `wrk' of dfitpack.parcur to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+  /* Processing variable s */
+  if (s_capi == Py_None) s = 0.0; else
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.parcur() 2nd keyword (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(s>=0.0,"s>=0.0","2nd keyword s","parcur:s=%g",s) {
+  /* Processing variable u */
+  ;
+  capi_u_intent |= F2PY_INTENT_INOUT;
+  capi_u_tmp = array_from_pyobj(NPY_DOUBLE,u_Dims,u_Rank,capi_u_intent,u_capi);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `u' of dfitpack.parcur to C/Fortran array" );
+  } else {
+    u = (double *)(PyArray_DATA(capi_u_tmp));
+
+  /* Processing variable idim */
+    f2py_success = int_from_pyobj(&idim,idim_capi,"dfitpack.parcur() 3rd argument (idim) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(idim > 0 && idim < 11,"idim > 0 && idim < 11","3rd argument idim","parcur:idim=%d",idim) {
+  /* Processing variable ipar */
+    f2py_success = int_from_pyobj(&ipar,ipar_capi,"dfitpack.parcur() 2nd argument (ipar) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(ipar == 1 || ipar == 0,"ipar == 1 || ipar == 0","2nd argument ipar","parcur:ipar=%d",ipar) {
+  /* Processing variable ue */
+    f2py_success = double_from_pyobj(&ue,ue_capi,"dfitpack.parcur() 8th argument (ue) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 5th argument `x' of dfitpack.parcur to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ub */
+    f2py_success = double_from_pyobj(&ub,ub_capi,"dfitpack.parcur() 7th argument (ub) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable t */
+  ;
+  capi_t_intent |= F2PY_INTENT_INOUT;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 9th argument `t' of dfitpack.parcur to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable nest */
+  nest = len(t);
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=nest;
+  capi_iwrk_intent |= F2PY_INTENT_INOUT;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,iwrk_capi);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 11st argument `iwrk' of dfitpack.parcur to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+  /* Processing variable nc */
+  nc = len(c);
+  CHECKSCALAR(nc>=idim*nest,"nc>=idim*nest","hidden nc","parcur:nc=%d",nc) {
+  /* Processing variable m */
+  m = len(u);
+  CHECKSCALAR(m>k,"m>k","hidden m","parcur:m=%d",m) {
+  /* Processing variable lwrk */
+  lwrk = len(wrk);
+  /* Processing variable n */
+  n = nest;
+  /* Processing variable mx */
+  mx = len(x);
+  CHECKSCALAR(mx>=idim*m,"mx>=idim*m","hidden mx","parcur:mx=%d",mx) {
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 6th argument `w' of dfitpack.parcur to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,&ipar,&idim,&m,u,&mx,x,w,&ub,&ue,&k,&s,&nest,&n,t,&nc,c,&fp,wrk,&lwrk,iwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("iNdi",n,capi_c_tmp,fp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_w_tmp!=w_capi) {
+    Py_XDECREF(capi_w_tmp); }
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  } /*CHECKSCALAR(mx>=idim*m)*/
+  /* End of cleaning variable mx */
+  /* End of cleaning variable n */
+  /* End of cleaning variable lwrk */
+  } /*CHECKSCALAR(m>k)*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(nc>=idim*nest)*/
+  /* End of cleaning variable nc */
+  if((PyObject *)capi_iwrk_tmp!=iwrk_capi) {
+    Py_XDECREF(capi_iwrk_tmp); }
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+  /* End of cleaning variable nest */
+  if((PyObject *)capi_t_tmp!=t_capi) {
+    Py_XDECREF(capi_t_tmp); }
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  } /*if (f2py_success) of ub*/
+  /* End of cleaning variable ub */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of ue*/
+  /* End of cleaning variable ue */
+  } /*CHECKSCALAR(ipar == 1 || ipar == 0)*/
+  } /*if (f2py_success) of ipar*/
+  /* End of cleaning variable ipar */
+  } /*CHECKSCALAR(idim > 0 && idim < 11)*/
+  } /*if (f2py_success) of idim*/
+  /* End of cleaning variable idim */
+  if((PyObject *)capi_u_tmp!=u_capi) {
+    Py_XDECREF(capi_u_tmp); }
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+  } /*CHECKSCALAR(s>=0.0)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  if((PyObject *)capi_wrk_tmp!=wrk_capi) {
+    Py_XDECREF(capi_wrk_tmp); }
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  } /*CHECKSCALAR(1<=k && k<=5)*/
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(iopt>=-1 && iopt <= 1)*/
+  } /*if (f2py_success) of iopt*/
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable ier */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of parcur *******************************/
+
+/********************************** fpcurf0 **********************************/
+static char doc_f2py_rout_dfitpack_fpcurf0[] = "\
+x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier = fpcurf0(x,y,k,[w,xb,xe,s,nest])\n\nWrapper for ``fpcurf0``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"k : input int\n"
+"\nOther Parameters\n----------------\n"
+"w : input rank-1 array('d') with bounds (m), optional\n    Default: 1.0\n"
+"xb : input float, optional\n    Default: x[0]\n"
+"xe : input float, optional\n    Default: x[m-1]\n"
+"s : input float, optional\n    Default: m\n"
+"nest : input int, optional\n    Default: (s==0.0?m+k+1:MAX(m/2,2*k1))\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (m)\n"
+"y : rank-1 array('d') with bounds (m)\n"
+"w : rank-1 array('d') with bounds (m)\n"
+"xb : float\n"
+"xe : float\n"
+"k : int\n"
+"s : float\n"
+"n : int\n"
+"t : rank-1 array('d') with bounds (nest)\n"
+"c : rank-1 array('d') with bounds (nest)\n"
+"fp : float\n"
+"fpint : rank-1 array('d') with bounds (nest)\n"
+"nrdata : rank-1 array('i') with bounds (nest)\n"
+"ier : int";
+/* extern void F_FUNC(fpcurf ,FPCURF )(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_dfitpack_fpcurf0(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  PyObject *w_capi = Py_None;
+  int m = 0;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nest = 0;
+  PyObject *nest_capi = Py_None;
+  double tol = 0;
+  int maxit = 0;
+  int k1 = 0;
+  int k2 = 0;
+  int n = 0;
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *fpint = NULL;
+  npy_intp fpint_Dims[1] = {-1};
+  const int fpint_Rank = 1;
+  PyArrayObject *capi_fpint_tmp = NULL;
+  int capi_fpint_intent = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int *nrdata = NULL;
+  npy_intp nrdata_Dims[1] = {-1};
+  const int nrdata_Rank = 1;
+  PyArrayObject *capi_nrdata_tmp = NULL;
+  int capi_nrdata_intent = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"x","y","k","w","xb","xe","s","nest",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOO:dfitpack.fpcurf0",\
+    capi_kwlist,&x_capi,&y_capi,&k_capi,&w_capi,&xb_capi,&xe_capi,&s_capi,&nest_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable maxit */
+  maxit = 20;
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.fpcurf0() 3rd argument (k) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=k && k<=5,"1<=k && k<=5","3rd argument k","fpcurf0:k=%d",k) {
+  /* Processing variable ier */
+  /* Processing variable n */
+  /* Processing variable tol */
+  tol = 0.001;
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `x' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable iopt */
+  iopt = 0;
+  /* Processing variable xb */
+  if (xb_capi == Py_None) xb = x[0]; else
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.fpcurf0() 2nd keyword (xb) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(xb<=x[0],"xb<=x[0]","2nd keyword xb","fpcurf0:xb=%g",xb) {
+  /* Processing variable m */
+  m = len(x);
+  CHECKSCALAR(m>k,"m>k","hidden m","fpcurf0:m=%d",m) {
+  /* Processing variable k2 */
+  k2 = k+2;
+  /* Processing variable k1 */
+  k1 = k+1;
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `y' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)==m,"len(y)==m","2nd argument y") {
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st keyword `w' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  if (w_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("fpcurf0: Initializing w=1.0\n");
+    if (initforcomb(PyArray_DIMS(capi_w_tmp),PyArray_NDIM(capi_w_tmp),1)) {
+      while ((_i = nextforcomb()))
+        w[capi_i++] = 1.0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(dfitpack_error,"Initialization of 1st keyword w failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  CHECKARRAY(len(w)==m,"len(w)==m","1st keyword w") {
+  /* Processing variable s */
+  if (s_capi == Py_None) s = m; else
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.fpcurf0() 4th keyword (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(s>=0.0,"s>=0.0","4th keyword s","fpcurf0:s=%g",s) {
+  /* Processing variable nest */
+  if (nest_capi == Py_None) nest = (s==0.0?m+k+1:MAX(m/2,2*k1)); else
+    f2py_success = int_from_pyobj(&nest,nest_capi,"dfitpack.fpcurf0() 5th keyword (nest) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(nest>=2*k1,"nest>=2*k1","5th keyword nest","fpcurf0:nest=%d",nest) {
+  /* Processing variable xe */
+  if (xe_capi == Py_None) xe = x[m-1]; else
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.fpcurf0() 3rd keyword (xe) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(xe>=x[m-1],"xe>=x[m-1]","3rd keyword xe","fpcurf0:xe=%g",xe) {
+  /* Processing variable nrdata */
+  nrdata_Dims[0]=nest;
+  capi_nrdata_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_nrdata_tmp = array_from_pyobj(NPY_INT,nrdata_Dims,nrdata_Rank,capi_nrdata_intent,Py_None);
+  if (capi_nrdata_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `nrdata' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    nrdata = (int *)(PyArray_DATA(capi_nrdata_tmp));
+
+  /* Processing variable fpint */
+  fpint_Dims[0]=nest;
+  capi_fpint_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_fpint_tmp = array_from_pyobj(NPY_DOUBLE,fpint_Dims,fpint_Rank,capi_fpint_intent,Py_None);
+  if (capi_fpint_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `fpint' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    fpint = (double *)(PyArray_DATA(capi_fpint_tmp));
+
+  /* Processing variable c */
+  c_Dims[0]=nest;
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  /* Processing variable wrk */
+  wrk_Dims[0]=nest*3*k2+m*k1;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+  /* Processing variable t */
+  t_Dims[0]=nest;
+  capi_t_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,Py_None);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `t' of dfitpack.fpcurf0 to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,x,y,w,&m,&xb,&xe,&k,&s,&nest,&tol,&maxit,&k1,&k2,&n,t,c,&fp,fpint,wrk,wrk+nest,wrk+nest*k2,wrk+nest*2*k2,wrk+nest*3*k2,nrdata,&ier) ;
+        /*(*f2py_func)(&iopt,x,y,w,&m,&xb,&xe,&k,&s,&nest,&tol,&maxit,&k1,&k2,&n,t,c,&fp,fpint,wrk,nrdata,&ier);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNddidiNNdNNi",capi_x_tmp,capi_y_tmp,capi_w_tmp,xb,xe,k,s,n,capi_t_tmp,capi_c_tmp,fp,capi_fpint_tmp,capi_nrdata_tmp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  }  /*if (capi_fpint_tmp == NULL) ... else of fpint*/
+  /* End of cleaning variable fpint */
+  }  /*if (capi_nrdata_tmp == NULL) ... else of nrdata*/
+  /* End of cleaning variable nrdata */
+  } /*CHECKSCALAR(xe>=x[m-1])*/
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  } /*CHECKSCALAR(nest>=2*k1)*/
+  } /*if (f2py_success) of nest*/
+  /* End of cleaning variable nest */
+  } /*CHECKSCALAR(s>=0.0)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  } /*CHECKARRAY(len(w)==m)*/
+  }  /*if (f2py_success) of w init*/
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  } /*CHECKARRAY(len(y)==m)*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable k1 */
+  /* End of cleaning variable k2 */
+  } /*CHECKSCALAR(m>k)*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(xb<=x[0])*/
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  /* End of cleaning variable iopt */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable tol */
+  /* End of cleaning variable n */
+  /* End of cleaning variable ier */
+  } /*CHECKSCALAR(1<=k && k<=5)*/
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  /* End of cleaning variable maxit */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of fpcurf0 *******************************/
+
+/********************************** fpcurf1 **********************************/
+static char doc_f2py_rout_dfitpack_fpcurf1[] = "\
+x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier = fpcurf1(x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier,[overwrite_x,overwrite_y,overwrite_w,overwrite_t,overwrite_c,overwrite_fpint,overwrite_nrdata])\n\nWrapper for ``fpcurf1``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"w : input rank-1 array('d') with bounds (m)\n"
+"xb : input float\n"
+"xe : input float\n"
+"k : input int\n"
+"s : input float\n"
+"n : input int\n"
+"t : input rank-1 array('d') with bounds (nest)\n"
+"c : input rank-1 array('d') with bounds (nest)\n"
+"fp : input float\n"
+"fpint : input rank-1 array('d') with bounds (nest)\n"
+"nrdata : input rank-1 array('i') with bounds (nest)\n"
+"ier : input int\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 1\n"
+"overwrite_w : input int, optional\n    Default: 1\n"
+"overwrite_t : input int, optional\n    Default: 1\n"
+"overwrite_c : input int, optional\n    Default: 1\n"
+"overwrite_fpint : input int, optional\n    Default: 1\n"
+"overwrite_nrdata : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (m)\n"
+"y : rank-1 array('d') with bounds (m)\n"
+"w : rank-1 array('d') with bounds (m)\n"
+"xb : float\n"
+"xe : float\n"
+"k : int\n"
+"s : float\n"
+"n : int\n"
+"t : rank-1 array('d') with bounds (nest)\n"
+"c : rank-1 array('d') with bounds (nest)\n"
+"fp : float\n"
+"fpint : rank-1 array('d') with bounds (nest)\n"
+"nrdata : rank-1 array('i') with bounds (nest)\n"
+"ier : int";
+/* extern void F_FUNC(fpcurf ,FPCURF )(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_dfitpack_fpcurf1(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 1;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 1;
+  PyObject *y_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  int capi_overwrite_w = 1;
+  PyObject *w_capi = Py_None;
+  int m = 0;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nest = 0;
+  double tol = 0;
+  int maxit = 0;
+  int k1 = 0;
+  int k2 = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  int capi_overwrite_t = 1;
+  PyObject *t_capi = Py_None;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 1;
+  PyObject *c_capi = Py_None;
+  double fp = 0;
+  PyObject *fp_capi = Py_None;
+  double *fpint = NULL;
+  npy_intp fpint_Dims[1] = {-1};
+  const int fpint_Rank = 1;
+  PyArrayObject *capi_fpint_tmp = NULL;
+  int capi_fpint_intent = 0;
+  int capi_overwrite_fpint = 1;
+  PyObject *fpint_capi = Py_None;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int *nrdata = NULL;
+  npy_intp nrdata_Dims[1] = {-1};
+  const int nrdata_Rank = 1;
+  PyArrayObject *capi_nrdata_tmp = NULL;
+  int capi_nrdata_intent = 0;
+  int capi_overwrite_nrdata = 1;
+  PyObject *nrdata_capi = Py_None;
+  int ier = 0;
+  PyObject *ier_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","w","xb","xe","k","s","n","t","c","fp","fpint","nrdata","ier","overwrite_x","overwrite_y","overwrite_w","overwrite_t","overwrite_c","overwrite_fpint","overwrite_nrdata",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOOOO|iiiiiii:dfitpack.fpcurf1",\
+    capi_kwlist,&x_capi,&y_capi,&w_capi,&xb_capi,&xe_capi,&k_capi,&s_capi,&n_capi,&t_capi,&c_capi,&fp_capi,&fpint_capi,&nrdata_capi,&ier_capi,&capi_overwrite_x,&capi_overwrite_y,&capi_overwrite_w,&capi_overwrite_t,&capi_overwrite_c,&capi_overwrite_fpint,&capi_overwrite_nrdata))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+    f2py_success = double_from_pyobj(&fp,fp_capi,"dfitpack.fpcurf1() 11st argument (fp) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable xb */
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.fpcurf1() 4th argument (xb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable s */
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.fpcurf1() 7th argument (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(s>=0.0,"s>=0.0","7th argument s","fpcurf1:s=%g",s) {
+  /* Processing variable xe */
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.fpcurf1() 5th argument (xe) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable maxit */
+  maxit = 20;
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.fpcurf1() 6th argument (k) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=k && k<=5,"1<=k && k<=5","6th argument k","fpcurf1:k=%d",k) {
+  /* Processing variable ier */
+    f2py_success = int_from_pyobj(&ier,ier_capi,"dfitpack.fpcurf1() 14th argument (ier) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"dfitpack.fpcurf1() 8th argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable t */
+  capi_t_intent |= (capi_overwrite_t?0:F2PY_INTENT_COPY);
+  ;
+  capi_t_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 9th argument `t' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable tol */
+  tol = 0.001;
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `x' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable iopt */
+  iopt = 1;
+  /* Processing variable nest */
+  nest = len(t);
+  /* Processing variable nrdata */
+  capi_nrdata_intent |= (capi_overwrite_nrdata?0:F2PY_INTENT_COPY);
+  nrdata_Dims[0]=nest;
+  capi_nrdata_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_nrdata_tmp = array_from_pyobj(NPY_INT,nrdata_Dims,nrdata_Rank,capi_nrdata_intent,nrdata_capi);
+  if (capi_nrdata_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 13rd argument `nrdata' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    nrdata = (int *)(PyArray_DATA(capi_nrdata_tmp));
+
+  CHECKARRAY(len(nrdata)==nest,"len(nrdata)==nest","13rd argument nrdata") {
+  /* Processing variable fpint */
+  capi_fpint_intent |= (capi_overwrite_fpint?0:F2PY_INTENT_COPY);
+  fpint_Dims[0]=nest;
+  capi_fpint_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_fpint_tmp = array_from_pyobj(NPY_DOUBLE,fpint_Dims,fpint_Rank,capi_fpint_intent,fpint_capi);
+  if (capi_fpint_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 12nd argument `fpint' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    fpint = (double *)(PyArray_DATA(capi_fpint_tmp));
+
+  CHECKARRAY(len(fpint)==nest,"len(fpint)==nest","12nd argument fpint") {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  c_Dims[0]=nest;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 10th argument `c' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==nest,"len(c)==nest","10th argument c") {
+  /* Processing variable m */
+  m = len(x);
+  CHECKSCALAR(m>k,"m>k","hidden m","fpcurf1:m=%d",m) {
+  /* Processing variable k2 */
+  k2 = k+2;
+  /* Processing variable k1 */
+  k1 = k+1;
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `y' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)==m,"len(y)==m","2nd argument y") {
+  /* Processing variable w */
+  capi_w_intent |= (capi_overwrite_w?0:F2PY_INTENT_COPY);
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `w' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  CHECKARRAY(len(w)==m,"len(w)==m","3rd argument w") {
+  /* Processing variable wrk */
+  wrk_Dims[0]=nest*3*k2+m*k1;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.fpcurf1 to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,x,y,w,&m,&xb,&xe,&k,&s,&nest,&tol,&maxit,&k1,&k2,&n,t,c,&fp,fpint,wrk,wrk+nest,wrk+nest*k2,wrk+nest*2*k2,wrk+nest*3*k2,nrdata,&ier) ;
+        /*(*f2py_func)(&iopt,x,y,w,&m,&xb,&xe,&k,&s,&nest,&tol,&maxit,&k1,&k2,&n,t,c,&fp,fpint,wrk,nrdata,&ier);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNddidiNNdNNi",capi_x_tmp,capi_y_tmp,capi_w_tmp,xb,xe,k,s,n,capi_t_tmp,capi_c_tmp,fp,capi_fpint_tmp,capi_nrdata_tmp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  } /*CHECKARRAY(len(w)==m)*/
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  } /*CHECKARRAY(len(y)==m)*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable k1 */
+  /* End of cleaning variable k2 */
+  } /*CHECKSCALAR(m>k)*/
+  /* End of cleaning variable m */
+  } /*CHECKARRAY(len(c)==nest)*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKARRAY(len(fpint)==nest)*/
+  }  /*if (capi_fpint_tmp == NULL) ... else of fpint*/
+  /* End of cleaning variable fpint */
+  } /*CHECKARRAY(len(nrdata)==nest)*/
+  }  /*if (capi_nrdata_tmp == NULL) ... else of nrdata*/
+  /* End of cleaning variable nrdata */
+  /* End of cleaning variable nest */
+  /* End of cleaning variable iopt */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable tol */
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of ier*/
+  /* End of cleaning variable ier */
+  } /*CHECKSCALAR(1<=k && k<=5)*/
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  /* End of cleaning variable maxit */
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  } /*CHECKSCALAR(s>=0.0)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  } /*if (f2py_success) of fp*/
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of fpcurf1 *******************************/
+
+/********************************** fpcurfm1 **********************************/
+static char doc_f2py_rout_dfitpack_fpcurfm1[] = "\
+x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier = fpcurfm1(x,y,k,t,[w,xb,xe,overwrite_t])\n\nWrapper for ``fpcurfm1``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"k : input int\n"
+"t : input rank-1 array('d') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"w : input rank-1 array('d') with bounds (m), optional\n    Default: 1.0\n"
+"xb : input float, optional\n    Default: x[0]\n"
+"xe : input float, optional\n    Default: x[m-1]\n"
+"overwrite_t : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (m)\n"
+"y : rank-1 array('d') with bounds (m)\n"
+"w : rank-1 array('d') with bounds (m)\n"
+"xb : float\n"
+"xe : float\n"
+"k : int\n"
+"s : float\n"
+"n : int\n"
+"t : rank-1 array('d') with bounds (n)\n"
+"c : rank-1 array('d') with bounds (nest)\n"
+"fp : float\n"
+"fpint : rank-1 array('d') with bounds (nest)\n"
+"nrdata : rank-1 array('i') with bounds (nest)\n"
+"ier : int";
+/* extern void F_FUNC(fpcurf ,FPCURF )(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_dfitpack_fpcurfm1(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  PyObject *w_capi = Py_None;
+  int m = 0;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  double s = 0;
+  int nest = 0;
+  double tol = 0;
+  int maxit = 0;
+  int k1 = 0;
+  int k2 = 0;
+  int n = 0;
+  double *t = NULL;
+  npy_intp t_Dims[1] = {-1};
+  const int t_Rank = 1;
+  PyArrayObject *capi_t_tmp = NULL;
+  int capi_t_intent = 0;
+  int capi_overwrite_t = 1;
+  PyObject *t_capi = Py_None;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *fpint = NULL;
+  npy_intp fpint_Dims[1] = {-1};
+  const int fpint_Rank = 1;
+  PyArrayObject *capi_fpint_tmp = NULL;
+  int capi_fpint_intent = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int *nrdata = NULL;
+  npy_intp nrdata_Dims[1] = {-1};
+  const int nrdata_Rank = 1;
+  PyArrayObject *capi_nrdata_tmp = NULL;
+  int capi_nrdata_intent = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"x","y","k","t","w","xb","xe","overwrite_t",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OOOi:dfitpack.fpcurfm1",\
+    capi_kwlist,&x_capi,&y_capi,&k_capi,&t_capi,&w_capi,&xb_capi,&xe_capi,&capi_overwrite_t))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable s */
+  s = -1;
+  /* Processing variable maxit */
+  maxit = 20;
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"dfitpack.fpcurfm1() 3rd argument (k) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=k && k<=5,"1<=k && k<=5","3rd argument k","fpcurfm1:k=%d",k) {
+  /* Processing variable ier */
+  /* Processing variable t */
+  capi_t_intent |= (capi_overwrite_t?0:F2PY_INTENT_COPY);
+  ;
+  capi_t_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_t_tmp = array_from_pyobj(NPY_DOUBLE,t_Dims,t_Rank,capi_t_intent,t_capi);
+  if (capi_t_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `t' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    t = (double *)(PyArray_DATA(capi_t_tmp));
+
+  /* Processing variable tol */
+  tol = 0.001;
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `x' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable iopt */
+  iopt = -1;
+  /* Processing variable xb */
+  if (xb_capi == Py_None) xb = x[0]; else
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.fpcurfm1() 2nd keyword (xb) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(xb<=x[0],"xb<=x[0]","2nd keyword xb","fpcurfm1:xb=%g",xb) {
+  /* Processing variable m */
+  m = len(x);
+  CHECKSCALAR(m>k,"m>k","hidden m","fpcurfm1:m=%d",m) {
+  /* Processing variable n */
+  n = len(t);
+  /* Processing variable k2 */
+  k2 = k+2;
+  /* Processing variable k1 */
+  k1 = k+1;
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `y' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)==m,"len(y)==m","2nd argument y") {
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st keyword `w' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  if (w_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("fpcurfm1: Initializing w=1.0\n");
+    if (initforcomb(PyArray_DIMS(capi_w_tmp),PyArray_NDIM(capi_w_tmp),1)) {
+      while ((_i = nextforcomb()))
+        w[capi_i++] = 1.0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(dfitpack_error,"Initialization of 1st keyword w failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  CHECKARRAY(len(w)==m,"len(w)==m","1st keyword w") {
+  /* Processing variable nest */
+  nest = n;
+  /* Processing variable xe */
+  if (xe_capi == Py_None) xe = x[m-1]; else
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.fpcurfm1() 3rd keyword (xe) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(xe>=x[m-1],"xe>=x[m-1]","3rd keyword xe","fpcurfm1:xe=%g",xe) {
+  /* Processing variable nrdata */
+  nrdata_Dims[0]=nest;
+  capi_nrdata_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_nrdata_tmp = array_from_pyobj(NPY_INT,nrdata_Dims,nrdata_Rank,capi_nrdata_intent,Py_None);
+  if (capi_nrdata_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `nrdata' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    nrdata = (int *)(PyArray_DATA(capi_nrdata_tmp));
+
+  /* Processing variable fpint */
+  fpint_Dims[0]=nest;
+  capi_fpint_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_fpint_tmp = array_from_pyobj(NPY_DOUBLE,fpint_Dims,fpint_Rank,capi_fpint_intent,Py_None);
+  if (capi_fpint_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `fpint' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    fpint = (double *)(PyArray_DATA(capi_fpint_tmp));
+
+  /* Processing variable c */
+  c_Dims[0]=nest;
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  /* Processing variable wrk */
+  wrk_Dims[0]=nest*3*k2+m*k1;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.fpcurfm1 to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,x,y,w,&m,&xb,&xe,&k,&s,&nest,&tol,&maxit,&k1,&k2,&n,t,c,&fp,fpint,wrk,wrk+nest,wrk+nest*k2,wrk+nest*2*k2,wrk+nest*3*k2,nrdata,&ier) ;
+        /*(*f2py_func)(&iopt,x,y,w,&m,&xb,&xe,&k,&s,&nest,&tol,&maxit,&k1,&k2,&n,t,c,&fp,fpint,wrk,nrdata,&ier);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNddidiNNdNNi",capi_x_tmp,capi_y_tmp,capi_w_tmp,xb,xe,k,s,n,capi_t_tmp,capi_c_tmp,fp,capi_fpint_tmp,capi_nrdata_tmp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  }  /*if (capi_fpint_tmp == NULL) ... else of fpint*/
+  /* End of cleaning variable fpint */
+  }  /*if (capi_nrdata_tmp == NULL) ... else of nrdata*/
+  /* End of cleaning variable nrdata */
+  } /*CHECKSCALAR(xe>=x[m-1])*/
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  /* End of cleaning variable nest */
+  } /*CHECKARRAY(len(w)==m)*/
+  }  /*if (f2py_success) of w init*/
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  } /*CHECKARRAY(len(y)==m)*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable k1 */
+  /* End of cleaning variable k2 */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(m>k)*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(xb<=x[0])*/
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  /* End of cleaning variable iopt */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable tol */
+  }  /*if (capi_t_tmp == NULL) ... else of t*/
+  /* End of cleaning variable t */
+  /* End of cleaning variable ier */
+  } /*CHECKSCALAR(1<=k && k<=5)*/
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+  /* End of cleaning variable maxit */
+  /* End of cleaning variable s */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of fpcurfm1 ******************************/
+
+/*********************************** bispev ***********************************/
+static char doc_f2py_rout_dfitpack_bispev[] = "\
+z,ier = bispev(tx,ty,c,kx,ky,x,y)\n\nWrapper for ``bispev``.\
+\n\nParameters\n----------\n"
+"tx : input rank-1 array('d') with bounds (nx)\n"
+"ty : input rank-1 array('d') with bounds (ny)\n"
+"c : input rank-1 array('d') with bounds ((nx-kx-1)*(ny-ky-1))\n"
+"kx : input int\n"
+"ky : input int\n"
+"x : input rank-1 array('d') with bounds (mx)\n"
+"y : input rank-1 array('d') with bounds (my)\n"
+"\nReturns\n-------\n"
+"z : rank-2 array('d') with bounds (mx,my)\n"
+"ier : int";
+/* extern void F_FUNC(bispev,BISPEV)(double*,int*,double*,int*,double*,int*,int*,double*,int*,double*,int*,double*,double*,int*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_bispev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int*,double*,int*,int*,double*,int*,double*,int*,double*,double*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *tx = NULL;
+  npy_intp tx_Dims[1] = {-1};
+  const int tx_Rank = 1;
+  PyArrayObject *capi_tx_tmp = NULL;
+  int capi_tx_intent = 0;
+  PyObject *tx_capi = Py_None;
+  int nx = 0;
+  double *ty = NULL;
+  npy_intp ty_Dims[1] = {-1};
+  const int ty_Rank = 1;
+  PyArrayObject *capi_ty_tmp = NULL;
+  int capi_ty_intent = 0;
+  PyObject *ty_capi = Py_None;
+  int ny = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  int kx = 0;
+  PyObject *kx_capi = Py_None;
+  int ky = 0;
+  PyObject *ky_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int mx = 0;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int my = 0;
+  double *z = NULL;
+  npy_intp z_Dims[2] = {-1, -1};
+  const int z_Rank = 2;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int lwrk = 0;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  int kwrk = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"tx","ty","c","kx","ky","x","y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOO:dfitpack.bispev",\
+    capi_kwlist,&tx_capi,&ty_capi,&c_capi,&kx_capi,&ky_capi,&x_capi,&y_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable kx */
+    f2py_success = int_from_pyobj(&kx,kx_capi,"dfitpack.bispev() 4th argument (kx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable tx */
+  ;
+  capi_tx_intent |= F2PY_INTENT_IN;
+  capi_tx_tmp = array_from_pyobj(NPY_DOUBLE,tx_Dims,tx_Rank,capi_tx_intent,tx_capi);
+  if (capi_tx_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `tx' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    tx = (double *)(PyArray_DATA(capi_tx_tmp));
+
+  /* Processing variable ty */
+  ;
+  capi_ty_intent |= F2PY_INTENT_IN;
+  capi_ty_tmp = array_from_pyobj(NPY_DOUBLE,ty_Dims,ty_Rank,capi_ty_intent,ty_capi);
+  if (capi_ty_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `ty' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    ty = (double *)(PyArray_DATA(capi_ty_tmp));
+
+  /* Processing variable ier */
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 7th argument `y' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 6th argument `x' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ky */
+    f2py_success = int_from_pyobj(&ky,ky_capi,"dfitpack.bispev() 5th argument (ky) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nx */
+  nx = len(tx);
+  /* Processing variable ny */
+  ny = len(ty);
+  /* Processing variable my */
+  my = len(y);
+  /* Processing variable mx */
+  mx = len(x);
+  /* Processing variable kwrk */
+  kwrk = mx+my;
+  /* Processing variable c */
+  c_Dims[0]=(nx-kx-1)*(ny-ky-1);
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `c' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==(nx-kx-1)*(ny-ky-1),"len(c)==(nx-kx-1)*(ny-ky-1)","3rd argument c") {
+  /* Processing variable lwrk */
+  lwrk = mx*(kx+1)+my*(ky+1);
+  /* Processing variable z */
+  z_Dims[0]=mx,z_Dims[1]=my;
+  capi_z_intent |= F2PY_INTENT_C|F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_z_tmp = array_from_pyobj(NPY_DOUBLE,z_Dims,z_Rank,capi_z_intent,Py_None);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `z' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    z = (double *)(PyArray_DATA(capi_z_tmp));
+
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=kwrk;
+  capi_iwrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,Py_None);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `iwrk' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+  /* Processing variable wrk */
+  wrk_Dims[0]=lwrk;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.bispev to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(tx,&nx,ty,&ny,c,&kx,&ky,x,&mx,y,&my,z,wrk,&lwrk,iwrk,&kwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_z_tmp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+    Py_XDECREF(capi_iwrk_tmp);
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  /* End of cleaning variable lwrk */
+  } /*CHECKARRAY(len(c)==(nx-kx-1)*(ny-ky-1))*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable kwrk */
+  /* End of cleaning variable mx */
+  /* End of cleaning variable my */
+  /* End of cleaning variable ny */
+  /* End of cleaning variable nx */
+  } /*if (f2py_success) of ky*/
+  /* End of cleaning variable ky */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ier */
+  if((PyObject *)capi_ty_tmp!=ty_capi) {
+    Py_XDECREF(capi_ty_tmp); }
+  }  /*if (capi_ty_tmp == NULL) ... else of ty*/
+  /* End of cleaning variable ty */
+  if((PyObject *)capi_tx_tmp!=tx_capi) {
+    Py_XDECREF(capi_tx_tmp); }
+  }  /*if (capi_tx_tmp == NULL) ... else of tx*/
+  /* End of cleaning variable tx */
+  } /*if (f2py_success) of kx*/
+  /* End of cleaning variable kx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of bispev *******************************/
+
+/*********************************** bispeu ***********************************/
+static char doc_f2py_rout_dfitpack_bispeu[] = "\
+z,ier = bispeu(tx,ty,c,kx,ky,x,y)\n\nWrapper for ``bispeu``.\
+\n\nParameters\n----------\n"
+"tx : input rank-1 array('d') with bounds (nx)\n"
+"ty : input rank-1 array('d') with bounds (ny)\n"
+"c : input rank-1 array('d') with bounds ((nx-kx-1)*(ny-ky-1))\n"
+"kx : input int\n"
+"ky : input int\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"\nReturns\n-------\n"
+"z : rank-1 array('d') with bounds (m)\n"
+"ier : int";
+/* extern void F_FUNC(bispeu,BISPEU)(double*,int*,double*,int*,double*,int*,int*,double*,double*,double*,int*,double*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_bispeu(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int*,double*,int*,int*,double*,double*,double*,int*,double*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *tx = NULL;
+  npy_intp tx_Dims[1] = {-1};
+  const int tx_Rank = 1;
+  PyArrayObject *capi_tx_tmp = NULL;
+  int capi_tx_intent = 0;
+  PyObject *tx_capi = Py_None;
+  int nx = 0;
+  double *ty = NULL;
+  npy_intp ty_Dims[1] = {-1};
+  const int ty_Rank = 1;
+  PyArrayObject *capi_ty_tmp = NULL;
+  int capi_ty_intent = 0;
+  PyObject *ty_capi = Py_None;
+  int ny = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  int kx = 0;
+  PyObject *kx_capi = Py_None;
+  int ky = 0;
+  PyObject *ky_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *z = NULL;
+  npy_intp z_Dims[1] = {-1};
+  const int z_Rank = 1;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  int m = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int lwrk = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"tx","ty","c","kx","ky","x","y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOO:dfitpack.bispeu",\
+    capi_kwlist,&tx_capi,&ty_capi,&c_capi,&kx_capi,&ky_capi,&x_capi,&y_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable kx */
+    f2py_success = int_from_pyobj(&kx,kx_capi,"dfitpack.bispeu() 4th argument (kx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable tx */
+  ;
+  capi_tx_intent |= F2PY_INTENT_IN;
+  capi_tx_tmp = array_from_pyobj(NPY_DOUBLE,tx_Dims,tx_Rank,capi_tx_intent,tx_capi);
+  if (capi_tx_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `tx' of dfitpack.bispeu to C/Fortran array" );
+  } else {
+    tx = (double *)(PyArray_DATA(capi_tx_tmp));
+
+  /* Processing variable ty */
+  ;
+  capi_ty_intent |= F2PY_INTENT_IN;
+  capi_ty_tmp = array_from_pyobj(NPY_DOUBLE,ty_Dims,ty_Rank,capi_ty_intent,ty_capi);
+  if (capi_ty_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `ty' of dfitpack.bispeu to C/Fortran array" );
+  } else {
+    ty = (double *)(PyArray_DATA(capi_ty_tmp));
+
+  /* Processing variable ier */
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 6th argument `x' of dfitpack.bispeu to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ky */
+    f2py_success = int_from_pyobj(&ky,ky_capi,"dfitpack.bispeu() 5th argument (ky) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable lwrk */
+  lwrk = kx+ky+2;
+  /* Processing variable nx */
+  nx = len(tx);
+  /* Processing variable ny */
+  ny = len(ty);
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 7th argument `y' of dfitpack.bispeu to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable z */
+  z_Dims[0]=m;
+  capi_z_intent |= F2PY_INTENT_C|F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_z_tmp = array_from_pyobj(NPY_DOUBLE,z_Dims,z_Rank,capi_z_intent,Py_None);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `z' of dfitpack.bispeu to C/Fortran array" );
+  } else {
+    z = (double *)(PyArray_DATA(capi_z_tmp));
+
+  /* Processing variable c */
+  c_Dims[0]=(nx-kx-1)*(ny-ky-1);
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `c' of dfitpack.bispeu to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==(nx-kx-1)*(ny-ky-1),"len(c)==(nx-kx-1)*(ny-ky-1)","3rd argument c") {
+  /* Processing variable wrk */
+  wrk_Dims[0]=lwrk;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.bispeu to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(tx,&nx,ty,&ny,c,&kx,&ky,x,y,z,&m,wrk,&lwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_z_tmp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  } /*CHECKARRAY(len(c)==(nx-kx-1)*(ny-ky-1))*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ny */
+  /* End of cleaning variable nx */
+  /* End of cleaning variable lwrk */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of ky*/
+  /* End of cleaning variable ky */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ier */
+  if((PyObject *)capi_ty_tmp!=ty_capi) {
+    Py_XDECREF(capi_ty_tmp); }
+  }  /*if (capi_ty_tmp == NULL) ... else of ty*/
+  /* End of cleaning variable ty */
+  if((PyObject *)capi_tx_tmp!=tx_capi) {
+    Py_XDECREF(capi_tx_tmp); }
+  }  /*if (capi_tx_tmp == NULL) ... else of tx*/
+  /* End of cleaning variable tx */
+  } /*if (f2py_success) of kx*/
+  /* End of cleaning variable kx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of bispeu *******************************/
+
+/******************************** surfit_smth ********************************/
+static char doc_f2py_rout_dfitpack_surfit_smth[] = "\
+nx,tx,ny,ty,c,fp,wrk1,ier = surfit_smth(x,y,z,[w,xb,xe,yb,ye,kx,ky,s,nxest,nyest,eps,lwrk2])\n\nWrapper for ``surfit_smth``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"z : input rank-1 array('d') with bounds (m)\n"
+"\nOther Parameters\n----------------\n"
+"w : input rank-1 array('d') with bounds (m), optional\n    Default: 1.0\n"
+"xb : input float, optional\n    Default: dmin(x,m)\n"
+"xe : input float, optional\n    Default: dmax(x,m)\n"
+"yb : input float, optional\n    Default: dmin(y,m)\n"
+"ye : input float, optional\n    Default: dmax(y,m)\n"
+"kx : input int, optional\n    Default: 3\n"
+"ky : input int, optional\n    Default: 3\n"
+"s : input float, optional\n    Default: m\n"
+"nxest : input int, optional\n    Default: imax(kx+1+sqrt(m/2),2*(kx+1))\n"
+"nyest : input int, optional\n    Default: imax(ky+1+sqrt(m/2),2*(ky+1))\n"
+"eps : input float, optional\n    Default: 1e-16\n"
+"lwrk2 : input int, optional\n    Default: calc_surfit_lwrk2(m,kx,ky,nxest,nyest)\n"
+"\nReturns\n-------\n"
+"nx : int\n"
+"tx : rank-1 array('d') with bounds (nmax)\n"
+"ny : int\n"
+"ty : rank-1 array('d') with bounds (nmax)\n"
+"c : rank-1 array('d') with bounds ((nxest-kx-1)*(nyest-ky-1))\n"
+"fp : float\n"
+"wrk1 : rank-1 array('d') with bounds (lwrk1)\n"
+"ier : int";
+/* extern void F_FUNC(surfit ,SURFIT )(int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_surfit_smth(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  int m = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *z = NULL;
+  npy_intp z_Dims[1] = {-1};
+  const int z_Rank = 1;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  PyObject *z_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  PyObject *w_capi = Py_None;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  double yb = 0;
+  PyObject *yb_capi = Py_None;
+  double ye = 0;
+  PyObject *ye_capi = Py_None;
+  int kx = 0;
+  PyObject *kx_capi = Py_None;
+  int ky = 0;
+  PyObject *ky_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nxest = 0;
+  PyObject *nxest_capi = Py_None;
+  int nyest = 0;
+  PyObject *nyest_capi = Py_None;
+  int nmax = 0;
+  double eps = 0;
+  PyObject *eps_capi = Py_None;
+  int nx = 0;
+  double *tx = NULL;
+  npy_intp tx_Dims[1] = {-1};
+  const int tx_Rank = 1;
+  PyArrayObject *capi_tx_tmp = NULL;
+  int capi_tx_intent = 0;
+  int ny = 0;
+  double *ty = NULL;
+  npy_intp ty_Dims[1] = {-1};
+  const int ty_Rank = 1;
+  PyArrayObject *capi_ty_tmp = NULL;
+  int capi_ty_intent = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *wrk1 = NULL;
+  npy_intp wrk1_Dims[1] = {-1};
+  const int wrk1_Rank = 1;
+  PyArrayObject *capi_wrk1_tmp = NULL;
+  int capi_wrk1_intent = 0;
+  int lwrk1 = 0;
+  double *wrk2 = NULL;
+  npy_intp wrk2_Dims[1] = {-1};
+  const int wrk2_Rank = 1;
+  PyArrayObject *capi_wrk2_tmp = NULL;
+  int capi_wrk2_intent = 0;
+  int lwrk2 = 0;
+  PyObject *lwrk2_capi = Py_None;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  int kwrk = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"x","y","z","w","xb","xe","yb","ye","kx","ky","s","nxest","nyest","eps","lwrk2",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOOOOOO:dfitpack.surfit_smth",\
+    capi_kwlist,&x_capi,&y_capi,&z_capi,&w_capi,&xb_capi,&xe_capi,&yb_capi,&ye_capi,&kx_capi,&ky_capi,&s_capi,&nxest_capi,&nyest_capi,&eps_capi,&lwrk2_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable iopt */
+  iopt = 0;
+  /* Processing variable kx */
+  if (kx_capi == Py_None) kx = 3; else
+    f2py_success = int_from_pyobj(&kx,kx_capi,"dfitpack.surfit_smth() 6th keyword (kx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=kx && kx<=5,"1<=kx && kx<=5","6th keyword kx","surfit_smth:kx=%d",kx) {
+  /* Processing variable ier */
+  /* Processing variable eps */
+  if (eps_capi == Py_None) eps = 1e-16; else
+    f2py_success = double_from_pyobj(&eps,eps_capi,"dfitpack.surfit_smth() 11st keyword (eps) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(0.0<eps && eps<1.0,"0.0<eps && eps<1.0","11st keyword eps","surfit_smth:eps=%g",eps) {
+  /* Processing variable nx */
+  /* Processing variable ny */
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `x' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ky */
+  if (ky_capi == Py_None) ky = 3; else
+    f2py_success = int_from_pyobj(&ky,ky_capi,"dfitpack.surfit_smth() 7th keyword (ky) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=ky && ky<=5,"1<=ky && ky<=5","7th keyword ky","surfit_smth:ky=%d",ky) {
+  /* Processing variable m */
+  m = len(x);
+  CHECKSCALAR(m>=(kx+1)*(ky+1),"m>=(kx+1)*(ky+1)","hidden m","surfit_smth:m=%d",m) {
+  /* Processing variable s */
+  if (s_capi == Py_None) s = m; else
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.surfit_smth() 8th keyword (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(0.0<=s,"0.0<=s","8th keyword s","surfit_smth:s=%g",s) {
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st keyword `w' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  if (w_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("surfit_smth: Initializing w=1.0\n");
+    if (initforcomb(PyArray_DIMS(capi_w_tmp),PyArray_NDIM(capi_w_tmp),1)) {
+      while ((_i = nextforcomb()))
+        w[capi_i++] = 1.0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(dfitpack_error,"Initialization of 1st keyword w failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  CHECKARRAY(len(w)==m,"len(w)==m","1st keyword w") {
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `y' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)==m,"len(y)==m","2nd argument y") {
+  /* Processing variable z */
+  z_Dims[0]=m;
+  capi_z_intent |= F2PY_INTENT_IN;
+  capi_z_tmp = array_from_pyobj(NPY_DOUBLE,z_Dims,z_Rank,capi_z_intent,z_capi);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `z' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    z = (double *)(PyArray_DATA(capi_z_tmp));
+
+  CHECKARRAY(len(z)==m,"len(z)==m","3rd argument z") {
+  /* Processing variable xb */
+  if (xb_capi == Py_None) xb = dmin(x,m); else
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.surfit_smth() 2nd keyword (xb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable yb */
+  if (yb_capi == Py_None) yb = dmin(y,m); else
+    f2py_success = double_from_pyobj(&yb,yb_capi,"dfitpack.surfit_smth() 4th keyword (yb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ye */
+  if (ye_capi == Py_None) ye = dmax(y,m); else
+    f2py_success = double_from_pyobj(&ye,ye_capi,"dfitpack.surfit_smth() 5th keyword (ye) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable xe */
+  if (xe_capi == Py_None) xe = dmax(x,m); else
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.surfit_smth() 3rd keyword (xe) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nxest */
+  if (nxest_capi == Py_None) nxest = imax(kx+1+sqrt(m/2),2*(kx+1)); else
+    f2py_success = int_from_pyobj(&nxest,nxest_capi,"dfitpack.surfit_smth() 9th keyword (nxest) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(nxest>=2*(kx+1),"nxest>=2*(kx+1)","9th keyword nxest","surfit_smth:nxest=%d",nxest) {
+  /* Processing variable nyest */
+  if (nyest_capi == Py_None) nyest = imax(ky+1+sqrt(m/2),2*(ky+1)); else
+    f2py_success = int_from_pyobj(&nyest,nyest_capi,"dfitpack.surfit_smth() 10th keyword (nyest) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(nyest>=2*(ky+1),"nyest>=2*(ky+1)","10th keyword nyest","surfit_smth:nyest=%d",nyest) {
+  /* Processing variable nmax */
+  nmax = MAX(nxest,nyest);
+  /* Processing variable lwrk2 */
+  if (lwrk2_capi == Py_None) lwrk2 = calc_surfit_lwrk2(m,kx,ky,nxest,nyest); else
+    f2py_success = int_from_pyobj(&lwrk2,lwrk2_capi,"dfitpack.surfit_smth() 12nd keyword (lwrk2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lwrk1 */
+  lwrk1 = calc_surfit_lwrk1(m,kx,ky,nxest,nyest);
+  /* Processing variable kwrk */
+  kwrk = m+(nxest-2*kx-1)*(nyest-2*ky-1);
+  /* Processing variable c */
+  c_Dims[0]=(nxest-kx-1)*(nyest-ky-1);
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  /* Processing variable tx */
+  tx_Dims[0]=nmax;
+  capi_tx_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tx_tmp = array_from_pyobj(NPY_DOUBLE,tx_Dims,tx_Rank,capi_tx_intent,Py_None);
+  if (capi_tx_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `tx' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    tx = (double *)(PyArray_DATA(capi_tx_tmp));
+
+  /* Processing variable ty */
+  ty_Dims[0]=nmax;
+  capi_ty_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_ty_tmp = array_from_pyobj(NPY_DOUBLE,ty_Dims,ty_Rank,capi_ty_intent,Py_None);
+  if (capi_ty_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `ty' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    ty = (double *)(PyArray_DATA(capi_ty_tmp));
+
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=kwrk;
+  capi_iwrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,Py_None);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `iwrk' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+  /* Processing variable wrk2 */
+  wrk2_Dims[0]=lwrk2;
+  capi_wrk2_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk2_tmp = array_from_pyobj(NPY_DOUBLE,wrk2_Dims,wrk2_Rank,capi_wrk2_intent,Py_None);
+  if (capi_wrk2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk2' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    wrk2 = (double *)(PyArray_DATA(capi_wrk2_tmp));
+
+  /* Processing variable wrk1 */
+  wrk1_Dims[0]=lwrk1;
+  capi_wrk1_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wrk1_tmp = array_from_pyobj(NPY_DOUBLE,wrk1_Dims,wrk1_Rank,capi_wrk1_intent,Py_None);
+  if (capi_wrk1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk1' of dfitpack.surfit_smth to C/Fortran array" );
+  } else {
+    wrk1 = (double *)(PyArray_DATA(capi_wrk1_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,&m,x,y,z,w,&xb,&xe,&yb,&ye,&kx,&ky,&s,&nxest,&nyest,&nmax,&eps,&nx,tx,&ny,ty,c,&fp,wrk1,&lwrk1,wrk2,&lwrk2,iwrk,&kwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("iNiNNdNi",nx,capi_tx_tmp,ny,capi_ty_tmp,capi_c_tmp,fp,capi_wrk1_tmp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_wrk1_tmp == NULL) ... else of wrk1*/
+  /* End of cleaning variable wrk1 */
+    Py_XDECREF(capi_wrk2_tmp);
+  }  /*if (capi_wrk2_tmp == NULL) ... else of wrk2*/
+  /* End of cleaning variable wrk2 */
+    Py_XDECREF(capi_iwrk_tmp);
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+  }  /*if (capi_ty_tmp == NULL) ... else of ty*/
+  /* End of cleaning variable ty */
+  }  /*if (capi_tx_tmp == NULL) ... else of tx*/
+  /* End of cleaning variable tx */
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable kwrk */
+  /* End of cleaning variable lwrk1 */
+  } /*if (f2py_success) of lwrk2*/
+  /* End of cleaning variable lwrk2 */
+  /* End of cleaning variable nmax */
+  } /*CHECKSCALAR(nyest>=2*(ky+1))*/
+  } /*if (f2py_success) of nyest*/
+  /* End of cleaning variable nyest */
+  } /*CHECKSCALAR(nxest>=2*(kx+1))*/
+  } /*if (f2py_success) of nxest*/
+  /* End of cleaning variable nxest */
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  } /*if (f2py_success) of ye*/
+  /* End of cleaning variable ye */
+  } /*if (f2py_success) of yb*/
+  /* End of cleaning variable yb */
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  } /*CHECKARRAY(len(z)==m)*/
+  if((PyObject *)capi_z_tmp!=z_capi) {
+    Py_XDECREF(capi_z_tmp); }
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  } /*CHECKARRAY(len(y)==m)*/
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKARRAY(len(w)==m)*/
+  }  /*if (f2py_success) of w init*/
+  if((PyObject *)capi_w_tmp!=w_capi) {
+    Py_XDECREF(capi_w_tmp); }
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  } /*CHECKSCALAR(0.0<=s)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  } /*CHECKSCALAR(m>=(kx+1)*(ky+1))*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(1<=ky && ky<=5)*/
+  } /*if (f2py_success) of ky*/
+  /* End of cleaning variable ky */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ny */
+  /* End of cleaning variable nx */
+  } /*CHECKSCALAR(0.0<eps && eps<1.0)*/
+  } /*if (f2py_success) of eps*/
+  /* End of cleaning variable eps */
+  /* End of cleaning variable ier */
+  } /*CHECKSCALAR(1<=kx && kx<=5)*/
+  } /*if (f2py_success) of kx*/
+  /* End of cleaning variable kx */
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of surfit_smth *****************************/
+
+/********************************* surfit_lsq *********************************/
+static char doc_f2py_rout_dfitpack_surfit_lsq[] = "\
+tx,ty,c,fp,ier = surfit_lsq(x,y,z,tx,ty,[w,xb,xe,yb,ye,kx,ky,eps,lwrk2,overwrite_tx,overwrite_ty])\n\nWrapper for ``surfit_lsq``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (m)\n"
+"z : input rank-1 array('d') with bounds (m)\n"
+"tx : input rank-1 array('d') with bounds (nx)\n"
+"ty : input rank-1 array('d') with bounds (ny)\n"
+"\nOther Parameters\n----------------\n"
+"w : input rank-1 array('d') with bounds (m), optional\n    Default: 1.0\n"
+"xb : input float, optional\n    Default: calc_b(x,m,tx,nx)\n"
+"xe : input float, optional\n    Default: calc_e(x,m,tx,nx)\n"
+"yb : input float, optional\n    Default: calc_b(y,m,ty,ny)\n"
+"ye : input float, optional\n    Default: calc_e(y,m,ty,ny)\n"
+"kx : input int, optional\n    Default: 3\n"
+"ky : input int, optional\n    Default: 3\n"
+"eps : input float, optional\n    Default: 1e-16\n"
+"overwrite_tx : input int, optional\n    Default: 1\n"
+"overwrite_ty : input int, optional\n    Default: 1\n"
+"lwrk2 : input int, optional\n    Default: calc_surfit_lwrk2(m,kx,ky,nxest,nyest)\n"
+"\nReturns\n-------\n"
+"tx : rank-1 array('d') with bounds (nx)\n"
+"ty : rank-1 array('d') with bounds (ny)\n"
+"c : rank-1 array('d') with bounds ((nx-kx-1)*(ny-ky-1))\n"
+"fp : float\n"
+"ier : int";
+/* extern void F_FUNC(surfit ,SURFIT )(int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_surfit_lsq(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  int m = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *z = NULL;
+  npy_intp z_Dims[1] = {-1};
+  const int z_Rank = 1;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  PyObject *z_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  PyObject *w_capi = Py_None;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  double yb = 0;
+  PyObject *yb_capi = Py_None;
+  double ye = 0;
+  PyObject *ye_capi = Py_None;
+  int kx = 0;
+  PyObject *kx_capi = Py_None;
+  int ky = 0;
+  PyObject *ky_capi = Py_None;
+  double s = 0;
+  int nxest = 0;
+  int nyest = 0;
+  int nmax = 0;
+  double eps = 0;
+  PyObject *eps_capi = Py_None;
+  int nx = 0;
+  double *tx = NULL;
+  npy_intp tx_Dims[1] = {-1};
+  const int tx_Rank = 1;
+  PyArrayObject *capi_tx_tmp = NULL;
+  int capi_tx_intent = 0;
+  int capi_overwrite_tx = 1;
+  PyObject *tx_capi = Py_None;
+  int ny = 0;
+  double *ty = NULL;
+  npy_intp ty_Dims[1] = {-1};
+  const int ty_Rank = 1;
+  PyArrayObject *capi_ty_tmp = NULL;
+  int capi_ty_intent = 0;
+  int capi_overwrite_ty = 1;
+  PyObject *ty_capi = Py_None;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *wrk1 = NULL;
+  npy_intp wrk1_Dims[1] = {-1};
+  const int wrk1_Rank = 1;
+  PyArrayObject *capi_wrk1_tmp = NULL;
+  int capi_wrk1_intent = 0;
+  int lwrk1 = 0;
+  double *wrk2 = NULL;
+  npy_intp wrk2_Dims[1] = {-1};
+  const int wrk2_Rank = 1;
+  PyArrayObject *capi_wrk2_tmp = NULL;
+  int capi_wrk2_intent = 0;
+  int lwrk2 = 0;
+  PyObject *lwrk2_capi = Py_None;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  int kwrk = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"x","y","z","tx","ty","w","xb","xe","yb","ye","kx","ky","eps","lwrk2","overwrite_tx","overwrite_ty",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|OOOOOOOOOii:dfitpack.surfit_lsq",\
+    capi_kwlist,&x_capi,&y_capi,&z_capi,&tx_capi,&ty_capi,&w_capi,&xb_capi,&xe_capi,&yb_capi,&ye_capi,&kx_capi,&ky_capi,&eps_capi,&lwrk2_capi,&capi_overwrite_tx,&capi_overwrite_ty))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable iopt */
+  iopt = -1;
+  /* Processing variable kx */
+  if (kx_capi == Py_None) kx = 3; else
+    f2py_success = int_from_pyobj(&kx,kx_capi,"dfitpack.surfit_lsq() 6th keyword (kx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=kx && kx<=5,"1<=kx && kx<=5","6th keyword kx","surfit_lsq:kx=%d",kx) {
+  /* Processing variable tx */
+  capi_tx_intent |= (capi_overwrite_tx?0:F2PY_INTENT_COPY);
+  ;
+  capi_tx_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_tx_tmp = array_from_pyobj(NPY_DOUBLE,tx_Dims,tx_Rank,capi_tx_intent,tx_capi);
+  if (capi_tx_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `tx' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    tx = (double *)(PyArray_DATA(capi_tx_tmp));
+
+  /* Processing variable ty */
+  capi_ty_intent |= (capi_overwrite_ty?0:F2PY_INTENT_COPY);
+  ;
+  capi_ty_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_ty_tmp = array_from_pyobj(NPY_DOUBLE,ty_Dims,ty_Rank,capi_ty_intent,ty_capi);
+  if (capi_ty_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 5th argument `ty' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    ty = (double *)(PyArray_DATA(capi_ty_tmp));
+
+  /* Processing variable ier */
+  /* Processing variable eps */
+  if (eps_capi == Py_None) eps = 1e-16; else
+    f2py_success = double_from_pyobj(&eps,eps_capi,"dfitpack.surfit_lsq() 8th keyword (eps) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(0.0<eps && eps<1.0,"0.0<eps && eps<1.0","8th keyword eps","surfit_lsq:eps=%g",eps) {
+  /* Processing variable s */
+  s = 0.0;
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `x' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ky */
+  if (ky_capi == Py_None) ky = 3; else
+    f2py_success = int_from_pyobj(&ky,ky_capi,"dfitpack.surfit_lsq() 7th keyword (ky) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=ky && ky<=5,"1<=ky && ky<=5","7th keyword ky","surfit_lsq:ky=%d",ky) {
+  /* Processing variable m */
+  m = len(x);
+  CHECKSCALAR(m>=(kx+1)*(ky+1),"m>=(kx+1)*(ky+1)","hidden m","surfit_lsq:m=%d",m) {
+  /* Processing variable nx */
+  nx = len(tx);
+  CHECKSCALAR(2*kx+2<=nx,"2*kx+2<=nx","hidden nx","surfit_lsq:nx=%d",nx) {
+  /* Processing variable ny */
+  ny = len(ty);
+  CHECKSCALAR(2*ky+2<=ny,"2*ky+2<=ny","hidden ny","surfit_lsq:ny=%d",ny) {
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,w_capi);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st keyword `w' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  if (w_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("surfit_lsq: Initializing w=1.0\n");
+    if (initforcomb(PyArray_DIMS(capi_w_tmp),PyArray_NDIM(capi_w_tmp),1)) {
+      while ((_i = nextforcomb()))
+        w[capi_i++] = 1.0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(dfitpack_error,"Initialization of 1st keyword w failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  CHECKARRAY(len(w)==m,"len(w)==m","1st keyword w") {
+  /* Processing variable y */
+  y_Dims[0]=m;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `y' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)==m,"len(y)==m","2nd argument y") {
+  /* Processing variable z */
+  z_Dims[0]=m;
+  capi_z_intent |= F2PY_INTENT_IN;
+  capi_z_tmp = array_from_pyobj(NPY_DOUBLE,z_Dims,z_Rank,capi_z_intent,z_capi);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `z' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    z = (double *)(PyArray_DATA(capi_z_tmp));
+
+  CHECKARRAY(len(z)==m,"len(z)==m","3rd argument z") {
+  /* Processing variable nmax */
+  nmax = MAX(nx,ny);
+  /* Processing variable xb */
+  if (xb_capi == Py_None) xb = calc_b(x,m,tx,nx); else
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.surfit_lsq() 2nd keyword (xb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable yb */
+  if (yb_capi == Py_None) yb = calc_b(y,m,ty,ny); else
+    f2py_success = double_from_pyobj(&yb,yb_capi,"dfitpack.surfit_lsq() 4th keyword (yb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ye */
+  if (ye_capi == Py_None) ye = calc_e(y,m,ty,ny); else
+    f2py_success = double_from_pyobj(&ye,ye_capi,"dfitpack.surfit_lsq() 5th keyword (ye) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable xe */
+  if (xe_capi == Py_None) xe = calc_e(x,m,tx,nx); else
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.surfit_lsq() 3rd keyword (xe) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nxest */
+  nxest = nx;
+  /* Processing variable kwrk */
+  kwrk = m+(nx-2*kx-1)*(ny-2*ky-1);
+  /* Processing variable c */
+  c_Dims[0]=(nx-kx-1)*(ny-ky-1);
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  /* Processing variable nyest */
+  nyest = ny;
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=kwrk;
+  capi_iwrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,Py_None);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `iwrk' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+  /* Processing variable lwrk2 */
+  if (lwrk2_capi == Py_None) lwrk2 = calc_surfit_lwrk2(m,kx,ky,nxest,nyest); else
+    f2py_success = int_from_pyobj(&lwrk2,lwrk2_capi,"dfitpack.surfit_lsq() 9th keyword (lwrk2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lwrk1 */
+  lwrk1 = calc_surfit_lwrk1(m,kx,ky,nxest,nyest);
+  /* Processing variable wrk2 */
+  wrk2_Dims[0]=lwrk2;
+  capi_wrk2_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk2_tmp = array_from_pyobj(NPY_DOUBLE,wrk2_Dims,wrk2_Rank,capi_wrk2_intent,Py_None);
+  if (capi_wrk2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk2' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    wrk2 = (double *)(PyArray_DATA(capi_wrk2_tmp));
+
+  /* Processing variable wrk1 */
+  wrk1_Dims[0]=lwrk1;
+  capi_wrk1_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk1_tmp = array_from_pyobj(NPY_DOUBLE,wrk1_Dims,wrk1_Rank,capi_wrk1_intent,Py_None);
+  if (capi_wrk1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk1' of dfitpack.surfit_lsq to C/Fortran array" );
+  } else {
+    wrk1 = (double *)(PyArray_DATA(capi_wrk1_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,&m,x,y,z,w,&xb,&xe,&yb,&ye,&kx,&ky,&s,&nxest,&nyest,&nmax,&eps,&nx,tx,&ny,ty,c,&fp,wrk1,&lwrk1,wrk2,&lwrk2,iwrk,&kwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNdi",capi_tx_tmp,capi_ty_tmp,capi_c_tmp,fp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk1_tmp);
+  }  /*if (capi_wrk1_tmp == NULL) ... else of wrk1*/
+  /* End of cleaning variable wrk1 */
+    Py_XDECREF(capi_wrk2_tmp);
+  }  /*if (capi_wrk2_tmp == NULL) ... else of wrk2*/
+  /* End of cleaning variable wrk2 */
+  /* End of cleaning variable lwrk1 */
+  } /*if (f2py_success) of lwrk2*/
+  /* End of cleaning variable lwrk2 */
+    Py_XDECREF(capi_iwrk_tmp);
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+  /* End of cleaning variable nyest */
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable kwrk */
+  /* End of cleaning variable nxest */
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  } /*if (f2py_success) of ye*/
+  /* End of cleaning variable ye */
+  } /*if (f2py_success) of yb*/
+  /* End of cleaning variable yb */
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  /* End of cleaning variable nmax */
+  } /*CHECKARRAY(len(z)==m)*/
+  if((PyObject *)capi_z_tmp!=z_capi) {
+    Py_XDECREF(capi_z_tmp); }
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  } /*CHECKARRAY(len(y)==m)*/
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKARRAY(len(w)==m)*/
+  }  /*if (f2py_success) of w init*/
+  if((PyObject *)capi_w_tmp!=w_capi) {
+    Py_XDECREF(capi_w_tmp); }
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  } /*CHECKSCALAR(2*ky+2<=ny)*/
+  /* End of cleaning variable ny */
+  } /*CHECKSCALAR(2*kx+2<=nx)*/
+  /* End of cleaning variable nx */
+  } /*CHECKSCALAR(m>=(kx+1)*(ky+1))*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(1<=ky && ky<=5)*/
+  } /*if (f2py_success) of ky*/
+  /* End of cleaning variable ky */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable s */
+  } /*CHECKSCALAR(0.0<eps && eps<1.0)*/
+  } /*if (f2py_success) of eps*/
+  /* End of cleaning variable eps */
+  /* End of cleaning variable ier */
+  }  /*if (capi_ty_tmp == NULL) ... else of ty*/
+  /* End of cleaning variable ty */
+  }  /*if (capi_tx_tmp == NULL) ... else of tx*/
+  /* End of cleaning variable tx */
+  } /*CHECKSCALAR(1<=kx && kx<=5)*/
+  } /*if (f2py_success) of kx*/
+  /* End of cleaning variable kx */
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of surfit_lsq *****************************/
+
+/******************************** regrid_smth ********************************/
+static char doc_f2py_rout_dfitpack_regrid_smth[] = "\
+nx,tx,ny,ty,c,fp,ier = regrid_smth(x,y,z,[xb,xe,yb,ye,kx,ky,s])\n\nWrapper for ``regrid_smth``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (mx)\n"
+"y : input rank-1 array('d') with bounds (my)\n"
+"z : input rank-1 array('d') with bounds (mx*my)\n"
+"\nOther Parameters\n----------------\n"
+"xb : input float, optional\n    Default: dmin(x,mx)\n"
+"xe : input float, optional\n    Default: dmax(x,mx)\n"
+"yb : input float, optional\n    Default: dmin(y,my)\n"
+"ye : input float, optional\n    Default: dmax(y,my)\n"
+"kx : input int, optional\n    Default: 3\n"
+"ky : input int, optional\n    Default: 3\n"
+"s : input float, optional\n    Default: 0.0\n"
+"\nReturns\n-------\n"
+"nx : int\n"
+"tx : rank-1 array('d') with bounds (nxest)\n"
+"ny : int\n"
+"ty : rank-1 array('d') with bounds (nyest)\n"
+"c : rank-1 array('d') with bounds ((nxest-kx-1)*(nyest-ky-1))\n"
+"fp : float\n"
+"ier : int";
+/* extern void F_FUNC(regrid ,REGRID )(int*,int*,double*,int*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_regrid_smth(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,int*,double*,double*,double*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int iopt = 0;
+  int mx = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int my = 0;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *z = NULL;
+  npy_intp z_Dims[1] = {-1};
+  const int z_Rank = 1;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  PyObject *z_capi = Py_None;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  double yb = 0;
+  PyObject *yb_capi = Py_None;
+  double ye = 0;
+  PyObject *ye_capi = Py_None;
+  int kx = 0;
+  PyObject *kx_capi = Py_None;
+  int ky = 0;
+  PyObject *ky_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nxest = 0;
+  int nyest = 0;
+  int nx = 0;
+  double *tx = NULL;
+  npy_intp tx_Dims[1] = {-1};
+  const int tx_Rank = 1;
+  PyArrayObject *capi_tx_tmp = NULL;
+  int capi_tx_intent = 0;
+  int ny = 0;
+  double *ty = NULL;
+  npy_intp ty_Dims[1] = {-1};
+  const int ty_Rank = 1;
+  PyArrayObject *capi_ty_tmp = NULL;
+  int capi_ty_intent = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int lwrk = 0;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  int kwrk = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"x","y","z","xb","xe","yb","ye","kx","ky","s",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOO:dfitpack.regrid_smth",\
+    capi_kwlist,&x_capi,&y_capi,&z_capi,&xb_capi,&xe_capi,&yb_capi,&ye_capi,&kx_capi,&ky_capi,&s_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable iopt */
+  iopt = 0;
+  /* Processing variable kx */
+  if (kx_capi == Py_None) kx = 3; else
+    f2py_success = int_from_pyobj(&kx,kx_capi,"dfitpack.regrid_smth() 5th keyword (kx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=kx && kx<=5,"1<=kx && kx<=5","5th keyword kx","regrid_smth:kx=%d",kx) {
+  /* Processing variable ier */
+  /* Processing variable nx */
+  /* Processing variable ny */
+  /* Processing variable s */
+  if (s_capi == Py_None) s = 0.0; else
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.regrid_smth() 7th keyword (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(0.0<=s,"0.0<=s","7th keyword s","regrid_smth:s=%g",s) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `y' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `x' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ky */
+  if (ky_capi == Py_None) ky = 3; else
+    f2py_success = int_from_pyobj(&ky,ky_capi,"dfitpack.regrid_smth() 6th keyword (ky) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=ky && ky<=5,"1<=ky && ky<=5","6th keyword ky","regrid_smth:ky=%d",ky) {
+  /* Processing variable my */
+  my = len(y);
+  CHECKSCALAR(my>ky,"my>ky","hidden my","regrid_smth:my=%d",my) {
+  /* Processing variable mx */
+  mx = len(x);
+  CHECKSCALAR(mx>kx,"mx>kx","hidden mx","regrid_smth:mx=%d",mx) {
+  /* Processing variable xb */
+  if (xb_capi == Py_None) xb = dmin(x,mx); else
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.regrid_smth() 1st keyword (xb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable yb */
+  if (yb_capi == Py_None) yb = dmin(y,my); else
+    f2py_success = double_from_pyobj(&yb,yb_capi,"dfitpack.regrid_smth() 3rd keyword (yb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ye */
+  if (ye_capi == Py_None) ye = dmax(y,my); else
+    f2py_success = double_from_pyobj(&ye,ye_capi,"dfitpack.regrid_smth() 4th keyword (ye) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable xe */
+  if (xe_capi == Py_None) xe = dmax(x,mx); else
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.regrid_smth() 2nd keyword (xe) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nxest */
+  nxest = mx+kx+1;
+  CHECKSCALAR(nxest>=2*(kx+1),"nxest>=2*(kx+1)","hidden nxest","regrid_smth:nxest=%d",nxest) {
+  /* Processing variable nyest */
+  nyest = my+ky+1;
+  CHECKSCALAR(nyest>=2*(ky+1),"nyest>=2*(ky+1)","hidden nyest","regrid_smth:nyest=%d",nyest) {
+  /* Processing variable tx */
+  tx_Dims[0]=nxest;
+  capi_tx_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tx_tmp = array_from_pyobj(NPY_DOUBLE,tx_Dims,tx_Rank,capi_tx_intent,Py_None);
+  if (capi_tx_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `tx' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    tx = (double *)(PyArray_DATA(capi_tx_tmp));
+
+  /* Processing variable ty */
+  ty_Dims[0]=nyest;
+  capi_ty_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_ty_tmp = array_from_pyobj(NPY_DOUBLE,ty_Dims,ty_Rank,capi_ty_intent,Py_None);
+  if (capi_ty_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `ty' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    ty = (double *)(PyArray_DATA(capi_ty_tmp));
+
+  /* Processing variable lwrk */
+  lwrk = calc_regrid_lwrk(mx,my,kx,ky,nxest,nyest);
+  /* Processing variable z */
+  z_Dims[0]=mx*my;
+  capi_z_intent |= F2PY_INTENT_IN;
+  capi_z_tmp = array_from_pyobj(NPY_DOUBLE,z_Dims,z_Rank,capi_z_intent,z_capi);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `z' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    z = (double *)(PyArray_DATA(capi_z_tmp));
+
+  CHECKARRAY(len(z)==mx*my,"len(z)==mx*my","3rd argument z") {
+  /* Processing variable kwrk */
+  kwrk = 3+mx+my+nxest+nyest;
+  /* Processing variable c */
+  c_Dims[0]=(nxest-kx-1)*(nyest-ky-1);
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  /* Processing variable wrk */
+  wrk_Dims[0]=lwrk;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=kwrk;
+  capi_iwrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,Py_None);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `iwrk' of dfitpack.regrid_smth to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iopt,&mx,x,&my,y,z,&xb,&xe,&yb,&ye,&kx,&ky,&s,&nxest,&nyest,&nx,tx,&ny,ty,c,&fp,wrk,&lwrk,iwrk,&kwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("iNiNNdi",nx,capi_tx_tmp,ny,capi_ty_tmp,capi_c_tmp,fp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwrk_tmp);
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable kwrk */
+  } /*CHECKARRAY(len(z)==mx*my)*/
+  if((PyObject *)capi_z_tmp!=z_capi) {
+    Py_XDECREF(capi_z_tmp); }
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  /* End of cleaning variable lwrk */
+  }  /*if (capi_ty_tmp == NULL) ... else of ty*/
+  /* End of cleaning variable ty */
+  }  /*if (capi_tx_tmp == NULL) ... else of tx*/
+  /* End of cleaning variable tx */
+  } /*CHECKSCALAR(nyest>=2*(ky+1))*/
+  /* End of cleaning variable nyest */
+  } /*CHECKSCALAR(nxest>=2*(kx+1))*/
+  /* End of cleaning variable nxest */
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  } /*if (f2py_success) of ye*/
+  /* End of cleaning variable ye */
+  } /*if (f2py_success) of yb*/
+  /* End of cleaning variable yb */
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  } /*CHECKSCALAR(mx>kx)*/
+  /* End of cleaning variable mx */
+  } /*CHECKSCALAR(my>ky)*/
+  /* End of cleaning variable my */
+  } /*CHECKSCALAR(1<=ky && ky<=5)*/
+  } /*if (f2py_success) of ky*/
+  /* End of cleaning variable ky */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(0.0<=s)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable ny */
+  /* End of cleaning variable nx */
+  /* End of cleaning variable ier */
+  } /*CHECKSCALAR(1<=kx && kx<=5)*/
+  } /*if (f2py_success) of kx*/
+  /* End of cleaning variable kx */
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of regrid_smth *****************************/
+
+/***************************** regrid_smth_spher *****************************/
+static char doc_f2py_rout_dfitpack_regrid_smth_spher[] = "\
+nu,tu,nv,tv,c,fp,ier = regrid_smth_spher(iopt,ider,u,v,r,[r0,r1,s])\n\nWrapper for ``regrid_smth_spher``.\
+\n\nParameters\n----------\n"
+"iopt : input rank-1 array('i') with bounds (3)\n"
+"ider : input rank-1 array('i') with bounds (4)\n"
+"u : input rank-1 array('d') with bounds (mu)\n"
+"v : input rank-1 array('d') with bounds (mv)\n"
+"r : input rank-1 array('d') with bounds (mu*mv)\n"
+"\nOther Parameters\n----------------\n"
+"r0 : input float\n"
+"r1 : input float\n"
+"s : input float, optional\n    Default: 0.0\n"
+"\nReturns\n-------\n"
+"nu : int\n"
+"tu : rank-1 array('d') with bounds (nuest)\n"
+"nv : int\n"
+"tv : rank-1 array('d') with bounds (nvest)\n"
+"c : rank-1 array('d') with bounds ((nuest-4)*(nvest-4))\n"
+"fp : float\n"
+"ier : int";
+/* extern void F_FUNC(spgrid ,SPGRID )(int*,int*,int*,double*,int*,double*,double*,double*,double*,double*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,int*,int*,int*); */
+static PyObject *f2py_rout_dfitpack_regrid_smth_spher(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,double*,int*,double*,double*,double*,double*,double*,int*,int*,int*,double*,int*,double*,double*,double*,double*,int*,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int *iopt = NULL;
+  npy_intp iopt_Dims[1] = {-1};
+  const int iopt_Rank = 1;
+  PyArrayObject *capi_iopt_tmp = NULL;
+  int capi_iopt_intent = 0;
+  PyObject *iopt_capi = Py_None;
+  int *ider = NULL;
+  npy_intp ider_Dims[1] = {-1};
+  const int ider_Rank = 1;
+  PyArrayObject *capi_ider_tmp = NULL;
+  int capi_ider_intent = 0;
+  PyObject *ider_capi = Py_None;
+  int mu = 0;
+  double *u = NULL;
+  npy_intp u_Dims[1] = {-1};
+  const int u_Rank = 1;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  PyObject *u_capi = Py_None;
+  int mv = 0;
+  double *v = NULL;
+  npy_intp v_Dims[1] = {-1};
+  const int v_Rank = 1;
+  PyArrayObject *capi_v_tmp = NULL;
+  int capi_v_intent = 0;
+  PyObject *v_capi = Py_None;
+  double *r = NULL;
+  npy_intp r_Dims[1] = {-1};
+  const int r_Rank = 1;
+  PyArrayObject *capi_r_tmp = NULL;
+  int capi_r_intent = 0;
+  PyObject *r_capi = Py_None;
+  double r0 = 0;
+  PyObject *r0_capi = Py_None;
+  double r1 = 0;
+  PyObject *r1_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  int nuest = 0;
+  int nvest = 0;
+  int nu = 0;
+  double *tu = NULL;
+  npy_intp tu_Dims[1] = {-1};
+  const int tu_Rank = 1;
+  PyArrayObject *capi_tu_tmp = NULL;
+  int capi_tu_intent = 0;
+  int nv = 0;
+  double *tv = NULL;
+  npy_intp tv_Dims[1] = {-1};
+  const int tv_Rank = 1;
+  PyArrayObject *capi_tv_tmp = NULL;
+  int capi_tv_intent = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  double fp = 0;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  int lwrk = 0;
+  int *iwrk = NULL;
+  npy_intp iwrk_Dims[1] = {-1};
+  const int iwrk_Rank = 1;
+  PyArrayObject *capi_iwrk_tmp = NULL;
+  int capi_iwrk_intent = 0;
+  int kwrk = 0;
+  int ier = 0;
+  static char *capi_kwlist[] = {"iopt","ider","u","v","r","r0","r1","s",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|OOO:dfitpack.regrid_smth_spher",\
+    capi_kwlist,&iopt_capi,&ider_capi,&u_capi,&v_capi,&r_capi,&r0_capi,&r1_capi,&s_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable fp */
+  /* Processing variable iopt */
+  iopt_Dims[0]=3;
+  capi_iopt_intent |= F2PY_INTENT_IN;
+  capi_iopt_tmp = array_from_pyobj(NPY_INT,iopt_Dims,iopt_Rank,capi_iopt_intent,iopt_capi);
+  if (capi_iopt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `iopt' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    iopt = (int *)(PyArray_DATA(capi_iopt_tmp));
+
+  /* Processing variable ider */
+  ider_Dims[0]=4;
+  capi_ider_intent |= F2PY_INTENT_IN;
+  capi_ider_tmp = array_from_pyobj(NPY_INT,ider_Dims,ider_Rank,capi_ider_intent,ider_capi);
+  if (capi_ider_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `ider' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    ider = (int *)(PyArray_DATA(capi_ider_tmp));
+
+  /* Processing variable r0 */
+  if (r0_capi != Py_None)
+    f2py_success = double_from_pyobj(&r0,r0_capi,"dfitpack.regrid_smth_spher() 1st keyword (r0) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable r1 */
+  if (r1_capi != Py_None)
+    f2py_success = double_from_pyobj(&r1,r1_capi,"dfitpack.regrid_smth_spher() 2nd keyword (r1) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ier */
+  /* Processing variable s */
+  if (s_capi == Py_None) s = 0.0; else
+    f2py_success = double_from_pyobj(&s,s_capi,"dfitpack.regrid_smth_spher() 3rd keyword (s) can't be converted to double");
+  if (f2py_success) {
+  CHECKSCALAR(0.0<=s,"0.0<=s","3rd keyword s","regrid_smth_spher:s=%g",s) {
+  /* Processing variable u */
+  ;
+  capi_u_intent |= F2PY_INTENT_IN;
+  capi_u_tmp = array_from_pyobj(NPY_DOUBLE,u_Dims,u_Rank,capi_u_intent,u_capi);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `u' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    u = (double *)(PyArray_DATA(capi_u_tmp));
+
+  /* Processing variable v */
+  ;
+  capi_v_intent |= F2PY_INTENT_IN;
+  capi_v_tmp = array_from_pyobj(NPY_DOUBLE,v_Dims,v_Rank,capi_v_intent,v_capi);
+  if (capi_v_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 4th argument `v' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    v = (double *)(PyArray_DATA(capi_v_tmp));
+
+  /* Processing variable nu */
+  /* Processing variable nv */
+  /* Processing variable mv */
+  mv = len(v);
+  /* Processing variable mu */
+  mu = len(u);
+  /* Processing variable nvest */
+  nvest = mv+7;
+  CHECKSCALAR(nvest>=8,"nvest>=8","hidden nvest","regrid_smth_spher:nvest=%d",nvest) {
+  /* Processing variable r */
+  r_Dims[0]=mu*mv;
+  capi_r_intent |= F2PY_INTENT_IN;
+  capi_r_tmp = array_from_pyobj(NPY_DOUBLE,r_Dims,r_Rank,capi_r_intent,r_capi);
+  if (capi_r_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 5th argument `r' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    r = (double *)(PyArray_DATA(capi_r_tmp));
+
+  CHECKARRAY(len(r)==mu*mv,"len(r)==mu*mv","5th argument r") {
+  /* Processing variable nuest */
+  nuest = mu+6;
+  CHECKSCALAR(nuest>=8,"nuest>=8","hidden nuest","regrid_smth_spher:nuest=%d",nuest) {
+  /* Processing variable tu */
+  tu_Dims[0]=nuest;
+  capi_tu_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tu_tmp = array_from_pyobj(NPY_DOUBLE,tu_Dims,tu_Rank,capi_tu_intent,Py_None);
+  if (capi_tu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `tu' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    tu = (double *)(PyArray_DATA(capi_tu_tmp));
+
+  /* Processing variable kwrk */
+  kwrk = 5+mu+mv+nuest+nvest;
+  /* Processing variable c */
+  c_Dims[0]=(nuest-4)*(nvest-4);
+  capi_c_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,Py_None);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `c' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  /* Processing variable tv */
+  tv_Dims[0]=nvest;
+  capi_tv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tv_tmp = array_from_pyobj(NPY_DOUBLE,tv_Dims,tv_Rank,capi_tv_intent,Py_None);
+  if (capi_tv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `tv' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    tv = (double *)(PyArray_DATA(capi_tv_tmp));
+
+  /* Processing variable lwrk */
+  lwrk = 12+nuest*(mv+nvest+3)+nvest*24+4*mu+8*mv+max(mv+nvest,nuest);
+  /* Processing variable iwrk */
+  iwrk_Dims[0]=kwrk;
+  capi_iwrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwrk_tmp = array_from_pyobj(NPY_INT,iwrk_Dims,iwrk_Rank,capi_iwrk_intent,Py_None);
+  if (capi_iwrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `iwrk' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    iwrk = (int *)(PyArray_DATA(capi_iwrk_tmp));
+
+  /* Processing variable wrk */
+  wrk_Dims[0]=lwrk;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.regrid_smth_spher to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(iopt,ider,&mu,u,&mv,v,r,&r0,&r1,&s,&nuest,&nvest,&nu,tu,&nv,tv,c,&fp,wrk,&lwrk,iwrk,&kwrk,&ier);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("iNiNNdi",nu,capi_tu_tmp,nv,capi_tv_tmp,capi_c_tmp,fp,ier);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+    Py_XDECREF(capi_iwrk_tmp);
+  }  /*if (capi_iwrk_tmp == NULL) ... else of iwrk*/
+  /* End of cleaning variable iwrk */
+  /* End of cleaning variable lwrk */
+  }  /*if (capi_tv_tmp == NULL) ... else of tv*/
+  /* End of cleaning variable tv */
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable kwrk */
+  }  /*if (capi_tu_tmp == NULL) ... else of tu*/
+  /* End of cleaning variable tu */
+  } /*CHECKSCALAR(nuest>=8)*/
+  /* End of cleaning variable nuest */
+  } /*CHECKARRAY(len(r)==mu*mv)*/
+  if((PyObject *)capi_r_tmp!=r_capi) {
+    Py_XDECREF(capi_r_tmp); }
+  }  /*if (capi_r_tmp == NULL) ... else of r*/
+  /* End of cleaning variable r */
+  } /*CHECKSCALAR(nvest>=8)*/
+  /* End of cleaning variable nvest */
+  /* End of cleaning variable mu */
+  /* End of cleaning variable mv */
+  /* End of cleaning variable nv */
+  /* End of cleaning variable nu */
+  if((PyObject *)capi_v_tmp!=v_capi) {
+    Py_XDECREF(capi_v_tmp); }
+  }  /*if (capi_v_tmp == NULL) ... else of v*/
+  /* End of cleaning variable v */
+  if((PyObject *)capi_u_tmp!=u_capi) {
+    Py_XDECREF(capi_u_tmp); }
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+  } /*CHECKSCALAR(0.0<=s)*/
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable ier */
+  } /*if (f2py_success) of r1*/
+  /* End of cleaning variable r1 */
+  } /*if (f2py_success) of r0*/
+  /* End of cleaning variable r0 */
+  if((PyObject *)capi_ider_tmp!=ider_capi) {
+    Py_XDECREF(capi_ider_tmp); }
+  }  /*if (capi_ider_tmp == NULL) ... else of ider*/
+  /* End of cleaning variable ider */
+  if((PyObject *)capi_iopt_tmp!=iopt_capi) {
+    Py_XDECREF(capi_iopt_tmp); }
+  }  /*if (capi_iopt_tmp == NULL) ... else of iopt*/
+  /* End of cleaning variable iopt */
+  /* End of cleaning variable fp */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************** end of regrid_smth_spher **************************/
+
+/*********************************** dblint ***********************************/
+static char doc_f2py_rout_dfitpack_dblint[] = "\
+dblint = dblint(tx,ty,c,kx,ky,xb,xe,yb,ye)\n\nWrapper for ``dblint``.\
+\n\nParameters\n----------\n"
+"tx : input rank-1 array('d') with bounds (nx)\n"
+"ty : input rank-1 array('d') with bounds (ny)\n"
+"c : input rank-1 array('d') with bounds ((nx-kx-1)*(ny-ky-1))\n"
+"kx : input int\n"
+"ky : input int\n"
+"xb : input float\n"
+"xe : input float\n"
+"yb : input float\n"
+"ye : input float\n"
+"\nReturns\n-------\n"
+"dblint : float";
+/* extern void F_WRAPPEDFUNC(dblint,DBLINT)(double*,double*,int*,double*,int*,double*,int*,int*,double*,double*,double*,double*,double*); */
+static PyObject *f2py_rout_dfitpack_dblint(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,double*,int*,double*,int*,int*,double*,double*,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double dblint = 0;
+  double *tx = NULL;
+  npy_intp tx_Dims[1] = {-1};
+  const int tx_Rank = 1;
+  PyArrayObject *capi_tx_tmp = NULL;
+  int capi_tx_intent = 0;
+  PyObject *tx_capi = Py_None;
+  int nx = 0;
+  double *ty = NULL;
+  npy_intp ty_Dims[1] = {-1};
+  const int ty_Rank = 1;
+  PyArrayObject *capi_ty_tmp = NULL;
+  int capi_ty_intent = 0;
+  PyObject *ty_capi = Py_None;
+  int ny = 0;
+  double *c = NULL;
+  npy_intp c_Dims[1] = {-1};
+  const int c_Rank = 1;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  int kx = 0;
+  PyObject *kx_capi = Py_None;
+  int ky = 0;
+  PyObject *ky_capi = Py_None;
+  double xb = 0;
+  PyObject *xb_capi = Py_None;
+  double xe = 0;
+  PyObject *xe_capi = Py_None;
+  double yb = 0;
+  PyObject *yb_capi = Py_None;
+  double ye = 0;
+  PyObject *ye_capi = Py_None;
+  double *wrk = NULL;
+  npy_intp wrk_Dims[1] = {-1};
+  const int wrk_Rank = 1;
+  PyArrayObject *capi_wrk_tmp = NULL;
+  int capi_wrk_intent = 0;
+  static char *capi_kwlist[] = {"tx","ty","c","kx","ky","xb","xe","yb","ye",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:dfitpack.dblint",\
+    capi_kwlist,&tx_capi,&ty_capi,&c_capi,&kx_capi,&ky_capi,&xb_capi,&xe_capi,&yb_capi,&ye_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable kx */
+    f2py_success = int_from_pyobj(&kx,kx_capi,"dfitpack.dblint() 4th argument (kx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable tx */
+  ;
+  capi_tx_intent |= F2PY_INTENT_IN;
+  capi_tx_tmp = array_from_pyobj(NPY_DOUBLE,tx_Dims,tx_Rank,capi_tx_intent,tx_capi);
+  if (capi_tx_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 1st argument `tx' of dfitpack.dblint to C/Fortran array" );
+  } else {
+    tx = (double *)(PyArray_DATA(capi_tx_tmp));
+
+  /* Processing variable ty */
+  ;
+  capi_ty_intent |= F2PY_INTENT_IN;
+  capi_ty_tmp = array_from_pyobj(NPY_DOUBLE,ty_Dims,ty_Rank,capi_ty_intent,ty_capi);
+  if (capi_ty_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 2nd argument `ty' of dfitpack.dblint to C/Fortran array" );
+  } else {
+    ty = (double *)(PyArray_DATA(capi_ty_tmp));
+
+  /* Processing variable xb */
+    f2py_success = double_from_pyobj(&xb,xb_capi,"dfitpack.dblint() 6th argument (xb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable yb */
+    f2py_success = double_from_pyobj(&yb,yb_capi,"dfitpack.dblint() 8th argument (yb) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ye */
+    f2py_success = double_from_pyobj(&ye,ye_capi,"dfitpack.dblint() 9th argument (ye) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable xe */
+    f2py_success = double_from_pyobj(&xe,xe_capi,"dfitpack.dblint() 7th argument (xe) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ky */
+    f2py_success = int_from_pyobj(&ky,ky_capi,"dfitpack.dblint() 5th argument (ky) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable dblint */
+  /* Processing variable nx */
+  nx = len(tx);
+  /* Processing variable ny */
+  ny = len(ty);
+  /* Processing variable c */
+  c_Dims[0]=(nx-kx-1)*(ny-ky-1);
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting 3rd argument `c' of dfitpack.dblint to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(len(c)==(nx-kx-1)*(ny-ky-1),"len(c)==(nx-kx-1)*(ny-ky-1)","3rd argument c") {
+  /* Processing variable wrk */
+  wrk_Dims[0]=nx+ny-kx-ky-2;
+  capi_wrk_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_wrk_tmp = array_from_pyobj(NPY_DOUBLE,wrk_Dims,wrk_Rank,capi_wrk_intent,Py_None);
+  if (capi_wrk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(dfitpack_error,"failed in converting hidden `wrk' of dfitpack.dblint to C/Fortran array" );
+  } else {
+    wrk = (double *)(PyArray_DATA(capi_wrk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&dblint,tx,&nx,ty,&ny,c,&kx,&ky,&xb,&xe,&yb,&ye,wrk);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",dblint);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_wrk_tmp);
+  }  /*if (capi_wrk_tmp == NULL) ... else of wrk*/
+  /* End of cleaning variable wrk */
+  } /*CHECKARRAY(len(c)==(nx-kx-1)*(ny-ky-1))*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  /* End of cleaning variable ny */
+  /* End of cleaning variable nx */
+  /* End of cleaning variable dblint */
+  } /*if (f2py_success) of ky*/
+  /* End of cleaning variable ky */
+  } /*if (f2py_success) of xe*/
+  /* End of cleaning variable xe */
+  } /*if (f2py_success) of ye*/
+  /* End of cleaning variable ye */
+  } /*if (f2py_success) of yb*/
+  /* End of cleaning variable yb */
+  } /*if (f2py_success) of xb*/
+  /* End of cleaning variable xb */
+  if((PyObject *)capi_ty_tmp!=ty_capi) {
+    Py_XDECREF(capi_ty_tmp); }
+  }  /*if (capi_ty_tmp == NULL) ... else of ty*/
+  /* End of cleaning variable ty */
+  if((PyObject *)capi_tx_tmp!=tx_capi) {
+    Py_XDECREF(capi_tx_tmp); }
+  }  /*if (capi_tx_tmp == NULL) ... else of tx*/
+  /* End of cleaning variable tx */
+  } /*if (f2py_success) of kx*/
+  /* End of cleaning variable kx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dblint *******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"splev",-1,{{-1}},0,(char *)F_FUNC(splev,SPLEV),(f2py_init_func)f2py_rout_dfitpack_splev,doc_f2py_rout_dfitpack_splev},
+  {"splder",-1,{{-1}},0,(char *)F_FUNC(splder,SPLDER),(f2py_init_func)f2py_rout_dfitpack_splder,doc_f2py_rout_dfitpack_splder},
+  {"splint",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(splint,SPLINT),(f2py_init_func)f2py_rout_dfitpack_splint,doc_f2py_rout_dfitpack_splint},
+  {"sproot",-1,{{-1}},0,(char *)F_FUNC(sproot,SPROOT),(f2py_init_func)f2py_rout_dfitpack_sproot,doc_f2py_rout_dfitpack_sproot},
+  {"spalde",-1,{{-1}},0,(char *)F_FUNC(spalde,SPALDE),(f2py_init_func)f2py_rout_dfitpack_spalde,doc_f2py_rout_dfitpack_spalde},
+  {"curfit",-1,{{-1}},0,(char *)F_FUNC(curfit,CURFIT),(f2py_init_func)f2py_rout_dfitpack_curfit,doc_f2py_rout_dfitpack_curfit},
+  {"percur",-1,{{-1}},0,(char *)F_FUNC(percur,PERCUR),(f2py_init_func)f2py_rout_dfitpack_percur,doc_f2py_rout_dfitpack_percur},
+  {"parcur",-1,{{-1}},0,(char *)F_FUNC(parcur,PARCUR),(f2py_init_func)f2py_rout_dfitpack_parcur,doc_f2py_rout_dfitpack_parcur},
+  {"fpcurf0",-1,{{-1}},0,(char *)F_FUNC(fpcurf ,FPCURF ),(f2py_init_func)f2py_rout_dfitpack_fpcurf0,doc_f2py_rout_dfitpack_fpcurf0},
+  {"fpcurf1",-1,{{-1}},0,(char *)F_FUNC(fpcurf ,FPCURF ),(f2py_init_func)f2py_rout_dfitpack_fpcurf1,doc_f2py_rout_dfitpack_fpcurf1},
+  {"fpcurfm1",-1,{{-1}},0,(char *)F_FUNC(fpcurf ,FPCURF ),(f2py_init_func)f2py_rout_dfitpack_fpcurfm1,doc_f2py_rout_dfitpack_fpcurfm1},
+  {"bispev",-1,{{-1}},0,(char *)F_FUNC(bispev,BISPEV),(f2py_init_func)f2py_rout_dfitpack_bispev,doc_f2py_rout_dfitpack_bispev},
+  {"bispeu",-1,{{-1}},0,(char *)F_FUNC(bispeu,BISPEU),(f2py_init_func)f2py_rout_dfitpack_bispeu,doc_f2py_rout_dfitpack_bispeu},
+  {"surfit_smth",-1,{{-1}},0,(char *)F_FUNC(surfit ,SURFIT ),(f2py_init_func)f2py_rout_dfitpack_surfit_smth,doc_f2py_rout_dfitpack_surfit_smth},
+  {"surfit_lsq",-1,{{-1}},0,(char *)F_FUNC(surfit ,SURFIT ),(f2py_init_func)f2py_rout_dfitpack_surfit_lsq,doc_f2py_rout_dfitpack_surfit_lsq},
+  {"regrid_smth",-1,{{-1}},0,(char *)F_FUNC(regrid ,REGRID ),(f2py_init_func)f2py_rout_dfitpack_regrid_smth,doc_f2py_rout_dfitpack_regrid_smth},
+  {"regrid_smth_spher",-1,{{-1}},0,(char *)F_FUNC(spgrid ,SPGRID ),(f2py_init_func)f2py_rout_dfitpack_regrid_smth_spher,doc_f2py_rout_dfitpack_regrid_smth_spher},
+  {"dblint",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(dblint,DBLINT),(f2py_init_func)f2py_rout_dfitpack_dblint,doc_f2py_rout_dfitpack_dblint},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "dfitpack",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_dfitpack(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initdfitpack(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = dfitpack_module = PyModule_Create(&moduledef);
+#else
+  m = dfitpack_module = Py_InitModule("dfitpack", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module dfitpack (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'dfitpack' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  y = splev(t,c,k,x,e=0)\n"
+"  y = splder(t,c,k,x,nu=1,e=0)\n"
+"  splint = splint(t,c,k,a,b)\n"
+"  zero,m,ier = sproot(t,c,mest=3*(n-7))\n"
+"  d,ier = spalde(t,c,k,x)\n"
+"  n,c,fp,ier = curfit(iopt,x,y,w,t,wrk,iwrk,xb=x[0],xe=x[m-1],k=3,s=0.0)\n"
+"  n,c,fp,ier = percur(iopt,x,y,w,t,wrk,iwrk,k=3,s=0.0)\n"
+"  n,c,fp,ier = parcur(iopt,ipar,idim,u,x,w,ub,ue,t,wrk,iwrk,k=3.0,s=0.0)\n"
+"  x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier = fpcurf0(x,y,k,w=1.0,xb=x[0],xe=x[m-1],s=m,nest=(s==0.0?m+k+1:MAX(m/2,2*k1)))\n"
+"  x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier = fpcurf1(x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier,overwrite_x=1,overwrite_y=1,overwrite_w=1,overwrite_t=1,overwrite_c=1,overwrite_fpint=1,overwrite_nrdata=1)\n"
+"  x,y,w,xb,xe,k,s,n,t,c,fp,fpint,nrdata,ier = fpcurfm1(x,y,k,t,w=1.0,xb=x[0],xe=x[m-1],overwrite_t=1)\n"
+"  z,ier = bispev(tx,ty,c,kx,ky,x,y)\n"
+"  z,ier = bispeu(tx,ty,c,kx,ky,x,y)\n"
+"  nx,tx,ny,ty,c,fp,wrk1,ier = surfit_smth(x,y,z,w=1.0,xb=dmin(x,m),xe=dmax(x,m),yb=dmin(y,m),ye=dmax(y,m),kx=3,ky=3,s=m,nxest=imax(kx+1+sqrt(m/2),2*(kx+1)),nyest=imax(ky+1+sqrt(m/2),2*(ky+1)),eps=1e-16,lwrk2=calc_surfit_lwrk2(m,kx,ky,nxest,nyest))\n"
+"  tx,ty,c,fp,ier = surfit_lsq(x,y,z,tx,ty,w=1.0,xb=calc_b(x,m,tx,nx),xe=calc_e(x,m,tx,nx),yb=calc_b(y,m,ty,ny),ye=calc_e(y,m,ty,ny),kx=3,ky=3,eps=1e-16,lwrk2=calc_surfit_lwrk2(m,kx,ky,nxest,nyest),overwrite_tx=1,overwrite_ty=1)\n"
+"  nx,tx,ny,ty,c,fp,ier = regrid_smth(x,y,z,xb=dmin(x,mx),xe=dmax(x,mx),yb=dmin(y,my),ye=dmax(y,my),kx=3,ky=3,s=0.0)\n"
+"  nu,tu,nv,tv,c,fp,ier = regrid_smth_spher(iopt,ider,u,v,r,r0=,r1=,s=0.0)\n"
+"  dblint = dblint(tx,ty,c,kx,ky,xb,xe,yb,ye)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  dfitpack_error = PyErr_NewException ("dfitpack.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+    {
+      extern double F_FUNC(splint,SPLINT)(void);
+      PyObject* o = PyDict_GetItemString(d,"splint");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(splint,SPLINT),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("splint"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("splint"));
+#endif
+    }
+    
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+    {
+      extern double F_FUNC(dblint,DBLINT)(void);
+      PyObject* o = PyDict_GetItemString(d,"dblint");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(dblint,DBLINT),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("dblint"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("dblint"));
+#endif
+    }
+    
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"dfitpack");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,12086 @@
+/* File: fblasmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 22:52:11 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include <stdarg.h>
+#include "Python.h"
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *fblas_error;
+static PyObject *fblas_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {double r,i;} complex_double;
+typedef struct {float r,i;} complex_float;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define pyobj_from_complex_float1(v) (PyComplex_FromDoubles(v.r,v.i))
+#define pyobj_from_complex_double1(v) (PyComplex_FromDoubles(v.r,v.i))
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(fblas_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) _F2PYWRAP##F
+#else
+#define F_WRAPPEDFUNC(f,F) _f2pywrap##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) _F2PYWRAP##F##_
+#else
+#define F_WRAPPEDFUNC(f,F) _f2pywrap##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) F2PYWRAP##F
+#else
+#define F_WRAPPEDFUNC(f,F) f2pywrap##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) F2PYWRAP##F##_
+#else
+#define F_WRAPPEDFUNC(f,F) f2pywrap##f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_WRAPPEDFUNC_US(f,F) F_WRAPPEDFUNC(f##_,F##_)
+#else
+#define F_WRAPPEDFUNC_US(f,F) F_WRAPPEDFUNC(f,F)
+#endif
+
+#define CHECKARRAY(check,tcheck,name) \
+    if (!(check)) {\
+        PyErr_SetString(fblas_error,"("tcheck") failed for "name);\
+        /*goto capi_fail;*/\
+    } else 
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int complex_double_from_pyobj(complex_double* v,PyObject *obj,const char *errmess) {
+    Py_complex c;
+    if (PyComplex_Check(obj)) {
+        c=PyComplex_AsCComplex(obj);
+        (*v).r=c.real, (*v).i=c.imag;
+        return 1;
+    }
+    if (PyArray_IsScalar(obj, ComplexFloating)) {
+        if (PyArray_IsScalar(obj, CFloat)) {
+            npy_cfloat new;
+            PyArray_ScalarAsCtype(obj, &new);
+            (*v).r = (double)new.real;
+            (*v).i = (double)new.imag;
+        }
+        else if (PyArray_IsScalar(obj, CLongDouble)) {
+            npy_clongdouble new;
+            PyArray_ScalarAsCtype(obj, &new);
+            (*v).r = (double)new.real;
+            (*v).i = (double)new.imag;
+        }
+        else { /* if (PyArray_IsScalar(obj, CDouble)) */
+            PyArray_ScalarAsCtype(obj, v);
+        }
+        return 1;
+    }
+    if (PyArray_CheckScalar(obj)) { /* 0-dim array or still array scalar */
+        PyObject *arr;
+        if (PyArray_Check(obj)) {
+            arr = PyArray_Cast((PyArrayObject *)obj, NPY_CDOUBLE);
+        }
+        else {
+            arr = PyArray_FromScalar(obj, PyArray_DescrFromType(NPY_CDOUBLE));
+        }
+        if (arr==NULL) return 0;
+        (*v).r = ((npy_cdouble *)PyArray_DATA(arr))->real;
+        (*v).i = ((npy_cdouble *)PyArray_DATA(arr))->imag;
+        return 1;
+    }
+    /* Python does not provide PyNumber_Complex function :-( */
+    (*v).i=0.0;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        (*v).r = PyFloat_AsDouble(obj);
+#else
+        (*v).r = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    if (PyInt_Check(obj)) {
+        (*v).r = (double)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    if (PyLong_Check(obj)) {
+        (*v).r = PyLong_AsDouble(obj);
+        return (!PyErr_Occurred());
+    }
+    if (PySequence_Check(obj) && !(PyString_Check(obj) || PyUnicode_Check(obj))) {
+        PyObject *tmp = PySequence_GetItem(obj,0);
+        if (tmp) {
+            if (complex_double_from_pyobj(v,tmp,errmess)) {
+                Py_DECREF(tmp);
+                return 1;
+            }
+            Py_DECREF(tmp);
+        }
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL)
+            err = PyExc_TypeError;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = fblas_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int float_from_pyobj(float* v,PyObject *obj,const char *errmess) {
+    double d=0.0;
+    if (double_from_pyobj(&d,obj,errmess)) {
+        *v = (float)d;
+        return 1;
+    }
+    return 0;
+}
+
+static int complex_float_from_pyobj(complex_float* v,PyObject *obj,const char *errmess) {
+    complex_double cd={0.0,0.0};
+    if (complex_double_from_pyobj(&cd,obj,errmess)) {
+        (*v).r = (float)cd.r;
+        (*v).i = (float)cd.i;
+        return 1;
+    }
+    return 0;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = fblas_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static struct { int nd;npy_intp *d;int *i,*i_tr,tr; } forcombcache;
+static int initforcomb(npy_intp *dims,int nd,int tr) {
+  int k;
+  if (dims==NULL) return 0;
+  if (nd<0) return 0;
+  forcombcache.nd = nd;
+  forcombcache.d = dims;
+  forcombcache.tr = tr;
+  if ((forcombcache.i = (int *)malloc(sizeof(int)*nd))==NULL) return 0;
+  if ((forcombcache.i_tr = (int *)malloc(sizeof(int)*nd))==NULL) return 0;
+  for (k=1;k<nd;k++) {
+    forcombcache.i[k] = forcombcache.i_tr[nd-k-1] = 0;
+  }
+  forcombcache.i[0] = forcombcache.i_tr[nd-1] = -1;
+  return 1;
+}
+static int *nextforcomb(void) {
+  int j,*i,*i_tr,k;
+  int nd=forcombcache.nd;
+  if ((i=forcombcache.i) == NULL) return NULL;
+  if ((i_tr=forcombcache.i_tr) == NULL) return NULL;
+  if (forcombcache.d == NULL) return NULL;
+  i[0]++;
+  if (i[0]==forcombcache.d[0]) {
+    j=1;
+    while ((j<nd) && (i[j]==forcombcache.d[j]-1)) j++;
+    if (j==nd) {
+      free(i);
+      free(i_tr);
+      return NULL;
+    }
+    for (k=0;k<j;k++) i[k] = i_tr[nd-k-1] = 0;
+    i[j]++;
+    i_tr[nd-j-1]++;
+  } else
+    i_tr[nd-1]++;
+  if (forcombcache.tr) return i_tr;
+  return i;
+}
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(srotg,SROTG)(float*,float*,float*,float* );
+extern void F_FUNC(drotg,DROTG)(double*,double*,double*,double* );
+extern void F_FUNC(crotg,CROTG)(complex_float*,complex_float*,complex_float*,complex_float* );
+extern void F_FUNC(zrotg,ZROTG)(complex_double*,complex_double*,complex_double*,complex_double* );
+extern void F_FUNC(srotmg,SROTMG)(float*,float*,float*,float*,float* );
+extern void F_FUNC(drotmg,DROTMG)(double*,double*,double*,double*,double* );
+extern void F_FUNC(srot,SROT)(int*,float*,int*,float*,int*,float*,float* );
+extern void F_FUNC(drot,DROT)(int*,double*,int*,double*,int*,double*,double* );
+extern void F_FUNC(csrot,CSROT)(int*,complex_float*,int*,complex_float*,int*,float*,float* );
+extern void F_FUNC(zdrot,ZDROT)(int*,complex_double*,int*,complex_double*,int*,double*,double* );
+extern void F_FUNC(srotm,SROTM)(int*,float*,int*,float*,int*,float* );
+extern void F_FUNC(drotm,DROTM)(int*,double*,int*,double*,int*,double* );
+extern void F_FUNC(sswap,SSWAP)(int*,float*,int*,float*,int* );
+extern void F_FUNC(dswap,DSWAP)(int*,double*,int*,double*,int* );
+extern void F_FUNC(cswap,CSWAP)(int*,complex_float*,int*,complex_float*,int* );
+extern void F_FUNC(zswap,ZSWAP)(int*,complex_double*,int*,complex_double*,int* );
+extern void F_FUNC(sscal,SSCAL)(int*,float*,float*,int* );
+extern void F_FUNC(dscal,DSCAL)(int*,double*,double*,int* );
+extern void F_FUNC(cscal,CSCAL)(int*,complex_float*,complex_float*,int* );
+extern void F_FUNC(zscal,ZSCAL)(int*,complex_double*,complex_double*,int* );
+extern void F_FUNC(csscal,CSSCAL)(int*,float*,complex_float*,int* );
+extern void F_FUNC(zdscal,ZDSCAL)(int*,double*,complex_double*,int* );
+extern void F_FUNC(scopy,SCOPY)(int*,float*,int*,float*,int* );
+extern void F_FUNC(dcopy,DCOPY)(int*,double*,int*,double*,int* );
+extern void F_FUNC(ccopy,CCOPY)(int*,complex_float*,int*,complex_float*,int* );
+extern void F_FUNC(zcopy,ZCOPY)(int*,complex_double*,int*,complex_double*,int* );
+extern void F_FUNC(saxpy,SAXPY)(int*,float*,float*,int*,float*,int* );
+extern void F_FUNC(daxpy,DAXPY)(int*,double*,double*,int*,double*,int* );
+extern void F_FUNC(caxpy,CAXPY)(int*,complex_float*,complex_float*,int*,complex_float*,int* );
+extern void F_FUNC(zaxpy,ZAXPY)(int*,complex_double*,complex_double*,int*,complex_double*,int* );
+extern void F_WRAPPEDFUNC(sdot,SDOT)(float*,int*,float*,int*,float*,int* );
+extern void F_WRAPPEDFUNC(ddot,DDOT)(double*,int*,double*,int*,double*,int* );
+extern void F_FUNC(wcdotu ,WCDOTU )(complex_float*,int*,complex_float*,int*,complex_float*,int* );
+extern void F_FUNC(wzdotu ,WZDOTU )(complex_double*,int*,complex_double*,int*,complex_double*,int* );
+extern void F_FUNC(wcdotc ,WCDOTC )(complex_float*,int*,complex_float*,int*,complex_float*,int* );
+extern void F_FUNC(wzdotc ,WZDOTC )(complex_double*,int*,complex_double*,int*,complex_double*,int* );
+extern void F_WRAPPEDFUNC(snrm2,SNRM2)(float*,int*,float*,int* );
+extern void F_WRAPPEDFUNC(dnrm2,DNRM2)(double*,int*,double*,int* );
+extern void F_WRAPPEDFUNC(scnrm2,SCNRM2)(float*,int*,complex_float*,int* );
+extern void F_WRAPPEDFUNC(dznrm2,DZNRM2)(double*,int*,complex_double*,int* );
+extern void F_WRAPPEDFUNC(sasum,SASUM)(float*,int*,float*,int* );
+extern void F_WRAPPEDFUNC(dasum,DASUM)(double*,int*,double*,int* );
+extern void F_WRAPPEDFUNC(scasum,SCASUM)(float*,int*,complex_float*,int* );
+extern void F_WRAPPEDFUNC(dzasum,DZASUM)(double*,int*,complex_double*,int* );
+extern int F_FUNC(isamax,ISAMAX) (int*,float*,int* );
+extern int F_FUNC(idamax,IDAMAX) (int*,double*,int* );
+extern int F_FUNC(icamax,ICAMAX) (int*,complex_float*,int* );
+extern int F_FUNC(izamax,IZAMAX) (int*,complex_double*,int* );
+extern void F_FUNC(sgemv,SGEMV)(char*,int*,int*,float*,float*,int*,float*,int*,float*,float*,int* );
+extern void F_FUNC(dgemv,DGEMV)(char*,int*,int*,double*,double*,int*,double*,int*,double*,double*,int* );
+extern void F_FUNC(cgemv,CGEMV)(char*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* );
+extern void F_FUNC(zgemv,ZGEMV)(char*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* );
+extern void F_FUNC(ssymv,SSYMV)(char*,int*,float*,float*,int*,float*,int*,float*,float*,int* );
+extern void F_FUNC(dsymv,DSYMV)(char*,int*,double*,double*,int*,double*,int*,double*,double*,int* );
+extern void F_FUNC(chemv,CHEMV)(char*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* );
+extern void F_FUNC(zhemv,ZHEMV)(char*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* );
+extern void F_FUNC(strmv,STRMV)(char*,char*,char*,int*,float*,int*,float*,int* );
+extern void F_FUNC(dtrmv,DTRMV)(char*,char*,char*,int*,double*,int*,double*,int* );
+extern void F_FUNC(ctrmv,CTRMV)(char*,char*,char*,int*,complex_float*,int*,complex_float*,int* );
+extern void F_FUNC(ztrmv,ZTRMV)(char*,char*,char*,int*,complex_double*,int*,complex_double*,int* );
+extern void F_FUNC(sger,SGER)(int*,int*,float*,float*,int*,float*,int*,float*,int*);
+extern void F_FUNC(dger,DGER)(int*,int*,double*,double*,int*,double*,int*,double*,int*);
+extern void F_FUNC(cgeru,CGERU)(int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*);
+extern void F_FUNC(zgeru,ZGERU)(int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*);
+extern void F_FUNC(cgerc,CGERC)(int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*);
+extern void F_FUNC(zgerc,ZGERC)(int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*);
+extern void F_FUNC(sgemm,SGEMM)(char*,char*,int*,int*,int*,float*,float*,int*,float*,int*,float*,float*,int* );
+extern void F_FUNC(dgemm,DGEMM)(char*,char*,int*,int*,int*,double*,double*,int*,double*,int*,double*,double*,int* );
+extern void F_FUNC(cgemm,CGEMM)(char*,char*,int*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* );
+extern void F_FUNC(zgemm,ZGEMM)(char*,char*,int*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* );
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** srotg ***********************************/
+static char doc_f2py_rout_fblas_srotg[] = "\
+c,s = srotg(a,b)\n\nWrapper for ``srotg``.\
+\n\nParameters\n----------\n"
+"a : input float\n"
+"b : input float\n"
+"\nReturns\n-------\n"
+"c : float\n"
+"s : float";
+/* extern void F_FUNC(srotg,SROTG)(float*,float*,float*,float* ); */
+static PyObject *f2py_rout_fblas_srotg(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,float*,float*,float* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float a = 0;
+  PyObject *a_capi = Py_None;
+  float b = 0;
+  PyObject *b_capi = Py_None;
+  float c = 0;
+  float s = 0;
+  static char *capi_kwlist[] = {"a","b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:fblas.srotg",\
+    capi_kwlist,&a_capi,&b_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = float_from_pyobj(&a,a_capi,"fblas.srotg() 1st argument (a) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable c */
+  /* Processing variable b */
+    f2py_success = float_from_pyobj(&b,b_capi,"fblas.srotg() 2nd argument (b) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable s */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&a,&b,&c,&s);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ff",c,s);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable s */
+  } /*if (f2py_success) of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable c */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of srotg ********************************/
+
+/*********************************** drotg ***********************************/
+static char doc_f2py_rout_fblas_drotg[] = "\
+c,s = drotg(a,b)\n\nWrapper for ``drotg``.\
+\n\nParameters\n----------\n"
+"a : input float\n"
+"b : input float\n"
+"\nReturns\n-------\n"
+"c : float\n"
+"s : float";
+/* extern void F_FUNC(drotg,DROTG)(double*,double*,double*,double* ); */
+static PyObject *f2py_rout_fblas_drotg(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double a = 0;
+  PyObject *a_capi = Py_None;
+  double b = 0;
+  PyObject *b_capi = Py_None;
+  double c = 0;
+  double s = 0;
+  static char *capi_kwlist[] = {"a","b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:fblas.drotg",\
+    capi_kwlist,&a_capi,&b_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = double_from_pyobj(&a,a_capi,"fblas.drotg() 1st argument (a) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable c */
+  /* Processing variable b */
+    f2py_success = double_from_pyobj(&b,b_capi,"fblas.drotg() 2nd argument (b) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable s */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&a,&b,&c,&s);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("dd",c,s);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable s */
+  } /*if (f2py_success) of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable c */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of drotg ********************************/
+
+/*********************************** crotg ***********************************/
+static char doc_f2py_rout_fblas_crotg[] = "\
+c,s = crotg(a,b)\n\nWrapper for ``crotg``.\
+\n\nParameters\n----------\n"
+"a : input complex\n"
+"b : input complex\n"
+"\nReturns\n-------\n"
+"c : complex\n"
+"s : complex";
+/* extern void F_FUNC(crotg,CROTG)(complex_float*,complex_float*,complex_float*,complex_float* ); */
+static PyObject *f2py_rout_fblas_crotg(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,complex_float*,complex_float*,complex_float* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_float a;
+  PyObject *a_capi = Py_None;
+  complex_float b;
+  PyObject *b_capi = Py_None;
+  complex_float c;
+  PyObject *c_capi = Py_None;
+  complex_float s;
+  PyObject *s_capi = Py_None;
+  static char *capi_kwlist[] = {"a","b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:fblas.crotg",\
+    capi_kwlist,&a_capi,&b_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = complex_float_from_pyobj(&a,a_capi,"fblas.crotg() 1st argument (a) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable c */
+  /* Processing variable b */
+    f2py_success = complex_float_from_pyobj(&b,b_capi,"fblas.crotg() 2nd argument (b) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable s */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&a,&b,&c,&s);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  c_capi = pyobj_from_complex_float1(c);
+  s_capi = pyobj_from_complex_float1(s);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",c_capi,s_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable s */
+  }  /*if (f2py_success) of b frompyobj*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable c */
+  }  /*if (f2py_success) of a frompyobj*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of crotg ********************************/
+
+/*********************************** zrotg ***********************************/
+static char doc_f2py_rout_fblas_zrotg[] = "\
+c,s = zrotg(a,b)\n\nWrapper for ``zrotg``.\
+\n\nParameters\n----------\n"
+"a : input complex\n"
+"b : input complex\n"
+"\nReturns\n-------\n"
+"c : complex\n"
+"s : complex";
+/* extern void F_FUNC(zrotg,ZROTG)(complex_double*,complex_double*,complex_double*,complex_double* ); */
+static PyObject *f2py_rout_fblas_zrotg(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,complex_double*,complex_double*,complex_double* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double a;
+  PyObject *a_capi = Py_None;
+  complex_double b;
+  PyObject *b_capi = Py_None;
+  complex_double c;
+  PyObject *c_capi = Py_None;
+  complex_double s;
+  PyObject *s_capi = Py_None;
+  static char *capi_kwlist[] = {"a","b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:fblas.zrotg",\
+    capi_kwlist,&a_capi,&b_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = complex_double_from_pyobj(&a,a_capi,"fblas.zrotg() 1st argument (a) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable c */
+  /* Processing variable b */
+    f2py_success = complex_double_from_pyobj(&b,b_capi,"fblas.zrotg() 2nd argument (b) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable s */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&a,&b,&c,&s);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  c_capi = pyobj_from_complex_double1(c);
+  s_capi = pyobj_from_complex_double1(s);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",c_capi,s_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable s */
+  }  /*if (f2py_success) of b frompyobj*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable c */
+  }  /*if (f2py_success) of a frompyobj*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zrotg ********************************/
+
+/*********************************** srotmg ***********************************/
+static char doc_f2py_rout_fblas_srotmg[] = "\
+param = srotmg(d1,d2,x1,y1)\n\nWrapper for ``srotmg``.\
+\n\nParameters\n----------\n"
+"d1 : input float\n"
+"d2 : input float\n"
+"x1 : input float\n"
+"y1 : input float\n"
+"\nReturns\n-------\n"
+"param : rank-1 array('f') with bounds (5)";
+/* extern void F_FUNC(srotmg,SROTMG)(float*,float*,float*,float*,float* ); */
+static PyObject *f2py_rout_fblas_srotmg(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,float*,float*,float*,float* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float d1 = 0;
+  PyObject *d1_capi = Py_None;
+  float d2 = 0;
+  PyObject *d2_capi = Py_None;
+  float x1 = 0;
+  PyObject *x1_capi = Py_None;
+  float y1 = 0;
+  PyObject *y1_capi = Py_None;
+  float *param = NULL;
+  npy_intp param_Dims[1] = {-1};
+  const int param_Rank = 1;
+  PyArrayObject *capi_param_tmp = NULL;
+  int capi_param_intent = 0;
+  static char *capi_kwlist[] = {"d1","d2","x1","y1",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:fblas.srotmg",\
+    capi_kwlist,&d1_capi,&d2_capi,&x1_capi,&y1_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable y1 */
+    f2py_success = float_from_pyobj(&y1,y1_capi,"fblas.srotmg() 4th argument (y1) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable x1 */
+    f2py_success = float_from_pyobj(&x1,x1_capi,"fblas.srotmg() 3rd argument (x1) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable d2 */
+    f2py_success = float_from_pyobj(&d2,d2_capi,"fblas.srotmg() 2nd argument (d2) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable param */
+  param_Dims[0]=5;
+  capi_param_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_param_tmp = array_from_pyobj(NPY_FLOAT,param_Dims,param_Rank,capi_param_intent,Py_None);
+  if (capi_param_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting hidden `param' of fblas.srotmg to C/Fortran array" );
+  } else {
+    param = (float *)(PyArray_DATA(capi_param_tmp));
+
+  /* Processing variable d1 */
+    f2py_success = float_from_pyobj(&d1,d1_capi,"fblas.srotmg() 1st argument (d1) can't be converted to float");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { (*f2py_func)(&d1,&d2,&x1,&y1,param); } ;
+        /*(*f2py_func)(&d1,&d2,&x1,&y1,param);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_param_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of d1*/
+  /* End of cleaning variable d1 */
+  }  /*if (capi_param_tmp == NULL) ... else of param*/
+  /* End of cleaning variable param */
+  } /*if (f2py_success) of d2*/
+  /* End of cleaning variable d2 */
+  } /*if (f2py_success) of x1*/
+  /* End of cleaning variable x1 */
+  } /*if (f2py_success) of y1*/
+  /* End of cleaning variable y1 */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of srotmg *******************************/
+
+/*********************************** drotmg ***********************************/
+static char doc_f2py_rout_fblas_drotmg[] = "\
+param = drotmg(d1,d2,x1,y1)\n\nWrapper for ``drotmg``.\
+\n\nParameters\n----------\n"
+"d1 : input float\n"
+"d2 : input float\n"
+"x1 : input float\n"
+"y1 : input float\n"
+"\nReturns\n-------\n"
+"param : rank-1 array('d') with bounds (5)";
+/* extern void F_FUNC(drotmg,DROTMG)(double*,double*,double*,double*,double* ); */
+static PyObject *f2py_rout_fblas_drotmg(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double d1 = 0;
+  PyObject *d1_capi = Py_None;
+  double d2 = 0;
+  PyObject *d2_capi = Py_None;
+  double x1 = 0;
+  PyObject *x1_capi = Py_None;
+  double y1 = 0;
+  PyObject *y1_capi = Py_None;
+  double *param = NULL;
+  npy_intp param_Dims[1] = {-1};
+  const int param_Rank = 1;
+  PyArrayObject *capi_param_tmp = NULL;
+  int capi_param_intent = 0;
+  static char *capi_kwlist[] = {"d1","d2","x1","y1",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:fblas.drotmg",\
+    capi_kwlist,&d1_capi,&d2_capi,&x1_capi,&y1_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable y1 */
+    f2py_success = double_from_pyobj(&y1,y1_capi,"fblas.drotmg() 4th argument (y1) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable x1 */
+    f2py_success = double_from_pyobj(&x1,x1_capi,"fblas.drotmg() 3rd argument (x1) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable d2 */
+    f2py_success = double_from_pyobj(&d2,d2_capi,"fblas.drotmg() 2nd argument (d2) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable param */
+  param_Dims[0]=5;
+  capi_param_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_param_tmp = array_from_pyobj(NPY_DOUBLE,param_Dims,param_Rank,capi_param_intent,Py_None);
+  if (capi_param_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting hidden `param' of fblas.drotmg to C/Fortran array" );
+  } else {
+    param = (double *)(PyArray_DATA(capi_param_tmp));
+
+  /* Processing variable d1 */
+    f2py_success = double_from_pyobj(&d1,d1_capi,"fblas.drotmg() 1st argument (d1) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { (*f2py_func)(&d1,&d2,&x1,&y1,param); } ;
+        /*(*f2py_func)(&d1,&d2,&x1,&y1,param);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_param_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of d1*/
+  /* End of cleaning variable d1 */
+  }  /*if (capi_param_tmp == NULL) ... else of param*/
+  /* End of cleaning variable param */
+  } /*if (f2py_success) of d2*/
+  /* End of cleaning variable d2 */
+  } /*if (f2py_success) of x1*/
+  /* End of cleaning variable x1 */
+  } /*if (f2py_success) of y1*/
+  /* End of cleaning variable y1 */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of drotmg *******************************/
+
+/************************************ srot ************************************/
+static char doc_f2py_rout_fblas_srot[] = "\
+x,y = srot(x,y,c,s,[n,offx,incx,offy,incy,overwrite_x,overwrite_y])\n\nWrapper for ``srot``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"y : input rank-1 array('f') with bounds (*)\n"
+"c : input float\n"
+"s : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (*)\n"
+"y : rank-1 array('f') with bounds (*)";
+/* extern void F_FUNC(srot,SROT)(int*,float*,int*,float*,int*,float*,float* ); */
+static PyObject *f2py_rout_fblas_srot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,float*,int*,float*,float* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  float c = 0;
+  PyObject *c_capi = Py_None;
+  float s = 0;
+  PyObject *s_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","c","s","n","offx","incx","offy","incy","overwrite_x","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OOOOOii:fblas.srot",\
+    capi_kwlist,&x_capi,&y_capi,&c_capi,&s_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&capi_overwrite_x,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable c */
+    f2py_success = float_from_pyobj(&c,c_capi,"fblas.srot() 3rd argument (c) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.srot() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","srot:incx=%d",incx) {
+  /* Processing variable s */
+    f2py_success = float_from_pyobj(&s,s_capi,"fblas.srot() 4th argument (s) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.srot() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","srot:incy=%d",incy) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.srot to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.srot to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.srot() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","srot:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.srot() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","srot:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.srot() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","srot:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","srot:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy,&c,&s) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy,&c,&s);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*if (f2py_success) of c*/
+  /* End of cleaning variable c */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of srot ********************************/
+
+/************************************ drot ************************************/
+static char doc_f2py_rout_fblas_drot[] = "\
+x,y = drot(x,y,c,s,[n,offx,incx,offy,incy,overwrite_x,overwrite_y])\n\nWrapper for ``drot``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"y : input rank-1 array('d') with bounds (*)\n"
+"c : input float\n"
+"s : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (*)\n"
+"y : rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(drot,DROT)(int*,double*,int*,double*,int*,double*,double* ); */
+static PyObject *f2py_rout_fblas_drot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,double*,int*,double*,double* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  double c = 0;
+  PyObject *c_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","c","s","n","offx","incx","offy","incy","overwrite_x","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OOOOOii:fblas.drot",\
+    capi_kwlist,&x_capi,&y_capi,&c_capi,&s_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&capi_overwrite_x,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable c */
+    f2py_success = double_from_pyobj(&c,c_capi,"fblas.drot() 3rd argument (c) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.drot() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","drot:incx=%d",incx) {
+  /* Processing variable s */
+    f2py_success = double_from_pyobj(&s,s_capi,"fblas.drot() 4th argument (s) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.drot() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","drot:incy=%d",incy) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.drot to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.drot to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.drot() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","drot:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.drot() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","drot:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.drot() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","drot:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","drot:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy,&c,&s) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy,&c,&s);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*if (f2py_success) of c*/
+  /* End of cleaning variable c */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of drot ********************************/
+
+/*********************************** csrot ***********************************/
+static char doc_f2py_rout_fblas_csrot[] = "\
+x,y = csrot(x,y,c,s,[n,offx,incx,offy,incy,overwrite_x,overwrite_y])\n\nWrapper for ``csrot``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"y : input rank-1 array('F') with bounds (*)\n"
+"c : input float\n"
+"s : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (*)\n"
+"y : rank-1 array('F') with bounds (*)";
+/* extern void F_FUNC(csrot,CSROT)(int*,complex_float*,int*,complex_float*,int*,float*,float* ); */
+static PyObject *f2py_rout_fblas_csrot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,int*,complex_float*,int*,float*,float* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  float c = 0;
+  PyObject *c_capi = Py_None;
+  float s = 0;
+  PyObject *s_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","c","s","n","offx","incx","offy","incy","overwrite_x","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OOOOOii:fblas.csrot",\
+    capi_kwlist,&x_capi,&y_capi,&c_capi,&s_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&capi_overwrite_x,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable c */
+    f2py_success = float_from_pyobj(&c,c_capi,"fblas.csrot() 3rd argument (c) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.csrot() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","csrot:incx=%d",incx) {
+  /* Processing variable s */
+    f2py_success = float_from_pyobj(&s,s_capi,"fblas.csrot() 4th argument (s) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.csrot() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","csrot:incy=%d",incy) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.csrot to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.csrot to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.csrot() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","csrot:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.csrot() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","csrot:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.csrot() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","csrot:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","csrot:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy,&c,&s) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy,&c,&s);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*if (f2py_success) of c*/
+  /* End of cleaning variable c */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of csrot ********************************/
+
+/*********************************** zdrot ***********************************/
+static char doc_f2py_rout_fblas_zdrot[] = "\
+x,y = zdrot(x,y,c,s,[n,offx,incx,offy,incy,overwrite_x,overwrite_y])\n\nWrapper for ``zdrot``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"y : input rank-1 array('D') with bounds (*)\n"
+"c : input float\n"
+"s : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (*)\n"
+"y : rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(zdrot,ZDROT)(int*,complex_double*,int*,complex_double*,int*,double*,double* ); */
+static PyObject *f2py_rout_fblas_zdrot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,int*,complex_double*,int*,double*,double* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  double c = 0;
+  PyObject *c_capi = Py_None;
+  double s = 0;
+  PyObject *s_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","c","s","n","offx","incx","offy","incy","overwrite_x","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OOOOOii:fblas.zdrot",\
+    capi_kwlist,&x_capi,&y_capi,&c_capi,&s_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&capi_overwrite_x,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable c */
+    f2py_success = double_from_pyobj(&c,c_capi,"fblas.zdrot() 3rd argument (c) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zdrot() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","zdrot:incx=%d",incx) {
+  /* Processing variable s */
+    f2py_success = double_from_pyobj(&s,s_capi,"fblas.zdrot() 4th argument (s) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zdrot() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","zdrot:incy=%d",incy) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.zdrot to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.zdrot to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zdrot() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","zdrot:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zdrot() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","zdrot:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zdrot() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","zdrot:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zdrot:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy,&c,&s) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy,&c,&s);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*if (f2py_success) of s*/
+  /* End of cleaning variable s */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*if (f2py_success) of c*/
+  /* End of cleaning variable c */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zdrot ********************************/
+
+/*********************************** srotm ***********************************/
+static char doc_f2py_rout_fblas_srotm[] = "\
+x,y = srotm(x,y,param,[n,offx,incx,offy,incy,overwrite_x,overwrite_y])\n\nWrapper for ``srotm``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"y : input rank-1 array('f') with bounds (*)\n"
+"param : input rank-1 array('f') with bounds (5)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (*)\n"
+"y : rank-1 array('f') with bounds (*)";
+/* extern void F_FUNC(srotm,SROTM)(int*,float*,int*,float*,int*,float* ); */
+static PyObject *f2py_rout_fblas_srotm(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,float*,int*,float* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  float *param = NULL;
+  npy_intp param_Dims[1] = {-1};
+  const int param_Rank = 1;
+  PyArrayObject *capi_param_tmp = NULL;
+  int capi_param_intent = 0;
+  PyObject *param_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","param","n","offx","incx","offy","incy","overwrite_x","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOii:fblas.srotm",\
+    capi_kwlist,&x_capi,&y_capi,&param_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&capi_overwrite_x,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.srotm() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","srotm:incx=%d",incx) {
+  /* Processing variable param */
+  param_Dims[0]=5;
+  capi_param_intent |= F2PY_INTENT_IN;
+  capi_param_tmp = array_from_pyobj(NPY_FLOAT,param_Dims,param_Rank,capi_param_intent,param_capi);
+  if (capi_param_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `param' of fblas.srotm to C/Fortran array" );
+  } else {
+    param = (float *)(PyArray_DATA(capi_param_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.srotm() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","srotm:incy=%d",incy) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.srotm to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.srotm to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.srotm() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","srotm:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.srotm() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","srotm:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.srotm() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","srotm:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","srotm:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy,param) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy,param);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  if((PyObject *)capi_param_tmp!=param_capi) {
+    Py_XDECREF(capi_param_tmp); }
+  }  /*if (capi_param_tmp == NULL) ... else of param*/
+  /* End of cleaning variable param */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of srotm ********************************/
+
+/*********************************** drotm ***********************************/
+static char doc_f2py_rout_fblas_drotm[] = "\
+x,y = drotm(x,y,param,[n,offx,incx,offy,incy,overwrite_x,overwrite_y])\n\nWrapper for ``drotm``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"y : input rank-1 array('d') with bounds (*)\n"
+"param : input rank-1 array('d') with bounds (5)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (*)\n"
+"y : rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(drotm,DROTM)(int*,double*,int*,double*,int*,double* ); */
+static PyObject *f2py_rout_fblas_drotm(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,double*,int*,double* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  double *param = NULL;
+  npy_intp param_Dims[1] = {-1};
+  const int param_Rank = 1;
+  PyArrayObject *capi_param_tmp = NULL;
+  int capi_param_intent = 0;
+  PyObject *param_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","param","n","offx","incx","offy","incy","overwrite_x","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOii:fblas.drotm",\
+    capi_kwlist,&x_capi,&y_capi,&param_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&capi_overwrite_x,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.drotm() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","drotm:incx=%d",incx) {
+  /* Processing variable param */
+  param_Dims[0]=5;
+  capi_param_intent |= F2PY_INTENT_IN;
+  capi_param_tmp = array_from_pyobj(NPY_DOUBLE,param_Dims,param_Rank,capi_param_intent,param_capi);
+  if (capi_param_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `param' of fblas.drotm to C/Fortran array" );
+  } else {
+    param = (double *)(PyArray_DATA(capi_param_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.drotm() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","drotm:incy=%d",incy) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.drotm to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.drotm to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.drotm() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","drotm:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.drotm() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","drotm:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.drotm() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","drotm:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","drotm:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy,param) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy,param);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  if((PyObject *)capi_param_tmp!=param_capi) {
+    Py_XDECREF(capi_param_tmp); }
+  }  /*if (capi_param_tmp == NULL) ... else of param*/
+  /* End of cleaning variable param */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of drotm ********************************/
+
+/*********************************** sswap ***********************************/
+static char doc_f2py_rout_fblas_sswap[] = "\
+x,y = sswap(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``sswap``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"y : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (*)\n"
+"y : rank-1 array('f') with bounds (*)";
+/* extern void F_FUNC(sswap,SSWAP)(int*,float*,int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_sswap(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.sswap",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.sswap to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.sswap to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.sswap() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","sswap:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.sswap() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","sswap:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.sswap() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","sswap:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.sswap() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","sswap:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.sswap() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","sswap:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","sswap:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sswap ********************************/
+
+/*********************************** dswap ***********************************/
+static char doc_f2py_rout_fblas_dswap[] = "\
+x,y = dswap(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``dswap``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"y : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (*)\n"
+"y : rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(dswap,DSWAP)(int*,double*,int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dswap(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.dswap",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.dswap to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.dswap to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.dswap() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","dswap:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dswap() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","dswap:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.dswap() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","dswap:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dswap() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","dswap:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.dswap() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","dswap:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","dswap:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dswap ********************************/
+
+/*********************************** cswap ***********************************/
+static char doc_f2py_rout_fblas_cswap[] = "\
+x,y = cswap(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``cswap``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"y : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (*)\n"
+"y : rank-1 array('F') with bounds (*)";
+/* extern void F_FUNC(cswap,CSWAP)(int*,complex_float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_cswap(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.cswap",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.cswap to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.cswap to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.cswap() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","cswap:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.cswap() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","cswap:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.cswap() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","cswap:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.cswap() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","cswap:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.cswap() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","cswap:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","cswap:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cswap ********************************/
+
+/*********************************** zswap ***********************************/
+static char doc_f2py_rout_fblas_zswap[] = "\
+x,y = zswap(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``zswap``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"y : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (*)\n"
+"y : rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(zswap,ZSWAP)(int*,complex_double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zswap(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.zswap",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.zswap to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.zswap to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zswap() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","zswap:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zswap() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","zswap:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zswap() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","zswap:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zswap() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","zswap:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zswap() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","zswap:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zswap:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_x_tmp,capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zswap ********************************/
+
+/*********************************** sscal ***********************************/
+static char doc_f2py_rout_fblas_sscal[] = "\
+x = sscal(a,x,[n,offx,incx])\n\nWrapper for ``sscal``.\
+\n\nParameters\n----------\n"
+"a : input float\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (*)";
+/* extern void F_FUNC(sscal,SSCAL)(int*,float*,float*,int* ); */
+static PyObject *f2py_rout_fblas_sscal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float a = 0;
+  PyObject *a_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOO:fblas.sscal",\
+    capi_kwlist,&a_capi,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = float_from_pyobj(&a,a_capi,"fblas.sscal() 1st argument (a) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.sscal to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.sscal() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","sscal:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.sscal() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","sscal:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.sscal() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","sscal:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sscal ********************************/
+
+/*********************************** dscal ***********************************/
+static char doc_f2py_rout_fblas_dscal[] = "\
+x = dscal(a,x,[n,offx,incx])\n\nWrapper for ``dscal``.\
+\n\nParameters\n----------\n"
+"a : input float\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(dscal,DSCAL)(int*,double*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dscal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double a = 0;
+  PyObject *a_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOO:fblas.dscal",\
+    capi_kwlist,&a_capi,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = double_from_pyobj(&a,a_capi,"fblas.dscal() 1st argument (a) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.dscal to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dscal() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","dscal:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dscal() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","dscal:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.dscal() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","dscal:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dscal ********************************/
+
+/*********************************** cscal ***********************************/
+static char doc_f2py_rout_fblas_cscal[] = "\
+x = cscal(a,x,[n,offx,incx])\n\nWrapper for ``cscal``.\
+\n\nParameters\n----------\n"
+"a : input complex\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (*)";
+/* extern void F_FUNC(cscal,CSCAL)(int*,complex_float*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_cscal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float a;
+  PyObject *a_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOO:fblas.cscal",\
+    capi_kwlist,&a_capi,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = complex_float_from_pyobj(&a,a_capi,"fblas.cscal() 1st argument (a) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.cscal to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.cscal() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","cscal:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.cscal() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","cscal:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.cscal() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","cscal:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (f2py_success) of a frompyobj*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cscal ********************************/
+
+/*********************************** zscal ***********************************/
+static char doc_f2py_rout_fblas_zscal[] = "\
+x = zscal(a,x,[n,offx,incx])\n\nWrapper for ``zscal``.\
+\n\nParameters\n----------\n"
+"a : input complex\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(zscal,ZSCAL)(int*,complex_double*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zscal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double a;
+  PyObject *a_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOO:fblas.zscal",\
+    capi_kwlist,&a_capi,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = complex_double_from_pyobj(&a,a_capi,"fblas.zscal() 1st argument (a) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.zscal to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zscal() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","zscal:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zscal() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","zscal:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zscal() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zscal:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (f2py_success) of a frompyobj*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zscal ********************************/
+
+/*********************************** csscal ***********************************/
+static char doc_f2py_rout_fblas_csscal[] = "\
+x = csscal(a,x,[n,offx,incx,overwrite_x])\n\nWrapper for ``csscal``.\
+\n\nParameters\n----------\n"
+"a : input float\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (*)";
+/* extern void F_FUNC(csscal,CSSCAL)(int*,float*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_csscal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","n","offx","incx","overwrite_x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOi:fblas.csscal",\
+    capi_kwlist,&a_capi,&x_capi,&n_capi,&offx_capi,&incx_capi,&capi_overwrite_x))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = float_from_pyobj(&a,a_capi,"fblas.csscal() 1st argument (a) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.csscal to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.csscal() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","csscal:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.csscal() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","csscal:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.csscal() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","csscal:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of csscal *******************************/
+
+/*********************************** zdscal ***********************************/
+static char doc_f2py_rout_fblas_zdscal[] = "\
+x = zdscal(a,x,[n,offx,incx,overwrite_x])\n\nWrapper for ``zdscal``.\
+\n\nParameters\n----------\n"
+"a : input float\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(zdscal,ZDSCAL)(int*,double*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zdscal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","n","offx","incx","overwrite_x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOi:fblas.zdscal",\
+    capi_kwlist,&a_capi,&x_capi,&n_capi,&offx_capi,&incx_capi,&capi_overwrite_x))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+    f2py_success = double_from_pyobj(&a,a_capi,"fblas.zdscal() 1st argument (a) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.zdscal to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zdscal() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","zdscal:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zdscal() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","zdscal:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zdscal() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zdscal:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zdscal *******************************/
+
+/*********************************** scopy ***********************************/
+static char doc_f2py_rout_fblas_scopy[] = "\
+y = scopy(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``scopy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"y : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('f') with bounds (*)";
+/* extern void F_FUNC(scopy,SCOPY)(int*,float*,int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_scopy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.scopy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.scopy to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.scopy to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.scopy() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","scopy:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.scopy() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","scopy:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.scopy() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","scopy:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.scopy() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","scopy:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.scopy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","scopy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","scopy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of scopy ********************************/
+
+/*********************************** dcopy ***********************************/
+static char doc_f2py_rout_fblas_dcopy[] = "\
+y = dcopy(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``dcopy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"y : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(dcopy,DCOPY)(int*,double*,int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dcopy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.dcopy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.dcopy to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.dcopy to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.dcopy() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","dcopy:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dcopy() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","dcopy:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.dcopy() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","dcopy:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dcopy() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","dcopy:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.dcopy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","dcopy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","dcopy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dcopy ********************************/
+
+/*********************************** ccopy ***********************************/
+static char doc_f2py_rout_fblas_ccopy[] = "\
+y = ccopy(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``ccopy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"y : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('F') with bounds (*)";
+/* extern void F_FUNC(ccopy,CCOPY)(int*,complex_float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_ccopy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.ccopy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.ccopy to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.ccopy to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.ccopy() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","ccopy:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.ccopy() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","ccopy:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.ccopy() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","ccopy:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.ccopy() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","ccopy:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.ccopy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","ccopy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","ccopy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of ccopy ********************************/
+
+/*********************************** zcopy ***********************************/
+static char doc_f2py_rout_fblas_zcopy[] = "\
+y = zcopy(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``zcopy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"y : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(zcopy,ZCOPY)(int*,complex_double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zcopy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.zcopy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.zcopy to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.zcopy to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zcopy() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","zcopy:incy=%d",incy) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zcopy() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","zcopy:incx=%d",incx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zcopy() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","zcopy:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zcopy() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","zcopy:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zcopy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","zcopy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zcopy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zcopy ********************************/
+
+/*********************************** saxpy ***********************************/
+static char doc_f2py_rout_fblas_saxpy[] = "\
+z = saxpy(x,y,[n,a,offx,incx,offy,incy])\n\nWrapper for ``saxpy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"y : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"a : input float, optional\n    Default: 1.0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"z : rank-1 array('f') with bounds (*) and y storage";
+/* extern void F_FUNC(saxpy,SAXPY)(int*,float*,float*,int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_saxpy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float a = 0;
+  PyObject *a_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","a","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOO:fblas.saxpy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&a_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  if (a_capi == Py_None) a = 1.0; else
+    f2py_success = float_from_pyobj(&a,a_capi,"fblas.saxpy() 2nd keyword (a) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.saxpy() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","saxpy:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.saxpy() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","saxpy:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.saxpy to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.saxpy to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.saxpy() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd keyword offx","saxpy:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.saxpy() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","5th keyword offy","saxpy:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.saxpy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","saxpy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","saxpy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of saxpy ********************************/
+
+/*********************************** daxpy ***********************************/
+static char doc_f2py_rout_fblas_daxpy[] = "\
+z = daxpy(x,y,[n,a,offx,incx,offy,incy])\n\nWrapper for ``daxpy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"y : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"a : input float, optional\n    Default: 1.0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"z : rank-1 array('d') with bounds (*) and y storage";
+/* extern void F_FUNC(daxpy,DAXPY)(int*,double*,double*,int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_daxpy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double a = 0;
+  PyObject *a_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","a","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOO:fblas.daxpy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&a_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  if (a_capi == Py_None) a = 1.0; else
+    f2py_success = double_from_pyobj(&a,a_capi,"fblas.daxpy() 2nd keyword (a) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.daxpy() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","daxpy:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.daxpy() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","daxpy:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.daxpy to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.daxpy to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.daxpy() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd keyword offx","daxpy:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.daxpy() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","5th keyword offy","daxpy:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.daxpy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","daxpy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","daxpy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*if (f2py_success) of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of daxpy ********************************/
+
+/*********************************** caxpy ***********************************/
+static char doc_f2py_rout_fblas_caxpy[] = "\
+z = caxpy(x,y,[n,a,offx,incx,offy,incy])\n\nWrapper for ``caxpy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"y : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"a : input complex, optional\n    Default: (1.0, 0.0)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"z : rank-1 array('F') with bounds (*) and y storage";
+/* extern void F_FUNC(caxpy,CAXPY)(int*,complex_float*,complex_float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_caxpy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float a;
+  PyObject *a_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","a","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOO:fblas.caxpy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&a_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  if (a_capi==Py_None) {a.r = 1.0, a.i =  0.0;} else
+    f2py_success = complex_float_from_pyobj(&a,a_capi,"fblas.caxpy() 2nd keyword (a) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.caxpy() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","caxpy:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.caxpy() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","caxpy:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.caxpy to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.caxpy to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.caxpy() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd keyword offx","caxpy:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.caxpy() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","5th keyword offy","caxpy:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.caxpy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","caxpy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","caxpy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (f2py_success) of a frompyobj*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of caxpy ********************************/
+
+/*********************************** zaxpy ***********************************/
+static char doc_f2py_rout_fblas_zaxpy[] = "\
+z = zaxpy(x,y,[n,a,offx,incx,offy,incy])\n\nWrapper for ``zaxpy``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"y : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"a : input complex, optional\n    Default: (1.0, 0.0)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"z : rank-1 array('D') with bounds (*) and y storage";
+/* extern void F_FUNC(zaxpy,ZAXPY)(int*,complex_double*,complex_double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zaxpy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double a;
+  PyObject *a_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","a","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOO:fblas.zaxpy",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&a_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  if (a_capi==Py_None) {a.r = 1.0, a.i =  0.0;} else
+    f2py_success = complex_double_from_pyobj(&a,a_capi,"fblas.zaxpy() 2nd keyword (a) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zaxpy() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","zaxpy:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zaxpy() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","zaxpy:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.zaxpy to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.zaxpy to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zaxpy() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd keyword offx","zaxpy:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zaxpy() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","5th keyword offy","zaxpy:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zaxpy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","zaxpy:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zaxpy:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&a,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&a,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  }  /*if (f2py_success) of a frompyobj*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zaxpy ********************************/
+
+/************************************ sdot ************************************/
+static char doc_f2py_rout_fblas_sdot[] = "\
+xy = sdot(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``sdot``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"y : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"xy : float";
+/* extern void F_WRAPPEDFUNC(sdot,SDOT)(float*,int*,float*,int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_sdot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float sdot = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.sdot",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.sdot() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","sdot:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.sdot() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","sdot:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.sdot to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.sdot to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.sdot() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","sdot:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.sdot() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","sdot:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.sdot() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","sdot:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","sdot:n=%d",n) {
+  /* Processing variable sdot */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&sdot,&n,x+offx,&incx,y+offy,&incy) ;
+  /*(*f2py_func)(&sdot,&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("f",sdot);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable sdot */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sdot ********************************/
+
+/************************************ ddot ************************************/
+static char doc_f2py_rout_fblas_ddot[] = "\
+xy = ddot(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``ddot``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"y : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"xy : float";
+/* extern void F_WRAPPEDFUNC(ddot,DDOT)(double*,int*,double*,int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_ddot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ddot = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.ddot",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.ddot() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","ddot:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.ddot() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","ddot:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.ddot to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.ddot to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.ddot() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","ddot:offy=%d",offy) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.ddot() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","ddot:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.ddot() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","ddot:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","ddot:n=%d",n) {
+  /* Processing variable ddot */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&ddot,&n,x+offx,&incx,y+offy,&incy) ;
+  /*(*f2py_func)(&ddot,&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",ddot);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable ddot */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of ddot ********************************/
+
+/*********************************** cdotu ***********************************/
+static char doc_f2py_rout_fblas_cdotu[] = "\
+xy = cdotu(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``cdotu``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"y : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"xy : complex";
+/* extern void F_FUNC(wcdotu ,WCDOTU )(complex_float*,int*,complex_float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_cdotu(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,int*,complex_float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_float xy;
+  PyObject *xy_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.cdotu",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.cdotu() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","cdotu:incx=%d",incx) {
+  /* Processing variable xy */
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.cdotu() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","cdotu:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.cdotu to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.cdotu to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.cdotu() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","cdotu:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.cdotu() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","cdotu:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.cdotu() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","cdotu:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","cdotu:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&xy,&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&xy,&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  xy_capi = pyobj_from_complex_float1(xy);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",xy_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  /* End of cleaning variable xy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cdotu ********************************/
+
+/*********************************** zdotu ***********************************/
+static char doc_f2py_rout_fblas_zdotu[] = "\
+xy = zdotu(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``zdotu``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"y : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"xy : complex";
+/* extern void F_FUNC(wzdotu ,WZDOTU )(complex_double*,int*,complex_double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zdotu(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,complex_double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double xy;
+  PyObject *xy_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.zdotu",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zdotu() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","zdotu:incx=%d",incx) {
+  /* Processing variable xy */
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zdotu() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","zdotu:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.zdotu to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.zdotu to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zdotu() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","zdotu:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zdotu() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","zdotu:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zdotu() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","zdotu:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zdotu:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&xy,&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&xy,&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  xy_capi = pyobj_from_complex_double1(xy);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",xy_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  /* End of cleaning variable xy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zdotu ********************************/
+
+/*********************************** cdotc ***********************************/
+static char doc_f2py_rout_fblas_cdotc[] = "\
+xy = cdotc(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``cdotc``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"y : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"xy : complex";
+/* extern void F_FUNC(wcdotc ,WCDOTC )(complex_float*,int*,complex_float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_cdotc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,int*,complex_float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_float xy;
+  PyObject *xy_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.cdotc",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.cdotc() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","cdotc:incx=%d",incx) {
+  /* Processing variable xy */
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.cdotc() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","cdotc:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.cdotc to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.cdotc to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.cdotc() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","cdotc:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.cdotc() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","cdotc:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.cdotc() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","cdotc:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","cdotc:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&xy,&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&xy,&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  xy_capi = pyobj_from_complex_float1(xy);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",xy_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  /* End of cleaning variable xy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cdotc ********************************/
+
+/*********************************** zdotc ***********************************/
+static char doc_f2py_rout_fblas_zdotc[] = "\
+xy = zdotc(x,y,[n,offx,incx,offy,incy])\n\nWrapper for ``zdotc``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"y : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"xy : complex";
+/* extern void F_FUNC(wzdotc ,WZDOTC )(complex_double*,int*,complex_double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zdotc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,complex_double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double xy;
+  PyObject *xy_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  static char *capi_kwlist[] = {"x","y","n","offx","incx","offy","incy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOO:fblas.zdotc",\
+    capi_kwlist,&x_capi,&y_capi,&n_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zdotc() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","zdotc:incx=%d",incx) {
+  /* Processing variable xy */
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zdotc() 5th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","5th keyword incy","zdotc:incy=%d",incy) {
+  /* Processing variable y */
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `y' of fblas.zdotc to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.zdotc to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zdotc() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","zdotc:offx=%d",offx) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zdotc() 4th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","4th keyword offy","zdotc:offy=%d",offy) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.zdotc() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(y)-offy>(n-1)*abs(incy),"len(y)-offy>(n-1)*abs(incy)","1st keyword n","zdotc:n=%d",n) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","zdotc:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&xy,&n,x+offx,&incx,y+offy,&incy) ;
+        /*(*f2py_func)(&xy,&n,x,&offx,&incx,y,&offy,&incy);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  xy_capi = pyobj_from_complex_double1(xy);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",xy_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*CHECKSCALAR(len(y)-offy>(n-1)*abs(incy))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offy>=0 && offy<len(y))*/
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  /* End of cleaning variable xy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zdotc ********************************/
+
+/*********************************** snrm2 ***********************************/
+static char doc_f2py_rout_fblas_snrm2[] = "\
+n2 = snrm2(x,[n,offx,incx])\n\nWrapper for ``snrm2``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"n2 : float";
+/* extern void F_WRAPPEDFUNC(snrm2,SNRM2)(float*,int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_snrm2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float snrm2 = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.snrm2",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.snrm2 to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.snrm2() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","snrm2:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.snrm2() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","snrm2:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.snrm2() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","snrm2:n=%d",n) {
+  /* Processing variable snrm2 */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&snrm2, &n,x+offx,&incx) ;
+  /*(*f2py_func)(&snrm2,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("f",snrm2);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable snrm2 */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of snrm2 ********************************/
+
+/*********************************** dnrm2 ***********************************/
+static char doc_f2py_rout_fblas_dnrm2[] = "\
+n2 = dnrm2(x,[n,offx,incx])\n\nWrapper for ``dnrm2``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"n2 : float";
+/* extern void F_WRAPPEDFUNC(dnrm2,DNRM2)(double*,int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dnrm2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double dnrm2 = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.dnrm2",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.dnrm2 to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dnrm2() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","dnrm2:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dnrm2() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","dnrm2:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.dnrm2() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","dnrm2:n=%d",n) {
+  /* Processing variable dnrm2 */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&dnrm2, &n,x+offx,&incx) ;
+  /*(*f2py_func)(&dnrm2,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",dnrm2);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable dnrm2 */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dnrm2 ********************************/
+
+/*********************************** scnrm2 ***********************************/
+static char doc_f2py_rout_fblas_scnrm2[] = "\
+n2 = scnrm2(x,[n,offx,incx])\n\nWrapper for ``scnrm2``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"n2 : float";
+/* extern void F_WRAPPEDFUNC(scnrm2,SCNRM2)(float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_scnrm2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float scnrm2 = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.scnrm2",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.scnrm2 to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.scnrm2() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","scnrm2:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.scnrm2() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","scnrm2:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.scnrm2() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","scnrm2:n=%d",n) {
+  /* Processing variable scnrm2 */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&scnrm2, &n,x+offx,&incx) ;
+  /*(*f2py_func)(&scnrm2,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("f",scnrm2);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable scnrm2 */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of scnrm2 *******************************/
+
+/*********************************** dznrm2 ***********************************/
+static char doc_f2py_rout_fblas_dznrm2[] = "\
+n2 = dznrm2(x,[n,offx,incx])\n\nWrapper for ``dznrm2``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"n2 : float";
+/* extern void F_WRAPPEDFUNC(dznrm2,DZNRM2)(double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_dznrm2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double dznrm2 = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.dznrm2",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.dznrm2 to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dznrm2() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","dznrm2:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dznrm2() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","dznrm2:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.dznrm2() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","dznrm2:n=%d",n) {
+  /* Processing variable dznrm2 */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&dznrm2, &n,x+offx,&incx) ;
+  /*(*f2py_func)(&dznrm2,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",dznrm2);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable dznrm2 */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dznrm2 *******************************/
+
+/*********************************** sasum ***********************************/
+static char doc_f2py_rout_fblas_sasum[] = "\
+s = sasum(x,[n,offx,incx])\n\nWrapper for ``sasum``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"s : float";
+/* extern void F_WRAPPEDFUNC(sasum,SASUM)(float*,int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_sasum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float sasum = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.sasum",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.sasum to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.sasum() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","sasum:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.sasum() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","sasum:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.sasum() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","sasum:n=%d",n) {
+  /* Processing variable sasum */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&sasum,&n,x+offx,&incx) ;
+  /*(*f2py_func)(&sasum,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("f",sasum);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable sasum */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sasum ********************************/
+
+/*********************************** dasum ***********************************/
+static char doc_f2py_rout_fblas_dasum[] = "\
+s = dasum(x,[n,offx,incx])\n\nWrapper for ``dasum``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"s : float";
+/* extern void F_WRAPPEDFUNC(dasum,DASUM)(double*,int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dasum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double dasum = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.dasum",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.dasum to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dasum() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","dasum:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dasum() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","dasum:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.dasum() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","dasum:n=%d",n) {
+  /* Processing variable dasum */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&dasum,&n,x+offx,&incx) ;
+  /*(*f2py_func)(&dasum,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",dasum);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable dasum */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dasum ********************************/
+
+/*********************************** scasum ***********************************/
+static char doc_f2py_rout_fblas_scasum[] = "\
+s = scasum(x,[n,offx,incx])\n\nWrapper for ``scasum``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"s : float";
+/* extern void F_WRAPPEDFUNC(scasum,SCASUM)(float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_scasum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  float scasum = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.scasum",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.scasum to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.scasum() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","scasum:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.scasum() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","scasum:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.scasum() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","scasum:n=%d",n) {
+  /* Processing variable scasum */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&scasum,&n,x+offx,&incx) ;
+  /*(*f2py_func)(&scasum,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("f",scasum);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable scasum */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of scasum *******************************/
+
+/*********************************** dzasum ***********************************/
+static char doc_f2py_rout_fblas_dzasum[] = "\
+s = dzasum(x,[n,offx,incx])\n\nWrapper for ``dzasum``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"s : float";
+/* extern void F_WRAPPEDFUNC(dzasum,DZASUM)(double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_dzasum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double dzasum = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.dzasum",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.dzasum to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dzasum() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","dzasum:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dzasum() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","dzasum:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.dzasum() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","dzasum:n=%d",n) {
+  /* Processing variable dzasum */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&dzasum,&n,x+offx,&incx) ;
+  /*(*f2py_func)(&dzasum,&n,x,&offx,&incx);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",dzasum);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable dzasum */
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dzasum *******************************/
+
+/*********************************** isamax ***********************************/
+static char doc_f2py_rout_fblas_isamax[] = "\
+k = isamax(x,[n,offx,incx])\n\nWrapper for ``isamax``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"k : int";
+/* extern int F_FUNC(isamax,ISAMAX) (int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_isamax(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int isamax_return_value=0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.isamax",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.isamax to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.isamax() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","isamax:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.isamax() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","isamax:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.isamax() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","isamax:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  isamax_return_value = (*f2py_func)(&n,x+offx,&incx) - 1 ;
+/*  isamax_return_value = (*f2py_func)(&n,x,&offx,&incx);*/
+
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",isamax_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of isamax *******************************/
+
+/*********************************** idamax ***********************************/
+static char doc_f2py_rout_fblas_idamax[] = "\
+k = idamax(x,[n,offx,incx])\n\nWrapper for ``idamax``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"k : int";
+/* extern int F_FUNC(idamax,IDAMAX) (int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_idamax(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int idamax_return_value=0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.idamax",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.idamax to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.idamax() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","idamax:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.idamax() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","idamax:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.idamax() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","idamax:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  idamax_return_value = (*f2py_func)(&n,x+offx,&incx) - 1 ;
+/*  idamax_return_value = (*f2py_func)(&n,x,&offx,&incx);*/
+
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",idamax_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of idamax *******************************/
+
+/*********************************** icamax ***********************************/
+static char doc_f2py_rout_fblas_icamax[] = "\
+k = icamax(x,[n,offx,incx])\n\nWrapper for ``icamax``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"k : int";
+/* extern int F_FUNC(icamax,ICAMAX) (int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_icamax(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int icamax_return_value=0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.icamax",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.icamax to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.icamax() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","icamax:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.icamax() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","icamax:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.icamax() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","icamax:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  icamax_return_value = (*f2py_func)(&n,x+offx,&incx) - 1 ;
+/*  icamax_return_value = (*f2py_func)(&n,x,&offx,&incx);*/
+
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",icamax_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of icamax *******************************/
+
+/*********************************** izamax ***********************************/
+static char doc_f2py_rout_fblas_izamax[] = "\
+k = izamax(x,[n,offx,incx])\n\nWrapper for ``izamax``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(x)-offx)/abs(incx)\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"k : int";
+/* extern int F_FUNC(izamax,IZAMAX) (int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_izamax(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int izamax_return_value=0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","offx","incx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOO:fblas.izamax",\
+    capi_kwlist,&x_capi,&n_capi,&offx_capi,&incx_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `x' of fblas.izamax to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.izamax() 3rd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","3rd keyword incx","izamax:incx=%d",incx) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.izamax() 2nd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","2nd keyword offx","izamax:offx=%d",offx) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(x)-offx)/abs(incx); else
+    f2py_success = int_from_pyobj(&n,n_capi,"fblas.izamax() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(x)-offx>(n-1)*abs(incx),"len(x)-offx>(n-1)*abs(incx)","1st keyword n","izamax:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  izamax_return_value = (*f2py_func)(&n,x+offx,&incx) - 1 ;
+/*  izamax_return_value = (*f2py_func)(&n,x,&offx,&incx);*/
+
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",izamax_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)-offx>(n-1)*abs(incx))*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of izamax *******************************/
+
+/*********************************** sgemv ***********************************/
+static char doc_f2py_rout_fblas_sgemv[] = "\
+y = sgemv(alpha,a,x,[beta,y,offx,incx,offy,incy,trans,overwrite_y])\n\nWrapper for ``sgemv``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"a : input rank-2 array('f') with bounds (m,n)\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input float, optional\n    Default: 0.0\n"
+"y : input rank-1 array('f') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('f') with bounds (ly)";
+/* extern void F_FUNC(sgemv,SGEMV)(char*,int*,int*,float*,float*,int*,float*,int*,float*,float*,int* ); */
+static PyObject *f2py_rout_fblas_sgemv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,float*,float*,int*,float*,int*,float*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  float alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  float beta = 0;
+  PyObject *beta_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int rows = 0;
+  int cols = 0;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","trans","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.sgemv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&trans_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.sgemv to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.sgemv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","sgemv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.sgemv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","sgemv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.sgemv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi == Py_None) beta = 0.0; else
+    f2py_success = float_from_pyobj(&beta,beta_capi,"fblas.sgemv() 1st keyword (beta) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = float_from_pyobj(&alpha,alpha_capi,"fblas.sgemv() 1st argument (alpha) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.sgemv() 7th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","7th keyword trans","sgemv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.sgemv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable rows */
+  rows = (trans?n:m);
+  /* Processing variable cols */
+  cols = (trans?m:n);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.sgemv to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(cols-1)*abs(incx),"len(x)>offx+(cols-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(rows-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.sgemv to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(rows-1)*abs(incy),"len(y)>offy+(rows-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans?(trans==2?"C":"T"):"N"),&m,&n,&alpha,a,&m,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&m,&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&trans,&rows,&cols,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(rows-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(cols-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable cols */
+  /* End of cleaning variable rows */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*if (f2py_success) of beta*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sgemv ********************************/
+
+/*********************************** dgemv ***********************************/
+static char doc_f2py_rout_fblas_dgemv[] = "\
+y = dgemv(alpha,a,x,[beta,y,offx,incx,offy,incy,trans,overwrite_y])\n\nWrapper for ``dgemv``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"a : input rank-2 array('d') with bounds (m,n)\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input float, optional\n    Default: 0.0\n"
+"y : input rank-1 array('d') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('d') with bounds (ly)";
+/* extern void F_FUNC(dgemv,DGEMV)(char*,int*,int*,double*,double*,int*,double*,int*,double*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dgemv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,double*,double*,int*,double*,int*,double*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  double alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double beta = 0;
+  PyObject *beta_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int rows = 0;
+  int cols = 0;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","trans","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.dgemv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&trans_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.dgemv to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dgemv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","dgemv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.dgemv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","dgemv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.dgemv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi == Py_None) beta = 0.0; else
+    f2py_success = double_from_pyobj(&beta,beta_capi,"fblas.dgemv() 1st keyword (beta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = double_from_pyobj(&alpha,alpha_capi,"fblas.dgemv() 1st argument (alpha) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.dgemv() 7th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","7th keyword trans","dgemv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dgemv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable rows */
+  rows = (trans?n:m);
+  /* Processing variable cols */
+  cols = (trans?m:n);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.dgemv to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(cols-1)*abs(incx),"len(x)>offx+(cols-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(rows-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.dgemv to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(rows-1)*abs(incy),"len(y)>offy+(rows-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans?(trans==2?"C":"T"):"N"),&m,&n,&alpha,a,&m,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&m,&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&trans,&rows,&cols,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(rows-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(cols-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable cols */
+  /* End of cleaning variable rows */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*if (f2py_success) of beta*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dgemv ********************************/
+
+/*********************************** cgemv ***********************************/
+static char doc_f2py_rout_fblas_cgemv[] = "\
+y = cgemv(alpha,a,x,[beta,y,offx,incx,offy,incy,trans,overwrite_y])\n\nWrapper for ``cgemv``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"a : input rank-2 array('F') with bounds (m,n)\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input complex, optional\n    Default: (0.0, 0.0)\n"
+"y : input rank-1 array('F') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('F') with bounds (ly)";
+/* extern void F_FUNC(cgemv,CGEMV)(char*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_cgemv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_float alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_float beta;
+  PyObject *beta_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int rows = 0;
+  int cols = 0;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","trans","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.cgemv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&trans_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.cgemv to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.cgemv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","cgemv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.cgemv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","cgemv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.cgemv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi==Py_None) {beta.r = 0.0, beta.i =  0.0;} else
+    f2py_success = complex_float_from_pyobj(&beta,beta_capi,"fblas.cgemv() 1st keyword (beta) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = complex_float_from_pyobj(&alpha,alpha_capi,"fblas.cgemv() 1st argument (alpha) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.cgemv() 7th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","7th keyword trans","cgemv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.cgemv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable rows */
+  rows = (trans?n:m);
+  /* Processing variable cols */
+  cols = (trans?m:n);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.cgemv to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(cols-1)*abs(incx),"len(x)>offx+(cols-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(rows-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.cgemv to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(rows-1)*abs(incy),"len(y)>offy+(rows-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans?(trans==2?"C":"T"):"N"),&m,&n,&alpha,a,&m,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&m,&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&trans,&rows,&cols,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(rows-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(cols-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable cols */
+  /* End of cleaning variable rows */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  }  /*if (f2py_success) of beta frompyobj*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgemv ********************************/
+
+/*********************************** zgemv ***********************************/
+static char doc_f2py_rout_fblas_zgemv[] = "\
+y = zgemv(alpha,a,x,[beta,y,offx,incx,offy,incy,trans,overwrite_y])\n\nWrapper for ``zgemv``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"a : input rank-2 array('D') with bounds (m,n)\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input complex, optional\n    Default: (0.0, 0.0)\n"
+"y : input rank-1 array('D') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('D') with bounds (ly)";
+/* extern void F_FUNC(zgemv,ZGEMV)(char*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zgemv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_double alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_double beta;
+  PyObject *beta_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int rows = 0;
+  int cols = 0;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","trans","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.zgemv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&trans_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.zgemv to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zgemv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","zgemv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zgemv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","zgemv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zgemv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi==Py_None) {beta.r = 0.0, beta.i =  0.0;} else
+    f2py_success = complex_double_from_pyobj(&beta,beta_capi,"fblas.zgemv() 1st keyword (beta) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = complex_double_from_pyobj(&alpha,alpha_capi,"fblas.zgemv() 1st argument (alpha) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.zgemv() 7th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","7th keyword trans","zgemv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zgemv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable rows */
+  rows = (trans?n:m);
+  /* Processing variable cols */
+  cols = (trans?m:n);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.zgemv to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(cols-1)*abs(incx),"len(x)>offx+(cols-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(rows-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.zgemv to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(rows-1)*abs(incy),"len(y)>offy+(rows-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans?(trans==2?"C":"T"):"N"),&m,&n,&alpha,a,&m,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&m,&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&trans,&rows,&cols,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(rows-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(cols-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable cols */
+  /* End of cleaning variable rows */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  }  /*if (f2py_success) of beta frompyobj*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgemv ********************************/
+
+/*********************************** ssymv ***********************************/
+static char doc_f2py_rout_fblas_ssymv[] = "\
+y = ssymv(alpha,a,x,[beta,y,offx,incx,offy,incy,lower,overwrite_y])\n\nWrapper for ``ssymv``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input float, optional\n    Default: 0.0\n"
+"y : input rank-1 array('f') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('f') with bounds (ly)";
+/* extern void F_FUNC(ssymv,SSYMV)(char*,int*,float*,float*,int*,float*,int*,float*,float*,int* ); */
+static PyObject *f2py_rout_fblas_ssymv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,float*,float*,int*,float*,int*,float*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  float beta = 0;
+  PyObject *beta_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","lower","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.ssymv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&lower_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.ssymv to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.ssymv() 7th keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","7th keyword lower","ssymv:lower=%d",lower) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.ssymv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","ssymv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.ssymv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","ssymv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.ssymv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi == Py_None) beta = 0.0; else
+    f2py_success = float_from_pyobj(&beta,beta_capi,"fblas.ssymv() 1st keyword (beta) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = float_from_pyobj(&alpha,alpha_capi,"fblas.ssymv() 1st argument (alpha) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.ssymv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.ssymv to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(n-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.ssymv to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(n-1)*abs(incy),"len(y)>offy+(n-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&alpha,a,&n,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&lower,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(n-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(n-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*if (f2py_success) of beta*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of ssymv ********************************/
+
+/*********************************** dsymv ***********************************/
+static char doc_f2py_rout_fblas_dsymv[] = "\
+y = dsymv(alpha,a,x,[beta,y,offx,incx,offy,incy,lower,overwrite_y])\n\nWrapper for ``dsymv``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input float, optional\n    Default: 0.0\n"
+"y : input rank-1 array('d') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('d') with bounds (ly)";
+/* extern void F_FUNC(dsymv,DSYMV)(char*,int*,double*,double*,int*,double*,int*,double*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dsymv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,double*,double*,int*,double*,int*,double*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double beta = 0;
+  PyObject *beta_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","lower","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.dsymv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&lower_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.dsymv to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.dsymv() 7th keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","7th keyword lower","dsymv:lower=%d",lower) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dsymv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","dsymv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.dsymv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","dsymv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.dsymv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi == Py_None) beta = 0.0; else
+    f2py_success = double_from_pyobj(&beta,beta_capi,"fblas.dsymv() 1st keyword (beta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = double_from_pyobj(&alpha,alpha_capi,"fblas.dsymv() 1st argument (alpha) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dsymv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.dsymv to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(n-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.dsymv to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(n-1)*abs(incy),"len(y)>offy+(n-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&alpha,a,&n,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&lower,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(n-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(n-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*if (f2py_success) of beta*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dsymv ********************************/
+
+/*********************************** chemv ***********************************/
+static char doc_f2py_rout_fblas_chemv[] = "\
+y = chemv(alpha,a,x,[beta,y,offx,incx,offy,incy,lower,overwrite_y])\n\nWrapper for ``chemv``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input complex, optional\n    Default: (0.0, 0.0)\n"
+"y : input rank-1 array('F') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('F') with bounds (ly)";
+/* extern void F_FUNC(chemv,CHEMV)(char*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_chemv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_float beta;
+  PyObject *beta_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","lower","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.chemv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&lower_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.chemv to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.chemv() 7th keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","7th keyword lower","chemv:lower=%d",lower) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.chemv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","chemv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.chemv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","chemv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.chemv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi==Py_None) {beta.r = 0.0, beta.i =  0.0;} else
+    f2py_success = complex_float_from_pyobj(&beta,beta_capi,"fblas.chemv() 1st keyword (beta) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = complex_float_from_pyobj(&alpha,alpha_capi,"fblas.chemv() 1st argument (alpha) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.chemv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.chemv to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(n-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.chemv to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(n-1)*abs(incy),"len(y)>offy+(n-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&alpha,a,&n,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&lower,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(n-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(n-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  }  /*if (f2py_success) of beta frompyobj*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of chemv ********************************/
+
+/*********************************** zhemv ***********************************/
+static char doc_f2py_rout_fblas_zhemv[] = "\
+y = zhemv(alpha,a,x,[beta,y,offx,incx,offy,incy,lower,overwrite_y])\n\nWrapper for ``zhemv``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input complex, optional\n    Default: (0.0, 0.0)\n"
+"y : input rank-1 array('D') with bounds (ly)\n"
+"overwrite_y : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"offy : input int, optional\n    Default: 0\n"
+"incy : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('D') with bounds (ly)";
+/* extern void F_FUNC(zhemv,ZHEMV)(char*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zhemv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_double beta;
+  PyObject *beta_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 0;
+  PyObject *y_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int offy = 0;
+  PyObject *offy_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int ly = 0;
+  static char *capi_kwlist[] = {"alpha","a","x","beta","y","offx","incx","offy","incy","lower","overwrite_y",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOOOOi:fblas.zhemv",\
+    capi_kwlist,&alpha_capi,&a_capi,&x_capi,&beta_capi,&y_capi,&offx_capi,&incx_capi,&offy_capi,&incy_capi,&lower_capi,&capi_overwrite_y))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.zhemv to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.zhemv() 7th keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","7th keyword lower","zhemv:lower=%d",lower) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zhemv() 4th keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","4th keyword incx","zhemv:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zhemv() 6th keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy>0||incy<0,"incy>0||incy<0","6th keyword incy","zhemv:incy=%d",incy) {
+  /* Processing variable offy */
+  if (offy_capi == Py_None) offy = 0; else
+    f2py_success = int_from_pyobj(&offy,offy_capi,"fblas.zhemv() 5th keyword (offy) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable beta */
+  if (beta_capi==Py_None) {beta.r = 0.0, beta.i =  0.0;} else
+    f2py_success = complex_double_from_pyobj(&beta,beta_capi,"fblas.zhemv() 1st keyword (beta) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = complex_double_from_pyobj(&alpha,alpha_capi,"fblas.zhemv() 1st argument (alpha) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.zhemv() 3rd keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `x' of fblas.zhemv to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  CHECKARRAY(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","3rd argument x") {
+  CHECKARRAY(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","3rd argument x") {
+  /* Processing variable ly */
+  ly = (y_capi==Py_None?1+offy+(n-1)*abs(incy):-1);
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  y_Dims[0]=ly;
+  capi_y_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `y' of fblas.zhemv to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  CHECKARRAY(len(y)>offy+(n-1)*abs(incy),"len(y)>offy+(n-1)*abs(incy)","2nd keyword y") {
+  CHECKARRAY(offy>=0 && offy<len(y),"offy>=0 && offy<len(y)","2nd keyword y") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&alpha,a,&n,x+offx,&incx,&beta,y+offy,&incy) ;
+        /*(*f2py_func)(&n,&alpha,a,x,&beta,y,&offx,&incx,&offy,&incy,&lower,&ly);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(offy>=0 && offy<len(y))*/
+  } /*CHECKARRAY(len(y)>offy+(n-1)*abs(incy))*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable ly */
+  } /*CHECKARRAY(offx>=0 && offx<len(x))*/
+  } /*CHECKARRAY(len(x)>offx+(n-1)*abs(incx))*/
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  }  /*if (f2py_success) of beta frompyobj*/
+  /* End of cleaning variable beta */
+  } /*if (f2py_success) of offy*/
+  /* End of cleaning variable offy */
+  } /*CHECKSCALAR(incy>0||incy<0)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zhemv ********************************/
+
+/*********************************** strmv ***********************************/
+static char doc_f2py_rout_fblas_strmv[] = "\
+x = strmv(a,x,[offx,incx,lower,trans,unitdiag,overwrite_x])\n\nWrapper for ``strmv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"x : input rank-1 array('f') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (*)";
+/* extern void F_FUNC(strmv,STRMV)(char*,char*,char*,int*,float*,int*,float*,int* ); */
+static PyObject *f2py_rout_fblas_strmv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","offx","incx","lower","trans","unitdiag","overwrite_x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOi:fblas.strmv",\
+    capi_kwlist,&a_capi,&x_capi,&offx_capi,&incx_capi,&lower_capi,&trans_capi,&unitdiag_capi,&capi_overwrite_x))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `a' of fblas.strmv to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.strmv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","3rd keyword lower","strmv:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"fblas.strmv() 5th keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","5th keyword unitdiag","strmv:unitdiag=%d",unitdiag) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.strmv() 2nd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","2nd keyword incx","strmv:incx=%d",incx) {
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.strmv to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.strmv() 4th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","4th keyword trans","strmv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.strmv() 1st keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","1st keyword offx","strmv:offx=%d",offx) {
+  /* Processing variable n */
+  n = shape(a,0);
+  CHECKSCALAR(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","hidden n","strmv:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(trans?(trans==2?"C":"T"):"N"),(unitdiag?"U":"N"),&n,a,&n,x+offx,&incx) ;
+        /*(*f2py_func)(&n,a,x,&offx,&incx,&lower,&trans,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)>offx+(n-1)*abs(incx))*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of strmv ********************************/
+
+/*********************************** dtrmv ***********************************/
+static char doc_f2py_rout_fblas_dtrmv[] = "\
+x = dtrmv(a,x,[offx,incx,lower,trans,unitdiag,overwrite_x])\n\nWrapper for ``dtrmv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"x : input rank-1 array('d') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(dtrmv,DTRMV)(char*,char*,char*,int*,double*,int*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dtrmv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","offx","incx","lower","trans","unitdiag","overwrite_x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOi:fblas.dtrmv",\
+    capi_kwlist,&a_capi,&x_capi,&offx_capi,&incx_capi,&lower_capi,&trans_capi,&unitdiag_capi,&capi_overwrite_x))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `a' of fblas.dtrmv to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.dtrmv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","3rd keyword lower","dtrmv:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"fblas.dtrmv() 5th keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","5th keyword unitdiag","dtrmv:unitdiag=%d",unitdiag) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dtrmv() 2nd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","2nd keyword incx","dtrmv:incx=%d",incx) {
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.dtrmv to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.dtrmv() 4th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","4th keyword trans","dtrmv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.dtrmv() 1st keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","1st keyword offx","dtrmv:offx=%d",offx) {
+  /* Processing variable n */
+  n = shape(a,0);
+  CHECKSCALAR(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","hidden n","dtrmv:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(trans?(trans==2?"C":"T"):"N"),(unitdiag?"U":"N"),&n,a,&n,x+offx,&incx) ;
+        /*(*f2py_func)(&n,a,x,&offx,&incx,&lower,&trans,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)>offx+(n-1)*abs(incx))*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dtrmv ********************************/
+
+/*********************************** ctrmv ***********************************/
+static char doc_f2py_rout_fblas_ctrmv[] = "\
+x = ctrmv(a,x,[offx,incx,lower,trans,unitdiag,overwrite_x])\n\nWrapper for ``ctrmv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"x : input rank-1 array('F') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (*)";
+/* extern void F_FUNC(ctrmv,CTRMV)(char*,char*,char*,int*,complex_float*,int*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_ctrmv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,complex_float*,int*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","offx","incx","lower","trans","unitdiag","overwrite_x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOi:fblas.ctrmv",\
+    capi_kwlist,&a_capi,&x_capi,&offx_capi,&incx_capi,&lower_capi,&trans_capi,&unitdiag_capi,&capi_overwrite_x))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `a' of fblas.ctrmv to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.ctrmv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","3rd keyword lower","ctrmv:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"fblas.ctrmv() 5th keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","5th keyword unitdiag","ctrmv:unitdiag=%d",unitdiag) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.ctrmv() 2nd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","2nd keyword incx","ctrmv:incx=%d",incx) {
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.ctrmv to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.ctrmv() 4th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","4th keyword trans","ctrmv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.ctrmv() 1st keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","1st keyword offx","ctrmv:offx=%d",offx) {
+  /* Processing variable n */
+  n = shape(a,0);
+  CHECKSCALAR(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","hidden n","ctrmv:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(trans?(trans==2?"C":"T"):"N"),(unitdiag?"U":"N"),&n,a,&n,x+offx,&incx) ;
+        /*(*f2py_func)(&n,a,x,&offx,&incx,&lower,&trans,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)>offx+(n-1)*abs(incx))*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of ctrmv ********************************/
+
+/*********************************** ztrmv ***********************************/
+static char doc_f2py_rout_fblas_ztrmv[] = "\
+x = ztrmv(a,x,[offx,incx,lower,trans,unitdiag,overwrite_x])\n\nWrapper for ``ztrmv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"x : input rank-1 array('D') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 0\n"
+"offx : input int, optional\n    Default: 0\n"
+"incx : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(ztrmv,ZTRMV)(char*,char*,char*,int*,complex_double*,int*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_ztrmv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,complex_double*,int*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 0;
+  PyObject *x_capi = Py_None;
+  int offx = 0;
+  PyObject *offx_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"a","x","offx","incx","lower","trans","unitdiag","overwrite_x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOOi:fblas.ztrmv",\
+    capi_kwlist,&a_capi,&x_capi,&offx_capi,&incx_capi,&lower_capi,&trans_capi,&unitdiag_capi,&capi_overwrite_x))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 1st argument `a' of fblas.ztrmv to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"fblas.ztrmv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","3rd keyword lower","ztrmv:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"fblas.ztrmv() 5th keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","5th keyword unitdiag","ztrmv:unitdiag=%d",unitdiag) {
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.ztrmv() 2nd keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx>0||incx<0,"incx>0||incx<0","2nd keyword incx","ztrmv:incx=%d",incx) {
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.ztrmv to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"fblas.ztrmv() 4th keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","4th keyword trans","ztrmv:trans=%d",trans) {
+  /* Processing variable offx */
+  if (offx_capi == Py_None) offx = 0; else
+    f2py_success = int_from_pyobj(&offx,offx_capi,"fblas.ztrmv() 1st keyword (offx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(offx>=0 && offx<len(x),"offx>=0 && offx<len(x)","1st keyword offx","ztrmv:offx=%d",offx) {
+  /* Processing variable n */
+  n = shape(a,0);
+  CHECKSCALAR(len(x)>offx+(n-1)*abs(incx),"len(x)>offx+(n-1)*abs(incx)","hidden n","ztrmv:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(trans?(trans==2?"C":"T"):"N"),(unitdiag?"U":"N"),&n,a,&n,x+offx,&incx) ;
+        /*(*f2py_func)(&n,a,x,&offx,&incx,&lower,&trans,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_x_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(x)>offx+(n-1)*abs(incx))*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(offx>=0 && offx<len(x))*/
+  } /*if (f2py_success) of offx*/
+  /* End of cleaning variable offx */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR(incx>0||incx<0)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of ztrmv ********************************/
+
+/************************************ sger ************************************/
+static char doc_f2py_rout_fblas_sger[] = "\
+a = sger(alpha,x,y,[incx,incy,a,overwrite_x,overwrite_y,overwrite_a])\n\nWrapper for ``sger``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"x : input rank-1 array('f') with bounds (m)\n"
+"y : input rank-1 array('f') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 1\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 1\n"
+"incy : input int, optional\n    Default: 1\n"
+"a : input rank-2 array('f') with bounds (m,n), optional\n    Default: 0.0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('f') with bounds (m,n)";
+/* extern void F_FUNC(sger,SGER)(int*,int*,float*,float*,int*,float*,int*,float*,int*); */
+static PyObject *f2py_rout_fblas_sger(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,float*,int*,float*,int*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  float alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 1;
+  PyObject *x_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 1;
+  PyObject *y_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int lda = 0;
+  static char *capi_kwlist[] = {"alpha","x","y","incx","incy","a","overwrite_x","overwrite_y","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOiii:fblas.sger",\
+    capi_kwlist,&alpha_capi,&x_capi,&y_capi,&incx_capi,&incy_capi,&a_capi,&capi_overwrite_x,&capi_overwrite_y,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.sger() 1st keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx==1||incx==-1,"incx==1||incx==-1","1st keyword incx","sger:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.sger() 2nd keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy==1||incy==-1,"incy==1||incy==-1","2nd keyword incy","sger:incy=%d",incy) {
+  /* Processing variable alpha */
+    f2py_success = float_from_pyobj(&alpha,alpha_capi,"fblas.sger() 1st argument (alpha) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_FLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `y' of fblas.sger to C/Fortran array" );
+  } else {
+    y = (float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.sger to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(y);
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  a_Dims[0]=m,a_Dims[1]=n;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd keyword `a' of fblas.sger to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  if (a_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("sger: Initializing a=0.0\n");
+    if (initforcomb(PyArray_DIMS(capi_a_tmp),PyArray_NDIM(capi_a_tmp),1)) {
+      while ((_i = nextforcomb()))
+        a[capi_i++] = 0.0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(fblas_error,"Initialization of 3rd keyword a failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable lda */
+  lda = m;
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&alpha,x,&incx,y,&incy,a,&lda);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable lda */
+  }  /*if (f2py_success) of a init*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*CHECKSCALAR(incy==1||incy==-1)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx==1||incx==-1)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sger ********************************/
+
+/************************************ dger ************************************/
+static char doc_f2py_rout_fblas_dger[] = "\
+a = dger(alpha,x,y,[incx,incy,a,overwrite_x,overwrite_y,overwrite_a])\n\nWrapper for ``dger``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"x : input rank-1 array('d') with bounds (m)\n"
+"y : input rank-1 array('d') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 1\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 1\n"
+"incy : input int, optional\n    Default: 1\n"
+"a : input rank-2 array('d') with bounds (m,n), optional\n    Default: 0.0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('d') with bounds (m,n)";
+/* extern void F_FUNC(dger,DGER)(int*,int*,double*,double*,int*,double*,int*,double*,int*); */
+static PyObject *f2py_rout_fblas_dger(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,int*,double*,int*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  double alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 1;
+  PyObject *x_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 1;
+  PyObject *y_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int lda = 0;
+  static char *capi_kwlist[] = {"alpha","x","y","incx","incy","a","overwrite_x","overwrite_y","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOiii:fblas.dger",\
+    capi_kwlist,&alpha_capi,&x_capi,&y_capi,&incx_capi,&incy_capi,&a_capi,&capi_overwrite_x,&capi_overwrite_y,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.dger() 1st keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx==1||incx==-1,"incx==1||incx==-1","1st keyword incx","dger:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.dger() 2nd keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy==1||incy==-1,"incy==1||incy==-1","2nd keyword incy","dger:incy=%d",incy) {
+  /* Processing variable alpha */
+    f2py_success = double_from_pyobj(&alpha,alpha_capi,"fblas.dger() 1st argument (alpha) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `y' of fblas.dger to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.dger to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(y);
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  a_Dims[0]=m,a_Dims[1]=n;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd keyword `a' of fblas.dger to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  if (a_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("dger: Initializing a=0.0\n");
+    if (initforcomb(PyArray_DIMS(capi_a_tmp),PyArray_NDIM(capi_a_tmp),1)) {
+      while ((_i = nextforcomb()))
+        a[capi_i++] = 0.0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(fblas_error,"Initialization of 3rd keyword a failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable lda */
+  lda = m;
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&alpha,x,&incx,y,&incy,a,&lda);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable lda */
+  }  /*if (f2py_success) of a init*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*CHECKSCALAR(incy==1||incy==-1)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx==1||incx==-1)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dger ********************************/
+
+/*********************************** cgeru ***********************************/
+static char doc_f2py_rout_fblas_cgeru[] = "\
+a = cgeru(alpha,x,y,[incx,incy,a,overwrite_x,overwrite_y,overwrite_a])\n\nWrapper for ``cgeru``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"x : input rank-1 array('F') with bounds (m)\n"
+"y : input rank-1 array('F') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 1\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 1\n"
+"incy : input int, optional\n    Default: 1\n"
+"a : input rank-2 array('F') with bounds (m,n), optional\n    Default: (0.0,0.0)\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('F') with bounds (m,n)";
+/* extern void F_FUNC(cgeru,CGERU)(int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*); */
+static PyObject *f2py_rout_fblas_cgeru(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_float alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 1;
+  PyObject *x_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 1;
+  PyObject *y_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int lda = 0;
+  static char *capi_kwlist[] = {"alpha","x","y","incx","incy","a","overwrite_x","overwrite_y","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOiii:fblas.cgeru",\
+    capi_kwlist,&alpha_capi,&x_capi,&y_capi,&incx_capi,&incy_capi,&a_capi,&capi_overwrite_x,&capi_overwrite_y,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.cgeru() 1st keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx==1||incx==-1,"incx==1||incx==-1","1st keyword incx","cgeru:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.cgeru() 2nd keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy==1||incy==-1,"incy==1||incy==-1","2nd keyword incy","cgeru:incy=%d",incy) {
+  /* Processing variable alpha */
+    f2py_success = complex_float_from_pyobj(&alpha,alpha_capi,"fblas.cgeru() 1st argument (alpha) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `y' of fblas.cgeru to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.cgeru to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(y);
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  a_Dims[0]=m,a_Dims[1]=n;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd keyword `a' of fblas.cgeru to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  if (a_capi == Py_None) {
+
+    complex_float capi_c;
+    int *_i,capi_i=0;
+    CFUNCSMESS("cgeru: Initializing a=(capi_c.r=0.0,capi_c.i=0.0,capi_c)\n");
+    if (initforcomb(PyArray_DIMS(capi_a_tmp),PyArray_NDIM(capi_a_tmp),1)) {
+      while ((_i = nextforcomb()))
+        a[capi_i++] = (capi_c.r=0.0,capi_c.i=0.0,capi_c); /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(fblas_error,"Initialization of 3rd keyword a failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable lda */
+  lda = m;
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&alpha,x,&incx,y,&incy,a,&lda);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable lda */
+  }  /*if (f2py_success) of a init*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  } /*CHECKSCALAR(incy==1||incy==-1)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx==1||incx==-1)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgeru ********************************/
+
+/*********************************** zgeru ***********************************/
+static char doc_f2py_rout_fblas_zgeru[] = "\
+a = zgeru(alpha,x,y,[incx,incy,a,overwrite_x,overwrite_y,overwrite_a])\n\nWrapper for ``zgeru``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"x : input rank-1 array('D') with bounds (m)\n"
+"y : input rank-1 array('D') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 1\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 1\n"
+"incy : input int, optional\n    Default: 1\n"
+"a : input rank-2 array('D') with bounds (m,n), optional\n    Default: (0.0,0.0)\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('D') with bounds (m,n)";
+/* extern void F_FUNC(zgeru,ZGERU)(int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*); */
+static PyObject *f2py_rout_fblas_zgeru(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_double alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 1;
+  PyObject *x_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 1;
+  PyObject *y_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int lda = 0;
+  static char *capi_kwlist[] = {"alpha","x","y","incx","incy","a","overwrite_x","overwrite_y","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOiii:fblas.zgeru",\
+    capi_kwlist,&alpha_capi,&x_capi,&y_capi,&incx_capi,&incy_capi,&a_capi,&capi_overwrite_x,&capi_overwrite_y,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zgeru() 1st keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx==1||incx==-1,"incx==1||incx==-1","1st keyword incx","zgeru:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zgeru() 2nd keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy==1||incy==-1,"incy==1||incy==-1","2nd keyword incy","zgeru:incy=%d",incy) {
+  /* Processing variable alpha */
+    f2py_success = complex_double_from_pyobj(&alpha,alpha_capi,"fblas.zgeru() 1st argument (alpha) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `y' of fblas.zgeru to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.zgeru to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(y);
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  a_Dims[0]=m,a_Dims[1]=n;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd keyword `a' of fblas.zgeru to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  if (a_capi == Py_None) {
+
+    complex_double capi_c;
+    int *_i,capi_i=0;
+    CFUNCSMESS("zgeru: Initializing a=(capi_c.r=0.0,capi_c.i=0.0,capi_c)\n");
+    if (initforcomb(PyArray_DIMS(capi_a_tmp),PyArray_NDIM(capi_a_tmp),1)) {
+      while ((_i = nextforcomb()))
+        a[capi_i++] = (capi_c.r=0.0,capi_c.i=0.0,capi_c); /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(fblas_error,"Initialization of 3rd keyword a failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable lda */
+  lda = m;
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&alpha,x,&incx,y,&incy,a,&lda);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable lda */
+  }  /*if (f2py_success) of a init*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  } /*CHECKSCALAR(incy==1||incy==-1)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx==1||incx==-1)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgeru ********************************/
+
+/*********************************** cgerc ***********************************/
+static char doc_f2py_rout_fblas_cgerc[] = "\
+a = cgerc(alpha,x,y,[incx,incy,a,overwrite_x,overwrite_y,overwrite_a])\n\nWrapper for ``cgerc``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"x : input rank-1 array('F') with bounds (m)\n"
+"y : input rank-1 array('F') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 1\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 1\n"
+"incy : input int, optional\n    Default: 1\n"
+"a : input rank-2 array('F') with bounds (m,n), optional\n    Default: (0.0,0.0)\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('F') with bounds (m,n)";
+/* extern void F_FUNC(cgerc,CGERC)(int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*); */
+static PyObject *f2py_rout_fblas_cgerc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_float alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 1;
+  PyObject *x_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_float *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 1;
+  PyObject *y_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int lda = 0;
+  static char *capi_kwlist[] = {"alpha","x","y","incx","incy","a","overwrite_x","overwrite_y","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOiii:fblas.cgerc",\
+    capi_kwlist,&alpha_capi,&x_capi,&y_capi,&incx_capi,&incy_capi,&a_capi,&capi_overwrite_x,&capi_overwrite_y,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.cgerc() 1st keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx==1||incx==-1,"incx==1||incx==-1","1st keyword incx","cgerc:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.cgerc() 2nd keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy==1||incy==-1,"incy==1||incy==-1","2nd keyword incy","cgerc:incy=%d",incy) {
+  /* Processing variable alpha */
+    f2py_success = complex_float_from_pyobj(&alpha,alpha_capi,"fblas.cgerc() 1st argument (alpha) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CFLOAT,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `y' of fblas.cgerc to C/Fortran array" );
+  } else {
+    y = (complex_float *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.cgerc to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(y);
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  a_Dims[0]=m,a_Dims[1]=n;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd keyword `a' of fblas.cgerc to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  if (a_capi == Py_None) {
+
+    complex_float capi_c;
+    int *_i,capi_i=0;
+    CFUNCSMESS("cgerc: Initializing a=(capi_c.r=0.0,capi_c.i=0.0,capi_c)\n");
+    if (initforcomb(PyArray_DIMS(capi_a_tmp),PyArray_NDIM(capi_a_tmp),1)) {
+      while ((_i = nextforcomb()))
+        a[capi_i++] = (capi_c.r=0.0,capi_c.i=0.0,capi_c); /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(fblas_error,"Initialization of 3rd keyword a failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable lda */
+  lda = m;
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&alpha,x,&incx,y,&incy,a,&lda);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable lda */
+  }  /*if (f2py_success) of a init*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  } /*CHECKSCALAR(incy==1||incy==-1)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx==1||incx==-1)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgerc ********************************/
+
+/*********************************** zgerc ***********************************/
+static char doc_f2py_rout_fblas_zgerc[] = "\
+a = zgerc(alpha,x,y,[incx,incy,a,overwrite_x,overwrite_y,overwrite_a])\n\nWrapper for ``zgerc``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"x : input rank-1 array('D') with bounds (m)\n"
+"y : input rank-1 array('D') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_x : input int, optional\n    Default: 1\n"
+"incx : input int, optional\n    Default: 1\n"
+"overwrite_y : input int, optional\n    Default: 1\n"
+"incy : input int, optional\n    Default: 1\n"
+"a : input rank-2 array('D') with bounds (m,n), optional\n    Default: (0.0,0.0)\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('D') with bounds (m,n)";
+/* extern void F_FUNC(zgerc,ZGERC)(int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*); */
+static PyObject *f2py_rout_fblas_zgerc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_double alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  int capi_overwrite_x = 1;
+  PyObject *x_capi = Py_None;
+  int incx = 0;
+  PyObject *incx_capi = Py_None;
+  complex_double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  int capi_overwrite_y = 1;
+  PyObject *y_capi = Py_None;
+  int incy = 0;
+  PyObject *incy_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int lda = 0;
+  static char *capi_kwlist[] = {"alpha","x","y","incx","incy","a","overwrite_x","overwrite_y","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOiii:fblas.zgerc",\
+    capi_kwlist,&alpha_capi,&x_capi,&y_capi,&incx_capi,&incy_capi,&a_capi,&capi_overwrite_x,&capi_overwrite_y,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable incx */
+  if (incx_capi == Py_None) incx = 1; else
+    f2py_success = int_from_pyobj(&incx,incx_capi,"fblas.zgerc() 1st keyword (incx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incx==1||incx==-1,"incx==1||incx==-1","1st keyword incx","zgerc:incx=%d",incx) {
+  /* Processing variable incy */
+  if (incy_capi == Py_None) incy = 1; else
+    f2py_success = int_from_pyobj(&incy,incy_capi,"fblas.zgerc() 2nd keyword (incy) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(incy==1||incy==-1,"incy==1||incy==-1","2nd keyword incy","zgerc:incy=%d",incy) {
+  /* Processing variable alpha */
+    f2py_success = complex_double_from_pyobj(&alpha,alpha_capi,"fblas.zgerc() 1st argument (alpha) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable y */
+  capi_y_intent |= (capi_overwrite_y?0:F2PY_INTENT_COPY);
+  ;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_CDOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `y' of fblas.zgerc to C/Fortran array" );
+  } else {
+    y = (complex_double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable x */
+  capi_x_intent |= (capi_overwrite_x?0:F2PY_INTENT_COPY);
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `x' of fblas.zgerc to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable m */
+  m = len(x);
+  /* Processing variable n */
+  n = len(y);
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  a_Dims[0]=m,a_Dims[1]=n;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd keyword `a' of fblas.zgerc to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  if (a_capi == Py_None) {
+
+    complex_double capi_c;
+    int *_i,capi_i=0;
+    CFUNCSMESS("zgerc: Initializing a=(capi_c.r=0.0,capi_c.i=0.0,capi_c)\n");
+    if (initforcomb(PyArray_DIMS(capi_a_tmp),PyArray_NDIM(capi_a_tmp),1)) {
+      while ((_i = nextforcomb()))
+        a[capi_i++] = (capi_c.r=0.0,capi_c.i=0.0,capi_c); /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(fblas_error,"Initialization of 3rd keyword a failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable lda */
+  lda = m;
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&alpha,x,&incx,y,&incy,a,&lda);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable lda */
+  }  /*if (f2py_success) of a init*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  } /*CHECKSCALAR(incy==1||incy==-1)*/
+  } /*if (f2py_success) of incy*/
+  /* End of cleaning variable incy */
+  } /*CHECKSCALAR(incx==1||incx==-1)*/
+  } /*if (f2py_success) of incx*/
+  /* End of cleaning variable incx */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgerc ********************************/
+
+/*********************************** sgemm ***********************************/
+static char doc_f2py_rout_fblas_sgemm[] = "\
+c = sgemm(alpha,a,b,[beta,c,trans_a,trans_b,overwrite_c])\n\nWrapper for ``sgemm``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"a : input rank-2 array('f') with bounds (lda,ka)\n"
+"b : input rank-2 array('f') with bounds (ldb,kb)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input float, optional\n    Default: 0.0\n"
+"c : input rank-2 array('f') with bounds (m,n)\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"trans_a : input int, optional\n    Default: 0\n"
+"trans_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('f') with bounds (m,n)";
+/* extern void F_FUNC(sgemm,SGEMM)(char*,char*,int*,int*,int*,float*,float*,int*,float*,int*,float*,float*,int* ); */
+static PyObject *f2py_rout_fblas_sgemm(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,int*,int*,float*,float*,int*,float*,int*,float*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  float alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float beta = 0;
+  PyObject *beta_capi = Py_None;
+  float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int trans_a = 0;
+  PyObject *trans_a_capi = Py_None;
+  int trans_b = 0;
+  PyObject *trans_b_capi = Py_None;
+  int lda = 0;
+  int ka = 0;
+  int ldb = 0;
+  int kb = 0;
+  static char *capi_kwlist[] = {"alpha","a","b","beta","c","trans_a","trans_b","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOi:fblas.sgemm",\
+    capi_kwlist,&alpha_capi,&a_capi,&b_capi,&beta_capi,&c_capi,&trans_a_capi,&trans_b_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.sgemm to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `b' of fblas.sgemm to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable trans_a */
+  if (trans_a_capi == Py_None) trans_a = 0; else
+    f2py_success = int_from_pyobj(&trans_a,trans_a_capi,"fblas.sgemm() 3rd keyword (trans_a) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_a>=0 && trans_a <=2,"trans_a>=0 && trans_a <=2","3rd keyword trans_a","sgemm:trans_a=%d",trans_a) {
+  /* Processing variable trans_b */
+  if (trans_b_capi == Py_None) trans_b = 0; else
+    f2py_success = int_from_pyobj(&trans_b,trans_b_capi,"fblas.sgemm() 4th keyword (trans_b) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_b>=0 && trans_b <=2,"trans_b>=0 && trans_b <=2","4th keyword trans_b","sgemm:trans_b=%d",trans_b) {
+  /* Processing variable beta */
+  if (beta_capi == Py_None) beta = 0.0; else
+    f2py_success = float_from_pyobj(&beta,beta_capi,"fblas.sgemm() 1st keyword (beta) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = float_from_pyobj(&alpha,alpha_capi,"fblas.sgemm() 1st argument (alpha) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable kb */
+  kb = shape(b,1);
+  /* Processing variable ka */
+  ka = shape(a,1);
+  /* Processing variable ldb */
+  ldb = shape(b,0);
+  /* Processing variable lda */
+  lda = shape(a,0);
+  /* Processing variable k */
+  k = (trans_a?lda:ka);
+  /* Processing variable m */
+  m = (trans_a?ka:lda);
+  /* Processing variable n */
+  n = (trans_b?ldb:kb);
+  CHECKSCALAR(trans_b?kb==k:ldb==k,"trans_b?kb==k:ldb==k","hidden n","sgemm:n=%d",n) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  c_Dims[0]=m,c_Dims[1]=n;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_FLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `c' of fblas.sgemm to C/Fortran array" );
+  } else {
+    c = (float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==m && shape(c,1)==n,"shape(c,0)==m && shape(c,1)==n","2nd keyword c") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans_a?(trans_a==2?"C":"T"):"N"),(trans_b?(trans_b==2?"C":"T"):"N"),&m,&n,&k,&alpha,a,&lda,b,&ldb,&beta,c,&m) ;
+        /*(*f2py_func)(&m,&n,&k,&alpha,a,b,&beta,c,&trans_a,&trans_b,&lda,&ka,&ldb,&kb);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_c_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(shape(c,0)==m && shape(c,1)==n)*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(trans_b?kb==k:ldb==k)*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable k */
+  /* End of cleaning variable lda */
+  /* End of cleaning variable ldb */
+  /* End of cleaning variable ka */
+  /* End of cleaning variable kb */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*if (f2py_success) of beta*/
+  /* End of cleaning variable beta */
+  } /*CHECKSCALAR(trans_b>=0 && trans_b <=2)*/
+  } /*if (f2py_success) of trans_b*/
+  /* End of cleaning variable trans_b */
+  } /*CHECKSCALAR(trans_a>=0 && trans_a <=2)*/
+  } /*if (f2py_success) of trans_a*/
+  /* End of cleaning variable trans_a */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sgemm ********************************/
+
+/*********************************** dgemm ***********************************/
+static char doc_f2py_rout_fblas_dgemm[] = "\
+c = dgemm(alpha,a,b,[beta,c,trans_a,trans_b,overwrite_c])\n\nWrapper for ``dgemm``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"a : input rank-2 array('d') with bounds (lda,ka)\n"
+"b : input rank-2 array('d') with bounds (ldb,kb)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input float, optional\n    Default: 0.0\n"
+"c : input rank-2 array('d') with bounds (m,n)\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"trans_a : input int, optional\n    Default: 0\n"
+"trans_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('d') with bounds (m,n)";
+/* extern void F_FUNC(dgemm,DGEMM)(char*,char*,int*,int*,int*,double*,double*,int*,double*,int*,double*,double*,int* ); */
+static PyObject *f2py_rout_fblas_dgemm(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,int*,int*,double*,double*,int*,double*,int*,double*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  double alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double beta = 0;
+  PyObject *beta_capi = Py_None;
+  double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int trans_a = 0;
+  PyObject *trans_a_capi = Py_None;
+  int trans_b = 0;
+  PyObject *trans_b_capi = Py_None;
+  int lda = 0;
+  int ka = 0;
+  int ldb = 0;
+  int kb = 0;
+  static char *capi_kwlist[] = {"alpha","a","b","beta","c","trans_a","trans_b","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOi:fblas.dgemm",\
+    capi_kwlist,&alpha_capi,&a_capi,&b_capi,&beta_capi,&c_capi,&trans_a_capi,&trans_b_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.dgemm to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `b' of fblas.dgemm to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable trans_a */
+  if (trans_a_capi == Py_None) trans_a = 0; else
+    f2py_success = int_from_pyobj(&trans_a,trans_a_capi,"fblas.dgemm() 3rd keyword (trans_a) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_a>=0 && trans_a <=2,"trans_a>=0 && trans_a <=2","3rd keyword trans_a","dgemm:trans_a=%d",trans_a) {
+  /* Processing variable trans_b */
+  if (trans_b_capi == Py_None) trans_b = 0; else
+    f2py_success = int_from_pyobj(&trans_b,trans_b_capi,"fblas.dgemm() 4th keyword (trans_b) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_b>=0 && trans_b <=2,"trans_b>=0 && trans_b <=2","4th keyword trans_b","dgemm:trans_b=%d",trans_b) {
+  /* Processing variable beta */
+  if (beta_capi == Py_None) beta = 0.0; else
+    f2py_success = double_from_pyobj(&beta,beta_capi,"fblas.dgemm() 1st keyword (beta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = double_from_pyobj(&alpha,alpha_capi,"fblas.dgemm() 1st argument (alpha) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable kb */
+  kb = shape(b,1);
+  /* Processing variable ka */
+  ka = shape(a,1);
+  /* Processing variable ldb */
+  ldb = shape(b,0);
+  /* Processing variable lda */
+  lda = shape(a,0);
+  /* Processing variable k */
+  k = (trans_a?lda:ka);
+  /* Processing variable m */
+  m = (trans_a?ka:lda);
+  /* Processing variable n */
+  n = (trans_b?ldb:kb);
+  CHECKSCALAR(trans_b?kb==k:ldb==k,"trans_b?kb==k:ldb==k","hidden n","dgemm:n=%d",n) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  c_Dims[0]=m,c_Dims[1]=n;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `c' of fblas.dgemm to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==m && shape(c,1)==n,"shape(c,0)==m && shape(c,1)==n","2nd keyword c") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans_a?(trans_a==2?"C":"T"):"N"),(trans_b?(trans_b==2?"C":"T"):"N"),&m,&n,&k,&alpha,a,&lda,b,&ldb,&beta,c,&m) ;
+        /*(*f2py_func)(&m,&n,&k,&alpha,a,b,&beta,c,&trans_a,&trans_b,&lda,&ka,&ldb,&kb);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_c_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(shape(c,0)==m && shape(c,1)==n)*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(trans_b?kb==k:ldb==k)*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable k */
+  /* End of cleaning variable lda */
+  /* End of cleaning variable ldb */
+  /* End of cleaning variable ka */
+  /* End of cleaning variable kb */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  } /*if (f2py_success) of beta*/
+  /* End of cleaning variable beta */
+  } /*CHECKSCALAR(trans_b>=0 && trans_b <=2)*/
+  } /*if (f2py_success) of trans_b*/
+  /* End of cleaning variable trans_b */
+  } /*CHECKSCALAR(trans_a>=0 && trans_a <=2)*/
+  } /*if (f2py_success) of trans_a*/
+  /* End of cleaning variable trans_a */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dgemm ********************************/
+
+/*********************************** cgemm ***********************************/
+static char doc_f2py_rout_fblas_cgemm[] = "\
+c = cgemm(alpha,a,b,[beta,c,trans_a,trans_b,overwrite_c])\n\nWrapper for ``cgemm``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"a : input rank-2 array('F') with bounds (lda,ka)\n"
+"b : input rank-2 array('F') with bounds (ldb,kb)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input complex, optional\n    Default: (0.0, 0.0)\n"
+"c : input rank-2 array('F') with bounds (m,n)\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"trans_a : input int, optional\n    Default: 0\n"
+"trans_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('F') with bounds (m,n)";
+/* extern void F_FUNC(cgemm,CGEMM)(char*,char*,int*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* ); */
+static PyObject *f2py_rout_fblas_cgemm(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  complex_float alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_float beta;
+  PyObject *beta_capi = Py_None;
+  complex_float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int trans_a = 0;
+  PyObject *trans_a_capi = Py_None;
+  int trans_b = 0;
+  PyObject *trans_b_capi = Py_None;
+  int lda = 0;
+  int ka = 0;
+  int ldb = 0;
+  int kb = 0;
+  static char *capi_kwlist[] = {"alpha","a","b","beta","c","trans_a","trans_b","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOi:fblas.cgemm",\
+    capi_kwlist,&alpha_capi,&a_capi,&b_capi,&beta_capi,&c_capi,&trans_a_capi,&trans_b_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.cgemm to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `b' of fblas.cgemm to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable trans_a */
+  if (trans_a_capi == Py_None) trans_a = 0; else
+    f2py_success = int_from_pyobj(&trans_a,trans_a_capi,"fblas.cgemm() 3rd keyword (trans_a) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_a>=0 && trans_a <=2,"trans_a>=0 && trans_a <=2","3rd keyword trans_a","cgemm:trans_a=%d",trans_a) {
+  /* Processing variable trans_b */
+  if (trans_b_capi == Py_None) trans_b = 0; else
+    f2py_success = int_from_pyobj(&trans_b,trans_b_capi,"fblas.cgemm() 4th keyword (trans_b) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_b>=0 && trans_b <=2,"trans_b>=0 && trans_b <=2","4th keyword trans_b","cgemm:trans_b=%d",trans_b) {
+  /* Processing variable beta */
+  if (beta_capi==Py_None) {beta.r = 0.0, beta.i =  0.0;} else
+    f2py_success = complex_float_from_pyobj(&beta,beta_capi,"fblas.cgemm() 1st keyword (beta) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = complex_float_from_pyobj(&alpha,alpha_capi,"fblas.cgemm() 1st argument (alpha) can't be converted to complex_float");
+  if (f2py_success) {
+  /* Processing variable kb */
+  kb = shape(b,1);
+  /* Processing variable ka */
+  ka = shape(a,1);
+  /* Processing variable ldb */
+  ldb = shape(b,0);
+  /* Processing variable lda */
+  lda = shape(a,0);
+  /* Processing variable k */
+  k = (trans_a?lda:ka);
+  /* Processing variable m */
+  m = (trans_a?ka:lda);
+  /* Processing variable n */
+  n = (trans_b?ldb:kb);
+  CHECKSCALAR(trans_b?kb==k:ldb==k,"trans_b?kb==k:ldb==k","hidden n","cgemm:n=%d",n) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  c_Dims[0]=m,c_Dims[1]=n;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CFLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `c' of fblas.cgemm to C/Fortran array" );
+  } else {
+    c = (complex_float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==m && shape(c,1)==n,"shape(c,0)==m && shape(c,1)==n","2nd keyword c") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans_a?(trans_a==2?"C":"T"):"N"),(trans_b?(trans_b==2?"C":"T"):"N"),&m,&n,&k,&alpha,a,&lda,b,&ldb,&beta,c,&m) ;
+        /*(*f2py_func)(&m,&n,&k,&alpha,a,b,&beta,c,&trans_a,&trans_b,&lda,&ka,&ldb,&kb);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_c_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(shape(c,0)==m && shape(c,1)==n)*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(trans_b?kb==k:ldb==k)*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable k */
+  /* End of cleaning variable lda */
+  /* End of cleaning variable ldb */
+  /* End of cleaning variable ka */
+  /* End of cleaning variable kb */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  }  /*if (f2py_success) of beta frompyobj*/
+  /* End of cleaning variable beta */
+  } /*CHECKSCALAR(trans_b>=0 && trans_b <=2)*/
+  } /*if (f2py_success) of trans_b*/
+  /* End of cleaning variable trans_b */
+  } /*CHECKSCALAR(trans_a>=0 && trans_a <=2)*/
+  } /*if (f2py_success) of trans_a*/
+  /* End of cleaning variable trans_a */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgemm ********************************/
+
+/*********************************** zgemm ***********************************/
+static char doc_f2py_rout_fblas_zgemm[] = "\
+c = zgemm(alpha,a,b,[beta,c,trans_a,trans_b,overwrite_c])\n\nWrapper for ``zgemm``.\
+\n\nParameters\n----------\n"
+"alpha : input complex\n"
+"a : input rank-2 array('D') with bounds (lda,ka)\n"
+"b : input rank-2 array('D') with bounds (ldb,kb)\n"
+"\nOther Parameters\n----------------\n"
+"beta : input complex, optional\n    Default: (0.0, 0.0)\n"
+"c : input rank-2 array('D') with bounds (m,n)\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"trans_a : input int, optional\n    Default: 0\n"
+"trans_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('D') with bounds (m,n)";
+/* extern void F_FUNC(zgemm,ZGEMM)(char*,char*,int*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* ); */
+static PyObject *f2py_rout_fblas_zgemm(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  complex_double alpha;
+  PyObject *alpha_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_double beta;
+  PyObject *beta_capi = Py_None;
+  complex_double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int trans_a = 0;
+  PyObject *trans_a_capi = Py_None;
+  int trans_b = 0;
+  PyObject *trans_b_capi = Py_None;
+  int lda = 0;
+  int ka = 0;
+  int ldb = 0;
+  int kb = 0;
+  static char *capi_kwlist[] = {"alpha","a","b","beta","c","trans_a","trans_b","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|OOOOi:fblas.zgemm",\
+    capi_kwlist,&alpha_capi,&a_capi,&b_capi,&beta_capi,&c_capi,&trans_a_capi,&trans_b_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd argument `a' of fblas.zgemm to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 3rd argument `b' of fblas.zgemm to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable trans_a */
+  if (trans_a_capi == Py_None) trans_a = 0; else
+    f2py_success = int_from_pyobj(&trans_a,trans_a_capi,"fblas.zgemm() 3rd keyword (trans_a) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_a>=0 && trans_a <=2,"trans_a>=0 && trans_a <=2","3rd keyword trans_a","zgemm:trans_a=%d",trans_a) {
+  /* Processing variable trans_b */
+  if (trans_b_capi == Py_None) trans_b = 0; else
+    f2py_success = int_from_pyobj(&trans_b,trans_b_capi,"fblas.zgemm() 4th keyword (trans_b) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans_b>=0 && trans_b <=2,"trans_b>=0 && trans_b <=2","4th keyword trans_b","zgemm:trans_b=%d",trans_b) {
+  /* Processing variable beta */
+  if (beta_capi==Py_None) {beta.r = 0.0, beta.i =  0.0;} else
+    f2py_success = complex_double_from_pyobj(&beta,beta_capi,"fblas.zgemm() 1st keyword (beta) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable alpha */
+    f2py_success = complex_double_from_pyobj(&alpha,alpha_capi,"fblas.zgemm() 1st argument (alpha) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable kb */
+  kb = shape(b,1);
+  /* Processing variable ka */
+  ka = shape(a,1);
+  /* Processing variable ldb */
+  ldb = shape(b,0);
+  /* Processing variable lda */
+  lda = shape(a,0);
+  /* Processing variable k */
+  k = (trans_a?lda:ka);
+  /* Processing variable m */
+  m = (trans_a?ka:lda);
+  /* Processing variable n */
+  n = (trans_b?ldb:kb);
+  CHECKSCALAR(trans_b?kb==k:ldb==k,"trans_b?kb==k:ldb==k","hidden n","zgemm:n=%d",n) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  c_Dims[0]=m,c_Dims[1]=n;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CDOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(fblas_error,"failed in converting 2nd keyword `c' of fblas.zgemm to C/Fortran array" );
+  } else {
+    c = (complex_double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==m && shape(c,1)==n,"shape(c,0)==m && shape(c,1)==n","2nd keyword c") {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((trans_a?(trans_a==2?"C":"T"):"N"),(trans_b?(trans_b==2?"C":"T"):"N"),&m,&n,&k,&alpha,a,&lda,b,&ldb,&beta,c,&m) ;
+        /*(*f2py_func)(&m,&n,&k,&alpha,a,b,&beta,c,&trans_a,&trans_b,&lda,&ka,&ldb,&kb);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_c_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKARRAY(shape(c,0)==m && shape(c,1)==n)*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(trans_b?kb==k:ldb==k)*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable k */
+  /* End of cleaning variable lda */
+  /* End of cleaning variable ldb */
+  /* End of cleaning variable ka */
+  /* End of cleaning variable kb */
+  }  /*if (f2py_success) of alpha frompyobj*/
+  /* End of cleaning variable alpha */
+  }  /*if (f2py_success) of beta frompyobj*/
+  /* End of cleaning variable beta */
+  } /*CHECKSCALAR(trans_b>=0 && trans_b <=2)*/
+  } /*if (f2py_success) of trans_b*/
+  /* End of cleaning variable trans_b */
+  } /*CHECKSCALAR(trans_a>=0 && trans_a <=2)*/
+  } /*if (f2py_success) of trans_a*/
+  /* End of cleaning variable trans_a */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgemm ********************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"srotg",-1,{{-1}},0,(char *)F_FUNC(srotg,SROTG),(f2py_init_func)f2py_rout_fblas_srotg,doc_f2py_rout_fblas_srotg},
+  {"drotg",-1,{{-1}},0,(char *)F_FUNC(drotg,DROTG),(f2py_init_func)f2py_rout_fblas_drotg,doc_f2py_rout_fblas_drotg},
+  {"crotg",-1,{{-1}},0,(char *)F_FUNC(crotg,CROTG),(f2py_init_func)f2py_rout_fblas_crotg,doc_f2py_rout_fblas_crotg},
+  {"zrotg",-1,{{-1}},0,(char *)F_FUNC(zrotg,ZROTG),(f2py_init_func)f2py_rout_fblas_zrotg,doc_f2py_rout_fblas_zrotg},
+  {"srotmg",-1,{{-1}},0,(char *)F_FUNC(srotmg,SROTMG),(f2py_init_func)f2py_rout_fblas_srotmg,doc_f2py_rout_fblas_srotmg},
+  {"drotmg",-1,{{-1}},0,(char *)F_FUNC(drotmg,DROTMG),(f2py_init_func)f2py_rout_fblas_drotmg,doc_f2py_rout_fblas_drotmg},
+  {"srot",-1,{{-1}},0,(char *)F_FUNC(srot,SROT),(f2py_init_func)f2py_rout_fblas_srot,doc_f2py_rout_fblas_srot},
+  {"drot",-1,{{-1}},0,(char *)F_FUNC(drot,DROT),(f2py_init_func)f2py_rout_fblas_drot,doc_f2py_rout_fblas_drot},
+  {"csrot",-1,{{-1}},0,(char *)F_FUNC(csrot,CSROT),(f2py_init_func)f2py_rout_fblas_csrot,doc_f2py_rout_fblas_csrot},
+  {"zdrot",-1,{{-1}},0,(char *)F_FUNC(zdrot,ZDROT),(f2py_init_func)f2py_rout_fblas_zdrot,doc_f2py_rout_fblas_zdrot},
+  {"srotm",-1,{{-1}},0,(char *)F_FUNC(srotm,SROTM),(f2py_init_func)f2py_rout_fblas_srotm,doc_f2py_rout_fblas_srotm},
+  {"drotm",-1,{{-1}},0,(char *)F_FUNC(drotm,DROTM),(f2py_init_func)f2py_rout_fblas_drotm,doc_f2py_rout_fblas_drotm},
+  {"sswap",-1,{{-1}},0,(char *)F_FUNC(sswap,SSWAP),(f2py_init_func)f2py_rout_fblas_sswap,doc_f2py_rout_fblas_sswap},
+  {"dswap",-1,{{-1}},0,(char *)F_FUNC(dswap,DSWAP),(f2py_init_func)f2py_rout_fblas_dswap,doc_f2py_rout_fblas_dswap},
+  {"cswap",-1,{{-1}},0,(char *)F_FUNC(cswap,CSWAP),(f2py_init_func)f2py_rout_fblas_cswap,doc_f2py_rout_fblas_cswap},
+  {"zswap",-1,{{-1}},0,(char *)F_FUNC(zswap,ZSWAP),(f2py_init_func)f2py_rout_fblas_zswap,doc_f2py_rout_fblas_zswap},
+  {"sscal",-1,{{-1}},0,(char *)F_FUNC(sscal,SSCAL),(f2py_init_func)f2py_rout_fblas_sscal,doc_f2py_rout_fblas_sscal},
+  {"dscal",-1,{{-1}},0,(char *)F_FUNC(dscal,DSCAL),(f2py_init_func)f2py_rout_fblas_dscal,doc_f2py_rout_fblas_dscal},
+  {"cscal",-1,{{-1}},0,(char *)F_FUNC(cscal,CSCAL),(f2py_init_func)f2py_rout_fblas_cscal,doc_f2py_rout_fblas_cscal},
+  {"zscal",-1,{{-1}},0,(char *)F_FUNC(zscal,ZSCAL),(f2py_init_func)f2py_rout_fblas_zscal,doc_f2py_rout_fblas_zscal},
+  {"csscal",-1,{{-1}},0,(char *)F_FUNC(csscal,CSSCAL),(f2py_init_func)f2py_rout_fblas_csscal,doc_f2py_rout_fblas_csscal},
+  {"zdscal",-1,{{-1}},0,(char *)F_FUNC(zdscal,ZDSCAL),(f2py_init_func)f2py_rout_fblas_zdscal,doc_f2py_rout_fblas_zdscal},
+  {"scopy",-1,{{-1}},0,(char *)F_FUNC(scopy,SCOPY),(f2py_init_func)f2py_rout_fblas_scopy,doc_f2py_rout_fblas_scopy},
+  {"dcopy",-1,{{-1}},0,(char *)F_FUNC(dcopy,DCOPY),(f2py_init_func)f2py_rout_fblas_dcopy,doc_f2py_rout_fblas_dcopy},
+  {"ccopy",-1,{{-1}},0,(char *)F_FUNC(ccopy,CCOPY),(f2py_init_func)f2py_rout_fblas_ccopy,doc_f2py_rout_fblas_ccopy},
+  {"zcopy",-1,{{-1}},0,(char *)F_FUNC(zcopy,ZCOPY),(f2py_init_func)f2py_rout_fblas_zcopy,doc_f2py_rout_fblas_zcopy},
+  {"saxpy",-1,{{-1}},0,(char *)F_FUNC(saxpy,SAXPY),(f2py_init_func)f2py_rout_fblas_saxpy,doc_f2py_rout_fblas_saxpy},
+  {"daxpy",-1,{{-1}},0,(char *)F_FUNC(daxpy,DAXPY),(f2py_init_func)f2py_rout_fblas_daxpy,doc_f2py_rout_fblas_daxpy},
+  {"caxpy",-1,{{-1}},0,(char *)F_FUNC(caxpy,CAXPY),(f2py_init_func)f2py_rout_fblas_caxpy,doc_f2py_rout_fblas_caxpy},
+  {"zaxpy",-1,{{-1}},0,(char *)F_FUNC(zaxpy,ZAXPY),(f2py_init_func)f2py_rout_fblas_zaxpy,doc_f2py_rout_fblas_zaxpy},
+  {"sdot",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(sdot,SDOT),(f2py_init_func)f2py_rout_fblas_sdot,doc_f2py_rout_fblas_sdot},
+  {"ddot",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(ddot,DDOT),(f2py_init_func)f2py_rout_fblas_ddot,doc_f2py_rout_fblas_ddot},
+  {"cdotu",-1,{{-1}},0,(char *)F_FUNC(wcdotu ,WCDOTU ),(f2py_init_func)f2py_rout_fblas_cdotu,doc_f2py_rout_fblas_cdotu},
+  {"zdotu",-1,{{-1}},0,(char *)F_FUNC(wzdotu ,WZDOTU ),(f2py_init_func)f2py_rout_fblas_zdotu,doc_f2py_rout_fblas_zdotu},
+  {"cdotc",-1,{{-1}},0,(char *)F_FUNC(wcdotc ,WCDOTC ),(f2py_init_func)f2py_rout_fblas_cdotc,doc_f2py_rout_fblas_cdotc},
+  {"zdotc",-1,{{-1}},0,(char *)F_FUNC(wzdotc ,WZDOTC ),(f2py_init_func)f2py_rout_fblas_zdotc,doc_f2py_rout_fblas_zdotc},
+  {"snrm2",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(snrm2,SNRM2),(f2py_init_func)f2py_rout_fblas_snrm2,doc_f2py_rout_fblas_snrm2},
+  {"dnrm2",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(dnrm2,DNRM2),(f2py_init_func)f2py_rout_fblas_dnrm2,doc_f2py_rout_fblas_dnrm2},
+  {"scnrm2",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(scnrm2,SCNRM2),(f2py_init_func)f2py_rout_fblas_scnrm2,doc_f2py_rout_fblas_scnrm2},
+  {"dznrm2",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(dznrm2,DZNRM2),(f2py_init_func)f2py_rout_fblas_dznrm2,doc_f2py_rout_fblas_dznrm2},
+  {"sasum",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(sasum,SASUM),(f2py_init_func)f2py_rout_fblas_sasum,doc_f2py_rout_fblas_sasum},
+  {"dasum",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(dasum,DASUM),(f2py_init_func)f2py_rout_fblas_dasum,doc_f2py_rout_fblas_dasum},
+  {"scasum",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(scasum,SCASUM),(f2py_init_func)f2py_rout_fblas_scasum,doc_f2py_rout_fblas_scasum},
+  {"dzasum",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(dzasum,DZASUM),(f2py_init_func)f2py_rout_fblas_dzasum,doc_f2py_rout_fblas_dzasum},
+  {"isamax",-1,{{-1}},0,(char *)F_FUNC(isamax,ISAMAX) ,(f2py_init_func)f2py_rout_fblas_isamax,doc_f2py_rout_fblas_isamax},
+  {"idamax",-1,{{-1}},0,(char *)F_FUNC(idamax,IDAMAX) ,(f2py_init_func)f2py_rout_fblas_idamax,doc_f2py_rout_fblas_idamax},
+  {"icamax",-1,{{-1}},0,(char *)F_FUNC(icamax,ICAMAX) ,(f2py_init_func)f2py_rout_fblas_icamax,doc_f2py_rout_fblas_icamax},
+  {"izamax",-1,{{-1}},0,(char *)F_FUNC(izamax,IZAMAX) ,(f2py_init_func)f2py_rout_fblas_izamax,doc_f2py_rout_fblas_izamax},
+  {"sgemv",-1,{{-1}},0,(char *)F_FUNC(sgemv,SGEMV),(f2py_init_func)f2py_rout_fblas_sgemv,doc_f2py_rout_fblas_sgemv},
+  {"dgemv",-1,{{-1}},0,(char *)F_FUNC(dgemv,DGEMV),(f2py_init_func)f2py_rout_fblas_dgemv,doc_f2py_rout_fblas_dgemv},
+  {"cgemv",-1,{{-1}},0,(char *)F_FUNC(cgemv,CGEMV),(f2py_init_func)f2py_rout_fblas_cgemv,doc_f2py_rout_fblas_cgemv},
+  {"zgemv",-1,{{-1}},0,(char *)F_FUNC(zgemv,ZGEMV),(f2py_init_func)f2py_rout_fblas_zgemv,doc_f2py_rout_fblas_zgemv},
+  {"ssymv",-1,{{-1}},0,(char *)F_FUNC(ssymv,SSYMV),(f2py_init_func)f2py_rout_fblas_ssymv,doc_f2py_rout_fblas_ssymv},
+  {"dsymv",-1,{{-1}},0,(char *)F_FUNC(dsymv,DSYMV),(f2py_init_func)f2py_rout_fblas_dsymv,doc_f2py_rout_fblas_dsymv},
+  {"chemv",-1,{{-1}},0,(char *)F_FUNC(chemv,CHEMV),(f2py_init_func)f2py_rout_fblas_chemv,doc_f2py_rout_fblas_chemv},
+  {"zhemv",-1,{{-1}},0,(char *)F_FUNC(zhemv,ZHEMV),(f2py_init_func)f2py_rout_fblas_zhemv,doc_f2py_rout_fblas_zhemv},
+  {"strmv",-1,{{-1}},0,(char *)F_FUNC(strmv,STRMV),(f2py_init_func)f2py_rout_fblas_strmv,doc_f2py_rout_fblas_strmv},
+  {"dtrmv",-1,{{-1}},0,(char *)F_FUNC(dtrmv,DTRMV),(f2py_init_func)f2py_rout_fblas_dtrmv,doc_f2py_rout_fblas_dtrmv},
+  {"ctrmv",-1,{{-1}},0,(char *)F_FUNC(ctrmv,CTRMV),(f2py_init_func)f2py_rout_fblas_ctrmv,doc_f2py_rout_fblas_ctrmv},
+  {"ztrmv",-1,{{-1}},0,(char *)F_FUNC(ztrmv,ZTRMV),(f2py_init_func)f2py_rout_fblas_ztrmv,doc_f2py_rout_fblas_ztrmv},
+  {"sger",-1,{{-1}},0,(char *)F_FUNC(sger,SGER),(f2py_init_func)f2py_rout_fblas_sger,doc_f2py_rout_fblas_sger},
+  {"dger",-1,{{-1}},0,(char *)F_FUNC(dger,DGER),(f2py_init_func)f2py_rout_fblas_dger,doc_f2py_rout_fblas_dger},
+  {"cgeru",-1,{{-1}},0,(char *)F_FUNC(cgeru,CGERU),(f2py_init_func)f2py_rout_fblas_cgeru,doc_f2py_rout_fblas_cgeru},
+  {"zgeru",-1,{{-1}},0,(char *)F_FUNC(zgeru,ZGERU),(f2py_init_func)f2py_rout_fblas_zgeru,doc_f2py_rout_fblas_zgeru},
+  {"cgerc",-1,{{-1}},0,(char *)F_FUNC(cgerc,CGERC),(f2py_init_func)f2py_rout_fblas_cgerc,doc_f2py_rout_fblas_cgerc},
+  {"zgerc",-1,{{-1}},0,(char *)F_FUNC(zgerc,ZGERC),(f2py_init_func)f2py_rout_fblas_zgerc,doc_f2py_rout_fblas_zgerc},
+  {"sgemm",-1,{{-1}},0,(char *)F_FUNC(sgemm,SGEMM),(f2py_init_func)f2py_rout_fblas_sgemm,doc_f2py_rout_fblas_sgemm},
+  {"dgemm",-1,{{-1}},0,(char *)F_FUNC(dgemm,DGEMM),(f2py_init_func)f2py_rout_fblas_dgemm,doc_f2py_rout_fblas_dgemm},
+  {"cgemm",-1,{{-1}},0,(char *)F_FUNC(cgemm,CGEMM),(f2py_init_func)f2py_rout_fblas_cgemm,doc_f2py_rout_fblas_cgemm},
+  {"zgemm",-1,{{-1}},0,(char *)F_FUNC(zgemm,ZGEMM),(f2py_init_func)f2py_rout_fblas_zgemm,doc_f2py_rout_fblas_zgemm},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "fblas",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_fblas(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initfblas(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = fblas_module = PyModule_Create(&moduledef);
+#else
+  m = fblas_module = Py_InitModule("fblas", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module fblas (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'fblas' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  c,s = srotg(a,b)\n"
+"  c,s = drotg(a,b)\n"
+"  c,s = crotg(a,b)\n"
+"  c,s = zrotg(a,b)\n"
+"  param = srotmg(d1,d2,x1,y1)\n"
+"  param = drotmg(d1,d2,x1,y1)\n"
+"  x,y = srot(x,y,c,s,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1,overwrite_x=0,overwrite_y=0)\n"
+"  x,y = drot(x,y,c,s,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1,overwrite_x=0,overwrite_y=0)\n"
+"  x,y = csrot(x,y,c,s,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1,overwrite_x=0,overwrite_y=0)\n"
+"  x,y = zdrot(x,y,c,s,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1,overwrite_x=0,overwrite_y=0)\n"
+"  x,y = srotm(x,y,param,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1,overwrite_x=0,overwrite_y=0)\n"
+"  x,y = drotm(x,y,param,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1,overwrite_x=0,overwrite_y=0)\n"
+"  x,y = sswap(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  x,y = dswap(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  x,y = cswap(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  x,y = zswap(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  x = sscal(a,x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  x = dscal(a,x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  x = cscal(a,x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  x = zscal(a,x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  x = csscal(a,x,n=(len(x)-offx)/abs(incx),offx=0,incx=1,overwrite_x=0)\n"
+"  x = zdscal(a,x,n=(len(x)-offx)/abs(incx),offx=0,incx=1,overwrite_x=0)\n"
+"  y = scopy(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  y = dcopy(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  y = ccopy(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  y = zcopy(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  z = saxpy(x,y,n=(len(x)-offx)/abs(incx),a=1.0,offx=0,incx=1,offy=0,incy=1)\n"
+"  z = daxpy(x,y,n=(len(x)-offx)/abs(incx),a=1.0,offx=0,incx=1,offy=0,incy=1)\n"
+"  z = caxpy(x,y,n=(len(x)-offx)/abs(incx),a=(1.0, 0.0),offx=0,incx=1,offy=0,incy=1)\n"
+"  z = zaxpy(x,y,n=(len(x)-offx)/abs(incx),a=(1.0, 0.0),offx=0,incx=1,offy=0,incy=1)\n"
+"  xy = sdot(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  xy = ddot(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  xy = cdotu(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  xy = zdotu(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  xy = cdotc(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  xy = zdotc(x,y,n=(len(x)-offx)/abs(incx),offx=0,incx=1,offy=0,incy=1)\n"
+"  n2 = snrm2(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  n2 = dnrm2(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  n2 = scnrm2(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  n2 = dznrm2(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  s = sasum(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  s = dasum(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  s = scasum(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  s = dzasum(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  k = isamax(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  k = idamax(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  k = icamax(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  k = izamax(x,n=(len(x)-offx)/abs(incx),offx=0,incx=1)\n"
+"  y = sgemv(alpha,a,x,beta=0.0,y=,offx=0,incx=1,offy=0,incy=1,trans=0,overwrite_y=0)\n"
+"  y = dgemv(alpha,a,x,beta=0.0,y=,offx=0,incx=1,offy=0,incy=1,trans=0,overwrite_y=0)\n"
+"  y = cgemv(alpha,a,x,beta=(0.0, 0.0),y=,offx=0,incx=1,offy=0,incy=1,trans=0,overwrite_y=0)\n"
+"  y = zgemv(alpha,a,x,beta=(0.0, 0.0),y=,offx=0,incx=1,offy=0,incy=1,trans=0,overwrite_y=0)\n"
+"  y = ssymv(alpha,a,x,beta=0.0,y=,offx=0,incx=1,offy=0,incy=1,lower=0,overwrite_y=0)\n"
+"  y = dsymv(alpha,a,x,beta=0.0,y=,offx=0,incx=1,offy=0,incy=1,lower=0,overwrite_y=0)\n"
+"  y = chemv(alpha,a,x,beta=(0.0, 0.0),y=,offx=0,incx=1,offy=0,incy=1,lower=0,overwrite_y=0)\n"
+"  y = zhemv(alpha,a,x,beta=(0.0, 0.0),y=,offx=0,incx=1,offy=0,incy=1,lower=0,overwrite_y=0)\n"
+"  x = strmv(a,x,offx=0,incx=1,lower=0,trans=0,unitdiag=0,overwrite_x=0)\n"
+"  x = dtrmv(a,x,offx=0,incx=1,lower=0,trans=0,unitdiag=0,overwrite_x=0)\n"
+"  x = ctrmv(a,x,offx=0,incx=1,lower=0,trans=0,unitdiag=0,overwrite_x=0)\n"
+"  x = ztrmv(a,x,offx=0,incx=1,lower=0,trans=0,unitdiag=0,overwrite_x=0)\n"
+"  a = sger(alpha,x,y,incx=1,incy=1,a=0.0,overwrite_x=1,overwrite_y=1,overwrite_a=0)\n"
+"  a = dger(alpha,x,y,incx=1,incy=1,a=0.0,overwrite_x=1,overwrite_y=1,overwrite_a=0)\n"
+"  a = cgeru(alpha,x,y,incx=1,incy=1,a=(0.0,0.0),overwrite_x=1,overwrite_y=1,overwrite_a=0)\n"
+"  a = zgeru(alpha,x,y,incx=1,incy=1,a=(0.0,0.0),overwrite_x=1,overwrite_y=1,overwrite_a=0)\n"
+"  a = cgerc(alpha,x,y,incx=1,incy=1,a=(0.0,0.0),overwrite_x=1,overwrite_y=1,overwrite_a=0)\n"
+"  a = zgerc(alpha,x,y,incx=1,incy=1,a=(0.0,0.0),overwrite_x=1,overwrite_y=1,overwrite_a=0)\n"
+"  c = sgemm(alpha,a,b,beta=0.0,c=,trans_a=0,trans_b=0,overwrite_c=0)\n"
+"  c = dgemm(alpha,a,b,beta=0.0,c=,trans_a=0,trans_b=0,overwrite_c=0)\n"
+"  c = cgemm(alpha,a,b,beta=(0.0, 0.0),c=,trans_a=0,trans_b=0,overwrite_c=0)\n"
+"  c = zgemm(alpha,a,b,beta=(0.0, 0.0),c=,trans_a=0,trans_b=0,overwrite_c=0)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  fblas_error = PyErr_NewException ("fblas.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+    {
+      extern float F_FUNC(sdot,SDOT)(void);
+      PyObject* o = PyDict_GetItemString(d,"sdot");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(sdot,SDOT),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("sdot"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("sdot"));
+#endif
+    }
+    
+
+    {
+      extern double F_FUNC(ddot,DDOT)(void);
+      PyObject* o = PyDict_GetItemString(d,"ddot");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(ddot,DDOT),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("ddot"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("ddot"));
+#endif
+    }
+    
+
+
+
+
+
+    {
+      extern float F_FUNC(snrm2,SNRM2)(void);
+      PyObject* o = PyDict_GetItemString(d,"snrm2");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(snrm2,SNRM2),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("snrm2"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("snrm2"));
+#endif
+    }
+    
+
+    {
+      extern double F_FUNC(dnrm2,DNRM2)(void);
+      PyObject* o = PyDict_GetItemString(d,"dnrm2");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(dnrm2,DNRM2),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("dnrm2"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("dnrm2"));
+#endif
+    }
+    
+
+    {
+      extern float F_FUNC(scnrm2,SCNRM2)(void);
+      PyObject* o = PyDict_GetItemString(d,"scnrm2");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(scnrm2,SCNRM2),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("scnrm2"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("scnrm2"));
+#endif
+    }
+    
+
+    {
+      extern double F_FUNC(dznrm2,DZNRM2)(void);
+      PyObject* o = PyDict_GetItemString(d,"dznrm2");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(dznrm2,DZNRM2),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("dznrm2"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("dznrm2"));
+#endif
+    }
+    
+
+    {
+      extern float F_FUNC(sasum,SASUM)(void);
+      PyObject* o = PyDict_GetItemString(d,"sasum");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(sasum,SASUM),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("sasum"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("sasum"));
+#endif
+    }
+    
+
+    {
+      extern double F_FUNC(dasum,DASUM)(void);
+      PyObject* o = PyDict_GetItemString(d,"dasum");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(dasum,DASUM),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("dasum"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("dasum"));
+#endif
+    }
+    
+
+    {
+      extern float F_FUNC(scasum,SCASUM)(void);
+      PyObject* o = PyDict_GetItemString(d,"scasum");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(scasum,SCASUM),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("scasum"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("scasum"));
+#endif
+    }
+    
+
+    {
+      extern double F_FUNC(dzasum,DZASUM)(void);
+      PyObject* o = PyDict_GetItemString(d,"dzasum");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(dzasum,DZASUM),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("dzasum"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("dzasum"));
+#endif
+    }
+    
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"fblas");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
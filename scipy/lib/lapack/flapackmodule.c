@@ -0,0 +1,19428 @@
+/* File: flapackmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 22:52:11 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <setjmp.h>
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *flapack_error;
+static PyObject *flapack_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {double r,i;} complex_double;
+typedef struct {float r,i;} complex_float;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+typedef int(*cb_zselect_in_gees__user__routines_typedef)(complex_double *);
+typedef int(*cb_cselect_in_gees__user__routines_typedef)(complex_float *);
+typedef int(*cb_dselect_in_gees__user__routines_typedef)(double *,double *);
+typedef int(*cb_sselect_in_gees__user__routines_typedef)(float *,float *);
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#define PRINTPYOBJERR(obj)\
+    fprintf(stderr,"flapack.error is related to ");\
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+
+#define GETSCALARFROMPYTUPLE(tuple,index,var,ctype,mess) {\
+        if ((capi_tmp = PyTuple_GetItem((tuple),(index)))==NULL) goto capi_fail;\
+        if (!(ctype ## _from_pyobj((var),capi_tmp,mess)))\
+            goto capi_fail;\
+    }
+
+#define pyobj_from_float1(v) (PyFloat_FromDouble(v))
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#define pyobj_from_double1(v) (PyFloat_FromDouble(v))
+#define pyobj_from_complex_float1(v) (PyComplex_FromDoubles(v.r,v.i))
+#define pyobj_from_complex_double1(v) (PyComplex_FromDoubles(v.r,v.i))
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKARRAY(check,tcheck,name) \
+    if (!(check)) {\
+        PyErr_SetString(flapack_error,"("tcheck") failed for "name);\
+        /*goto capi_fail;*/\
+    } else 
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(flapack_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#define SWAP(a,b,t) {\
+    t *c;\
+    c = a;\
+    a = b;\
+    b = c;}
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = flapack_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = flapack_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int float_from_pyobj(float* v,PyObject *obj,const char *errmess) {
+    double d=0.0;
+    if (double_from_pyobj(&d,obj,errmess)) {
+        *v = (float)d;
+        return 1;
+    }
+    return 0;
+}
+
+static int create_cb_arglist(PyObject* fun,PyTupleObject* xa,const int maxnofargs,const int nofoptargs,int *nofargs,PyTupleObject **args,const char *errmess) {
+    PyObject *tmp = NULL;
+    PyObject *tmp_fun = NULL;
+    int tot,opt,ext,siz,i,di=0;
+    CFUNCSMESS("create_cb_arglist\n");
+    tot=opt=ext=siz=0;
+    /* Get the total number of arguments */
+    if (PyFunction_Check(fun))
+        tmp_fun = fun;
+    else {
+        di = 1;
+        if (PyObject_HasAttrString(fun,"im_func")) {
+            tmp_fun = PyObject_GetAttrString(fun,"im_func");
+        }
+        else if (PyObject_HasAttrString(fun,"__call__")) {
+            tmp = PyObject_GetAttrString(fun,"__call__");
+            if (PyObject_HasAttrString(tmp,"im_func"))
+                tmp_fun = PyObject_GetAttrString(tmp,"im_func");
+            else {
+                tmp_fun = fun; /* built-in function */
+                tot = maxnofargs;
+                if (xa != NULL)
+                    tot += PyTuple_Size((PyObject *)xa);
+            }
+            Py_XDECREF(tmp);
+        }
+        else if (PyFortran_Check(fun) || PyFortran_Check1(fun)) {
+            tot = maxnofargs;
+            if (xa != NULL)
+                tot += PyTuple_Size((PyObject *)xa);
+            tmp_fun = fun;
+        }
+        else if (F2PyCapsule_Check(fun)) {
+            tot = maxnofargs;
+            if (xa != NULL)
+                ext = PyTuple_Size((PyObject *)xa);
+            if(ext>0) {
+                fprintf(stderr,"extra arguments tuple cannot be used with CObject call-back\n");
+                goto capi_fail;
+            }
+            tmp_fun = fun;
+        }
+    }
+if (tmp_fun==NULL) {
+fprintf(stderr,"Call-back argument must be function|instance|instance.__call__|f2py-function but got %s.\n",(fun==NULL?"NULL":Py_TYPE(fun)->tp_name));
+goto capi_fail;
+}
+#if PY_VERSION_HEX >= 0x03000000
+    if (PyObject_HasAttrString(tmp_fun,"__code__")) {
+        if (PyObject_HasAttrString(tmp = PyObject_GetAttrString(tmp_fun,"__code__"),"co_argcount"))
+#else
+    if (PyObject_HasAttrString(tmp_fun,"func_code")) {
+        if (PyObject_HasAttrString(tmp = PyObject_GetAttrString(tmp_fun,"func_code"),"co_argcount"))
+#endif
+            tot = PyInt_AsLong(PyObject_GetAttrString(tmp,"co_argcount")) - di;
+        Py_XDECREF(tmp);
+    }
+    /* Get the number of optional arguments */
+#if PY_VERSION_HEX >= 0x03000000
+    if (PyObject_HasAttrString(tmp_fun,"__defaults__")) {
+        if (PyTuple_Check(tmp = PyObject_GetAttrString(tmp_fun,"__defaults__")))
+#else
+    if (PyObject_HasAttrString(tmp_fun,"func_defaults")) {
+        if (PyTuple_Check(tmp = PyObject_GetAttrString(tmp_fun,"func_defaults")))
+#endif
+            opt = PyTuple_Size(tmp);
+        Py_XDECREF(tmp);
+    }
+    /* Get the number of extra arguments */
+    if (xa != NULL)
+        ext = PyTuple_Size((PyObject *)xa);
+    /* Calculate the size of call-backs argument list */
+    siz = MIN(maxnofargs+ext,tot);
+    *nofargs = MAX(0,siz-ext);
+#ifdef DEBUGCFUNCS
+    fprintf(stderr,"debug-capi:create_cb_arglist:maxnofargs(-nofoptargs),tot,opt,ext,siz,nofargs=%d(-%d),%d,%d,%d,%d,%d\n",maxnofargs,nofoptargs,tot,opt,ext,siz,*nofargs);
+#endif
+    if (siz<tot-opt) {
+        fprintf(stderr,"create_cb_arglist: Failed to build argument list (siz) with enough arguments (tot-opt) required by user-supplied function (siz,tot,opt=%d,%d,%d).\n",siz,tot,opt);
+        goto capi_fail;
+    }
+    /* Initialize argument list */
+    *args = (PyTupleObject *)PyTuple_New(siz);
+    for (i=0;i<*nofargs;i++) {
+        Py_INCREF(Py_None);
+        PyTuple_SET_ITEM((PyObject *)(*args),i,Py_None);
+    }
+    if (xa != NULL)
+        for (i=(*nofargs);i<siz;i++) {
+            tmp = PyTuple_GetItem((PyObject *)xa,i-(*nofargs));
+            Py_INCREF(tmp);
+            PyTuple_SET_ITEM(*args,i,tmp);
+        }
+    CFUNCSMESS("create_cb_arglist-end\n");
+    return 1;
+capi_fail:
+    if ((PyErr_Occurred())==NULL)
+        PyErr_SetString(flapack_error,errmess);
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(sgesv,SGESV)(int*,int*,float*,int*,int*,float*,int*,int* );
+extern void F_FUNC(dgesv,DGESV)(int*,int*,double*,int*,int*,double*,int*,int* );
+extern void F_FUNC(cgesv,CGESV)(int*,int*,complex_float*,int*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zgesv,ZGESV)(int*,int*,complex_double*,int*,int*,complex_double*,int*,int* );
+extern void F_FUNC(sgbsv,SGBSV)(int*,int*,int*,int*,float*,int*,int*,float*,int*,int* );
+extern void F_FUNC(dgbsv,DGBSV)(int*,int*,int*,int*,double*,int*,int*,double*,int*,int* );
+extern void F_FUNC(cgbsv,CGBSV)(int*,int*,int*,int*,complex_float*,int*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zgbsv,ZGBSV)(int*,int*,int*,int*,complex_double*,int*,int*,complex_double*,int*,int* );
+extern void F_FUNC(sposv,SPOSV)(char*,int*,int*,float*,int*,float*,int*,int* );
+extern void F_FUNC(dposv,DPOSV)(char*,int*,int*,double*,int*,double*,int*,int* );
+extern void F_FUNC(cposv,CPOSV)(char*,int*,int*,complex_float*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zposv,ZPOSV)(char*,int*,int*,complex_double*,int*,complex_double*,int*,int* );
+extern void F_FUNC(sgelss,SGELSS)(int*,int*,int*,float*,int*,float*,int*,float*,float*,int*,float*,int*,int* );
+extern void F_FUNC(dgelss,DGELSS)(int*,int*,int*,double*,int*,double*,int*,double*,double*,int*,double*,int*,int* );
+extern void F_FUNC(cgelss,CGELSS)(int*,int*,int*,complex_float*,int*,complex_float*,int*,float*,float*,int*,complex_float*,int*,float*,int* );
+extern void F_FUNC(zgelss,ZGELSS)(int*,int*,int*,complex_double*,int*,complex_double*,int*,double*,double*,int*,complex_double*,int*,double*,int* );
+extern void F_FUNC(ssyev,SSYEV)(char*,char*,int*,float*,int*,float*,float*,int*,int* );
+extern void F_FUNC(dsyev,DSYEV)(char*,char*,int*,double*,int*,double*,double*,int*,int* );
+extern void F_FUNC(cheev,CHEEV)(char*,char*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int* );
+extern void F_FUNC(zheev,ZHEEV)(char*,char*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int* );
+extern void F_FUNC(ssyevd,SSYEVD)(char*,char*,int*,float*,int*,float*,float*,int*,int*,int*,int* );
+extern void F_FUNC(dsyevd,DSYEVD)(char*,char*,int*,double*,int*,double*,double*,int*,int*,int*,int* );
+extern void F_FUNC(cheevd,CHEEVD)(char*,char*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int*,int*,int*,int* );
+extern void F_FUNC(zheevd,ZHEEVD)(char*,char*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int*,int*,int*,int* );
+extern void F_FUNC(ssyevr,SSYEVR)(char*,char*,char*,int*,float*,int*,float*,float*,int*,int*,float*,int*,float*,float*,int*,int*,float*,int*,int*,int*,int* );
+extern void F_FUNC(dsyevr,DSYEVR)(char*,char*,char*,int*,double*,int*,double*,double*,int*,int*,double*,int*,double*,double*,int*,int*,double*,int*,int*,int*,int* );
+extern void F_FUNC(cheevr,CHEEVR)(char*,char*,char*,int*,complex_float*,int*,float*,float*,int*,int*,float*,int*,float*,complex_float*,int*,int*,complex_float*,int*,float*,int*,int*,int*,int* );
+extern void F_FUNC(zheevr,ZHEEVR)(char*,char*,char*,int*,complex_double*,int*,double*,double*,int*,int*,double*,int*,double*,complex_double*,int*,int*,complex_double*,int*,double*,int*,int*,int*,int* );
+extern void F_FUNC(sgees,SGEES)(char*,char*,int(*)(float*,float*),int*,float*,int*,int*,float*,float*,float*,int*,float*,int*,int*,int*,int,int );
+extern void F_FUNC(dgees,DGEES)(char*,char*,int(*)(double*,double*),int*,double*,int*,int*,double*,double*,double*,int*,double*,int*,int*,int*,int,int );
+extern void F_FUNC(cgees,CGEES)(char*,char*,int(*)(complex_float*),int*,complex_float*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,float*,int*,int*,int,int );
+extern void F_FUNC(zgees,ZGEES)(char*,char*,int(*)(complex_double*),int*,complex_double*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,double*,int*,int*,int,int );
+extern void F_FUNC(sgeev,SGEEV)(char*,char*,int*,float*,int*,float*,float*,float*,int*,float*,int*,float*,int*,int* );
+extern void F_FUNC(dgeev,DGEEV)(char*,char*,int*,double*,int*,double*,double*,double*,int*,double*,int*,double*,int*,int* );
+extern void F_FUNC(cgeev,CGEEV)(char*,char*,int*,complex_float*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int* );
+extern void F_FUNC(zgeev,ZGEEV)(char*,char*,int*,complex_double*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int* );
+extern void F_FUNC(sgesdd,SGESDD)(char*,int*,int*,float*,int*,float*,float*,int*,float*,int*,float*,int*,int*,int* );
+extern void F_FUNC(dgesdd,DGESDD)(char*,int*,int*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int* );
+extern void F_FUNC(cgesdd,CGESDD)(char*,int*,int*,complex_float*,int*,float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int*,int* );
+extern void F_FUNC(zgesdd,ZGESDD)(char*,int*,int*,complex_double*,int*,double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int*,int* );
+extern void F_FUNC(ssygv,SSYGV)(int*,char*,char*,int*,float*,int*,float*,int*,float*,float*,int*,int* );
+extern void F_FUNC(dsygv,DSYGV)(int*,char*,char*,int*,double*,int*,double*,int*,double*,double*,int*,int* );
+extern void F_FUNC(chegv,CHEGV)(int*,char*,char*,int*,complex_float*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int* );
+extern void F_FUNC(zhegv,ZHEGV)(int*,char*,char*,int*,complex_double*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int* );
+extern void F_FUNC(ssygvd,SSYGVD)(int*,char*,char*,int*,float*,int*,float*,int*,float*,float*,int*,int*,int*,int* );
+extern void F_FUNC(dsygvd,DSYGVD)(int*,char*,char*,int*,double*,int*,double*,int*,double*,double*,int*,int*,int*,int* );
+extern void F_FUNC(chegvd,CHEGVD)(int*,char*,char*,int*,complex_float*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int*,int*,int*,int* );
+extern void F_FUNC(zhegvd,ZHEGVD)(int*,char*,char*,int*,complex_double*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int*,int*,int*,int* );
+extern void F_FUNC(sggev,SGGEV)(char*,char*,int*,float*,int*,float*,int*,float*,float*,float*,float*,int*,float*,int*,float*,int*,int* );
+extern void F_FUNC(dggev,DGGEV)(char*,char*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,double*,int*,int* );
+extern void F_FUNC(cggev,CGGEV)(char*,char*,int*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int* );
+extern void F_FUNC(zggev,ZGGEV)(char*,char*,int*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int* );
+extern void F_FUNC(sgetrf,SGETRF)(int*,int*,float*,int*,int*,int* );
+extern void F_FUNC(dgetrf,DGETRF)(int*,int*,double*,int*,int*,int* );
+extern void F_FUNC(cgetrf,CGETRF)(int*,int*,complex_float*,int*,int*,int* );
+extern void F_FUNC(zgetrf,ZGETRF)(int*,int*,complex_double*,int*,int*,int* );
+extern void F_FUNC(spotrf,SPOTRF)(char*,int*,float*,int*,int* );
+extern void F_FUNC(dpotrf,DPOTRF)(char*,int*,double*,int*,int* );
+extern void F_FUNC(cpotrf,CPOTRF)(char*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zpotrf,ZPOTRF)(char*,int*,complex_double*,int*,int* );
+extern void F_FUNC(sgetrs,SGETRS)(char*,int*,int*,float*,int*,int*,float*,int*,int* );
+extern void F_FUNC(dgetrs,DGETRS)(char*,int*,int*,double*,int*,int*,double*,int*,int* );
+extern void F_FUNC(cgetrs,CGETRS)(char*,int*,int*,complex_float*,int*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zgetrs,ZGETRS)(char*,int*,int*,complex_double*,int*,int*,complex_double*,int*,int* );
+extern void F_FUNC(spotrs,SPOTRS)(char*,int*,int*,float*,int*,float*,int*,int* );
+extern void F_FUNC(dpotrs,DPOTRS)(char*,int*,int*,double*,int*,double*,int*,int* );
+extern void F_FUNC(cpotrs,CPOTRS)(char*,int*,int*,complex_float*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zpotrs,ZPOTRS)(char*,int*,int*,complex_double*,int*,complex_double*,int*,int* );
+extern void F_FUNC(sgetri,SGETRI)(int*,float*,int*,int*,float*,int*,int* );
+extern void F_FUNC(dgetri,DGETRI)(int*,double*,int*,int*,double*,int*,int* );
+extern void F_FUNC(cgetri,CGETRI)(int*,complex_float*,int*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zgetri,ZGETRI)(int*,complex_double*,int*,int*,complex_double*,int*,int* );
+extern void F_FUNC(spotri,SPOTRI)(char*,int*,float*,int*,int* );
+extern void F_FUNC(dpotri,DPOTRI)(char*,int*,double*,int*,int* );
+extern void F_FUNC(cpotri,CPOTRI)(char*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zpotri,ZPOTRI)(char*,int*,complex_double*,int*,int* );
+extern void F_FUNC(strtri,STRTRI)(char*,char*,int*,float*,int*,int* );
+extern void F_FUNC(dtrtri,DTRTRI)(char*,char*,int*,double*,int*,int* );
+extern void F_FUNC(ctrtri,CTRTRI)(char*,char*,int*,complex_float*,int*,int* );
+extern void F_FUNC(ztrtri,ZTRTRI)(char*,char*,int*,complex_double*,int*,int* );
+extern void F_FUNC(sgeqrf,SGEQRF)(int*,int*,float*,int*,float*,float*,int*,int* );
+extern void F_FUNC(dgeqrf,DGEQRF)(int*,int*,double*,int*,double*,double*,int*,int* );
+extern void F_FUNC(cgeqrf,CGEQRF)(int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* );
+extern void F_FUNC(zgeqrf,ZGEQRF)(int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* );
+extern void F_FUNC(sorgqr,SORGQR)(int*,int*,int*,float*,int*,float*,float*,int*,int* );
+extern void F_FUNC(dorgqr,DORGQR)(int*,int*,int*,double*,int*,double*,double*,int*,int* );
+extern void F_FUNC(cungqr,CUNGQR)(int*,int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* );
+extern void F_FUNC(zungqr,ZUNGQR)(int*,int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* );
+extern void F_FUNC(sgehrd,SGEHRD)(int*,int*,int*,float*,int*,float*,float*,int*,int* );
+extern void F_FUNC(dgehrd,DGEHRD)(int*,int*,int*,double*,int*,double*,double*,int*,int* );
+extern void F_FUNC(cgehrd,CGEHRD)(int*,int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* );
+extern void F_FUNC(zgehrd,ZGEHRD)(int*,int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* );
+extern void F_FUNC(sgebal,SGEBAL)(char*,int*,float*,int*,int*,int*,float*,int* );
+extern void F_FUNC(dgebal,DGEBAL)(char*,int*,double*,int*,int*,int*,double*,int* );
+extern void F_FUNC(cgebal,CGEBAL)(char*,int*,complex_float*,int*,int*,int*,float*,int* );
+extern void F_FUNC(zgebal,ZGEBAL)(char*,int*,complex_double*,int*,int*,int*,double*,int* );
+extern void F_FUNC(slauum,SLAUUM)(char*,int*,float*,int*,int* );
+extern void F_FUNC(dlauum,DLAUUM)(char*,int*,double*,int*,int* );
+extern void F_FUNC(clauum,CLAUUM)(char*,int*,complex_float*,int*,int* );
+extern void F_FUNC(zlauum,ZLAUUM)(char*,int*,complex_double*,int*,int* );
+extern void F_FUNC(slaswp,SLASWP)(int*,float*,int*,int*,int*,int*,int* );
+extern void F_FUNC(dlaswp,DLASWP)(int*,double*,int*,int*,int*,int*,int* );
+extern void F_FUNC(claswp,CLASWP)(int*,complex_float*,int*,int*,int*,int*,int* );
+extern void F_FUNC(zlaswp,ZLASWP)(int*,complex_double*,int*,int*,int*,int*,int* );
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+
+/********************* cb_sselect_in_gees__user__routines *********************/
+PyObject *cb_sselect_in_gees__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_sselect_in_gees__user__routines_args_capi = NULL;
+int cb_sselect_in_gees__user__routines_nofargs = 0;
+jmp_buf cb_sselect_in_gees__user__routines_jmpbuf;
+/*typedef int(*cb_sselect_in_gees__user__routines_typedef)(float *,float *);*/
+static int cb_sselect_in_gees__user__routines (float *arg1_cb_capi,float *arg2_cb_capi) {
+  PyTupleObject *capi_arglist = cb_sselect_in_gees__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int return_value;
+  float arg1=(*arg1_cb_capi);
+  float arg2=(*arg2_cb_capi);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_sselect_in_gees__user__routines (maxnofargs=2(-0))\n");
+  CFUNCSMESSPY("cb:cb_sselect_in_gees__user__routines_capi=",cb_sselect_in_gees__user__routines_capi);
+  if (cb_sselect_in_gees__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_sselect_in_gees__user__routines_capi = PyObject_GetAttrString(flapack_module,"sselect");
+  }
+  if (cb_sselect_in_gees__user__routines_capi==NULL) {
+    PyErr_SetString(flapack_error,"cb: Callback sselect not defined (as an argument or module flapack attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_sselect_in_gees__user__routines_capi)) {
+  cb_sselect_in_gees__user__routines_typedef cb_sselect_in_gees__user__routines_cptr;
+  cb_sselect_in_gees__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_sselect_in_gees__user__routines_capi);
+  return_value=(*cb_sselect_in_gees__user__routines_cptr)(arg1_cb_capi,arg2_cb_capi);
+    return return_value;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(flapack_module,"sselect_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(flapack_error,"Failed to convert flapack.sselect_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(flapack_error,"Callback sselect argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_sselect_in_gees__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_float1(arg1)))
+      goto capi_fail;
+  if (cb_sselect_in_gees__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_float1(arg2)))
+      goto capi_fail;
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function sselect.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_sselect_in_gees__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_sselect_in_gees__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i)
+    GETSCALARFROMPYTUPLE(capi_return,capi_i++,&return_value,int,"int_from_pyobj failed in converting return_value of call-back function cb_sselect_in_gees__user__routines to C int\n");
+  CFUNCSMESS("cb:cb_sselect_in_gees__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_sselect_in_gees__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_sselect_in_gees__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+  return return_value;
+}
+/***************** end of cb_sselect_in_gees__user__routines *****************/
+
+
+/********************* cb_dselect_in_gees__user__routines *********************/
+PyObject *cb_dselect_in_gees__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_dselect_in_gees__user__routines_args_capi = NULL;
+int cb_dselect_in_gees__user__routines_nofargs = 0;
+jmp_buf cb_dselect_in_gees__user__routines_jmpbuf;
+/*typedef int(*cb_dselect_in_gees__user__routines_typedef)(double *,double *);*/
+static int cb_dselect_in_gees__user__routines (double *arg1_cb_capi,double *arg2_cb_capi) {
+  PyTupleObject *capi_arglist = cb_dselect_in_gees__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int return_value;
+  double arg1=(*arg1_cb_capi);
+  double arg2=(*arg2_cb_capi);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_dselect_in_gees__user__routines (maxnofargs=2(-0))\n");
+  CFUNCSMESSPY("cb:cb_dselect_in_gees__user__routines_capi=",cb_dselect_in_gees__user__routines_capi);
+  if (cb_dselect_in_gees__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_dselect_in_gees__user__routines_capi = PyObject_GetAttrString(flapack_module,"dselect");
+  }
+  if (cb_dselect_in_gees__user__routines_capi==NULL) {
+    PyErr_SetString(flapack_error,"cb: Callback dselect not defined (as an argument or module flapack attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_dselect_in_gees__user__routines_capi)) {
+  cb_dselect_in_gees__user__routines_typedef cb_dselect_in_gees__user__routines_cptr;
+  cb_dselect_in_gees__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_dselect_in_gees__user__routines_capi);
+  return_value=(*cb_dselect_in_gees__user__routines_cptr)(arg1_cb_capi,arg2_cb_capi);
+    return return_value;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(flapack_module,"dselect_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(flapack_error,"Failed to convert flapack.dselect_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(flapack_error,"Callback dselect argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_dselect_in_gees__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_double1(arg1)))
+      goto capi_fail;
+  if (cb_dselect_in_gees__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_double1(arg2)))
+      goto capi_fail;
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function dselect.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_dselect_in_gees__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_dselect_in_gees__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i)
+    GETSCALARFROMPYTUPLE(capi_return,capi_i++,&return_value,int,"int_from_pyobj failed in converting return_value of call-back function cb_dselect_in_gees__user__routines to C int\n");
+  CFUNCSMESS("cb:cb_dselect_in_gees__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_dselect_in_gees__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_dselect_in_gees__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+  return return_value;
+}
+/***************** end of cb_dselect_in_gees__user__routines *****************/
+
+
+/********************* cb_cselect_in_gees__user__routines *********************/
+PyObject *cb_cselect_in_gees__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_cselect_in_gees__user__routines_args_capi = NULL;
+int cb_cselect_in_gees__user__routines_nofargs = 0;
+jmp_buf cb_cselect_in_gees__user__routines_jmpbuf;
+/*typedef int(*cb_cselect_in_gees__user__routines_typedef)(complex_float *);*/
+static int cb_cselect_in_gees__user__routines (complex_float *arg_cb_capi) {
+  PyTupleObject *capi_arglist = cb_cselect_in_gees__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int return_value;
+  complex_float arg=(*arg_cb_capi);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_cselect_in_gees__user__routines (maxnofargs=1(-0))\n");
+  CFUNCSMESSPY("cb:cb_cselect_in_gees__user__routines_capi=",cb_cselect_in_gees__user__routines_capi);
+  if (cb_cselect_in_gees__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_cselect_in_gees__user__routines_capi = PyObject_GetAttrString(flapack_module,"cselect");
+  }
+  if (cb_cselect_in_gees__user__routines_capi==NULL) {
+    PyErr_SetString(flapack_error,"cb: Callback cselect not defined (as an argument or module flapack attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_cselect_in_gees__user__routines_capi)) {
+  cb_cselect_in_gees__user__routines_typedef cb_cselect_in_gees__user__routines_cptr;
+  cb_cselect_in_gees__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_cselect_in_gees__user__routines_capi);
+  return_value=(*cb_cselect_in_gees__user__routines_cptr)(arg_cb_capi);
+    return return_value;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(flapack_module,"cselect_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(flapack_error,"Failed to convert flapack.cselect_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(flapack_error,"Callback cselect argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_cselect_in_gees__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_complex_float1(arg)))
+      goto capi_fail;
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function cselect.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_cselect_in_gees__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_cselect_in_gees__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i)
+    GETSCALARFROMPYTUPLE(capi_return,capi_i++,&return_value,int,"int_from_pyobj failed in converting return_value of call-back function cb_cselect_in_gees__user__routines to C int\n");
+  CFUNCSMESS("cb:cb_cselect_in_gees__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_cselect_in_gees__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_cselect_in_gees__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+  return return_value;
+}
+/***************** end of cb_cselect_in_gees__user__routines *****************/
+
+
+/********************* cb_zselect_in_gees__user__routines *********************/
+PyObject *cb_zselect_in_gees__user__routines_capi = NULL;/*was Py_None*/
+PyTupleObject *cb_zselect_in_gees__user__routines_args_capi = NULL;
+int cb_zselect_in_gees__user__routines_nofargs = 0;
+jmp_buf cb_zselect_in_gees__user__routines_jmpbuf;
+/*typedef int(*cb_zselect_in_gees__user__routines_typedef)(complex_double *);*/
+static int cb_zselect_in_gees__user__routines (complex_double *arg_cb_capi) {
+  PyTupleObject *capi_arglist = cb_zselect_in_gees__user__routines_args_capi;
+  PyObject *capi_return = NULL;
+  PyObject *capi_tmp = NULL;
+  PyObject *capi_arglist_list = NULL;
+  int capi_j,capi_i = 0;
+  int capi_longjmp_ok = 1;
+/*decl*/
+  int return_value;
+  complex_double arg=(*arg_cb_capi);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_clock();
+#endif
+  CFUNCSMESS("cb:Call-back function cb_zselect_in_gees__user__routines (maxnofargs=1(-0))\n");
+  CFUNCSMESSPY("cb:cb_zselect_in_gees__user__routines_capi=",cb_zselect_in_gees__user__routines_capi);
+  if (cb_zselect_in_gees__user__routines_capi==NULL) {
+    capi_longjmp_ok = 0;
+    cb_zselect_in_gees__user__routines_capi = PyObject_GetAttrString(flapack_module,"zselect");
+  }
+  if (cb_zselect_in_gees__user__routines_capi==NULL) {
+    PyErr_SetString(flapack_error,"cb: Callback zselect not defined (as an argument or module flapack attribute).\n");
+    goto capi_fail;
+  }
+  if (F2PyCapsule_Check(cb_zselect_in_gees__user__routines_capi)) {
+  cb_zselect_in_gees__user__routines_typedef cb_zselect_in_gees__user__routines_cptr;
+  cb_zselect_in_gees__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_zselect_in_gees__user__routines_capi);
+  return_value=(*cb_zselect_in_gees__user__routines_cptr)(arg_cb_capi);
+    return return_value;
+  }
+  if (capi_arglist==NULL) {
+    capi_longjmp_ok = 0;
+    capi_tmp = PyObject_GetAttrString(flapack_module,"zselect_extra_args");
+    if (capi_tmp) {
+      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
+      if (capi_arglist==NULL) {
+        PyErr_SetString(flapack_error,"Failed to convert flapack.zselect_extra_args to tuple.\n");
+        goto capi_fail;
+      }
+    } else {
+      PyErr_Clear();
+      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
+    }
+  }
+  if (capi_arglist == NULL) {
+    PyErr_SetString(flapack_error,"Callback zselect argument list is not set.\n");
+    goto capi_fail;
+  }
+/*setdims*/
+#ifdef PYPY_VERSION
+#define CAPI_ARGLIST_SETITEM(idx, value) PyList_SetItem((PyObject *)capi_arglist_list, idx, value)
+  capi_arglist_list = PySequence_List(capi_arglist);
+  if (capi_arglist_list == NULL) goto capi_fail;
+#else
+#define CAPI_ARGLIST_SETITEM(idx, value) PyTuple_SetItem((PyObject *)capi_arglist, idx, value)
+#endif
+/*pyobjfrom*/
+  if (cb_zselect_in_gees__user__routines_nofargs>capi_i)
+    if (CAPI_ARGLIST_SETITEM(capi_i++,pyobj_from_complex_double1(arg)))
+      goto capi_fail;
+#undef CAPI_ARGLIST_SETITEM
+#ifdef PYPY_VERSION
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist_list);
+#else
+  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
+#endif
+  CFUNCSMESS("cb:Call-back calling Python function zselect.\n");
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_start_call_clock();
+#endif
+#ifdef PYPY_VERSION
+  capi_return = PyObject_CallObject(cb_zselect_in_gees__user__routines_capi,(PyObject *)capi_arglist_list);
+  Py_DECREF(capi_arglist_list);
+  capi_arglist_list = NULL;
+#else
+  capi_return = PyObject_CallObject(cb_zselect_in_gees__user__routines_capi,(PyObject *)capi_arglist);
+#endif
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_call_clock();
+#endif
+  CFUNCSMESSPY("cb:capi_return=",capi_return);
+  if (capi_return == NULL) {
+    fprintf(stderr,"capi_return is NULL\n");
+    goto capi_fail;
+  }
+  if (capi_return == Py_None) {
+    Py_DECREF(capi_return);
+    capi_return = Py_BuildValue("()");
+  }
+  else if (!PyTuple_Check(capi_return)) {
+    capi_return = Py_BuildValue("(N)",capi_return);
+  }
+  capi_j = PyTuple_Size(capi_return);
+  capi_i = 0;
+/*frompyobj*/
+  if (capi_j>capi_i)
+    GETSCALARFROMPYTUPLE(capi_return,capi_i++,&return_value,int,"int_from_pyobj failed in converting return_value of call-back function cb_zselect_in_gees__user__routines to C int\n");
+  CFUNCSMESS("cb:cb_zselect_in_gees__user__routines:successful\n");
+  Py_DECREF(capi_return);
+#ifdef F2PY_REPORT_ATEXIT
+f2py_cb_stop_clock();
+#endif
+  goto capi_return_pt;
+capi_fail:
+  fprintf(stderr,"Call-back cb_zselect_in_gees__user__routines failed.\n");
+  Py_XDECREF(capi_return);
+  Py_XDECREF(capi_arglist_list);
+  if (capi_longjmp_ok)
+    longjmp(cb_zselect_in_gees__user__routines_jmpbuf,-1);
+capi_return_pt:
+  ;
+  return return_value;
+}
+/***************** end of cb_zselect_in_gees__user__routines *****************/
+
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** sgesv ***********************************/
+static char doc_f2py_rout_flapack_sgesv[] = "\
+lu,piv,x,info = sgesv(a,b,[overwrite_a,overwrite_b])\n\nWrapper for ``sgesv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"b : input rank-2 array('f') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('f') with bounds (n,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('f') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(sgesv,SGESV)(int*,int*,float*,int*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgesv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,int*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|ii:flapack.sgesv",\
+    capi_kwlist,&a_capi,&b_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgesv to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.sgesv to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.sgesv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;(*f2py_func)(&n,&nrhs,a,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,a,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_a_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sgesv ********************************/
+
+/*********************************** dgesv ***********************************/
+static char doc_f2py_rout_flapack_dgesv[] = "\
+lu,piv,x,info = dgesv(a,b,[overwrite_a,overwrite_b])\n\nWrapper for ``dgesv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"b : input rank-2 array('d') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('d') with bounds (n,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('d') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(dgesv,DGESV)(int*,int*,double*,int*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgesv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,int*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|ii:flapack.dgesv",\
+    capi_kwlist,&a_capi,&b_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgesv to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.dgesv to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.dgesv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;(*f2py_func)(&n,&nrhs,a,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,a,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_a_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dgesv ********************************/
+
+/*********************************** cgesv ***********************************/
+static char doc_f2py_rout_flapack_cgesv[] = "\
+lu,piv,x,info = cgesv(a,b,[overwrite_a,overwrite_b])\n\nWrapper for ``cgesv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"b : input rank-2 array('F') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('F') with bounds (n,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('F') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(cgesv,CGESV)(int*,int*,complex_float*,int*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgesv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_float*,int*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|ii:flapack.cgesv",\
+    capi_kwlist,&a_capi,&b_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgesv to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.cgesv to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.cgesv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;(*f2py_func)(&n,&nrhs,a,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,a,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_a_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgesv ********************************/
+
+/*********************************** zgesv ***********************************/
+static char doc_f2py_rout_flapack_zgesv[] = "\
+lu,piv,x,info = zgesv(a,b,[overwrite_a,overwrite_b])\n\nWrapper for ``zgesv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"b : input rank-2 array('D') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('D') with bounds (n,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('D') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(zgesv,ZGESV)(int*,int*,complex_double*,int*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgesv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_double*,int*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|ii:flapack.zgesv",\
+    capi_kwlist,&a_capi,&b_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgesv to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.zgesv to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.zgesv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;(*f2py_func)(&n,&nrhs,a,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,a,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_a_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgesv ********************************/
+
+/*********************************** sgbsv ***********************************/
+static char doc_f2py_rout_flapack_sgbsv[] = "\
+lub,piv,x,info = sgbsv(kl,ku,ab,b,[overwrite_ab,overwrite_b])\n\nWrapper for ``sgbsv``.\
+\n\nParameters\n----------\n"
+"kl : input int\n"
+"ku : input int\n"
+"ab : input rank-2 array('f') with bounds (2*kl+ku+1,n)\n"
+"b : input rank-2 array('f') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_ab : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lub : rank-2 array('f') with bounds (2*kl+ku+1,n) and ab storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('f') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(sgbsv,SGBSV)(int*,int*,int*,int*,float*,int*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgbsv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,float*,int*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int kl = 0;
+  PyObject *kl_capi = Py_None;
+  int ku = 0;
+  PyObject *ku_capi = Py_None;
+  int nrhs = 0;
+  float *ab = NULL;
+  npy_intp ab_Dims[2] = {-1, -1};
+  const int ab_Rank = 2;
+  PyArrayObject *capi_ab_tmp = NULL;
+  int capi_ab_intent = 0;
+  int capi_overwrite_ab = 0;
+  PyObject *ab_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"kl","ku","ab","b","overwrite_ab","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|ii:flapack.sgbsv",\
+    capi_kwlist,&kl_capi,&ku_capi,&ab_capi,&b_capi,&capi_overwrite_ab,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable kl */
+    f2py_success = int_from_pyobj(&kl,kl_capi,"flapack.sgbsv() 1st argument (kl) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ku */
+    f2py_success = int_from_pyobj(&ku,ku_capi,"flapack.sgbsv() 2nd argument (ku) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ab */
+  capi_ab_intent |= (capi_overwrite_ab?0:F2PY_INTENT_COPY);
+  ab_Dims[0]=2*kl+ku+1;
+  capi_ab_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_ab_tmp = array_from_pyobj(NPY_FLOAT,ab_Dims,ab_Rank,capi_ab_intent,ab_capi);
+  if (capi_ab_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `ab' of flapack.sgbsv to C/Fortran array" );
+  } else {
+    ab = (float *)(PyArray_DATA(capi_ab_tmp));
+
+  CHECKARRAY(2*kl+ku+1==shape(ab,0),"2*kl+ku+1==shape(ab,0)","3rd argument ab") {
+  /* Processing variable n */
+  n = shape(ab,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.sgbsv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th argument `b' of flapack.sgbsv to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(ab,1)==shape(b,0),"shape(ab,1)==shape(b,0)","4th argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i=2*kl+ku+1;(*f2py_func)(&n,&kl,&ku,&nrhs,ab,&i,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&kl,&ku,&nrhs,ab,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_ab_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(ab,1)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(2*kl+ku+1==shape(ab,0))*/
+  }  /*if (capi_ab_tmp == NULL) ... else of ab*/
+  /* End of cleaning variable ab */
+  } /*if (f2py_success) of ku*/
+  /* End of cleaning variable ku */
+  } /*if (f2py_success) of kl*/
+  /* End of cleaning variable kl */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sgbsv ********************************/
+
+/*********************************** dgbsv ***********************************/
+static char doc_f2py_rout_flapack_dgbsv[] = "\
+lub,piv,x,info = dgbsv(kl,ku,ab,b,[overwrite_ab,overwrite_b])\n\nWrapper for ``dgbsv``.\
+\n\nParameters\n----------\n"
+"kl : input int\n"
+"ku : input int\n"
+"ab : input rank-2 array('d') with bounds (2*kl+ku+1,n)\n"
+"b : input rank-2 array('d') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_ab : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lub : rank-2 array('d') with bounds (2*kl+ku+1,n) and ab storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('d') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(dgbsv,DGBSV)(int*,int*,int*,int*,double*,int*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgbsv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,double*,int*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int kl = 0;
+  PyObject *kl_capi = Py_None;
+  int ku = 0;
+  PyObject *ku_capi = Py_None;
+  int nrhs = 0;
+  double *ab = NULL;
+  npy_intp ab_Dims[2] = {-1, -1};
+  const int ab_Rank = 2;
+  PyArrayObject *capi_ab_tmp = NULL;
+  int capi_ab_intent = 0;
+  int capi_overwrite_ab = 0;
+  PyObject *ab_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"kl","ku","ab","b","overwrite_ab","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|ii:flapack.dgbsv",\
+    capi_kwlist,&kl_capi,&ku_capi,&ab_capi,&b_capi,&capi_overwrite_ab,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable kl */
+    f2py_success = int_from_pyobj(&kl,kl_capi,"flapack.dgbsv() 1st argument (kl) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ku */
+    f2py_success = int_from_pyobj(&ku,ku_capi,"flapack.dgbsv() 2nd argument (ku) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ab */
+  capi_ab_intent |= (capi_overwrite_ab?0:F2PY_INTENT_COPY);
+  ab_Dims[0]=2*kl+ku+1;
+  capi_ab_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_ab_tmp = array_from_pyobj(NPY_DOUBLE,ab_Dims,ab_Rank,capi_ab_intent,ab_capi);
+  if (capi_ab_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `ab' of flapack.dgbsv to C/Fortran array" );
+  } else {
+    ab = (double *)(PyArray_DATA(capi_ab_tmp));
+
+  CHECKARRAY(2*kl+ku+1==shape(ab,0),"2*kl+ku+1==shape(ab,0)","3rd argument ab") {
+  /* Processing variable n */
+  n = shape(ab,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.dgbsv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th argument `b' of flapack.dgbsv to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(ab,1)==shape(b,0),"shape(ab,1)==shape(b,0)","4th argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i=2*kl+ku+1;(*f2py_func)(&n,&kl,&ku,&nrhs,ab,&i,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&kl,&ku,&nrhs,ab,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_ab_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(ab,1)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(2*kl+ku+1==shape(ab,0))*/
+  }  /*if (capi_ab_tmp == NULL) ... else of ab*/
+  /* End of cleaning variable ab */
+  } /*if (f2py_success) of ku*/
+  /* End of cleaning variable ku */
+  } /*if (f2py_success) of kl*/
+  /* End of cleaning variable kl */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dgbsv ********************************/
+
+/*********************************** cgbsv ***********************************/
+static char doc_f2py_rout_flapack_cgbsv[] = "\
+lub,piv,x,info = cgbsv(kl,ku,ab,b,[overwrite_ab,overwrite_b])\n\nWrapper for ``cgbsv``.\
+\n\nParameters\n----------\n"
+"kl : input int\n"
+"ku : input int\n"
+"ab : input rank-2 array('F') with bounds (2*kl+ku+1,n)\n"
+"b : input rank-2 array('F') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_ab : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lub : rank-2 array('F') with bounds (2*kl+ku+1,n) and ab storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('F') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(cgbsv,CGBSV)(int*,int*,int*,int*,complex_float*,int*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgbsv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,complex_float*,int*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int kl = 0;
+  PyObject *kl_capi = Py_None;
+  int ku = 0;
+  PyObject *ku_capi = Py_None;
+  int nrhs = 0;
+  complex_float *ab = NULL;
+  npy_intp ab_Dims[2] = {-1, -1};
+  const int ab_Rank = 2;
+  PyArrayObject *capi_ab_tmp = NULL;
+  int capi_ab_intent = 0;
+  int capi_overwrite_ab = 0;
+  PyObject *ab_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"kl","ku","ab","b","overwrite_ab","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|ii:flapack.cgbsv",\
+    capi_kwlist,&kl_capi,&ku_capi,&ab_capi,&b_capi,&capi_overwrite_ab,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable kl */
+    f2py_success = int_from_pyobj(&kl,kl_capi,"flapack.cgbsv() 1st argument (kl) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ku */
+    f2py_success = int_from_pyobj(&ku,ku_capi,"flapack.cgbsv() 2nd argument (ku) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ab */
+  capi_ab_intent |= (capi_overwrite_ab?0:F2PY_INTENT_COPY);
+  ab_Dims[0]=2*kl+ku+1;
+  capi_ab_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_ab_tmp = array_from_pyobj(NPY_CFLOAT,ab_Dims,ab_Rank,capi_ab_intent,ab_capi);
+  if (capi_ab_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `ab' of flapack.cgbsv to C/Fortran array" );
+  } else {
+    ab = (complex_float *)(PyArray_DATA(capi_ab_tmp));
+
+  CHECKARRAY(2*kl+ku+1==shape(ab,0),"2*kl+ku+1==shape(ab,0)","3rd argument ab") {
+  /* Processing variable n */
+  n = shape(ab,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.cgbsv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th argument `b' of flapack.cgbsv to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(ab,1)==shape(b,0),"shape(ab,1)==shape(b,0)","4th argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i=2*kl+ku+1;(*f2py_func)(&n,&kl,&ku,&nrhs,ab,&i,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&kl,&ku,&nrhs,ab,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_ab_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(ab,1)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(2*kl+ku+1==shape(ab,0))*/
+  }  /*if (capi_ab_tmp == NULL) ... else of ab*/
+  /* End of cleaning variable ab */
+  } /*if (f2py_success) of ku*/
+  /* End of cleaning variable ku */
+  } /*if (f2py_success) of kl*/
+  /* End of cleaning variable kl */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgbsv ********************************/
+
+/*********************************** zgbsv ***********************************/
+static char doc_f2py_rout_flapack_zgbsv[] = "\
+lub,piv,x,info = zgbsv(kl,ku,ab,b,[overwrite_ab,overwrite_b])\n\nWrapper for ``zgbsv``.\
+\n\nParameters\n----------\n"
+"kl : input int\n"
+"ku : input int\n"
+"ab : input rank-2 array('D') with bounds (2*kl+ku+1,n)\n"
+"b : input rank-2 array('D') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_ab : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lub : rank-2 array('D') with bounds (2*kl+ku+1,n) and ab storage\n"
+"piv : rank-1 array('i') with bounds (n)\n"
+"x : rank-2 array('D') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(zgbsv,ZGBSV)(int*,int*,int*,int*,complex_double*,int*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgbsv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,complex_double*,int*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int kl = 0;
+  PyObject *kl_capi = Py_None;
+  int ku = 0;
+  PyObject *ku_capi = Py_None;
+  int nrhs = 0;
+  complex_double *ab = NULL;
+  npy_intp ab_Dims[2] = {-1, -1};
+  const int ab_Rank = 2;
+  PyArrayObject *capi_ab_tmp = NULL;
+  int capi_ab_intent = 0;
+  int capi_overwrite_ab = 0;
+  PyObject *ab_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"kl","ku","ab","b","overwrite_ab","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|ii:flapack.zgbsv",\
+    capi_kwlist,&kl_capi,&ku_capi,&ab_capi,&b_capi,&capi_overwrite_ab,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable kl */
+    f2py_success = int_from_pyobj(&kl,kl_capi,"flapack.zgbsv() 1st argument (kl) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ku */
+    f2py_success = int_from_pyobj(&ku,ku_capi,"flapack.zgbsv() 2nd argument (ku) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ab */
+  capi_ab_intent |= (capi_overwrite_ab?0:F2PY_INTENT_COPY);
+  ab_Dims[0]=2*kl+ku+1;
+  capi_ab_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_ab_tmp = array_from_pyobj(NPY_CDOUBLE,ab_Dims,ab_Rank,capi_ab_intent,ab_capi);
+  if (capi_ab_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `ab' of flapack.zgbsv to C/Fortran array" );
+  } else {
+    ab = (complex_double *)(PyArray_DATA(capi_ab_tmp));
+
+  CHECKARRAY(2*kl+ku+1==shape(ab,0),"2*kl+ku+1==shape(ab,0)","3rd argument ab") {
+  /* Processing variable n */
+  n = shape(ab,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.zgbsv to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th argument `b' of flapack.zgbsv to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(ab,1)==shape(b,0),"shape(ab,1)==shape(b,0)","4th argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i=2*kl+ku+1;(*f2py_func)(&n,&kl,&ku,&nrhs,ab,&i,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&kl,&ku,&nrhs,ab,piv,b,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_ab_tmp,capi_piv_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(ab,1)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(2*kl+ku+1==shape(ab,0))*/
+  }  /*if (capi_ab_tmp == NULL) ... else of ab*/
+  /* End of cleaning variable ab */
+  } /*if (f2py_success) of ku*/
+  /* End of cleaning variable ku */
+  } /*if (f2py_success) of kl*/
+  /* End of cleaning variable kl */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgbsv ********************************/
+
+/*********************************** sposv ***********************************/
+static char doc_f2py_rout_flapack_sposv[] = "\
+c,x,info = sposv(a,b,[lower,overwrite_a,overwrite_b])\n\nWrapper for ``sposv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"b : input rank-2 array('f') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('f') with bounds (n,n) and a storage\n"
+"x : rank-2 array('f') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(sposv,SPOSV)(char*,int*,int*,float*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sposv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,float*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"a","b","lower","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.sposv",\
+    capi_kwlist,&a_capi,&b_capi,&lower_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sposv to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.sposv() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","sposv:lower=%d",lower) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.sposv to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,a,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,a,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sposv ********************************/
+
+/*********************************** dposv ***********************************/
+static char doc_f2py_rout_flapack_dposv[] = "\
+c,x,info = dposv(a,b,[lower,overwrite_a,overwrite_b])\n\nWrapper for ``dposv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"b : input rank-2 array('d') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('d') with bounds (n,n) and a storage\n"
+"x : rank-2 array('d') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(dposv,DPOSV)(char*,int*,int*,double*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dposv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,double*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"a","b","lower","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.dposv",\
+    capi_kwlist,&a_capi,&b_capi,&lower_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dposv to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dposv() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","dposv:lower=%d",lower) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.dposv to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,a,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,a,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dposv ********************************/
+
+/*********************************** cposv ***********************************/
+static char doc_f2py_rout_flapack_cposv[] = "\
+c,x,info = cposv(a,b,[lower,overwrite_a,overwrite_b])\n\nWrapper for ``cposv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"b : input rank-2 array('F') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('F') with bounds (n,n) and a storage\n"
+"x : rank-2 array('F') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(cposv,CPOSV)(char*,int*,int*,complex_float*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cposv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_float*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"a","b","lower","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.cposv",\
+    capi_kwlist,&a_capi,&b_capi,&lower_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cposv to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.cposv() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","cposv:lower=%d",lower) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.cposv to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,a,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,a,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cposv ********************************/
+
+/*********************************** zposv ***********************************/
+static char doc_f2py_rout_flapack_zposv[] = "\
+c,x,info = zposv(a,b,[lower,overwrite_a,overwrite_b])\n\nWrapper for ``zposv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"b : input rank-2 array('D') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('D') with bounds (n,n) and a storage\n"
+"x : rank-2 array('D') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(zposv,ZPOSV)(char*,int*,int*,complex_double*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zposv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_double*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"a","b","lower","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.zposv",\
+    capi_kwlist,&a_capi,&b_capi,&lower_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zposv to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zposv() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","zposv:lower=%d",lower) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.zposv to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(b,0),"shape(a,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,a,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,a,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(a,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zposv ********************************/
+
+/*********************************** sgelss ***********************************/
+static char doc_f2py_rout_flapack_sgelss[] = "\
+v,x,s,rank,info = sgelss(a,b,[cond,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``sgelss``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (m,n)\n"
+"b : input rank-2 array('f') with bounds (maxmn,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"cond : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 3*minmn+MAX(2*minmn,MAX(maxmn,nrhs))\n"
+"\nReturns\n-------\n"
+"v : rank-2 array('f') with bounds (m,n) and a storage\n"
+"x : rank-2 array('f') with bounds (maxmn,nrhs) and b storage\n"
+"s : rank-1 array('f') with bounds (minmn)\n"
+"rank : int\n"
+"info : int";
+/* extern void F_FUNC(sgelss,SGELSS)(int*,int*,int*,float*,int*,float*,int*,float*,float*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgelss(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,float*,int*,float*,int*,float*,float*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int maxmn = 0;
+  int nrhs = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  float *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  float cond = 0;
+  PyObject *cond_capi = Py_None;
+  int r = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","cond","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOii:flapack.sgelss",\
+    capi_kwlist,&a_capi,&b_capi,&cond_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgelss to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable r */
+  /* Processing variable cond */
+  if (cond_capi == Py_None) cond = -1.0; else
+    f2py_success = float_from_pyobj(&cond,cond_capi,"flapack.sgelss() 1st keyword (cond) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable maxmn */
+  maxmn = MAX(m,n);
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_FLOAT,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.sgelss to C/Fortran array" );
+  } else {
+    s = (float *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=maxmn;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.sgelss to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(maxmn==shape(b,0),"maxmn==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*minmn+MAX(2*minmn,MAX(maxmn,nrhs)); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sgelss() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=1,"lwork>=1","2nd keyword lwork","sgelss:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sgelss to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&nrhs,a,&m,b,&maxmn,s,&cond,&r,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&maxmn,&nrhs,a,b,s,&cond,&r,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNii",capi_a_tmp,capi_b_tmp,capi_s_tmp,r,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(maxmn==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable maxmn */
+  /* End of cleaning variable minmn */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of cond*/
+  /* End of cleaning variable cond */
+  /* End of cleaning variable r */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgelss *******************************/
+
+/*********************************** dgelss ***********************************/
+static char doc_f2py_rout_flapack_dgelss[] = "\
+v,x,s,rank,info = dgelss(a,b,[cond,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``dgelss``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (m,n)\n"
+"b : input rank-2 array('d') with bounds (maxmn,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"cond : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 3*minmn+MAX(2*minmn,MAX(maxmn,nrhs))\n"
+"\nReturns\n-------\n"
+"v : rank-2 array('d') with bounds (m,n) and a storage\n"
+"x : rank-2 array('d') with bounds (maxmn,nrhs) and b storage\n"
+"s : rank-1 array('d') with bounds (minmn)\n"
+"rank : int\n"
+"info : int";
+/* extern void F_FUNC(dgelss,DGELSS)(int*,int*,int*,double*,int*,double*,int*,double*,double*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgelss(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,double*,int*,double*,int*,double*,double*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int maxmn = 0;
+  int nrhs = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  double *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  double cond = 0;
+  PyObject *cond_capi = Py_None;
+  int r = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","cond","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOii:flapack.dgelss",\
+    capi_kwlist,&a_capi,&b_capi,&cond_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgelss to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable r */
+  /* Processing variable cond */
+  if (cond_capi == Py_None) cond = -1.0; else
+    f2py_success = double_from_pyobj(&cond,cond_capi,"flapack.dgelss() 1st keyword (cond) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable maxmn */
+  maxmn = MAX(m,n);
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_DOUBLE,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.dgelss to C/Fortran array" );
+  } else {
+    s = (double *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=maxmn;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.dgelss to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(maxmn==shape(b,0),"maxmn==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*minmn+MAX(2*minmn,MAX(maxmn,nrhs)); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dgelss() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=1,"lwork>=1","2nd keyword lwork","dgelss:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dgelss to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&nrhs,a,&m,b,&maxmn,s,&cond,&r,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&maxmn,&nrhs,a,b,s,&cond,&r,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNii",capi_a_tmp,capi_b_tmp,capi_s_tmp,r,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(maxmn==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable maxmn */
+  /* End of cleaning variable minmn */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of cond*/
+  /* End of cleaning variable cond */
+  /* End of cleaning variable r */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgelss *******************************/
+
+/*********************************** cgelss ***********************************/
+static char doc_f2py_rout_flapack_cgelss[] = "\
+v,x,s,rank,info = cgelss(a,b,[cond,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``cgelss``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (m,n)\n"
+"b : input rank-2 array('F') with bounds (maxmn,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"cond : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 2*minmn+MAX(maxmn,nrhs)\n"
+"\nReturns\n-------\n"
+"v : rank-2 array('F') with bounds (m,n) and a storage\n"
+"x : rank-2 array('F') with bounds (maxmn,nrhs) and b storage\n"
+"s : rank-1 array('f') with bounds (minmn)\n"
+"rank : int\n"
+"info : int";
+/* extern void F_FUNC(cgelss,CGELSS)(int*,int*,int*,complex_float*,int*,complex_float*,int*,float*,float*,int*,complex_float*,int*,float*,int* ); */
+static PyObject *f2py_rout_flapack_cgelss(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,complex_float*,int*,complex_float*,int*,float*,float*,int*,complex_float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int maxmn = 0;
+  int nrhs = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  float *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  float cond = 0;
+  PyObject *cond_capi = Py_None;
+  int r = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","cond","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOii:flapack.cgelss",\
+    capi_kwlist,&a_capi,&b_capi,&cond_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgelss to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable r */
+  /* Processing variable cond */
+  if (cond_capi == Py_None) cond = -1.0; else
+    f2py_success = float_from_pyobj(&cond,cond_capi,"flapack.cgelss() 1st keyword (cond) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable maxmn */
+  maxmn = MAX(m,n);
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_FLOAT,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.cgelss to C/Fortran array" );
+  } else {
+    s = (float *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=maxmn;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.cgelss to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(maxmn==shape(b,0),"maxmn==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*minmn+MAX(maxmn,nrhs); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cgelss() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=1,"lwork>=1","2nd keyword lwork","cgelss:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cgelss to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=5 * minmn - 1;
+  capi_rwork_intent |= F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cgelss to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&nrhs,a,&m,b,&maxmn,s,&cond,&r,work,&lwork,rwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&maxmn,&nrhs,a,b,s,&cond,&r,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNii",capi_a_tmp,capi_b_tmp,capi_s_tmp,r,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(maxmn==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable maxmn */
+  /* End of cleaning variable minmn */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of cond*/
+  /* End of cleaning variable cond */
+  /* End of cleaning variable r */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgelss *******************************/
+
+/*********************************** zgelss ***********************************/
+static char doc_f2py_rout_flapack_zgelss[] = "\
+v,x,s,rank,info = zgelss(a,b,[cond,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``zgelss``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (m,n)\n"
+"b : input rank-2 array('D') with bounds (maxmn,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"cond : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 2*minmn+MAX(maxmn,nrhs)\n"
+"\nReturns\n-------\n"
+"v : rank-2 array('D') with bounds (m,n) and a storage\n"
+"x : rank-2 array('D') with bounds (maxmn,nrhs) and b storage\n"
+"s : rank-1 array('d') with bounds (minmn)\n"
+"rank : int\n"
+"info : int";
+/* extern void F_FUNC(zgelss,ZGELSS)(int*,int*,int*,complex_double*,int*,complex_double*,int*,double*,double*,int*,complex_double*,int*,double*,int* ); */
+static PyObject *f2py_rout_flapack_zgelss(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,complex_double*,int*,complex_double*,int*,double*,double*,int*,complex_double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int maxmn = 0;
+  int nrhs = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  double *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  double cond = 0;
+  PyObject *cond_capi = Py_None;
+  int r = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","cond","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOii:flapack.zgelss",\
+    capi_kwlist,&a_capi,&b_capi,&cond_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgelss to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable r */
+  /* Processing variable cond */
+  if (cond_capi == Py_None) cond = -1.0; else
+    f2py_success = double_from_pyobj(&cond,cond_capi,"flapack.zgelss() 1st keyword (cond) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable maxmn */
+  maxmn = MAX(m,n);
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_DOUBLE,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.zgelss to C/Fortran array" );
+  } else {
+    s = (double *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=maxmn;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.zgelss to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(maxmn==shape(b,0),"maxmn==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*minmn+MAX(maxmn,nrhs); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zgelss() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=1,"lwork>=1","2nd keyword lwork","zgelss:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zgelss to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=5 * minmn - 1;
+  capi_rwork_intent |= F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zgelss to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&nrhs,a,&m,b,&maxmn,s,&cond,&r,work,&lwork,rwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&maxmn,&nrhs,a,b,s,&cond,&r,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNii",capi_a_tmp,capi_b_tmp,capi_s_tmp,r,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(maxmn==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable maxmn */
+  /* End of cleaning variable minmn */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of cond*/
+  /* End of cleaning variable cond */
+  /* End of cleaning variable r */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgelss *******************************/
+
+/*********************************** ssyev ***********************************/
+static char doc_f2py_rout_flapack_ssyev[] = "\
+w,v,info = ssyev(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``ssyev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('f') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(ssyev,SSYEV)(char*,char*,int*,float*,int*,float*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_ssyev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,float*,int*,float*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.ssyev",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.ssyev to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.ssyev() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","ssyev:lower=%d",lower) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.ssyev() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","ssyev:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.ssyev to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.ssyev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=3*n-1,"lwork>=3*n-1","3rd keyword lwork","ssyev:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.ssyev to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=3*n-1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of ssyev ********************************/
+
+/*********************************** dsyev ***********************************/
+static char doc_f2py_rout_flapack_dsyev[] = "\
+w,v,info = dsyev(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``dsyev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('d') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(dsyev,DSYEV)(char*,char*,int*,double*,int*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dsyev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,double*,int*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.dsyev",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dsyev to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dsyev() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","dsyev:lower=%d",lower) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.dsyev() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","dsyev:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.dsyev to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dsyev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=3*n-1,"lwork>=3*n-1","3rd keyword lwork","dsyev:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dsyev to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=3*n-1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dsyev ********************************/
+
+/*********************************** cheev ***********************************/
+static char doc_f2py_rout_flapack_cheev[] = "\
+w,v,info = cheev(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``cheev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('F') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(cheev,CHEEV)(char*,char*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int* ); */
+static PyObject *f2py_rout_flapack_cheev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.cheev",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cheev to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.cheev() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","cheev:lower=%d",lower) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.cheev() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","cheev:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.cheev to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cheev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=2*n-1,"lwork>=2*n-1","3rd keyword lwork","cheev:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cheev to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=3 * n - 1;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cheev to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,rwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=2*n-1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cheev ********************************/
+
+/*********************************** zheev ***********************************/
+static char doc_f2py_rout_flapack_zheev[] = "\
+w,v,info = zheev(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``zheev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('D') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(zheev,ZHEEV)(char*,char*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int* ); */
+static PyObject *f2py_rout_flapack_zheev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.zheev",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zheev to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zheev() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","zheev:lower=%d",lower) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.zheev() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","zheev:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.zheev to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zheev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=2*n-1,"lwork>=2*n-1","3rd keyword lwork","zheev:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zheev to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=3 * n - 1;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zheev to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,rwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=2*n-1)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zheev ********************************/
+
+/*********************************** ssyevd ***********************************/
+static char doc_f2py_rout_flapack_ssyevd[] = "\
+w,v,info = ssyevd(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``ssyevd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?1+6*n+2*n*n:2*n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('f') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(ssyevd,SSYEVD)(char*,char*,int*,float*,int*,float*,float*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_ssyevd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,float*,int*,float*,float*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.ssyevd",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.ssyevd to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.ssyevd() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","ssyevd:lower=%d",lower) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.ssyevd() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","ssyevd:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.ssyevd to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?1+6*n+2*n*n:2*n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.ssyevd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=(compute_v?1+6*n+2*n*n:2*n+1),"lwork>=(compute_v?1+6*n+2*n*n:2*n+1)","3rd keyword lwork","ssyevd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.ssyevd to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.ssyevd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR(lwork>=(compute_v?1+6*n+2*n*n:2*n+1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of ssyevd *******************************/
+
+/*********************************** dsyevd ***********************************/
+static char doc_f2py_rout_flapack_dsyevd[] = "\
+w,v,info = dsyevd(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``dsyevd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?1+6*n+2*n*n:2*n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('d') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(dsyevd,DSYEVD)(char*,char*,int*,double*,int*,double*,double*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dsyevd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,double*,int*,double*,double*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.dsyevd",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dsyevd to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dsyevd() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","dsyevd:lower=%d",lower) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.dsyevd() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","dsyevd:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.dsyevd to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?1+6*n+2*n*n:2*n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dsyevd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=(compute_v?1+6*n+2*n*n:2*n+1),"lwork>=(compute_v?1+6*n+2*n*n:2*n+1)","3rd keyword lwork","dsyevd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dsyevd to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.dsyevd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR(lwork>=(compute_v?1+6*n+2*n*n:2*n+1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dsyevd *******************************/
+
+/*********************************** cheevd ***********************************/
+static char doc_f2py_rout_flapack_cheevd[] = "\
+w,v,info = cheevd(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``cheevd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?2*n+n*n:n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('F') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(cheevd,CHEEVD)(char*,char*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cheevd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int lrwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.cheevd",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cheevd to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.cheevd() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","cheevd:lower=%d",lower) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.cheevd() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","cheevd:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.cheevd to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?2*n+n*n:n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cheevd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=(compute_v?2*n+n*n:n+1),"lwork>=(compute_v?2*n+n*n:n+1)","3rd keyword lwork","cheevd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cheevd to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable lrwork */
+  lrwork = (compute_v?1+5*n+2*n*n:n);
+  /* Processing variable rwork */
+  rwork_Dims[0]=lrwork;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cheevd to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.cheevd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,rwork,&lrwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,iwork,&liwork,rwork,&lrwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+  /* End of cleaning variable lrwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR(lwork>=(compute_v?2*n+n*n:n+1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cheevd *******************************/
+
+/*********************************** zheevd ***********************************/
+static char doc_f2py_rout_flapack_zheevd[] = "\
+w,v,info = zheevd(a,[compute_v,lower,lwork,overwrite_a])\n\nWrapper for ``zheevd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?2*n+n*n:n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('D') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(zheevd,ZHEEVD)(char*,char*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zheevd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int lrwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.zheevd",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zheevd to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zheevd() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","zheevd:lower=%d",lower) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.zheevd() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","zheevd:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.zheevd to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?2*n+n*n:n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zheevd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=(compute_v?2*n+n*n:n+1),"lwork>=(compute_v?2*n+n*n:n+1)","3rd keyword lwork","zheevd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zheevd to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable lrwork */
+  lrwork = (compute_v?1+5*n+2*n*n:n);
+  /* Processing variable rwork */
+  rwork_Dims[0]=lrwork;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zheevd to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.zheevd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,w,work,&lwork,rwork,&lrwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&compute_v,&lower,&n,w,a,work,&lwork,iwork,&liwork,rwork,&lrwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+  /* End of cleaning variable lrwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR(lwork>=(compute_v?2*n+n*n:n+1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zheevd *******************************/
+
+/*********************************** ssyevr ***********************************/
+static char doc_f2py_rout_flapack_ssyevr[] = "\
+w,v,info = ssyevr(a,[compute_v,lower,vrange,irange,atol,lwork,overwrite_a])\n\nWrapper for ``ssyevr``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"vrange : input rank-1 array('f') with bounds (2)\n"
+"irange : input rank-1 array('i') with bounds (2)\n"
+"atol : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 26*n\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (m)\n"
+"v : rank-2 array('f') with bounds (ldz,m) and z storage\n"
+"info : int";
+/* extern void F_FUNC(ssyevr,SSYEVR)(char*,char*,char*,int*,float*,int*,float*,float*,int*,int*,float*,int*,float*,float*,int*,int*,float*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_ssyevr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,float*,int*,float*,float*,int*,int*,float*,int*,float*,float*,int*,int*,float*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  float *vrange = NULL;
+  npy_intp vrange_Dims[1] = {-1};
+  const int vrange_Rank = 1;
+  PyArrayObject *capi_vrange_tmp = NULL;
+  int capi_vrange_intent = 0;
+  PyObject *vrange_capi = Py_None;
+  int *irange = NULL;
+  npy_intp irange_Dims[1] = {-1};
+  const int irange_Rank = 1;
+  PyArrayObject *capi_irange_tmp = NULL;
+  int capi_irange_intent = 0;
+  PyObject *irange_capi = Py_None;
+  float atol = 0;
+  PyObject *atol_capi = Py_None;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  float *z = NULL;
+  npy_intp z_Dims[2] = {-1, -1};
+  const int z_Rank = 2;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  int m = 0;
+  int ldz = 0;
+  int *isuppz = NULL;
+  npy_intp isuppz_Dims[1] = {-1};
+  const int isuppz_Rank = 1;
+  PyArrayObject *capi_isuppz_tmp = NULL;
+  int capi_isuppz_intent = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","vrange","irange","atol","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOOOOi:flapack.ssyevr",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&vrange_capi,&irange_capi,&atol_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable atol */
+  if (atol_capi == Py_None) atol = -1.0; else
+    f2py_success = float_from_pyobj(&atol,atol_capi,"flapack.ssyevr() 5th keyword (atol) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.ssyevr() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","ssyevr:compute_v=%d",compute_v) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.ssyevr() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","ssyevr:lower=%d",lower) {
+  /* Processing variable vrange */
+  vrange_Dims[0]=2;
+  capi_vrange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_vrange_tmp = array_from_pyobj(NPY_FLOAT,vrange_Dims,vrange_Rank,capi_vrange_intent,vrange_capi);
+  if (capi_vrange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd keyword `vrange' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    vrange = (float *)(PyArray_DATA(capi_vrange_tmp));
+
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable liwork */
+  liwork = 10*n;
+  /* Processing variable irange */
+  irange_Dims[0]=2;
+  capi_irange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_irange_tmp = array_from_pyobj(NPY_INT,irange_Dims,irange_Rank,capi_irange_intent,irange_capi);
+  if (capi_irange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th keyword `irange' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    irange = (int *)(PyArray_DATA(capi_irange_tmp));
+
+  CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n),"irange_capi==Py_None || (irange[0]>=0 && irange[1]<n)","4th keyword irange") {
+  /* Processing variable m */
+  m = (irange_capi==Py_None?n:irange[1]-irange[0]+1);
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable ldz */
+  ldz = (compute_v?n:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 26*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.ssyevr() 6th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=26*n,"lwork>=26*n","6th keyword lwork","ssyevr:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable z */
+  z_Dims[0]=ldz,z_Dims[1]=m;
+  capi_z_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_z_tmp = array_from_pyobj(NPY_FLOAT,z_Dims,z_Rank,capi_z_intent,Py_None);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `z' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    z = (float *)(PyArray_DATA(capi_z_tmp));
+
+  /* Processing variable isuppz */
+  isuppz_Dims[0]=2 * m;
+  capi_isuppz_intent |= F2PY_INTENT_HIDE;
+  capi_isuppz_tmp = array_from_pyobj(NPY_INT,isuppz_Dims,isuppz_Rank,capi_isuppz_intent,Py_None);
+  if (capi_isuppz_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `isuppz' of flapack.ssyevr to C/Fortran array" );
+  } else {
+    isuppz = (int *)(PyArray_DATA(capi_isuppz_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        if(irange_capi==Py_None);else{irange[0]++;irange[1]++;}(*f2py_func)((compute_v?"V":"N"),(vrange_capi==Py_None?(irange_capi==Py_None?"A":"I"):"V"),(lower?"L":"U"),&n,a,&n,vrange,vrange+1,irange,irange+1,&atol,&m,w,z,&ldz,isuppz,work,&lwork,iwork,&liwork,&info);if(irange_capi==Py_None);else{irange[0]--;irange[1]--;}if(vrange_capi==Py_None);else {capi_w_tmp->dimensions[0]=capi_z_tmp->dimensions[1]=m;/*capi_z_tmp->strides[0]=m*capi_z_tmp->descr->elsize;*/} ;
+        /*(*f2py_func)(&n,a,&compute_v,&lower,vrange,irange,&atol,w,z,&m,&ldz,isuppz,work,&lwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_z_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_isuppz_tmp);
+  }  /*if (capi_isuppz_tmp == NULL) ... else of isuppz*/
+  /* End of cleaning variable isuppz */
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=26*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable ldz */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  /* End of cleaning variable m */
+  } /*CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n))*/
+  if((PyObject *)capi_irange_tmp!=irange_capi) {
+    Py_XDECREF(capi_irange_tmp); }
+  }  /*if (capi_irange_tmp == NULL) ... else of irange*/
+  /* End of cleaning variable irange */
+  /* End of cleaning variable liwork */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_vrange_tmp!=vrange_capi) {
+    Py_XDECREF(capi_vrange_tmp); }
+  }  /*if (capi_vrange_tmp == NULL) ... else of vrange*/
+  /* End of cleaning variable vrange */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*if (f2py_success) of atol*/
+  /* End of cleaning variable atol */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of ssyevr *******************************/
+
+/*********************************** dsyevr ***********************************/
+static char doc_f2py_rout_flapack_dsyevr[] = "\
+w,v,info = dsyevr(a,[compute_v,lower,vrange,irange,atol,lwork,overwrite_a])\n\nWrapper for ``dsyevr``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"vrange : input rank-1 array('d') with bounds (2)\n"
+"irange : input rank-1 array('i') with bounds (2)\n"
+"atol : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 26*n\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (m)\n"
+"v : rank-2 array('d') with bounds (ldz,m) and z storage\n"
+"info : int";
+/* extern void F_FUNC(dsyevr,DSYEVR)(char*,char*,char*,int*,double*,int*,double*,double*,int*,int*,double*,int*,double*,double*,int*,int*,double*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dsyevr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,double*,int*,double*,double*,int*,int*,double*,int*,double*,double*,int*,int*,double*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  double *vrange = NULL;
+  npy_intp vrange_Dims[1] = {-1};
+  const int vrange_Rank = 1;
+  PyArrayObject *capi_vrange_tmp = NULL;
+  int capi_vrange_intent = 0;
+  PyObject *vrange_capi = Py_None;
+  int *irange = NULL;
+  npy_intp irange_Dims[1] = {-1};
+  const int irange_Rank = 1;
+  PyArrayObject *capi_irange_tmp = NULL;
+  int capi_irange_intent = 0;
+  PyObject *irange_capi = Py_None;
+  double atol = 0;
+  PyObject *atol_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  double *z = NULL;
+  npy_intp z_Dims[2] = {-1, -1};
+  const int z_Rank = 2;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  int m = 0;
+  int ldz = 0;
+  int *isuppz = NULL;
+  npy_intp isuppz_Dims[1] = {-1};
+  const int isuppz_Rank = 1;
+  PyArrayObject *capi_isuppz_tmp = NULL;
+  int capi_isuppz_intent = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","vrange","irange","atol","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOOOOi:flapack.dsyevr",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&vrange_capi,&irange_capi,&atol_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable atol */
+  if (atol_capi == Py_None) atol = -1.0; else
+    f2py_success = double_from_pyobj(&atol,atol_capi,"flapack.dsyevr() 5th keyword (atol) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.dsyevr() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","dsyevr:compute_v=%d",compute_v) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dsyevr() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","dsyevr:lower=%d",lower) {
+  /* Processing variable vrange */
+  vrange_Dims[0]=2;
+  capi_vrange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_vrange_tmp = array_from_pyobj(NPY_DOUBLE,vrange_Dims,vrange_Rank,capi_vrange_intent,vrange_capi);
+  if (capi_vrange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd keyword `vrange' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    vrange = (double *)(PyArray_DATA(capi_vrange_tmp));
+
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable liwork */
+  liwork = 10*n;
+  /* Processing variable irange */
+  irange_Dims[0]=2;
+  capi_irange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_irange_tmp = array_from_pyobj(NPY_INT,irange_Dims,irange_Rank,capi_irange_intent,irange_capi);
+  if (capi_irange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th keyword `irange' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    irange = (int *)(PyArray_DATA(capi_irange_tmp));
+
+  CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n),"irange_capi==Py_None || (irange[0]>=0 && irange[1]<n)","4th keyword irange") {
+  /* Processing variable m */
+  m = (irange_capi==Py_None?n:irange[1]-irange[0]+1);
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable ldz */
+  ldz = (compute_v?n:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 26*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dsyevr() 6th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=26*n,"lwork>=26*n","6th keyword lwork","dsyevr:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable z */
+  z_Dims[0]=ldz,z_Dims[1]=m;
+  capi_z_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_z_tmp = array_from_pyobj(NPY_DOUBLE,z_Dims,z_Rank,capi_z_intent,Py_None);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `z' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    z = (double *)(PyArray_DATA(capi_z_tmp));
+
+  /* Processing variable isuppz */
+  isuppz_Dims[0]=2 * m;
+  capi_isuppz_intent |= F2PY_INTENT_HIDE;
+  capi_isuppz_tmp = array_from_pyobj(NPY_INT,isuppz_Dims,isuppz_Rank,capi_isuppz_intent,Py_None);
+  if (capi_isuppz_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `isuppz' of flapack.dsyevr to C/Fortran array" );
+  } else {
+    isuppz = (int *)(PyArray_DATA(capi_isuppz_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        if(irange_capi==Py_None);else{irange[0]++;irange[1]++;}(*f2py_func)((compute_v?"V":"N"),(vrange_capi==Py_None?(irange_capi==Py_None?"A":"I"):"V"),(lower?"L":"U"),&n,a,&n,vrange,vrange+1,irange,irange+1,&atol,&m,w,z,&ldz,isuppz,work,&lwork,iwork,&liwork,&info);if(irange_capi==Py_None);else{irange[0]--;irange[1]--;}if(vrange_capi==Py_None);else {capi_w_tmp->dimensions[0]=capi_z_tmp->dimensions[1]=m;/*capi_z_tmp->strides[0]=m*capi_z_tmp->descr->elsize;*/} ;
+        /*(*f2py_func)(&n,a,&compute_v,&lower,vrange,irange,&atol,w,z,&m,&ldz,isuppz,work,&lwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_z_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_isuppz_tmp);
+  }  /*if (capi_isuppz_tmp == NULL) ... else of isuppz*/
+  /* End of cleaning variable isuppz */
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=26*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable ldz */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  /* End of cleaning variable m */
+  } /*CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n))*/
+  if((PyObject *)capi_irange_tmp!=irange_capi) {
+    Py_XDECREF(capi_irange_tmp); }
+  }  /*if (capi_irange_tmp == NULL) ... else of irange*/
+  /* End of cleaning variable irange */
+  /* End of cleaning variable liwork */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_vrange_tmp!=vrange_capi) {
+    Py_XDECREF(capi_vrange_tmp); }
+  }  /*if (capi_vrange_tmp == NULL) ... else of vrange*/
+  /* End of cleaning variable vrange */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*if (f2py_success) of atol*/
+  /* End of cleaning variable atol */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dsyevr *******************************/
+
+/*********************************** cheevr ***********************************/
+static char doc_f2py_rout_flapack_cheevr[] = "\
+w,v,info = cheevr(a,[compute_v,lower,vrange,irange,atol,lwork,overwrite_a])\n\nWrapper for ``cheevr``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"vrange : input rank-1 array('f') with bounds (2)\n"
+"irange : input rank-1 array('i') with bounds (2)\n"
+"atol : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 18*n\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (m)\n"
+"v : rank-2 array('F') with bounds (ldz,m) and z storage\n"
+"info : int";
+/* extern void F_FUNC(cheevr,CHEEVR)(char*,char*,char*,int*,complex_float*,int*,float*,float*,int*,int*,float*,int*,float*,complex_float*,int*,int*,complex_float*,int*,float*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cheevr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,complex_float*,int*,float*,float*,int*,int*,float*,int*,float*,complex_float*,int*,int*,complex_float*,int*,float*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  float *vrange = NULL;
+  npy_intp vrange_Dims[1] = {-1};
+  const int vrange_Rank = 1;
+  PyArrayObject *capi_vrange_tmp = NULL;
+  int capi_vrange_intent = 0;
+  PyObject *vrange_capi = Py_None;
+  int *irange = NULL;
+  npy_intp irange_Dims[1] = {-1};
+  const int irange_Rank = 1;
+  PyArrayObject *capi_irange_tmp = NULL;
+  int capi_irange_intent = 0;
+  PyObject *irange_capi = Py_None;
+  float atol = 0;
+  PyObject *atol_capi = Py_None;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_float *z = NULL;
+  npy_intp z_Dims[2] = {-1, -1};
+  const int z_Rank = 2;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  int m = 0;
+  int ldz = 0;
+  int *isuppz = NULL;
+  npy_intp isuppz_Dims[1] = {-1};
+  const int isuppz_Rank = 1;
+  PyArrayObject *capi_isuppz_tmp = NULL;
+  int capi_isuppz_intent = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int lrwork = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","vrange","irange","atol","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOOOOi:flapack.cheevr",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&vrange_capi,&irange_capi,&atol_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable atol */
+  if (atol_capi == Py_None) atol = -1.0; else
+    f2py_success = float_from_pyobj(&atol,atol_capi,"flapack.cheevr() 5th keyword (atol) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.cheevr() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","cheevr:compute_v=%d",compute_v) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cheevr to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.cheevr() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","cheevr:lower=%d",lower) {
+  /* Processing variable vrange */
+  vrange_Dims[0]=2;
+  capi_vrange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_vrange_tmp = array_from_pyobj(NPY_FLOAT,vrange_Dims,vrange_Rank,capi_vrange_intent,vrange_capi);
+  if (capi_vrange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd keyword `vrange' of flapack.cheevr to C/Fortran array" );
+  } else {
+    vrange = (float *)(PyArray_DATA(capi_vrange_tmp));
+
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable liwork */
+  liwork = 10*n;
+  /* Processing variable irange */
+  irange_Dims[0]=2;
+  capi_irange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_irange_tmp = array_from_pyobj(NPY_INT,irange_Dims,irange_Rank,capi_irange_intent,irange_capi);
+  if (capi_irange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th keyword `irange' of flapack.cheevr to C/Fortran array" );
+  } else {
+    irange = (int *)(PyArray_DATA(capi_irange_tmp));
+
+  CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n),"irange_capi==Py_None || (irange[0]>=0 && irange[1]<n)","4th keyword irange") {
+  /* Processing variable m */
+  m = (irange_capi==Py_None?n:irange[1]-irange[0]+1);
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.cheevr to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable ldz */
+  ldz = (compute_v?n:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 18*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cheevr() 6th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=18*n,"lwork>=18*n","6th keyword lwork","cheevr:lwork=%d",lwork) {
+  /* Processing variable lrwork */
+  lrwork = 24*n;
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cheevr to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=lrwork;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cheevr to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.cheevr to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable z */
+  z_Dims[0]=ldz,z_Dims[1]=m;
+  capi_z_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_z_tmp = array_from_pyobj(NPY_CFLOAT,z_Dims,z_Rank,capi_z_intent,Py_None);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `z' of flapack.cheevr to C/Fortran array" );
+  } else {
+    z = (complex_float *)(PyArray_DATA(capi_z_tmp));
+
+  /* Processing variable isuppz */
+  isuppz_Dims[0]=2 * m;
+  capi_isuppz_intent |= F2PY_INTENT_HIDE;
+  capi_isuppz_tmp = array_from_pyobj(NPY_INT,isuppz_Dims,isuppz_Rank,capi_isuppz_intent,Py_None);
+  if (capi_isuppz_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `isuppz' of flapack.cheevr to C/Fortran array" );
+  } else {
+    isuppz = (int *)(PyArray_DATA(capi_isuppz_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        if(irange_capi==Py_None);else{irange[0]++;irange[1]++;}(*f2py_func)((compute_v?"V":"N"),(vrange_capi==Py_None?(irange_capi==Py_None?"A":"I"):"V"),(lower?"L":"U"),&n,a,&n,vrange,vrange+1,irange,irange+1,&atol,&m,w,z,&ldz,isuppz,work,&lwork,rwork,&lrwork,iwork,&liwork,&info);if(irange_capi==Py_None);else{irange[0]--;irange[1]--;}if(vrange_capi==Py_None);else {capi_w_tmp->dimensions[0]=capi_z_tmp->dimensions[1]=m;/*capi_z_tmp->strides[0]=m*capi_z_tmp->descr->elsize;*/} ;
+        /*(*f2py_func)(&n,a,&compute_v,&lower,vrange,irange,&atol,w,z,&m,&ldz,isuppz,work,&lwork,rwork,&lrwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_z_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_isuppz_tmp);
+  }  /*if (capi_isuppz_tmp == NULL) ... else of isuppz*/
+  /* End of cleaning variable isuppz */
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable lrwork */
+  } /*CHECKSCALAR(lwork>=18*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable ldz */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  /* End of cleaning variable m */
+  } /*CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n))*/
+  if((PyObject *)capi_irange_tmp!=irange_capi) {
+    Py_XDECREF(capi_irange_tmp); }
+  }  /*if (capi_irange_tmp == NULL) ... else of irange*/
+  /* End of cleaning variable irange */
+  /* End of cleaning variable liwork */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_vrange_tmp!=vrange_capi) {
+    Py_XDECREF(capi_vrange_tmp); }
+  }  /*if (capi_vrange_tmp == NULL) ... else of vrange*/
+  /* End of cleaning variable vrange */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*if (f2py_success) of atol*/
+  /* End of cleaning variable atol */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cheevr *******************************/
+
+/*********************************** zheevr ***********************************/
+static char doc_f2py_rout_flapack_zheevr[] = "\
+w,v,info = zheevr(a,[compute_v,lower,vrange,irange,atol,lwork,overwrite_a])\n\nWrapper for ``zheevr``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"vrange : input rank-1 array('d') with bounds (2)\n"
+"irange : input rank-1 array('i') with bounds (2)\n"
+"atol : input float, optional\n    Default: -1.0\n"
+"lwork : input int, optional\n    Default: 18*n\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (m)\n"
+"v : rank-2 array('D') with bounds (ldz,m) and z storage\n"
+"info : int";
+/* extern void F_FUNC(zheevr,ZHEEVR)(char*,char*,char*,int*,complex_double*,int*,double*,double*,int*,int*,double*,int*,double*,complex_double*,int*,int*,complex_double*,int*,double*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zheevr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,char*,int*,complex_double*,int*,double*,double*,int*,int*,double*,int*,double*,complex_double*,int*,int*,complex_double*,int*,double*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  double *vrange = NULL;
+  npy_intp vrange_Dims[1] = {-1};
+  const int vrange_Rank = 1;
+  PyArrayObject *capi_vrange_tmp = NULL;
+  int capi_vrange_intent = 0;
+  PyObject *vrange_capi = Py_None;
+  int *irange = NULL;
+  npy_intp irange_Dims[1] = {-1};
+  const int irange_Rank = 1;
+  PyArrayObject *capi_irange_tmp = NULL;
+  int capi_irange_intent = 0;
+  PyObject *irange_capi = Py_None;
+  double atol = 0;
+  PyObject *atol_capi = Py_None;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_double *z = NULL;
+  npy_intp z_Dims[2] = {-1, -1};
+  const int z_Rank = 2;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  int m = 0;
+  int ldz = 0;
+  int *isuppz = NULL;
+  npy_intp isuppz_Dims[1] = {-1};
+  const int isuppz_Rank = 1;
+  PyArrayObject *capi_isuppz_tmp = NULL;
+  int capi_isuppz_intent = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int lrwork = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_v","lower","vrange","irange","atol","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOOOOi:flapack.zheevr",\
+    capi_kwlist,&a_capi,&compute_v_capi,&lower_capi,&vrange_capi,&irange_capi,&atol_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable atol */
+  if (atol_capi == Py_None) atol = -1.0; else
+    f2py_success = double_from_pyobj(&atol,atol_capi,"flapack.zheevr() 5th keyword (atol) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.zheevr() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==1||compute_v==0,"compute_v==1||compute_v==0","1st keyword compute_v","zheevr:compute_v=%d",compute_v) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zheevr to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zheevr() 2nd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","2nd keyword lower","zheevr:lower=%d",lower) {
+  /* Processing variable vrange */
+  vrange_Dims[0]=2;
+  capi_vrange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_vrange_tmp = array_from_pyobj(NPY_DOUBLE,vrange_Dims,vrange_Rank,capi_vrange_intent,vrange_capi);
+  if (capi_vrange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd keyword `vrange' of flapack.zheevr to C/Fortran array" );
+  } else {
+    vrange = (double *)(PyArray_DATA(capi_vrange_tmp));
+
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable liwork */
+  liwork = 10*n;
+  /* Processing variable irange */
+  irange_Dims[0]=2;
+  capi_irange_intent |= F2PY_INTENT_IN|F2PY_OPTIONAL;
+  capi_irange_tmp = array_from_pyobj(NPY_INT,irange_Dims,irange_Rank,capi_irange_intent,irange_capi);
+  if (capi_irange_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 4th keyword `irange' of flapack.zheevr to C/Fortran array" );
+  } else {
+    irange = (int *)(PyArray_DATA(capi_irange_tmp));
+
+  CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n),"irange_capi==Py_None || (irange[0]>=0 && irange[1]<n)","4th keyword irange") {
+  /* Processing variable m */
+  m = (irange_capi==Py_None?n:irange[1]-irange[0]+1);
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.zheevr to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable ldz */
+  ldz = (compute_v?n:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 18*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zheevr() 6th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=18*n,"lwork>=18*n","6th keyword lwork","zheevr:lwork=%d",lwork) {
+  /* Processing variable lrwork */
+  lrwork = 24*n;
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zheevr to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=lrwork;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zheevr to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=m;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.zheevr to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable z */
+  z_Dims[0]=ldz,z_Dims[1]=m;
+  capi_z_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_z_tmp = array_from_pyobj(NPY_CDOUBLE,z_Dims,z_Rank,capi_z_intent,Py_None);
+  if (capi_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `z' of flapack.zheevr to C/Fortran array" );
+  } else {
+    z = (complex_double *)(PyArray_DATA(capi_z_tmp));
+
+  /* Processing variable isuppz */
+  isuppz_Dims[0]=2 * m;
+  capi_isuppz_intent |= F2PY_INTENT_HIDE;
+  capi_isuppz_tmp = array_from_pyobj(NPY_INT,isuppz_Dims,isuppz_Rank,capi_isuppz_intent,Py_None);
+  if (capi_isuppz_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `isuppz' of flapack.zheevr to C/Fortran array" );
+  } else {
+    isuppz = (int *)(PyArray_DATA(capi_isuppz_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        if(irange_capi==Py_None);else{irange[0]++;irange[1]++;}(*f2py_func)((compute_v?"V":"N"),(vrange_capi==Py_None?(irange_capi==Py_None?"A":"I"):"V"),(lower?"L":"U"),&n,a,&n,vrange,vrange+1,irange,irange+1,&atol,&m,w,z,&ldz,isuppz,work,&lwork,rwork,&lrwork,iwork,&liwork,&info);if(irange_capi==Py_None);else{irange[0]--;irange[1]--;}if(vrange_capi==Py_None);else {capi_w_tmp->dimensions[0]=capi_z_tmp->dimensions[1]=m;/*capi_z_tmp->strides[0]=m*capi_z_tmp->descr->elsize;*/} ;
+        /*(*f2py_func)(&n,a,&compute_v,&lower,vrange,irange,&atol,w,z,&m,&ldz,isuppz,work,&lwork,rwork,&lrwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_z_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_isuppz_tmp);
+  }  /*if (capi_isuppz_tmp == NULL) ... else of isuppz*/
+  /* End of cleaning variable isuppz */
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable lrwork */
+  } /*CHECKSCALAR(lwork>=18*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable ldz */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  /* End of cleaning variable m */
+  } /*CHECKARRAY(irange_capi==Py_None || (irange[0]>=0 && irange[1]<n))*/
+  if((PyObject *)capi_irange_tmp!=irange_capi) {
+    Py_XDECREF(capi_irange_tmp); }
+  }  /*if (capi_irange_tmp == NULL) ... else of irange*/
+  /* End of cleaning variable irange */
+  /* End of cleaning variable liwork */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_vrange_tmp!=vrange_capi) {
+    Py_XDECREF(capi_vrange_tmp); }
+  }  /*if (capi_vrange_tmp == NULL) ... else of vrange*/
+  /* End of cleaning variable vrange */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_v==1||compute_v==0)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*if (f2py_success) of atol*/
+  /* End of cleaning variable atol */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zheevr *******************************/
+
+/*********************************** sgees ***********************************/
+static char doc_f2py_rout_flapack_sgees[] = "\
+t,sdim,wr,wi,vs,info = sgees(sselect,a,[compute_v,sort_t,lwork,sselect_extra_args,overwrite_a])\n\nWrapper for ``sgees``.\
+\n\nParameters\n----------\n"
+"sselect : call-back function\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"sort_t : input int, optional\n    Default: 0\n"
+"sselect_extra_args : input tuple, optional\n    Default: ()\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"t : rank-2 array('f') with bounds (n,n) and a storage\n"
+"sdim : int\n"
+"wr : rank-1 array('f') with bounds (n)\n"
+"wi : rank-1 array('f') with bounds (n)\n"
+"vs : rank-2 array('f') with bounds (ldvs,n)\n"
+"info : int\n"
+"\nNotes\n-----\nCall-back functions::\n\n"
+"  def sselect(arg1,arg2): return sselect\n\
+  Required arguments:\n"
+"    arg1 : input float\n"
+"    arg2 : input float\n"
+"  Return objects:\n"
+"    sselect : int";
+/* extern void F_FUNC(sgees,SGEES)(char*,char*,int(*)(float*,float*),int*,float*,int*,int*,float*,float*,float*,int*,float*,int*,int*,int*,int,int ); */
+static PyObject *f2py_rout_flapack_sgees(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int(*)(float*,float*),int*,float*,int*,int*,float*,float*,float*,int*,float*,int*,int*,int*,int,int )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int sort_t = 0;
+  PyObject *sort_t_capi = Py_None;
+  PyObject *sselect_capi = Py_None;
+  PyTupleObject *sselect_xa_capi = NULL;
+  PyTupleObject *sselect_args_capi = NULL;
+  int sselect_nofargs_capi = 0;
+  cb_sselect_in_gees__user__routines_typedef sselect_cptr;
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int sdim = 0;
+  float *wr = NULL;
+  npy_intp wr_Dims[1] = {-1};
+  const int wr_Rank = 1;
+  PyArrayObject *capi_wr_tmp = NULL;
+  int capi_wr_intent = 0;
+  float *wi = NULL;
+  npy_intp wi_Dims[1] = {-1};
+  const int wi_Rank = 1;
+  PyArrayObject *capi_wi_tmp = NULL;
+  int capi_wi_intent = 0;
+  float *vs = NULL;
+  npy_intp vs_Dims[2] = {-1, -1};
+  const int vs_Rank = 2;
+  PyArrayObject *capi_vs_tmp = NULL;
+  int capi_vs_intent = 0;
+  int ldvs = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *bwork = NULL;
+  npy_intp bwork_Dims[1] = {-1};
+  const int bwork_Rank = 1;
+  PyArrayObject *capi_bwork_tmp = NULL;
+  int capi_bwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"sselect","a","compute_v","sort_t","lwork","sselect_extra_args","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOO!i:flapack.sgees",\
+    capi_kwlist,&sselect_capi,&a_capi,&compute_v_capi,&sort_t_capi,&lwork_capi,&PyTuple_Type,&sselect_xa_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable sort_t */
+  if (sort_t_capi == Py_None) sort_t = 0; else
+    f2py_success = int_from_pyobj(&sort_t,sort_t_capi,"flapack.sgees() 2nd keyword (sort_t) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(sort_t==0||sort_t==1,"sort_t==0||sort_t==1","2nd keyword sort_t","sgees:sort_t=%d",sort_t) {
+  /* Processing variable sselect */
+if(F2PyCapsule_Check(sselect_capi)) {
+  sselect_cptr = F2PyCapsule_AsVoidPtr(sselect_capi);
+} else {
+  sselect_cptr = cb_sselect_in_gees__user__routines;
+}
+
+  sselect_nofargs_capi = cb_sselect_in_gees__user__routines_nofargs;
+  if (create_cb_arglist(sselect_capi,sselect_xa_capi,2,0,&cb_sselect_in_gees__user__routines_nofargs,&sselect_args_capi,"failed in processing argument list for call-back sselect.")) {
+    jmp_buf sselect_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `sselect`.\n");
+    SWAP(sselect_capi,cb_sselect_in_gees__user__routines_capi,PyObject);
+    SWAP(sselect_args_capi,cb_sselect_in_gees__user__routines_args_capi,PyTupleObject);
+    memcpy(&sselect_jmpbuf,&cb_sselect_in_gees__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.sgees() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==0||compute_v==1,"compute_v==0||compute_v==1","1st keyword compute_v","sgees:compute_v=%d",compute_v) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `a' of flapack.sgees to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable sdim */
+  sdim = 0;
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable ldvs */
+  ldvs = ((compute_v==1)?n:1);
+  /* Processing variable wi */
+  wi_Dims[0]=n;
+  capi_wi_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wi_tmp = array_from_pyobj(NPY_FLOAT,wi_Dims,wi_Rank,capi_wi_intent,Py_None);
+  if (capi_wi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wi' of flapack.sgees to C/Fortran array" );
+  } else {
+    wi = (float *)(PyArray_DATA(capi_wi_tmp));
+
+  /* Processing variable vs */
+  vs_Dims[0]=ldvs,vs_Dims[1]=n;
+  capi_vs_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vs_tmp = array_from_pyobj(NPY_FLOAT,vs_Dims,vs_Rank,capi_vs_intent,Py_None);
+  if (capi_vs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vs' of flapack.sgees to C/Fortran array" );
+  } else {
+    vs = (float *)(PyArray_DATA(capi_vs_tmp));
+
+  /* Processing variable wr */
+  wr_Dims[0]=n;
+  capi_wr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wr_tmp = array_from_pyobj(NPY_FLOAT,wr_Dims,wr_Rank,capi_wr_intent,Py_None);
+  if (capi_wr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wr' of flapack.sgees to C/Fortran array" );
+  } else {
+    wr = (float *)(PyArray_DATA(capi_wr_tmp));
+
+  /* Processing variable bwork */
+  bwork_Dims[0]=n;
+  capi_bwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_bwork_tmp = array_from_pyobj(NPY_INT,bwork_Dims,bwork_Rank,capi_bwork_intent,Py_None);
+  if (capi_bwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `bwork' of flapack.sgees to C/Fortran array" );
+  } else {
+    bwork = (int *)(PyArray_DATA(capi_bwork_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sgees() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork >= MAX(1,3*n),"lwork >= MAX(1,3*n)","3rd keyword lwork","sgees:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sgees to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    if ((setjmp(cb_sselect_in_gees__user__routines_jmpbuf))) {
+      f2py_success = 0;
+    } else {
+        (*f2py_func)((compute_v?"V":"N"),(sort_t?"S":"N"),cb_sselect_in_gees__user__routines,&n,a,&nrows,&sdim,wr,wi,vs,&ldvs,work,&lwork,bwork,&info,1,1) ;
+        /*(*f2py_func)(&compute_v,&sort_t,sselect_cptr,&n,a,&nrows,&sdim,wr,wi,vs,&ldvs,work,&lwork,bwork,&info);*/
+    }
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiNNNi",capi_a_tmp,sdim,capi_wr_tmp,capi_wi_tmp,capi_vs_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork >= MAX(1,3*n))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+    Py_XDECREF(capi_bwork_tmp);
+  }  /*if (capi_bwork_tmp == NULL) ... else of bwork*/
+  /* End of cleaning variable bwork */
+  }  /*if (capi_wr_tmp == NULL) ... else of wr*/
+  /* End of cleaning variable wr */
+  }  /*if (capi_vs_tmp == NULL) ... else of vs*/
+  /* End of cleaning variable vs */
+  }  /*if (capi_wi_tmp == NULL) ... else of wi*/
+  /* End of cleaning variable wi */
+  /* End of cleaning variable ldvs */
+  /* End of cleaning variable n */
+  /* End of cleaning variable nrows */
+  /* End of cleaning variable sdim */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_v==0||compute_v==1)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+    CFUNCSMESS("Restoring jmpbuf for `sselect`.\n");
+    cb_sselect_in_gees__user__routines_capi = sselect_capi;
+    Py_DECREF(cb_sselect_in_gees__user__routines_args_capi);
+    cb_sselect_in_gees__user__routines_args_capi = sselect_args_capi;
+    cb_sselect_in_gees__user__routines_nofargs = sselect_nofargs_capi;
+    memcpy(&cb_sselect_in_gees__user__routines_jmpbuf,&sselect_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable sselect */
+  } /*CHECKSCALAR(sort_t==0||sort_t==1)*/
+  } /*if (f2py_success) of sort_t*/
+  /* End of cleaning variable sort_t */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sgees ********************************/
+
+/*********************************** dgees ***********************************/
+static char doc_f2py_rout_flapack_dgees[] = "\
+t,sdim,wr,wi,vs,info = dgees(dselect,a,[compute_v,sort_t,lwork,dselect_extra_args,overwrite_a])\n\nWrapper for ``dgees``.\
+\n\nParameters\n----------\n"
+"dselect : call-back function\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"sort_t : input int, optional\n    Default: 0\n"
+"dselect_extra_args : input tuple, optional\n    Default: ()\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"t : rank-2 array('d') with bounds (n,n) and a storage\n"
+"sdim : int\n"
+"wr : rank-1 array('d') with bounds (n)\n"
+"wi : rank-1 array('d') with bounds (n)\n"
+"vs : rank-2 array('d') with bounds (ldvs,n)\n"
+"info : int\n"
+"\nNotes\n-----\nCall-back functions::\n\n"
+"  def dselect(arg1,arg2): return dselect\n\
+  Required arguments:\n"
+"    arg1 : input float\n"
+"    arg2 : input float\n"
+"  Return objects:\n"
+"    dselect : int";
+/* extern void F_FUNC(dgees,DGEES)(char*,char*,int(*)(double*,double*),int*,double*,int*,int*,double*,double*,double*,int*,double*,int*,int*,int*,int,int ); */
+static PyObject *f2py_rout_flapack_dgees(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int(*)(double*,double*),int*,double*,int*,int*,double*,double*,double*,int*,double*,int*,int*,int*,int,int )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int sort_t = 0;
+  PyObject *sort_t_capi = Py_None;
+  PyObject *dselect_capi = Py_None;
+  PyTupleObject *dselect_xa_capi = NULL;
+  PyTupleObject *dselect_args_capi = NULL;
+  int dselect_nofargs_capi = 0;
+  cb_dselect_in_gees__user__routines_typedef dselect_cptr;
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int sdim = 0;
+  double *wr = NULL;
+  npy_intp wr_Dims[1] = {-1};
+  const int wr_Rank = 1;
+  PyArrayObject *capi_wr_tmp = NULL;
+  int capi_wr_intent = 0;
+  double *wi = NULL;
+  npy_intp wi_Dims[1] = {-1};
+  const int wi_Rank = 1;
+  PyArrayObject *capi_wi_tmp = NULL;
+  int capi_wi_intent = 0;
+  double *vs = NULL;
+  npy_intp vs_Dims[2] = {-1, -1};
+  const int vs_Rank = 2;
+  PyArrayObject *capi_vs_tmp = NULL;
+  int capi_vs_intent = 0;
+  int ldvs = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *bwork = NULL;
+  npy_intp bwork_Dims[1] = {-1};
+  const int bwork_Rank = 1;
+  PyArrayObject *capi_bwork_tmp = NULL;
+  int capi_bwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"dselect","a","compute_v","sort_t","lwork","dselect_extra_args","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOO!i:flapack.dgees",\
+    capi_kwlist,&dselect_capi,&a_capi,&compute_v_capi,&sort_t_capi,&lwork_capi,&PyTuple_Type,&dselect_xa_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable sort_t */
+  if (sort_t_capi == Py_None) sort_t = 0; else
+    f2py_success = int_from_pyobj(&sort_t,sort_t_capi,"flapack.dgees() 2nd keyword (sort_t) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(sort_t==0||sort_t==1,"sort_t==0||sort_t==1","2nd keyword sort_t","dgees:sort_t=%d",sort_t) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.dgees() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==0||compute_v==1,"compute_v==0||compute_v==1","1st keyword compute_v","dgees:compute_v=%d",compute_v) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `a' of flapack.dgees to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable sdim */
+  sdim = 0;
+  /* Processing variable dselect */
+if(F2PyCapsule_Check(dselect_capi)) {
+  dselect_cptr = F2PyCapsule_AsVoidPtr(dselect_capi);
+} else {
+  dselect_cptr = cb_dselect_in_gees__user__routines;
+}
+
+  dselect_nofargs_capi = cb_dselect_in_gees__user__routines_nofargs;
+  if (create_cb_arglist(dselect_capi,dselect_xa_capi,2,0,&cb_dselect_in_gees__user__routines_nofargs,&dselect_args_capi,"failed in processing argument list for call-back dselect.")) {
+    jmp_buf dselect_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `dselect`.\n");
+    SWAP(dselect_capi,cb_dselect_in_gees__user__routines_capi,PyObject);
+    SWAP(dselect_args_capi,cb_dselect_in_gees__user__routines_args_capi,PyTupleObject);
+    memcpy(&dselect_jmpbuf,&cb_dselect_in_gees__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable ldvs */
+  ldvs = ((compute_v==1)?n:1);
+  /* Processing variable wi */
+  wi_Dims[0]=n;
+  capi_wi_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wi_tmp = array_from_pyobj(NPY_DOUBLE,wi_Dims,wi_Rank,capi_wi_intent,Py_None);
+  if (capi_wi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wi' of flapack.dgees to C/Fortran array" );
+  } else {
+    wi = (double *)(PyArray_DATA(capi_wi_tmp));
+
+  /* Processing variable vs */
+  vs_Dims[0]=ldvs,vs_Dims[1]=n;
+  capi_vs_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vs_tmp = array_from_pyobj(NPY_DOUBLE,vs_Dims,vs_Rank,capi_vs_intent,Py_None);
+  if (capi_vs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vs' of flapack.dgees to C/Fortran array" );
+  } else {
+    vs = (double *)(PyArray_DATA(capi_vs_tmp));
+
+  /* Processing variable wr */
+  wr_Dims[0]=n;
+  capi_wr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wr_tmp = array_from_pyobj(NPY_DOUBLE,wr_Dims,wr_Rank,capi_wr_intent,Py_None);
+  if (capi_wr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wr' of flapack.dgees to C/Fortran array" );
+  } else {
+    wr = (double *)(PyArray_DATA(capi_wr_tmp));
+
+  /* Processing variable bwork */
+  bwork_Dims[0]=n;
+  capi_bwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_bwork_tmp = array_from_pyobj(NPY_INT,bwork_Dims,bwork_Rank,capi_bwork_intent,Py_None);
+  if (capi_bwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `bwork' of flapack.dgees to C/Fortran array" );
+  } else {
+    bwork = (int *)(PyArray_DATA(capi_bwork_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dgees() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork >= MAX(1,3*n),"lwork >= MAX(1,3*n)","3rd keyword lwork","dgees:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dgees to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    if ((setjmp(cb_dselect_in_gees__user__routines_jmpbuf))) {
+      f2py_success = 0;
+    } else {
+        (*f2py_func)((compute_v?"V":"N"),(sort_t?"S":"N"),cb_dselect_in_gees__user__routines,&n,a,&nrows,&sdim,wr,wi,vs,&ldvs,work,&lwork,bwork,&info,1,1) ;
+        /*(*f2py_func)(&compute_v,&sort_t,dselect_cptr,&n,a,&nrows,&sdim,wr,wi,vs,&ldvs,work,&lwork,bwork,&info);*/
+    }
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiNNNi",capi_a_tmp,sdim,capi_wr_tmp,capi_wi_tmp,capi_vs_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork >= MAX(1,3*n))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+    Py_XDECREF(capi_bwork_tmp);
+  }  /*if (capi_bwork_tmp == NULL) ... else of bwork*/
+  /* End of cleaning variable bwork */
+  }  /*if (capi_wr_tmp == NULL) ... else of wr*/
+  /* End of cleaning variable wr */
+  }  /*if (capi_vs_tmp == NULL) ... else of vs*/
+  /* End of cleaning variable vs */
+  }  /*if (capi_wi_tmp == NULL) ... else of wi*/
+  /* End of cleaning variable wi */
+  /* End of cleaning variable ldvs */
+  /* End of cleaning variable n */
+  /* End of cleaning variable nrows */
+    CFUNCSMESS("Restoring jmpbuf for `dselect`.\n");
+    cb_dselect_in_gees__user__routines_capi = dselect_capi;
+    Py_DECREF(cb_dselect_in_gees__user__routines_args_capi);
+    cb_dselect_in_gees__user__routines_args_capi = dselect_args_capi;
+    cb_dselect_in_gees__user__routines_nofargs = dselect_nofargs_capi;
+    memcpy(&cb_dselect_in_gees__user__routines_jmpbuf,&dselect_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable dselect */
+  /* End of cleaning variable sdim */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_v==0||compute_v==1)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(sort_t==0||sort_t==1)*/
+  } /*if (f2py_success) of sort_t*/
+  /* End of cleaning variable sort_t */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dgees ********************************/
+
+/*********************************** cgees ***********************************/
+static char doc_f2py_rout_flapack_cgees[] = "\
+t,sdim,w,vs,info = cgees(cselect,a,[compute_v,sort_t,lwork,cselect_extra_args,overwrite_a])\n\nWrapper for ``cgees``.\
+\n\nParameters\n----------\n"
+"cselect : call-back function\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"sort_t : input int, optional\n    Default: 0\n"
+"cselect_extra_args : input tuple, optional\n    Default: ()\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"t : rank-2 array('F') with bounds (n,n) and a storage\n"
+"sdim : int\n"
+"w : rank-1 array('F') with bounds (n)\n"
+"vs : rank-2 array('F') with bounds (ldvs,n)\n"
+"info : int\n"
+"\nNotes\n-----\nCall-back functions::\n\n"
+"  def cselect(arg): return cselect\n\
+  Required arguments:\n"
+"    arg : input complex\n"
+"  Return objects:\n"
+"    cselect : int";
+/* extern void F_FUNC(cgees,CGEES)(char*,char*,int(*)(complex_float*),int*,complex_float*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,float*,int*,int*,int,int ); */
+static PyObject *f2py_rout_flapack_cgees(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int(*)(complex_float*),int*,complex_float*,int*,int*,complex_float*,complex_float*,int*,complex_float*,int*,float*,int*,int*,int,int )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int sort_t = 0;
+  PyObject *sort_t_capi = Py_None;
+  PyObject *cselect_capi = Py_None;
+  PyTupleObject *cselect_xa_capi = NULL;
+  PyTupleObject *cselect_args_capi = NULL;
+  int cselect_nofargs_capi = 0;
+  cb_cselect_in_gees__user__routines_typedef cselect_cptr;
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int sdim = 0;
+  complex_float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_float *vs = NULL;
+  npy_intp vs_Dims[2] = {-1, -1};
+  const int vs_Rank = 2;
+  PyArrayObject *capi_vs_tmp = NULL;
+  int capi_vs_intent = 0;
+  int ldvs = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int *bwork = NULL;
+  npy_intp bwork_Dims[1] = {-1};
+  const int bwork_Rank = 1;
+  PyArrayObject *capi_bwork_tmp = NULL;
+  int capi_bwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"cselect","a","compute_v","sort_t","lwork","cselect_extra_args","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOO!i:flapack.cgees",\
+    capi_kwlist,&cselect_capi,&a_capi,&compute_v_capi,&sort_t_capi,&lwork_capi,&PyTuple_Type,&cselect_xa_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `a' of flapack.cgees to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable info */
+  /* Processing variable sort_t */
+  if (sort_t_capi == Py_None) sort_t = 0; else
+    f2py_success = int_from_pyobj(&sort_t,sort_t_capi,"flapack.cgees() 2nd keyword (sort_t) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(sort_t==0||sort_t==1,"sort_t==0||sort_t==1","2nd keyword sort_t","cgees:sort_t=%d",sort_t) {
+  /* Processing variable cselect */
+if(F2PyCapsule_Check(cselect_capi)) {
+  cselect_cptr = F2PyCapsule_AsVoidPtr(cselect_capi);
+} else {
+  cselect_cptr = cb_cselect_in_gees__user__routines;
+}
+
+  cselect_nofargs_capi = cb_cselect_in_gees__user__routines_nofargs;
+  if (create_cb_arglist(cselect_capi,cselect_xa_capi,1,0,&cb_cselect_in_gees__user__routines_nofargs,&cselect_args_capi,"failed in processing argument list for call-back cselect.")) {
+    jmp_buf cselect_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `cselect`.\n");
+    SWAP(cselect_capi,cb_cselect_in_gees__user__routines_capi,PyObject);
+    SWAP(cselect_args_capi,cb_cselect_in_gees__user__routines_args_capi,PyTupleObject);
+    memcpy(&cselect_jmpbuf,&cb_cselect_in_gees__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable sdim */
+  sdim = 0;
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.cgees() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==0||compute_v==1,"compute_v==0||compute_v==1","1st keyword compute_v","cgees:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable ldvs */
+  ldvs = ((compute_v==1)?n:1);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_CFLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.cgees to C/Fortran array" );
+  } else {
+    w = (complex_float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable bwork */
+  bwork_Dims[0]=n;
+  capi_bwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_bwork_tmp = array_from_pyobj(NPY_INT,bwork_Dims,bwork_Rank,capi_bwork_intent,Py_None);
+  if (capi_bwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `bwork' of flapack.cgees to C/Fortran array" );
+  } else {
+    bwork = (int *)(PyArray_DATA(capi_bwork_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cgees() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork >= MAX(1,3*n),"lwork >= MAX(1,3*n)","3rd keyword lwork","cgees:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cgees to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=n;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cgees to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable vs */
+  vs_Dims[0]=ldvs,vs_Dims[1]=n;
+  capi_vs_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vs_tmp = array_from_pyobj(NPY_CFLOAT,vs_Dims,vs_Rank,capi_vs_intent,Py_None);
+  if (capi_vs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vs' of flapack.cgees to C/Fortran array" );
+  } else {
+    vs = (complex_float *)(PyArray_DATA(capi_vs_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    if ((setjmp(cb_cselect_in_gees__user__routines_jmpbuf))) {
+      f2py_success = 0;
+    } else {
+        (*f2py_func)((compute_v?"V":"N"),(sort_t?"S":"N"),cb_cselect_in_gees__user__routines,&n,a,&nrows,&sdim,w,vs,&ldvs,work,&lwork,rwork,bwork,&info,1,1) ;
+        /*(*f2py_func)(&compute_v,&sort_t,cselect_cptr,&n,a,&nrows,&sdim,w,vs,&ldvs,work,&lwork,rwork,bwork,&info);*/
+    }
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiNNi",capi_a_tmp,sdim,capi_w_tmp,capi_vs_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vs_tmp == NULL) ... else of vs*/
+  /* End of cleaning variable vs */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork >= MAX(1,3*n))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+    Py_XDECREF(capi_bwork_tmp);
+  }  /*if (capi_bwork_tmp == NULL) ... else of bwork*/
+  /* End of cleaning variable bwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable ldvs */
+  /* End of cleaning variable nrows */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==0||compute_v==1)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable sdim */
+    CFUNCSMESS("Restoring jmpbuf for `cselect`.\n");
+    cb_cselect_in_gees__user__routines_capi = cselect_capi;
+    Py_DECREF(cb_cselect_in_gees__user__routines_args_capi);
+    cb_cselect_in_gees__user__routines_args_capi = cselect_args_capi;
+    cb_cselect_in_gees__user__routines_nofargs = cselect_nofargs_capi;
+    memcpy(&cb_cselect_in_gees__user__routines_jmpbuf,&cselect_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable cselect */
+  } /*CHECKSCALAR(sort_t==0||sort_t==1)*/
+  } /*if (f2py_success) of sort_t*/
+  /* End of cleaning variable sort_t */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgees ********************************/
+
+/*********************************** zgees ***********************************/
+static char doc_f2py_rout_flapack_zgees[] = "\
+t,sdim,w,vs,info = zgees(zselect,a,[compute_v,sort_t,lwork,zselect_extra_args,overwrite_a])\n\nWrapper for ``zgees``.\
+\n\nParameters\n----------\n"
+"zselect : call-back function\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"sort_t : input int, optional\n    Default: 0\n"
+"zselect_extra_args : input tuple, optional\n    Default: ()\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"t : rank-2 array('D') with bounds (n,n) and a storage\n"
+"sdim : int\n"
+"w : rank-1 array('D') with bounds (n)\n"
+"vs : rank-2 array('D') with bounds (ldvs,n)\n"
+"info : int\n"
+"\nNotes\n-----\nCall-back functions::\n\n"
+"  def zselect(arg): return zselect\n\
+  Required arguments:\n"
+"    arg : input complex\n"
+"  Return objects:\n"
+"    zselect : int";
+/* extern void F_FUNC(zgees,ZGEES)(char*,char*,int(*)(complex_double*),int*,complex_double*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,double*,int*,int*,int,int ); */
+static PyObject *f2py_rout_flapack_zgees(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int(*)(complex_double*),int*,complex_double*,int*,int*,complex_double*,complex_double*,int*,complex_double*,int*,double*,int*,int*,int,int )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int sort_t = 0;
+  PyObject *sort_t_capi = Py_None;
+  PyObject *zselect_capi = Py_None;
+  PyTupleObject *zselect_xa_capi = NULL;
+  PyTupleObject *zselect_args_capi = NULL;
+  int zselect_nofargs_capi = 0;
+  cb_zselect_in_gees__user__routines_typedef zselect_cptr;
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int sdim = 0;
+  complex_double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_double *vs = NULL;
+  npy_intp vs_Dims[2] = {-1, -1};
+  const int vs_Rank = 2;
+  PyArrayObject *capi_vs_tmp = NULL;
+  int capi_vs_intent = 0;
+  int ldvs = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int *bwork = NULL;
+  npy_intp bwork_Dims[1] = {-1};
+  const int bwork_Rank = 1;
+  PyArrayObject *capi_bwork_tmp = NULL;
+  int capi_bwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"zselect","a","compute_v","sort_t","lwork","zselect_extra_args","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOO!i:flapack.zgees",\
+    capi_kwlist,&zselect_capi,&a_capi,&compute_v_capi,&sort_t_capi,&lwork_capi,&PyTuple_Type,&zselect_xa_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `a' of flapack.zgees to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","2nd argument a") {
+  /* Processing variable info */
+  /* Processing variable sort_t */
+  if (sort_t_capi == Py_None) sort_t = 0; else
+    f2py_success = int_from_pyobj(&sort_t,sort_t_capi,"flapack.zgees() 2nd keyword (sort_t) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(sort_t==0||sort_t==1,"sort_t==0||sort_t==1","2nd keyword sort_t","zgees:sort_t=%d",sort_t) {
+  /* Processing variable sdim */
+  sdim = 0;
+  /* Processing variable zselect */
+if(F2PyCapsule_Check(zselect_capi)) {
+  zselect_cptr = F2PyCapsule_AsVoidPtr(zselect_capi);
+} else {
+  zselect_cptr = cb_zselect_in_gees__user__routines;
+}
+
+  zselect_nofargs_capi = cb_zselect_in_gees__user__routines_nofargs;
+  if (create_cb_arglist(zselect_capi,zselect_xa_capi,1,0,&cb_zselect_in_gees__user__routines_nofargs,&zselect_args_capi,"failed in processing argument list for call-back zselect.")) {
+    jmp_buf zselect_jmpbuf;
+    CFUNCSMESS("Saving jmpbuf for `zselect`.\n");
+    SWAP(zselect_capi,cb_zselect_in_gees__user__routines_capi,PyObject);
+    SWAP(zselect_args_capi,cb_zselect_in_gees__user__routines_args_capi,PyTupleObject);
+    memcpy(&zselect_jmpbuf,&cb_zselect_in_gees__user__routines_jmpbuf,sizeof(jmp_buf));
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.zgees() 1st keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_v==0||compute_v==1,"compute_v==0||compute_v==1","1st keyword compute_v","zgees:compute_v=%d",compute_v) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_CDOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.zgees to C/Fortran array" );
+  } else {
+    w = (complex_double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable bwork */
+  bwork_Dims[0]=n;
+  capi_bwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_bwork_tmp = array_from_pyobj(NPY_INT,bwork_Dims,bwork_Rank,capi_bwork_intent,Py_None);
+  if (capi_bwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `bwork' of flapack.zgees to C/Fortran array" );
+  } else {
+    bwork = (int *)(PyArray_DATA(capi_bwork_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zgees() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork >= MAX(1,3*n),"lwork >= MAX(1,3*n)","3rd keyword lwork","zgees:lwork=%d",lwork) {
+  /* Processing variable ldvs */
+  ldvs = ((compute_v==1)?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zgees to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=n;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zgees to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable vs */
+  vs_Dims[0]=ldvs,vs_Dims[1]=n;
+  capi_vs_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vs_tmp = array_from_pyobj(NPY_CDOUBLE,vs_Dims,vs_Rank,capi_vs_intent,Py_None);
+  if (capi_vs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vs' of flapack.zgees to C/Fortran array" );
+  } else {
+    vs = (complex_double *)(PyArray_DATA(capi_vs_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    if ((setjmp(cb_zselect_in_gees__user__routines_jmpbuf))) {
+      f2py_success = 0;
+    } else {
+        (*f2py_func)((compute_v?"V":"N"),(sort_t?"S":"N"),cb_zselect_in_gees__user__routines,&n,a,&nrows,&sdim,w,vs,&ldvs,work,&lwork,rwork,bwork,&info,1,1) ;
+        /*(*f2py_func)(&compute_v,&sort_t,zselect_cptr,&n,a,&nrows,&sdim,w,vs,&ldvs,work,&lwork,rwork,bwork,&info);*/
+    }
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiNNi",capi_a_tmp,sdim,capi_w_tmp,capi_vs_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vs_tmp == NULL) ... else of vs*/
+  /* End of cleaning variable vs */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvs */
+  } /*CHECKSCALAR(lwork >= MAX(1,3*n))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+    Py_XDECREF(capi_bwork_tmp);
+  }  /*if (capi_bwork_tmp == NULL) ... else of bwork*/
+  /* End of cleaning variable bwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable nrows */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_v==0||compute_v==1)*/
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+    CFUNCSMESS("Restoring jmpbuf for `zselect`.\n");
+    cb_zselect_in_gees__user__routines_capi = zselect_capi;
+    Py_DECREF(cb_zselect_in_gees__user__routines_args_capi);
+    cb_zselect_in_gees__user__routines_args_capi = zselect_args_capi;
+    cb_zselect_in_gees__user__routines_nofargs = zselect_nofargs_capi;
+    memcpy(&cb_zselect_in_gees__user__routines_jmpbuf,&zselect_jmpbuf,sizeof(jmp_buf));
+  }
+  /* End of cleaning variable zselect */
+  /* End of cleaning variable sdim */
+  } /*CHECKSCALAR(sort_t==0||sort_t==1)*/
+  } /*if (f2py_success) of sort_t*/
+  /* End of cleaning variable sort_t */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgees ********************************/
+
+/*********************************** sgeev ***********************************/
+static char doc_f2py_rout_flapack_sgeev[] = "\
+wr,wi,vl,vr,info = sgeev(a,[compute_vl,compute_vr,lwork,overwrite_a])\n\nWrapper for ``sgeev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_vl||compute_vr)?4*n:3*n\n"
+"\nReturns\n-------\n"
+"wr : rank-1 array('f') with bounds (n)\n"
+"wi : rank-1 array('f') with bounds (n)\n"
+"vl : rank-2 array('f') with bounds (ldvl,n)\n"
+"vr : rank-2 array('f') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(sgeev,SGEEV)(char*,char*,int*,float*,int*,float*,float*,float*,int*,float*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgeev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,float*,int*,float*,float*,float*,int*,float*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *wr = NULL;
+  npy_intp wr_Dims[1] = {-1};
+  const int wr_Rank = 1;
+  PyArrayObject *capi_wr_tmp = NULL;
+  int capi_wr_intent = 0;
+  float *wi = NULL;
+  npy_intp wi_Dims[1] = {-1};
+  const int wi_Rank = 1;
+  PyArrayObject *capi_wi_tmp = NULL;
+  int capi_wi_intent = 0;
+  float *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  float *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_vl","compute_vr","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.sgeev",\
+    capi_kwlist,&a_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgeev to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.sgeev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","sgeev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.sgeev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","sgeev:compute_vl=%d",compute_vl) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable wr */
+  wr_Dims[0]=n;
+  capi_wr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wr_tmp = array_from_pyobj(NPY_FLOAT,wr_Dims,wr_Rank,capi_wr_intent,Py_None);
+  if (capi_wr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wr' of flapack.sgeev to C/Fortran array" );
+  } else {
+    wr = (float *)(PyArray_DATA(capi_wr_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_vl||compute_vr)?4*n:3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sgeev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=(compute_vl||compute_vr)?4*n:3*n,"lwork>=(compute_vl||compute_vr)?4*n:3*n","3rd keyword lwork","sgeev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sgeev to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable wi */
+  wi_Dims[0]=n;
+  capi_wi_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wi_tmp = array_from_pyobj(NPY_FLOAT,wi_Dims,wi_Rank,capi_wi_intent,Py_None);
+  if (capi_wi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wi' of flapack.sgeev to C/Fortran array" );
+  } else {
+    wi = (float *)(PyArray_DATA(capi_wi_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_FLOAT,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.sgeev to C/Fortran array" );
+  } else {
+    vr = (float *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_FLOAT,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.sgeev to C/Fortran array" );
+  } else {
+    vl = (float *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,wr,wi,vl,&ldvl,vr,&ldvr,work,&lwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,wr,wi,vl,&ldvl,vr,&ldvr,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNNi",capi_wr_tmp,capi_wi_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+  }  /*if (capi_wi_tmp == NULL) ... else of wi*/
+  /* End of cleaning variable wi */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=(compute_vl||compute_vr)?4*n:3*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_wr_tmp == NULL) ... else of wr*/
+  /* End of cleaning variable wr */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sgeev ********************************/
+
+/*********************************** dgeev ***********************************/
+static char doc_f2py_rout_flapack_dgeev[] = "\
+wr,wi,vl,vr,info = dgeev(a,[compute_vl,compute_vr,lwork,overwrite_a])\n\nWrapper for ``dgeev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_vl||compute_vr)?4*n:3*n\n"
+"\nReturns\n-------\n"
+"wr : rank-1 array('d') with bounds (n)\n"
+"wi : rank-1 array('d') with bounds (n)\n"
+"vl : rank-2 array('d') with bounds (ldvl,n)\n"
+"vr : rank-2 array('d') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(dgeev,DGEEV)(char*,char*,int*,double*,int*,double*,double*,double*,int*,double*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgeev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,double*,int*,double*,double*,double*,int*,double*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *wr = NULL;
+  npy_intp wr_Dims[1] = {-1};
+  const int wr_Rank = 1;
+  PyArrayObject *capi_wr_tmp = NULL;
+  int capi_wr_intent = 0;
+  double *wi = NULL;
+  npy_intp wi_Dims[1] = {-1};
+  const int wi_Rank = 1;
+  PyArrayObject *capi_wi_tmp = NULL;
+  int capi_wi_intent = 0;
+  double *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  double *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_vl","compute_vr","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.dgeev",\
+    capi_kwlist,&a_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgeev to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.dgeev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","dgeev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.dgeev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","dgeev:compute_vl=%d",compute_vl) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable wr */
+  wr_Dims[0]=n;
+  capi_wr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wr_tmp = array_from_pyobj(NPY_DOUBLE,wr_Dims,wr_Rank,capi_wr_intent,Py_None);
+  if (capi_wr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wr' of flapack.dgeev to C/Fortran array" );
+  } else {
+    wr = (double *)(PyArray_DATA(capi_wr_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_vl||compute_vr)?4*n:3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dgeev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=(compute_vl||compute_vr)?4*n:3*n,"lwork>=(compute_vl||compute_vr)?4*n:3*n","3rd keyword lwork","dgeev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dgeev to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable wi */
+  wi_Dims[0]=n;
+  capi_wi_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_wi_tmp = array_from_pyobj(NPY_DOUBLE,wi_Dims,wi_Rank,capi_wi_intent,Py_None);
+  if (capi_wi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `wi' of flapack.dgeev to C/Fortran array" );
+  } else {
+    wi = (double *)(PyArray_DATA(capi_wi_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_DOUBLE,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.dgeev to C/Fortran array" );
+  } else {
+    vr = (double *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_DOUBLE,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.dgeev to C/Fortran array" );
+  } else {
+    vl = (double *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,wr,wi,vl,&ldvl,vr,&ldvr,work,&lwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,wr,wi,vl,&ldvl,vr,&ldvr,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNNi",capi_wr_tmp,capi_wi_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+  }  /*if (capi_wi_tmp == NULL) ... else of wi*/
+  /* End of cleaning variable wi */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=(compute_vl||compute_vr)?4*n:3*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_wr_tmp == NULL) ... else of wr*/
+  /* End of cleaning variable wr */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dgeev ********************************/
+
+/*********************************** cgeev ***********************************/
+static char doc_f2py_rout_flapack_cgeev[] = "\
+w,vl,vr,info = cgeev(a,[compute_vl,compute_vr,lwork,overwrite_a])\n\nWrapper for ``cgeev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('F') with bounds (n)\n"
+"vl : rank-2 array('F') with bounds (ldvl,n)\n"
+"vr : rank-2 array('F') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(cgeev,CGEEV)(char*,char*,int*,complex_float*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int* ); */
+static PyObject *f2py_rout_flapack_cgeev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_float*,int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_float *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  complex_float *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_vl","compute_vr","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.cgeev",\
+    capi_kwlist,&a_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgeev to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.cgeev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","cgeev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.cgeev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","cgeev:compute_vl=%d",compute_vl) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_CFLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.cgeev to C/Fortran array" );
+  } else {
+    w = (complex_float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cgeev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=2*n,"lwork>=2*n","3rd keyword lwork","cgeev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cgeev to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=2 * n;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cgeev to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_CFLOAT,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.cgeev to C/Fortran array" );
+  } else {
+    vr = (complex_float *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_CFLOAT,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.cgeev to C/Fortran array" );
+  } else {
+    vl = (complex_float *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,w,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,w,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_w_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=2*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cgeev ********************************/
+
+/*********************************** zgeev ***********************************/
+static char doc_f2py_rout_flapack_zgeev[] = "\
+w,vl,vr,info = zgeev(a,[compute_vl,compute_vr,lwork,overwrite_a])\n\nWrapper for ``zgeev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('D') with bounds (n)\n"
+"vl : rank-2 array('D') with bounds (ldvl,n)\n"
+"vr : rank-2 array('D') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(zgeev,ZGEEV)(char*,char*,int*,complex_double*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int* ); */
+static PyObject *f2py_rout_flapack_zgeev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_double*,int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_double *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  complex_double *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_vl","compute_vr","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.zgeev",\
+    capi_kwlist,&a_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgeev to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.zgeev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","zgeev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.zgeev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","zgeev:compute_vl=%d",compute_vl) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_CDOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.zgeev to C/Fortran array" );
+  } else {
+    w = (complex_double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zgeev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=2*n,"lwork>=2*n","3rd keyword lwork","zgeev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zgeev to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=2 * n;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zgeev to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_CDOUBLE,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.zgeev to C/Fortran array" );
+  } else {
+    vr = (complex_double *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_CDOUBLE,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.zgeev to C/Fortran array" );
+  } else {
+    vl = (complex_double *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,w,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,w,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_w_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=2*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zgeev ********************************/
+
+/*********************************** sgesdd ***********************************/
+static char doc_f2py_rout_flapack_sgesdd[] = "\
+u,s,vt,info = sgesdd(a,[compute_uv,lwork,overwrite_a])\n\nWrapper for ``sgesdd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_uv : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: (compute_uv?4*minmn*minmn+MAX(m,n)+9*minmn:MAX(14*minmn+4,10*minmn+827)+MAX(m,n))\n"
+"\nReturns\n-------\n"
+"u : rank-2 array('f') with bounds (du,du)\n"
+"s : rank-1 array('f') with bounds (minmn)\n"
+"vt : rank-2 array('f') with bounds (dvt,dvt)\n"
+"info : int";
+/* extern void F_FUNC(sgesdd,SGESDD)(char*,int*,int*,float*,int*,float*,float*,int*,float*,int*,float*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgesdd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,float*,int*,float*,float*,int*,float*,int*,float*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int du = 0;
+  int dvt = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_uv = 0;
+  PyObject *compute_uv_capi = Py_None;
+  float *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  float *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  float *vt = NULL;
+  npy_intp vt_Dims[2] = {-1, -1};
+  const int vt_Rank = 2;
+  PyArrayObject *capi_vt_tmp = NULL;
+  int capi_vt_intent = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_uv","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.sgesdd",\
+    capi_kwlist,&a_capi,&compute_uv_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgesdd to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable compute_uv */
+  if (compute_uv_capi == Py_None) compute_uv = 1; else
+    f2py_success = int_from_pyobj(&compute_uv,compute_uv_capi,"flapack.sgesdd() 1st keyword (compute_uv) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_uv==0||compute_uv==1,"compute_uv==0||compute_uv==1","1st keyword compute_uv","sgesdd:compute_uv=%d",compute_uv) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable dvt */
+  dvt = (compute_uv?n:1);
+  /* Processing variable vt */
+  vt_Dims[0]=dvt,vt_Dims[1]=dvt;
+  capi_vt_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vt_tmp = array_from_pyobj(NPY_FLOAT,vt_Dims,vt_Rank,capi_vt_intent,Py_None);
+  if (capi_vt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vt' of flapack.sgesdd to C/Fortran array" );
+  } else {
+    vt = (float *)(PyArray_DATA(capi_vt_tmp));
+
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_FLOAT,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.sgesdd to C/Fortran array" );
+  } else {
+    s = (float *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=8 * minmn;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.sgesdd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable du */
+  du = (compute_uv?m:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_uv?4*minmn*minmn+MAX(m,n)+9*minmn:MAX(14*minmn+4,10*minmn+827)+MAX(m,n)); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sgesdd() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sgesdd to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=du,u_Dims[1]=du;
+  capi_u_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_u_tmp = array_from_pyobj(NPY_FLOAT,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `u' of flapack.sgesdd to C/Fortran array" );
+  } else {
+    u = (float *)(PyArray_DATA(capi_u_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_uv?"A":"N"),&m,&n,a,&m,s,u,&du,vt,&dvt,work,&lwork,iwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&du,&dvt,a,&compute_uv,u,s,vt,work,&lwork,iwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_u_tmp,capi_s_tmp,capi_vt_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable du */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable minmn */
+  }  /*if (capi_vt_tmp == NULL) ... else of vt*/
+  /* End of cleaning variable vt */
+  /* End of cleaning variable dvt */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(compute_uv==0||compute_uv==1)*/
+  } /*if (f2py_success) of compute_uv*/
+  /* End of cleaning variable compute_uv */
+  /* End of cleaning variable info */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgesdd *******************************/
+
+/*********************************** dgesdd ***********************************/
+static char doc_f2py_rout_flapack_dgesdd[] = "\
+u,s,vt,info = dgesdd(a,[compute_uv,lwork,overwrite_a])\n\nWrapper for ``dgesdd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_uv : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: (compute_uv?4*minmn*minmn+MAX(m,n)+9*minmn:MAX(14*minmn+4,10*minmn+827)+MAX(m,n))\n"
+"\nReturns\n-------\n"
+"u : rank-2 array('d') with bounds (du,du)\n"
+"s : rank-1 array('d') with bounds (minmn)\n"
+"vt : rank-2 array('d') with bounds (dvt,dvt)\n"
+"info : int";
+/* extern void F_FUNC(dgesdd,DGESDD)(char*,int*,int*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgesdd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,double*,int*,double*,double*,int*,double*,int*,double*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int du = 0;
+  int dvt = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_uv = 0;
+  PyObject *compute_uv_capi = Py_None;
+  double *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  double *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  double *vt = NULL;
+  npy_intp vt_Dims[2] = {-1, -1};
+  const int vt_Rank = 2;
+  PyArrayObject *capi_vt_tmp = NULL;
+  int capi_vt_intent = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_uv","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.dgesdd",\
+    capi_kwlist,&a_capi,&compute_uv_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgesdd to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable compute_uv */
+  if (compute_uv_capi == Py_None) compute_uv = 1; else
+    f2py_success = int_from_pyobj(&compute_uv,compute_uv_capi,"flapack.dgesdd() 1st keyword (compute_uv) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_uv==0||compute_uv==1,"compute_uv==0||compute_uv==1","1st keyword compute_uv","dgesdd:compute_uv=%d",compute_uv) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable dvt */
+  dvt = (compute_uv?n:1);
+  /* Processing variable vt */
+  vt_Dims[0]=dvt,vt_Dims[1]=dvt;
+  capi_vt_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vt_tmp = array_from_pyobj(NPY_DOUBLE,vt_Dims,vt_Rank,capi_vt_intent,Py_None);
+  if (capi_vt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vt' of flapack.dgesdd to C/Fortran array" );
+  } else {
+    vt = (double *)(PyArray_DATA(capi_vt_tmp));
+
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_DOUBLE,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.dgesdd to C/Fortran array" );
+  } else {
+    s = (double *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=8 * minmn;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.dgesdd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable du */
+  du = (compute_uv?m:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_uv?4*minmn*minmn+MAX(m,n)+9*minmn:MAX(14*minmn+4,10*minmn+827)+MAX(m,n)); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dgesdd() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dgesdd to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=du,u_Dims[1]=du;
+  capi_u_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_u_tmp = array_from_pyobj(NPY_DOUBLE,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `u' of flapack.dgesdd to C/Fortran array" );
+  } else {
+    u = (double *)(PyArray_DATA(capi_u_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_uv?"A":"N"),&m,&n,a,&m,s,u,&du,vt,&dvt,work,&lwork,iwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&du,&dvt,a,&compute_uv,u,s,vt,work,&lwork,iwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_u_tmp,capi_s_tmp,capi_vt_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable du */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+  /* End of cleaning variable minmn */
+  }  /*if (capi_vt_tmp == NULL) ... else of vt*/
+  /* End of cleaning variable vt */
+  /* End of cleaning variable dvt */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(compute_uv==0||compute_uv==1)*/
+  } /*if (f2py_success) of compute_uv*/
+  /* End of cleaning variable compute_uv */
+  /* End of cleaning variable info */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgesdd *******************************/
+
+/*********************************** cgesdd ***********************************/
+static char doc_f2py_rout_flapack_cgesdd[] = "\
+u,s,vt,info = cgesdd(a,[compute_uv,lwork,overwrite_a])\n\nWrapper for ``cgesdd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_uv : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: (compute_uv?2*minmn*minmn+MAX(m,n)+2*minmn:2*minmn+MAX(m,n))\n"
+"\nReturns\n-------\n"
+"u : rank-2 array('F') with bounds (du,du)\n"
+"s : rank-1 array('f') with bounds (minmn)\n"
+"vt : rank-2 array('F') with bounds (dvt,dvt)\n"
+"info : int";
+/* extern void F_FUNC(cgesdd,CGESDD)(char*,int*,int*,complex_float*,int*,float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgesdd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_float*,int*,float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int du = 0;
+  int dvt = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_uv = 0;
+  PyObject *compute_uv_capi = Py_None;
+  complex_float *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  float *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  complex_float *vt = NULL;
+  npy_intp vt_Dims[2] = {-1, -1};
+  const int vt_Rank = 2;
+  PyArrayObject *capi_vt_tmp = NULL;
+  int capi_vt_intent = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_uv","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.cgesdd",\
+    capi_kwlist,&a_capi,&compute_uv_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgesdd to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable compute_uv */
+  if (compute_uv_capi == Py_None) compute_uv = 1; else
+    f2py_success = int_from_pyobj(&compute_uv,compute_uv_capi,"flapack.cgesdd() 1st keyword (compute_uv) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_uv==0||compute_uv==1,"compute_uv==0||compute_uv==1","1st keyword compute_uv","cgesdd:compute_uv=%d",compute_uv) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable dvt */
+  dvt = (compute_uv?n:1);
+  /* Processing variable vt */
+  vt_Dims[0]=dvt,vt_Dims[1]=dvt;
+  capi_vt_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vt_tmp = array_from_pyobj(NPY_CFLOAT,vt_Dims,vt_Rank,capi_vt_intent,Py_None);
+  if (capi_vt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vt' of flapack.cgesdd to C/Fortran array" );
+  } else {
+    vt = (complex_float *)(PyArray_DATA(capi_vt_tmp));
+
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable rwork */
+  rwork_Dims[0]=(compute_uv?5*minmn*minmn+7*minmn:5*minmn);
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cgesdd to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_FLOAT,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.cgesdd to C/Fortran array" );
+  } else {
+    s = (float *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=8 * minmn;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.cgesdd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable du */
+  du = (compute_uv?m:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_uv?2*minmn*minmn+MAX(m,n)+2*minmn:2*minmn+MAX(m,n)); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cgesdd() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cgesdd to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=du,u_Dims[1]=du;
+  capi_u_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_u_tmp = array_from_pyobj(NPY_CFLOAT,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `u' of flapack.cgesdd to C/Fortran array" );
+  } else {
+    u = (complex_float *)(PyArray_DATA(capi_u_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_uv?"A":"N"),&m,&n,a,&m,s,u,&du,vt,&dvt,work,&lwork,rwork,iwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&du,&dvt,a,&compute_uv,u,s,vt,work,&lwork,rwork,iwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_u_tmp,capi_s_tmp,capi_vt_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable du */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+  /* End of cleaning variable minmn */
+  }  /*if (capi_vt_tmp == NULL) ... else of vt*/
+  /* End of cleaning variable vt */
+  /* End of cleaning variable dvt */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(compute_uv==0||compute_uv==1)*/
+  } /*if (f2py_success) of compute_uv*/
+  /* End of cleaning variable compute_uv */
+  /* End of cleaning variable info */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgesdd *******************************/
+
+/*********************************** zgesdd ***********************************/
+static char doc_f2py_rout_flapack_zgesdd[] = "\
+u,s,vt,info = zgesdd(a,[compute_uv,lwork,overwrite_a])\n\nWrapper for ``zgesdd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"compute_uv : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: (compute_uv?2*minmn*minmn+MAX(m,n)+2*minmn:2*minmn+MAX(m,n))\n"
+"\nReturns\n-------\n"
+"u : rank-2 array('D') with bounds (du,du)\n"
+"s : rank-1 array('d') with bounds (minmn)\n"
+"vt : rank-2 array('D') with bounds (dvt,dvt)\n"
+"info : int";
+/* extern void F_FUNC(zgesdd,ZGESDD)(char*,int*,int*,complex_double*,int*,double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgesdd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_double*,int*,double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int minmn = 0;
+  int du = 0;
+  int dvt = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int compute_uv = 0;
+  PyObject *compute_uv_capi = Py_None;
+  complex_double *u = NULL;
+  npy_intp u_Dims[2] = {-1, -1};
+  const int u_Rank = 2;
+  PyArrayObject *capi_u_tmp = NULL;
+  int capi_u_intent = 0;
+  double *s = NULL;
+  npy_intp s_Dims[1] = {-1};
+  const int s_Rank = 1;
+  PyArrayObject *capi_s_tmp = NULL;
+  int capi_s_intent = 0;
+  complex_double *vt = NULL;
+  npy_intp vt_Dims[2] = {-1, -1};
+  const int vt_Rank = 2;
+  PyArrayObject *capi_vt_tmp = NULL;
+  int capi_vt_intent = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","compute_uv","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.zgesdd",\
+    capi_kwlist,&a_capi,&compute_uv_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgesdd to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable compute_uv */
+  if (compute_uv_capi == Py_None) compute_uv = 1; else
+    f2py_success = int_from_pyobj(&compute_uv,compute_uv_capi,"flapack.zgesdd() 1st keyword (compute_uv) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_uv==0||compute_uv==1,"compute_uv==0||compute_uv==1","1st keyword compute_uv","zgesdd:compute_uv=%d",compute_uv) {
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable dvt */
+  dvt = (compute_uv?n:1);
+  /* Processing variable vt */
+  vt_Dims[0]=dvt,vt_Dims[1]=dvt;
+  capi_vt_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vt_tmp = array_from_pyobj(NPY_CDOUBLE,vt_Dims,vt_Rank,capi_vt_intent,Py_None);
+  if (capi_vt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vt' of flapack.zgesdd to C/Fortran array" );
+  } else {
+    vt = (complex_double *)(PyArray_DATA(capi_vt_tmp));
+
+  /* Processing variable minmn */
+  minmn = MIN(m,n);
+  /* Processing variable rwork */
+  rwork_Dims[0]=(compute_uv?5*minmn*minmn+7*minmn:5*minmn);
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zgesdd to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable s */
+  s_Dims[0]=minmn;
+  capi_s_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_s_tmp = array_from_pyobj(NPY_DOUBLE,s_Dims,s_Rank,capi_s_intent,Py_None);
+  if (capi_s_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `s' of flapack.zgesdd to C/Fortran array" );
+  } else {
+    s = (double *)(PyArray_DATA(capi_s_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=8 * minmn;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.zgesdd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+  /* Processing variable du */
+  du = (compute_uv?m:1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_uv?2*minmn*minmn+MAX(m,n)+2*minmn:2*minmn+MAX(m,n)); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zgesdd() 2nd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zgesdd to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable u */
+  u_Dims[0]=du,u_Dims[1]=du;
+  capi_u_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_u_tmp = array_from_pyobj(NPY_CDOUBLE,u_Dims,u_Rank,capi_u_intent,Py_None);
+  if (capi_u_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `u' of flapack.zgesdd to C/Fortran array" );
+  } else {
+    u = (complex_double *)(PyArray_DATA(capi_u_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((compute_uv?"A":"N"),&m,&n,a,&m,s,u,&du,vt,&dvt,work,&lwork,rwork,iwork,&info) ;
+        /*(*f2py_func)(&m,&n,&minmn,&du,&dvt,a,&compute_uv,u,s,vt,work,&lwork,rwork,iwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNi",capi_u_tmp,capi_s_tmp,capi_vt_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_u_tmp == NULL) ... else of u*/
+  /* End of cleaning variable u */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable du */
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+  }  /*if (capi_s_tmp == NULL) ... else of s*/
+  /* End of cleaning variable s */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+  /* End of cleaning variable minmn */
+  }  /*if (capi_vt_tmp == NULL) ... else of vt*/
+  /* End of cleaning variable vt */
+  /* End of cleaning variable dvt */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(compute_uv==0||compute_uv==1)*/
+  } /*if (f2py_success) of compute_uv*/
+  /* End of cleaning variable compute_uv */
+  /* End of cleaning variable info */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgesdd *******************************/
+
+/*********************************** ssygv ***********************************/
+static char doc_f2py_rout_flapack_ssygv[] = "\
+w,v,info = ssygv(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``ssygv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"b : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('f') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(ssygv,SSYGV)(int*,char*,char*,int*,float*,int*,float*,int*,float*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_ssygv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,float*,int*,float*,int*,float*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.ssygv",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.ssygv to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.ssygv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.ssygv() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","ssygv:itype=%d",itype) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.ssygv() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.ssygv to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.ssygv() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(3*n-1<=lwork,"3*n-1<=lwork","4th keyword lwork","ssygv:lwork=%d",lwork) {
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.ssygv to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.ssygv to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*CHECKSCALAR(3*n-1<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of ssygv ********************************/
+
+/*********************************** dsygv ***********************************/
+static char doc_f2py_rout_flapack_dsygv[] = "\
+w,v,info = dsygv(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``dsygv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"b : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('d') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(dsygv,DSYGV)(int*,char*,char*,int*,double*,int*,double*,int*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dsygv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,double*,int*,double*,int*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.dsygv",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dsygv to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dsygv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.dsygv() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","dsygv:itype=%d",itype) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.dsygv() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.dsygv to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dsygv() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(3*n-1<=lwork,"3*n-1<=lwork","4th keyword lwork","dsygv:lwork=%d",lwork) {
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.dsygv to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dsygv to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*CHECKSCALAR(3*n-1<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dsygv ********************************/
+
+/*********************************** chegv ***********************************/
+static char doc_f2py_rout_flapack_chegv[] = "\
+w,v,info = chegv(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``chegv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"b : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('F') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(chegv,CHEGV)(int*,char*,char*,int*,complex_float*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int* ); */
+static PyObject *f2py_rout_flapack_chegv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,complex_float*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.chegv",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.chegv to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.chegv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.chegv() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","chegv:itype=%d",itype) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.chegv() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.chegv to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.chegv() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(2*n-1<=lwork,"2*n-1<=lwork","4th keyword lwork","chegv:lwork=%d",lwork) {
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.chegv to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.chegv to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=3 * n - 2;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.chegv to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,rwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*CHECKSCALAR(2*n-1<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of chegv ********************************/
+
+/*********************************** zhegv ***********************************/
+static char doc_f2py_rout_flapack_zhegv[] = "\
+w,v,info = zhegv(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``zhegv``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"b : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n-1\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('D') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(zhegv,ZHEGV)(int*,char*,char*,int*,complex_double*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int* ); */
+static PyObject *f2py_rout_flapack_zhegv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,complex_double*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.zhegv",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zhegv to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zhegv() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.zhegv() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","zhegv:itype=%d",itype) {
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.zhegv() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.zhegv to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n-1; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zhegv() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(2*n-1<=lwork,"2*n-1<=lwork","4th keyword lwork","zhegv:lwork=%d",lwork) {
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.zhegv to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zhegv to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=3 * n - 2;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zhegv to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,rwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*CHECKSCALAR(2*n-1<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zhegv ********************************/
+
+/*********************************** ssygvd ***********************************/
+static char doc_f2py_rout_flapack_ssygvd[] = "\
+w,v,info = ssygvd(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``ssygvd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"b : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?1+6*n+2*n*n:2*n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('f') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(ssygvd,SSYGVD)(int*,char*,char*,int*,float*,int*,float*,int*,float*,float*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_ssygvd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,float*,int*,float*,int*,float*,float*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.ssygvd",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.ssygvd to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.ssygvd() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.ssygvd() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","ssygvd:itype=%d",itype) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.ssygvd() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?1+6*n+2*n*n:2*n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.ssygvd() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((compute_v?1+6*n+2*n*n:2*n+1)<=lwork,"(compute_v?1+6*n+2*n*n:2*n+1)<=lwork","4th keyword lwork","ssygvd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.ssygvd to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.ssygvd to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.ssygvd to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.ssygvd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR((compute_v?1+6*n+2*n*n:2*n+1)<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of ssygvd *******************************/
+
+/*********************************** dsygvd ***********************************/
+static char doc_f2py_rout_flapack_dsygvd[] = "\
+w,v,info = dsygvd(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``dsygvd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"b : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?1+6*n+2*n*n:2*n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('d') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(dsygvd,DSYGVD)(int*,char*,char*,int*,double*,int*,double*,int*,double*,double*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dsygvd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,double*,int*,double*,int*,double*,double*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.dsygvd",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dsygvd to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dsygvd() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.dsygvd() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","dsygvd:itype=%d",itype) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.dsygvd() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?1+6*n+2*n*n:2*n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dsygvd() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((compute_v?1+6*n+2*n*n:2*n+1)<=lwork,"(compute_v?1+6*n+2*n*n:2*n+1)<=lwork","4th keyword lwork","dsygvd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.dsygvd to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.dsygvd to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dsygvd to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.dsygvd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR((compute_v?1+6*n+2*n*n:2*n+1)<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dsygvd *******************************/
+
+/*********************************** chegvd ***********************************/
+static char doc_f2py_rout_flapack_chegvd[] = "\
+w,v,info = chegvd(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``chegvd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"b : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?2*n+n*n:n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('f') with bounds (n)\n"
+"v : rank-2 array('F') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(chegvd,CHEGVD)(int*,char*,char*,int*,complex_float*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_chegvd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,complex_float*,int*,complex_float*,int*,float*,complex_float*,int*,float*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  float *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int lrwork = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.chegvd",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.chegvd to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.chegvd() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.chegvd() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","chegvd:itype=%d",itype) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.chegvd() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable lrwork */
+  lrwork = (compute_v?1+5*n+2*n*n:n);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?2*n+n*n:n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.chegvd() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((compute_v?2*n+n*n:n+1)<=lwork,"(compute_v?2*n+n*n:n+1)<=lwork","4th keyword lwork","chegvd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.chegvd to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_FLOAT,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.chegvd to C/Fortran array" );
+  } else {
+    w = (float *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.chegvd to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=lrwork;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.chegvd to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.chegvd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,rwork,&lrwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,rwork,&lrwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR((compute_v?2*n+n*n:n+1)<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable lrwork */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of chegvd *******************************/
+
+/*********************************** zhegvd ***********************************/
+static char doc_f2py_rout_flapack_zhegvd[] = "\
+w,v,info = zhegvd(a,b,[itype,compute_v,lower,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``zhegvd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"b : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"itype : input int, optional\n    Default: 1\n"
+"compute_v : input int, optional\n    Default: 1\n"
+"lower : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: (compute_v?2*n+n*n:n+1)\n"
+"\nReturns\n-------\n"
+"w : rank-1 array('d') with bounds (n)\n"
+"v : rank-2 array('D') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(zhegvd,ZHEGVD)(int*,char*,char*,int*,complex_double*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zhegvd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,char*,char*,int*,complex_double*,int*,complex_double*,int*,double*,complex_double*,int*,double*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  int compute_v = 0;
+  PyObject *compute_v_capi = Py_None;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int n = 0;
+  double *w = NULL;
+  npy_intp w_Dims[1] = {-1};
+  const int w_Rank = 1;
+  PyArrayObject *capi_w_tmp = NULL;
+  int capi_w_intent = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int lrwork = 0;
+  int *iwork = NULL;
+  npy_intp iwork_Dims[1] = {-1};
+  const int iwork_Rank = 1;
+  PyArrayObject *capi_iwork_tmp = NULL;
+  int capi_iwork_intent = 0;
+  int liwork = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","itype","compute_v","lower","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOii:flapack.zhegvd",\
+    capi_kwlist,&a_capi,&b_capi,&itype_capi,&compute_v_capi,&lower_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zhegvd to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zhegvd() 3rd keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+  if (itype_capi == Py_None) itype = 1; else
+    f2py_success = int_from_pyobj(&itype,itype_capi,"flapack.zhegvd() 1st keyword (itype) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(1<=itype && itype<=3,"1<=itype && itype<=3","1st keyword itype","zhegvd:itype=%d",itype) {
+  /* Processing variable info */
+  /* Processing variable compute_v */
+  if (compute_v_capi == Py_None) compute_v = 1; else
+    f2py_success = int_from_pyobj(&compute_v,compute_v_capi,"flapack.zhegvd() 2nd keyword (compute_v) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable lrwork */
+  lrwork = (compute_v?1+5*n+2*n*n:n);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = (compute_v?2*n+n*n:n+1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zhegvd() 4th keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((compute_v?2*n+n*n:n+1)<=lwork,"(compute_v?2*n+n*n:n+1)<=lwork","4th keyword lwork","zhegvd:lwork=%d",lwork) {
+  /* Processing variable liwork */
+  liwork = (compute_v?3+5*n:1);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n,b_Dims[1]=n;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.zhegvd to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable w */
+  w_Dims[0]=n;
+  capi_w_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_w_tmp = array_from_pyobj(NPY_DOUBLE,w_Dims,w_Rank,capi_w_intent,Py_None);
+  if (capi_w_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `w' of flapack.zhegvd to C/Fortran array" );
+  } else {
+    w = (double *)(PyArray_DATA(capi_w_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zhegvd to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=lrwork;
+  capi_rwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zhegvd to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable iwork */
+  iwork_Dims[0]=liwork;
+  capi_iwork_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_iwork_tmp = array_from_pyobj(NPY_INT,iwork_Dims,iwork_Rank,capi_iwork_intent,Py_None);
+  if (capi_iwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `iwork' of flapack.zhegvd to C/Fortran array" );
+  } else {
+    iwork = (int *)(PyArray_DATA(capi_iwork_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,(compute_v?"V":"N"),(lower?"L":"U"),&n,a,&n,b,&n,w,work,&lwork,rwork,&lrwork,iwork,&liwork,&info) ;
+        /*(*f2py_func)(&itype,&compute_v,&lower,&n,w,a,b,work,&lwork,rwork,&lrwork,iwork,&liwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_w_tmp,capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_iwork_tmp);
+  }  /*if (capi_iwork_tmp == NULL) ... else of iwork*/
+  /* End of cleaning variable iwork */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_w_tmp == NULL) ... else of w*/
+  /* End of cleaning variable w */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable liwork */
+  } /*CHECKSCALAR((compute_v?2*n+n*n:n+1)<=lwork)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable lrwork */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of compute_v*/
+  /* End of cleaning variable compute_v */
+  /* End of cleaning variable info */
+  } /*CHECKSCALAR(1<=itype && itype<=3)*/
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zhegvd *******************************/
+
+/*********************************** sggev ***********************************/
+static char doc_f2py_rout_flapack_sggev[] = "\
+alphar,alphai,beta,vl,vr,info = sggev(a,b,[compute_vl,compute_vr,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``sggev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"b : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 8*n\n"
+"\nReturns\n-------\n"
+"alphar : rank-1 array('f') with bounds (n)\n"
+"alphai : rank-1 array('f') with bounds (n)\n"
+"beta : rank-1 array('f') with bounds (n)\n"
+"vl : rank-2 array('f') with bounds (ldvl,n)\n"
+"vr : rank-2 array('f') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(sggev,SGGEV)(char*,char*,int*,float*,int*,float*,int*,float*,float*,float*,float*,int*,float*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sggev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,float*,int*,float*,int*,float*,float*,float*,float*,int*,float*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  float *alphar = NULL;
+  npy_intp alphar_Dims[1] = {-1};
+  const int alphar_Rank = 1;
+  PyArrayObject *capi_alphar_tmp = NULL;
+  int capi_alphar_intent = 0;
+  float *alphai = NULL;
+  npy_intp alphai_Dims[1] = {-1};
+  const int alphai_Rank = 1;
+  PyArrayObject *capi_alphai_tmp = NULL;
+  int capi_alphai_intent = 0;
+  float *beta = NULL;
+  npy_intp beta_Dims[1] = {-1};
+  const int beta_Rank = 1;
+  PyArrayObject *capi_beta_tmp = NULL;
+  int capi_beta_intent = 0;
+  float *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  float *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","compute_vl","compute_vr","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOii:flapack.sggev",\
+    capi_kwlist,&a_capi,&b_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.sggev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","sggev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.sggev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","sggev:compute_vl=%d",compute_vl) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sggev to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.sggev to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(b,0)==shape(b,1),"shape(b,0)==shape(b,1)","2nd argument b") {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable alphai */
+  alphai_Dims[0]=n;
+  capi_alphai_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_alphai_tmp = array_from_pyobj(NPY_FLOAT,alphai_Dims,alphai_Rank,capi_alphai_intent,Py_None);
+  if (capi_alphai_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `alphai' of flapack.sggev to C/Fortran array" );
+  } else {
+    alphai = (float *)(PyArray_DATA(capi_alphai_tmp));
+
+  /* Processing variable alphar */
+  alphar_Dims[0]=n;
+  capi_alphar_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_alphar_tmp = array_from_pyobj(NPY_FLOAT,alphar_Dims,alphar_Rank,capi_alphar_intent,Py_None);
+  if (capi_alphar_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `alphar' of flapack.sggev to C/Fortran array" );
+  } else {
+    alphar = (float *)(PyArray_DATA(capi_alphar_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_FLOAT,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.sggev to C/Fortran array" );
+  } else {
+    vr = (float *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 8*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sggev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=8*n,"lwork>=8*n","3rd keyword lwork","sggev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sggev to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable beta */
+  beta_Dims[0]=n;
+  capi_beta_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_beta_tmp = array_from_pyobj(NPY_FLOAT,beta_Dims,beta_Rank,capi_beta_intent,Py_None);
+  if (capi_beta_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `beta' of flapack.sggev to C/Fortran array" );
+  } else {
+    beta = (float *)(PyArray_DATA(capi_beta_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_FLOAT,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.sggev to C/Fortran array" );
+  } else {
+    vl = (float *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,b,&n,alphar,alphai,beta,vl,&ldvl,vr,&ldvr,work,&lwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,b,alphar,alphai,beta,vl,&ldvl,vr,&ldvr,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNNNi",capi_alphar_tmp,capi_alphai_tmp,capi_beta_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_beta_tmp == NULL) ... else of beta*/
+  /* End of cleaning variable beta */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=8*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+  }  /*if (capi_alphar_tmp == NULL) ... else of alphar*/
+  /* End of cleaning variable alphar */
+  }  /*if (capi_alphai_tmp == NULL) ... else of alphai*/
+  /* End of cleaning variable alphai */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(b,0)==shape(b,1))*/
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of sggev ********************************/
+
+/*********************************** dggev ***********************************/
+static char doc_f2py_rout_flapack_dggev[] = "\
+alphar,alphai,beta,vl,vr,info = dggev(a,b,[compute_vl,compute_vr,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``dggev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"b : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 8*n\n"
+"\nReturns\n-------\n"
+"alphar : rank-1 array('d') with bounds (n)\n"
+"alphai : rank-1 array('d') with bounds (n)\n"
+"beta : rank-1 array('d') with bounds (n)\n"
+"vl : rank-2 array('d') with bounds (ldvl,n)\n"
+"vr : rank-2 array('d') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(dggev,DGGEV)(char*,char*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dggev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,double*,int*,double*,int*,double*,double*,double*,double*,int*,double*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  double *alphar = NULL;
+  npy_intp alphar_Dims[1] = {-1};
+  const int alphar_Rank = 1;
+  PyArrayObject *capi_alphar_tmp = NULL;
+  int capi_alphar_intent = 0;
+  double *alphai = NULL;
+  npy_intp alphai_Dims[1] = {-1};
+  const int alphai_Rank = 1;
+  PyArrayObject *capi_alphai_tmp = NULL;
+  int capi_alphai_intent = 0;
+  double *beta = NULL;
+  npy_intp beta_Dims[1] = {-1};
+  const int beta_Rank = 1;
+  PyArrayObject *capi_beta_tmp = NULL;
+  int capi_beta_intent = 0;
+  double *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  double *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","compute_vl","compute_vr","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOii:flapack.dggev",\
+    capi_kwlist,&a_capi,&b_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.dggev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","dggev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.dggev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","dggev:compute_vl=%d",compute_vl) {
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dggev to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.dggev to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(b,0)==shape(b,1),"shape(b,0)==shape(b,1)","2nd argument b") {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable alphai */
+  alphai_Dims[0]=n;
+  capi_alphai_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_alphai_tmp = array_from_pyobj(NPY_DOUBLE,alphai_Dims,alphai_Rank,capi_alphai_intent,Py_None);
+  if (capi_alphai_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `alphai' of flapack.dggev to C/Fortran array" );
+  } else {
+    alphai = (double *)(PyArray_DATA(capi_alphai_tmp));
+
+  /* Processing variable alphar */
+  alphar_Dims[0]=n;
+  capi_alphar_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_alphar_tmp = array_from_pyobj(NPY_DOUBLE,alphar_Dims,alphar_Rank,capi_alphar_intent,Py_None);
+  if (capi_alphar_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `alphar' of flapack.dggev to C/Fortran array" );
+  } else {
+    alphar = (double *)(PyArray_DATA(capi_alphar_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_DOUBLE,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.dggev to C/Fortran array" );
+  } else {
+    vr = (double *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 8*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dggev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=8*n,"lwork>=8*n","3rd keyword lwork","dggev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dggev to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable beta */
+  beta_Dims[0]=n;
+  capi_beta_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_beta_tmp = array_from_pyobj(NPY_DOUBLE,beta_Dims,beta_Rank,capi_beta_intent,Py_None);
+  if (capi_beta_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `beta' of flapack.dggev to C/Fortran array" );
+  } else {
+    beta = (double *)(PyArray_DATA(capi_beta_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_DOUBLE,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.dggev to C/Fortran array" );
+  } else {
+    vl = (double *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,b,&n,alphar,alphai,beta,vl,&ldvl,vr,&ldvr,work,&lwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,b,alphar,alphai,beta,vl,&ldvl,vr,&ldvr,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNNNi",capi_alphar_tmp,capi_alphai_tmp,capi_beta_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_beta_tmp == NULL) ... else of beta*/
+  /* End of cleaning variable beta */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=8*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+  }  /*if (capi_alphar_tmp == NULL) ... else of alphar*/
+  /* End of cleaning variable alphar */
+  }  /*if (capi_alphai_tmp == NULL) ... else of alphai*/
+  /* End of cleaning variable alphai */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(b,0)==shape(b,1))*/
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of dggev ********************************/
+
+/*********************************** cggev ***********************************/
+static char doc_f2py_rout_flapack_cggev[] = "\
+alpha,beta,vl,vr,info = cggev(a,b,[compute_vl,compute_vr,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``cggev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"b : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n\n"
+"\nReturns\n-------\n"
+"alpha : rank-1 array('F') with bounds (n)\n"
+"beta : rank-1 array('F') with bounds (n)\n"
+"vl : rank-2 array('F') with bounds (ldvl,n)\n"
+"vr : rank-2 array('F') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(cggev,CGGEV)(char*,char*,int*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int* ); */
+static PyObject *f2py_rout_flapack_cggev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_float*,int*,complex_float*,int*,complex_float*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *alpha = NULL;
+  npy_intp alpha_Dims[1] = {-1};
+  const int alpha_Rank = 1;
+  PyArrayObject *capi_alpha_tmp = NULL;
+  int capi_alpha_intent = 0;
+  complex_float *beta = NULL;
+  npy_intp beta_Dims[1] = {-1};
+  const int beta_Rank = 1;
+  PyArrayObject *capi_beta_tmp = NULL;
+  int capi_beta_intent = 0;
+  complex_float *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  complex_float *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  float *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","compute_vl","compute_vr","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOii:flapack.cggev",\
+    capi_kwlist,&a_capi,&b_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cggev to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.cggev to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(b,0)==shape(b,1),"shape(b,0)==shape(b,1)","2nd argument b") {
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.cggev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","cggev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.cggev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","cggev:compute_vl=%d",compute_vl) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable alpha */
+  alpha_Dims[0]=n;
+  capi_alpha_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_alpha_tmp = array_from_pyobj(NPY_CFLOAT,alpha_Dims,alpha_Rank,capi_alpha_intent,Py_None);
+  if (capi_alpha_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `alpha' of flapack.cggev to C/Fortran array" );
+  } else {
+    alpha = (complex_float *)(PyArray_DATA(capi_alpha_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cggev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=2*n,"lwork>=2*n","3rd keyword lwork","cggev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cggev to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=8 * n;
+  capi_rwork_intent |= F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_FLOAT,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.cggev to C/Fortran array" );
+  } else {
+    rwork = (float *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable beta */
+  beta_Dims[0]=n;
+  capi_beta_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_beta_tmp = array_from_pyobj(NPY_CFLOAT,beta_Dims,beta_Rank,capi_beta_intent,Py_None);
+  if (capi_beta_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `beta' of flapack.cggev to C/Fortran array" );
+  } else {
+    beta = (complex_float *)(PyArray_DATA(capi_beta_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_CFLOAT,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.cggev to C/Fortran array" );
+  } else {
+    vr = (complex_float *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_CFLOAT,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.cggev to C/Fortran array" );
+  } else {
+    vl = (complex_float *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,b,&n,alpha,beta,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,b,alpha,beta,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNNi",capi_alpha_tmp,capi_beta_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+  }  /*if (capi_beta_tmp == NULL) ... else of beta*/
+  /* End of cleaning variable beta */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=2*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_alpha_tmp == NULL) ... else of alpha*/
+  /* End of cleaning variable alpha */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+  } /*CHECKARRAY(shape(b,0)==shape(b,1))*/
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of cggev ********************************/
+
+/*********************************** zggev ***********************************/
+static char doc_f2py_rout_flapack_zggev[] = "\
+alpha,beta,vl,vr,info = zggev(a,b,[compute_vl,compute_vr,lwork,overwrite_a,overwrite_b])\n\nWrapper for ``zggev``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"b : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"compute_vl : input int, optional\n    Default: 1\n"
+"compute_vr : input int, optional\n    Default: 1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 2*n\n"
+"\nReturns\n-------\n"
+"alpha : rank-1 array('D') with bounds (n)\n"
+"beta : rank-1 array('D') with bounds (n)\n"
+"vl : rank-2 array('D') with bounds (ldvl,n)\n"
+"vr : rank-2 array('D') with bounds (ldvr,n)\n"
+"info : int";
+/* extern void F_FUNC(zggev,ZGGEV)(char*,char*,int*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int* ); */
+static PyObject *f2py_rout_flapack_zggev(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_double*,int*,complex_double*,int*,complex_double*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int compute_vl = 0;
+  PyObject *compute_vl_capi = Py_None;
+  int compute_vr = 0;
+  PyObject *compute_vr_capi = Py_None;
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *alpha = NULL;
+  npy_intp alpha_Dims[1] = {-1};
+  const int alpha_Rank = 1;
+  PyArrayObject *capi_alpha_tmp = NULL;
+  int capi_alpha_intent = 0;
+  complex_double *beta = NULL;
+  npy_intp beta_Dims[1] = {-1};
+  const int beta_Rank = 1;
+  PyArrayObject *capi_beta_tmp = NULL;
+  int capi_beta_intent = 0;
+  complex_double *vl = NULL;
+  npy_intp vl_Dims[2] = {-1, -1};
+  const int vl_Rank = 2;
+  PyArrayObject *capi_vl_tmp = NULL;
+  int capi_vl_intent = 0;
+  int ldvl = 0;
+  complex_double *vr = NULL;
+  npy_intp vr_Dims[2] = {-1, -1};
+  const int vr_Rank = 2;
+  PyArrayObject *capi_vr_tmp = NULL;
+  int capi_vr_intent = 0;
+  int ldvr = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  double *rwork = NULL;
+  npy_intp rwork_Dims[1] = {-1};
+  const int rwork_Rank = 1;
+  PyArrayObject *capi_rwork_tmp = NULL;
+  int capi_rwork_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","b","compute_vl","compute_vr","lwork","overwrite_a","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOii:flapack.zggev",\
+    capi_kwlist,&a_capi,&b_capi,&compute_vl_capi,&compute_vr_capi,&lwork_capi,&capi_overwrite_a,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zggev to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.zggev to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(b,0)==shape(b,1),"shape(b,0)==shape(b,1)","2nd argument b") {
+  /* Processing variable compute_vr */
+  if (compute_vr_capi == Py_None) compute_vr = 1; else
+    f2py_success = int_from_pyobj(&compute_vr,compute_vr_capi,"flapack.zggev() 2nd keyword (compute_vr) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vr==1||compute_vr==0,"compute_vr==1||compute_vr==0","2nd keyword compute_vr","zggev:compute_vr=%d",compute_vr) {
+  /* Processing variable compute_vl */
+  if (compute_vl_capi == Py_None) compute_vl = 1; else
+    f2py_success = int_from_pyobj(&compute_vl,compute_vl_capi,"flapack.zggev() 1st keyword (compute_vl) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(compute_vl==1||compute_vl==0,"compute_vl==1||compute_vl==0","1st keyword compute_vl","zggev:compute_vl=%d",compute_vl) {
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable ldvr */
+  ldvr = (compute_vr?n:1);
+  /* Processing variable alpha */
+  alpha_Dims[0]=n;
+  capi_alpha_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_alpha_tmp = array_from_pyobj(NPY_CDOUBLE,alpha_Dims,alpha_Rank,capi_alpha_intent,Py_None);
+  if (capi_alpha_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `alpha' of flapack.zggev to C/Fortran array" );
+  } else {
+    alpha = (complex_double *)(PyArray_DATA(capi_alpha_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 2*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zggev() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=2*n,"lwork>=2*n","3rd keyword lwork","zggev:lwork=%d",lwork) {
+  /* Processing variable ldvl */
+  ldvl = (compute_vl?n:1);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zggev to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable rwork */
+  rwork_Dims[0]=8 * n;
+  capi_rwork_intent |= F2PY_INTENT_HIDE;
+  capi_rwork_tmp = array_from_pyobj(NPY_DOUBLE,rwork_Dims,rwork_Rank,capi_rwork_intent,Py_None);
+  if (capi_rwork_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `rwork' of flapack.zggev to C/Fortran array" );
+  } else {
+    rwork = (double *)(PyArray_DATA(capi_rwork_tmp));
+
+  /* Processing variable beta */
+  beta_Dims[0]=n;
+  capi_beta_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_beta_tmp = array_from_pyobj(NPY_CDOUBLE,beta_Dims,beta_Rank,capi_beta_intent,Py_None);
+  if (capi_beta_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `beta' of flapack.zggev to C/Fortran array" );
+  } else {
+    beta = (complex_double *)(PyArray_DATA(capi_beta_tmp));
+
+  /* Processing variable vr */
+  vr_Dims[0]=ldvr,vr_Dims[1]=n;
+  capi_vr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vr_tmp = array_from_pyobj(NPY_CDOUBLE,vr_Dims,vr_Rank,capi_vr_intent,Py_None);
+  if (capi_vr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vr' of flapack.zggev to C/Fortran array" );
+  } else {
+    vr = (complex_double *)(PyArray_DATA(capi_vr_tmp));
+
+  /* Processing variable vl */
+  vl_Dims[0]=ldvl,vl_Dims[1]=n;
+  capi_vl_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_vl_tmp = array_from_pyobj(NPY_CDOUBLE,vl_Dims,vl_Rank,capi_vl_intent,Py_None);
+  if (capi_vl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `vl' of flapack.zggev to C/Fortran array" );
+  } else {
+    vl = (complex_double *)(PyArray_DATA(capi_vl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {(*f2py_func)((compute_vl?"V":"N"),(compute_vr?"V":"N"),&n,a,&n,b,&n,alpha,beta,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);} ;
+        /*(*f2py_func)(&compute_vl,&compute_vr,&n,a,b,alpha,beta,vl,&ldvl,vr,&ldvr,work,&lwork,rwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNNi",capi_alpha_tmp,capi_beta_tmp,capi_vl_tmp,capi_vr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_vl_tmp == NULL) ... else of vl*/
+  /* End of cleaning variable vl */
+  }  /*if (capi_vr_tmp == NULL) ... else of vr*/
+  /* End of cleaning variable vr */
+  }  /*if (capi_beta_tmp == NULL) ... else of beta*/
+  /* End of cleaning variable beta */
+    Py_XDECREF(capi_rwork_tmp);
+  }  /*if (capi_rwork_tmp == NULL) ... else of rwork*/
+  /* End of cleaning variable rwork */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldvl */
+  } /*CHECKSCALAR(lwork>=2*n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_alpha_tmp == NULL) ... else of alpha*/
+  /* End of cleaning variable alpha */
+  /* End of cleaning variable ldvr */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(compute_vl==1||compute_vl==0)*/
+  } /*if (f2py_success) of compute_vl*/
+  /* End of cleaning variable compute_vl */
+  } /*CHECKSCALAR(compute_vr==1||compute_vr==0)*/
+  } /*if (f2py_success) of compute_vr*/
+  /* End of cleaning variable compute_vr */
+  } /*CHECKARRAY(shape(b,0)==shape(b,1))*/
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of zggev ********************************/
+
+/*********************************** sgetrf ***********************************/
+static char doc_f2py_rout_flapack_sgetrf[] = "\
+lu,piv,info = sgetrf(a,[overwrite_a])\n\nWrapper for ``sgetrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('f') with bounds (m,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(sgetrf,SGETRF)(int*,int*,float*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgetrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:flapack.sgetrf",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgetrf to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable piv */
+  piv_Dims[0]=MIN(m,n);
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.sgetrf to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;(*f2py_func)(&m,&n,a,&m,piv,&info);for(i=0,n=MIN(m,n);i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&m,&n,a,piv,&info);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_piv_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgetrf *******************************/
+
+/*********************************** dgetrf ***********************************/
+static char doc_f2py_rout_flapack_dgetrf[] = "\
+lu,piv,info = dgetrf(a,[overwrite_a])\n\nWrapper for ``dgetrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('d') with bounds (m,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(dgetrf,DGETRF)(int*,int*,double*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgetrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:flapack.dgetrf",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgetrf to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable piv */
+  piv_Dims[0]=MIN(m,n);
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.dgetrf to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;(*f2py_func)(&m,&n,a,&m,piv,&info);for(i=0,n=MIN(m,n);i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&m,&n,a,piv,&info);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_piv_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgetrf *******************************/
+
+/*********************************** cgetrf ***********************************/
+static char doc_f2py_rout_flapack_cgetrf[] = "\
+lu,piv,info = cgetrf(a,[overwrite_a])\n\nWrapper for ``cgetrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('F') with bounds (m,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(cgetrf,CGETRF)(int*,int*,complex_float*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgetrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_float*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:flapack.cgetrf",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgetrf to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable piv */
+  piv_Dims[0]=MIN(m,n);
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.cgetrf to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;(*f2py_func)(&m,&n,a,&m,piv,&info);for(i=0,n=MIN(m,n);i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&m,&n,a,piv,&info);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_piv_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgetrf *******************************/
+
+/*********************************** zgetrf ***********************************/
+static char doc_f2py_rout_flapack_zgetrf[] = "\
+lu,piv,info = zgetrf(a,[overwrite_a])\n\nWrapper for ``zgetrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"lu : rank-2 array('D') with bounds (m,n) and a storage\n"
+"piv : rank-1 array('i') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(zgetrf,ZGETRF)(int*,int*,complex_double*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgetrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_double*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|i:flapack.zgetrf",\
+    capi_kwlist,&a_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgetrf to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable piv */
+  piv_Dims[0]=MIN(m,n);
+  capi_piv_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,Py_None);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `piv' of flapack.zgetrf to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;(*f2py_func)(&m,&n,a,&m,piv,&info);for(i=0,n=MIN(m,n);i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&m,&n,a,piv,&info);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_piv_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgetrf *******************************/
+
+/*********************************** spotrf ***********************************/
+static char doc_f2py_rout_flapack_spotrf[] = "\
+c,info = spotrf(a,[lower,clean,overwrite_a])\n\nWrapper for ``spotrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"clean : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('f') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(spotrf,SPOTRF)(char*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_spotrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int clean = 0;
+  PyObject *clean_capi = Py_None;
+  static char *capi_kwlist[] = {"a","lower","clean","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.spotrf",\
+    capi_kwlist,&a_capi,&lower_capi,&clean_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.spotrf to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.spotrf() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","spotrf:lower=%d",lower) {
+  /* Processing variable clean */
+  if (clean_capi == Py_None) clean = 1; else
+    f2py_success = int_from_pyobj(&clean,clean_capi,"flapack.spotrf() 2nd keyword (clean) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(clean==0||clean==1,"clean==0||clean==1","2nd keyword clean","spotrf:clean=%d",clean) {
+  /* Processing variable n */
+  n = shape(a,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,a,&n,&info); if(clean){int i,j;if(lower){for(i=0;i<n;++i) for(j=i+1;j<n;++j) {*(a+j*n+i)=0.0;}} else {for(i=0;i<n;++i) for(j=i+1;j<n;++j) {*(a+i*n+j)=0.0;}}} ;
+        /*(*f2py_func)(&n,a,&info,&lower,&clean);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(clean==0||clean==1)*/
+  } /*if (f2py_success) of clean*/
+  /* End of cleaning variable clean */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of spotrf *******************************/
+
+/*********************************** dpotrf ***********************************/
+static char doc_f2py_rout_flapack_dpotrf[] = "\
+c,info = dpotrf(a,[lower,clean,overwrite_a])\n\nWrapper for ``dpotrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"clean : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('d') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(dpotrf,DPOTRF)(char*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dpotrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int clean = 0;
+  PyObject *clean_capi = Py_None;
+  static char *capi_kwlist[] = {"a","lower","clean","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.dpotrf",\
+    capi_kwlist,&a_capi,&lower_capi,&clean_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dpotrf to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dpotrf() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","dpotrf:lower=%d",lower) {
+  /* Processing variable clean */
+  if (clean_capi == Py_None) clean = 1; else
+    f2py_success = int_from_pyobj(&clean,clean_capi,"flapack.dpotrf() 2nd keyword (clean) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(clean==0||clean==1,"clean==0||clean==1","2nd keyword clean","dpotrf:clean=%d",clean) {
+  /* Processing variable n */
+  n = shape(a,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,a,&n,&info); if(clean){int i,j;if(lower){for(i=0;i<n;++i) for(j=i+1;j<n;++j) {*(a+j*n+i)=0.0;}} else {for(i=0;i<n;++i) for(j=i+1;j<n;++j) {*(a+i*n+j)=0.0;}}} ;
+        /*(*f2py_func)(&n,a,&info,&lower,&clean);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(clean==0||clean==1)*/
+  } /*if (f2py_success) of clean*/
+  /* End of cleaning variable clean */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dpotrf *******************************/
+
+/*********************************** cpotrf ***********************************/
+static char doc_f2py_rout_flapack_cpotrf[] = "\
+c,info = cpotrf(a,[lower,clean,overwrite_a])\n\nWrapper for ``cpotrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"clean : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('F') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(cpotrf,CPOTRF)(char*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cpotrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int clean = 0;
+  PyObject *clean_capi = Py_None;
+  static char *capi_kwlist[] = {"a","lower","clean","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.cpotrf",\
+    capi_kwlist,&a_capi,&lower_capi,&clean_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cpotrf to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.cpotrf() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","cpotrf:lower=%d",lower) {
+  /* Processing variable clean */
+  if (clean_capi == Py_None) clean = 1; else
+    f2py_success = int_from_pyobj(&clean,clean_capi,"flapack.cpotrf() 2nd keyword (clean) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(clean==0||clean==1,"clean==0||clean==1","2nd keyword clean","cpotrf:clean=%d",clean) {
+  /* Processing variable n */
+  n = shape(a,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,a,&n,&info); if(clean){int i,j,k;if(lower){for(i=0;i<n;++i) for(j=i+1;j<n;++j) {k=j*n+i;(*(a+k)).r=(*(a+k)).i=0.0;}} else {for(i=0;i<n;++i) for(j=i+1;j<n;++j) {k=i*n+j;(*(a+k)).r=(*(a+k)).i=0.0;}}} ;
+        /*(*f2py_func)(&n,a,&info,&lower,&clean);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(clean==0||clean==1)*/
+  } /*if (f2py_success) of clean*/
+  /* End of cleaning variable clean */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cpotrf *******************************/
+
+/*********************************** zpotrf ***********************************/
+static char doc_f2py_rout_flapack_zpotrf[] = "\
+c,info = zpotrf(a,[lower,clean,overwrite_a])\n\nWrapper for ``zpotrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"clean : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"c : rank-2 array('D') with bounds (n,n) and a storage\n"
+"info : int";
+/* extern void F_FUNC(zpotrf,ZPOTRF)(char*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zpotrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int clean = 0;
+  PyObject *clean_capi = Py_None;
+  static char *capi_kwlist[] = {"a","lower","clean","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.zpotrf",\
+    capi_kwlist,&a_capi,&lower_capi,&clean_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zpotrf to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zpotrf() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","zpotrf:lower=%d",lower) {
+  /* Processing variable clean */
+  if (clean_capi == Py_None) clean = 1; else
+    f2py_success = int_from_pyobj(&clean,clean_capi,"flapack.zpotrf() 2nd keyword (clean) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(clean==0||clean==1,"clean==0||clean==1","2nd keyword clean","zpotrf:clean=%d",clean) {
+  /* Processing variable n */
+  n = shape(a,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,a,&n,&info); if(clean){int i,j,k;if(lower){for(i=0;i<n;++i) for(j=i+1;j<n;++j) {k=j*n+i;(*(a+k)).r=(*(a+k)).i=0.0;}} else {for(i=0;i<n;++i) for(j=i+1;j<n;++j) {k=i*n+j;(*(a+k)).r=(*(a+k)).i=0.0;}}} ;
+        /*(*f2py_func)(&n,a,&info,&lower,&clean);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_a_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(clean==0||clean==1)*/
+  } /*if (f2py_success) of clean*/
+  /* End of cleaning variable clean */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zpotrf *******************************/
+
+/*********************************** sgetrs ***********************************/
+static char doc_f2py_rout_flapack_sgetrs[] = "\
+x,info = sgetrs(lu,piv,b,[trans,overwrite_b])\n\nWrapper for ``sgetrs``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('f') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"b : input rank-2 array('f') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('f') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(sgetrs,SGETRS)(char*,int*,int*,float*,int*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgetrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,float*,int*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  float *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  static char *capi_kwlist[] = {"lu","piv","b","trans","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|Oi:flapack.sgetrs",\
+    capi_kwlist,&lu_capi,&piv_capi,&b_capi,&trans_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN;
+  capi_lu_tmp = array_from_pyobj(NPY_FLOAT,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.sgetrs to C/Fortran array" );
+  } else {
+    lu = (float *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"flapack.sgetrs() 1st keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","1st keyword trans","sgetrs:trans=%d",trans) {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `b' of flapack.sgetrs to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(b,0),"shape(lu,0)==shape(b,0)","3rd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.sgetrs to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)((trans?(trans==2?"C":"T"):"N"),&n,&nrhs,lu,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,lu,piv,b,&info,&trans);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(lu,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  if((PyObject *)capi_lu_tmp!=lu_capi) {
+    Py_XDECREF(capi_lu_tmp); }
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgetrs *******************************/
+
+/*********************************** dgetrs ***********************************/
+static char doc_f2py_rout_flapack_dgetrs[] = "\
+x,info = dgetrs(lu,piv,b,[trans,overwrite_b])\n\nWrapper for ``dgetrs``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('d') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"b : input rank-2 array('d') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('d') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(dgetrs,DGETRS)(char*,int*,int*,double*,int*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgetrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,double*,int*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  double *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  static char *capi_kwlist[] = {"lu","piv","b","trans","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|Oi:flapack.dgetrs",\
+    capi_kwlist,&lu_capi,&piv_capi,&b_capi,&trans_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN;
+  capi_lu_tmp = array_from_pyobj(NPY_DOUBLE,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.dgetrs to C/Fortran array" );
+  } else {
+    lu = (double *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"flapack.dgetrs() 1st keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","1st keyword trans","dgetrs:trans=%d",trans) {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `b' of flapack.dgetrs to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(b,0),"shape(lu,0)==shape(b,0)","3rd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.dgetrs to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)((trans?(trans==2?"C":"T"):"N"),&n,&nrhs,lu,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,lu,piv,b,&info,&trans);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(lu,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  if((PyObject *)capi_lu_tmp!=lu_capi) {
+    Py_XDECREF(capi_lu_tmp); }
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgetrs *******************************/
+
+/*********************************** cgetrs ***********************************/
+static char doc_f2py_rout_flapack_cgetrs[] = "\
+x,info = cgetrs(lu,piv,b,[trans,overwrite_b])\n\nWrapper for ``cgetrs``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('F') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"b : input rank-2 array('F') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('F') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(cgetrs,CGETRS)(char*,int*,int*,complex_float*,int*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgetrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_float*,int*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_float *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  static char *capi_kwlist[] = {"lu","piv","b","trans","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|Oi:flapack.cgetrs",\
+    capi_kwlist,&lu_capi,&piv_capi,&b_capi,&trans_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN;
+  capi_lu_tmp = array_from_pyobj(NPY_CFLOAT,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.cgetrs to C/Fortran array" );
+  } else {
+    lu = (complex_float *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"flapack.cgetrs() 1st keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","1st keyword trans","cgetrs:trans=%d",trans) {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `b' of flapack.cgetrs to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(b,0),"shape(lu,0)==shape(b,0)","3rd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.cgetrs to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)((trans?(trans==2?"C":"T"):"N"),&n,&nrhs,lu,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,lu,piv,b,&info,&trans);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(lu,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  if((PyObject *)capi_lu_tmp!=lu_capi) {
+    Py_XDECREF(capi_lu_tmp); }
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgetrs *******************************/
+
+/*********************************** zgetrs ***********************************/
+static char doc_f2py_rout_flapack_zgetrs[] = "\
+x,info = zgetrs(lu,piv,b,[trans,overwrite_b])\n\nWrapper for ``zgetrs``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('D') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"b : input rank-2 array('D') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"trans : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('D') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(zgetrs,ZGETRS)(char*,int*,int*,complex_double*,int*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgetrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_double*,int*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_double *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int trans = 0;
+  PyObject *trans_capi = Py_None;
+  static char *capi_kwlist[] = {"lu","piv","b","trans","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|Oi:flapack.zgetrs",\
+    capi_kwlist,&lu_capi,&piv_capi,&b_capi,&trans_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN;
+  capi_lu_tmp = array_from_pyobj(NPY_CDOUBLE,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.zgetrs to C/Fortran array" );
+  } else {
+    lu = (complex_double *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable trans */
+  if (trans_capi == Py_None) trans = 0; else
+    f2py_success = int_from_pyobj(&trans,trans_capi,"flapack.zgetrs() 1st keyword (trans) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(trans>=0 && trans <=2,"trans>=0 && trans <=2","1st keyword trans","zgetrs:trans=%d",trans) {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 3rd argument `b' of flapack.zgetrs to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(b,0),"shape(lu,0)==shape(b,0)","3rd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.zgetrs to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)((trans?(trans==2?"C":"T"):"N"),&n,&nrhs,lu,&n,piv,b,&n,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,&nrhs,lu,piv,b,&info,&trans);*/
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(lu,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(trans>=0 && trans <=2)*/
+  } /*if (f2py_success) of trans*/
+  /* End of cleaning variable trans */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  if((PyObject *)capi_lu_tmp!=lu_capi) {
+    Py_XDECREF(capi_lu_tmp); }
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgetrs *******************************/
+
+/*********************************** spotrs ***********************************/
+static char doc_f2py_rout_flapack_spotrs[] = "\
+x,info = spotrs(c,b,[lower,overwrite_b])\n\nWrapper for ``spotrs``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('f') with bounds (n,n)\n"
+"b : input rank-2 array('f') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('f') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(spotrs,SPOTRS)(char*,int*,int*,float*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_spotrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,float*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","b","lower","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.spotrs",\
+    capi_kwlist,&c_capi,&b_capi,&lower_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.spotrs() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","spotrs:lower=%d",lower) {
+  /* Processing variable c */
+  ;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_FLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.spotrs to C/Fortran array" );
+  } else {
+    c = (float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.spotrs to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(b,0),"shape(c,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,c,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,c,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(c,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of spotrs *******************************/
+
+/*********************************** dpotrs ***********************************/
+static char doc_f2py_rout_flapack_dpotrs[] = "\
+x,info = dpotrs(c,b,[lower,overwrite_b])\n\nWrapper for ``dpotrs``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('d') with bounds (n,n)\n"
+"b : input rank-2 array('d') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('d') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(dpotrs,DPOTRS)(char*,int*,int*,double*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dpotrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,double*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","b","lower","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.dpotrs",\
+    capi_kwlist,&c_capi,&b_capi,&lower_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dpotrs() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","dpotrs:lower=%d",lower) {
+  /* Processing variable c */
+  ;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.dpotrs to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.dpotrs to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(b,0),"shape(c,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,c,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,c,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(c,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dpotrs *******************************/
+
+/*********************************** cpotrs ***********************************/
+static char doc_f2py_rout_flapack_cpotrs[] = "\
+x,info = cpotrs(c,b,[lower,overwrite_b])\n\nWrapper for ``cpotrs``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('F') with bounds (n,n)\n"
+"b : input rank-2 array('F') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('F') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(cpotrs,CPOTRS)(char*,int*,int*,complex_float*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cpotrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_float*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","b","lower","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.cpotrs",\
+    capi_kwlist,&c_capi,&b_capi,&lower_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.cpotrs() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","cpotrs:lower=%d",lower) {
+  /* Processing variable c */
+  ;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_CFLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.cpotrs to C/Fortran array" );
+  } else {
+    c = (complex_float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.cpotrs to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(b,0),"shape(c,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,c,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,c,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(c,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cpotrs *******************************/
+
+/*********************************** zpotrs ***********************************/
+static char doc_f2py_rout_flapack_zpotrs[] = "\
+x,info = zpotrs(c,b,[lower,overwrite_b])\n\nWrapper for ``zpotrs``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('D') with bounds (n,n)\n"
+"b : input rank-2 array('D') with bounds (n,nrhs)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_b : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"x : rank-2 array('D') with bounds (n,nrhs) and b storage\n"
+"info : int";
+/* extern void F_FUNC(zpotrs,ZPOTRS)(char*,int*,int*,complex_double*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zpotrs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,int*,complex_double*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int nrhs = 0;
+  complex_double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  PyObject *c_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[2] = {-1, -1};
+  const int b_Rank = 2;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  int capi_overwrite_b = 0;
+  PyObject *b_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","b","lower","overwrite_b",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.zpotrs",\
+    capi_kwlist,&c_capi,&b_capi,&lower_capi,&capi_overwrite_b))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zpotrs() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","zpotrs:lower=%d",lower) {
+  /* Processing variable c */
+  ;
+  capi_c_intent |= F2PY_INTENT_IN;
+  capi_c_tmp = array_from_pyobj(NPY_CDOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.zpotrs to C/Fortran array" );
+  } else {
+    c = (complex_double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+  /* Processing variable b */
+  capi_b_intent |= (capi_overwrite_b?0:F2PY_INTENT_COPY);
+  b_Dims[0]=n;
+  capi_b_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `b' of flapack.zpotrs to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(b,0),"shape(c,0)==shape(b,0)","2nd argument b") {
+  /* Processing variable nrhs */
+  nrhs = shape(b,1);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,&nrhs,c,&n,b,&n,&info) ;
+        /*(*f2py_func)(&n,&nrhs,c,b,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_b_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nrhs */
+  } /*CHECKARRAY(shape(c,0)==shape(b,0))*/
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  if((PyObject *)capi_c_tmp!=c_capi) {
+    Py_XDECREF(capi_c_tmp); }
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zpotrs *******************************/
+
+/*********************************** sgetri ***********************************/
+static char doc_f2py_rout_flapack_sgetri[] = "\
+inv_a,info = sgetri(lu,piv,[lwork,overwrite_lu])\n\nWrapper for ``sgetri``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('f') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_lu : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('f') with bounds (n,n) and lu storage\n"
+"info : int";
+/* extern void F_FUNC(sgetri,SGETRI)(int*,float*,int*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgetri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  int capi_overwrite_lu = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"lu","piv","lwork","overwrite_lu",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.sgetri",\
+    capi_kwlist,&lu_capi,&piv_capi,&lwork_capi,&capi_overwrite_lu))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  capi_lu_intent |= (capi_overwrite_lu?0:F2PY_INTENT_COPY);
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_lu_tmp = array_from_pyobj(NPY_FLOAT,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.sgetri to C/Fortran array" );
+  } else {
+    lu = (float *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sgetri() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","sgetri:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sgetri to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.sgetri to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)(&n,lu,&n,piv,work,&lwork,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,lu,piv,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_lu_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgetri *******************************/
+
+/*********************************** dgetri ***********************************/
+static char doc_f2py_rout_flapack_dgetri[] = "\
+inv_a,info = dgetri(lu,piv,[lwork,overwrite_lu])\n\nWrapper for ``dgetri``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('d') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_lu : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('d') with bounds (n,n) and lu storage\n"
+"info : int";
+/* extern void F_FUNC(dgetri,DGETRI)(int*,double*,int*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgetri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  int capi_overwrite_lu = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"lu","piv","lwork","overwrite_lu",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.dgetri",\
+    capi_kwlist,&lu_capi,&piv_capi,&lwork_capi,&capi_overwrite_lu))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  capi_lu_intent |= (capi_overwrite_lu?0:F2PY_INTENT_COPY);
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_lu_tmp = array_from_pyobj(NPY_DOUBLE,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.dgetri to C/Fortran array" );
+  } else {
+    lu = (double *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dgetri() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","dgetri:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dgetri to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.dgetri to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)(&n,lu,&n,piv,work,&lwork,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,lu,piv,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_lu_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgetri *******************************/
+
+/*********************************** cgetri ***********************************/
+static char doc_f2py_rout_flapack_cgetri[] = "\
+inv_a,info = cgetri(lu,piv,[lwork,overwrite_lu])\n\nWrapper for ``cgetri``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('F') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_lu : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('F') with bounds (n,n) and lu storage\n"
+"info : int";
+/* extern void F_FUNC(cgetri,CGETRI)(int*,complex_float*,int*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgetri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,int*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  int capi_overwrite_lu = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"lu","piv","lwork","overwrite_lu",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.cgetri",\
+    capi_kwlist,&lu_capi,&piv_capi,&lwork_capi,&capi_overwrite_lu))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  capi_lu_intent |= (capi_overwrite_lu?0:F2PY_INTENT_COPY);
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_lu_tmp = array_from_pyobj(NPY_CFLOAT,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.cgetri to C/Fortran array" );
+  } else {
+    lu = (complex_float *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cgetri() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","cgetri:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cgetri to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.cgetri to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)(&n,lu,&n,piv,work,&lwork,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,lu,piv,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_lu_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgetri *******************************/
+
+/*********************************** zgetri ***********************************/
+static char doc_f2py_rout_flapack_zgetri[] = "\
+inv_a,info = zgetri(lu,piv,[lwork,overwrite_lu])\n\nWrapper for ``zgetri``.\
+\n\nParameters\n----------\n"
+"lu : input rank-2 array('D') with bounds (n,n)\n"
+"piv : input rank-1 array('i') with bounds (n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_lu : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: 3*n\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('D') with bounds (n,n) and lu storage\n"
+"info : int";
+/* extern void F_FUNC(zgetri,ZGETRI)(int*,complex_double*,int*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgetri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,int*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *lu = NULL;
+  npy_intp lu_Dims[2] = {-1, -1};
+  const int lu_Rank = 2;
+  PyArrayObject *capi_lu_tmp = NULL;
+  int capi_lu_intent = 0;
+  int capi_overwrite_lu = 0;
+  PyObject *lu_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"lu","piv","lwork","overwrite_lu",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oi:flapack.zgetri",\
+    capi_kwlist,&lu_capi,&piv_capi,&lwork_capi,&capi_overwrite_lu))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lu */
+  capi_lu_intent |= (capi_overwrite_lu?0:F2PY_INTENT_COPY);
+  ;
+  capi_lu_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_lu_tmp = array_from_pyobj(NPY_CDOUBLE,lu_Dims,lu_Rank,capi_lu_intent,lu_capi);
+  if (capi_lu_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `lu' of flapack.zgetri to C/Fortran array" );
+  } else {
+    lu = (complex_double *)(PyArray_DATA(capi_lu_tmp));
+
+  CHECKARRAY(shape(lu,0)==shape(lu,1),"shape(lu,0)==shape(lu,1)","1st argument lu") {
+  /* Processing variable n */
+  n = shape(lu,0);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = 3*n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zgetri() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","zgetri:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zgetri to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable piv */
+  piv_Dims[0]=n;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.zgetri to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;for(i=0;i<n;++piv[i++]);(*f2py_func)(&n,lu,&n,piv,work,&lwork,&info);for(i=0;i<n;--piv[i++]);} ;
+        /*(*f2py_func)(&n,lu,piv,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_lu_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(lu,0)==shape(lu,1))*/
+  }  /*if (capi_lu_tmp == NULL) ... else of lu*/
+  /* End of cleaning variable lu */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgetri *******************************/
+
+/*********************************** spotri ***********************************/
+static char doc_f2py_rout_flapack_spotri[] = "\
+inv_a,info = spotri(c,[lower,overwrite_c])\n\nWrapper for ``spotri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('f') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(spotri,SPOTRI)(char*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_spotri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.spotri",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.spotri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","spotri:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_C|F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_FLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.spotri to C/Fortran array" );
+  } else {
+    c = (float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of spotri *******************************/
+
+/*********************************** dpotri ***********************************/
+static char doc_f2py_rout_flapack_dpotri[] = "\
+inv_a,info = dpotri(c,[lower,overwrite_c])\n\nWrapper for ``dpotri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('d') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(dpotri,DPOTRI)(char*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dpotri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.dpotri",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dpotri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","dpotri:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_C|F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.dpotri to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dpotri *******************************/
+
+/*********************************** cpotri ***********************************/
+static char doc_f2py_rout_flapack_cpotri[] = "\
+inv_a,info = cpotri(c,[lower,overwrite_c])\n\nWrapper for ``cpotri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('F') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(cpotri,CPOTRI)(char*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cpotri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.cpotri",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.cpotri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","cpotri:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_C|F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CFLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.cpotri to C/Fortran array" );
+  } else {
+    c = (complex_float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cpotri *******************************/
+
+/*********************************** zpotri ***********************************/
+static char doc_f2py_rout_flapack_zpotri[] = "\
+inv_a,info = zpotri(c,[lower,overwrite_c])\n\nWrapper for ``zpotri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_a : rank-2 array('D') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(zpotri,ZPOTRI)(char*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zpotri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.zpotri",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zpotri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","zpotri:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_C|F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CDOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.zpotri to C/Fortran array" );
+  } else {
+    c = (complex_double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zpotri *******************************/
+
+/*********************************** strtri ***********************************/
+static char doc_f2py_rout_flapack_strtri[] = "\
+inv_c,info = strtri(c,[lower,unitdiag,overwrite_c])\n\nWrapper for ``strtri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_c : rank-2 array('f') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(strtri,STRTRI)(char*,char*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_strtri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","unitdiag","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.strtri",\
+    capi_kwlist,&c_capi,&lower_capi,&unitdiag_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.strtri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","strtri:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"flapack.strtri() 2nd keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","2nd keyword unitdiag","strtri:unitdiag=%d",unitdiag) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_FLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.strtri to C/Fortran array" );
+  } else {
+    c = (float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(unitdiag?"U":"N"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of strtri *******************************/
+
+/*********************************** dtrtri ***********************************/
+static char doc_f2py_rout_flapack_dtrtri[] = "\
+inv_c,info = dtrtri(c,[lower,unitdiag,overwrite_c])\n\nWrapper for ``dtrtri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_c : rank-2 array('d') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(dtrtri,DTRTRI)(char*,char*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dtrtri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","unitdiag","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.dtrtri",\
+    capi_kwlist,&c_capi,&lower_capi,&unitdiag_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dtrtri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","dtrtri:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"flapack.dtrtri() 2nd keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","2nd keyword unitdiag","dtrtri:unitdiag=%d",unitdiag) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.dtrtri to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(unitdiag?"U":"N"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dtrtri *******************************/
+
+/*********************************** ctrtri ***********************************/
+static char doc_f2py_rout_flapack_ctrtri[] = "\
+inv_c,info = ctrtri(c,[lower,unitdiag,overwrite_c])\n\nWrapper for ``ctrtri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_c : rank-2 array('F') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(ctrtri,CTRTRI)(char*,char*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_ctrtri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","unitdiag","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.ctrtri",\
+    capi_kwlist,&c_capi,&lower_capi,&unitdiag_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.ctrtri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","ctrtri:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"flapack.ctrtri() 2nd keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","2nd keyword unitdiag","ctrtri:unitdiag=%d",unitdiag) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CFLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.ctrtri to C/Fortran array" );
+  } else {
+    c = (complex_float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(unitdiag?"U":"N"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of ctrtri *******************************/
+
+/*********************************** ztrtri ***********************************/
+static char doc_f2py_rout_flapack_ztrtri[] = "\
+inv_c,info = ztrtri(c,[lower,unitdiag,overwrite_c])\n\nWrapper for ``ztrtri``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"unitdiag : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"inv_c : rank-2 array('D') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(ztrtri,ZTRTRI)(char*,char*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_ztrtri(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,char*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  int unitdiag = 0;
+  PyObject *unitdiag_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","unitdiag","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.ztrtri",\
+    capi_kwlist,&c_capi,&lower_capi,&unitdiag_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.ztrtri() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","ztrtri:lower=%d",lower) {
+  /* Processing variable unitdiag */
+  if (unitdiag_capi == Py_None) unitdiag = 0; else
+    f2py_success = int_from_pyobj(&unitdiag,unitdiag_capi,"flapack.ztrtri() 2nd keyword (unitdiag) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(unitdiag==0||unitdiag==1,"unitdiag==0||unitdiag==1","2nd keyword unitdiag","ztrtri:unitdiag=%d",unitdiag) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CDOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.ztrtri to C/Fortran array" );
+  } else {
+    c = (complex_double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),(unitdiag?"U":"N"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower,&unitdiag);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(unitdiag==0||unitdiag==1)*/
+  } /*if (f2py_success) of unitdiag*/
+  /* End of cleaning variable unitdiag */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of ztrtri *******************************/
+
+/*********************************** sgeqrf ***********************************/
+static char doc_f2py_rout_flapack_sgeqrf[] = "\
+qr,tau,info = sgeqrf(a,[lwork,overwrite_a])\n\nWrapper for ``sgeqrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"qr : rank-2 array('f') with bounds (m,n) and a storage\n"
+"tau : rank-1 array('f') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(sgeqrf,SGEQRF)(int*,int*,float*,int*,float*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgeqrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,int*,float*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.sgeqrf",\
+    capi_kwlist,&a_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgeqrf to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable tau */
+  tau_Dims[0]=MIN(m,n);
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_FLOAT,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.sgeqrf to C/Fortran array" );
+  } else {
+    tau = (float *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sgeqrf() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","sgeqrf:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sgeqrf to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,a,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgeqrf *******************************/
+
+/*********************************** dgeqrf ***********************************/
+static char doc_f2py_rout_flapack_dgeqrf[] = "\
+qr,tau,info = dgeqrf(a,[lwork,overwrite_a])\n\nWrapper for ``dgeqrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"qr : rank-2 array('d') with bounds (m,n) and a storage\n"
+"tau : rank-1 array('d') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(dgeqrf,DGEQRF)(int*,int*,double*,int*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgeqrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,int*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.dgeqrf",\
+    capi_kwlist,&a_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgeqrf to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable tau */
+  tau_Dims[0]=MIN(m,n);
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_DOUBLE,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.dgeqrf to C/Fortran array" );
+  } else {
+    tau = (double *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dgeqrf() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","dgeqrf:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dgeqrf to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,a,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgeqrf *******************************/
+
+/*********************************** cgeqrf ***********************************/
+static char doc_f2py_rout_flapack_cgeqrf[] = "\
+qr,tau,info = cgeqrf(a,[lwork,overwrite_a])\n\nWrapper for ``cgeqrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"qr : rank-2 array('F') with bounds (m,n) and a storage\n"
+"tau : rank-1 array('F') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(cgeqrf,CGEQRF)(int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgeqrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.cgeqrf",\
+    capi_kwlist,&a_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgeqrf to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable tau */
+  tau_Dims[0]=MIN(m,n);
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_CFLOAT,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.cgeqrf to C/Fortran array" );
+  } else {
+    tau = (complex_float *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cgeqrf() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","cgeqrf:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cgeqrf to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,a,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgeqrf *******************************/
+
+/*********************************** zgeqrf ***********************************/
+static char doc_f2py_rout_flapack_zgeqrf[] = "\
+qr,tau,info = zgeqrf(a,[lwork,overwrite_a])\n\nWrapper for ``zgeqrf``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"qr : rank-2 array('D') with bounds (m,n) and a storage\n"
+"tau : rank-1 array('D') with bounds (MIN(m,n))\n"
+"info : int";
+/* extern void F_FUNC(zgeqrf,ZGEQRF)(int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgeqrf(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.zgeqrf",\
+    capi_kwlist,&a_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgeqrf to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable m */
+  m = shape(a,0);
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable tau */
+  tau_Dims[0]=MIN(m,n);
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_CDOUBLE,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.zgeqrf to C/Fortran array" );
+  } else {
+    tau = (complex_double *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zgeqrf() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","zgeqrf:lwork=%d",lwork) {
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zgeqrf to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,a,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgeqrf *******************************/
+
+/*********************************** sorgqr ***********************************/
+static char doc_f2py_rout_flapack_sorgqr[] = "\
+q,info = sorgqr(qr,tau,[lwork,overwrite_qr,overwrite_tau])\n\nWrapper for ``sorgqr``.\
+\n\nParameters\n----------\n"
+"qr : input rank-2 array('f') with bounds (m,n)\n"
+"tau : input rank-1 array('f') with bounds (k)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_qr : input int, optional\n    Default: 0\n"
+"overwrite_tau : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"q : rank-2 array('f') with bounds (m,n) and qr storage\n"
+"info : int";
+/* extern void F_FUNC(sorgqr,SORGQR)(int*,int*,int*,float*,int*,float*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sorgqr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,float*,int*,float*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  float *qr = NULL;
+  npy_intp qr_Dims[2] = {-1, -1};
+  const int qr_Rank = 2;
+  PyArrayObject *capi_qr_tmp = NULL;
+  int capi_qr_intent = 0;
+  int capi_overwrite_qr = 0;
+  PyObject *qr_capi = Py_None;
+  float *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  int capi_overwrite_tau = 1;
+  PyObject *tau_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"qr","tau","lwork","overwrite_qr","overwrite_tau",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.sorgqr",\
+    capi_kwlist,&qr_capi,&tau_capi,&lwork_capi,&capi_overwrite_qr,&capi_overwrite_tau))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable qr */
+  capi_qr_intent |= (capi_overwrite_qr?0:F2PY_INTENT_COPY);
+  ;
+  capi_qr_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_qr_tmp = array_from_pyobj(NPY_FLOAT,qr_Dims,qr_Rank,capi_qr_intent,qr_capi);
+  if (capi_qr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `qr' of flapack.sorgqr to C/Fortran array" );
+  } else {
+    qr = (float *)(PyArray_DATA(capi_qr_tmp));
+
+  /* Processing variable m */
+  m = shape(qr,0);
+  /* Processing variable n */
+  n = shape(qr,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sorgqr() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","sorgqr:lwork=%d",lwork) {
+  /* Processing variable k */
+  k = MIN(m,n);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sorgqr to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable tau */
+  capi_tau_intent |= (capi_overwrite_tau?0:F2PY_INTENT_COPY);
+  tau_Dims[0]=k;
+  capi_tau_intent |= F2PY_INTENT_IN;
+  capi_tau_tmp = array_from_pyobj(NPY_FLOAT,tau_Dims,tau_Rank,capi_tau_intent,tau_capi);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `tau' of flapack.sorgqr to C/Fortran array" );
+  } else {
+    tau = (float *)(PyArray_DATA(capi_tau_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&k,qr,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,&k,qr,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_qr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_tau_tmp!=tau_capi) {
+    Py_XDECREF(capi_tau_tmp); }
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable k */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  }  /*if (capi_qr_tmp == NULL) ... else of qr*/
+  /* End of cleaning variable qr */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sorgqr *******************************/
+
+/*********************************** dorgqr ***********************************/
+static char doc_f2py_rout_flapack_dorgqr[] = "\
+q,info = dorgqr(qr,tau,[lwork,overwrite_qr,overwrite_tau])\n\nWrapper for ``dorgqr``.\
+\n\nParameters\n----------\n"
+"qr : input rank-2 array('d') with bounds (m,n)\n"
+"tau : input rank-1 array('d') with bounds (k)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_qr : input int, optional\n    Default: 0\n"
+"overwrite_tau : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"q : rank-2 array('d') with bounds (m,n) and qr storage\n"
+"info : int";
+/* extern void F_FUNC(dorgqr,DORGQR)(int*,int*,int*,double*,int*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dorgqr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,double*,int*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  double *qr = NULL;
+  npy_intp qr_Dims[2] = {-1, -1};
+  const int qr_Rank = 2;
+  PyArrayObject *capi_qr_tmp = NULL;
+  int capi_qr_intent = 0;
+  int capi_overwrite_qr = 0;
+  PyObject *qr_capi = Py_None;
+  double *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  int capi_overwrite_tau = 1;
+  PyObject *tau_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"qr","tau","lwork","overwrite_qr","overwrite_tau",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.dorgqr",\
+    capi_kwlist,&qr_capi,&tau_capi,&lwork_capi,&capi_overwrite_qr,&capi_overwrite_tau))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable qr */
+  capi_qr_intent |= (capi_overwrite_qr?0:F2PY_INTENT_COPY);
+  ;
+  capi_qr_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_qr_tmp = array_from_pyobj(NPY_DOUBLE,qr_Dims,qr_Rank,capi_qr_intent,qr_capi);
+  if (capi_qr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `qr' of flapack.dorgqr to C/Fortran array" );
+  } else {
+    qr = (double *)(PyArray_DATA(capi_qr_tmp));
+
+  /* Processing variable m */
+  m = shape(qr,0);
+  /* Processing variable n */
+  n = shape(qr,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dorgqr() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","dorgqr:lwork=%d",lwork) {
+  /* Processing variable k */
+  k = MIN(m,n);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dorgqr to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable tau */
+  capi_tau_intent |= (capi_overwrite_tau?0:F2PY_INTENT_COPY);
+  tau_Dims[0]=k;
+  capi_tau_intent |= F2PY_INTENT_IN;
+  capi_tau_tmp = array_from_pyobj(NPY_DOUBLE,tau_Dims,tau_Rank,capi_tau_intent,tau_capi);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `tau' of flapack.dorgqr to C/Fortran array" );
+  } else {
+    tau = (double *)(PyArray_DATA(capi_tau_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&k,qr,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,&k,qr,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_qr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_tau_tmp!=tau_capi) {
+    Py_XDECREF(capi_tau_tmp); }
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable k */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  }  /*if (capi_qr_tmp == NULL) ... else of qr*/
+  /* End of cleaning variable qr */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dorgqr *******************************/
+
+/*********************************** cungqr ***********************************/
+static char doc_f2py_rout_flapack_cungqr[] = "\
+q,info = cungqr(qr,tau,[lwork,overwrite_qr,overwrite_tau])\n\nWrapper for ``cungqr``.\
+\n\nParameters\n----------\n"
+"qr : input rank-2 array('F') with bounds (m,n)\n"
+"tau : input rank-1 array('F') with bounds (k)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_qr : input int, optional\n    Default: 0\n"
+"overwrite_tau : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"q : rank-2 array('F') with bounds (m,n) and qr storage\n"
+"info : int";
+/* extern void F_FUNC(cungqr,CUNGQR)(int*,int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cungqr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  complex_float *qr = NULL;
+  npy_intp qr_Dims[2] = {-1, -1};
+  const int qr_Rank = 2;
+  PyArrayObject *capi_qr_tmp = NULL;
+  int capi_qr_intent = 0;
+  int capi_overwrite_qr = 0;
+  PyObject *qr_capi = Py_None;
+  complex_float *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  int capi_overwrite_tau = 1;
+  PyObject *tau_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"qr","tau","lwork","overwrite_qr","overwrite_tau",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.cungqr",\
+    capi_kwlist,&qr_capi,&tau_capi,&lwork_capi,&capi_overwrite_qr,&capi_overwrite_tau))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable qr */
+  capi_qr_intent |= (capi_overwrite_qr?0:F2PY_INTENT_COPY);
+  ;
+  capi_qr_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_qr_tmp = array_from_pyobj(NPY_CFLOAT,qr_Dims,qr_Rank,capi_qr_intent,qr_capi);
+  if (capi_qr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `qr' of flapack.cungqr to C/Fortran array" );
+  } else {
+    qr = (complex_float *)(PyArray_DATA(capi_qr_tmp));
+
+  /* Processing variable m */
+  m = shape(qr,0);
+  /* Processing variable n */
+  n = shape(qr,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cungqr() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","cungqr:lwork=%d",lwork) {
+  /* Processing variable k */
+  k = MIN(m,n);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cungqr to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable tau */
+  capi_tau_intent |= (capi_overwrite_tau?0:F2PY_INTENT_COPY);
+  tau_Dims[0]=k;
+  capi_tau_intent |= F2PY_INTENT_IN;
+  capi_tau_tmp = array_from_pyobj(NPY_CFLOAT,tau_Dims,tau_Rank,capi_tau_intent,tau_capi);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `tau' of flapack.cungqr to C/Fortran array" );
+  } else {
+    tau = (complex_float *)(PyArray_DATA(capi_tau_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&k,qr,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,&k,qr,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_qr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_tau_tmp!=tau_capi) {
+    Py_XDECREF(capi_tau_tmp); }
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable k */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  }  /*if (capi_qr_tmp == NULL) ... else of qr*/
+  /* End of cleaning variable qr */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cungqr *******************************/
+
+/*********************************** zungqr ***********************************/
+static char doc_f2py_rout_flapack_zungqr[] = "\
+q,info = zungqr(qr,tau,[lwork,overwrite_qr,overwrite_tau])\n\nWrapper for ``zungqr``.\
+\n\nParameters\n----------\n"
+"qr : input rank-2 array('D') with bounds (m,n)\n"
+"tau : input rank-1 array('D') with bounds (k)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_qr : input int, optional\n    Default: 0\n"
+"overwrite_tau : input int, optional\n    Default: 1\n"
+"lwork : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"q : rank-2 array('D') with bounds (m,n) and qr storage\n"
+"info : int";
+/* extern void F_FUNC(zungqr,ZUNGQR)(int*,int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zungqr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  int n = 0;
+  int k = 0;
+  complex_double *qr = NULL;
+  npy_intp qr_Dims[2] = {-1, -1};
+  const int qr_Rank = 2;
+  PyArrayObject *capi_qr_tmp = NULL;
+  int capi_qr_intent = 0;
+  int capi_overwrite_qr = 0;
+  PyObject *qr_capi = Py_None;
+  complex_double *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  int capi_overwrite_tau = 1;
+  PyObject *tau_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"qr","tau","lwork","overwrite_qr","overwrite_tau",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|Oii:flapack.zungqr",\
+    capi_kwlist,&qr_capi,&tau_capi,&lwork_capi,&capi_overwrite_qr,&capi_overwrite_tau))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable qr */
+  capi_qr_intent |= (capi_overwrite_qr?0:F2PY_INTENT_COPY);
+  ;
+  capi_qr_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_qr_tmp = array_from_pyobj(NPY_CDOUBLE,qr_Dims,qr_Rank,capi_qr_intent,qr_capi);
+  if (capi_qr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `qr' of flapack.zungqr to C/Fortran array" );
+  } else {
+    qr = (complex_double *)(PyArray_DATA(capi_qr_tmp));
+
+  /* Processing variable m */
+  m = shape(qr,0);
+  /* Processing variable n */
+  n = shape(qr,1);
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = n; else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zungqr() 1st keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=n,"lwork>=n","1st keyword lwork","zungqr:lwork=%d",lwork) {
+  /* Processing variable k */
+  k = MIN(m,n);
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_CACHE|F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zungqr to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable tau */
+  capi_tau_intent |= (capi_overwrite_tau?0:F2PY_INTENT_COPY);
+  tau_Dims[0]=k;
+  capi_tau_intent |= F2PY_INTENT_IN;
+  capi_tau_tmp = array_from_pyobj(NPY_CDOUBLE,tau_Dims,tau_Rank,capi_tau_intent,tau_capi);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `tau' of flapack.zungqr to C/Fortran array" );
+  } else {
+    tau = (complex_double *)(PyArray_DATA(capi_tau_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&k,qr,&m,tau,work,&lwork,&info) ;
+        /*(*f2py_func)(&m,&n,&k,qr,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_qr_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_tau_tmp!=tau_capi) {
+    Py_XDECREF(capi_tau_tmp); }
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable k */
+  } /*CHECKSCALAR(lwork>=n)*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  }  /*if (capi_qr_tmp == NULL) ... else of qr*/
+  /* End of cleaning variable qr */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zungqr *******************************/
+
+/*********************************** sgehrd ***********************************/
+static char doc_f2py_rout_flapack_sgehrd[] = "\
+ht,tau,info = sgehrd(a,[lo,hi,lwork,overwrite_a])\n\nWrapper for ``sgehrd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"lo : input int, optional\n    Default: 0\n"
+"hi : input int, optional\n    Default: n-1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: MAX(n,1)\n"
+"\nReturns\n-------\n"
+"ht : rank-2 array('f') with bounds (n,n) and a storage\n"
+"tau : rank-1 array('f') with bounds (n - 1)\n"
+"info : int";
+/* extern void F_FUNC(sgehrd,SGEHRD)(int*,int*,int*,float*,int*,float*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_sgehrd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,float*,int*,float*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int lo = 0;
+  PyObject *lo_capi = Py_None;
+  int hi = 0;
+  PyObject *hi_capi = Py_None;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  float *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lo","hi","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.sgehrd",\
+    capi_kwlist,&a_capi,&lo_capi,&hi_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgehrd to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lo */
+  if (lo_capi == Py_None) lo = 0; else
+    f2py_success = int_from_pyobj(&lo,lo_capi,"flapack.sgehrd() 1st keyword (lo) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable hi */
+  if (hi_capi == Py_None) hi = n-1; else
+    f2py_success = int_from_pyobj(&hi,hi_capi,"flapack.sgehrd() 2nd keyword (hi) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = MAX(n,1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.sgehrd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=MAX(n,1),"lwork>=MAX(n,1)","3rd keyword lwork","sgehrd:lwork=%d",lwork) {
+  /* Processing variable tau */
+  tau_Dims[0]=n - 1;
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_FLOAT,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.sgehrd to C/Fortran array" );
+  } else {
+    tau = (float *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.sgehrd to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { hi++; lo++; (*f2py_func)(&n,&lo,&hi,a,&n,tau,work,&lwork,&info); } ;
+        /*(*f2py_func)(&n,&lo,&hi,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  } /*CHECKSCALAR(lwork>=MAX(n,1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  } /*if (f2py_success) of hi*/
+  /* End of cleaning variable hi */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of lo*/
+  /* End of cleaning variable lo */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgehrd *******************************/
+
+/*********************************** dgehrd ***********************************/
+static char doc_f2py_rout_flapack_dgehrd[] = "\
+ht,tau,info = dgehrd(a,[lo,hi,lwork,overwrite_a])\n\nWrapper for ``dgehrd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"lo : input int, optional\n    Default: 0\n"
+"hi : input int, optional\n    Default: n-1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: MAX(n,1)\n"
+"\nReturns\n-------\n"
+"ht : rank-2 array('d') with bounds (n,n) and a storage\n"
+"tau : rank-1 array('d') with bounds (n - 1)\n"
+"info : int";
+/* extern void F_FUNC(dgehrd,DGEHRD)(int*,int*,int*,double*,int*,double*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dgehrd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,double*,int*,double*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int lo = 0;
+  PyObject *lo_capi = Py_None;
+  int hi = 0;
+  PyObject *hi_capi = Py_None;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  double *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lo","hi","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.dgehrd",\
+    capi_kwlist,&a_capi,&lo_capi,&hi_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgehrd to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lo */
+  if (lo_capi == Py_None) lo = 0; else
+    f2py_success = int_from_pyobj(&lo,lo_capi,"flapack.dgehrd() 1st keyword (lo) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable hi */
+  if (hi_capi == Py_None) hi = n-1; else
+    f2py_success = int_from_pyobj(&hi,hi_capi,"flapack.dgehrd() 2nd keyword (hi) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = MAX(n,1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.dgehrd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=MAX(n,1),"lwork>=MAX(n,1)","3rd keyword lwork","dgehrd:lwork=%d",lwork) {
+  /* Processing variable tau */
+  tau_Dims[0]=n - 1;
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_DOUBLE,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.dgehrd to C/Fortran array" );
+  } else {
+    tau = (double *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.dgehrd to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { hi++; lo++; (*f2py_func)(&n,&lo,&hi,a,&n,tau,work,&lwork,&info); } ;
+        /*(*f2py_func)(&n,&lo,&hi,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  } /*CHECKSCALAR(lwork>=MAX(n,1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  } /*if (f2py_success) of hi*/
+  /* End of cleaning variable hi */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of lo*/
+  /* End of cleaning variable lo */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgehrd *******************************/
+
+/*********************************** cgehrd ***********************************/
+static char doc_f2py_rout_flapack_cgehrd[] = "\
+ht,tau,info = cgehrd(a,[lo,hi,lwork,overwrite_a])\n\nWrapper for ``cgehrd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"lo : input int, optional\n    Default: 0\n"
+"hi : input int, optional\n    Default: n-1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: MAX(n,1)\n"
+"\nReturns\n-------\n"
+"ht : rank-2 array('F') with bounds (n,n) and a storage\n"
+"tau : rank-1 array('F') with bounds (n - 1)\n"
+"info : int";
+/* extern void F_FUNC(cgehrd,CGEHRD)(int*,int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_cgehrd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,complex_float*,int*,complex_float*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int lo = 0;
+  PyObject *lo_capi = Py_None;
+  int hi = 0;
+  PyObject *hi_capi = Py_None;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_float *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lo","hi","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.cgehrd",\
+    capi_kwlist,&a_capi,&lo_capi,&hi_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgehrd to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lo */
+  if (lo_capi == Py_None) lo = 0; else
+    f2py_success = int_from_pyobj(&lo,lo_capi,"flapack.cgehrd() 1st keyword (lo) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable hi */
+  if (hi_capi == Py_None) hi = n-1; else
+    f2py_success = int_from_pyobj(&hi,hi_capi,"flapack.cgehrd() 2nd keyword (hi) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = MAX(n,1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.cgehrd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=MAX(n,1),"lwork>=MAX(n,1)","3rd keyword lwork","cgehrd:lwork=%d",lwork) {
+  /* Processing variable tau */
+  tau_Dims[0]=n - 1;
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_CFLOAT,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.cgehrd to C/Fortran array" );
+  } else {
+    tau = (complex_float *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.cgehrd to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { hi++; lo++; (*f2py_func)(&n,&lo,&hi,a,&n,tau,work,&lwork,&info); } ;
+        /*(*f2py_func)(&n,&lo,&hi,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  } /*CHECKSCALAR(lwork>=MAX(n,1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  } /*if (f2py_success) of hi*/
+  /* End of cleaning variable hi */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of lo*/
+  /* End of cleaning variable lo */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgehrd *******************************/
+
+/*********************************** zgehrd ***********************************/
+static char doc_f2py_rout_flapack_zgehrd[] = "\
+ht,tau,info = zgehrd(a,[lo,hi,lwork,overwrite_a])\n\nWrapper for ``zgehrd``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"lo : input int, optional\n    Default: 0\n"
+"hi : input int, optional\n    Default: n-1\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"lwork : input int, optional\n    Default: MAX(n,1)\n"
+"\nReturns\n-------\n"
+"ht : rank-2 array('D') with bounds (n,n) and a storage\n"
+"tau : rank-1 array('D') with bounds (n - 1)\n"
+"info : int";
+/* extern void F_FUNC(zgehrd,ZGEHRD)(int*,int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zgehrd(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,complex_double*,int*,complex_double*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int lo = 0;
+  PyObject *lo_capi = Py_None;
+  int hi = 0;
+  PyObject *hi_capi = Py_None;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  complex_double *tau = NULL;
+  npy_intp tau_Dims[1] = {-1};
+  const int tau_Rank = 1;
+  PyArrayObject *capi_tau_tmp = NULL;
+  int capi_tau_intent = 0;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  int lwork = 0;
+  PyObject *lwork_capi = Py_None;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","lo","hi","lwork","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOOi:flapack.zgehrd",\
+    capi_kwlist,&a_capi,&lo_capi,&hi_capi,&lwork_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgehrd to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  CHECKARRAY(shape(a,0)==shape(a,1),"shape(a,0)==shape(a,1)","1st argument a") {
+  /* Processing variable lo */
+  if (lo_capi == Py_None) lo = 0; else
+    f2py_success = int_from_pyobj(&lo,lo_capi,"flapack.zgehrd() 1st keyword (lo) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+  /* Processing variable n */
+  n = shape(a,0);
+  /* Processing variable hi */
+  if (hi_capi == Py_None) hi = n-1; else
+    f2py_success = int_from_pyobj(&hi,hi_capi,"flapack.zgehrd() 2nd keyword (hi) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lwork */
+  if (lwork_capi == Py_None) lwork = MAX(n,1); else
+    f2py_success = int_from_pyobj(&lwork,lwork_capi,"flapack.zgehrd() 3rd keyword (lwork) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lwork>=MAX(n,1),"lwork>=MAX(n,1)","3rd keyword lwork","zgehrd:lwork=%d",lwork) {
+  /* Processing variable tau */
+  tau_Dims[0]=n - 1;
+  capi_tau_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_tau_tmp = array_from_pyobj(NPY_CDOUBLE,tau_Dims,tau_Rank,capi_tau_intent,Py_None);
+  if (capi_tau_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `tau' of flapack.zgehrd to C/Fortran array" );
+  } else {
+    tau = (complex_double *)(PyArray_DATA(capi_tau_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=lwork;
+  capi_work_intent |= F2PY_INTENT_HIDE;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,Py_None);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `work' of flapack.zgehrd to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { hi++; lo++; (*f2py_func)(&n,&lo,&hi,a,&n,tau,work,&lwork,&info); } ;
+        /*(*f2py_func)(&n,&lo,&hi,a,tau,work,&lwork,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNi",capi_a_tmp,capi_tau_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_work_tmp);
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_tau_tmp == NULL) ... else of tau*/
+  /* End of cleaning variable tau */
+  } /*CHECKSCALAR(lwork>=MAX(n,1))*/
+  } /*if (f2py_success) of lwork*/
+  /* End of cleaning variable lwork */
+  } /*if (f2py_success) of hi*/
+  /* End of cleaning variable hi */
+  /* End of cleaning variable n */
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of lo*/
+  /* End of cleaning variable lo */
+  } /*CHECKARRAY(shape(a,0)==shape(a,1))*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgehrd *******************************/
+
+/*********************************** sgebal ***********************************/
+static char doc_f2py_rout_flapack_sgebal[] = "\
+ba,lo,hi,pivscale,info = sgebal(a,[scale,permute,overwrite_a])\n\nWrapper for ``sgebal``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"scale : input int, optional\n    Default: 0\n"
+"permute : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ba : rank-2 array('f') with bounds (m,n) and a storage\n"
+"lo : int\n"
+"hi : int\n"
+"pivscale : rank-1 array('f') with bounds (n)\n"
+"info : int";
+/* extern void F_FUNC(sgebal,SGEBAL)(char*,int*,float*,int*,int*,int*,float*,int* ); */
+static PyObject *f2py_rout_flapack_sgebal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,float*,int*,int*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int scale = 0;
+  PyObject *scale_capi = Py_None;
+  int permute = 0;
+  PyObject *permute_capi = Py_None;
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int lo = 0;
+  int hi = 0;
+  float *pivscale = NULL;
+  npy_intp pivscale_Dims[1] = {-1};
+  const int pivscale_Rank = 1;
+  PyArrayObject *capi_pivscale_tmp = NULL;
+  int capi_pivscale_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","scale","permute","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.sgebal",\
+    capi_kwlist,&a_capi,&scale_capi,&permute_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.sgebal to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable scale */
+  if (scale_capi == Py_None) scale = 0; else
+    f2py_success = int_from_pyobj(&scale,scale_capi,"flapack.sgebal() 1st keyword (scale) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lo */
+  /* Processing variable hi */
+  /* Processing variable permute */
+  if (permute_capi == Py_None) permute = 0; else
+    f2py_success = int_from_pyobj(&permute,permute_capi,"flapack.sgebal() 2nd keyword (permute) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable pivscale */
+  pivscale_Dims[0]=n;
+  capi_pivscale_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_pivscale_tmp = array_from_pyobj(NPY_FLOAT,pivscale_Dims,pivscale_Rank,capi_pivscale_intent,Py_None);
+  if (capi_pivscale_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `pivscale' of flapack.sgebal to C/Fortran array" );
+  } else {
+    pivscale = (float *)(PyArray_DATA(capi_pivscale_tmp));
+
+  /* Processing variable m */
+  m = shape(a,0);
+  CHECKSCALAR(m>=n,"m>=n","hidden m","sgebal:m=%d",m) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { (*f2py_func)((permute?(scale?"B":"P"):(scale?"S":"N")),&n,a,&m,&lo,&hi,pivscale,&info); hi--; lo--; } ;
+        /*(*f2py_func)(&scale,&permute,&n,a,&m,&lo,&hi,pivscale,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiiNi",capi_a_tmp,lo,hi,capi_pivscale_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(m>=n)*/
+  /* End of cleaning variable m */
+  }  /*if (capi_pivscale_tmp == NULL) ... else of pivscale*/
+  /* End of cleaning variable pivscale */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of permute*/
+  /* End of cleaning variable permute */
+  /* End of cleaning variable hi */
+  /* End of cleaning variable lo */
+  } /*if (f2py_success) of scale*/
+  /* End of cleaning variable scale */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sgebal *******************************/
+
+/*********************************** dgebal ***********************************/
+static char doc_f2py_rout_flapack_dgebal[] = "\
+ba,lo,hi,pivscale,info = dgebal(a,[scale,permute,overwrite_a])\n\nWrapper for ``dgebal``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"scale : input int, optional\n    Default: 0\n"
+"permute : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ba : rank-2 array('d') with bounds (m,n) and a storage\n"
+"lo : int\n"
+"hi : int\n"
+"pivscale : rank-1 array('d') with bounds (n)\n"
+"info : int";
+/* extern void F_FUNC(dgebal,DGEBAL)(char*,int*,double*,int*,int*,int*,double*,int* ); */
+static PyObject *f2py_rout_flapack_dgebal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,double*,int*,int*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int scale = 0;
+  PyObject *scale_capi = Py_None;
+  int permute = 0;
+  PyObject *permute_capi = Py_None;
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int lo = 0;
+  int hi = 0;
+  double *pivscale = NULL;
+  npy_intp pivscale_Dims[1] = {-1};
+  const int pivscale_Rank = 1;
+  PyArrayObject *capi_pivscale_tmp = NULL;
+  int capi_pivscale_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","scale","permute","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.dgebal",\
+    capi_kwlist,&a_capi,&scale_capi,&permute_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dgebal to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable scale */
+  if (scale_capi == Py_None) scale = 0; else
+    f2py_success = int_from_pyobj(&scale,scale_capi,"flapack.dgebal() 1st keyword (scale) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lo */
+  /* Processing variable hi */
+  /* Processing variable permute */
+  if (permute_capi == Py_None) permute = 0; else
+    f2py_success = int_from_pyobj(&permute,permute_capi,"flapack.dgebal() 2nd keyword (permute) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable pivscale */
+  pivscale_Dims[0]=n;
+  capi_pivscale_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_pivscale_tmp = array_from_pyobj(NPY_DOUBLE,pivscale_Dims,pivscale_Rank,capi_pivscale_intent,Py_None);
+  if (capi_pivscale_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `pivscale' of flapack.dgebal to C/Fortran array" );
+  } else {
+    pivscale = (double *)(PyArray_DATA(capi_pivscale_tmp));
+
+  /* Processing variable m */
+  m = shape(a,0);
+  CHECKSCALAR(m>=n,"m>=n","hidden m","dgebal:m=%d",m) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { (*f2py_func)((permute?(scale?"B":"P"):(scale?"S":"N")),&n,a,&m,&lo,&hi,pivscale,&info); hi--; lo--; } ;
+        /*(*f2py_func)(&scale,&permute,&n,a,&m,&lo,&hi,pivscale,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiiNi",capi_a_tmp,lo,hi,capi_pivscale_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(m>=n)*/
+  /* End of cleaning variable m */
+  }  /*if (capi_pivscale_tmp == NULL) ... else of pivscale*/
+  /* End of cleaning variable pivscale */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of permute*/
+  /* End of cleaning variable permute */
+  /* End of cleaning variable hi */
+  /* End of cleaning variable lo */
+  } /*if (f2py_success) of scale*/
+  /* End of cleaning variable scale */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dgebal *******************************/
+
+/*********************************** cgebal ***********************************/
+static char doc_f2py_rout_flapack_cgebal[] = "\
+ba,lo,hi,pivscale,info = cgebal(a,[scale,permute,overwrite_a])\n\nWrapper for ``cgebal``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"scale : input int, optional\n    Default: 0\n"
+"permute : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ba : rank-2 array('F') with bounds (m,n) and a storage\n"
+"lo : int\n"
+"hi : int\n"
+"pivscale : rank-1 array('f') with bounds (n)\n"
+"info : int";
+/* extern void F_FUNC(cgebal,CGEBAL)(char*,int*,complex_float*,int*,int*,int*,float*,int* ); */
+static PyObject *f2py_rout_flapack_cgebal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_float*,int*,int*,int*,float*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int scale = 0;
+  PyObject *scale_capi = Py_None;
+  int permute = 0;
+  PyObject *permute_capi = Py_None;
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int lo = 0;
+  int hi = 0;
+  float *pivscale = NULL;
+  npy_intp pivscale_Dims[1] = {-1};
+  const int pivscale_Rank = 1;
+  PyArrayObject *capi_pivscale_tmp = NULL;
+  int capi_pivscale_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","scale","permute","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.cgebal",\
+    capi_kwlist,&a_capi,&scale_capi,&permute_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.cgebal to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable scale */
+  if (scale_capi == Py_None) scale = 0; else
+    f2py_success = int_from_pyobj(&scale,scale_capi,"flapack.cgebal() 1st keyword (scale) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lo */
+  /* Processing variable hi */
+  /* Processing variable permute */
+  if (permute_capi == Py_None) permute = 0; else
+    f2py_success = int_from_pyobj(&permute,permute_capi,"flapack.cgebal() 2nd keyword (permute) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable pivscale */
+  pivscale_Dims[0]=n;
+  capi_pivscale_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_pivscale_tmp = array_from_pyobj(NPY_FLOAT,pivscale_Dims,pivscale_Rank,capi_pivscale_intent,Py_None);
+  if (capi_pivscale_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `pivscale' of flapack.cgebal to C/Fortran array" );
+  } else {
+    pivscale = (float *)(PyArray_DATA(capi_pivscale_tmp));
+
+  /* Processing variable m */
+  m = shape(a,0);
+  CHECKSCALAR(m>=n,"m>=n","hidden m","cgebal:m=%d",m) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { (*f2py_func)((permute?(scale?"B":"P"):(scale?"S":"N")),&n,a,&m,&lo,&hi,pivscale,&info); hi--; lo--; } ;
+        /*(*f2py_func)(&scale,&permute,&n,a,&m,&lo,&hi,pivscale,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiiNi",capi_a_tmp,lo,hi,capi_pivscale_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(m>=n)*/
+  /* End of cleaning variable m */
+  }  /*if (capi_pivscale_tmp == NULL) ... else of pivscale*/
+  /* End of cleaning variable pivscale */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of permute*/
+  /* End of cleaning variable permute */
+  /* End of cleaning variable hi */
+  /* End of cleaning variable lo */
+  } /*if (f2py_success) of scale*/
+  /* End of cleaning variable scale */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cgebal *******************************/
+
+/*********************************** zgebal ***********************************/
+static char doc_f2py_rout_flapack_zgebal[] = "\
+ba,lo,hi,pivscale,info = zgebal(a,[scale,permute,overwrite_a])\n\nWrapper for ``zgebal``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (m,n)\n"
+"\nOther Parameters\n----------------\n"
+"scale : input int, optional\n    Default: 0\n"
+"permute : input int, optional\n    Default: 0\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ba : rank-2 array('D') with bounds (m,n) and a storage\n"
+"lo : int\n"
+"hi : int\n"
+"pivscale : rank-1 array('d') with bounds (n)\n"
+"info : int";
+/* extern void F_FUNC(zgebal,ZGEBAL)(char*,int*,complex_double*,int*,int*,int*,double*,int* ); */
+static PyObject *f2py_rout_flapack_zgebal(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_double*,int*,int*,int*,double*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int scale = 0;
+  PyObject *scale_capi = Py_None;
+  int permute = 0;
+  PyObject *permute_capi = Py_None;
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int m = 0;
+  int lo = 0;
+  int hi = 0;
+  double *pivscale = NULL;
+  npy_intp pivscale_Dims[1] = {-1};
+  const int pivscale_Rank = 1;
+  PyArrayObject *capi_pivscale_tmp = NULL;
+  int capi_pivscale_intent = 0;
+  int info = 0;
+  static char *capi_kwlist[] = {"a","scale","permute","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OOi:flapack.zgebal",\
+    capi_kwlist,&a_capi,&scale_capi,&permute_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zgebal to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable info */
+  /* Processing variable scale */
+  if (scale_capi == Py_None) scale = 0; else
+    f2py_success = int_from_pyobj(&scale,scale_capi,"flapack.zgebal() 1st keyword (scale) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable lo */
+  /* Processing variable hi */
+  /* Processing variable permute */
+  if (permute_capi == Py_None) permute = 0; else
+    f2py_success = int_from_pyobj(&permute,permute_capi,"flapack.zgebal() 2nd keyword (permute) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable pivscale */
+  pivscale_Dims[0]=n;
+  capi_pivscale_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_pivscale_tmp = array_from_pyobj(NPY_DOUBLE,pivscale_Dims,pivscale_Rank,capi_pivscale_intent,Py_None);
+  if (capi_pivscale_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting hidden `pivscale' of flapack.zgebal to C/Fortran array" );
+  } else {
+    pivscale = (double *)(PyArray_DATA(capi_pivscale_tmp));
+
+  /* Processing variable m */
+  m = shape(a,0);
+  CHECKSCALAR(m>=n,"m>=n","hidden m","zgebal:m=%d",m) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        { (*f2py_func)((permute?(scale?"B":"P"):(scale?"S":"N")),&n,a,&m,&lo,&hi,pivscale,&info); hi--; lo--; } ;
+        /*(*f2py_func)(&scale,&permute,&n,a,&m,&lo,&hi,pivscale,&info);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiiNi",capi_a_tmp,lo,hi,capi_pivscale_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(m>=n)*/
+  /* End of cleaning variable m */
+  }  /*if (capi_pivscale_tmp == NULL) ... else of pivscale*/
+  /* End of cleaning variable pivscale */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of permute*/
+  /* End of cleaning variable permute */
+  /* End of cleaning variable hi */
+  /* End of cleaning variable lo */
+  } /*if (f2py_success) of scale*/
+  /* End of cleaning variable scale */
+  /* End of cleaning variable info */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zgebal *******************************/
+
+/*********************************** slauum ***********************************/
+static char doc_f2py_rout_flapack_slauum[] = "\
+a,info = slauum(c,[lower,overwrite_c])\n\nWrapper for ``slauum``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('f') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('f') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(slauum,SLAUUM)(char*,int*,float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_slauum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.slauum",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.slauum() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","slauum:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_FLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.slauum to C/Fortran array" );
+  } else {
+    c = (float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of slauum *******************************/
+
+/*********************************** dlauum ***********************************/
+static char doc_f2py_rout_flapack_dlauum[] = "\
+a,info = dlauum(c,[lower,overwrite_c])\n\nWrapper for ``dlauum``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('d') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('d') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(dlauum,DLAUUM)(char*,int*,double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dlauum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.dlauum",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.dlauum() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","dlauum:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_DOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.dlauum to C/Fortran array" );
+  } else {
+    c = (double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dlauum *******************************/
+
+/*********************************** clauum ***********************************/
+static char doc_f2py_rout_flapack_clauum[] = "\
+a,info = clauum(c,[lower,overwrite_c])\n\nWrapper for ``clauum``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('F') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('F') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(clauum,CLAUUM)(char*,int*,complex_float*,int*,int* ); */
+static PyObject *f2py_rout_flapack_clauum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_float*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.clauum",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.clauum() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","clauum:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CFLOAT,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.clauum to C/Fortran array" );
+  } else {
+    c = (complex_float *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of clauum *******************************/
+
+/*********************************** zlauum ***********************************/
+static char doc_f2py_rout_flapack_zlauum[] = "\
+a,info = zlauum(c,[lower,overwrite_c])\n\nWrapper for ``zlauum``.\
+\n\nParameters\n----------\n"
+"c : input rank-2 array('D') with bounds (n,n)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_c : input int, optional\n    Default: 0\n"
+"lower : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('D') with bounds (n,n) and c storage\n"
+"info : int";
+/* extern void F_FUNC(zlauum,ZLAUUM)(char*,int*,complex_double*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zlauum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(char*,int*,complex_double*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *c = NULL;
+  npy_intp c_Dims[2] = {-1, -1};
+  const int c_Rank = 2;
+  PyArrayObject *capi_c_tmp = NULL;
+  int capi_c_intent = 0;
+  int capi_overwrite_c = 0;
+  PyObject *c_capi = Py_None;
+  int info = 0;
+  int lower = 0;
+  PyObject *lower_capi = Py_None;
+  static char *capi_kwlist[] = {"c","lower","overwrite_c",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|Oi:flapack.zlauum",\
+    capi_kwlist,&c_capi,&lower_capi,&capi_overwrite_c))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+  /* Processing variable lower */
+  if (lower_capi == Py_None) lower = 0; else
+    f2py_success = int_from_pyobj(&lower,lower_capi,"flapack.zlauum() 1st keyword (lower) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(lower==0||lower==1,"lower==0||lower==1","1st keyword lower","zlauum:lower=%d",lower) {
+  /* Processing variable c */
+  capi_c_intent |= (capi_overwrite_c?0:F2PY_INTENT_COPY);
+  ;
+  capi_c_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_c_tmp = array_from_pyobj(NPY_CDOUBLE,c_Dims,c_Rank,capi_c_intent,c_capi);
+  if (capi_c_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `c' of flapack.zlauum to C/Fortran array" );
+  } else {
+    c = (complex_double *)(PyArray_DATA(capi_c_tmp));
+
+  CHECKARRAY(shape(c,0)==shape(c,1),"shape(c,0)==shape(c,1)","1st argument c") {
+  /* Processing variable n */
+  n = shape(c,0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)((lower?"L":"U"),&n,c,&n,&info) ;
+        /*(*f2py_func)(&n,c,&info,&lower);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Ni",capi_c_tmp,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  } /*CHECKARRAY(shape(c,0)==shape(c,1))*/
+  }  /*if (capi_c_tmp == NULL) ... else of c*/
+  /* End of cleaning variable c */
+  } /*CHECKSCALAR(lower==0||lower==1)*/
+  } /*if (f2py_success) of lower*/
+  /* End of cleaning variable lower */
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zlauum *******************************/
+
+/*********************************** slaswp ***********************************/
+static char doc_f2py_rout_flapack_slaswp[] = "\
+a = slaswp(a,piv,[k1,k2,off,inc,overwrite_a])\n\nWrapper for ``slaswp``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('f') with bounds (nrows,n)\n"
+"piv : input rank-1 array('i') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"k1 : input int, optional\n    Default: 0\n"
+"k2 : input int, optional\n    Default: len(piv)-1\n"
+"off : input int, optional\n    Default: 0\n"
+"inc : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('f') with bounds (nrows,n)";
+/* extern void F_FUNC(slaswp,SLASWP)(int*,float*,int*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_slaswp(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int k1 = 0;
+  PyObject *k1_capi = Py_None;
+  int k2 = 0;
+  PyObject *k2_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  int off = 0;
+  PyObject *off_capi = Py_None;
+  int inc = 0;
+  PyObject *inc_capi = Py_None;
+  int m = 0;
+  static char *capi_kwlist[] = {"a","piv","k1","k2","off","inc","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOi:flapack.slaswp",\
+    capi_kwlist,&a_capi,&piv_capi,&k1_capi,&k2_capi,&off_capi,&inc_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.slaswp to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable k1 */
+  if (k1_capi == Py_None) k1 = 0; else
+    f2py_success = int_from_pyobj(&k1,k1_capi,"flapack.slaswp() 1st keyword (k1) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(0<=k1,"0<=k1","1st keyword k1","slaswp:k1=%d",k1) {
+  /* Processing variable inc */
+  if (inc_capi == Py_None) inc = 1; else
+    f2py_success = int_from_pyobj(&inc,inc_capi,"flapack.slaswp() 4th keyword (inc) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(inc>0||inc<0,"inc>0||inc<0","4th keyword inc","slaswp:inc=%d",inc) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable piv */
+  ;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.slaswp to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  CHECKARRAY(len(piv)<=nrows,"len(piv)<=nrows","2nd argument piv") {
+  /* Processing variable off */
+  if (off_capi == Py_None) off = 0; else
+    f2py_success = int_from_pyobj(&off,off_capi,"flapack.slaswp() 3rd keyword (off) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(off>=0 && off<len(piv),"off>=0 && off<len(piv)","3rd keyword off","slaswp:off=%d",off) {
+  /* Processing variable m */
+  m = (len(piv)-off)/abs(inc);
+  CHECKSCALAR(len(piv)-off>(m-1)*abs(inc),"len(piv)-off>(m-1)*abs(inc)","hidden m","slaswp:m=%d",m) {
+  /* Processing variable k2 */
+  if (k2_capi == Py_None) k2 = len(piv)-1; else
+    f2py_success = int_from_pyobj(&k2,k2_capi,"flapack.slaswp() 2nd keyword (k2) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(k1<=k2 && k2<len(piv)-off,"k1<=k2 && k2<len(piv)-off","2nd keyword k2","slaswp:k2=%d",k2) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;m=len(piv);for(i=0;i<m;++piv[i++]);++k1;++k2; (*f2py_func)(&n,a,&nrows,&k1,&k2,piv+off,&inc); for(i=0;i<m;--piv[i++]);} ;
+        /*(*f2py_func)(&n,a,&nrows,&k1,&k2,piv,&off,&inc,&m);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(k1<=k2 && k2<len(piv)-off)*/
+  } /*if (f2py_success) of k2*/
+  /* End of cleaning variable k2 */
+  } /*CHECKSCALAR(len(piv)-off>(m-1)*abs(inc))*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(off>=0 && off<len(piv))*/
+  } /*if (f2py_success) of off*/
+  /* End of cleaning variable off */
+  } /*CHECKARRAY(len(piv)<=nrows)*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrows */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(inc>0||inc<0)*/
+  } /*if (f2py_success) of inc*/
+  /* End of cleaning variable inc */
+  } /*CHECKSCALAR(0<=k1)*/
+  } /*if (f2py_success) of k1*/
+  /* End of cleaning variable k1 */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of slaswp *******************************/
+
+/*********************************** dlaswp ***********************************/
+static char doc_f2py_rout_flapack_dlaswp[] = "\
+a = dlaswp(a,piv,[k1,k2,off,inc,overwrite_a])\n\nWrapper for ``dlaswp``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('d') with bounds (nrows,n)\n"
+"piv : input rank-1 array('i') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"k1 : input int, optional\n    Default: 0\n"
+"k2 : input int, optional\n    Default: len(piv)-1\n"
+"off : input int, optional\n    Default: 0\n"
+"inc : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('d') with bounds (nrows,n)";
+/* extern void F_FUNC(dlaswp,DLASWP)(int*,double*,int*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_dlaswp(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int k1 = 0;
+  PyObject *k1_capi = Py_None;
+  int k2 = 0;
+  PyObject *k2_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  int off = 0;
+  PyObject *off_capi = Py_None;
+  int inc = 0;
+  PyObject *inc_capi = Py_None;
+  int m = 0;
+  static char *capi_kwlist[] = {"a","piv","k1","k2","off","inc","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOi:flapack.dlaswp",\
+    capi_kwlist,&a_capi,&piv_capi,&k1_capi,&k2_capi,&off_capi,&inc_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_DOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.dlaswp to C/Fortran array" );
+  } else {
+    a = (double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable k1 */
+  if (k1_capi == Py_None) k1 = 0; else
+    f2py_success = int_from_pyobj(&k1,k1_capi,"flapack.dlaswp() 1st keyword (k1) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(0<=k1,"0<=k1","1st keyword k1","dlaswp:k1=%d",k1) {
+  /* Processing variable inc */
+  if (inc_capi == Py_None) inc = 1; else
+    f2py_success = int_from_pyobj(&inc,inc_capi,"flapack.dlaswp() 4th keyword (inc) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(inc>0||inc<0,"inc>0||inc<0","4th keyword inc","dlaswp:inc=%d",inc) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable piv */
+  ;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.dlaswp to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  CHECKARRAY(len(piv)<=nrows,"len(piv)<=nrows","2nd argument piv") {
+  /* Processing variable off */
+  if (off_capi == Py_None) off = 0; else
+    f2py_success = int_from_pyobj(&off,off_capi,"flapack.dlaswp() 3rd keyword (off) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(off>=0 && off<len(piv),"off>=0 && off<len(piv)","3rd keyword off","dlaswp:off=%d",off) {
+  /* Processing variable m */
+  m = (len(piv)-off)/abs(inc);
+  CHECKSCALAR(len(piv)-off>(m-1)*abs(inc),"len(piv)-off>(m-1)*abs(inc)","hidden m","dlaswp:m=%d",m) {
+  /* Processing variable k2 */
+  if (k2_capi == Py_None) k2 = len(piv)-1; else
+    f2py_success = int_from_pyobj(&k2,k2_capi,"flapack.dlaswp() 2nd keyword (k2) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(k1<=k2 && k2<len(piv)-off,"k1<=k2 && k2<len(piv)-off","2nd keyword k2","dlaswp:k2=%d",k2) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;m=len(piv);for(i=0;i<m;++piv[i++]);++k1;++k2; (*f2py_func)(&n,a,&nrows,&k1,&k2,piv+off,&inc); for(i=0;i<m;--piv[i++]);} ;
+        /*(*f2py_func)(&n,a,&nrows,&k1,&k2,piv,&off,&inc,&m);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(k1<=k2 && k2<len(piv)-off)*/
+  } /*if (f2py_success) of k2*/
+  /* End of cleaning variable k2 */
+  } /*CHECKSCALAR(len(piv)-off>(m-1)*abs(inc))*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(off>=0 && off<len(piv))*/
+  } /*if (f2py_success) of off*/
+  /* End of cleaning variable off */
+  } /*CHECKARRAY(len(piv)<=nrows)*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrows */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(inc>0||inc<0)*/
+  } /*if (f2py_success) of inc*/
+  /* End of cleaning variable inc */
+  } /*CHECKSCALAR(0<=k1)*/
+  } /*if (f2py_success) of k1*/
+  /* End of cleaning variable k1 */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of dlaswp *******************************/
+
+/*********************************** claswp ***********************************/
+static char doc_f2py_rout_flapack_claswp[] = "\
+a = claswp(a,piv,[k1,k2,off,inc,overwrite_a])\n\nWrapper for ``claswp``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('F') with bounds (nrows,n)\n"
+"piv : input rank-1 array('i') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"k1 : input int, optional\n    Default: 0\n"
+"k2 : input int, optional\n    Default: len(piv)-1\n"
+"off : input int, optional\n    Default: 0\n"
+"inc : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('F') with bounds (nrows,n)";
+/* extern void F_FUNC(claswp,CLASWP)(int*,complex_float*,int*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_claswp(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,int*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int k1 = 0;
+  PyObject *k1_capi = Py_None;
+  int k2 = 0;
+  PyObject *k2_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  int off = 0;
+  PyObject *off_capi = Py_None;
+  int inc = 0;
+  PyObject *inc_capi = Py_None;
+  int m = 0;
+  static char *capi_kwlist[] = {"a","piv","k1","k2","off","inc","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOi:flapack.claswp",\
+    capi_kwlist,&a_capi,&piv_capi,&k1_capi,&k2_capi,&off_capi,&inc_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CFLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.claswp to C/Fortran array" );
+  } else {
+    a = (complex_float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable k1 */
+  if (k1_capi == Py_None) k1 = 0; else
+    f2py_success = int_from_pyobj(&k1,k1_capi,"flapack.claswp() 1st keyword (k1) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(0<=k1,"0<=k1","1st keyword k1","claswp:k1=%d",k1) {
+  /* Processing variable inc */
+  if (inc_capi == Py_None) inc = 1; else
+    f2py_success = int_from_pyobj(&inc,inc_capi,"flapack.claswp() 4th keyword (inc) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(inc>0||inc<0,"inc>0||inc<0","4th keyword inc","claswp:inc=%d",inc) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable piv */
+  ;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.claswp to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  CHECKARRAY(len(piv)<=nrows,"len(piv)<=nrows","2nd argument piv") {
+  /* Processing variable off */
+  if (off_capi == Py_None) off = 0; else
+    f2py_success = int_from_pyobj(&off,off_capi,"flapack.claswp() 3rd keyword (off) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(off>=0 && off<len(piv),"off>=0 && off<len(piv)","3rd keyword off","claswp:off=%d",off) {
+  /* Processing variable m */
+  m = (len(piv)-off)/abs(inc);
+  CHECKSCALAR(len(piv)-off>(m-1)*abs(inc),"len(piv)-off>(m-1)*abs(inc)","hidden m","claswp:m=%d",m) {
+  /* Processing variable k2 */
+  if (k2_capi == Py_None) k2 = len(piv)-1; else
+    f2py_success = int_from_pyobj(&k2,k2_capi,"flapack.claswp() 2nd keyword (k2) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(k1<=k2 && k2<len(piv)-off,"k1<=k2 && k2<len(piv)-off","2nd keyword k2","claswp:k2=%d",k2) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;m=len(piv);for(i=0;i<m;++piv[i++]);++k1;++k2; (*f2py_func)(&n,a,&nrows,&k1,&k2,piv+off,&inc); for(i=0;i<m;--piv[i++]);} ;
+        /*(*f2py_func)(&n,a,&nrows,&k1,&k2,piv,&off,&inc,&m);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(k1<=k2 && k2<len(piv)-off)*/
+  } /*if (f2py_success) of k2*/
+  /* End of cleaning variable k2 */
+  } /*CHECKSCALAR(len(piv)-off>(m-1)*abs(inc))*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(off>=0 && off<len(piv))*/
+  } /*if (f2py_success) of off*/
+  /* End of cleaning variable off */
+  } /*CHECKARRAY(len(piv)<=nrows)*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrows */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(inc>0||inc<0)*/
+  } /*if (f2py_success) of inc*/
+  /* End of cleaning variable inc */
+  } /*CHECKSCALAR(0<=k1)*/
+  } /*if (f2py_success) of k1*/
+  /* End of cleaning variable k1 */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of claswp *******************************/
+
+/*********************************** zlaswp ***********************************/
+static char doc_f2py_rout_flapack_zlaswp[] = "\
+a = zlaswp(a,piv,[k1,k2,off,inc,overwrite_a])\n\nWrapper for ``zlaswp``.\
+\n\nParameters\n----------\n"
+"a : input rank-2 array('D') with bounds (nrows,n)\n"
+"piv : input rank-1 array('i') with bounds (*)\n"
+"\nOther Parameters\n----------------\n"
+"overwrite_a : input int, optional\n    Default: 0\n"
+"k1 : input int, optional\n    Default: 0\n"
+"k2 : input int, optional\n    Default: len(piv)-1\n"
+"off : input int, optional\n    Default: 0\n"
+"inc : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"a : rank-2 array('D') with bounds (nrows,n)";
+/* extern void F_FUNC(zlaswp,ZLASWP)(int*,complex_double*,int*,int*,int*,int*,int* ); */
+static PyObject *f2py_rout_flapack_zlaswp(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,int*,int*,int*,int*,int* )) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *a = NULL;
+  npy_intp a_Dims[2] = {-1, -1};
+  const int a_Rank = 2;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  int capi_overwrite_a = 0;
+  PyObject *a_capi = Py_None;
+  int nrows = 0;
+  int k1 = 0;
+  PyObject *k1_capi = Py_None;
+  int k2 = 0;
+  PyObject *k2_capi = Py_None;
+  int *piv = NULL;
+  npy_intp piv_Dims[1] = {-1};
+  const int piv_Rank = 1;
+  PyArrayObject *capi_piv_tmp = NULL;
+  int capi_piv_intent = 0;
+  PyObject *piv_capi = Py_None;
+  int off = 0;
+  PyObject *off_capi = Py_None;
+  int inc = 0;
+  PyObject *inc_capi = Py_None;
+  int m = 0;
+  static char *capi_kwlist[] = {"a","piv","k1","k2","off","inc","overwrite_a",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OOOOi:flapack.zlaswp",\
+    capi_kwlist,&a_capi,&piv_capi,&k1_capi,&k2_capi,&off_capi,&inc_capi,&capi_overwrite_a))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  capi_a_intent |= (capi_overwrite_a?0:F2PY_INTENT_COPY);
+  ;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_CDOUBLE,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 1st argument `a' of flapack.zlaswp to C/Fortran array" );
+  } else {
+    a = (complex_double *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable k1 */
+  if (k1_capi == Py_None) k1 = 0; else
+    f2py_success = int_from_pyobj(&k1,k1_capi,"flapack.zlaswp() 1st keyword (k1) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(0<=k1,"0<=k1","1st keyword k1","zlaswp:k1=%d",k1) {
+  /* Processing variable inc */
+  if (inc_capi == Py_None) inc = 1; else
+    f2py_success = int_from_pyobj(&inc,inc_capi,"flapack.zlaswp() 4th keyword (inc) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(inc>0||inc<0,"inc>0||inc<0","4th keyword inc","zlaswp:inc=%d",inc) {
+  /* Processing variable n */
+  n = shape(a,1);
+  /* Processing variable nrows */
+  nrows = shape(a,0);
+  /* Processing variable piv */
+  ;
+  capi_piv_intent |= F2PY_INTENT_IN;
+  capi_piv_tmp = array_from_pyobj(NPY_INT,piv_Dims,piv_Rank,capi_piv_intent,piv_capi);
+  if (capi_piv_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(flapack_error,"failed in converting 2nd argument `piv' of flapack.zlaswp to C/Fortran array" );
+  } else {
+    piv = (int *)(PyArray_DATA(capi_piv_tmp));
+
+  CHECKARRAY(len(piv)<=nrows,"len(piv)<=nrows","2nd argument piv") {
+  /* Processing variable off */
+  if (off_capi == Py_None) off = 0; else
+    f2py_success = int_from_pyobj(&off,off_capi,"flapack.zlaswp() 3rd keyword (off) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(off>=0 && off<len(piv),"off>=0 && off<len(piv)","3rd keyword off","zlaswp:off=%d",off) {
+  /* Processing variable m */
+  m = (len(piv)-off)/abs(inc);
+  CHECKSCALAR(len(piv)-off>(m-1)*abs(inc),"len(piv)-off>(m-1)*abs(inc)","hidden m","zlaswp:m=%d",m) {
+  /* Processing variable k2 */
+  if (k2_capi == Py_None) k2 = len(piv)-1; else
+    f2py_success = int_from_pyobj(&k2,k2_capi,"flapack.zlaswp() 2nd keyword (k2) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(k1<=k2 && k2<len(piv)-off,"k1<=k2 && k2<len(piv)-off","2nd keyword k2","zlaswp:k2=%d",k2) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        {int i;m=len(piv);for(i=0;i<m;++piv[i++]);++k1;++k2; (*f2py_func)(&n,a,&nrows,&k1,&k2,piv+off,&inc); for(i=0;i<m;--piv[i++]);} ;
+        /*(*f2py_func)(&n,a,&nrows,&k1,&k2,piv,&off,&inc,&m);*/
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_a_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(k1<=k2 && k2<len(piv)-off)*/
+  } /*if (f2py_success) of k2*/
+  /* End of cleaning variable k2 */
+  } /*CHECKSCALAR(len(piv)-off>(m-1)*abs(inc))*/
+  /* End of cleaning variable m */
+  } /*CHECKSCALAR(off>=0 && off<len(piv))*/
+  } /*if (f2py_success) of off*/
+  /* End of cleaning variable off */
+  } /*CHECKARRAY(len(piv)<=nrows)*/
+  if((PyObject *)capi_piv_tmp!=piv_capi) {
+    Py_XDECREF(capi_piv_tmp); }
+  }  /*if (capi_piv_tmp == NULL) ... else of piv*/
+  /* End of cleaning variable piv */
+  /* End of cleaning variable nrows */
+  /* End of cleaning variable n */
+  } /*CHECKSCALAR(inc>0||inc<0)*/
+  } /*if (f2py_success) of inc*/
+  /* End of cleaning variable inc */
+  } /*CHECKSCALAR(0<=k1)*/
+  } /*if (f2py_success) of k1*/
+  /* End of cleaning variable k1 */
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of zlaswp *******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"sgesv",-1,{{-1}},0,(char *)F_FUNC(sgesv,SGESV),(f2py_init_func)f2py_rout_flapack_sgesv,doc_f2py_rout_flapack_sgesv},
+  {"dgesv",-1,{{-1}},0,(char *)F_FUNC(dgesv,DGESV),(f2py_init_func)f2py_rout_flapack_dgesv,doc_f2py_rout_flapack_dgesv},
+  {"cgesv",-1,{{-1}},0,(char *)F_FUNC(cgesv,CGESV),(f2py_init_func)f2py_rout_flapack_cgesv,doc_f2py_rout_flapack_cgesv},
+  {"zgesv",-1,{{-1}},0,(char *)F_FUNC(zgesv,ZGESV),(f2py_init_func)f2py_rout_flapack_zgesv,doc_f2py_rout_flapack_zgesv},
+  {"sgbsv",-1,{{-1}},0,(char *)F_FUNC(sgbsv,SGBSV),(f2py_init_func)f2py_rout_flapack_sgbsv,doc_f2py_rout_flapack_sgbsv},
+  {"dgbsv",-1,{{-1}},0,(char *)F_FUNC(dgbsv,DGBSV),(f2py_init_func)f2py_rout_flapack_dgbsv,doc_f2py_rout_flapack_dgbsv},
+  {"cgbsv",-1,{{-1}},0,(char *)F_FUNC(cgbsv,CGBSV),(f2py_init_func)f2py_rout_flapack_cgbsv,doc_f2py_rout_flapack_cgbsv},
+  {"zgbsv",-1,{{-1}},0,(char *)F_FUNC(zgbsv,ZGBSV),(f2py_init_func)f2py_rout_flapack_zgbsv,doc_f2py_rout_flapack_zgbsv},
+  {"sposv",-1,{{-1}},0,(char *)F_FUNC(sposv,SPOSV),(f2py_init_func)f2py_rout_flapack_sposv,doc_f2py_rout_flapack_sposv},
+  {"dposv",-1,{{-1}},0,(char *)F_FUNC(dposv,DPOSV),(f2py_init_func)f2py_rout_flapack_dposv,doc_f2py_rout_flapack_dposv},
+  {"cposv",-1,{{-1}},0,(char *)F_FUNC(cposv,CPOSV),(f2py_init_func)f2py_rout_flapack_cposv,doc_f2py_rout_flapack_cposv},
+  {"zposv",-1,{{-1}},0,(char *)F_FUNC(zposv,ZPOSV),(f2py_init_func)f2py_rout_flapack_zposv,doc_f2py_rout_flapack_zposv},
+  {"sgelss",-1,{{-1}},0,(char *)F_FUNC(sgelss,SGELSS),(f2py_init_func)f2py_rout_flapack_sgelss,doc_f2py_rout_flapack_sgelss},
+  {"dgelss",-1,{{-1}},0,(char *)F_FUNC(dgelss,DGELSS),(f2py_init_func)f2py_rout_flapack_dgelss,doc_f2py_rout_flapack_dgelss},
+  {"cgelss",-1,{{-1}},0,(char *)F_FUNC(cgelss,CGELSS),(f2py_init_func)f2py_rout_flapack_cgelss,doc_f2py_rout_flapack_cgelss},
+  {"zgelss",-1,{{-1}},0,(char *)F_FUNC(zgelss,ZGELSS),(f2py_init_func)f2py_rout_flapack_zgelss,doc_f2py_rout_flapack_zgelss},
+  {"ssyev",-1,{{-1}},0,(char *)F_FUNC(ssyev,SSYEV),(f2py_init_func)f2py_rout_flapack_ssyev,doc_f2py_rout_flapack_ssyev},
+  {"dsyev",-1,{{-1}},0,(char *)F_FUNC(dsyev,DSYEV),(f2py_init_func)f2py_rout_flapack_dsyev,doc_f2py_rout_flapack_dsyev},
+  {"cheev",-1,{{-1}},0,(char *)F_FUNC(cheev,CHEEV),(f2py_init_func)f2py_rout_flapack_cheev,doc_f2py_rout_flapack_cheev},
+  {"zheev",-1,{{-1}},0,(char *)F_FUNC(zheev,ZHEEV),(f2py_init_func)f2py_rout_flapack_zheev,doc_f2py_rout_flapack_zheev},
+  {"ssyevd",-1,{{-1}},0,(char *)F_FUNC(ssyevd,SSYEVD),(f2py_init_func)f2py_rout_flapack_ssyevd,doc_f2py_rout_flapack_ssyevd},
+  {"dsyevd",-1,{{-1}},0,(char *)F_FUNC(dsyevd,DSYEVD),(f2py_init_func)f2py_rout_flapack_dsyevd,doc_f2py_rout_flapack_dsyevd},
+  {"cheevd",-1,{{-1}},0,(char *)F_FUNC(cheevd,CHEEVD),(f2py_init_func)f2py_rout_flapack_cheevd,doc_f2py_rout_flapack_cheevd},
+  {"zheevd",-1,{{-1}},0,(char *)F_FUNC(zheevd,ZHEEVD),(f2py_init_func)f2py_rout_flapack_zheevd,doc_f2py_rout_flapack_zheevd},
+  {"ssyevr",-1,{{-1}},0,(char *)F_FUNC(ssyevr,SSYEVR),(f2py_init_func)f2py_rout_flapack_ssyevr,doc_f2py_rout_flapack_ssyevr},
+  {"dsyevr",-1,{{-1}},0,(char *)F_FUNC(dsyevr,DSYEVR),(f2py_init_func)f2py_rout_flapack_dsyevr,doc_f2py_rout_flapack_dsyevr},
+  {"cheevr",-1,{{-1}},0,(char *)F_FUNC(cheevr,CHEEVR),(f2py_init_func)f2py_rout_flapack_cheevr,doc_f2py_rout_flapack_cheevr},
+  {"zheevr",-1,{{-1}},0,(char *)F_FUNC(zheevr,ZHEEVR),(f2py_init_func)f2py_rout_flapack_zheevr,doc_f2py_rout_flapack_zheevr},
+  {"sgees",-1,{{-1}},0,(char *)F_FUNC(sgees,SGEES),(f2py_init_func)f2py_rout_flapack_sgees,doc_f2py_rout_flapack_sgees},
+  {"dgees",-1,{{-1}},0,(char *)F_FUNC(dgees,DGEES),(f2py_init_func)f2py_rout_flapack_dgees,doc_f2py_rout_flapack_dgees},
+  {"cgees",-1,{{-1}},0,(char *)F_FUNC(cgees,CGEES),(f2py_init_func)f2py_rout_flapack_cgees,doc_f2py_rout_flapack_cgees},
+  {"zgees",-1,{{-1}},0,(char *)F_FUNC(zgees,ZGEES),(f2py_init_func)f2py_rout_flapack_zgees,doc_f2py_rout_flapack_zgees},
+  {"sgeev",-1,{{-1}},0,(char *)F_FUNC(sgeev,SGEEV),(f2py_init_func)f2py_rout_flapack_sgeev,doc_f2py_rout_flapack_sgeev},
+  {"dgeev",-1,{{-1}},0,(char *)F_FUNC(dgeev,DGEEV),(f2py_init_func)f2py_rout_flapack_dgeev,doc_f2py_rout_flapack_dgeev},
+  {"cgeev",-1,{{-1}},0,(char *)F_FUNC(cgeev,CGEEV),(f2py_init_func)f2py_rout_flapack_cgeev,doc_f2py_rout_flapack_cgeev},
+  {"zgeev",-1,{{-1}},0,(char *)F_FUNC(zgeev,ZGEEV),(f2py_init_func)f2py_rout_flapack_zgeev,doc_f2py_rout_flapack_zgeev},
+  {"sgesdd",-1,{{-1}},0,(char *)F_FUNC(sgesdd,SGESDD),(f2py_init_func)f2py_rout_flapack_sgesdd,doc_f2py_rout_flapack_sgesdd},
+  {"dgesdd",-1,{{-1}},0,(char *)F_FUNC(dgesdd,DGESDD),(f2py_init_func)f2py_rout_flapack_dgesdd,doc_f2py_rout_flapack_dgesdd},
+  {"cgesdd",-1,{{-1}},0,(char *)F_FUNC(cgesdd,CGESDD),(f2py_init_func)f2py_rout_flapack_cgesdd,doc_f2py_rout_flapack_cgesdd},
+  {"zgesdd",-1,{{-1}},0,(char *)F_FUNC(zgesdd,ZGESDD),(f2py_init_func)f2py_rout_flapack_zgesdd,doc_f2py_rout_flapack_zgesdd},
+  {"ssygv",-1,{{-1}},0,(char *)F_FUNC(ssygv,SSYGV),(f2py_init_func)f2py_rout_flapack_ssygv,doc_f2py_rout_flapack_ssygv},
+  {"dsygv",-1,{{-1}},0,(char *)F_FUNC(dsygv,DSYGV),(f2py_init_func)f2py_rout_flapack_dsygv,doc_f2py_rout_flapack_dsygv},
+  {"chegv",-1,{{-1}},0,(char *)F_FUNC(chegv,CHEGV),(f2py_init_func)f2py_rout_flapack_chegv,doc_f2py_rout_flapack_chegv},
+  {"zhegv",-1,{{-1}},0,(char *)F_FUNC(zhegv,ZHEGV),(f2py_init_func)f2py_rout_flapack_zhegv,doc_f2py_rout_flapack_zhegv},
+  {"ssygvd",-1,{{-1}},0,(char *)F_FUNC(ssygvd,SSYGVD),(f2py_init_func)f2py_rout_flapack_ssygvd,doc_f2py_rout_flapack_ssygvd},
+  {"dsygvd",-1,{{-1}},0,(char *)F_FUNC(dsygvd,DSYGVD),(f2py_init_func)f2py_rout_flapack_dsygvd,doc_f2py_rout_flapack_dsygvd},
+  {"chegvd",-1,{{-1}},0,(char *)F_FUNC(chegvd,CHEGVD),(f2py_init_func)f2py_rout_flapack_chegvd,doc_f2py_rout_flapack_chegvd},
+  {"zhegvd",-1,{{-1}},0,(char *)F_FUNC(zhegvd,ZHEGVD),(f2py_init_func)f2py_rout_flapack_zhegvd,doc_f2py_rout_flapack_zhegvd},
+  {"sggev",-1,{{-1}},0,(char *)F_FUNC(sggev,SGGEV),(f2py_init_func)f2py_rout_flapack_sggev,doc_f2py_rout_flapack_sggev},
+  {"dggev",-1,{{-1}},0,(char *)F_FUNC(dggev,DGGEV),(f2py_init_func)f2py_rout_flapack_dggev,doc_f2py_rout_flapack_dggev},
+  {"cggev",-1,{{-1}},0,(char *)F_FUNC(cggev,CGGEV),(f2py_init_func)f2py_rout_flapack_cggev,doc_f2py_rout_flapack_cggev},
+  {"zggev",-1,{{-1}},0,(char *)F_FUNC(zggev,ZGGEV),(f2py_init_func)f2py_rout_flapack_zggev,doc_f2py_rout_flapack_zggev},
+  {"sgetrf",-1,{{-1}},0,(char *)F_FUNC(sgetrf,SGETRF),(f2py_init_func)f2py_rout_flapack_sgetrf,doc_f2py_rout_flapack_sgetrf},
+  {"dgetrf",-1,{{-1}},0,(char *)F_FUNC(dgetrf,DGETRF),(f2py_init_func)f2py_rout_flapack_dgetrf,doc_f2py_rout_flapack_dgetrf},
+  {"cgetrf",-1,{{-1}},0,(char *)F_FUNC(cgetrf,CGETRF),(f2py_init_func)f2py_rout_flapack_cgetrf,doc_f2py_rout_flapack_cgetrf},
+  {"zgetrf",-1,{{-1}},0,(char *)F_FUNC(zgetrf,ZGETRF),(f2py_init_func)f2py_rout_flapack_zgetrf,doc_f2py_rout_flapack_zgetrf},
+  {"spotrf",-1,{{-1}},0,(char *)F_FUNC(spotrf,SPOTRF),(f2py_init_func)f2py_rout_flapack_spotrf,doc_f2py_rout_flapack_spotrf},
+  {"dpotrf",-1,{{-1}},0,(char *)F_FUNC(dpotrf,DPOTRF),(f2py_init_func)f2py_rout_flapack_dpotrf,doc_f2py_rout_flapack_dpotrf},
+  {"cpotrf",-1,{{-1}},0,(char *)F_FUNC(cpotrf,CPOTRF),(f2py_init_func)f2py_rout_flapack_cpotrf,doc_f2py_rout_flapack_cpotrf},
+  {"zpotrf",-1,{{-1}},0,(char *)F_FUNC(zpotrf,ZPOTRF),(f2py_init_func)f2py_rout_flapack_zpotrf,doc_f2py_rout_flapack_zpotrf},
+  {"sgetrs",-1,{{-1}},0,(char *)F_FUNC(sgetrs,SGETRS),(f2py_init_func)f2py_rout_flapack_sgetrs,doc_f2py_rout_flapack_sgetrs},
+  {"dgetrs",-1,{{-1}},0,(char *)F_FUNC(dgetrs,DGETRS),(f2py_init_func)f2py_rout_flapack_dgetrs,doc_f2py_rout_flapack_dgetrs},
+  {"cgetrs",-1,{{-1}},0,(char *)F_FUNC(cgetrs,CGETRS),(f2py_init_func)f2py_rout_flapack_cgetrs,doc_f2py_rout_flapack_cgetrs},
+  {"zgetrs",-1,{{-1}},0,(char *)F_FUNC(zgetrs,ZGETRS),(f2py_init_func)f2py_rout_flapack_zgetrs,doc_f2py_rout_flapack_zgetrs},
+  {"spotrs",-1,{{-1}},0,(char *)F_FUNC(spotrs,SPOTRS),(f2py_init_func)f2py_rout_flapack_spotrs,doc_f2py_rout_flapack_spotrs},
+  {"dpotrs",-1,{{-1}},0,(char *)F_FUNC(dpotrs,DPOTRS),(f2py_init_func)f2py_rout_flapack_dpotrs,doc_f2py_rout_flapack_dpotrs},
+  {"cpotrs",-1,{{-1}},0,(char *)F_FUNC(cpotrs,CPOTRS),(f2py_init_func)f2py_rout_flapack_cpotrs,doc_f2py_rout_flapack_cpotrs},
+  {"zpotrs",-1,{{-1}},0,(char *)F_FUNC(zpotrs,ZPOTRS),(f2py_init_func)f2py_rout_flapack_zpotrs,doc_f2py_rout_flapack_zpotrs},
+  {"sgetri",-1,{{-1}},0,(char *)F_FUNC(sgetri,SGETRI),(f2py_init_func)f2py_rout_flapack_sgetri,doc_f2py_rout_flapack_sgetri},
+  {"dgetri",-1,{{-1}},0,(char *)F_FUNC(dgetri,DGETRI),(f2py_init_func)f2py_rout_flapack_dgetri,doc_f2py_rout_flapack_dgetri},
+  {"cgetri",-1,{{-1}},0,(char *)F_FUNC(cgetri,CGETRI),(f2py_init_func)f2py_rout_flapack_cgetri,doc_f2py_rout_flapack_cgetri},
+  {"zgetri",-1,{{-1}},0,(char *)F_FUNC(zgetri,ZGETRI),(f2py_init_func)f2py_rout_flapack_zgetri,doc_f2py_rout_flapack_zgetri},
+  {"spotri",-1,{{-1}},0,(char *)F_FUNC(spotri,SPOTRI),(f2py_init_func)f2py_rout_flapack_spotri,doc_f2py_rout_flapack_spotri},
+  {"dpotri",-1,{{-1}},0,(char *)F_FUNC(dpotri,DPOTRI),(f2py_init_func)f2py_rout_flapack_dpotri,doc_f2py_rout_flapack_dpotri},
+  {"cpotri",-1,{{-1}},0,(char *)F_FUNC(cpotri,CPOTRI),(f2py_init_func)f2py_rout_flapack_cpotri,doc_f2py_rout_flapack_cpotri},
+  {"zpotri",-1,{{-1}},0,(char *)F_FUNC(zpotri,ZPOTRI),(f2py_init_func)f2py_rout_flapack_zpotri,doc_f2py_rout_flapack_zpotri},
+  {"strtri",-1,{{-1}},0,(char *)F_FUNC(strtri,STRTRI),(f2py_init_func)f2py_rout_flapack_strtri,doc_f2py_rout_flapack_strtri},
+  {"dtrtri",-1,{{-1}},0,(char *)F_FUNC(dtrtri,DTRTRI),(f2py_init_func)f2py_rout_flapack_dtrtri,doc_f2py_rout_flapack_dtrtri},
+  {"ctrtri",-1,{{-1}},0,(char *)F_FUNC(ctrtri,CTRTRI),(f2py_init_func)f2py_rout_flapack_ctrtri,doc_f2py_rout_flapack_ctrtri},
+  {"ztrtri",-1,{{-1}},0,(char *)F_FUNC(ztrtri,ZTRTRI),(f2py_init_func)f2py_rout_flapack_ztrtri,doc_f2py_rout_flapack_ztrtri},
+  {"sgeqrf",-1,{{-1}},0,(char *)F_FUNC(sgeqrf,SGEQRF),(f2py_init_func)f2py_rout_flapack_sgeqrf,doc_f2py_rout_flapack_sgeqrf},
+  {"dgeqrf",-1,{{-1}},0,(char *)F_FUNC(dgeqrf,DGEQRF),(f2py_init_func)f2py_rout_flapack_dgeqrf,doc_f2py_rout_flapack_dgeqrf},
+  {"cgeqrf",-1,{{-1}},0,(char *)F_FUNC(cgeqrf,CGEQRF),(f2py_init_func)f2py_rout_flapack_cgeqrf,doc_f2py_rout_flapack_cgeqrf},
+  {"zgeqrf",-1,{{-1}},0,(char *)F_FUNC(zgeqrf,ZGEQRF),(f2py_init_func)f2py_rout_flapack_zgeqrf,doc_f2py_rout_flapack_zgeqrf},
+  {"sorgqr",-1,{{-1}},0,(char *)F_FUNC(sorgqr,SORGQR),(f2py_init_func)f2py_rout_flapack_sorgqr,doc_f2py_rout_flapack_sorgqr},
+  {"dorgqr",-1,{{-1}},0,(char *)F_FUNC(dorgqr,DORGQR),(f2py_init_func)f2py_rout_flapack_dorgqr,doc_f2py_rout_flapack_dorgqr},
+  {"cungqr",-1,{{-1}},0,(char *)F_FUNC(cungqr,CUNGQR),(f2py_init_func)f2py_rout_flapack_cungqr,doc_f2py_rout_flapack_cungqr},
+  {"zungqr",-1,{{-1}},0,(char *)F_FUNC(zungqr,ZUNGQR),(f2py_init_func)f2py_rout_flapack_zungqr,doc_f2py_rout_flapack_zungqr},
+  {"sgehrd",-1,{{-1}},0,(char *)F_FUNC(sgehrd,SGEHRD),(f2py_init_func)f2py_rout_flapack_sgehrd,doc_f2py_rout_flapack_sgehrd},
+  {"dgehrd",-1,{{-1}},0,(char *)F_FUNC(dgehrd,DGEHRD),(f2py_init_func)f2py_rout_flapack_dgehrd,doc_f2py_rout_flapack_dgehrd},
+  {"cgehrd",-1,{{-1}},0,(char *)F_FUNC(cgehrd,CGEHRD),(f2py_init_func)f2py_rout_flapack_cgehrd,doc_f2py_rout_flapack_cgehrd},
+  {"zgehrd",-1,{{-1}},0,(char *)F_FUNC(zgehrd,ZGEHRD),(f2py_init_func)f2py_rout_flapack_zgehrd,doc_f2py_rout_flapack_zgehrd},
+  {"sgebal",-1,{{-1}},0,(char *)F_FUNC(sgebal,SGEBAL),(f2py_init_func)f2py_rout_flapack_sgebal,doc_f2py_rout_flapack_sgebal},
+  {"dgebal",-1,{{-1}},0,(char *)F_FUNC(dgebal,DGEBAL),(f2py_init_func)f2py_rout_flapack_dgebal,doc_f2py_rout_flapack_dgebal},
+  {"cgebal",-1,{{-1}},0,(char *)F_FUNC(cgebal,CGEBAL),(f2py_init_func)f2py_rout_flapack_cgebal,doc_f2py_rout_flapack_cgebal},
+  {"zgebal",-1,{{-1}},0,(char *)F_FUNC(zgebal,ZGEBAL),(f2py_init_func)f2py_rout_flapack_zgebal,doc_f2py_rout_flapack_zgebal},
+  {"slauum",-1,{{-1}},0,(char *)F_FUNC(slauum,SLAUUM),(f2py_init_func)f2py_rout_flapack_slauum,doc_f2py_rout_flapack_slauum},
+  {"dlauum",-1,{{-1}},0,(char *)F_FUNC(dlauum,DLAUUM),(f2py_init_func)f2py_rout_flapack_dlauum,doc_f2py_rout_flapack_dlauum},
+  {"clauum",-1,{{-1}},0,(char *)F_FUNC(clauum,CLAUUM),(f2py_init_func)f2py_rout_flapack_clauum,doc_f2py_rout_flapack_clauum},
+  {"zlauum",-1,{{-1}},0,(char *)F_FUNC(zlauum,ZLAUUM),(f2py_init_func)f2py_rout_flapack_zlauum,doc_f2py_rout_flapack_zlauum},
+  {"slaswp",-1,{{-1}},0,(char *)F_FUNC(slaswp,SLASWP),(f2py_init_func)f2py_rout_flapack_slaswp,doc_f2py_rout_flapack_slaswp},
+  {"dlaswp",-1,{{-1}},0,(char *)F_FUNC(dlaswp,DLASWP),(f2py_init_func)f2py_rout_flapack_dlaswp,doc_f2py_rout_flapack_dlaswp},
+  {"claswp",-1,{{-1}},0,(char *)F_FUNC(claswp,CLASWP),(f2py_init_func)f2py_rout_flapack_claswp,doc_f2py_rout_flapack_claswp},
+  {"zlaswp",-1,{{-1}},0,(char *)F_FUNC(zlaswp,ZLASWP),(f2py_init_func)f2py_rout_flapack_zlaswp,doc_f2py_rout_flapack_zlaswp},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "flapack",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_flapack(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initflapack(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = flapack_module = PyModule_Create(&moduledef);
+#else
+  m = flapack_module = Py_InitModule("flapack", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module flapack (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'flapack' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  lu,piv,x,info = sgesv(a,b,overwrite_a=0,overwrite_b=0)\n"
+"  lu,piv,x,info = dgesv(a,b,overwrite_a=0,overwrite_b=0)\n"
+"  lu,piv,x,info = cgesv(a,b,overwrite_a=0,overwrite_b=0)\n"
+"  lu,piv,x,info = zgesv(a,b,overwrite_a=0,overwrite_b=0)\n"
+"  lub,piv,x,info = sgbsv(kl,ku,ab,b,overwrite_ab=0,overwrite_b=0)\n"
+"  lub,piv,x,info = dgbsv(kl,ku,ab,b,overwrite_ab=0,overwrite_b=0)\n"
+"  lub,piv,x,info = cgbsv(kl,ku,ab,b,overwrite_ab=0,overwrite_b=0)\n"
+"  lub,piv,x,info = zgbsv(kl,ku,ab,b,overwrite_ab=0,overwrite_b=0)\n"
+"  c,x,info = sposv(a,b,lower=0,overwrite_a=0,overwrite_b=0)\n"
+"  c,x,info = dposv(a,b,lower=0,overwrite_a=0,overwrite_b=0)\n"
+"  c,x,info = cposv(a,b,lower=0,overwrite_a=0,overwrite_b=0)\n"
+"  c,x,info = zposv(a,b,lower=0,overwrite_a=0,overwrite_b=0)\n"
+"  v,x,s,rank,info = sgelss(a,b,cond=-1.0,lwork=3*minmn+MAX(2*minmn,MAX(maxmn,nrhs)),overwrite_a=0,overwrite_b=0)\n"
+"  v,x,s,rank,info = dgelss(a,b,cond=-1.0,lwork=3*minmn+MAX(2*minmn,MAX(maxmn,nrhs)),overwrite_a=0,overwrite_b=0)\n"
+"  v,x,s,rank,info = cgelss(a,b,cond=-1.0,lwork=2*minmn+MAX(maxmn,nrhs),overwrite_a=0,overwrite_b=0)\n"
+"  v,x,s,rank,info = zgelss(a,b,cond=-1.0,lwork=2*minmn+MAX(maxmn,nrhs),overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = ssyev(a,compute_v=1,lower=0,lwork=3*n-1,overwrite_a=0)\n"
+"  w,v,info = dsyev(a,compute_v=1,lower=0,lwork=3*n-1,overwrite_a=0)\n"
+"  w,v,info = cheev(a,compute_v=1,lower=0,lwork=2*n-1,overwrite_a=0)\n"
+"  w,v,info = zheev(a,compute_v=1,lower=0,lwork=2*n-1,overwrite_a=0)\n"
+"  w,v,info = ssyevd(a,compute_v=1,lower=0,lwork=(compute_v?1+6*n+2*n*n:2*n+1),overwrite_a=0)\n"
+"  w,v,info = dsyevd(a,compute_v=1,lower=0,lwork=(compute_v?1+6*n+2*n*n:2*n+1),overwrite_a=0)\n"
+"  w,v,info = cheevd(a,compute_v=1,lower=0,lwork=(compute_v?2*n+n*n:n+1),overwrite_a=0)\n"
+"  w,v,info = zheevd(a,compute_v=1,lower=0,lwork=(compute_v?2*n+n*n:n+1),overwrite_a=0)\n"
+"  w,v,info = ssyevr(a,compute_v=1,lower=0,vrange=,irange=,atol=-1.0,lwork=26*n,overwrite_a=0)\n"
+"  w,v,info = dsyevr(a,compute_v=1,lower=0,vrange=,irange=,atol=-1.0,lwork=26*n,overwrite_a=0)\n"
+"  w,v,info = cheevr(a,compute_v=1,lower=0,vrange=,irange=,atol=-1.0,lwork=18*n,overwrite_a=0)\n"
+"  w,v,info = zheevr(a,compute_v=1,lower=0,vrange=,irange=,atol=-1.0,lwork=18*n,overwrite_a=0)\n"
+"  t,sdim,wr,wi,vs,info = sgees(sselect,a,compute_v=1,sort_t=0,lwork=3*n,sselect_extra_args=(),overwrite_a=0)\n"
+"  t,sdim,wr,wi,vs,info = dgees(dselect,a,compute_v=1,sort_t=0,lwork=3*n,dselect_extra_args=(),overwrite_a=0)\n"
+"  t,sdim,w,vs,info = cgees(cselect,a,compute_v=1,sort_t=0,lwork=3*n,cselect_extra_args=(),overwrite_a=0)\n"
+"  t,sdim,w,vs,info = zgees(zselect,a,compute_v=1,sort_t=0,lwork=3*n,zselect_extra_args=(),overwrite_a=0)\n"
+"  wr,wi,vl,vr,info = sgeev(a,compute_vl=1,compute_vr=1,lwork=(compute_vl||compute_vr)?4*n:3*n,overwrite_a=0)\n"
+"  wr,wi,vl,vr,info = dgeev(a,compute_vl=1,compute_vr=1,lwork=(compute_vl||compute_vr)?4*n:3*n,overwrite_a=0)\n"
+"  w,vl,vr,info = cgeev(a,compute_vl=1,compute_vr=1,lwork=2*n,overwrite_a=0)\n"
+"  w,vl,vr,info = zgeev(a,compute_vl=1,compute_vr=1,lwork=2*n,overwrite_a=0)\n"
+"  u,s,vt,info = sgesdd(a,compute_uv=1,lwork=(compute_uv?4*minmn*minmn+MAX(m,n)+9*minmn:MAX(14*minmn+4,10*minmn+827)+MAX(m,n)),overwrite_a=0)\n"
+"  u,s,vt,info = dgesdd(a,compute_uv=1,lwork=(compute_uv?4*minmn*minmn+MAX(m,n)+9*minmn:MAX(14*minmn+4,10*minmn+827)+MAX(m,n)),overwrite_a=0)\n"
+"  u,s,vt,info = cgesdd(a,compute_uv=1,lwork=(compute_uv?2*minmn*minmn+MAX(m,n)+2*minmn:2*minmn+MAX(m,n)),overwrite_a=0)\n"
+"  u,s,vt,info = zgesdd(a,compute_uv=1,lwork=(compute_uv?2*minmn*minmn+MAX(m,n)+2*minmn:2*minmn+MAX(m,n)),overwrite_a=0)\n"
+"  w,v,info = ssygv(a,b,itype=1,compute_v=1,lower=0,lwork=3*n-1,overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = dsygv(a,b,itype=1,compute_v=1,lower=0,lwork=3*n-1,overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = chegv(a,b,itype=1,compute_v=1,lower=0,lwork=2*n-1,overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = zhegv(a,b,itype=1,compute_v=1,lower=0,lwork=2*n-1,overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = ssygvd(a,b,itype=1,compute_v=1,lower=0,lwork=(compute_v?1+6*n+2*n*n:2*n+1),overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = dsygvd(a,b,itype=1,compute_v=1,lower=0,lwork=(compute_v?1+6*n+2*n*n:2*n+1),overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = chegvd(a,b,itype=1,compute_v=1,lower=0,lwork=(compute_v?2*n+n*n:n+1),overwrite_a=0,overwrite_b=0)\n"
+"  w,v,info = zhegvd(a,b,itype=1,compute_v=1,lower=0,lwork=(compute_v?2*n+n*n:n+1),overwrite_a=0,overwrite_b=0)\n"
+"  alphar,alphai,beta,vl,vr,info = sggev(a,b,compute_vl=1,compute_vr=1,lwork=8*n,overwrite_a=0,overwrite_b=0)\n"
+"  alphar,alphai,beta,vl,vr,info = dggev(a,b,compute_vl=1,compute_vr=1,lwork=8*n,overwrite_a=0,overwrite_b=0)\n"
+"  alpha,beta,vl,vr,info = cggev(a,b,compute_vl=1,compute_vr=1,lwork=2*n,overwrite_a=0,overwrite_b=0)\n"
+"  alpha,beta,vl,vr,info = zggev(a,b,compute_vl=1,compute_vr=1,lwork=2*n,overwrite_a=0,overwrite_b=0)\n"
+"  lu,piv,info = sgetrf(a,overwrite_a=0)\n"
+"  lu,piv,info = dgetrf(a,overwrite_a=0)\n"
+"  lu,piv,info = cgetrf(a,overwrite_a=0)\n"
+"  lu,piv,info = zgetrf(a,overwrite_a=0)\n"
+"  c,info = spotrf(a,lower=0,clean=1,overwrite_a=0)\n"
+"  c,info = dpotrf(a,lower=0,clean=1,overwrite_a=0)\n"
+"  c,info = cpotrf(a,lower=0,clean=1,overwrite_a=0)\n"
+"  c,info = zpotrf(a,lower=0,clean=1,overwrite_a=0)\n"
+"  x,info = sgetrs(lu,piv,b,trans=0,overwrite_b=0)\n"
+"  x,info = dgetrs(lu,piv,b,trans=0,overwrite_b=0)\n"
+"  x,info = cgetrs(lu,piv,b,trans=0,overwrite_b=0)\n"
+"  x,info = zgetrs(lu,piv,b,trans=0,overwrite_b=0)\n"
+"  x,info = spotrs(c,b,lower=0,overwrite_b=0)\n"
+"  x,info = dpotrs(c,b,lower=0,overwrite_b=0)\n"
+"  x,info = cpotrs(c,b,lower=0,overwrite_b=0)\n"
+"  x,info = zpotrs(c,b,lower=0,overwrite_b=0)\n"
+"  inv_a,info = sgetri(lu,piv,lwork=3*n,overwrite_lu=0)\n"
+"  inv_a,info = dgetri(lu,piv,lwork=3*n,overwrite_lu=0)\n"
+"  inv_a,info = cgetri(lu,piv,lwork=3*n,overwrite_lu=0)\n"
+"  inv_a,info = zgetri(lu,piv,lwork=3*n,overwrite_lu=0)\n"
+"  inv_a,info = spotri(c,lower=0,overwrite_c=0)\n"
+"  inv_a,info = dpotri(c,lower=0,overwrite_c=0)\n"
+"  inv_a,info = cpotri(c,lower=0,overwrite_c=0)\n"
+"  inv_a,info = zpotri(c,lower=0,overwrite_c=0)\n"
+"  inv_c,info = strtri(c,lower=0,unitdiag=0,overwrite_c=0)\n"
+"  inv_c,info = dtrtri(c,lower=0,unitdiag=0,overwrite_c=0)\n"
+"  inv_c,info = ctrtri(c,lower=0,unitdiag=0,overwrite_c=0)\n"
+"  inv_c,info = ztrtri(c,lower=0,unitdiag=0,overwrite_c=0)\n"
+"  qr,tau,info = sgeqrf(a,lwork=n,overwrite_a=0)\n"
+"  qr,tau,info = dgeqrf(a,lwork=n,overwrite_a=0)\n"
+"  qr,tau,info = cgeqrf(a,lwork=n,overwrite_a=0)\n"
+"  qr,tau,info = zgeqrf(a,lwork=n,overwrite_a=0)\n"
+"  q,info = sorgqr(qr,tau,lwork=n,overwrite_qr=0,overwrite_tau=1)\n"
+"  q,info = dorgqr(qr,tau,lwork=n,overwrite_qr=0,overwrite_tau=1)\n"
+"  q,info = cungqr(qr,tau,lwork=n,overwrite_qr=0,overwrite_tau=1)\n"
+"  q,info = zungqr(qr,tau,lwork=n,overwrite_qr=0,overwrite_tau=1)\n"
+"  ht,tau,info = sgehrd(a,lo=0,hi=n-1,lwork=MAX(n,1),overwrite_a=0)\n"
+"  ht,tau,info = dgehrd(a,lo=0,hi=n-1,lwork=MAX(n,1),overwrite_a=0)\n"
+"  ht,tau,info = cgehrd(a,lo=0,hi=n-1,lwork=MAX(n,1),overwrite_a=0)\n"
+"  ht,tau,info = zgehrd(a,lo=0,hi=n-1,lwork=MAX(n,1),overwrite_a=0)\n"
+"  ba,lo,hi,pivscale,info = sgebal(a,scale=0,permute=0,overwrite_a=0)\n"
+"  ba,lo,hi,pivscale,info = dgebal(a,scale=0,permute=0,overwrite_a=0)\n"
+"  ba,lo,hi,pivscale,info = cgebal(a,scale=0,permute=0,overwrite_a=0)\n"
+"  ba,lo,hi,pivscale,info = zgebal(a,scale=0,permute=0,overwrite_a=0)\n"
+"  a,info = slauum(c,lower=0,overwrite_c=0)\n"
+"  a,info = dlauum(c,lower=0,overwrite_c=0)\n"
+"  a,info = clauum(c,lower=0,overwrite_c=0)\n"
+"  a,info = zlauum(c,lower=0,overwrite_c=0)\n"
+"  a = slaswp(a,piv,k1=0,k2=len(piv)-1,off=0,inc=1,overwrite_a=0)\n"
+"  a = dlaswp(a,piv,k1=0,k2=len(piv)-1,off=0,inc=1,overwrite_a=0)\n"
+"  a = claswp(a,piv,k1=0,k2=len(piv)-1,off=0,inc=1,overwrite_a=0)\n"
+"  a = zlaswp(a,piv,k1=0,k2=len(piv)-1,off=0,inc=1,overwrite_a=0)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  flapack_error = PyErr_NewException ("flapack.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"flapack");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -68,6 +68,14 @@ Graph algorithms:
 
    cs_graph_components -- Determine connected components of a graph
 
+Parallel execution:
+
+.. autosummary::
+   :toctree: generated/
+
+   get_n_jobs - Default number of threads used by sparse matrix products
+   set_n_jobs - Set the default number of threads used by sparse matrix products
+
 Exceptions
 ----------
 
@@ -185,6 +193,7 @@ from csgraph import *
 
 from construct import *
 from extract import *
+from parallel import *
 
 #from spfuncs import *
 
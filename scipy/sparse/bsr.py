@@ -11,7 +11,7 @@ import numpy as np
 from data import _data_matrix
 from compressed import _cs_matrix
 from base import isspmatrix, _formats
-from sputils import isshape, getdtype, to_native, upcast
+from sputils import isshape, getdtype, to_native, upcast, get_index_dtype
 import sparsetools
 from sparsetools import bsr_matvec, bsr_matvecs, csr_matmat_pass1, \
                         bsr_matmat_pass2, bsr_transpose, bsr_sort_indices
@@ -214,9 +214,11 @@ class bsr_matrix(_cs_matrix):
             warn("indices array has non-integer dtype (%s)" \
                     % self.indices.dtype.name )
 
-        # only support 32-bit ints for now
-        self.indptr  = np.asarray(self.indptr, np.intc)
-        self.indices = np.asarray(self.indices, np.intc)
+        # use 32-bit indices unless the values need 64 bits
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    check_contents=True)
+        self.indptr  = np.asarray(self.indptr, idx_dtype)
+        self.indices = np.asarray(self.indices, idx_dtype)
         self.data    = to_native(self.data)
 
         # check array shapes
@@ -308,11 +310,14 @@ class bsr_matrix(_cs_matrix):
     def matmat(self, other):
         return self * other
 
-    def _mul_vector(self, other):
+    def dot_nnz_bound(self, other):
+        return self.tocsr().dot_nnz_bound(other)
+
+    def _mul_vector(self, other, out=None, n_jobs=None):
         M,N = self.shape
         R,C = self.blocksize
 
-        result = np.zeros(self.shape[0], dtype=upcast(self.dtype, other.dtype))
+        result = self._mul_out(out, (M,), upcast(self.dtype, other.dtype))
 
         bsr_matvec(M//R, N//C, R, C, \
             self.indptr, self.indices, self.data.ravel(),
@@ -320,12 +325,13 @@ class bsr_matrix(_cs_matrix):
 
         return result
 
-    def _mul_multivector(self,other):
+    def _mul_multivector(self, other, out=None, n_jobs=None):
         R,C = self.blocksize
         M,N = self.shape
         n_vecs = other.shape[1] #number of column vectors
 
-        result = np.zeros((M,n_vecs), dtype=upcast(self.dtype,other.dtype))
+        result = self._mul_out(out, (M,n_vecs),
+                               upcast(self.dtype,other.dtype))
 
         bsr_matvecs(M//R, N//C, n_vecs, R, C, \
                 self.indptr, self.indices, self.data.ravel(), \
@@ -333,7 +339,7 @@ class bsr_matrix(_cs_matrix):
 
         return result
 
-    def _mul_sparse_matrix(self, other):
+    def _mul_sparse_matrix(self, other, n_jobs=None):
         M, K1 = self.shape
         K2, N = other.shape
 
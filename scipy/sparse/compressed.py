@@ -9,9 +9,10 @@ import numpy as np
 
 from base import spmatrix, isspmatrix, SparseEfficiencyWarning
 from data import _data_matrix
+from parallel import _check_n_jobs, _row_blocks, _run_blocks
 import sparsetools
 from sputils import upcast, upcast_char, to_native, isdense, isshape, \
-     getdtype, isscalarlike, isintlike
+     getdtype, isscalarlike, isintlike, get_index_dtype
 
 
 class _cs_matrix(_data_matrix):
@@ -121,9 +122,11 @@ class _cs_matrix(_data_matrix):
             warn("indices array has non-integer dtype (%s)" \
                     % self.indices.dtype.name )
 
-        # only support 32-bit ints for now
-        self.indptr  = np.asarray(self.indptr,  dtype=np.intc)
-        self.indices = np.asarray(self.indices, dtype=np.intc)
+        # use 32-bit indices unless the values need 64 bits
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    check_contents=True)
+        self.indptr  = np.asarray(self.indptr,  dtype=idx_dtype)
+        self.indices = np.asarray(self.indices, dtype=idx_dtype)
         self.data    = to_native(self.data)
 
         # check array shapes
@@ -253,55 +256,223 @@ class _cs_matrix(_data_matrix):
     # Multiplication handlers #
     ###########################
 
-    def _mul_vector(self, other):
+    def dot(self, other, out=None, n_jobs=None):
+        """Ordinary dot product
+
+        Parameters
+        ----------
+        other : sparse matrix or ndarray
+            The right-hand operand.
+        out : ndarray, optional
+            Array in which to store the product when `other` is a dense
+            1-D or 2-D array.  It must be C-contiguous and have exactly
+            the shape and dtype of the result.  Reusing it avoids
+            allocating the result, e.g. in every iteration of a solver.
+        n_jobs : int, optional
+            Number of threads used to multiply a CSR matrix by a dense
+            array, or a CSR or CSC matrix by a sparse matrix.  The rows
+            (columns for CSC) of the result are split into contiguous
+            blocks with about the same amount of work, which are computed
+            without holding the GIL.  If -1 is given, all processors are
+            used.  Default: the value set with `set_n_jobs`.
+
+        See Also
+        --------
+        dot_nnz_bound : bound on the size of a sparse product
+
+        """
+        M,N = self.shape
+
+        if isinstance(other, np.ndarray) and other.ndim in (1, 2):
+            if other.shape[0] != N:
+                raise ValueError('dimension mismatch')
+            if other.ndim == 1:
+                return self._mul_vector(other, out=out, n_jobs=n_jobs)
+            result = self._mul_multivector(np.asarray(other), out=out,
+                                           n_jobs=n_jobs)
+            if isinstance(other, np.matrix) and out is None:
+                result = np.asmatrix(result)
+            return result
+
+        if out is not None:
+            raise ValueError('out is only supported for dense operands')
+
+        if isspmatrix(other):
+            if other.shape[0] != N:
+                raise ValueError('dimension mismatch')
+            return self._mul_sparse_matrix(other, n_jobs=n_jobs)
+
+        return self * other
+
+    def _mul_out(self, out, shape, dtype):
+        """Return a zeroed output array, checking `out` if it is given"""
+        if out is None:
+            return np.zeros(shape, dtype=dtype)
+        if not isinstance(out, np.ndarray) or out.shape != shape or \
+                out.dtype != dtype or not out.flags.c_contiguous:
+            raise ValueError('out must be a C-contiguous array of shape %s '
+                             'and dtype %s' % (shape, np.dtype(dtype)))
+        out.fill(0)
+        return out
+
+    def _mul_vector(self, other, out=None, n_jobs=None):
         M,N = self.shape
 
         # output array
-        result = np.zeros(M, dtype=upcast_char(self.dtype.char,
-                                               other.dtype.char))
+        result = self._mul_out(out, (M,), upcast_char(self.dtype.char,
+                                                      other.dtype.char))
 
         # csr_matvec or csc_matvec
         fn = getattr(sparsetools,self.format + '_matvec')
-        fn(M, N, self.indptr, self.indices, self.data, other, result)
+
+        if self.format == 'csr':
+            # convert the operands once rather than in every block
+            data = np.asarray(self.data, dtype=result.dtype)
+            other = np.ascontiguousarray(other, dtype=result.dtype)
+
+            # products for blocks of rows are independent
+            def mul_rows(start, stop):
+                fn(stop - start, N, self.indptr[start:stop+1], self.indices,
+                   data, other, result[start:stop])
+            _run_blocks(mul_rows, _row_blocks(self.indptr,
+                                              _check_n_jobs(n_jobs)))
+        else:
+            fn(M, N, self.indptr, self.indices, self.data, other, result)
 
         return result
 
 
-    def _mul_multivector(self, other):
+    def _mul_multivector(self, other, out=None, n_jobs=None):
         M,N = self.shape
         n_vecs = other.shape[1] #number of column vectors
 
-        result = np.zeros((M,n_vecs), dtype=upcast_char(self.dtype.char,
-                                                        other.dtype.char))
+        result = self._mul_out(out, (M,n_vecs),
+                               upcast_char(self.dtype.char, other.dtype.char))
 
         # csr_matvecs or csc_matvecs
         fn = getattr(sparsetools,self.format + '_matvecs')
-        fn(M, N, n_vecs, self.indptr, self.indices, self.data, other.ravel(), result.ravel())
+
+        if self.format == 'csr':
+            data = np.asarray(self.data, dtype=result.dtype)
+            other = np.ascontiguousarray(other, dtype=result.dtype).ravel()
+
+            def mul_rows(start, stop):
+                fn(stop - start, N, n_vecs, self.indptr[start:stop+1],
+                   self.indices, data, other, result[start:stop].ravel())
+            _run_blocks(mul_rows, _row_blocks(self.indptr,
+                                              _check_n_jobs(n_jobs)))
+        else:
+            fn(M, N, n_vecs, self.indptr, self.indices, self.data,
+               other.ravel(), result.ravel())
 
         return result
 
 
-    def _mul_sparse_matrix(self, other):
-        M, K1 = self.shape
-        K2, N = other.shape
+    def dot_nnz_bound(self, other):
+        """Upper bound on the number of nonzeros of the product with `other`
 
-        major_axis = self._swap((M,N))[0]
-        indptr = np.empty(major_axis + 1, dtype=np.intc)
+        The bound counts, for each row of ``self * other``, the stored
+        entries of `other` reached through the stored entries of that row
+        of `self`, but at most the length of the row.  It takes time and
+        memory proportional to the number of nonzeros of `self`, so it
+        can be used to check whether a product fits in memory before
+        computing it.
 
-        other = self.__class__(other) #convert to this format
-        fn = getattr(sparsetools, self.format + '_matmat_pass1')
-        fn( M, N, self.indptr, self.indices, \
-                  other.indptr, other.indices, \
-                  indptr)
+        Parameters
+        ----------
+        other : sparse matrix
+            The right-hand operand.
+
+        Returns
+        -------
+        nnz : int
+            Upper bound on ``(self * other).nnz``.
 
-        nnz = indptr[-1]
-        indices = np.empty(nnz, dtype=np.intc)
+        """
+        if self.shape[1] != other.shape[0]:
+            raise ValueError('dimension mismatch')
+        A, B, n_major, n_minor = self._matmat_operands(other)
+        return int(_matmat_row_work(A, B, n_minor)[-1])
+
+    def _matmat_operands(self, other):
+        """Return (A, B, n_major, n_minor) such that csr_matmat_pass1 and
+        csr_matmat_pass2 applied to A and B compute the product, or its
+        transpose for CSC matrices
+        """
+        M, N = self.shape[0], other.shape[1]
+        other = self.__class__(other) #convert to this format
+        if self.format == 'csr':
+            return self, other, M, N
+        else:
+            return other, self, N, M
+
+    def _mul_sparse_matrix(self, other, n_jobs=None):
+        A, B, n_major, n_minor = self._matmat_operands(other)
+        M, N = self.shape[0], other.shape[1]
+
+        n_jobs = _check_n_jobs(n_jobs)
+        work = None
+        if n_jobs > 1:
+            # balance the blocks by the work of the product
+            work = _matmat_row_work(A, B, n_minor)
+            blocks = _row_blocks(work, n_jobs)
+        else:
+            blocks = [(0, n_major)]
+
+        # the product may have too many entries for 32-bit indices even
+        # when the operands do not
+        maxval = None
+        if len(B.indptr) > 1 and int(A.nnz) * int(np.diff(B.indptr).max()) \
+                > np.iinfo(np.intc).max:
+            if work is None:
+                work = _matmat_row_work(A, B, n_minor)
+            maxval = work[-1]
+        idx_dtype = get_index_dtype((A.indptr, A.indices,
+                                     B.indptr, B.indices), maxval=maxval)
+        Ap = np.asarray(A.indptr, dtype=idx_dtype)
+        Aj = np.asarray(A.indices, dtype=idx_dtype)
+        Bp = np.asarray(B.indptr, dtype=idx_dtype)
+        Bj = np.asarray(B.indices, dtype=idx_dtype)
+
+        # first pass: number of entries in the rows of each block
+        Cp = {}
+        def count_rows(start, stop):
+            Cp[start] = np.empty(stop - start + 1, dtype=idx_dtype)
+            sparsetools.csr_matmat_pass1(stop - start, n_minor,
+                    Ap[start:stop+1], Aj, Bp, Bj, Cp[start])
+        _run_blocks(count_rows, blocks)
+
+        sizes  = [Cp[start][-1] for start, stop in blocks]
+        offset = dict(zip([start for start, stop in blocks],
+                          np.cumsum([0] + sizes[:-1])))
+        nnz = sum(sizes)
+        indices = np.empty(nnz, dtype=idx_dtype)
         data    = np.empty(nnz, dtype=upcast(self.dtype,other.dtype))
 
-        fn = getattr(sparsetools, self.format + '_matmat_pass2')
-        fn( M, N, self.indptr, self.indices, self.data, \
-                  other.indptr, other.indices, other.data, \
-                  indptr, indices, data)
+        # second pass: each block fills its own part of indices and data
+        def fill_rows(start, stop):
+            lo = offset[start]
+            hi = lo + Cp[start][-1]
+            sparsetools.csr_matmat_pass2(stop - start, n_minor,
+                    Ap[start:stop+1], Aj, A.data, Bp, Bj, B.data,
+                    Cp[start], indices[lo:hi], data[lo:hi])
+        _run_blocks(fill_rows, blocks)
+
+        # the second pass drops explicit zeros, which leaves gaps between
+        # the blocks
+        counts = [Cp[start][-1] for start, stop in blocks]
+        if counts[:-1] != sizes[:-1]:
+            indices = np.concatenate([indices[offset[start]:][:n]
+                        for (start, stop), n in zip(blocks, counts)])
+            data = np.concatenate([data[offset[start]:][:n]
+                        for (start, stop), n in zip(blocks, counts)])
+
+        indptr = np.empty(n_major + 1, dtype=idx_dtype)
+        indptr[0] = 0
+        end = 0
+        for (start, stop), n in zip(blocks, counts):
+            indptr[start+1:stop+1] = Cp[start][1:] + end
+            end += n
 
         return self.__class__((data,indices,indptr),shape=(M,N))
 
@@ -359,6 +530,67 @@ class _cs_matrix(_data_matrix):
             raise IndexError("invalid index")
 
 
+    def _major_index_fancy(self, idx):
+        """Index along the major axis where idx is an array of indices
+        or a boolean mask, e.g. self[idx,:] for CSR.
+        """
+        M, N = self._swap(self.shape)
+        idx = _index_array(idx, M)
+
+        start = self.indptr[idx]
+        lengths = self.indptr[idx + 1] - start
+        nnz = int(lengths.sum())
+
+        idx_dtype = get_index_dtype((self.indices,), maxval=nnz)
+        indptr = np.zeros(len(idx) + 1, dtype=idx_dtype)
+        np.cumsum(lengths, out=indptr[1:])
+
+        # position in self of each entry of the result
+        pos = np.arange(nnz, dtype=np.intp)
+        pos += np.repeat(start - indptr[:-1], lengths)
+
+        indices = self.indices.take(pos).astype(idx_dtype)
+        data = self.data.take(pos)
+
+        shape = self._swap((len(idx), N))
+        return self.__class__((data, indices, indptr), shape=shape)
+
+    def _minor_index_fancy(self, idx):
+        """Index along the minor axis where idx is an array of indices
+        or a boolean mask, e.g. self[:,idx] for CSR.
+
+        Each stored entry is copied once for every occurrence of its
+        minor index in idx.
+        """
+        M, N = self._swap(self.shape)
+        idx = _index_array(idx, N)
+
+        # positions in idx at which each minor index occurs
+        order = np.argsort(idx, kind='mergesort')
+        sorted_idx = idx[order]
+        indices = self.indices[:self.nnz]
+        lo = np.searchsorted(sorted_idx, indices, side='left')
+        counts = np.searchsorted(sorted_idx, indices, side='right') - lo
+
+        cumcounts = np.empty(len(counts) + 1, dtype=np.intp)
+        cumcounts[0] = 0
+        np.cumsum(counts, out=cumcounts[1:])
+        nnz = int(cumcounts[-1])
+
+        idx_dtype = get_index_dtype((self.indptr,), maxval=max(nnz, len(idx)))
+        indptr = cumcounts[self.indptr].astype(idx_dtype)
+
+        # stored entry of self and occurrence in idx for each result entry
+        src = np.repeat(np.arange(len(counts), dtype=np.intp), counts)
+        pos = np.arange(nnz, dtype=np.intp) - cumcounts[:-1].repeat(counts)
+        pos += lo[src]
+
+        indices = order[pos].astype(idx_dtype)
+        data = self.data.take(src)
+
+        shape = self._swap((M, len(idx)))
+        return self.__class__((data, indices, indptr), shape=shape)
+
     def _get_single_element(self,row,col):
         M, N = self.shape
         if (row < 0):
@@ -462,64 +694,138 @@ class _cs_matrix(_data_matrix):
     def __setitem__(self, key, val):
         if isinstance(key, tuple):
             row,col = key
-            if not (isscalarlike(row) and isscalarlike(col)):
-                raise NotImplementedError("Fancy indexing in assignment not "
-                                          "supported for csr matrices.")
+            if isinstance(row, slice) or isinstance(col, slice):
+                raise NotImplementedError("Slicing in assignment not "
+                                          "supported for %s matrices." %
+                                          self.format)
+            if isscalarlike(row) and isscalarlike(col):
+                if not np.isscalar(val):
+                    raise ValueError('setting an array element with a '
+                                     'sequence')
+                val = self.dtype.type(val)
+
+            row = np.asarray(row)
+            col = np.asarray(col)
+            if row.dtype.kind not in 'iu' or col.dtype.kind not in 'iu':
+                raise IndexError("invalid index")
+            row, col = np.broadcast_arrays(row, col)
+
+            # broadcast the values to the shape of the index arrays
+            x = np.empty(row.shape, dtype=self.dtype)
+            x[...] = val
+
+            # check bounds before narrowing the indices, so that large
+            # values cannot wrap around
             M, N = self.shape
-            if (row < 0):
-                row += M
-            if (col < 0):
-                col += N
-            if not (0<=row<M) or not (0<=col<N):
+            row = row.ravel().astype(np.int64)
+            col = col.ravel().astype(np.int64)
+            row[row < 0] += M
+            col[col < 0] += N
+            if len(row) and (row.min() < 0 or row.max() >= M or
+                             col.min() < 0 or col.max() >= N):
                 raise IndexError("index out of bounds")
 
-            major_index, minor_index = self._swap((row,col))
-
-            start = self.indptr[major_index]
-            end   = self.indptr[major_index+1]
-            indxs = np.where(minor_index == self.indices[start:end])[0]
-
-            num_matches = len(indxs)
-
-
-            if not np.isscalar(val):
-                raise ValueError('setting an array element with a sequence')
-
-            val = self.dtype.type(val)
+            idx_dtype = get_index_dtype(maxval=max(M, N))
+            row = row.astype(idx_dtype)
+            col = col.astype(idx_dtype)
 
-            if num_matches == 0:
-                #entry not already present
-                warn('changing the sparsity structure of a %s_matrix is expensive. ' \
-                        'lil_matrix is more efficient.' % self.format, \
-                        SparseEfficiencyWarning)
-
-                if self.has_sorted_indices:
-                    # preserve sorted order
-                    newindx = start + self.indices[start:end].searchsorted(minor_index)
-                else:
-                    newindx = start
-
-                val         = np.array([val],         dtype=self.data.dtype)
-                minor_index = np.array([minor_index], dtype=self.indices.dtype)
-
-                self.data    = np.concatenate((self.data[:newindx],    val,         self.data[newindx:]))
-                self.indices = np.concatenate((self.indices[:newindx], minor_index, self.indices[newindx:]))
-                self.indptr  = self.indptr.copy()
+            major_index, minor_index = self._swap((row,col))
+            self._set_many(major_index, minor_index, x.ravel())
+        else:
+            # We should allow slices here!
+            raise IndexError("invalid index")
 
-                self.indptr[major_index+1:] += 1
+    def _set_many(self, major, minor, x):
+        """Set the entries (major[k], minor[k]) to x[k], in place
 
-            elif num_matches == 1:
-                #entry appears exactly once
-                self.data[start:end][indxs[0]] = val
+        The new coordinates are sorted and merged into indptr, indices
+        and data in a single pass, so setting k entries costs
+        O(nnz + k log k) rather than O(k * nnz).  When a coordinate is
+        repeated, the last value given for it is used.
+        """
+        if len(x) == 0:
+            return
+
+        minor_dim = self._swap(self.shape)[1]
+
+        # sort the new entries, keeping the last of any repeated ones
+        key = major.astype(np.int64) * minor_dim + minor
+        order = np.argsort(key, kind='mergesort')
+        key = key[order]
+        last = np.ones(len(key), dtype=bool)
+        last[:-1] = key[1:] != key[:-1]
+        key   = key[last]
+        major = major[order][last]
+        minor = minor[order][last]
+        x     = x[order][last]
+
+        nnz = self.nnz
+        if len(key) == 1:
+            # a single entry only needs a search of its own row
+            start = self.indptr[major[0]]
+            end   = self.indptr[major[0] + 1]
+            row_minor = self.indices[start:end]
+            matches = np.where(row_minor == minor[0])[0]
+            found = np.array([len(matches) == 1])
+            dup = np.array([len(matches) > 1])
+            if found[0]:
+                pos = start + matches
+            elif (row_minor[1:] >= row_minor[:-1]).all():
+                # preserve sorted order
+                pos = start + row_minor.searchsorted(minor)
             else:
-                #entry appears more than once
-                raise ValueError('nonzero entry (%d,%d) occurs more than once'
-                                % (row,col))
-
-            self.check_format(full_check=True)
+                pos = np.array([start])
         else:
-            # We should allow slices here!
-            raise IndexError("invalid index")
+            self.sort_indices()
+            major_indices = np.empty(nnz, dtype=self.indptr.dtype)
+            sparsetools.expandptr(len(self.indptr) - 1, self.indptr,
+                                  major_indices)
+            old_key = major_indices.astype(np.int64) * minor_dim + self.indices
+            pos = old_key.searchsorted(key)
+            found = pos < nnz
+            found[found] = old_key[pos[found]] == key[found]
+            dup = found & (pos + 1 < nnz)
+            dup[dup] = old_key[pos[dup] + 1] == key[dup]
+
+        if dup.any():
+            row,col = self._swap((major[dup][0], minor[dup][0]))
+            raise ValueError('nonzero entry (%d,%d) occurs more than once'
+                             % (row,col))
+
+        # update the entries that are already present
+        self.data[pos[found]] = x[found]
+
+        # insert the rest
+        new = ~found
+        if not new.any():
+            return
+
+        warn('changing the sparsity structure of a %s_matrix is expensive. ' \
+                'lil_matrix is more efficient.' % self.format, \
+                SparseEfficiencyWarning)
+
+        pos = pos[new]
+        major = major[new]
+        # positions of the new entries in the merged arrays
+        new_pos = pos + np.arange(len(pos))
+        keep = np.ones(nnz + len(pos), dtype=bool)
+        keep[new_pos] = False
+
+        idx_dtype = get_index_dtype((self.indices, self.indptr, minor),
+                                    maxval=nnz + len(pos),
+                                    check_contents=True)
+        indices = np.empty(nnz + len(pos), dtype=idx_dtype)
+        indices[keep] = self.indices
+        indices[new_pos] = minor[new]
+        data = np.empty(nnz + len(pos), dtype=self.data.dtype)
+        data[keep] = self.data
+        data[new_pos] = x[new]
+
+        major_dim = len(self.indptr) - 1
+        shift = major.searchsorted(np.arange(major_dim + 1))
+        self.indptr = (self.indptr + shift).astype(idx_dtype)
+        self.indices = indices
+        self.data = data
 
     ######################
     # Conversion methods #
@@ -545,9 +851,13 @@ class _cs_matrix(_data_matrix):
             data = data.copy()
             minor_indices = minor_indices.copy()
 
-        major_indices = np.empty(len(minor_indices), dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(self.nnz, major_dim))
+        major_indices = np.empty(len(minor_indices), dtype=idx_dtype)
 
-        sparsetools.expandptr(major_dim,self.indptr,major_indices)
+        sparsetools.expandptr(major_dim,
+                              np.asarray(self.indptr, dtype=idx_dtype),
+                              major_indices)
 
         row,col = self._swap((major_indices,minor_indices))
 
@@ -668,13 +978,18 @@ class _cs_matrix(_data_matrix):
         fn = getattr(sparsetools, self.format + op + self.format)
 
         maxnnz  = self.nnz + other.nnz
-        indptr  = np.empty_like(self.indptr)
-        indices = np.empty(maxnnz, dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indptr, self.indices,
+                                     other.indptr, other.indices),
+                                    maxval=maxnnz)
+        indptr  = np.empty(self.indptr.shape, dtype=idx_dtype)
+        indices = np.empty(maxnnz, dtype=idx_dtype)
         data    = np.empty(maxnnz, dtype=upcast(self.dtype,other.dtype))
 
         fn(self.shape[0], self.shape[1], \
-                self.indptr,  self.indices,  self.data,
-                other.indptr, other.indices, other.data,
+                np.asarray(self.indptr,  dtype=idx_dtype),
+                np.asarray(self.indices, dtype=idx_dtype), self.data,
+                np.asarray(other.indptr,  dtype=idx_dtype),
+                np.asarray(other.indices, dtype=idx_dtype), other.data,
                 indptr, indices, data)
 
         actual_nnz = indptr[-1]
@@ -688,3 +1003,53 @@ class _cs_matrix(_data_matrix):
         A = self.__class__((data, indices, indptr), shape=self.shape)
 
         return A
+
+
+def _matmat_row_work(A, B, n_minor):
+    """Cumulative upper bounds on the number of entries in the rows of the
+    product of compressed matrices A and B, computed as by csr_matmat_pass1
+
+    Returns an array of length n_major + 1, like an index pointer.
+    """
+    # stored entries of B reached through each stored entry of A
+    nnz_A = A.indptr[-1]
+    reached = np.empty(nnz_A + 1, dtype=np.int64)
+    reached[0] = 0
+    np.cumsum(np.diff(B.indptr)[A.indices[:nnz_A]], out=reached[1:])
+
+    work = np.empty(len(A.indptr), dtype=np.int64)
+    work[0] = 0
+    row_bound = reached[A.indptr[1:]] - reached[A.indptr[:-1]]
+    np.cumsum(np.minimum(row_bound, n_minor), out=work[1:])
+    return work
+
+
+def _index_array(idx, n):
+    """Return idx, an array of indices or a boolean mask along an axis of
+    length n, as an array of non-negative indices
+    """
+    idx = np.asarray(idx)
+    if idx.dtype == np.bool_:
+        if idx.shape != (n,):
+            raise IndexError('boolean index does not match dimension %d' % n)
+        return idx.nonzero()[0]
+
+    if idx.ndim != 1:
+        raise IndexError('index must be a 1-d array')
+    try:
+        idx = idx.astype(np.intp)
+    except (TypeError, ValueError):
+        raise IndexError('invalid index')
+
+    if len(idx) == 0:
+        return idx
+    max_idx = idx.max()
+    if max_idx >= n:
+        raise IndexError('index (%d) out of range' % max_idx)
+    min_idx = idx.min()
+    if min_idx < -n:
+        raise IndexError('index (%d) out of range' % min_idx)
+    if min_idx < 0:
+        idx = idx.copy()
+        idx[idx < 0] += n
+    return idx
@@ -11,7 +11,7 @@ from warnings import warn
 
 import numpy as np
 
-from sputils import upcast
+from sputils import upcast, get_index_dtype
 
 from csr import csr_matrix
 from csc import csc_matrix
@@ -208,15 +208,16 @@ def identity(n, dtype='d', format=None):
 
     """
 
+    idx_dtype = get_index_dtype(maxval=n)
     if format in ['csr','csc']:
-        indptr  = np.arange(n+1, dtype=np.intc)
-        indices = np.arange(n,   dtype=np.intc)
+        indptr  = np.arange(n+1, dtype=idx_dtype)
+        indices = np.arange(n,   dtype=idx_dtype)
         data    = np.ones(n,     dtype=dtype)
         cls = eval('%s_matrix' % format)
         return cls((data,indices,indptr),(n,n))
     elif format == 'coo':
-        row  = np.arange(n, dtype=np.intc)
-        col  = np.arange(n, dtype=np.intc)
+        row  = np.arange(n, dtype=idx_dtype)
+        col  = np.arange(n, dtype=idx_dtype)
         data = np.ones(n, dtype=dtype)
         return coo_matrix((data,(row,col)),(n,n))
     elif format == 'dia':
@@ -296,9 +297,14 @@ def kron(A, B, format=None):
             # kronecker product is the zero matrix
             return coo_matrix( output_shape )
 
+        # the indices of the product may need 64 bits even when those of
+        # A and B do not
+        idx_dtype = get_index_dtype((A.row, A.col, B.row, B.col),
+                                    maxval=max(output_shape))
+
         # expand entries of a into blocks
-        row  = A.row.repeat(B.nnz)
-        col  = A.col.repeat(B.nnz)
+        row  = A.row.astype(idx_dtype).repeat(B.nnz)
+        col  = A.col.astype(idx_dtype).repeat(B.nnz)
         data = A.data.repeat(B.nnz)
 
         row *= B.shape[0]
@@ -468,8 +474,8 @@ def bmat(blocks, format=None, dtype=None):
     M,N = blocks.shape
 
     block_mask   = np.zeros(blocks.shape,    dtype=np.bool)
-    brow_lengths = np.zeros(blocks.shape[0], dtype=np.intc)
-    bcol_lengths = np.zeros(blocks.shape[1], dtype=np.intc)
+    brow_lengths = np.zeros(blocks.shape[0], dtype=np.int64)
+    bcol_lengths = np.zeros(blocks.shape[1], dtype=np.int64)
 
     # convert everything to COO format
     for i in range(M):
@@ -505,9 +511,12 @@ def bmat(blocks, format=None, dtype=None):
     row_offsets = np.concatenate(([0], np.cumsum(brow_lengths)))
     col_offsets = np.concatenate(([0], np.cumsum(bcol_lengths)))
 
+    shape = (np.sum(brow_lengths), np.sum(bcol_lengths))
+    idx_dtype = get_index_dtype(maxval=max(shape))
+
     data = np.empty(nnz, dtype=dtype)
-    row  = np.empty(nnz, dtype=np.intc)
-    col  = np.empty(nnz, dtype=np.intc)
+    row  = np.empty(nnz, dtype=idx_dtype)
+    col  = np.empty(nnz, dtype=idx_dtype)
 
     nnz = 0
     for i in range(M):
@@ -523,7 +532,6 @@ def bmat(blocks, format=None, dtype=None):
 
                 nnz += A.nnz
 
-    shape = (np.sum(brow_lengths), np.sum(bcol_lengths))
     return coo_matrix((data, (row, col)), shape=shape).asformat(format)
 
 def block_diag(mats, format=None, dtype=None):
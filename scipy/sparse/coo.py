@@ -11,7 +11,8 @@ import numpy as np
 from sparsetools import coo_tocsr, coo_todense, coo_matvec
 from base import isspmatrix
 from data import _data_matrix
-from sputils import upcast, upcast_char, to_native, isshape, getdtype, isintlike
+from sputils import upcast, upcast_char, to_native, isshape, getdtype, \
+        isintlike, get_index_dtype
 
 class coo_matrix(_data_matrix):
     """
@@ -130,8 +131,9 @@ class coo_matrix(_data_matrix):
                 except TypeError:
                     raise TypeError('invalid input format')
 
-                self.row  = np.array(ij[0], copy=copy, dtype=np.intc)
-                self.col  = np.array(ij[1], copy=copy, dtype=np.intc)
+                idx_dtype = get_index_dtype(ij, check_contents=True)
+                self.row  = np.array(ij[0], copy=copy, dtype=idx_dtype)
+                self.col  = np.array(ij[1], copy=copy, dtype=idx_dtype)
                 self.data = np.array(  obj, copy=copy)
 
                 if shape is None:
@@ -210,9 +212,10 @@ class coo_matrix(_data_matrix):
             warn("col index array has non-integer dtype (%s) " \
                     % self.col.dtype.name )
 
-        # only support 32-bit ints for now
-        self.row  = np.asarray(self.row, dtype=np.intc)
-        self.col  = np.asarray(self.col, dtype=np.intc)
+        # use 32-bit indices unless the values need 64 bits
+        idx_dtype = get_index_dtype((self.row, self.col), check_contents=True)
+        self.row  = np.asarray(self.row, dtype=idx_dtype)
+        self.col  = np.asarray(self.col, dtype=idx_dtype)
         self.data = to_native(self.data)
 
         if nnz > 0:
@@ -261,12 +264,15 @@ class coo_matrix(_data_matrix):
             return csc_matrix(self.shape, dtype=self.dtype)
         else:
             M,N = self.shape
-            indptr  = np.empty(N + 1,    dtype=np.intc)
-            indices = np.empty(self.nnz, dtype=np.intc)
+            idx_dtype = get_index_dtype((self.row, self.col),
+                                        maxval=self.nnz)
+            indptr  = np.empty(N + 1,    dtype=idx_dtype)
+            indices = np.empty(self.nnz, dtype=idx_dtype)
             data    = np.empty(self.nnz, dtype=upcast(self.dtype))
 
             coo_tocsr(N, M, self.nnz, \
-                      self.col, self.row, self.data, \
+                      np.asarray(self.col, dtype=idx_dtype),
+                      np.asarray(self.row, dtype=idx_dtype), self.data, \
                       indptr, indices, data)
 
             A = csc_matrix((data, indices, indptr), shape=self.shape)
@@ -299,12 +305,15 @@ class coo_matrix(_data_matrix):
             return csr_matrix(self.shape, dtype=self.dtype)
         else:
             M,N = self.shape
-            indptr  = np.empty(M + 1,    dtype=np.intc)
-            indices = np.empty(self.nnz, dtype=np.intc)
+            idx_dtype = get_index_dtype((self.row, self.col),
+                                        maxval=self.nnz)
+            indptr  = np.empty(M + 1,    dtype=idx_dtype)
+            indices = np.empty(self.nnz, dtype=idx_dtype)
             data    = np.empty(self.nnz, dtype=upcast(self.dtype))
 
             coo_tocsr(M, N, self.nnz, \
-                      self.row, self.col, self.data, \
+                      np.asarray(self.row, dtype=idx_dtype),
+                      np.asarray(self.col, dtype=idx_dtype), self.data, \
                       indptr, indices, data)
 
             A = csr_matrix((data, indices, indptr), shape=self.shape)
@@ -9,7 +9,7 @@ from warnings import warn
 import numpy as np
 
 from sparsetools import csc_tocsr
-from sputils import upcast, isintlike
+from sputils import upcast, isintlike, get_index_dtype
 
 from compressed import _cs_matrix
 
@@ -123,12 +123,15 @@ class csc_matrix(_cs_matrix):
 
     def tocsr(self):
         M,N = self.shape
-        indptr  = np.empty(M + 1,    dtype=np.intc)
-        indices = np.empty(self.nnz, dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(self.nnz, N))
+        indptr  = np.empty(M + 1,    dtype=idx_dtype)
+        indices = np.empty(self.nnz, dtype=idx_dtype)
         data    = np.empty(self.nnz, dtype=upcast(self.dtype))
 
         csc_tocsr(M, N, \
-                 self.indptr, self.indices, self.data, \
+                 np.asarray(self.indptr, dtype=idx_dtype),
+                 np.asarray(self.indices, dtype=idx_dtype), self.data, \
                  indptr, indices, data)
 
         from csr import csr_matrix
@@ -137,6 +140,18 @@ class csc_matrix(_cs_matrix):
         return A
 
 
+    def getrow(self, i):
+        """Returns a copy of row i of the matrix, as a (1 x n)
+        CSR matrix (row vector).
+        """
+        return self._minor_index_fancy([i]).tocsr()
+
+    def getcol(self, i):
+        """Returns a copy of column i of the matrix, as a (m x 1)
+        CSC matrix (column vector).
+        """
+        return self._major_index_fancy([i])
+
     def __getitem__(self, key):
         # use CSR to implement fancy indexing
         if isinstance(key, tuple):
@@ -150,13 +165,11 @@ class csc_matrix(_cs_matrix):
                 if isintlike(col) or isinstance(col,slice):
                     return self.T[col,row].T
                 else:
-                    row = np.asarray(row, dtype=np.intc)
-                    col = np.asarray(col, dtype=np.intc)
-                    if len(row.shape) == 1:
+                    if np.ndim(row) == 1:
                         return self.T[col,row]
-                    elif len(row.shape) == 2:
-                        row = row.reshape(-1)
-                        col = col.reshape(-1,1)
+                    elif np.ndim(row) == 2:
+                        row = np.ravel(row)
+                        col = np.reshape(col, (-1,1))
                         return self.T[col,row].T
                     else:
                         raise NotImplementedError('unsupported indexing')
@@ -11,10 +11,10 @@ import numpy as np
 
 from sparsetools import csr_tocsc, csr_tobsr, csr_count_blocks, \
         get_csr_submatrix, csr_sample_values
-from sputils import upcast, isintlike
+from sputils import upcast, isintlike, get_index_dtype
 
 
-from compressed import _cs_matrix
+from compressed import _cs_matrix, _index_array
 
 class csr_matrix(_cs_matrix):
     """
@@ -133,12 +133,15 @@ class csr_matrix(_cs_matrix):
             return self
 
     def tocsc(self):
-        indptr  = np.empty(self.shape[1] + 1, dtype=np.intc)
-        indices = np.empty(self.nnz, dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(self.nnz, self.shape[0]))
+        indptr  = np.empty(self.shape[1] + 1, dtype=idx_dtype)
+        indices = np.empty(self.nnz, dtype=idx_dtype)
         data    = np.empty(self.nnz, dtype=upcast(self.dtype))
 
         csr_tocsc(self.shape[0], self.shape[1], \
-                  self.indptr, self.indices, self.data, \
+                  np.asarray(self.indptr, dtype=idx_dtype),
+                  np.asarray(self.indices, dtype=idx_dtype), self.data, \
                   indptr, indices, data)
 
         from csc import csc_matrix
@@ -166,11 +169,14 @@ class csr_matrix(_cs_matrix):
 
             blks = csr_count_blocks(M,N,R,C,self.indptr,self.indices)
 
-            indptr  = np.empty(M//R + 1,    dtype=np.intc)
-            indices = np.empty(blks,       dtype=np.intc)
+            idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                        maxval=max(N//C, blks))
+            indptr  = np.empty(M//R + 1,    dtype=idx_dtype)
+            indices = np.empty(blks,       dtype=idx_dtype)
             data    = np.zeros((blks,R,C), dtype=self.dtype)
 
-            csr_tobsr(M, N, R, C, self.indptr, self.indices, self.data, \
+            csr_tobsr(M, N, R, C, np.asarray(self.indptr, dtype=idx_dtype),
+                    np.asarray(self.indices, dtype=idx_dtype), self.data, \
                     indptr, indices, data.ravel() )
 
             return bsr_matrix((data,indices,indptr), shape=self.shape)
@@ -183,44 +189,19 @@ class csr_matrix(_cs_matrix):
         return (x[0],x[1])
 
 
-    def __getitem__(self, key):
-        def asindices(x):
-            try:
-                x = np.asarray(x, dtype=np.intc)
-            except:
-                raise IndexError('invalid index')
-            else:
-                return x
-        def check_bounds(indices,N):
-            max_indx = indices.max()
-            if max_indx >= N:
-                raise IndexError('index (%d) out of range' % max_indx)
-
-            min_indx = indices.min()
-            if min_indx < -N:
-                raise IndexError('index (%d) out of range' % (N + min_indx))
-
-            return (min_indx,max_indx)
-
-        def extractor(indices,N):
-            """Return a sparse matrix P so that P*self implements
-            slicing of the form self[[1,2,3],:]
-            """
-            indices = asindices(indices)
-
-            (min_indx,max_indx) = check_bounds(indices,N)
-
-            if min_indx < 0:
-                indices = indices.copy()
-                indices[indices < 0] += N
-
-            indptr  = np.arange(len(indices) + 1, dtype=np.intc)
-            data    = np.ones(len(indices), dtype=self.dtype)
-            shape   = (len(indices),N)
-
-            return csr_matrix((data,indices,indptr), shape=shape)
+    def getrow(self, i):
+        """Returns a copy of row i of the matrix, as a (1 x n)
+        CSR matrix (row vector).
+        """
+        return self._major_index_fancy([i])
 
+    def getcol(self, i):
+        """Returns a copy of column i of the matrix, as a (m x 1)
+        CSR matrix (column vector).
+        """
+        return self._minor_index_fancy([i])
 
+    def __getitem__(self, key):
         if isinstance(key, tuple):
             row = key[0]
             col = key[1]
@@ -232,55 +213,48 @@ class csr_matrix(_cs_matrix):
                 elif isinstance(col, slice):
                     return self._get_row_slice(row, col)      #[i,1:2]
                 else:
-                    P = extractor(col,self.shape[1]).T        #[i,[1,2]]
-                    return self[row,:]*P
+                    return self.getrow(row)._minor_index_fancy(col) #[i,[1,2]]
 
             elif isinstance(row, slice):
                 #[1:2,??]
                 if isintlike(col) or isinstance(col, slice):
                     return self._get_submatrix(row, col)      #[1:2,j]
                 else:
-                    P = extractor(col,self.shape[1]).T        #[1:2,[1,2]]
-                    return self[row,:]*P
+                    return self[row,:]._minor_index_fancy(col) #[1:2,[1,2]]
 
             else:
                 #[[1,2],??] or [[[1],[2]],??]
                 if isintlike(col) or isinstance(col,slice):
-                    P = extractor(row, self.shape[0])        #[[1,2],j] or [[1,2],1:2]
-                    return (P*self)[:,col]
+                    P = self._major_index_fancy(row)          #[[1,2],j] or [[1,2],1:2]
+                    return P[:,col]
+
+                elif np.ndim(row) == 1:
+                    row = _index_array(row, self.shape[0])    #[[1,2],[1,2]]
+                    col = _index_array(col, self.shape[1])
+                    if len(row) != len(col):
+                        raise IndexError('number of row and column indices differ')
+
+                    num_samples = len(row)
+                    val = np.empty(num_samples, dtype=self.dtype)
+                    csr_sample_values(self.shape[0], self.shape[1],
+                                      self.indptr, self.indices, self.data,
+                                      num_samples,
+                                      row.astype(self.indices.dtype),
+                                      col.astype(self.indices.dtype), val)
+                    return np.asmatrix(val)
+
+                elif np.ndim(row) == 2:
+                    row = np.ravel(row)                       #[[[1],[2]],[1,2]]
+                    P = self._major_index_fancy(row)
+                    return P._minor_index_fancy(col)
 
                 else:
-                    row = asindices(row)
-                    col = asindices(col)
-                    if len(row.shape) == 1:
-                        if len(row) != len(col):             #[[1,2],[1,2]]
-                            raise IndexError('number of row and column indices differ')
-
-                        check_bounds(row, self.shape[0])
-                        check_bounds(col, self.shape[1])
-
-                        num_samples = len(row)
-                        val = np.empty(num_samples, dtype=self.dtype)
-                        csr_sample_values(self.shape[0], self.shape[1],
-                                          self.indptr, self.indices, self.data,
-                                          num_samples, row, col, val)
-                        #val = []
-                        #for i,j in zip(row,col):
-                        #    val.append(self._get_single_element(i,j))
-                        return np.asmatrix(val)
-
-                    elif len(row.shape) == 2:
-                        row = np.ravel(row)                   #[[[1],[2]],[1,2]]
-                        P = extractor(row, self.shape[0])
-                        return (P*self)[:,col]
-
-                    else:
-                        raise NotImplementedError('unsupported indexing')
+                    raise NotImplementedError('unsupported indexing')
 
         elif isintlike(key) or isinstance(key,slice):
             return self[key,:]                                #[i] or [1:2]
         else:
-            return self[asindices(key),:]                     #[[1,2]]
+            return self._major_index_fancy(key)               #[[1,2]]
 
 
     def _get_single_element(self,row,col):
@@ -0,0 +1,5798 @@
+/* File: _iterativemodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 22:52:11 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *_iterative_error;
+static PyObject *_iterative_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {double r,i;} complex_double;
+typedef struct {float r,i;} complex_float;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define pyobj_from_complex_float1(v) (PyComplex_FromDoubles(v.r,v.i))
+#define pyobj_from_complex_double1(v) (PyComplex_FromDoubles(v.r,v.i))
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(_iterative_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _iterative_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _iterative_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int float_from_pyobj(float* v,PyObject *obj,const char *errmess) {
+    double d=0.0;
+    if (double_from_pyobj(&d,obj,errmess)) {
+        *v = (float)d;
+        return 1;
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(sbicgrevcom,SBICGREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*);
+extern void F_FUNC(dbicgrevcom,DBICGREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*);
+extern void F_FUNC(cbicgrevcom,CBICGREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*);
+extern void F_FUNC(zbicgrevcom,ZBICGREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*);
+extern void F_FUNC(sbicgstabrevcom,SBICGSTABREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*);
+extern void F_FUNC(dbicgstabrevcom,DBICGSTABREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*);
+extern void F_FUNC(cbicgstabrevcom,CBICGSTABREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*);
+extern void F_FUNC(zbicgstabrevcom,ZBICGSTABREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*);
+extern void F_FUNC(scgrevcom,SCGREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*);
+extern void F_FUNC(dcgrevcom,DCGREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*);
+extern void F_FUNC(ccgrevcom,CCGREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*);
+extern void F_FUNC(zcgrevcom,ZCGREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*);
+extern void F_FUNC(scgsrevcom,SCGSREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*);
+extern void F_FUNC(dcgsrevcom,DCGSREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*);
+extern void F_FUNC(ccgsrevcom,CCGSREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*);
+extern void F_FUNC(zcgsrevcom,ZCGSREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*);
+extern void F_FUNC(sqmrrevcom,SQMRREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*);
+extern void F_FUNC(dqmrrevcom,DQMRREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*);
+extern void F_FUNC(cqmrrevcom,CQMRREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*);
+extern void F_FUNC(zqmrrevcom,ZQMRREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*);
+extern void F_FUNC(sgmresrevcom,SGMRESREVCOM)(int*,float*,float*,int*,float*,int*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*);
+extern void F_FUNC(dgmresrevcom,DGMRESREVCOM)(int*,double*,double*,int*,double*,int*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*);
+extern void F_FUNC(cgmresrevcom,CGMRESREVCOM)(int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*);
+extern void F_FUNC(zgmresrevcom,ZGMRESREVCOM)(int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*);
+extern void F_FUNC(sstoptest2,SSTOPTEST2)(int*,float*,float*,float*,float*,float*,int*);
+extern void F_FUNC(dstoptest2,DSTOPTEST2)(int*,double*,double*,double*,double*,double*,int*);
+extern void F_FUNC(cstoptest2,CSTOPTEST2)(int*,complex_float*,complex_float*,float*,float*,float*,int*);
+extern void F_FUNC(zstoptest2,ZSTOPTEST2)(int*,complex_double*,complex_double*,double*,double*,double*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/******************************** sbicgrevcom ********************************/
+static char doc_f2py_rout__iterative_sbicgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``sbicgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('f') with bounds (n)\n"
+"x : input rank-1 array('f') with bounds (n)\n"
+"work : in/output rank-1 array('f') with bounds (6 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(sbicgrevcom,SBICGREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_sbicgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  float sclr1 = 0;
+  float sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.sbicgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.sbicgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.sbicgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.sbicgrevcom to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.sbicgrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.sbicgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.sbicgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.sbicgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.sbicgrevcom to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=6 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.sbicgrevcom to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nifiiiffi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of sbicgrevcom *****************************/
+
+/******************************** dbicgrevcom ********************************/
+static char doc_f2py_rout__iterative_dbicgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``dbicgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('d') with bounds (n)\n"
+"x : input rank-1 array('d') with bounds (n)\n"
+"work : in/output rank-1 array('d') with bounds (6 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(dbicgrevcom,DBICGREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_dbicgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  double sclr1 = 0;
+  double sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.dbicgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.dbicgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.dbicgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.dbicgrevcom to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.dbicgrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.dbicgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.dbicgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.dbicgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.dbicgrevcom to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=6 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.dbicgrevcom to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nidiiiddi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of dbicgrevcom *****************************/
+
+/******************************** cbicgrevcom ********************************/
+static char doc_f2py_rout__iterative_cbicgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``cbicgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('F') with bounds (n)\n"
+"x : input rank-1 array('F') with bounds (n)\n"
+"work : in/output rank-1 array('F') with bounds (6 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(cbicgrevcom,CBICGREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*); */
+static PyObject *f2py_rout__iterative_cbicgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_float sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_float sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.cbicgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.cbicgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.cbicgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.cbicgrevcom to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.cbicgrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.cbicgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.cbicgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.cbicgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.cbicgrevcom to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=6 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.cbicgrevcom to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_float1(sclr1);
+  sclr2_capi = pyobj_from_complex_float1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NifiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of cbicgrevcom *****************************/
+
+/******************************** zbicgrevcom ********************************/
+static char doc_f2py_rout__iterative_zbicgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``zbicgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('D') with bounds (n)\n"
+"x : input rank-1 array('D') with bounds (n)\n"
+"work : in/output rank-1 array('D') with bounds (6 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(zbicgrevcom,ZBICGREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*); */
+static PyObject *f2py_rout__iterative_zbicgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_double sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_double sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.zbicgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.zbicgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.zbicgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.zbicgrevcom to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.zbicgrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.zbicgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.zbicgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.zbicgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.zbicgrevcom to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=6 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.zbicgrevcom to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_double1(sclr1);
+  sclr2_capi = pyobj_from_complex_double1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NidiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of zbicgrevcom *****************************/
+
+/****************************** sbicgstabrevcom ******************************/
+static char doc_f2py_rout__iterative_sbicgstabrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``sbicgstabrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('f') with bounds (n)\n"
+"x : input rank-1 array('f') with bounds (n)\n"
+"work : in/output rank-1 array('f') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(sbicgstabrevcom,SBICGSTABREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_sbicgstabrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  float sclr1 = 0;
+  float sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.sbicgstabrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.sbicgstabrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.sbicgstabrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.sbicgstabrevcom to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.sbicgstabrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.sbicgstabrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.sbicgstabrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.sbicgstabrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.sbicgstabrevcom to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.sbicgstabrevcom to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nifiiiffi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of sbicgstabrevcom ***************************/
+
+/****************************** dbicgstabrevcom ******************************/
+static char doc_f2py_rout__iterative_dbicgstabrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``dbicgstabrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('d') with bounds (n)\n"
+"x : input rank-1 array('d') with bounds (n)\n"
+"work : in/output rank-1 array('d') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(dbicgstabrevcom,DBICGSTABREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_dbicgstabrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  double sclr1 = 0;
+  double sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.dbicgstabrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.dbicgstabrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.dbicgstabrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.dbicgstabrevcom to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.dbicgstabrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.dbicgstabrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.dbicgstabrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.dbicgstabrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.dbicgstabrevcom to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.dbicgstabrevcom to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nidiiiddi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of dbicgstabrevcom ***************************/
+
+/****************************** cbicgstabrevcom ******************************/
+static char doc_f2py_rout__iterative_cbicgstabrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``cbicgstabrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('F') with bounds (n)\n"
+"x : input rank-1 array('F') with bounds (n)\n"
+"work : in/output rank-1 array('F') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(cbicgstabrevcom,CBICGSTABREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*); */
+static PyObject *f2py_rout__iterative_cbicgstabrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_float sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_float sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.cbicgstabrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.cbicgstabrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.cbicgstabrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.cbicgstabrevcom to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.cbicgstabrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.cbicgstabrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.cbicgstabrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.cbicgstabrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.cbicgstabrevcom to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.cbicgstabrevcom to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_float1(sclr1);
+  sclr2_capi = pyobj_from_complex_float1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NifiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of cbicgstabrevcom ***************************/
+
+/****************************** zbicgstabrevcom ******************************/
+static char doc_f2py_rout__iterative_zbicgstabrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``zbicgstabrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('D') with bounds (n)\n"
+"x : input rank-1 array('D') with bounds (n)\n"
+"work : in/output rank-1 array('D') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(zbicgstabrevcom,ZBICGSTABREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*); */
+static PyObject *f2py_rout__iterative_zbicgstabrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_double sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_double sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.zbicgstabrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.zbicgstabrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.zbicgstabrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.zbicgstabrevcom to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.zbicgstabrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.zbicgstabrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.zbicgstabrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.zbicgstabrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.zbicgstabrevcom to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.zbicgstabrevcom to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_double1(sclr1);
+  sclr2_capi = pyobj_from_complex_double1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NidiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of zbicgstabrevcom ***************************/
+
+/********************************* scgrevcom *********************************/
+static char doc_f2py_rout__iterative_scgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = scgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``scgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('f') with bounds (n)\n"
+"x : input rank-1 array('f') with bounds (n)\n"
+"work : in/output rank-1 array('f') with bounds (4 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(scgrevcom,SCGREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_scgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  float sclr1 = 0;
+  float sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.scgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.scgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.scgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.scgrevcom to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.scgrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.scgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.scgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.scgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.scgrevcom to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=4 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.scgrevcom to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nifiiiffi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of scgrevcom ******************************/
+
+/********************************* dcgrevcom *********************************/
+static char doc_f2py_rout__iterative_dcgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dcgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``dcgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('d') with bounds (n)\n"
+"x : input rank-1 array('d') with bounds (n)\n"
+"work : in/output rank-1 array('d') with bounds (4 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(dcgrevcom,DCGREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_dcgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  double sclr1 = 0;
+  double sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.dcgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.dcgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.dcgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.dcgrevcom to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.dcgrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.dcgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.dcgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.dcgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.dcgrevcom to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=4 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.dcgrevcom to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nidiiiddi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of dcgrevcom ******************************/
+
+/********************************* ccgrevcom *********************************/
+static char doc_f2py_rout__iterative_ccgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = ccgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``ccgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('F') with bounds (n)\n"
+"x : input rank-1 array('F') with bounds (n)\n"
+"work : in/output rank-1 array('F') with bounds (4 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(ccgrevcom,CCGREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*); */
+static PyObject *f2py_rout__iterative_ccgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_float sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_float sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.ccgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.ccgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.ccgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.ccgrevcom to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.ccgrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.ccgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.ccgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.ccgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.ccgrevcom to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=4 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.ccgrevcom to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_float1(sclr1);
+  sclr2_capi = pyobj_from_complex_float1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NifiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of ccgrevcom ******************************/
+
+/********************************* zcgrevcom *********************************/
+static char doc_f2py_rout__iterative_zcgrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zcgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``zcgrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('D') with bounds (n)\n"
+"x : input rank-1 array('D') with bounds (n)\n"
+"work : in/output rank-1 array('D') with bounds (4 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(zcgrevcom,ZCGREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*); */
+static PyObject *f2py_rout__iterative_zcgrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_double sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_double sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.zcgrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.zcgrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.zcgrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.zcgrevcom to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.zcgrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.zcgrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.zcgrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.zcgrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.zcgrevcom to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=4 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.zcgrevcom to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_double1(sclr1);
+  sclr2_capi = pyobj_from_complex_double1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NidiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of zcgrevcom ******************************/
+
+/********************************* scgsrevcom *********************************/
+static char doc_f2py_rout__iterative_scgsrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = scgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``scgsrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('f') with bounds (n)\n"
+"x : input rank-1 array('f') with bounds (n)\n"
+"work : in/output rank-1 array('f') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(scgsrevcom,SCGSREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_scgsrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  float sclr1 = 0;
+  float sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.scgsrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.scgsrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.scgsrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.scgsrevcom to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.scgsrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.scgsrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.scgsrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.scgsrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.scgsrevcom to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.scgsrevcom to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nifiiiffi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of scgsrevcom *****************************/
+
+/********************************* dcgsrevcom *********************************/
+static char doc_f2py_rout__iterative_dcgsrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dcgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``dcgsrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('d') with bounds (n)\n"
+"x : input rank-1 array('d') with bounds (n)\n"
+"work : in/output rank-1 array('d') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(dcgsrevcom,DCGSREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_dcgsrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  double sclr1 = 0;
+  double sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.dcgsrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.dcgsrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.dcgsrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.dcgsrevcom to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.dcgsrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.dcgsrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.dcgsrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.dcgsrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.dcgsrevcom to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.dcgsrevcom to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nidiiiddi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of dcgsrevcom *****************************/
+
+/********************************* ccgsrevcom *********************************/
+static char doc_f2py_rout__iterative_ccgsrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = ccgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``ccgsrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('F') with bounds (n)\n"
+"x : input rank-1 array('F') with bounds (n)\n"
+"work : in/output rank-1 array('F') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(ccgsrevcom,CCGSREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*); */
+static PyObject *f2py_rout__iterative_ccgsrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_float sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_float sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.ccgsrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.ccgsrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.ccgsrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.ccgsrevcom to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.ccgsrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.ccgsrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.ccgsrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.ccgsrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.ccgsrevcom to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.ccgsrevcom to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_float1(sclr1);
+  sclr2_capi = pyobj_from_complex_float1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NifiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of ccgsrevcom *****************************/
+
+/********************************* zcgsrevcom *********************************/
+static char doc_f2py_rout__iterative_zcgsrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zcgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``zcgsrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('D') with bounds (n)\n"
+"x : input rank-1 array('D') with bounds (n)\n"
+"work : in/output rank-1 array('D') with bounds (7 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(zcgsrevcom,ZCGSREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*); */
+static PyObject *f2py_rout__iterative_zcgsrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_double sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_double sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.zcgsrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.zcgsrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.zcgsrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.zcgsrevcom to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.zcgsrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.zcgsrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.zcgsrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.zcgsrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.zcgsrevcom to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=7 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.zcgsrevcom to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_double1(sclr1);
+  sclr2_capi = pyobj_from_complex_double1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NidiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of zcgsrevcom *****************************/
+
+/********************************* sqmrrevcom *********************************/
+static char doc_f2py_rout__iterative_sqmrrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``sqmrrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('f') with bounds (n)\n"
+"x : input rank-1 array('f') with bounds (n)\n"
+"work : in/output rank-1 array('f') with bounds (11 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(sqmrrevcom,SQMRREVCOM)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_sqmrrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  float sclr1 = 0;
+  float sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.sqmrrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.sqmrrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.sqmrrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.sqmrrevcom to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.sqmrrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.sqmrrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.sqmrrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.sqmrrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.sqmrrevcom to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=11 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.sqmrrevcom to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nifiiiffi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of sqmrrevcom *****************************/
+
+/********************************* dqmrrevcom *********************************/
+static char doc_f2py_rout__iterative_dqmrrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``dqmrrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('d') with bounds (n)\n"
+"x : input rank-1 array('d') with bounds (n)\n"
+"work : in/output rank-1 array('d') with bounds (11 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(dqmrrevcom,DQMRREVCOM)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_dqmrrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  double sclr1 = 0;
+  double sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.dqmrrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.dqmrrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.dqmrrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.dqmrrevcom to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.dqmrrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.dqmrrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.dqmrrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.dqmrrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.dqmrrevcom to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=11 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.dqmrrevcom to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nidiiiddi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of dqmrrevcom *****************************/
+
+/********************************* cqmrrevcom *********************************/
+static char doc_f2py_rout__iterative_cqmrrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``cqmrrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('F') with bounds (n)\n"
+"x : input rank-1 array('F') with bounds (n)\n"
+"work : in/output rank-1 array('F') with bounds (11 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(cqmrrevcom,CQMRREVCOM)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*); */
+static PyObject *f2py_rout__iterative_cqmrrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_float sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_float sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.cqmrrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.cqmrrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.cqmrrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.cqmrrevcom to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.cqmrrevcom() 5th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.cqmrrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.cqmrrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.cqmrrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.cqmrrevcom to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=11 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.cqmrrevcom to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_float1(sclr1);
+  sclr2_capi = pyobj_from_complex_float1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NifiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of cqmrrevcom *****************************/
+
+/********************************* zqmrrevcom *********************************/
+static char doc_f2py_rout__iterative_zqmrrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``zqmrrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('D') with bounds (n)\n"
+"x : input rank-1 array('D') with bounds (n)\n"
+"work : in/output rank-1 array('D') with bounds (11 * ldw)\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(zqmrrevcom,ZQMRREVCOM)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*); */
+static PyObject *f2py_rout__iterative_zqmrrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_double sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_double sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","work","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:_iterative.zqmrrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&work_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.zqmrrevcom() 6th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.zqmrrevcom() 8th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.zqmrrevcom to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.zqmrrevcom() 5th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.zqmrrevcom() 4th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.zqmrrevcom() 9th argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.zqmrrevcom() 7th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.zqmrrevcom to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable work */
+  work_Dims[0]=11 * ldw;
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 3rd argument `work' of _iterative.zqmrrevcom to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,work,&ldw,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_double1(sclr1);
+  sclr2_capi = pyobj_from_complex_double1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NidiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable ldw */
+  /* End of cleaning variable n */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of zqmrrevcom *****************************/
+
+/******************************** sgmresrevcom ********************************/
+static char doc_f2py_rout__iterative_sgmresrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``sgmresrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('f') with bounds (n)\n"
+"x : input rank-1 array('f') with bounds (n)\n"
+"restrt : input int\n"
+"work : in/output rank-1 array('f') with bounds (ldw*(6+restrt))\n"
+"work2 : in/output rank-1 array('f') with bounds (ldw2*(2*restrt+2))\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('f') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(sgmresrevcom,SGMRESREVCOM)(int*,float*,float*,int*,float*,int*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_sgmresrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,int*,float*,int*,float*,int*,int*,float*,int*,int*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int restrt = 0;
+  PyObject *restrt_capi = Py_None;
+  float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  float *work2 = NULL;
+  npy_intp work2_Dims[1] = {-1};
+  const int work2_Rank = 1;
+  PyArrayObject *capi_work2_tmp = NULL;
+  int capi_work2_intent = 0;
+  PyObject *work2_capi = Py_None;
+  int ldw2 = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  float sclr1 = 0;
+  float sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","restrt","work","work2","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOO:_iterative.sgmresrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&restrt_capi,&work_capi,&work2_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.sgmresrevcom() 10th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.sgmresrevcom() 9th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.sgmresrevcom() 8th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.sgmresrevcom to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.sgmresrevcom() 7th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.sgmresrevcom() 6th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.sgmresrevcom() 11st argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable restrt */
+    f2py_success = int_from_pyobj(&restrt,restrt_capi,"_iterative.sgmresrevcom() 3rd argument (restrt) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((0<restrt) && (restrt<=n),"(0<restrt) && (restrt<=n)","3rd argument restrt","sgmresrevcom:restrt=%d",restrt) {
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.sgmresrevcom to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable work */
+  work_Dims[0]=ldw*(6+restrt);
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_FLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 4th argument `work' of _iterative.sgmresrevcom to C/Fortran array" );
+  } else {
+    work = (float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable ldw2 */
+  ldw2 = MAX(2,restrt+1);
+  /* Processing variable work2 */
+  work2_Dims[0]=ldw2*(2*restrt+2);
+  capi_work2_intent |= F2PY_INTENT_INOUT;
+  capi_work2_tmp = array_from_pyobj(NPY_FLOAT,work2_Dims,work2_Rank,capi_work2_intent,work2_capi);
+  if (capi_work2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 5th argument `work2' of _iterative.sgmresrevcom to C/Fortran array" );
+  } else {
+    work2 = (float *)(PyArray_DATA(capi_work2_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,&restrt,work,&ldw,work2,&ldw2,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nifiiiffi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work2_tmp!=work2_capi) {
+    Py_XDECREF(capi_work2_tmp); }
+  }  /*if (capi_work2_tmp == NULL) ... else of work2*/
+  /* End of cleaning variable work2 */
+  /* End of cleaning variable ldw2 */
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldw */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR((0<restrt) && (restrt<=n))*/
+  } /*if (f2py_success) of restrt*/
+  /* End of cleaning variable restrt */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of sgmresrevcom ****************************/
+
+/******************************** dgmresrevcom ********************************/
+static char doc_f2py_rout__iterative_dgmresrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``dgmresrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('d') with bounds (n)\n"
+"x : input rank-1 array('d') with bounds (n)\n"
+"restrt : input int\n"
+"work : in/output rank-1 array('d') with bounds (ldw*(6+restrt))\n"
+"work2 : in/output rank-1 array('d') with bounds (ldw2*(2*restrt+2))\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('d') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : float\n"
+"sclr2 : float\n"
+"ijob : int";
+/* extern void F_FUNC(dgmresrevcom,DGMRESREVCOM)(int*,double*,double*,int*,double*,int*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_dgmresrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,int*,double*,int*,double*,int*,int*,double*,int*,int*,int*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int restrt = 0;
+  PyObject *restrt_capi = Py_None;
+  double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  double *work2 = NULL;
+  npy_intp work2_Dims[1] = {-1};
+  const int work2_Rank = 1;
+  PyArrayObject *capi_work2_tmp = NULL;
+  int capi_work2_intent = 0;
+  PyObject *work2_capi = Py_None;
+  int ldw2 = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  double sclr1 = 0;
+  double sclr2 = 0;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","restrt","work","work2","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOO:_iterative.dgmresrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&restrt_capi,&work_capi,&work2_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.dgmresrevcom() 10th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.dgmresrevcom() 9th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.dgmresrevcom() 8th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.dgmresrevcom to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.dgmresrevcom() 7th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.dgmresrevcom() 6th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.dgmresrevcom() 11st argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable restrt */
+    f2py_success = int_from_pyobj(&restrt,restrt_capi,"_iterative.dgmresrevcom() 3rd argument (restrt) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((0<restrt) && (restrt<=n),"(0<restrt) && (restrt<=n)","3rd argument restrt","dgmresrevcom:restrt=%d",restrt) {
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.dgmresrevcom to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable work */
+  work_Dims[0]=ldw*(6+restrt);
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_DOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 4th argument `work' of _iterative.dgmresrevcom to C/Fortran array" );
+  } else {
+    work = (double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable ldw2 */
+  ldw2 = MAX(2,restrt+1);
+  /* Processing variable work2 */
+  work2_Dims[0]=ldw2*(2*restrt+2);
+  capi_work2_intent |= F2PY_INTENT_INOUT;
+  capi_work2_tmp = array_from_pyobj(NPY_DOUBLE,work2_Dims,work2_Rank,capi_work2_intent,work2_capi);
+  if (capi_work2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 5th argument `work2' of _iterative.dgmresrevcom to C/Fortran array" );
+  } else {
+    work2 = (double *)(PyArray_DATA(capi_work2_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,&restrt,work,&ldw,work2,&ldw2,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nidiiiddi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work2_tmp!=work2_capi) {
+    Py_XDECREF(capi_work2_tmp); }
+  }  /*if (capi_work2_tmp == NULL) ... else of work2*/
+  /* End of cleaning variable work2 */
+  /* End of cleaning variable ldw2 */
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldw */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR((0<restrt) && (restrt<=n))*/
+  } /*if (f2py_success) of restrt*/
+  /* End of cleaning variable restrt */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of dgmresrevcom ****************************/
+
+/******************************** cgmresrevcom ********************************/
+static char doc_f2py_rout__iterative_cgmresrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``cgmresrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('F') with bounds (n)\n"
+"x : input rank-1 array('F') with bounds (n)\n"
+"restrt : input int\n"
+"work : in/output rank-1 array('F') with bounds (ldw*(6+restrt))\n"
+"work2 : in/output rank-1 array('F') with bounds (ldw2*(2*restrt+2))\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('F') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(cgmresrevcom,CGMRESREVCOM)(int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*); */
+static PyObject *f2py_rout__iterative_cgmresrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,int*,complex_float*,int*,complex_float*,int*,int*,float*,int*,int*,int*,complex_float*,complex_float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int restrt = 0;
+  PyObject *restrt_capi = Py_None;
+  complex_float *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  complex_float *work2 = NULL;
+  npy_intp work2_Dims[1] = {-1};
+  const int work2_Rank = 1;
+  PyArrayObject *capi_work2_tmp = NULL;
+  int capi_work2_intent = 0;
+  PyObject *work2_capi = Py_None;
+  int ldw2 = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  float resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_float sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_float sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","restrt","work","work2","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOO:_iterative.cgmresrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&restrt_capi,&work_capi,&work2_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.cgmresrevcom() 10th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.cgmresrevcom() 9th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.cgmresrevcom() 8th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.cgmresrevcom to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = float_from_pyobj(&resid,resid_capi,"_iterative.cgmresrevcom() 7th argument (resid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.cgmresrevcom() 6th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.cgmresrevcom() 11st argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable restrt */
+    f2py_success = int_from_pyobj(&restrt,restrt_capi,"_iterative.cgmresrevcom() 3rd argument (restrt) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((0<restrt) && (restrt<=n),"(0<restrt) && (restrt<=n)","3rd argument restrt","cgmresrevcom:restrt=%d",restrt) {
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CFLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.cgmresrevcom to C/Fortran array" );
+  } else {
+    x = (complex_float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable work */
+  work_Dims[0]=ldw*(6+restrt);
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CFLOAT,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 4th argument `work' of _iterative.cgmresrevcom to C/Fortran array" );
+  } else {
+    work = (complex_float *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable ldw2 */
+  ldw2 = MAX(2,restrt+1);
+  /* Processing variable work2 */
+  work2_Dims[0]=ldw2*(2*restrt+2);
+  capi_work2_intent |= F2PY_INTENT_INOUT;
+  capi_work2_tmp = array_from_pyobj(NPY_CFLOAT,work2_Dims,work2_Rank,capi_work2_intent,work2_capi);
+  if (capi_work2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 5th argument `work2' of _iterative.cgmresrevcom to C/Fortran array" );
+  } else {
+    work2 = (complex_float *)(PyArray_DATA(capi_work2_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,&restrt,work,&ldw,work2,&ldw2,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_float1(sclr1);
+  sclr2_capi = pyobj_from_complex_float1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NifiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work2_tmp!=work2_capi) {
+    Py_XDECREF(capi_work2_tmp); }
+  }  /*if (capi_work2_tmp == NULL) ... else of work2*/
+  /* End of cleaning variable work2 */
+  /* End of cleaning variable ldw2 */
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldw */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR((0<restrt) && (restrt<=n))*/
+  } /*if (f2py_success) of restrt*/
+  /* End of cleaning variable restrt */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of cgmresrevcom ****************************/
+
+/******************************** zgmresrevcom ********************************/
+static char doc_f2py_rout__iterative_zgmresrevcom[] = "\
+x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n\nWrapper for ``zgmresrevcom``.\
+\n\nParameters\n----------\n"
+"b : input rank-1 array('D') with bounds (n)\n"
+"x : input rank-1 array('D') with bounds (n)\n"
+"restrt : input int\n"
+"work : in/output rank-1 array('D') with bounds (ldw*(6+restrt))\n"
+"work2 : in/output rank-1 array('D') with bounds (ldw2*(2*restrt+2))\n"
+"iter : input int\n"
+"resid : input float\n"
+"info : input int\n"
+"ndx1 : input int\n"
+"ndx2 : input int\n"
+"ijob : input int\n"
+"\nReturns\n-------\n"
+"x : rank-1 array('D') with bounds (n)\n"
+"iter : int\n"
+"resid : float\n"
+"info : int\n"
+"ndx1 : int\n"
+"ndx2 : int\n"
+"sclr1 : complex\n"
+"sclr2 : complex\n"
+"ijob : int";
+/* extern void F_FUNC(zgmresrevcom,ZGMRESREVCOM)(int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*); */
+static PyObject *f2py_rout__iterative_zgmresrevcom(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,int*,complex_double*,int*,complex_double*,int*,int*,double*,int*,int*,int*,complex_double*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  complex_double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int restrt = 0;
+  PyObject *restrt_capi = Py_None;
+  complex_double *work = NULL;
+  npy_intp work_Dims[1] = {-1};
+  const int work_Rank = 1;
+  PyArrayObject *capi_work_tmp = NULL;
+  int capi_work_intent = 0;
+  PyObject *work_capi = Py_None;
+  int ldw = 0;
+  complex_double *work2 = NULL;
+  npy_intp work2_Dims[1] = {-1};
+  const int work2_Rank = 1;
+  PyArrayObject *capi_work2_tmp = NULL;
+  int capi_work2_intent = 0;
+  PyObject *work2_capi = Py_None;
+  int ldw2 = 0;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double resid = 0;
+  PyObject *resid_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  int ndx1 = 0;
+  PyObject *ndx1_capi = Py_None;
+  int ndx2 = 0;
+  PyObject *ndx2_capi = Py_None;
+  complex_double sclr1;
+  PyObject *sclr1_capi = Py_None;
+  complex_double sclr2;
+  PyObject *sclr2_capi = Py_None;
+  int ijob = 0;
+  PyObject *ijob_capi = Py_None;
+  static char *capi_kwlist[] = {"b","x","restrt","work","work2","iter","resid","info","ndx1","ndx2","ijob",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOO:_iterative.zgmresrevcom",\
+    capi_kwlist,&b_capi,&x_capi,&restrt_capi,&work_capi,&work2_capi,&iter_capi,&resid_capi,&info_capi,&ndx1_capi,&ndx2_capi,&ijob_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ndx2 */
+    f2py_success = int_from_pyobj(&ndx2,ndx2_capi,"_iterative.zgmresrevcom() 10th argument (ndx2) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sclr2 */
+  /* Processing variable ndx1 */
+    f2py_success = int_from_pyobj(&ndx1,ndx1_capi,"_iterative.zgmresrevcom() 9th argument (ndx1) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.zgmresrevcom() 8th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `b' of _iterative.zgmresrevcom to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+    f2py_success = double_from_pyobj(&resid,resid_capi,"_iterative.zgmresrevcom() 7th argument (resid) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sclr1 */
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"_iterative.zgmresrevcom() 6th argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ijob */
+    f2py_success = int_from_pyobj(&ijob,ijob_capi,"_iterative.zgmresrevcom() 11st argument (ijob) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable restrt */
+    f2py_success = int_from_pyobj(&restrt,restrt_capi,"_iterative.zgmresrevcom() 3rd argument (restrt) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((0<restrt) && (restrt<=n),"(0<restrt) && (restrt<=n)","3rd argument restrt","zgmresrevcom:restrt=%d",restrt) {
+  /* Processing variable x */
+  x_Dims[0]=n;
+  capi_x_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_x_tmp = array_from_pyobj(NPY_CDOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `x' of _iterative.zgmresrevcom to C/Fortran array" );
+  } else {
+    x = (complex_double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable ldw */
+  ldw = MAX(1,n);
+  /* Processing variable work */
+  work_Dims[0]=ldw*(6+restrt);
+  capi_work_intent |= F2PY_INTENT_INOUT;
+  capi_work_tmp = array_from_pyobj(NPY_CDOUBLE,work_Dims,work_Rank,capi_work_intent,work_capi);
+  if (capi_work_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 4th argument `work' of _iterative.zgmresrevcom to C/Fortran array" );
+  } else {
+    work = (complex_double *)(PyArray_DATA(capi_work_tmp));
+
+  /* Processing variable ldw2 */
+  ldw2 = MAX(2,restrt+1);
+  /* Processing variable work2 */
+  work2_Dims[0]=ldw2*(2*restrt+2);
+  capi_work2_intent |= F2PY_INTENT_INOUT;
+  capi_work2_tmp = array_from_pyobj(NPY_CDOUBLE,work2_Dims,work2_Rank,capi_work2_intent,work2_capi);
+  if (capi_work2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 5th argument `work2' of _iterative.zgmresrevcom to C/Fortran array" );
+  } else {
+    work2 = (complex_double *)(PyArray_DATA(capi_work2_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,b,x,&restrt,work,&ldw,work2,&ldw2,&iter,&resid,&info,&ndx1,&ndx2,&sclr1,&sclr2,&ijob);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  sclr1_capi = pyobj_from_complex_double1(sclr1);
+  sclr2_capi = pyobj_from_complex_double1(sclr2);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NidiiiNNi",capi_x_tmp,iter,resid,info,ndx1,ndx2,sclr1_capi,sclr2_capi,ijob);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_work2_tmp!=work2_capi) {
+    Py_XDECREF(capi_work2_tmp); }
+  }  /*if (capi_work2_tmp == NULL) ... else of work2*/
+  /* End of cleaning variable work2 */
+  /* End of cleaning variable ldw2 */
+  if((PyObject *)capi_work_tmp!=work_capi) {
+    Py_XDECREF(capi_work_tmp); }
+  }  /*if (capi_work_tmp == NULL) ... else of work*/
+  /* End of cleaning variable work */
+  /* End of cleaning variable ldw */
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  } /*CHECKSCALAR((0<restrt) && (restrt<=n))*/
+  } /*if (f2py_success) of restrt*/
+  /* End of cleaning variable restrt */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of ijob*/
+  /* End of cleaning variable ijob */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  /* End of cleaning variable sclr1 */
+  } /*if (f2py_success) of resid*/
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+  } /*if (f2py_success) of ndx1*/
+  /* End of cleaning variable ndx1 */
+  /* End of cleaning variable sclr2 */
+  } /*if (f2py_success) of ndx2*/
+  /* End of cleaning variable ndx2 */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of zgmresrevcom ****************************/
+
+/********************************* sstoptest2 *********************************/
+static char doc_f2py_rout__iterative_sstoptest2[] = "\
+bnrm2,resid,info = sstoptest2(r,b,bnrm2,tol,info)\n\nWrapper for ``sstoptest2``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('f') with bounds (n)\n"
+"b : input rank-1 array('f') with bounds (n)\n"
+"bnrm2 : input float\n"
+"tol : input float\n"
+"info : input int\n"
+"\nReturns\n-------\n"
+"bnrm2 : float\n"
+"resid : float\n"
+"info : int";
+/* extern void F_FUNC(sstoptest2,SSTOPTEST2)(int*,float*,float*,float*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_sstoptest2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,float*,float*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  float *r = NULL;
+  npy_intp r_Dims[1] = {-1};
+  const int r_Rank = 1;
+  PyArrayObject *capi_r_tmp = NULL;
+  int capi_r_intent = 0;
+  PyObject *r_capi = Py_None;
+  float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float bnrm2 = 0;
+  PyObject *bnrm2_capi = Py_None;
+  float resid = 0;
+  float tol = 0;
+  PyObject *tol_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  static char *capi_kwlist[] = {"r","b","bnrm2","tol","info",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:_iterative.sstoptest2",\
+    capi_kwlist,&r_capi,&b_capi,&bnrm2_capi,&tol_capi,&info_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.sstoptest2() 5th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_FLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `b' of _iterative.sstoptest2 to C/Fortran array" );
+  } else {
+    b = (float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+  /* Processing variable tol */
+    f2py_success = float_from_pyobj(&tol,tol_capi,"_iterative.sstoptest2() 4th argument (tol) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable bnrm2 */
+    f2py_success = float_from_pyobj(&bnrm2,bnrm2_capi,"_iterative.sstoptest2() 3rd argument (bnrm2) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable r */
+  r_Dims[0]=n;
+  capi_r_intent |= F2PY_INTENT_IN;
+  capi_r_tmp = array_from_pyobj(NPY_FLOAT,r_Dims,r_Rank,capi_r_intent,r_capi);
+  if (capi_r_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `r' of _iterative.sstoptest2 to C/Fortran array" );
+  } else {
+    r = (float *)(PyArray_DATA(capi_r_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,r,b,&bnrm2,&resid,&tol,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ffi",bnrm2,resid,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_r_tmp!=r_capi) {
+    Py_XDECREF(capi_r_tmp); }
+  }  /*if (capi_r_tmp == NULL) ... else of r*/
+  /* End of cleaning variable r */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of bnrm2*/
+  /* End of cleaning variable bnrm2 */
+  } /*if (f2py_success) of tol*/
+  /* End of cleaning variable tol */
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of sstoptest2 *****************************/
+
+/********************************* dstoptest2 *********************************/
+static char doc_f2py_rout__iterative_dstoptest2[] = "\
+bnrm2,resid,info = dstoptest2(r,b,bnrm2,tol,info)\n\nWrapper for ``dstoptest2``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"b : input rank-1 array('d') with bounds (n)\n"
+"bnrm2 : input float\n"
+"tol : input float\n"
+"info : input int\n"
+"\nReturns\n-------\n"
+"bnrm2 : float\n"
+"resid : float\n"
+"info : int";
+/* extern void F_FUNC(dstoptest2,DSTOPTEST2)(int*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_dstoptest2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *r = NULL;
+  npy_intp r_Dims[1] = {-1};
+  const int r_Rank = 1;
+  PyArrayObject *capi_r_tmp = NULL;
+  int capi_r_intent = 0;
+  PyObject *r_capi = Py_None;
+  double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double bnrm2 = 0;
+  PyObject *bnrm2_capi = Py_None;
+  double resid = 0;
+  double tol = 0;
+  PyObject *tol_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  static char *capi_kwlist[] = {"r","b","bnrm2","tol","info",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:_iterative.dstoptest2",\
+    capi_kwlist,&r_capi,&b_capi,&bnrm2_capi,&tol_capi,&info_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.dstoptest2() 5th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_DOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `b' of _iterative.dstoptest2 to C/Fortran array" );
+  } else {
+    b = (double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+  /* Processing variable tol */
+    f2py_success = double_from_pyobj(&tol,tol_capi,"_iterative.dstoptest2() 4th argument (tol) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable bnrm2 */
+    f2py_success = double_from_pyobj(&bnrm2,bnrm2_capi,"_iterative.dstoptest2() 3rd argument (bnrm2) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable r */
+  r_Dims[0]=n;
+  capi_r_intent |= F2PY_INTENT_IN;
+  capi_r_tmp = array_from_pyobj(NPY_DOUBLE,r_Dims,r_Rank,capi_r_intent,r_capi);
+  if (capi_r_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `r' of _iterative.dstoptest2 to C/Fortran array" );
+  } else {
+    r = (double *)(PyArray_DATA(capi_r_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,r,b,&bnrm2,&resid,&tol,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ddi",bnrm2,resid,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_r_tmp!=r_capi) {
+    Py_XDECREF(capi_r_tmp); }
+  }  /*if (capi_r_tmp == NULL) ... else of r*/
+  /* End of cleaning variable r */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of bnrm2*/
+  /* End of cleaning variable bnrm2 */
+  } /*if (f2py_success) of tol*/
+  /* End of cleaning variable tol */
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of dstoptest2 *****************************/
+
+/********************************* cstoptest2 *********************************/
+static char doc_f2py_rout__iterative_cstoptest2[] = "\
+bnrm2,resid,info = cstoptest2(r,b,bnrm2,tol,info)\n\nWrapper for ``cstoptest2``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('F') with bounds (n)\n"
+"b : input rank-1 array('F') with bounds (n)\n"
+"bnrm2 : input float\n"
+"tol : input float\n"
+"info : input int\n"
+"\nReturns\n-------\n"
+"bnrm2 : float\n"
+"resid : float\n"
+"info : int";
+/* extern void F_FUNC(cstoptest2,CSTOPTEST2)(int*,complex_float*,complex_float*,float*,float*,float*,int*); */
+static PyObject *f2py_rout__iterative_cstoptest2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_float*,complex_float*,float*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_float *r = NULL;
+  npy_intp r_Dims[1] = {-1};
+  const int r_Rank = 1;
+  PyArrayObject *capi_r_tmp = NULL;
+  int capi_r_intent = 0;
+  PyObject *r_capi = Py_None;
+  complex_float *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  float bnrm2 = 0;
+  PyObject *bnrm2_capi = Py_None;
+  float resid = 0;
+  float tol = 0;
+  PyObject *tol_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  static char *capi_kwlist[] = {"r","b","bnrm2","tol","info",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:_iterative.cstoptest2",\
+    capi_kwlist,&r_capi,&b_capi,&bnrm2_capi,&tol_capi,&info_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.cstoptest2() 5th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CFLOAT,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `b' of _iterative.cstoptest2 to C/Fortran array" );
+  } else {
+    b = (complex_float *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+  /* Processing variable tol */
+    f2py_success = float_from_pyobj(&tol,tol_capi,"_iterative.cstoptest2() 4th argument (tol) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable bnrm2 */
+    f2py_success = float_from_pyobj(&bnrm2,bnrm2_capi,"_iterative.cstoptest2() 3rd argument (bnrm2) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable r */
+  r_Dims[0]=n;
+  capi_r_intent |= F2PY_INTENT_IN;
+  capi_r_tmp = array_from_pyobj(NPY_CFLOAT,r_Dims,r_Rank,capi_r_intent,r_capi);
+  if (capi_r_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `r' of _iterative.cstoptest2 to C/Fortran array" );
+  } else {
+    r = (complex_float *)(PyArray_DATA(capi_r_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,r,b,&bnrm2,&resid,&tol,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ffi",bnrm2,resid,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_r_tmp!=r_capi) {
+    Py_XDECREF(capi_r_tmp); }
+  }  /*if (capi_r_tmp == NULL) ... else of r*/
+  /* End of cleaning variable r */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of bnrm2*/
+  /* End of cleaning variable bnrm2 */
+  } /*if (f2py_success) of tol*/
+  /* End of cleaning variable tol */
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of cstoptest2 *****************************/
+
+/********************************* zstoptest2 *********************************/
+static char doc_f2py_rout__iterative_zstoptest2[] = "\
+bnrm2,resid,info = zstoptest2(r,b,bnrm2,tol,info)\n\nWrapper for ``zstoptest2``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('D') with bounds (n)\n"
+"b : input rank-1 array('D') with bounds (n)\n"
+"bnrm2 : input float\n"
+"tol : input float\n"
+"info : input int\n"
+"\nReturns\n-------\n"
+"bnrm2 : float\n"
+"resid : float\n"
+"info : int";
+/* extern void F_FUNC(zstoptest2,ZSTOPTEST2)(int*,complex_double*,complex_double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__iterative_zstoptest2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,double*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  complex_double *r = NULL;
+  npy_intp r_Dims[1] = {-1};
+  const int r_Rank = 1;
+  PyArrayObject *capi_r_tmp = NULL;
+  int capi_r_intent = 0;
+  PyObject *r_capi = Py_None;
+  complex_double *b = NULL;
+  npy_intp b_Dims[1] = {-1};
+  const int b_Rank = 1;
+  PyArrayObject *capi_b_tmp = NULL;
+  int capi_b_intent = 0;
+  PyObject *b_capi = Py_None;
+  double bnrm2 = 0;
+  PyObject *bnrm2_capi = Py_None;
+  double resid = 0;
+  double tol = 0;
+  PyObject *tol_capi = Py_None;
+  int info = 0;
+  PyObject *info_capi = Py_None;
+  static char *capi_kwlist[] = {"r","b","bnrm2","tol","info",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:_iterative.zstoptest2",\
+    capi_kwlist,&r_capi,&b_capi,&bnrm2_capi,&tol_capi,&info_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable info */
+    f2py_success = int_from_pyobj(&info,info_capi,"_iterative.zstoptest2() 5th argument (info) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable b */
+  ;
+  capi_b_intent |= F2PY_INTENT_IN;
+  capi_b_tmp = array_from_pyobj(NPY_CDOUBLE,b_Dims,b_Rank,capi_b_intent,b_capi);
+  if (capi_b_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 2nd argument `b' of _iterative.zstoptest2 to C/Fortran array" );
+  } else {
+    b = (complex_double *)(PyArray_DATA(capi_b_tmp));
+
+  /* Processing variable resid */
+  /* Processing variable tol */
+    f2py_success = double_from_pyobj(&tol,tol_capi,"_iterative.zstoptest2() 4th argument (tol) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable bnrm2 */
+    f2py_success = double_from_pyobj(&bnrm2,bnrm2_capi,"_iterative.zstoptest2() 3rd argument (bnrm2) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(b);
+  /* Processing variable r */
+  r_Dims[0]=n;
+  capi_r_intent |= F2PY_INTENT_IN;
+  capi_r_tmp = array_from_pyobj(NPY_CDOUBLE,r_Dims,r_Rank,capi_r_intent,r_capi);
+  if (capi_r_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(_iterative_error,"failed in converting 1st argument `r' of _iterative.zstoptest2 to C/Fortran array" );
+  } else {
+    r = (complex_double *)(PyArray_DATA(capi_r_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,r,b,&bnrm2,&resid,&tol,&info);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ddi",bnrm2,resid,info);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_r_tmp!=r_capi) {
+    Py_XDECREF(capi_r_tmp); }
+  }  /*if (capi_r_tmp == NULL) ... else of r*/
+  /* End of cleaning variable r */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of bnrm2*/
+  /* End of cleaning variable bnrm2 */
+  } /*if (f2py_success) of tol*/
+  /* End of cleaning variable tol */
+  /* End of cleaning variable resid */
+  if((PyObject *)capi_b_tmp!=b_capi) {
+    Py_XDECREF(capi_b_tmp); }
+  }  /*if (capi_b_tmp == NULL) ... else of b*/
+  /* End of cleaning variable b */
+  } /*if (f2py_success) of info*/
+  /* End of cleaning variable info */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of zstoptest2 *****************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"sbicgrevcom",-1,{{-1}},0,(char *)F_FUNC(sbicgrevcom,SBICGREVCOM),(f2py_init_func)f2py_rout__iterative_sbicgrevcom,doc_f2py_rout__iterative_sbicgrevcom},
+  {"dbicgrevcom",-1,{{-1}},0,(char *)F_FUNC(dbicgrevcom,DBICGREVCOM),(f2py_init_func)f2py_rout__iterative_dbicgrevcom,doc_f2py_rout__iterative_dbicgrevcom},
+  {"cbicgrevcom",-1,{{-1}},0,(char *)F_FUNC(cbicgrevcom,CBICGREVCOM),(f2py_init_func)f2py_rout__iterative_cbicgrevcom,doc_f2py_rout__iterative_cbicgrevcom},
+  {"zbicgrevcom",-1,{{-1}},0,(char *)F_FUNC(zbicgrevcom,ZBICGREVCOM),(f2py_init_func)f2py_rout__iterative_zbicgrevcom,doc_f2py_rout__iterative_zbicgrevcom},
+  {"sbicgstabrevcom",-1,{{-1}},0,(char *)F_FUNC(sbicgstabrevcom,SBICGSTABREVCOM),(f2py_init_func)f2py_rout__iterative_sbicgstabrevcom,doc_f2py_rout__iterative_sbicgstabrevcom},
+  {"dbicgstabrevcom",-1,{{-1}},0,(char *)F_FUNC(dbicgstabrevcom,DBICGSTABREVCOM),(f2py_init_func)f2py_rout__iterative_dbicgstabrevcom,doc_f2py_rout__iterative_dbicgstabrevcom},
+  {"cbicgstabrevcom",-1,{{-1}},0,(char *)F_FUNC(cbicgstabrevcom,CBICGSTABREVCOM),(f2py_init_func)f2py_rout__iterative_cbicgstabrevcom,doc_f2py_rout__iterative_cbicgstabrevcom},
+  {"zbicgstabrevcom",-1,{{-1}},0,(char *)F_FUNC(zbicgstabrevcom,ZBICGSTABREVCOM),(f2py_init_func)f2py_rout__iterative_zbicgstabrevcom,doc_f2py_rout__iterative_zbicgstabrevcom},
+  {"scgrevcom",-1,{{-1}},0,(char *)F_FUNC(scgrevcom,SCGREVCOM),(f2py_init_func)f2py_rout__iterative_scgrevcom,doc_f2py_rout__iterative_scgrevcom},
+  {"dcgrevcom",-1,{{-1}},0,(char *)F_FUNC(dcgrevcom,DCGREVCOM),(f2py_init_func)f2py_rout__iterative_dcgrevcom,doc_f2py_rout__iterative_dcgrevcom},
+  {"ccgrevcom",-1,{{-1}},0,(char *)F_FUNC(ccgrevcom,CCGREVCOM),(f2py_init_func)f2py_rout__iterative_ccgrevcom,doc_f2py_rout__iterative_ccgrevcom},
+  {"zcgrevcom",-1,{{-1}},0,(char *)F_FUNC(zcgrevcom,ZCGREVCOM),(f2py_init_func)f2py_rout__iterative_zcgrevcom,doc_f2py_rout__iterative_zcgrevcom},
+  {"scgsrevcom",-1,{{-1}},0,(char *)F_FUNC(scgsrevcom,SCGSREVCOM),(f2py_init_func)f2py_rout__iterative_scgsrevcom,doc_f2py_rout__iterative_scgsrevcom},
+  {"dcgsrevcom",-1,{{-1}},0,(char *)F_FUNC(dcgsrevcom,DCGSREVCOM),(f2py_init_func)f2py_rout__iterative_dcgsrevcom,doc_f2py_rout__iterative_dcgsrevcom},
+  {"ccgsrevcom",-1,{{-1}},0,(char *)F_FUNC(ccgsrevcom,CCGSREVCOM),(f2py_init_func)f2py_rout__iterative_ccgsrevcom,doc_f2py_rout__iterative_ccgsrevcom},
+  {"zcgsrevcom",-1,{{-1}},0,(char *)F_FUNC(zcgsrevcom,ZCGSREVCOM),(f2py_init_func)f2py_rout__iterative_zcgsrevcom,doc_f2py_rout__iterative_zcgsrevcom},
+  {"sqmrrevcom",-1,{{-1}},0,(char *)F_FUNC(sqmrrevcom,SQMRREVCOM),(f2py_init_func)f2py_rout__iterative_sqmrrevcom,doc_f2py_rout__iterative_sqmrrevcom},
+  {"dqmrrevcom",-1,{{-1}},0,(char *)F_FUNC(dqmrrevcom,DQMRREVCOM),(f2py_init_func)f2py_rout__iterative_dqmrrevcom,doc_f2py_rout__iterative_dqmrrevcom},
+  {"cqmrrevcom",-1,{{-1}},0,(char *)F_FUNC(cqmrrevcom,CQMRREVCOM),(f2py_init_func)f2py_rout__iterative_cqmrrevcom,doc_f2py_rout__iterative_cqmrrevcom},
+  {"zqmrrevcom",-1,{{-1}},0,(char *)F_FUNC(zqmrrevcom,ZQMRREVCOM),(f2py_init_func)f2py_rout__iterative_zqmrrevcom,doc_f2py_rout__iterative_zqmrrevcom},
+  {"sgmresrevcom",-1,{{-1}},0,(char *)F_FUNC(sgmresrevcom,SGMRESREVCOM),(f2py_init_func)f2py_rout__iterative_sgmresrevcom,doc_f2py_rout__iterative_sgmresrevcom},
+  {"dgmresrevcom",-1,{{-1}},0,(char *)F_FUNC(dgmresrevcom,DGMRESREVCOM),(f2py_init_func)f2py_rout__iterative_dgmresrevcom,doc_f2py_rout__iterative_dgmresrevcom},
+  {"cgmresrevcom",-1,{{-1}},0,(char *)F_FUNC(cgmresrevcom,CGMRESREVCOM),(f2py_init_func)f2py_rout__iterative_cgmresrevcom,doc_f2py_rout__iterative_cgmresrevcom},
+  {"zgmresrevcom",-1,{{-1}},0,(char *)F_FUNC(zgmresrevcom,ZGMRESREVCOM),(f2py_init_func)f2py_rout__iterative_zgmresrevcom,doc_f2py_rout__iterative_zgmresrevcom},
+  {"sstoptest2",-1,{{-1}},0,(char *)F_FUNC(sstoptest2,SSTOPTEST2),(f2py_init_func)f2py_rout__iterative_sstoptest2,doc_f2py_rout__iterative_sstoptest2},
+  {"dstoptest2",-1,{{-1}},0,(char *)F_FUNC(dstoptest2,DSTOPTEST2),(f2py_init_func)f2py_rout__iterative_dstoptest2,doc_f2py_rout__iterative_dstoptest2},
+  {"cstoptest2",-1,{{-1}},0,(char *)F_FUNC(cstoptest2,CSTOPTEST2),(f2py_init_func)f2py_rout__iterative_cstoptest2,doc_f2py_rout__iterative_cstoptest2},
+  {"zstoptest2",-1,{{-1}},0,(char *)F_FUNC(zstoptest2,ZSTOPTEST2),(f2py_init_func)f2py_rout__iterative_zstoptest2,doc_f2py_rout__iterative_zstoptest2},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "_iterative",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit__iterative(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC init_iterative(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = _iterative_module = PyModule_Create(&moduledef);
+#else
+  m = _iterative_module = Py_InitModule("_iterative", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module _iterative (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module '_iterative' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zbicgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zbicgstabrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = scgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dcgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = ccgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zcgrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = scgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dcgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = ccgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zcgsrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zqmrrevcom(b,x,work,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = sgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = dgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = cgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  x,iter,resid,info,ndx1,ndx2,sclr1,sclr2,ijob = zgmresrevcom(b,x,restrt,work,work2,iter,resid,info,ndx1,ndx2,ijob)\n"
+"  bnrm2,resid,info = sstoptest2(r,b,bnrm2,tol,info)\n"
+"  bnrm2,resid,info = dstoptest2(r,b,bnrm2,tol,info)\n"
+"  bnrm2,resid,info = cstoptest2(r,b,bnrm2,tol,info)\n"
+"  bnrm2,resid,info = zstoptest2(r,b,bnrm2,tol,info)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  _iterative_error = PyErr_NewException ("_iterative.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"_iterative");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,132 @@
+"""Thread-level parallelism for sparse matrix kernels
+
+The compiled kernels release the GIL, so contiguous blocks of rows can be
+processed concurrently by Python threads.
+"""
+
+__all__ = ['get_n_jobs', 'set_n_jobs']
+
+import threading
+from multiprocessing import cpu_count
+
+import numpy as np
+
+
+# number of threads used when a method is called without n_jobs
+_n_jobs = 1
+
+# below this much work (nonzeros plus rows) per block, starting a thread
+# costs more than it saves
+_MIN_BLOCK_WORK = 32768
+
+
+def _check_n_jobs(n_jobs):
+    """Return the number of threads requested by `n_jobs`
+
+    None means the global setting, -1 means all processors.
+    """
+    if n_jobs is None:
+        return _n_jobs
+    if n_jobs == -1:
+        return cpu_count()
+    if n_jobs < 1 or int(n_jobs) != n_jobs:
+        raise ValueError("n_jobs must be a positive integer or -1")
+    return int(n_jobs)
+
+
+def get_n_jobs():
+    """Return the default number of threads used by sparse matrix products
+
+    See Also
+    --------
+    set_n_jobs
+
+    """
+    return _n_jobs
+
+
+def set_n_jobs(n_jobs):
+    """Set the default number of threads used by sparse matrix products
+
+    Products of CSR matrices with dense vectors and matrices, and
+    products of CSR or CSC matrices with sparse matrices, split the rows
+    (columns for CSC) of the result into contiguous blocks holding about
+    the same amount of work, and compute the blocks concurrently without
+    holding the GIL.  Methods that take an ``n_jobs`` argument use this
+    default when it is not given.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of threads.  If -1 is given, all processors are used.
+        The initial setting is 1.
+
+    Returns
+    -------
+    old_n_jobs : int
+        The previous setting.
+
+    Examples
+    --------
+    >>> from scipy.sparse import set_n_jobs
+    >>> old = set_n_jobs(4)
+    >>> # ... multiply sparse matrices using 4 threads ...
+    >>> set_n_jobs(old)
+    4
+
+    """
+    global _n_jobs
+    n_jobs = _check_n_jobs(n_jobs)
+    old, _n_jobs = _n_jobs, n_jobs
+    return old
+
+
+def _row_blocks(indptr, n_jobs):
+    """Split the rows of a compressed matrix into contiguous blocks
+
+    The blocks hold roughly equal amounts of work, counting one unit per
+    stored entry and one per row.  Any other cumulative measure of the
+    work of each row may be passed in place of the index pointer.
+    Returns a list of (start, stop) pairs.
+    """
+    n_row = len(indptr) - 1
+    work = indptr[-1] + n_row
+    n_blocks = min(n_jobs, work // _MIN_BLOCK_WORK, n_row)
+    if n_blocks <= 1:
+        return [(0, n_row)]
+
+    cumwork = indptr + np.arange(n_row + 1)
+    targets = np.linspace(0, work, n_blocks + 1)[1:-1]
+    cuts = np.searchsorted(cumwork, targets)
+    bounds = np.unique(np.concatenate(([0], cuts, [n_row])))
+    return [(int(start), int(stop))
+            for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _run_blocks(func, blocks):
+    """Call func(start, stop) for each block, in parallel threads
+
+    The first block is processed by the calling thread.  An exception
+    raised by any of the calls is re-raised after all threads finish.
+    """
+    if len(blocks) == 1:
+        func(*blocks[0])
+        return
+
+    errors = []
+    def run(start, stop):
+        try:
+            func(start, stop)
+        except Exception, e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=block)
+               for block in blocks[1:]]
+    for t in threads:
+        t.start()
+    run(*blocks[0])
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[0]
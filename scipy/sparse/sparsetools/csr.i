@@ -6,6 +6,32 @@
 #include "csr.h"
 %}
 
+/*
+ * The matrix products only touch NumPy array data, so they release the
+ * GIL, allowing blocks of rows to be multiplied in parallel by Python
+ * threads.
+ */
+%exception csr_matmat_pass1 {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%exception csr_matmat_pass2 {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%exception csr_matvec {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%exception csr_matvecs {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+
 %include "csr.h" 
 
 
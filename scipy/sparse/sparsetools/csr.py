@@ -1,12 +1,22 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 2.0.1+capsulehack
+# Version 3.0.12
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
-# This file is compatible with both classic and new-style classes.
 
-from sys import version_info
-if version_info >= (2,6,0):
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info >= (2, 7, 0):
+    def swig_import_helper():
+        import importlib
+        pkg = __name__.rpartition('.')[0]
+        mname = '.'.join((pkg, '_csr')).lstrip('.')
+        try:
+            return importlib.import_module(mname)
+        except ImportError:
+            return importlib.import_module('_csr')
+    _csr = swig_import_helper()
+    del swig_import_helper
+elif _swig_python_version_info >= (2, 6, 0):
     def swig_import_helper():
         from os.path import dirname
         import imp
@@ -16,636 +26,664 @@ if version_info >= (2,6,0):
         except ImportError:
             import _csr
             return _csr
-        if fp is not None:
-            try:
-                _mod = imp.load_module('_csr', fp, pathname, description)
-            finally:
+        try:
+            _mod = imp.load_module('_csr', fp, pathname, description)
+        finally:
+            if fp is not None:
                 fp.close()
-            return _mod
+        return _mod
     _csr = swig_import_helper()
     del swig_import_helper
 else:
     import _csr
-del version_info
+del _swig_python_version_info
+
 try:
     _swig_property = property
 except NameError:
-    pass # Python < 2.2 doesn't have 'property'.
-def _swig_setattr_nondynamic(self,class_type,name,value,static=1):
-    if (name == "thisown"): return self.this.own(value)
+    pass  # Python < 2.2 doesn't have 'property'.
+
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
+    if (name == "thisown"):
+        return self.this.own(value)
     if (name == "this"):
         if type(value).__name__ == 'SwigPyObject':
             self.__dict__[name] = value
             return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    if (not static) or hasattr(self,name):
-        self.__dict__[name] = value
+    method = class_type.__swig_setmethods__.get(name, None)
+    if method:
+        return method(self, value)
+    if (not static):
+        if _newclass:
+            object.__setattr__(self, name, value)
+        else:
+            self.__dict__[name] = value
     else:
         raise AttributeError("You cannot add attributes to %s" % self)
 
-def _swig_setattr(self,class_type,name,value):
-    return _swig_setattr_nondynamic(self,class_type,name,value,0)
 
-def _swig_getattr(self,class_type,name):
-    if (name == "thisown"): return self.this.own()
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError(name)
+def _swig_setattr(self, class_type, name, value):
+    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
+
+
+def _swig_getattr(self, class_type, name):
+    if (name == "thisown"):
+        return self.this.own()
+    method = class_type.__swig_getmethods__.get(name, None)
+    if method:
+        return method(self)
+    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
+
 
 def _swig_repr(self):
-    try: strthis = "proxy of " + self.this.__repr__()
-    except: strthis = ""
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
 try:
     _object = object
     _newclass = 1
-except AttributeError:
-    class _object : pass
+except __builtin__.Exception:
+    class _object:
+        pass
     _newclass = 0
 
 
-
 def expandptr(*args):
-    """expandptr(int n_row, int Ap, int Bi)"""
+    """
+    expandptr(int const n_row, int const [] Ap, int [] Bi)
+    expandptr(long long const n_row, long long const [] Ap, long long [] Bi)
+    """
     return _csr.expandptr(*args)
 
 def csr_matmat_pass1(*args):
     """
-      csr_matmat_pass1(int n_row, int n_col, int Ap, int Aj, int Bp, int Bj,
-          int Cp)
-      """
+    csr_matmat_pass1(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Bp, int const [] Bj, int [] Cp)
+    csr_matmat_pass1(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Bp, long long const [] Bj, long long [] Cp)
+    """
     return _csr.csr_matmat_pass1(*args)
 
 def csr_count_blocks(*args):
-    """csr_count_blocks(int n_row, int n_col, int R, int C, int Ap, int Aj) -> int"""
+    """
+    csr_count_blocks(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj) -> int
+    csr_count_blocks(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj) -> long long
+    """
     return _csr.csr_count_blocks(*args)
 
 def csr_has_sorted_indices(*args):
-    """csr_has_sorted_indices(int n_row, int Ap, int Aj) -> bool"""
+    """
+    csr_has_sorted_indices(int const n_row, int const [] Ap, int const [] Aj) -> bool
+    csr_has_sorted_indices(long long const n_row, long long const [] Ap, long long const [] Aj) -> bool
+    """
     return _csr.csr_has_sorted_indices(*args)
 
-
 def csr_diagonal(*args):
     """
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        signed char Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        unsigned char Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, short Ax, short Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        unsigned short Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, int Ax, int Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        unsigned int Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        long long Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        unsigned long long Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, float Ax, float Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, double Ax, double Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        long double Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        npy_cfloat_wrapper Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        npy_cdouble_wrapper Yx)
-    csr_diagonal(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        npy_clongdouble_wrapper Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, signed char [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, unsigned char [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, short [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, unsigned short [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, unsigned int [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, long long [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, unsigned long long [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, float [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, double [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, long double [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper [] Yx)
+    csr_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, signed char [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, unsigned char [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, short [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, unsigned short [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, int [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, unsigned int [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, unsigned long long [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, float [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, double [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long double [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper [] Yx)
+    csr_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper [] Yx)
     """
     return _csr.csr_diagonal(*args)
 
 def csr_scale_rows(*args):
     """
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        signed char Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        unsigned char Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, short Ax, short Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        unsigned short Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, int Ax, int Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        unsigned int Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        long long Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        unsigned long long Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, float Ax, float Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, double Ax, double Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        long double Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        npy_cfloat_wrapper Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        npy_cdouble_wrapper Xx)
-    csr_scale_rows(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        npy_clongdouble_wrapper Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char [] Ax, signed char const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char [] Ax, unsigned char const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short [] Ax, short const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short [] Ax, unsigned short const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int [] Ax, int const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int [] Ax, unsigned int const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long [] Ax, long long const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long [] Ax, unsigned long long const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float [] Ax, float const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double [] Ax, double const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double [] Ax, long double const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper [] Ax, npy_cfloat_wrapper const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper [] Ax, npy_cdouble_wrapper const [] Xx)
+    csr_scale_rows(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper [] Ax, npy_clongdouble_wrapper const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char [] Ax, signed char const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char [] Ax, unsigned char const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short [] Ax, short const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short [] Ax, unsigned short const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int [] Ax, int const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int [] Ax, unsigned int const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long [] Ax, long long const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long [] Ax, unsigned long long const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float [] Ax, float const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double [] Ax, double const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double [] Ax, long double const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper [] Ax, npy_cfloat_wrapper const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper [] Ax, npy_cdouble_wrapper const [] Xx)
+    csr_scale_rows(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper [] Ax, npy_clongdouble_wrapper const [] Xx)
     """
     return _csr.csr_scale_rows(*args)
 
 def csr_scale_columns(*args):
     """
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        signed char Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        unsigned char Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, short Ax, short Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        unsigned short Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, int Ax, int Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        unsigned int Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        long long Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        unsigned long long Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, float Ax, float Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, double Ax, double Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        long double Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        npy_cfloat_wrapper Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        npy_cdouble_wrapper Xx)
-    csr_scale_columns(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        npy_clongdouble_wrapper Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char [] Ax, signed char const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char [] Ax, unsigned char const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short [] Ax, short const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short [] Ax, unsigned short const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int [] Ax, int const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int [] Ax, unsigned int const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long [] Ax, long long const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long [] Ax, unsigned long long const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float [] Ax, float const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double [] Ax, double const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double [] Ax, long double const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper [] Ax, npy_cfloat_wrapper const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper [] Ax, npy_cdouble_wrapper const [] Xx)
+    csr_scale_columns(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper [] Ax, npy_clongdouble_wrapper const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char [] Ax, signed char const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char [] Ax, unsigned char const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short [] Ax, short const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short [] Ax, unsigned short const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int [] Ax, int const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int [] Ax, unsigned int const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long [] Ax, long long const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long [] Ax, unsigned long long const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float [] Ax, float const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double [] Ax, double const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double [] Ax, long double const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper [] Ax, npy_cfloat_wrapper const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper [] Ax, npy_cdouble_wrapper const [] Xx)
+    csr_scale_columns(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper [] Ax, npy_clongdouble_wrapper const [] Xx)
     """
     return _csr.csr_scale_columns(*args)
 
 def csr_tocsc(*args):
     """
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int Bp, int Bi, signed char Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int Bp, int Bi, unsigned char Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, short Ax, int Bp,
-        int Bi, short Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int Bp, int Bi, unsigned short Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, int Ax, int Bp,
-        int Bi, int Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int Bp, int Bi, unsigned int Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int Bp, int Bi, long long Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int Bp, int Bi, unsigned long long Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, float Ax, int Bp,
-        int Bi, float Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, double Ax, int Bp,
-        int Bi, double Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int Bp, int Bi, long double Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int Bp, int Bi, npy_cfloat_wrapper Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int Bp, int Bi, npy_cdouble_wrapper Bx)
-    csr_tocsc(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int Bp, int Bi, npy_clongdouble_wrapper Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int [] Bp, int [] Bi, signed char [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int [] Bp, int [] Bi, unsigned char [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int [] Bp, int [] Bi, short [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int [] Bp, int [] Bi, unsigned short [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int [] Bp, int [] Bi, int [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int [] Bp, int [] Bi, unsigned int [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int [] Bp, int [] Bi, long long [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int [] Bp, int [] Bi, unsigned long long [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int [] Bp, int [] Bi, float [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int [] Bp, int [] Bi, double [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int [] Bp, int [] Bi, long double [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int [] Bp, int [] Bi, npy_cfloat_wrapper [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int [] Bp, int [] Bi, npy_cdouble_wrapper [] Bx)
+    csr_tocsc(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int [] Bp, int [] Bi, npy_clongdouble_wrapper [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long [] Bp, long long [] Bi, signed char [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long [] Bp, long long [] Bi, unsigned char [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long [] Bp, long long [] Bi, short [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long [] Bp, long long [] Bi, unsigned short [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long [] Bp, long long [] Bi, int [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long [] Bp, long long [] Bi, unsigned int [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long [] Bp, long long [] Bi, long long [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long [] Bp, long long [] Bi, unsigned long long [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long [] Bp, long long [] Bi, float [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long [] Bp, long long [] Bi, double [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long [] Bp, long long [] Bi, long double [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long [] Bp, long long [] Bi, npy_cfloat_wrapper [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long [] Bp, long long [] Bi, npy_cdouble_wrapper [] Bx)
+    csr_tocsc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long [] Bp, long long [] Bi, npy_clongdouble_wrapper [] Bx)
     """
     return _csr.csr_tocsc(*args)
 
 def csr_tobsr(*args):
     """
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        signed char Ax, int Bp, int Bj, signed char Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        unsigned char Ax, int Bp, int Bj, unsigned char Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        short Ax, int Bp, int Bj, short Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        unsigned short Ax, int Bp, int Bj, unsigned short Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        int Ax, int Bp, int Bj, int Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        unsigned int Ax, int Bp, int Bj, unsigned int Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        long long Ax, int Bp, int Bj, long long Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        unsigned long long Ax, int Bp, int Bj, unsigned long long Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        float Ax, int Bp, int Bj, float Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        double Ax, int Bp, int Bj, double Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        long double Ax, int Bp, int Bj, long double Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        npy_cfloat_wrapper Ax, int Bp, int Bj, npy_cfloat_wrapper Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        npy_cdouble_wrapper Ax, int Bp, int Bj, npy_cdouble_wrapper Bx)
-    csr_tobsr(int n_row, int n_col, int R, int C, int Ap, int Aj,
-        npy_clongdouble_wrapper Ax, int Bp, int Bj,
-        npy_clongdouble_wrapper Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, signed char const [] Ax, int [] Bp, int [] Bj, signed char [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int [] Bp, int [] Bj, unsigned char [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, short const [] Ax, int [] Bp, int [] Bj, short [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int [] Bp, int [] Bj, unsigned short [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, int const [] Ax, int [] Bp, int [] Bj, int [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int [] Bp, int [] Bj, unsigned int [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, long long const [] Ax, int [] Bp, int [] Bj, long long [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int [] Bp, int [] Bj, unsigned long long [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, float const [] Ax, int [] Bp, int [] Bj, float [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, double const [] Ax, int [] Bp, int [] Bj, double [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, long double const [] Ax, int [] Bp, int [] Bj, long double [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int [] Bp, int [] Bj, npy_cfloat_wrapper [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int [] Bp, int [] Bj, npy_cdouble_wrapper [] Bx)
+    csr_tobsr(int const n_row, int const n_col, int const R, int const C, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int [] Bp, int [] Bj, npy_clongdouble_wrapper [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long [] Bp, long long [] Bj, signed char [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long [] Bp, long long [] Bj, unsigned char [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, short const [] Ax, long long [] Bp, long long [] Bj, short [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long [] Bp, long long [] Bj, unsigned short [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, int const [] Ax, long long [] Bp, long long [] Bj, int [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long [] Bp, long long [] Bj, unsigned int [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long [] Bp, long long [] Bj, long long [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long [] Bp, long long [] Bj, unsigned long long [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, float const [] Ax, long long [] Bp, long long [] Bj, float [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, double const [] Ax, long long [] Bp, long long [] Bj, double [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long [] Bp, long long [] Bj, long double [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long [] Bp, long long [] Bj, npy_cfloat_wrapper [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long [] Bp, long long [] Bj, npy_cdouble_wrapper [] Bx)
+    csr_tobsr(long long const n_row, long long const n_col, long long const R, long long const C, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long [] Bp, long long [] Bj, npy_clongdouble_wrapper [] Bx)
     """
     return _csr.csr_tobsr(*args)
 
 def csr_matmat_pass2(*args):
     """
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int Bp, int Bj, signed char Bx, int Cp, int Cj,
-        signed char Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int Bp, int Bj, unsigned char Bx, int Cp,
-        int Cj, unsigned char Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, short Ax, int Bp,
-        int Bj, short Bx, int Cp, int Cj, short Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int Bp, int Bj, unsigned short Bx, int Cp,
-        int Cj, unsigned short Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, int Ax, int Bp,
-        int Bj, int Bx, int Cp, int Cj, int Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int Bp, int Bj, unsigned int Bx, int Cp,
-        int Cj, unsigned int Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int Bp, int Bj, long long Bx, int Cp, int Cj,
-        long long Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int Bp, int Bj, unsigned long long Bx,
-        int Cp, int Cj, unsigned long long Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, float Ax, int Bp,
-        int Bj, float Bx, int Cp, int Cj, float Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, double Ax, int Bp,
-        int Bj, double Bx, int Cp, int Cj, double Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int Bp, int Bj, long double Bx, int Cp, int Cj,
-        long double Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int Bp, int Bj, npy_cfloat_wrapper Bx,
-        int Cp, int Cj, npy_cfloat_wrapper Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int Bp, int Bj, npy_cdouble_wrapper Bx,
-        int Cp, int Cj, npy_cdouble_wrapper Cx)
-    csr_matmat_pass2(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int Bp, int Bj, npy_clongdouble_wrapper Bx,
-        int Cp, int Cj, npy_clongdouble_wrapper Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int const [] Bp, int const [] Bj, signed char const [] Bx, int [] Cp, int [] Cj, signed char [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int const [] Bp, int const [] Bj, unsigned char const [] Bx, int [] Cp, int [] Cj, unsigned char [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int const [] Bp, int const [] Bj, short const [] Bx, int [] Cp, int [] Cj, short [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int const [] Bp, int const [] Bj, unsigned short const [] Bx, int [] Cp, int [] Cj, unsigned short [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const [] Bp, int const [] Bj, int const [] Bx, int [] Cp, int [] Cj, int [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int const [] Bp, int const [] Bj, unsigned int const [] Bx, int [] Cp, int [] Cj, unsigned int [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int const [] Bp, int const [] Bj, long long const [] Bx, int [] Cp, int [] Cj, long long [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int const [] Bp, int const [] Bj, unsigned long long const [] Bx, int [] Cp, int [] Cj, unsigned long long [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int const [] Bp, int const [] Bj, float const [] Bx, int [] Cp, int [] Cj, float [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int const [] Bp, int const [] Bj, double const [] Bx, int [] Cp, int [] Cj, double [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int const [] Bp, int const [] Bj, long double const [] Bx, int [] Cp, int [] Cj, long double [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_clongdouble_wrapper [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long const [] Bp, long long const [] Bj, signed char const [] Bx, long long [] Cp, long long [] Cj, signed char [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long const [] Bp, long long const [] Bj, unsigned char const [] Bx, long long [] Cp, long long [] Cj, unsigned char [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long const [] Bp, long long const [] Bj, short const [] Bx, long long [] Cp, long long [] Cj, short [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long const [] Bp, long long const [] Bj, unsigned short const [] Bx, long long [] Cp, long long [] Cj, unsigned short [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long const [] Bp, long long const [] Bj, int const [] Bx, long long [] Cp, long long [] Cj, int [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long const [] Bp, long long const [] Bj, unsigned int const [] Bx, long long [] Cp, long long [] Cj, unsigned int [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const [] Bp, long long const [] Bj, long long const [] Bx, long long [] Cp, long long [] Cj, long long [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bj, unsigned long long const [] Bx, long long [] Cp, long long [] Cj, unsigned long long [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long const [] Bp, long long const [] Bj, float const [] Bx, long long [] Cp, long long [] Cj, float [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long const [] Bp, long long const [] Bj, double const [] Bx, long long [] Cp, long long [] Cj, double [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long const [] Bp, long long const [] Bj, long double const [] Bx, long long [] Cp, long long [] Cj, long double [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_clongdouble_wrapper [] Cx)
     """
     return _csr.csr_matmat_pass2(*args)
 
 def csr_matvec(*args):
     """
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        signed char Xx, signed char Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        unsigned char Xx, unsigned char Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, short Ax, short Xx,
-        short Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        unsigned short Xx, unsigned short Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, int Ax, int Xx,
-        int Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        unsigned int Xx, unsigned int Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        long long Xx, long long Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        unsigned long long Xx, unsigned long long Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, float Ax, float Xx,
-        float Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, double Ax, double Xx,
-        double Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        long double Xx, long double Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        npy_cfloat_wrapper Xx, npy_cfloat_wrapper Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        npy_cdouble_wrapper Xx, npy_cdouble_wrapper Yx)
-    csr_matvec(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        npy_clongdouble_wrapper Xx, npy_clongdouble_wrapper Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, short const [] Xx, short [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const [] Xx, int [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, float const [] Xx, float [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, double const [] Xx, double [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csr_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, short const [] Xx, short [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, int const [] Xx, int [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, float const [] Xx, float [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, double const [] Xx, double [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csr_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
     """
     return _csr.csr_matvec(*args)
 
 def csr_matvecs(*args):
     """
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, signed char Ax,
-        signed char Xx, signed char Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, unsigned char Ax,
-        unsigned char Xx, unsigned char Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, short Ax,
-        short Xx, short Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, unsigned short Ax,
-        unsigned short Xx, unsigned short Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, int Ax,
-        int Xx, int Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, unsigned int Ax,
-        unsigned int Xx, unsigned int Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, long long Ax,
-        long long Xx, long long Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, unsigned long long Ax,
-        unsigned long long Xx,
-        unsigned long long Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, float Ax,
-        float Xx, float Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, double Ax,
-        double Xx, double Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, long double Ax,
-        long double Xx, long double Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        npy_cfloat_wrapper Xx,
-        npy_cfloat_wrapper Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        npy_cdouble_wrapper Xx,
-        npy_cdouble_wrapper Yx)
-    csr_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        npy_clongdouble_wrapper Xx,
-        npy_clongdouble_wrapper Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, short const [] Ax, short const [] Xx, short [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, int const [] Ax, int const [] Xx, int [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, float const [] Ax, float const [] Xx, float [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, double const [] Ax, double const [] Xx, double [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csr_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, short const [] Ax, short const [] Xx, short [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, int const [] Ax, int const [] Xx, int [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, float const [] Ax, float const [] Xx, float [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, double const [] Ax, double const [] Xx, double [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csr_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
     """
     return _csr.csr_matvecs(*args)
 
 def csr_elmul_csr(*args):
     """
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int Bp, int Bj, signed char Bx, int Cp, int Cj,
-        signed char Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int Bp, int Bj, unsigned char Bx, int Cp,
-        int Cj, unsigned char Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, short Ax, int Bp,
-        int Bj, short Bx, int Cp, int Cj, short Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int Bp, int Bj, unsigned short Bx, int Cp,
-        int Cj, unsigned short Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, int Ax, int Bp,
-        int Bj, int Bx, int Cp, int Cj, int Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int Bp, int Bj, unsigned int Bx, int Cp,
-        int Cj, unsigned int Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int Bp, int Bj, long long Bx, int Cp, int Cj,
-        long long Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int Bp, int Bj, unsigned long long Bx,
-        int Cp, int Cj, unsigned long long Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, float Ax, int Bp,
-        int Bj, float Bx, int Cp, int Cj, float Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, double Ax, int Bp,
-        int Bj, double Bx, int Cp, int Cj, double Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int Bp, int Bj, long double Bx, int Cp, int Cj,
-        long double Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int Bp, int Bj, npy_cfloat_wrapper Bx,
-        int Cp, int Cj, npy_cfloat_wrapper Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int Bp, int Bj, npy_cdouble_wrapper Bx,
-        int Cp, int Cj, npy_cdouble_wrapper Cx)
-    csr_elmul_csr(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int Bp, int Bj, npy_clongdouble_wrapper Bx,
-        int Cp, int Cj, npy_clongdouble_wrapper Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int const [] Bp, int const [] Bj, signed char const [] Bx, int [] Cp, int [] Cj, signed char [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int const [] Bp, int const [] Bj, unsigned char const [] Bx, int [] Cp, int [] Cj, unsigned char [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int const [] Bp, int const [] Bj, short const [] Bx, int [] Cp, int [] Cj, short [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int const [] Bp, int const [] Bj, unsigned short const [] Bx, int [] Cp, int [] Cj, unsigned short [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const [] Bp, int const [] Bj, int const [] Bx, int [] Cp, int [] Cj, int [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int const [] Bp, int const [] Bj, unsigned int const [] Bx, int [] Cp, int [] Cj, unsigned int [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int const [] Bp, int const [] Bj, long long const [] Bx, int [] Cp, int [] Cj, long long [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int const [] Bp, int const [] Bj, unsigned long long const [] Bx, int [] Cp, int [] Cj, unsigned long long [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int const [] Bp, int const [] Bj, float const [] Bx, int [] Cp, int [] Cj, float [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int const [] Bp, int const [] Bj, double const [] Bx, int [] Cp, int [] Cj, double [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int const [] Bp, int const [] Bj, long double const [] Bx, int [] Cp, int [] Cj, long double [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_elmul_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_clongdouble_wrapper [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long const [] Bp, long long const [] Bj, signed char const [] Bx, long long [] Cp, long long [] Cj, signed char [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long const [] Bp, long long const [] Bj, unsigned char const [] Bx, long long [] Cp, long long [] Cj, unsigned char [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long const [] Bp, long long const [] Bj, short const [] Bx, long long [] Cp, long long [] Cj, short [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long const [] Bp, long long const [] Bj, unsigned short const [] Bx, long long [] Cp, long long [] Cj, unsigned short [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long const [] Bp, long long const [] Bj, int const [] Bx, long long [] Cp, long long [] Cj, int [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long const [] Bp, long long const [] Bj, unsigned int const [] Bx, long long [] Cp, long long [] Cj, unsigned int [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const [] Bp, long long const [] Bj, long long const [] Bx, long long [] Cp, long long [] Cj, long long [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bj, unsigned long long const [] Bx, long long [] Cp, long long [] Cj, unsigned long long [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long const [] Bp, long long const [] Bj, float const [] Bx, long long [] Cp, long long [] Cj, float [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long const [] Bp, long long const [] Bj, double const [] Bx, long long [] Cp, long long [] Cj, double [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long const [] Bp, long long const [] Bj, long double const [] Bx, long long [] Cp, long long [] Cj, long double [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_elmul_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_clongdouble_wrapper [] Cx)
     """
     return _csr.csr_elmul_csr(*args)
 
 def csr_eldiv_csr(*args):
     """
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int Bp, int Bj, signed char Bx, int Cp, int Cj,
-        signed char Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int Bp, int Bj, unsigned char Bx, int Cp,
-        int Cj, unsigned char Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, short Ax, int Bp,
-        int Bj, short Bx, int Cp, int Cj, short Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int Bp, int Bj, unsigned short Bx, int Cp,
-        int Cj, unsigned short Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, int Ax, int Bp,
-        int Bj, int Bx, int Cp, int Cj, int Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int Bp, int Bj, unsigned int Bx, int Cp,
-        int Cj, unsigned int Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int Bp, int Bj, long long Bx, int Cp, int Cj,
-        long long Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int Bp, int Bj, unsigned long long Bx,
-        int Cp, int Cj, unsigned long long Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, float Ax, int Bp,
-        int Bj, float Bx, int Cp, int Cj, float Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, double Ax, int Bp,
-        int Bj, double Bx, int Cp, int Cj, double Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int Bp, int Bj, long double Bx, int Cp, int Cj,
-        long double Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int Bp, int Bj, npy_cfloat_wrapper Bx,
-        int Cp, int Cj, npy_cfloat_wrapper Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int Bp, int Bj, npy_cdouble_wrapper Bx,
-        int Cp, int Cj, npy_cdouble_wrapper Cx)
-    csr_eldiv_csr(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int Bp, int Bj, npy_clongdouble_wrapper Bx,
-        int Cp, int Cj, npy_clongdouble_wrapper Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int const [] Bp, int const [] Bj, signed char const [] Bx, int [] Cp, int [] Cj, signed char [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int const [] Bp, int const [] Bj, unsigned char const [] Bx, int [] Cp, int [] Cj, unsigned char [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int const [] Bp, int const [] Bj, short const [] Bx, int [] Cp, int [] Cj, short [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int const [] Bp, int const [] Bj, unsigned short const [] Bx, int [] Cp, int [] Cj, unsigned short [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const [] Bp, int const [] Bj, int const [] Bx, int [] Cp, int [] Cj, int [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int const [] Bp, int const [] Bj, unsigned int const [] Bx, int [] Cp, int [] Cj, unsigned int [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int const [] Bp, int const [] Bj, long long const [] Bx, int [] Cp, int [] Cj, long long [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int const [] Bp, int const [] Bj, unsigned long long const [] Bx, int [] Cp, int [] Cj, unsigned long long [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int const [] Bp, int const [] Bj, float const [] Bx, int [] Cp, int [] Cj, float [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int const [] Bp, int const [] Bj, double const [] Bx, int [] Cp, int [] Cj, double [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int const [] Bp, int const [] Bj, long double const [] Bx, int [] Cp, int [] Cj, long double [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_eldiv_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_clongdouble_wrapper [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long const [] Bp, long long const [] Bj, signed char const [] Bx, long long [] Cp, long long [] Cj, signed char [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long const [] Bp, long long const [] Bj, unsigned char const [] Bx, long long [] Cp, long long [] Cj, unsigned char [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long const [] Bp, long long const [] Bj, short const [] Bx, long long [] Cp, long long [] Cj, short [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long const [] Bp, long long const [] Bj, unsigned short const [] Bx, long long [] Cp, long long [] Cj, unsigned short [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long const [] Bp, long long const [] Bj, int const [] Bx, long long [] Cp, long long [] Cj, int [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long const [] Bp, long long const [] Bj, unsigned int const [] Bx, long long [] Cp, long long [] Cj, unsigned int [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const [] Bp, long long const [] Bj, long long const [] Bx, long long [] Cp, long long [] Cj, long long [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bj, unsigned long long const [] Bx, long long [] Cp, long long [] Cj, unsigned long long [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long const [] Bp, long long const [] Bj, float const [] Bx, long long [] Cp, long long [] Cj, float [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long const [] Bp, long long const [] Bj, double const [] Bx, long long [] Cp, long long [] Cj, double [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long const [] Bp, long long const [] Bj, long double const [] Bx, long long [] Cp, long long [] Cj, long double [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_eldiv_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_clongdouble_wrapper [] Cx)
     """
     return _csr.csr_eldiv_csr(*args)
 
 def csr_plus_csr(*args):
     """
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int Bp, int Bj, signed char Bx, int Cp, int Cj,
-        signed char Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int Bp, int Bj, unsigned char Bx, int Cp,
-        int Cj, unsigned char Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, short Ax, int Bp,
-        int Bj, short Bx, int Cp, int Cj, short Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int Bp, int Bj, unsigned short Bx, int Cp,
-        int Cj, unsigned short Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, int Ax, int Bp,
-        int Bj, int Bx, int Cp, int Cj, int Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int Bp, int Bj, unsigned int Bx, int Cp,
-        int Cj, unsigned int Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int Bp, int Bj, long long Bx, int Cp, int Cj,
-        long long Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int Bp, int Bj, unsigned long long Bx,
-        int Cp, int Cj, unsigned long long Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, float Ax, int Bp,
-        int Bj, float Bx, int Cp, int Cj, float Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, double Ax, int Bp,
-        int Bj, double Bx, int Cp, int Cj, double Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int Bp, int Bj, long double Bx, int Cp, int Cj,
-        long double Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int Bp, int Bj, npy_cfloat_wrapper Bx,
-        int Cp, int Cj, npy_cfloat_wrapper Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int Bp, int Bj, npy_cdouble_wrapper Bx,
-        int Cp, int Cj, npy_cdouble_wrapper Cx)
-    csr_plus_csr(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int Bp, int Bj, npy_clongdouble_wrapper Bx,
-        int Cp, int Cj, npy_clongdouble_wrapper Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int const [] Bp, int const [] Bj, signed char const [] Bx, int [] Cp, int [] Cj, signed char [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int const [] Bp, int const [] Bj, unsigned char const [] Bx, int [] Cp, int [] Cj, unsigned char [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int const [] Bp, int const [] Bj, short const [] Bx, int [] Cp, int [] Cj, short [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int const [] Bp, int const [] Bj, unsigned short const [] Bx, int [] Cp, int [] Cj, unsigned short [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const [] Bp, int const [] Bj, int const [] Bx, int [] Cp, int [] Cj, int [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int const [] Bp, int const [] Bj, unsigned int const [] Bx, int [] Cp, int [] Cj, unsigned int [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int const [] Bp, int const [] Bj, long long const [] Bx, int [] Cp, int [] Cj, long long [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int const [] Bp, int const [] Bj, unsigned long long const [] Bx, int [] Cp, int [] Cj, unsigned long long [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int const [] Bp, int const [] Bj, float const [] Bx, int [] Cp, int [] Cj, float [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int const [] Bp, int const [] Bj, double const [] Bx, int [] Cp, int [] Cj, double [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int const [] Bp, int const [] Bj, long double const [] Bx, int [] Cp, int [] Cj, long double [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_plus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_clongdouble_wrapper [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long const [] Bp, long long const [] Bj, signed char const [] Bx, long long [] Cp, long long [] Cj, signed char [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long const [] Bp, long long const [] Bj, unsigned char const [] Bx, long long [] Cp, long long [] Cj, unsigned char [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long const [] Bp, long long const [] Bj, short const [] Bx, long long [] Cp, long long [] Cj, short [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long const [] Bp, long long const [] Bj, unsigned short const [] Bx, long long [] Cp, long long [] Cj, unsigned short [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long const [] Bp, long long const [] Bj, int const [] Bx, long long [] Cp, long long [] Cj, int [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long const [] Bp, long long const [] Bj, unsigned int const [] Bx, long long [] Cp, long long [] Cj, unsigned int [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const [] Bp, long long const [] Bj, long long const [] Bx, long long [] Cp, long long [] Cj, long long [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bj, unsigned long long const [] Bx, long long [] Cp, long long [] Cj, unsigned long long [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long const [] Bp, long long const [] Bj, float const [] Bx, long long [] Cp, long long [] Cj, float [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long const [] Bp, long long const [] Bj, double const [] Bx, long long [] Cp, long long [] Cj, double [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long const [] Bp, long long const [] Bj, long double const [] Bx, long long [] Cp, long long [] Cj, long double [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_plus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_clongdouble_wrapper [] Cx)
     """
     return _csr.csr_plus_csr(*args)
 
 def csr_minus_csr(*args):
     """
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int Bp, int Bj, signed char Bx, int Cp, int Cj,
-        signed char Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int Bp, int Bj, unsigned char Bx, int Cp,
-        int Cj, unsigned char Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, short Ax, int Bp,
-        int Bj, short Bx, int Cp, int Cj, short Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int Bp, int Bj, unsigned short Bx, int Cp,
-        int Cj, unsigned short Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, int Ax, int Bp,
-        int Bj, int Bx, int Cp, int Cj, int Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int Bp, int Bj, unsigned int Bx, int Cp,
-        int Cj, unsigned int Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int Bp, int Bj, long long Bx, int Cp, int Cj,
-        long long Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int Bp, int Bj, unsigned long long Bx,
-        int Cp, int Cj, unsigned long long Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, float Ax, int Bp,
-        int Bj, float Bx, int Cp, int Cj, float Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, double Ax, int Bp,
-        int Bj, double Bx, int Cp, int Cj, double Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int Bp, int Bj, long double Bx, int Cp, int Cj,
-        long double Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int Bp, int Bj, npy_cfloat_wrapper Bx,
-        int Cp, int Cj, npy_cfloat_wrapper Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int Bp, int Bj, npy_cdouble_wrapper Bx,
-        int Cp, int Cj, npy_cdouble_wrapper Cx)
-    csr_minus_csr(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int Bp, int Bj, npy_clongdouble_wrapper Bx,
-        int Cp, int Cj, npy_clongdouble_wrapper Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int const [] Bp, int const [] Bj, signed char const [] Bx, int [] Cp, int [] Cj, signed char [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int const [] Bp, int const [] Bj, unsigned char const [] Bx, int [] Cp, int [] Cj, unsigned char [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int const [] Bp, int const [] Bj, short const [] Bx, int [] Cp, int [] Cj, short [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int const [] Bp, int const [] Bj, unsigned short const [] Bx, int [] Cp, int [] Cj, unsigned short [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const [] Bp, int const [] Bj, int const [] Bx, int [] Cp, int [] Cj, int [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int const [] Bp, int const [] Bj, unsigned int const [] Bx, int [] Cp, int [] Cj, unsigned int [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int const [] Bp, int const [] Bj, long long const [] Bx, int [] Cp, int [] Cj, long long [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int const [] Bp, int const [] Bj, unsigned long long const [] Bx, int [] Cp, int [] Cj, unsigned long long [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int const [] Bp, int const [] Bj, float const [] Bx, int [] Cp, int [] Cj, float [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int const [] Bp, int const [] Bj, double const [] Bx, int [] Cp, int [] Cj, double [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int const [] Bp, int const [] Bj, long double const [] Bx, int [] Cp, int [] Cj, long double [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_minus_csr(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bj, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Cj, npy_clongdouble_wrapper [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long const [] Bp, long long const [] Bj, signed char const [] Bx, long long [] Cp, long long [] Cj, signed char [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long const [] Bp, long long const [] Bj, unsigned char const [] Bx, long long [] Cp, long long [] Cj, unsigned char [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long const [] Bp, long long const [] Bj, short const [] Bx, long long [] Cp, long long [] Cj, short [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long const [] Bp, long long const [] Bj, unsigned short const [] Bx, long long [] Cp, long long [] Cj, unsigned short [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long const [] Bp, long long const [] Bj, int const [] Bx, long long [] Cp, long long [] Cj, int [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long const [] Bp, long long const [] Bj, unsigned int const [] Bx, long long [] Cp, long long [] Cj, unsigned int [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const [] Bp, long long const [] Bj, long long const [] Bx, long long [] Cp, long long [] Cj, long long [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bj, unsigned long long const [] Bx, long long [] Cp, long long [] Cj, unsigned long long [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long const [] Bp, long long const [] Bj, float const [] Bx, long long [] Cp, long long [] Cj, float [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long const [] Bp, long long const [] Bj, double const [] Bx, long long [] Cp, long long [] Cj, double [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long const [] Bp, long long const [] Bj, long double const [] Bx, long long [] Cp, long long [] Cj, long double [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cfloat_wrapper [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_cdouble_wrapper [] Cx)
+    csr_minus_csr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bj, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Cj, npy_clongdouble_wrapper [] Cx)
     """
     return _csr.csr_minus_csr(*args)
 
 def csr_sort_indices(*args):
     """
-    csr_sort_indices(int n_row, int Ap, int Aj, signed char Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, unsigned char Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, short Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, unsigned short Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, int Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, unsigned int Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, long long Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, unsigned long long Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, float Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, double Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, long double Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, npy_cfloat_wrapper Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, npy_cdouble_wrapper Ax)
-    csr_sort_indices(int n_row, int Ap, int Aj, npy_clongdouble_wrapper Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, signed char [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, unsigned char [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, short [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, unsigned short [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, int [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, unsigned int [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, long long [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, unsigned long long [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, float [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, double [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, long double [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, npy_cfloat_wrapper [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, npy_cdouble_wrapper [] Ax)
+    csr_sort_indices(int const n_row, int const [] Ap, int [] Aj, npy_clongdouble_wrapper [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, signed char [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, unsigned char [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, short [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, unsigned short [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, int [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, unsigned int [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, long long [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, unsigned long long [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, float [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, double [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, long double [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, npy_cfloat_wrapper [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, npy_cdouble_wrapper [] Ax)
+    csr_sort_indices(long long const n_row, long long const [] Ap, long long [] Aj, npy_clongdouble_wrapper [] Ax)
     """
     return _csr.csr_sort_indices(*args)
 
 def csr_eliminate_zeros(*args):
     """
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, signed char Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, unsigned char Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, short Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, unsigned short Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, int Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, unsigned int Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, long long Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, float Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, double Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, long double Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax)
-    csr_eliminate_zeros(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, signed char [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned char [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, short [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned short [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, int [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned int [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, long long [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned long long [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, float [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, double [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, long double [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, npy_cfloat_wrapper [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, npy_cdouble_wrapper [] Ax)
+    csr_eliminate_zeros(int const n_row, int const n_col, int [] Ap, int [] Aj, npy_clongdouble_wrapper [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, signed char [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned char [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, short [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned short [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, int [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned int [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, long long [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned long long [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, float [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, double [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, long double [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, npy_cfloat_wrapper [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, npy_cdouble_wrapper [] Ax)
+    csr_eliminate_zeros(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, npy_clongdouble_wrapper [] Ax)
     """
     return _csr.csr_eliminate_zeros(*args)
 
 def csr_sum_duplicates(*args):
     """
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, signed char Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, unsigned char Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, short Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, unsigned short Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, int Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, unsigned int Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, long long Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, float Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, double Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, long double Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax)
-    csr_sum_duplicates(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, signed char [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned char [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, short [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned short [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, int [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned int [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, long long [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, unsigned long long [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, float [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, double [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, long double [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, npy_cfloat_wrapper [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, npy_cdouble_wrapper [] Ax)
+    csr_sum_duplicates(int const n_row, int const n_col, int [] Ap, int [] Aj, npy_clongdouble_wrapper [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, signed char [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned char [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, short [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned short [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, int [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned int [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, long long [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, unsigned long long [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, float [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, double [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, long double [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, npy_cfloat_wrapper [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, npy_cdouble_wrapper [] Ax)
+    csr_sum_duplicates(long long const n_row, long long const n_col, long long [] Ap, long long [] Aj, npy_clongdouble_wrapper [] Ax)
     """
     return _csr.csr_sum_duplicates(*args)
 
 def get_csr_submatrix(*args):
     """
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, short Ax, int ir0,
-        int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, int Ax, int ir0,
-        int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, float Ax, int ir0,
-        int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, double Ax, int ir0,
-        int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int ir0, int ir1, int ic0, int ic1)
-    get_csr_submatrix(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int ir0, int ir1, int ic0, int ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int const ir0, int const ir1, int const ic0, int const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
+    get_csr_submatrix(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long const ir0, long long const ir1, long long const ic0, long long const ic1)
     """
     return _csr.get_csr_submatrix(*args)
 
 def csr_sample_values(*args):
     """
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, signed char Ax,
-        int n_samples, int Bi, int Bj, signed char Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, unsigned char Ax,
-        int n_samples, int Bi, int Bj, unsigned char Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, short Ax, int n_samples,
-        int Bi, int Bj, short Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, unsigned short Ax,
-        int n_samples, int Bi, int Bj, unsigned short Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, int Ax, int n_samples,
-        int Bi, int Bj, int Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, unsigned int Ax,
-        int n_samples, int Bi, int Bj, unsigned int Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, long long Ax,
-        int n_samples, int Bi, int Bj, long long Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax,
-        int n_samples, int Bi, int Bj, unsigned long long Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, float Ax, int n_samples,
-        int Bi, int Bj, float Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, double Ax, int n_samples,
-        int Bi, int Bj, double Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, long double Ax,
-        int n_samples, int Bi, int Bj, long double Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax,
-        int n_samples, int Bi, int Bj, npy_cfloat_wrapper Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax,
-        int n_samples, int Bi, int Bj, npy_cdouble_wrapper Bx)
-    csr_sample_values(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax,
-        int n_samples, int Bi, int Bj,
-        npy_clongdouble_wrapper Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, signed char [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, unsigned char [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, short [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, unsigned short [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, int [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, unsigned int [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, long long [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, unsigned long long [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, float [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, double [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, long double [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, npy_cfloat_wrapper [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, npy_cdouble_wrapper [] Bx)
+    csr_sample_values(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, int const n_samples, int const [] Bi, int const [] Bj, npy_clongdouble_wrapper [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, signed char [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, unsigned char [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, short [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, unsigned short [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, int [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, unsigned int [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, long long [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, unsigned long long [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, float [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, double [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, long double [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, npy_cfloat_wrapper [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, npy_cdouble_wrapper [] Bx)
+    csr_sample_values(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, long long const n_samples, long long const [] Bi, long long const [] Bj, npy_clongdouble_wrapper [] Bx)
     """
     return _csr.csr_sample_values(*args)
+# This file is compatible with both classic and new-style classes.
+
+
@@ -2,7 +2,7 @@
 """
 
 __all__ = ['upcast','getdtype','isscalarlike','isintlike',
-            'isshape','issequence','isdense']
+            'isshape','issequence','isdense','get_index_dtype']
 
 import numpy as np
 
@@ -59,6 +59,57 @@ def upcast_char(*args):
     _upcast_memo[args] = t
     return t
 
+def get_index_dtype(arrays=(), maxval=None, check_contents=False):
+    """Returns a suitable index data type for the given index arrays
+
+    Sparse matrices store their indices as C ints (np.intc), which
+    sparsetools handles fastest, and switch to np.int64 only when that is
+    needed to hold the indices or index pointers.
+
+    Parameters
+    ----------
+    arrays : tuple of array_like
+        Input arrays whose values will be stored as indices.
+    maxval : int, optional
+        Largest value that the indices will hold, e.g. the number of
+        nonzeros for an index pointer.
+    check_contents : bool, optional
+        Whether to look at the values of arrays whose dtype is wider than
+        np.intc, rather than assuming that they need np.int64.
+
+    Returns
+    -------
+    dtype : dtype
+        np.intc or np.int64.
+
+    Examples
+    --------
+
+    >>> get_index_dtype(maxval=2**40)
+    <type 'numpy.int64'>
+    >>> get_index_dtype((np.array([0, 1, 5]),), check_contents=True)
+    <type 'numpy.int32'>
+
+    """
+    int32min = np.iinfo(np.intc).min
+    int32max = np.iinfo(np.intc).max
+
+    if maxval is not None and maxval > int32max:
+        return np.int64
+
+    for arr in arrays:
+        arr = np.asarray(arr)
+        if np.can_cast(arr.dtype, np.intc):
+            continue
+        if check_contents:
+            if arr.size == 0:
+                continue
+            if arr.min() >= int32min and arr.max() <= int32max:
+                continue
+        return np.int64
+
+    return np.intc
+
 def to_native(A):
     return np.asarray(A,dtype=A.dtype.newbyteorder('native'))
 
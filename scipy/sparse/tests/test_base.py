@@ -648,6 +648,69 @@ class _TestGetSet:
         for ij in [(0,3),(-1,3),(4,0),(4,3),(4,-1)]:
             assert_raises(IndexError, A.__getitem__, ij)
 
+class _TestFancySet:
+    def test_fancy_setelement(self):
+        D = zeros((4,5))
+        A = self.spmatrix(D)
+        i = array([0, 3, 1, -1, 2, 0])
+        j = array([1, 4, 1, 0, -2, 1])
+        v = array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        A[i,j] = v
+        D[i,j] = v
+        assert_array_equal(A.todense(), D)
+        assert_(A.has_sorted_indices)
+
+        # existing entries are updated and new ones inserted
+        A[[0, 2], [1, 0]] = [-1, -2]
+        D[[0, 2], [1, 0]] = [-1, -2]
+        assert_array_equal(A.todense(), D)
+
+        # indices and values are broadcast
+        A[arange(4)[:,None], [1, 3]] = 9
+        D[arange(4)[:,None], [1, 3]] = 9
+        assert_array_equal(A.todense(), D)
+
+        assert_raises(IndexError, A.__setitem__, ([0, 4], [0, 0]), 1.0)
+        assert_raises(IndexError, A.__setitem__, ([0, 0], [0, -6]), 1.0)
+        assert_raises(IndexError, A.__setitem__, ([2**32, 0], [0, 0]), 1.0)
+        assert_raises(IndexError, A.__setitem__, (0, -2**32), 1.0)
+        assert_raises(ValueError, A.__setitem__, ([0, 1], [0, 1]), [1, 2, 3])
+
+
+class _TestMatmat:
+    def test_dot_sparse_n_jobs(self):
+        np.random.seed(1234)
+        A = self.spmatrix(sparse.rand(500, 400, density=0.05, format='csr'))
+        B = sparse.rand(400, 300, density=0.05, format='csr')
+        A.data = np.round(2 * A.data) - 1
+        B.data = np.round(2 * B.data) - 1
+        D = dot(A.toarray(), B.toarray())
+
+        for n_jobs in [1, 2, 3, 8, -1]:
+            C = A.dot(B, n_jobs=n_jobs)
+            assert_equal(C.format, A.format)
+            assert_array_equal(C.toarray(), D)
+
+        old = sparse.set_n_jobs(4)
+        try:
+            assert_array_equal((A * B).toarray(), D)
+            assert_array_equal((A * B.tocsc()).toarray(), D)
+        finally:
+            sparse.set_n_jobs(old)
+
+        assert_raises(ValueError, A.dot, B.T)
+
+    def test_dot_nnz_bound(self):
+        A = self.spmatrix([[1, 0, 2], [0, 0, 0], [3, 4, 0]])
+        B = self.spmatrix([[1, 1, 0, 0], [0, 0, 0, 1], [1, 0, 0, 0]])
+        assert_equal(A.dot_nnz_bound(B), 6)
+        assert_equal(A.dot_nnz_bound(B.tocsr()), 6)
+        assert_equal(B.T.dot_nnz_bound(A.T), 6)
+        assert_equal((A * B).nnz, 5)
+        assert_(A.dot_nnz_bound(A) >= (A * A).nnz)
+        assert_raises(ValueError, A.dot_nnz_bound, self.spmatrix((2, 3)))
+
+
 class _TestSolve:
     def test_solve(self):
         """ Test whether the lu_solve command segfaults, as reported by Nils
@@ -761,22 +824,29 @@ class _TestFancyIndexing:
     """Tests fancy indexing features.  The tests for any matrix formats
     that implement these features should derive from this class.
     """
-    def test_fancy_indexing_set(self):
+    def _check_set(self, i, j, nitems):
         n, m = (5, 10)
-        def _test_set(i, j, nitems):
-            A = self.spmatrix((n, m))
-            A[i, j] = 1
-            assert_almost_equal(A.sum(), nitems)
-            assert_almost_equal(A[i, j], 1)
+        A = self.spmatrix((n, m))
+        A[i, j] = 1
+        assert_almost_equal(A.sum(), nitems)
+        assert_almost_equal(A[i, j], 1)
 
+    def test_fancy_indexing_set(self):
         # [i,j]
         for i, j in [(2, 3), (-1, 8), (-1, -2), (array(-1), -2), (-1, array(-2)),
                      (array(-1), array(-2))]:
-            _test_set(i, j, 1)
+            self._check_set(i, j, 1)
+
+        # [[i1,i2],[j1,j2]]
+        for i, j in [([0, 2], [1, 3]), (array([-1, 0]), array([-2, 9]))]:
+            self._check_set(i, j, 2)
 
+    def test_fancy_indexing_set_slice(self):
+        m = 10
         # [i,1:2]
-        for i, j in [(2, slice(m)), (2, slice(5, -2)), (array(2), slice(5, -2))]:
-            _test_set(i, j, 3)
+        for i, j, nitems in [(2, slice(m), m), (2, slice(5, -2), 3),
+                             (array(2), slice(5, -2), 3)]:
+            self._check_set(i, j, nitems)
 
     def test_fancy_indexing(self):
         B = asmatrix(arange(50).reshape(5,10))
@@ -902,6 +972,53 @@ class _TestFancyIndexing:
         assert_raises(IndexError, S.__getitem__, (I,J_bad))
 
 
+class _TestFancyMask:
+    """Tests boolean masks and repeated indices in fancy indexing
+    """
+    def test_fancy_indexing_mask(self):
+        B = asmatrix(arange(50).reshape(5,10))
+        A = self.spmatrix(B)
+
+        I = array([True, False, True, True, False])
+        J = arange(10) % 3 == 0
+
+        assert_equal(A[I,:].todense(), B[I,:])
+        assert_equal(A[:,J].todense(), B[:,J])
+        assert_equal(A[I].todense(), B[I])
+        assert_equal(A[I,2:7].todense(), B[I,2:7])
+        assert_equal(A[1:4,J].todense(), B[1:4,J])
+        assert_equal(A[3,J].todense(), B[3,J])
+        assert_equal(A[I,:][:,J].todense(), B[I,:][:,J])
+
+        assert_raises(IndexError, A.__getitem__, (I[:-1],slice(None)))
+        assert_raises(IndexError, A.__getitem__, (slice(None),J[:-1]))
+
+    def test_fancy_indexing_repeated(self):
+        B = asmatrix(arange(50).reshape(5,10))
+        B[:,::4] = 0
+        A = self.spmatrix(B)
+
+        I = [3, 1, 3, -2, 0, 3]
+        J = [9, 2, 2, -1, 0, 4, 2]
+
+        for X in [A[I,:], A[:,J], A[I,:][:,J], A[:,J][I,:]]:
+            assert_equal(X.format, A.format)
+        assert_equal(A[I,:].todense(), B[I,:])
+        assert_equal(A[:,J].todense(), B[:,J])
+        assert_equal(A[I,:][:,J].todense(), B[I,:][:,J])
+        assert_equal(A[:,J][I,:].todense(), B[:,J][I,:])
+
+        # matrices with duplicate entries
+        C = self.spmatrix((np.ones(3), ([0,0,1], [1,1,2])), shape=(2,3))
+        assert_equal(C[[1,0,0],:].todense(), [[0,0,1],[0,2,0],[0,2,0]])
+        assert_equal(C[:,[1,2,1]].todense(), [[2,0,2],[0,1,0]])
+
+        assert_equal(A.getrow(-2).format, 'csr')
+        assert_equal(A.getrow(-2).todense(), B[-2,:])
+        assert_equal(A.getcol(2).format, A.format)
+        assert_equal(A.getcol(2).todense(), B[:,2])
+
+
 class _TestArithmetic:
     """
     Test real/complex arithmetic
@@ -992,16 +1109,16 @@ class _Test2DSlicingRegression:
         assert_(False)  # Should not happen.
 
 
-class TestCSR(_TestCommon, _TestGetSet, _TestSolve,
-        _TestInplaceArithmetic, _TestArithmetic,
-        _TestHorizSlicing, _TestVertSlicing, _TestBothSlicing,
+class TestCSR(_TestCommon, _TestGetSet, _TestFancySet, _TestMatmat,
+        _TestSolve, _TestInplaceArithmetic, _TestArithmetic,
+        _TestHorizSlicing, _TestVertSlicing, _TestBothSlicing, _TestFancyMask,
         _TestFancyIndexing, _Test2DSlicingRegression, TestCase):
     spmatrix = csr_matrix
 
-    @dec.knownfailureif(True, "Fancy indexing is known to be broken for CSR" \
+    @dec.knownfailureif(True, "Slice assignment is not supported for CSR" \
                               " matrices")
-    def test_fancy_indexing_set(self):
-        _TestFancyIndexing.test_fancy_indexing_set(self)
+    def test_fancy_indexing_set_slice(self):
+        _TestFancyIndexing.test_fancy_indexing_set_slice(self)
 
     def test_constructor1(self):
         b = matrix([[0,4,0],
@@ -1070,6 +1187,41 @@ class TestCSR(_TestCommon, _TestGetSet, _TestSolve,
         csr = csr_matrix((data, indices, indptr))
         assert_array_equal(csr.shape,(3,6))
 
+    def test_constructor_index_dtype(self):
+        """64-bit indices are only used when they are needed"""
+        data    = array([1., 2.])
+        indices = array([0, 5], dtype='int64')
+        indptr  = array([0, 1, 2], dtype='int64')
+        A = csr_matrix((data, indices, indptr), shape=(2, 6))
+        assert_equal(A.indices.dtype, np.intc)
+        assert_equal(A.indptr.dtype, np.intc)
+
+        indices = array([0, 2**33], dtype='int64')
+        A = csr_matrix((data, indices, indptr), shape=(2, 2**34))
+        assert_equal(A.indices.dtype, np.int64)
+        assert_equal(A.indptr.dtype, np.int64)
+        assert_array_equal(A.indices, [0, 2**33])
+
+    def test_index_dtype_kernels(self):
+        """sparsetools accepts 64-bit index arrays"""
+        B = matrix([[1, 0, 2, 0],
+                    [0, 0, 3, 4],
+                    [5, 0, 0, 6]], dtype=float)
+        A = csr_matrix(B)
+        # matrices this small get 32-bit indices, so widen them by hand
+        A.indptr  = A.indptr.astype(np.int64)
+        A.indices = A.indices.astype(np.int64)
+
+        x = array([1., 2., 3., 4.])
+        assert_array_equal(A * x, dot(B, x).A.ravel())
+        assert_array_equal(A * B.T, B * B.T)
+        assert_array_equal((A * A.T).todense(), B * B.T)
+        assert_array_equal((A + A).todense(), 2 * B)
+        assert_array_equal(A.tocsc().todense(), B)
+        assert_array_equal(A.tocoo().todense(), B)
+        assert_array_equal(A.tobsr(blocksize=(1, 2)).todense(), B)
+        assert_array_equal(A.diagonal(), [1, 0, 0])
+
     def test_sort_indices(self):
         data    = arange( 5 )
         indices = array( [7, 2, 1, 5, 4] )
@@ -1102,17 +1254,62 @@ class TestCSR(_TestCommon, _TestGetSet, _TestSolve,
         bsp = csr_matrix( (data, indices, indptr), shape=(2,10) )
         assert_equal((asp + bsp).todense(), asp.todense() + bsp.todense())
 
+    def test_dot_n_jobs(self):
+        np.random.seed(1234)
+        A = sparse.rand(2000, 500, density=0.1, format='csr')
+        A.data[A.indices % 7 == 0] = 0
+        A.eliminate_zeros()
+        x = np.random.rand(500)
+        X = np.random.rand(500, 3)
+        Ad = A.toarray()
 
-class TestCSC(_TestCommon, _TestGetSet, _TestSolve,
-        _TestInplaceArithmetic, _TestArithmetic,
-        _TestHorizSlicing, _TestVertSlicing, _TestBothSlicing,
+        for n_jobs in [1, 2, 3, 8, -1]:
+            assert_array_almost_equal(A.dot(x, n_jobs=n_jobs), dot(Ad, x))
+            assert_array_almost_equal(A.dot(X, n_jobs=n_jobs), dot(Ad, X))
+
+        old = sparse.set_n_jobs(4)
+        try:
+            assert_equal(sparse.get_n_jobs(), 4)
+            assert_array_almost_equal(A * x, dot(Ad, x))
+            assert_array_almost_equal(A * X, dot(Ad, X))
+        finally:
+            sparse.set_n_jobs(old)
+
+        assert_raises(ValueError, A.dot, x, n_jobs=0)
+        assert_raises(ValueError, sparse.set_n_jobs, 1.5)
+
+    def test_dot_out(self):
+        A = csr_matrix([[1, 0, 2], [0, 0, 3], [4, 5, 6]], dtype=np.float64)
+        x = array([1., 2., 3.])
+        X = array([[1., 2.], [3., 4.], [5., 6.]])
+
+        y = np.empty(3)
+        y.fill(np.nan)
+        z = A.dot(x, out=y, n_jobs=2)
+        assert_(z is y)
+        assert_array_equal(y, dot(A.toarray(), x))
+
+        Y = np.ones((3, 2))
+        Z = A.dot(X, out=Y)
+        assert_(Z is Y)
+        assert_array_equal(Y, dot(A.toarray(), X))
+
+        assert_raises(ValueError, A.dot, x, out=np.empty(4))
+        assert_raises(ValueError, A.dot, x, out=np.empty(3, dtype=np.int32))
+        assert_raises(ValueError, A.dot, X, out=np.empty((2, 3)).T)
+        assert_raises(ValueError, A.dot, A, out=np.empty((3, 3)))
+
+
+class TestCSC(_TestCommon, _TestGetSet, _TestFancySet, _TestMatmat,
+        _TestSolve, _TestInplaceArithmetic, _TestArithmetic,
+        _TestHorizSlicing, _TestVertSlicing, _TestBothSlicing, _TestFancyMask,
         _TestFancyIndexing, _Test2DSlicingRegression, TestCase):
     spmatrix = csc_matrix
 
-    @dec.knownfailureif(True, "Fancy indexing is known to be broken for CSC" \
+    @dec.knownfailureif(True, "Slice assignment is not supported for CSC" \
                               " matrices")
-    def test_fancy_indexing_set(self):
-        _TestFancyIndexing.test_fancy_indexing_set(self)
+    def test_fancy_indexing_set_slice(self):
+        _TestFancyIndexing.test_fancy_indexing_set_slice(self)
 
     def test_constructor1(self):
         b = matrix([[1,0,0,0],[0,0,1,0],[0,2,0,3]],'d')
@@ -1362,6 +1559,11 @@ class TestLIL( _TestCommon, _TestHorizSlicing, _TestVertSlicing,
     def test_fancy_indexing_set(self):
         _TestFancyIndexing.test_fancy_indexing_set(self)
 
+    @dec.knownfailureif(True, "Fancy indexing is known to be broken for LIL" \
+                              " matrices")
+    def test_fancy_indexing_set_slice(self):
+        _TestFancyIndexing.test_fancy_indexing_set_slice(self)
+
     @dec.knownfailureif(True, "Fancy indexing is known to be broken for LIL" \
                               " matrices")
     def test_fancy_indexing_randomized(self):
@@ -1545,6 +1747,33 @@ class TestCOO(_TestCommon, TestCase):
 
         assert_array_equal(mat,coo.todense())
 
+    def test_constructor_index_dtype(self):
+        """64-bit indices are only used when they are needed"""
+        row  = array([0, 3], dtype='int64')
+        col  = array([1, 2], dtype='int64')
+        data = array([1., 2.])
+        coo = coo_matrix((data, (row, col)), shape=(4, 3))
+        assert_equal(coo.row.dtype, np.intc)
+        assert_equal(coo.col.dtype, np.intc)
+
+        row[1] = 2**33
+        coo = coo_matrix((data, (row, col)), shape=(2**34, 3))
+        assert_equal(coo.row.dtype, np.int64)
+        assert_equal(coo.col.dtype, np.int64)
+        assert_array_equal(coo.row, [0, 2**33])
+
+    def test_index_dtype_kernels(self):
+        """sparsetools accepts 64-bit index arrays"""
+        coo = coo_matrix(([1., 2., 3.], ([0, 3, 3], [1, 2, 2])), shape=(4, 3))
+        # matrices this small get 32-bit indices, so widen them by hand
+        coo.row = coo.row.astype(np.int64)
+        coo.col = coo.col.astype(np.int64)
+        B = [[0, 1, 0], [0, 0, 0], [0, 0, 0], [0, 0, 5]]
+        assert_array_equal(coo.todense(), B)
+        assert_array_equal(coo.tocsr().todense(), B)
+        assert_array_equal(coo.tocsc().todense(), B)
+        assert_array_equal(coo * array([1., 2., 3.]), [2, 0, 0, 15])
+
     def test_constructor3(self):
         """empty matrix"""
         coo = coo_matrix( (4,3) )
@@ -61,6 +61,23 @@ class TestSparseUtils(TestCase):
         assert_equal(sputils.issequence( np.array([[1],[2],[3]]) ),False)
         assert_equal(sputils.issequence( 3 ),False)
 
+    def test_get_index_dtype(self):
+        int32max = np.iinfo(np.int32).max
+        a = np.array([0, 1, 2], dtype=np.int64)
+        b = np.array([0, int32max + 1], dtype=np.int64)
+
+        assert_equal(sputils.get_index_dtype(), np.intc)
+        assert_equal(sputils.get_index_dtype(maxval=int32max), np.intc)
+        assert_equal(sputils.get_index_dtype(maxval=int32max + 1), np.int64)
+        assert_equal(sputils.get_index_dtype((a.astype(np.intc),)), np.intc)
+        assert_equal(sputils.get_index_dtype((a,)), np.int64)
+        assert_equal(sputils.get_index_dtype((a,), check_contents=True),
+                     np.intc)
+        assert_equal(sputils.get_index_dtype((a, b), check_contents=True),
+                     np.int64)
+        assert_equal(sputils.get_index_dtype((a,), maxval=2**40,
+                                             check_contents=True), np.int64)
+
     def test_isdense(self):
         assert_equal(sputils.isdense( np.array([1]) ),True)
         assert_equal(sputils.isdense( np.matrix([1]) ),True)
@@ -12,12 +12,14 @@ Nearest-neighbor queries:
    cKDTree     -- class for efficient nearest-neighbor queries (faster impl.)
    distance    -- module containing many different distance measures
 
-Delaunay triangulation:
+Delaunay triangulation, convex hulls and Voronoi diagrams:
 
 .. autosummary::
    :toctree: generated/
 
    Delaunay
+   ConvexHull
+   Voronoi
    tsearch
 
 """
@@ -32,3 +34,4 @@ __all__ += ['distance']
 import distance
 from numpy.testing import Tester
 test = Tester().test
+bench = Tester().bench
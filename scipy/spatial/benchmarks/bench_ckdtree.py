@@ -0,0 +1,61 @@
+"""benchmarks for the construction and querying of cKDTree"""
+
+import time
+
+import numpy as np
+
+from numpy.testing import *
+
+from scipy.spatial import cKDTree
+
+
+def uniform_points(n, m):
+    return np.random.rand(n, m)
+
+
+def clustered_points(n, m, n_clusters=50):
+    """Points in gaussian clusters whose widths span five decades."""
+    centers = np.random.rand(n_clusters, m)
+    widths = 10.0**np.random.uniform(-6, -1, n_clusters)
+    labels = np.random.randint(n_clusters, size=n)
+    return centers[labels] + widths[labels][:,np.newaxis]*np.random.randn(n, m)
+
+
+class BenchmarkCKDTree(TestCase):
+    """Compare the tree building options of cKDTree"""
+
+    def bench_build_query(self):
+        np.random.seed(1234)
+        n, m, k = 100000, 3, 5
+        options = [('sliding midpoint', {}),
+                   ('balanced', {'balanced_tree': True}),
+                   ('compact', {'compact_nodes': True}),
+                   ('balanced+compact', {'balanced_tree': True,
+                                         'compact_nodes': True})]
+
+        print
+        print '                     cKDTree construction and query'
+        print '========================================================================='
+        print '   data    |      options       | depth | build (sec) | query (msec/pt) '
+        print '-------------------------------------------------------------------------'
+        fmt = ' %9s | %18s | %5d | %11.3f | %15.4f '
+
+        for name, points in [('uniform', uniform_points),
+                             ('clustered', clustered_points)]:
+            data = points(n, m)
+            queries = data[np.random.randint(n, size=10000)]
+            queries += 1e-4*np.random.randn(*queries.shape)
+            for option, kwargs in options:
+                start = time.clock()
+                T = cKDTree(data, **kwargs)
+                build = time.clock() - start
+
+                start = time.clock()
+                T.query(queries, k=k)
+                query = 1e3*(time.clock() - start)/len(queries)
+
+                print fmt % (name, option, T.depth, build, query)
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -0,0 +1,43 @@
+"""benchmarks for the distance functions"""
+
+import time
+
+import numpy as np
+
+from numpy.testing import *
+
+from scipy.spatial.distance import cdist
+
+
+class BenchmarkCdist(TestCase):
+    """Compare the direct and the gemm methods of cdist"""
+
+    def bench_gemm(self):
+        np.random.seed(1234)
+        m = 2000
+
+        print
+        print '                  cdist: direct vs. gemm method'
+        print '====================================================================='
+        print '    metric    | dimensions | direct (sec) | gemm (sec) | max. diff. '
+        print '---------------------------------------------------------------------'
+        fmt = ' %12s | %10d | %12.3f | %10.3f | %10.2e '
+
+        for metric in ['euclidean', 'sqeuclidean', 'cosine', 'correlation']:
+            for n in [3, 32, 128, 512]:
+                XA = np.random.rand(m, n)
+                XB = np.random.rand(m, n)
+
+                start = time.clock()
+                Y1 = cdist(XA, XB, metric)
+                direct = time.clock() - start
+
+                start = time.clock()
+                Y2 = cdist(XA, XB, metric, method='gemm')
+                gemm = time.clock() - start
+
+                print fmt % (metric, n, direct, gemm, abs(Y1 - Y2).max())
+
+
+if __name__ == "__main__":
+    run_module_suite()
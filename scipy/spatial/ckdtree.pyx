@@ -4,6 +4,11 @@ import numpy as np
 cimport numpy as np
 cimport stdlib
 
+import threading
+from multiprocessing import cpu_count
+
+import scipy.sparse
+
 import kdtree
 
 cdef double infinity = np.inf
@@ -25,21 +30,27 @@ cdef struct heap:
     heapitem* heap
     int space
 
-cdef inline heapcreate(heap* self,int initial_size):
+# The heap routines are nogil so that queries can run in parallel threads;
+# they report errors through their return value instead of raising.
+cdef inline int heapcreate(heap* self,int initial_size) nogil:
     self.space = initial_size
     self.heap = <heapitem*>stdlib.malloc(sizeof(heapitem)*self.space)
     self.n=0
+    return 0
 
-cdef inline heapdestroy(heap* self):
+cdef inline int heapdestroy(heap* self) nogil:
     stdlib.free(self.heap)
+    return 0
 
-cdef inline heapresize(heap* self, int new_space):
+cdef inline int heapresize(heap* self, int new_space) nogil:
     if new_space<self.n:
-        raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))
+        # a heap cannot shrink below the number of items it holds
+        return -1
     self.space = new_space
     self.heap = <heapitem*>stdlib.realloc(<void*>self.heap,new_space*sizeof(heapitem))
+    return 0
 
-cdef inline heappush(heap* self, heapitem item):
+cdef inline int heappush(heap* self, heapitem item) nogil:
     cdef int i
     cdef heapitem t
 
@@ -54,11 +65,12 @@ cdef inline heappush(heap* self, heapitem item):
         self.heap[(i-1)//2] = self.heap[i]
         self.heap[i] = t
         i = (i-1)//2
+    return 0
 
-cdef heapitem heappeek(heap* self):
+cdef heapitem heappeek(heap* self) nogil:
     return self.heap[0]
 
-cdef heapremove(heap* self):
+cdef int heapremove(heap* self) nogil:
     cdef heapitem t
     cdef int i, j, k, l
 
@@ -84,8 +96,9 @@ cdef heapremove(heap* self):
         i = l
         j = 2*i+1
         k = 2*i+2
+    return 0
 
-cdef heapitem heappop(heap* self):
+cdef heapitem heappop(heap* self) nogil:
     cdef heapitem it
     it = heappeek(self)
     heapremove(self)
@@ -96,20 +109,62 @@ cdef heapitem heappop(heap* self):
 
 
 # utility functions
-cdef inline double dmax(double x, double y):
+cdef inline double dmax(double x, double y) nogil:
     if x>y:
         return x
     else:
         return y
-cdef inline double dabs(double x):
+cdef inline double dabs(double x) nogil:
     if x>0:
         return x
     else:
         return -x
-cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound):
+
+# Periodic boxes
+# boxsize is NULL for an ordinary tree; for a tree in a periodic box it
+# holds the sizes of the box in boxsize[:k] and their halves in
+# boxsize[k:2*k], and all coordinates lie in [0, boxsize).
+cdef inline double _wrap(double d, double* boxsize, int i, int k) nogil:
+    """Distance between two coordinates along dimension i that differ by d."""
+    d = dabs(d)
+    if boxsize!=NULL and d>boxsize[k+i]:
+        return boxsize[i]-d
+    return d
+
+cdef inline void _interval_distance(double tmin, double tmax,
+                                    double* boxsize, int i, int k,
+                                    double* lo, double* hi) nogil:
+    """Smallest and largest distance between two coordinates along
+    dimension i whose difference ranges over [tmin, tmax]."""
+    if tmax<0:
+        lo[0] = -tmax
+        hi[0] = -tmin
+    elif tmin>0:
+        lo[0] = tmin
+        hi[0] = tmax
+    else:
+        lo[0] = 0
+        hi[0] = dmax(-tmin, tmax)
+        if boxsize!=NULL and hi[0]>boxsize[k+i]:
+            hi[0] = boxsize[k+i]
+        return
+    if boxsize==NULL or hi[0]<=boxsize[k+i]:
+        return
+    elif lo[0]>=boxsize[k+i]:
+        # every difference is shorter the other way round the box
+        lo[0], hi[0] = boxsize[i]-hi[0], boxsize[i]-lo[0]
+    else:
+        # the differences straddle half of the box
+        if boxsize[i]-hi[0]<lo[0]:
+            lo[0] = boxsize[i]-hi[0]
+        hi[0] = boxsize[k+i]
+
+cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound,
+                               double* boxsize) nogil:
     """Compute the distance between x and y
 
-    Computes the Minkowski p-distance to the power p between two points.
+    Computes the Minkowski p-distance to the power p between two points,
+    in the periodic box boxsize unless it is NULL.
     If the distance**p is larger than upperbound, then any number larger
     than upperbound may be returned (the calculation is truncated).
     """
@@ -118,42 +173,154 @@ cdef inline double _distance_p(double*x,double*y,double p,int k,double upperboun
     r = 0
     if p==infinity:
         for i in range(k):
-            r = dmax(r,dabs(x[i]-y[i]))
+            r = dmax(r,_wrap(x[i]-y[i],boxsize,i,k))
             if r>upperbound:
                 return r
     elif p==1:
         for i in range(k):
-            r += dabs(x[i]-y[i])
+            r += _wrap(x[i]-y[i],boxsize,i,k)
             if r>upperbound:
                 return r
     else:
         for i in range(k):
-            r += dabs(x[i]-y[i])**p
+            r += _wrap(x[i]-y[i],boxsize,i,k)**p
             if r>upperbound:
                 return r
     return r
 
 
 
+cdef inline double _add_distance_p(double d, double t, double p) nogil:
+    """Add the coordinate difference t >= 0 to the distance**p d."""
+    if p==infinity:
+        return dmax(d,t)
+    elif p==1:
+        return d+t
+    else:
+        return d+t**p
+
+cdef inline double _distance_to_p(double r, double p):
+    """Convert a distance r to the internal distance**p representation."""
+    if p==infinity or p==1 or r==infinity:
+        return r
+    else:
+        return r**p
+
+
+# Hyperrectangles, for the traversals that check rectangles against
+# points or other rectangles rather than following one query point.
+# The traversals split them in place along a node's split dimension
+# and restore the bound afterwards.
+cdef class Rectangle:
+    cdef int m
+    cdef double* mins
+    cdef double* maxes
+
+    def __init__(Rectangle self, mins, maxes):
+        cdef np.ndarray[double, ndim=1] inner_mins
+        cdef np.ndarray[double, ndim=1] inner_maxes
+        cdef int i
+        inner_mins = np.ascontiguousarray(mins, dtype=np.float)
+        inner_maxes = np.ascontiguousarray(maxes, dtype=np.float)
+        self.m = inner_mins.shape[0]
+        self.mins = <double*>stdlib.malloc(self.m*sizeof(double))
+        self.maxes = <double*>stdlib.malloc(self.m*sizeof(double))
+        for i in range(self.m):
+            self.mins[i] = inner_mins[i]
+            self.maxes[i] = inner_maxes[i]
+
+    def __dealloc__(Rectangle self):
+        stdlib.free(self.mins)
+        stdlib.free(self.maxes)
+
+# The distances below are in the periodic box boxsize unless it is NULL.
+cdef inline double min_distance_point_p(Rectangle rect, double* x, double p,
+                                        double* boxsize):
+    """Minimum distance**p between x and a point in the rectangle."""
+    cdef int i
+    cdef double d, lo, hi
+    d = 0
+    for i in range(rect.m):
+        _interval_distance(rect.mins[i]-x[i], rect.maxes[i]-x[i],
+                           boxsize, i, rect.m, &lo, &hi)
+        d = _add_distance_p(d, lo, p)
+    return d
+
+cdef inline double max_distance_point_p(Rectangle rect, double* x, double p,
+                                        double* boxsize):
+    """Maximum distance**p between x and a point in the rectangle."""
+    cdef int i
+    cdef double d, lo, hi
+    d = 0
+    for i in range(rect.m):
+        _interval_distance(rect.mins[i]-x[i], rect.maxes[i]-x[i],
+                           boxsize, i, rect.m, &lo, &hi)
+        d = _add_distance_p(d, hi, p)
+    return d
+
+cdef inline double min_distance_rectangle_p(Rectangle rect1, Rectangle rect2,
+                                            double p, double* boxsize):
+    """Minimum distance**p between points in the two rectangles."""
+    cdef int i
+    cdef double d, lo, hi
+    d = 0
+    for i in range(rect1.m):
+        _interval_distance(rect1.mins[i]-rect2.maxes[i],
+                           rect1.maxes[i]-rect2.mins[i],
+                           boxsize, i, rect1.m, &lo, &hi)
+        d = _add_distance_p(d, lo, p)
+    return d
+
+cdef inline double max_distance_rectangle_p(Rectangle rect1, Rectangle rect2,
+                                            double p, double* boxsize):
+    """Maximum distance**p between points in the two rectangles."""
+    cdef int i
+    cdef double d, lo, hi
+    d = 0
+    for i in range(rect1.m):
+        _interval_distance(rect1.mins[i]-rect2.maxes[i],
+                           rect1.maxes[i]-rect2.mins[i],
+                           boxsize, i, rect1.m, &lo, &hi)
+        d = _add_distance_p(d, hi, p)
+    return d
+
+
 # Tree structure
-cdef struct innernode:
-    int split_dim
-    int n_points
-    double split
-    innernode* less
-    innernode* greater
-cdef struct leafnode:
+# The tree is a flat array of nodes, with the root at index 0; less and
+# greater are indices into that array and are -1 in leaves (split_dim -1).
+# The points below any node are raw_indices[start_idx:end_idx].
+cdef struct ckdtreenode:
     int split_dim
-    int n_points
+    int children
     int start_idx
     int end_idx
+    double split
+    int less
+    int greater
+
+# the numpy equivalent of ckdtreenode, so that the node array can be
+# pickled, saved and memory-mapped like any other array
+_node_dtype = np.dtype([('split_dim', np.intc),
+                        ('children', np.intc),
+                        ('start_idx', np.intc),
+                        ('end_idx', np.intc),
+                        ('split', np.float64),
+                        ('less', np.intc),
+                        ('greater', np.intc)], align=True)
+if _node_dtype.itemsize != sizeof(ckdtreenode):
+    raise ImportError("node dtype does not match the ckdtreenode struct")
 
 # this is the standard trick for variable-size arrays:
 # malloc sizeof(nodeinfo)+self.m*sizeof(double) bytes.
 cdef struct nodeinfo:
-    innernode* node
+    ckdtreenode* node
     double side_distances[0]
 
+def _ckdtree_new():
+    # used to unpickle cKDTree instances; the state is filled in by
+    # __setstate__
+    return cKDTree.__new__(cKDTree)
+
 cdef class cKDTree:
     """kd-tree for quick nearest-neighbor lookup
 
@@ -169,7 +336,8 @@ cdef class cKDTree:
 
     During construction, the axis and splitting point are chosen by the 
     "sliding midpoint" rule, which ensures that the cells do not all
-    become long and thin. 
+    become long and thin. Alternatively the points can be split at the
+    median, which gives a balanced tree (see `balanced_tree`).
 
     The tree can be queried for the r closest neighbors of any given point 
     (optionally returning only those within some maximum distance of the 
@@ -190,58 +358,307 @@ cdef class cKDTree:
     leafsize : positive integer
         The number of points at which the algorithm switches over to
         brute-force.
+    compact_nodes : bool, optional
+        If True, the rectangle of each node is shrunk to the points it
+        holds before the splitting axis and point are chosen, so that
+        empty space is not split.  This gives a more compact tree at the
+        cost of a slower build.  The shrunk rectangles are only used to
+        choose the splits; queries bound the distances to a node with its
+        splitting planes as usual.  Default: False.
+    balanced_tree : bool, optional
+        If True, the points are split at the median along the splitting
+        axis instead of at the midpoint of the node, which bounds the
+        depth of the tree by about log2(n/leafsize) also when the data
+        are strongly clustered.  The median is found in linear time with
+        introselect.  The cells of a balanced tree can be long and thin,
+        so queries are not necessarily faster.  Default: False.
+    boxsize : float or array_like, shape (m,), optional
+        Treat the data as lying in a periodic (toroidal) box of this size
+        along each dimension, so that all distances wrap around the box.
+        The data must lie in ``[0, boxsize)``; query points are wrapped
+        into the box.  Default: None, for no periodicity.
+
+    Attributes
+    ----------
+    depth : int
+        The number of levels of the tree below the root.
+    boxsize : ndarray of floats, shape (m,) or None
+        The size of the periodic box, or None.
+
+    Notes
+    -----
+    The tree is held in a few flat arrays (the data, a permutation of the
+    point indices and an array of nodes), which ``__getstate__`` returns
+    as a dict; this is what is pickled.  The arrays can also be written
+    with `numpy.save` and loaded back with ``numpy.load(...,
+    mmap_mode='r')``.  Passing them to ``__setstate__`` of a new instance
+    (``cKDTree.__new__(cKDTree)``) then recreates the tree without
+    rebuilding or copying it, so that several processes can share one tree
+    on disk.
 
     """
 
-    cdef innernode* tree 
     cdef readonly object data
     cdef double* raw_data
     cdef readonly int n, m
     cdef readonly int leafsize
+    cdef readonly bint compact_nodes, balanced_tree
     cdef readonly object maxes
     cdef double* raw_maxes
     cdef readonly object mins
     cdef double* raw_mins
     cdef object indices
     cdef np.int32_t* raw_indices
-    def __init__(cKDTree self, data, int leafsize=10):
-        cdef np.ndarray[double, ndim=2] inner_data
-        cdef np.ndarray[double, ndim=1] inner_maxes
-        cdef np.ndarray[double, ndim=1] inner_mins
-        cdef np.ndarray[np.int32_t, ndim=1] inner_indices
+    cdef object nodes
+    cdef ckdtreenode* raw_nodes
+    cdef readonly object boxsize
+    cdef object boxsize_data
+    cdef double* raw_boxsize_data
+    # scratch space for the nodes while the tree is being built
+    cdef ckdtreenode* tree_buffer
+    cdef int tree_size, tree_space
+
+    def __init__(cKDTree self, data, int leafsize=10, compact_nodes=False,
+                 balanced_tree=False, boxsize=None):
+        cdef ckdtreenode* raw_nodes
+        cdef int i
+        data = np.ascontiguousarray(data,dtype=np.float)
+        if leafsize<1:
+            raise ValueError("leafsize must be at least 1")
+        self.compact_nodes = compact_nodes
+        self.balanced_tree = balanced_tree
+        self.__set_arrays(data, leafsize,
+                          np.arange(np.shape(data)[0],dtype=np.int32),
+                          np.array([(-1, 0, 0, 0, 0., -1, -1)],
+                                   dtype=_node_dtype),
+                          np.amax(data,axis=0), np.amin(data,axis=0))
+        self.__set_boxsize(boxsize)
+        if boxsize is not None and (np.any(self.data < 0) or
+                                    np.any(self.data >= self.boxsize)):
+            raise ValueError("data must lie in the periodic box "
+                             "[0, boxsize)")
+
+        self.tree_size = 0
+        self.tree_space = 2*(self.n//self.leafsize)+1
+        self.tree_buffer = <ckdtreenode*>stdlib.malloc(
+            self.tree_space*sizeof(ckdtreenode))
+        try:
+            self.__build(0, self.n, self.raw_maxes, self.raw_mins)
+            nodes = np.empty(self.tree_size, dtype=_node_dtype)
+            raw_nodes = <ckdtreenode*>np.PyArray_DATA(nodes)
+            for i in range(self.tree_size):
+                raw_nodes[i] = self.tree_buffer[i]
+        finally:
+            stdlib.free(self.tree_buffer)
+            self.tree_buffer = NULL
+        self.nodes = nodes
+        self.raw_nodes = raw_nodes
+
+    cdef __set_arrays(cKDTree self, data, int leafsize, indices, nodes,
+                      maxes, mins):
+        # The arrays are only read from, so they may be read-only or
+        # memory-mapped; nothing is copied if they already have the
+        # right type and layout.
         self.data = np.ascontiguousarray(data,dtype=np.float)
         self.n, self.m = np.shape(self.data)
         self.leafsize = leafsize
-        if self.leafsize<1:
-            raise ValueError("leafsize must be at least 1")
-        self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
-        self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
-        self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
-
-        inner_data = self.data
-        self.raw_data = <double*>inner_data.data
-        inner_maxes = self.maxes
-        self.raw_maxes = <double*>inner_maxes.data
-        inner_mins = self.mins
-        self.raw_mins = <double*>inner_mins.data
-        inner_indices = self.indices
-        self.raw_indices = <np.int32_t*>inner_indices.data
-
-        self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)
-
-    cdef innernode* __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins):
-        cdef leafnode* n
-        cdef innernode* ni
+        self.indices = np.ascontiguousarray(indices,dtype=np.int32)
+        self.nodes = np.ascontiguousarray(nodes,dtype=_node_dtype)
+        self.maxes = np.ascontiguousarray(maxes,dtype=np.float)
+        self.mins = np.ascontiguousarray(mins,dtype=np.float)
+        if (np.shape(self.indices) != (self.n,) or
+            np.shape(self.maxes) != (self.m,) or
+            np.shape(self.mins) != (self.m,) or
+            len(np.shape(self.nodes)) != 1 or len(self.nodes) == 0 or
+            not self.__valid_nodes()):
+            raise ValueError("inconsistent cKDTree arrays")
+
+        self.raw_data = <double*>np.PyArray_DATA(self.data)
+        self.raw_indices = <np.int32_t*>np.PyArray_DATA(self.indices)
+        self.raw_nodes = <ckdtreenode*>np.PyArray_DATA(self.nodes)
+        self.raw_maxes = <double*>np.PyArray_DATA(self.maxes)
+        self.raw_mins = <double*>np.PyArray_DATA(self.mins)
+
+    cdef bint __valid_nodes(cKDTree self):
+        # The nodes may come from a pickle or a file, and the queries
+        # follow them without bounds checks, so check that the children
+        # of each inner node come after it (in depth-first order) and
+        # that all the indices stay within the arrays.
+        nodes = self.nodes
+        n_nodes = len(nodes)
+        inner = nodes['split_dim'] != -1
+        own = np.arange(n_nodes)[inner]
+        less = nodes['less'][inner]
+        greater = nodes['greater'][inner]
+        return not (np.any(nodes['split_dim'] < -1) or
+                    np.any(nodes['split_dim'] >= self.m) or
+                    np.any(less <= own) or np.any(less >= n_nodes) or
+                    np.any(greater <= own) or np.any(greater >= n_nodes) or
+                    np.any(nodes['start_idx'] < 0) or
+                    np.any(nodes['start_idx'] > nodes['end_idx']) or
+                    np.any(nodes['end_idx'] > self.n) or
+                    np.any(self.indices < 0) or
+                    np.any(self.indices >= self.n))
+
+    cdef __set_boxsize(cKDTree self, boxsize):
+        # boxsize_data holds the sizes of the box followed by their halves
+        if boxsize is None:
+            self.boxsize = None
+            self.boxsize_data = None
+            self.raw_boxsize_data = NULL
+            return
+        self.boxsize = np.empty(self.m, dtype=np.float)
+        self.boxsize[:] = boxsize
+        if not np.all(self.boxsize > 0):
+            raise ValueError("boxsize must be positive")
+        self.boxsize_data = np.concatenate([self.boxsize, 0.5*self.boxsize])
+        self.raw_boxsize_data = <double*>np.PyArray_DATA(self.boxsize_data)
+
+    cdef int __new_node(cKDTree self) except -1:
+        # add a node to tree_buffer and return its index
+        cdef ckdtreenode* buf
+        if self.tree_size == self.tree_space:
+            buf = <ckdtreenode*>stdlib.realloc(self.tree_buffer,
+                    (2*self.tree_space+1)*sizeof(ckdtreenode))
+            if buf == NULL:
+                raise MemoryError
+            self.tree_buffer = buf
+            self.tree_space = 2*self.tree_space+1
+        self.tree_size += 1
+        return self.tree_size-1
+
+    cdef int __select(cKDTree self, int start_idx, int end_idx, int k,
+                      int d) except -1:
+        # Reorder raw_indices[start_idx:end_idx] so that position k holds
+        # the point that would be there if they were sorted along
+        # dimension d, with no greater coordinate before it and no smaller
+        # one after it.  This is introselect: quickselect with
+        # median-of-three pivots, falling back to heapsort when the
+        # partitions shrink too slowly, so it never takes more than
+        # O(n log n) time.
+        cdef int lo, hi, i, j, t, limit
+        cdef double pivot
+        lo = start_idx
+        hi = end_idx-1
+        limit = 0
+        t = end_idx-start_idx
+        while t>1:
+            limit += 2
+            t >>= 1
+        while hi>lo:
+            if limit==0:
+                self.__heapsort(lo, hi+1, d)
+                return 0
+            limit -= 1
+
+            # sort lo, middle and hi; the middle one is the pivot and the
+            # other two act as sentinels for the scans below
+            i = lo+(hi-lo)//2
+            if self.__key(i,d)<self.__key(lo,d):
+                self.__swap(i,lo)
+            if self.__key(hi,d)<self.__key(lo,d):
+                self.__swap(hi,lo)
+            if self.__key(hi,d)<self.__key(i,d):
+                self.__swap(hi,i)
+            pivot = self.__key(i,d)
+
+            i = lo
+            j = hi
+            while i<=j:
+                while self.__key(i,d)<pivot:
+                    i += 1
+                while self.__key(j,d)>pivot:
+                    j -= 1
+                if i<=j:
+                    self.__swap(i,j)
+                    i += 1
+                    j -= 1
+            # now everything in [lo, j] is <= pivot, everything in [i, hi]
+            # is >= pivot and anything in between equals pivot
+            if k<=j:
+                hi = j
+            elif k>=i:
+                lo = i
+            else:
+                return 0
+        return 0
+
+    cdef int __heapsort(cKDTree self, int start_idx, int end_idx,
+                        int d) except -1:
+        # sort raw_indices[start_idx:end_idx] along dimension d
+        cdef int i, n
+        n = end_idx-start_idx
+        for i in range(n//2-1, -1, -1):
+            self.__sift_down(start_idx, i, n, d)
+        for i in range(n-1, 0, -1):
+            self.__swap(start_idx, start_idx+i)
+            self.__sift_down(start_idx, 0, i, d)
+        return 0
+
+    cdef void __sift_down(cKDTree self, int base, int i, int n, int d):
+        # restore the max-heap property of raw_indices[base:base+n] below
+        # position i
+        cdef int c
+        while 2*i+1<n:
+            c = 2*i+1
+            if c+1<n and self.__key(base+c+1,d)>self.__key(base+c,d):
+                c += 1
+            if self.__key(base+c,d)<=self.__key(base+i,d):
+                return
+            self.__swap(base+i, base+c)
+            i = c
+
+    cdef inline double __key(cKDTree self, int i, int d):
+        return self.raw_data[self.raw_indices[i]*self.m+d]
+
+    cdef inline void __swap(cKDTree self, int i, int j):
+        cdef np.int32_t t
+        t = self.raw_indices[i]
+        self.raw_indices[i] = self.raw_indices[j]
+        self.raw_indices[j] = t
+
+    cdef int __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins) except -1:
+        cdef ckdtreenode* n
+        cdef int node_index, less, greater
         cdef int i, j, t, p, q, d
-        cdef double size, split, minval, maxval
+        cdef double size, split, minval, maxval, v
         cdef double*mids
+        node_index = self.__new_node()
+        n = self.tree_buffer+node_index
+        n.split_dim = -1
+        n.children = end_idx-start_idx
+        n.start_idx = start_idx
+        n.end_idx = end_idx
+        n.split = 0
+        n.less = -1
+        n.greater = -1
         if end_idx-start_idx<=self.leafsize:
-            n = <leafnode*>stdlib.malloc(sizeof(leafnode))
-            n.split_dim = -1
-            n.start_idx = start_idx
-            n.end_idx = end_idx
-            return <innernode*>n
+            return node_index
         else:
+            # mids[:m] and mids[m:] are the bounds of the children
+            mids = <double*>stdlib.malloc(2*sizeof(double)*self.m)
+            if mids == NULL:
+                raise MemoryError
+            if self.compact_nodes:
+                # shrink the node's rectangle to the points it holds
+                for i in range(self.m):
+                    maxval = self.raw_data[self.raw_indices[start_idx]*self.m+i]
+                    minval = maxval
+                    for j in range(start_idx+1, end_idx):
+                        v = self.raw_data[self.raw_indices[j]*self.m+i]
+                        if v>maxval:
+                            maxval = v
+                        elif v<minval:
+                            minval = v
+                    mids[i] = maxval
+                    mids[self.m+i] = minval
+            else:
+                for i in range(self.m):
+                    mids[i] = maxes[i]
+                    mids[self.m+i] = mins[i]
+            maxes = mids
+            mins = mids+self.m
+
             d = 0 
             size = 0
             for i in range(self.m):
@@ -252,88 +669,122 @@ cdef class cKDTree:
             minval = mins[d]
             if maxval==minval:
                 # all points are identical; warn user?
-                n = <leafnode*>stdlib.malloc(sizeof(leafnode))
-                n.split_dim = -1
-                n.start_idx = start_idx
-                n.end_idx = end_idx
-                return <innernode*>n
-
-            split = (maxval+minval)/2
-
-            p = start_idx
-            q = end_idx-1
-            while p<=q:
-                if self.raw_data[self.raw_indices[p]*self.m+d]<split:
-                    p+=1
-                elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
-                    q-=1
-                else:
-                    t = self.raw_indices[p]
-                    self.raw_indices[p] = self.raw_indices[q]
-                    self.raw_indices[q] = t
-                    p+=1
-                    q-=1
-
-            # slide midpoint if necessary
-            if p==start_idx:
-                # no points less than split
-                j = start_idx
-                split = self.raw_data[self.raw_indices[j]*self.m+d]
-                for i in range(start_idx+1, end_idx):
-                    if self.raw_data[self.raw_indices[i]*self.m+d]<split:
-                        j = i
-                        split = self.raw_data[self.raw_indices[j]*self.m+d]
-                t = self.raw_indices[start_idx]
-                self.raw_indices[start_idx] = self.raw_indices[j]
-                self.raw_indices[j] = t
-                p = start_idx+1
-                q = start_idx
-            elif p==end_idx:
-                # no points greater than split
-                j = end_idx-1
-                split = self.raw_data[self.raw_indices[j]*self.m+d]
-                for i in range(start_idx, end_idx-1):
-                    if self.raw_data[self.raw_indices[i]*self.m+d]>split:
-                        j = i
-                        split = self.raw_data[self.raw_indices[j]*self.m+d]
-                t = self.raw_indices[end_idx-1]
-                self.raw_indices[end_idx-1] = self.raw_indices[j]
-                self.raw_indices[j] = t
-                p = end_idx-1
-                q = end_idx-2
-
-            # construct new node representation
-            ni = <innernode*>stdlib.malloc(sizeof(innernode))
-
-            mids = <double*>stdlib.malloc(sizeof(double)*self.m)
-            for i in range(self.m):
-                mids[i] = maxes[i]
-            mids[d] = split
-            ni.less = self.__build(start_idx,p,mids,mins)
-
-            for i in range(self.m):
-                mids[i] = mins[i]
-            mids[d] = split
-            ni.greater = self.__build(p,end_idx,maxes,mids)
-
-            stdlib.free(mids)
-
-            ni.split_dim = d
-            ni.split = split
-
-            return ni
-                    
-    cdef __free_tree(cKDTree self, innernode* node):
-        if node.split_dim!=-1:
-            self.__free_tree(node.less)
-            self.__free_tree(node.greater)
-        stdlib.free(node)
+                stdlib.free(mids)
+                return node_index
+
+            if self.balanced_tree:
+                # split at the median, so that the tree is balanced
+                p = start_idx+(end_idx-start_idx)//2
+                self.__select(start_idx, end_idx, p, d)
+                split = self.raw_data[self.raw_indices[p]*self.m+d]
+            else:
+                split = (maxval+minval)/2
+
+                p = start_idx
+                q = end_idx-1
+                while p<=q:
+                    if self.raw_data[self.raw_indices[p]*self.m+d]<split:
+                        p+=1
+                    elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
+                        q-=1
+                    else:
+                        t = self.raw_indices[p]
+                        self.raw_indices[p] = self.raw_indices[q]
+                        self.raw_indices[q] = t
+                        p+=1
+                        q-=1
+
+                # slide midpoint if necessary
+                if p==start_idx:
+                    # no points less than split
+                    j = start_idx
+                    split = self.raw_data[self.raw_indices[j]*self.m+d]
+                    for i in range(start_idx+1, end_idx):
+                        if self.raw_data[self.raw_indices[i]*self.m+d]<split:
+                            j = i
+                            split = self.raw_data[self.raw_indices[j]*self.m+d]
+                    t = self.raw_indices[start_idx]
+                    self.raw_indices[start_idx] = self.raw_indices[j]
+                    self.raw_indices[j] = t
+                    p = start_idx+1
+                    q = start_idx
+                elif p==end_idx:
+                    # no points greater than split
+                    j = end_idx-1
+                    split = self.raw_data[self.raw_indices[j]*self.m+d]
+                    for i in range(start_idx, end_idx-1):
+                        if self.raw_data[self.raw_indices[i]*self.m+d]>split:
+                            j = i
+                            split = self.raw_data[self.raw_indices[j]*self.m+d]
+                    t = self.raw_indices[end_idx-1]
+                    self.raw_indices[end_idx-1] = self.raw_indices[j]
+                    self.raw_indices[j] = t
+                    p = end_idx-1
+                    q = end_idx-2
+
+            maxes[d] = split
+            try:
+                less = self.__build(start_idx,p,maxes,mins)
+                maxes[d] = maxval
+                mins[d] = split
+                greater = self.__build(p,end_idx,maxes,mins)
+            finally:
+                stdlib.free(mids)
+
+            # building the children may have moved tree_buffer
+            n = self.tree_buffer+node_index
+            n.split_dim = d
+            n.split = split
+            n.less = less
+            n.greater = greater
+
+            return node_index
 
     def __dealloc__(cKDTree self):
-        if <int>(self.tree) == 0:
-            # should happen only if __init__ was never called
-            return
-        self.__free_tree(self.tree)
+        # normally already freed at the end of __init__
+        stdlib.free(self.tree_buffer)
+
+    def __getstate__(cKDTree self):
+        return {'data': self.data, 'leafsize': self.leafsize,
+                'indices': self.indices, 'nodes': self.nodes,
+                'maxes': self.maxes, 'mins': self.mins,
+                'compact_nodes': self.compact_nodes,
+                'balanced_tree': self.balanced_tree,
+                'boxsize': self.boxsize}
+
+    def __setstate__(cKDTree self, state):
+        self.__set_arrays(state['data'], state['leafsize'], state['indices'],
+                          state['nodes'], state['maxes'], state['mins'])
+        self.compact_nodes = state.get('compact_nodes', False)
+        self.balanced_tree = state.get('balanced_tree', False)
+        self.__set_boxsize(state.get('boxsize'))
+
+    property depth:
+        def __get__(cKDTree self):
+            # The nodes are stored in depth-first order, so every node
+            # comes before its children and one pass suffices.
+            cdef int i, depth, n_nodes
+            cdef int* levels
+            cdef ckdtreenode* node
+            n_nodes = len(self.nodes)
+            levels = <int*>stdlib.malloc(n_nodes*sizeof(int))
+            if levels == NULL:
+                raise MemoryError
+            levels[0] = 0
+            depth = 0
+            for i in range(n_nodes):
+                node = self.raw_nodes+i
+                if node.split_dim == -1:
+                    if levels[i] > depth:
+                        depth = levels[i]
+                else:
+                    levels[node.less] = levels[i]+1
+                    levels[node.greater] = levels[i]+1
+            stdlib.free(levels)
+            return depth
+
+    def __reduce__(cKDTree self):
+        return (_ckdtree_new, (), self.__getstate__())
 
     cdef void __query(cKDTree self, 
             double*result_distances, 
@@ -342,12 +793,15 @@ cdef class cKDTree:
             int k, 
             double eps, 
             double p, 
-            double distance_upper_bound):
+            double distance_upper_bound,
+            int max_leaves) nogil:
         cdef heap q
         cdef heap neighbors
 
         cdef int i, j
-        cdef double t
+        cdef int leaves, nbuf
+        cdef bint near_is_less
+        cdef double t, hi
         cdef nodeinfo* inf
         cdef nodeinfo* inf2
         cdef double d
@@ -355,10 +809,10 @@ cdef class cKDTree:
         cdef double min_distance
         cdef double far_min_distance
         cdef heapitem it, it2, neighbor
-        cdef leafnode* node
-        cdef innernode* inode
-        cdef innernode* near
-        cdef innernode* far
+        cdef ckdtreenode* node
+        cdef ckdtreenode* inode
+        cdef ckdtreenode* near
+        cdef ckdtreenode* far
         cdef double* side_distances
 
         # priority queue for chasing nodes
@@ -373,20 +827,28 @@ cdef class cKDTree:
         # entries are (-distance**p, i)
         heapcreate(&neighbors,k)
 
+        # in a periodic box the side distances depend on both bounds of
+        # the cell, so the nodeinfo also holds the lower bounds of the
+        # cell in side_distances[m:2*m] and the upper ones in
+        # side_distances[2*m:3*m]
+        if self.raw_boxsize_data==NULL:
+            nbuf = self.m
+        else:
+            nbuf = 3*self.m
+
         # set up first nodeinfo
-        inf = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double)) 
-        inf.node = self.tree
+        inf = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+nbuf*sizeof(double)) 
+        inf.node = self.raw_nodes
         for i in range(self.m):
-            inf.side_distances[i] = 0
-            t = x[i]-self.raw_maxes[i]
-            if t>inf.side_distances[i]:
-                inf.side_distances[i] = t
-            else:
-                t = self.raw_mins[i]-x[i]
-                if t>inf.side_distances[i]:
-                    inf.side_distances[i] = t
+            _interval_distance(self.raw_mins[i]-x[i], self.raw_maxes[i]-x[i],
+                               self.raw_boxsize_data, i, self.m,
+                               &inf.side_distances[i], &hi)
             if p!=1 and p!=infinity:
                 inf.side_distances[i]=inf.side_distances[i]**p
+        if nbuf>self.m:
+            for i in range(self.m):
+                inf.side_distances[self.m+i] = self.raw_mins[i]
+                inf.side_distances[2*self.m+i] = self.raw_maxes[i]
 
         # compute first distance
         min_distance = 0.
@@ -408,15 +870,20 @@ cdef class cKDTree:
         if p!=infinity and distance_upper_bound!=infinity:
             distance_upper_bound = distance_upper_bound**p
 
+        # leaves are visited nearest first, so when the budget of
+        # leaves runs out the best neighbors found so far are returned
+        leaves = 0
+
         while True:
             if inf.node.split_dim==-1:
-                node = <leafnode*>inf.node
+                node = inf.node
 
                 # brute-force
                 for i in range(node.start_idx,node.end_idx):
                     d = _distance_p(
                             self.raw_data+self.raw_indices[i]*self.m,
-                            x,p,self.m,distance_upper_bound)
+                            x,p,self.m,distance_upper_bound,
+                            self.raw_boxsize_data)
                         
                     if d<distance_upper_bound:
                         # replace furthest neighbor
@@ -431,7 +898,13 @@ cdef class cKDTree:
                             distance_upper_bound = -heappeek(&neighbors).priority
                 # done with this node, get another
                 stdlib.free(inf)
-                if q.n==0:
+                leaves += 1
+                if max_leaves>0 and leaves>=max_leaves:
+                    # out of budget, free all the nodes still on the heap
+                    for i in range(q.n):
+                        stdlib.free(q.heap[i].contents.ptrdata)
+                    break
+                elif q.n==0:
                     # no more nodes to visit
                     break
                 else:
@@ -439,7 +912,7 @@ cdef class cKDTree:
                     inf = <nodeinfo*>it.contents.ptrdata
                     min_distance = it.priority
             else:
-                inode = <innernode*>inf.node
+                inode = inf.node
 
                 # we don't push cells that are too far onto the queue at all,
                 # but since the distance_upper_bound decreases, we might get 
@@ -453,12 +926,13 @@ cdef class cKDTree:
                     break
 
                 # set up children for searching
-                if x[inode.split_dim]<inode.split:
-                    near = inode.less
-                    far = inode.greater
+                near_is_less = x[inode.split_dim]<inode.split
+                if near_is_less:
+                    near = self.raw_nodes+inode.less
+                    far = self.raw_nodes+inode.greater
                 else:
-                    near = inode.greater
-                    far = inode.less
+                    near = self.raw_nodes+inode.greater
+                    far = self.raw_nodes+inode.less
 
                 # near child is at the same distance as the current node
                 # we're going here next, so no point pushing it on the queue
@@ -468,24 +942,41 @@ cdef class cKDTree:
                 # far child is further by an amount depending only
                 # on the split value; compute its distance and side_distances
                 # and push it on the queue if it's near enough
-                inf2 = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double)) 
+                inf2 = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+nbuf*sizeof(double)) 
                 it2.contents.ptrdata = <char*> inf2
                 inf2.node = far
                 # most side distances unchanged
-                for i in range(self.m):
+                for i in range(nbuf):
                     inf2.side_distances[i] = inf.side_distances[i]
 
+                if nbuf>self.m:
+                    # split the bounds of the cell between the children;
+                    # the near child keeps the side distance of its
+                    # parent, which is still a lower bound
+                    if near_is_less:
+                        inf.side_distances[2*self.m+inode.split_dim] = inode.split
+                        inf2.side_distances[self.m+inode.split_dim] = inode.split
+                    else:
+                        inf.side_distances[self.m+inode.split_dim] = inode.split
+                        inf2.side_distances[2*self.m+inode.split_dim] = inode.split
+                    _interval_distance(
+                        inf2.side_distances[self.m+inode.split_dim]-x[inode.split_dim],
+                        inf2.side_distances[2*self.m+inode.split_dim]-x[inode.split_dim],
+                        self.raw_boxsize_data, inode.split_dim, self.m, &t, &hi)
+                else:
+                    t = dabs(inode.split-x[inode.split_dim])
+
                 # one side distance changes
                 # we can adjust the minimum distance without recomputing
                 if p == infinity:
                     # we never use side_distances in the l_infinity case
-                    # inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
-                    far_min_distance = dmax(min_distance, dabs(inode.split-x[inode.split_dim]))
+                    # inf2.side_distances[inode.split_dim] = t
+                    far_min_distance = dmax(min_distance, t)
                 elif p == 1:
-                    inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+                    inf2.side_distances[inode.split_dim] = t
                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
                 else:
-                    inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])**p
+                    inf2.side_distances[inode.split_dim] = t**p
                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
 
                 it2.priority = far_min_distance
@@ -511,9 +1002,31 @@ cdef class cKDTree:
         heapdestroy(&q)
         heapdestroy(&neighbors)
 
+    def _query_chunk(cKDTree self, np.ndarray dd, np.ndarray ii,
+            np.ndarray xx, int start, int stop, int k, double eps, double p,
+            double distance_upper_bound, int max_leaves):
+        # Answer the queries xx[start:stop] without holding the GIL,
+        # writing straight into the preallocated result arrays.
+        cdef int c
+        cdef double* raw_dd = <double*>dd.data
+        cdef int* raw_ii = <int*>ii.data
+        cdef double* raw_xx = <double*>xx.data
+        with nogil:
+            for c in range(start, stop):
+                self.__query(
+                        raw_dd+c*k,
+                        raw_ii+c*k,
+                        raw_xx+c*self.m, 
+                        k, 
+                        eps,
+                        p, 
+                        distance_upper_bound,
+                        max_leaves)
+
     def query(cKDTree self, object x, int k=1, double eps=0, double p=2, 
-            double distance_upper_bound=infinity):
-        """query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf)
+            double distance_upper_bound=infinity, int n_jobs=1,
+            max_leaves=None):
+        """query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf, n_jobs=1, max_leaves=None)
         
         Query the kd-tree for nearest neighbors.
 
@@ -537,6 +1050,20 @@ cdef class cKDTree:
             tree searches, so if you are doing a series of nearest-neighbor
             queries, it may help to supply the distance to the nearest neighbor
             of the most recent point.
+        n_jobs : int, optional
+            Number of threads to use. The query points are split into
+            `n_jobs` contiguous chunks which are searched concurrently
+            without holding the GIL. If -1 is given, all processors are
+            used. Default: 1.
+        max_leaves : int, optional
+            Visit at most this many leaves of the tree for each query point.
+            Leaves are visited in order of increasing distance from the
+            query point, and when the budget is used up the best neighbors
+            found so far are returned.  This bounds the work done per query,
+            which is useful in high dimensions, but the neighbors returned
+            may then not be the nearest ones.  Default: None, which visits
+            as many leaves as needed for an exact (or `eps`-approximate)
+            answer.
 
         Returns
         -------
@@ -553,12 +1080,21 @@ cdef class cKDTree:
         cdef np.ndarray[int, ndim=2] ii
         cdef np.ndarray[double, ndim=2] dd
         cdef np.ndarray[double, ndim=2] xx
-        cdef int c
         x = np.asarray(x).astype(np.float)
         if np.shape(x)[-1] != self.m:
             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
         if p<1:
             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        if self.boxsize is not None:
+            x = np.mod(x, self.boxsize)
+        if n_jobs == -1:
+            n_jobs = cpu_count()
+        elif n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer or -1")
+        if max_leaves is None:
+            max_leaves = 0
+        elif max_leaves < 1:
+            raise ValueError("max_leaves must be a positive integer or None")
         if len(x.shape)==1:
             single = True
             x = x[np.newaxis,:]
@@ -572,15 +1108,20 @@ cdef class cKDTree:
         dd.fill(infinity)
         ii = np.empty((n,k),dtype='i')
         ii.fill(self.n)
-        for c in range(n):
-            self.__query(
-                    (<double*>dd.data)+c*k,
-                    (<int*>ii.data)+c*k,
-                    (<double*>xx.data)+c*self.m, 
-                    k, 
-                    eps,
-                    p, 
-                    distance_upper_bound)
+        n_jobs = min(n_jobs, n)
+        if n_jobs > 1:
+            bounds = [(n*j)//n_jobs for j in range(n_jobs+1)]
+            threads = [threading.Thread(target=self._query_chunk,
+                            args=(dd, ii, xx, start, stop, k, eps, p,
+                                  distance_upper_bound, max_leaves))
+                       for start, stop in zip(bounds[:-1], bounds[1:])]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        else:
+            self._query_chunk(dd, ii, xx, 0, n, k, eps, p,
+                              distance_upper_bound, max_leaves)
         if single:
             if k==1:
                 return dd[0,0], ii[0,0]
@@ -592,3 +1133,629 @@ cdef class cKDTree:
             else:
                 return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))
 
+
+    # ----------------------------------------------------------------
+    # query_ball_point
+    # ----------------------------------------------------------------
+    cdef int __query_ball_point_traverse_no_checking(cKDTree self,
+            list results, ckdtreenode* node) except -1:
+        cdef int i
+        for i in range(node.start_idx, node.end_idx):
+            results.append(self.raw_indices[i])
+        return 0
+
+    cdef int __query_ball_point_traverse_checking(cKDTree self,
+            list results, ckdtreenode* node, Rectangle rect, double* x,
+            double r, double lower, double upper, double p) except -1:
+        cdef int i, d
+        cdef double save
+
+        if min_distance_point_p(rect, x, p, self.raw_boxsize_data) > lower:
+            return 0
+        elif max_distance_point_p(rect, x, p, self.raw_boxsize_data) < upper:
+            self.__query_ball_point_traverse_no_checking(results, node)
+        elif node.split_dim == -1:
+            for i in range(node.start_idx, node.end_idx):
+                if _distance_p(self.raw_data+self.raw_indices[i]*self.m,
+                               x, p, self.m, r,
+                               self.raw_boxsize_data) <= r:
+                    results.append(self.raw_indices[i])
+        else:
+            d = node.split_dim
+            save = rect.maxes[d]
+            rect.maxes[d] = node.split
+            self.__query_ball_point_traverse_checking(
+                results, self.raw_nodes+node.less, rect, x, r, lower, upper, p)
+            rect.maxes[d] = save
+
+            save = rect.mins[d]
+            rect.mins[d] = node.split
+            self.__query_ball_point_traverse_checking(
+                results, self.raw_nodes+node.greater, rect, x, r, lower, upper,
+                p)
+            rect.mins[d] = save
+        return 0
+
+    cdef list __query_ball_point(cKDTree self, double* x, double r,
+                                 double p, double eps):
+        cdef list results
+        cdef Rectangle rect
+        results = []
+        rect = Rectangle(self.mins, self.maxes)
+        self.__query_ball_point_traverse_checking(
+            results, self.raw_nodes, rect, x, _distance_to_p(r, p),
+            _distance_to_p(r/(1.+eps), p), _distance_to_p(r*(1.+eps), p), p)
+        return results
+
+    def query_ball_point(cKDTree self, object x, double r, double p=2.,
+                         double eps=0):
+        """query_ball_point(self, x, r, p=2., eps=0)
+
+        Find all points within distance r of point(s) x.
+
+        Parameters
+        ----------
+        x : array_like, shape tuple + (self.m,)
+            The point or points to search for neighbors of.
+        r : positive float
+            The radius of points to return.
+        p : float, optional
+            Which Minkowski p-norm to use.  Should be in the range [1, inf].
+        eps : nonnegative float, optional
+            Approximate search. Branches of the tree are not explored if their
+            nearest points are further than ``r / (1 + eps)``, and branches are
+            added in bulk if their furthest points are nearer than
+            ``r * (1 + eps)``.
+
+        Returns
+        -------
+        results : list or array of lists
+            If `x` is a single point, returns a list of the indices of the
+            neighbors of `x`. If `x` is an array of points, returns an object
+            array of shape tuple containing lists of neighbors.
+
+        Notes
+        -----
+        If you have many points whose neighbors you want to find, you may save
+        substantial amounts of time by putting them in a cKDTree and using
+        query_ball_tree.
+
+        """
+        cdef np.ndarray[double, ndim=2] xx
+        cdef int c
+        x = np.asarray(x).astype(np.float)
+        if x.shape[-1] != self.m:
+            raise ValueError("Searching for a %d-dimensional point in a " \
+                             "%d-dimensional KDTree" % (x.shape[-1], self.m))
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        if self.boxsize is not None:
+            x = np.mod(x, self.boxsize)
+        if len(x.shape) == 1:
+            xx = np.ascontiguousarray(x[np.newaxis,:])
+            return self.__query_ball_point(<double*>xx.data, r, p, eps)
+        else:
+            retshape = x.shape[:-1]
+            result = np.empty(retshape, dtype=np.object)
+            xx = np.ascontiguousarray(np.reshape(x, (-1, self.m)))
+            for c, index in enumerate(np.ndindex(retshape)):
+                result[index] = self.__query_ball_point(
+                    (<double*>xx.data)+c*self.m, r, p, eps)
+            return result
+
+    # ----------------------------------------------------------------
+    # query_ball_tree
+    # ----------------------------------------------------------------
+    cdef int __query_ball_tree_traverse_no_checking(cKDTree self,
+            cKDTree other, list results, ckdtreenode* node1,
+            ckdtreenode* node2) except -1:
+        cdef list l
+        cdef int i, j
+        for i in range(node1.start_idx, node1.end_idx):
+            l = results[self.raw_indices[i]]
+            for j in range(node2.start_idx, node2.end_idx):
+                l.append(other.raw_indices[j])
+        return 0
+
+    cdef int __query_ball_tree_traverse_checking(cKDTree self,
+            cKDTree other, list results, ckdtreenode* node1, Rectangle rect1,
+            ckdtreenode* node2, Rectangle rect2, double r, double lower,
+            double upper, double p) except -1:
+        cdef list l
+        cdef int i, j, d
+        cdef double save
+
+        if min_distance_rectangle_p(rect1, rect2, p,
+                                    self.raw_boxsize_data) > lower:
+            return 0
+        elif max_distance_rectangle_p(rect1, rect2, p,
+                                    self.raw_boxsize_data) < upper:
+            self.__query_ball_tree_traverse_no_checking(
+                other, results, node1, node2)
+        elif node1.split_dim == -1:
+            if node2.split_dim == -1:
+                # brute-force
+                for i in range(node1.start_idx, node1.end_idx):
+                    l = results[self.raw_indices[i]]
+                    for j in range(node2.start_idx, node2.end_idx):
+                        if _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                other.raw_data+other.raw_indices[j]*self.m,
+                                p, self.m, r, self.raw_boxsize_data) <= r:
+                            l.append(other.raw_indices[j])
+            else:
+                d = node2.split_dim
+                save = rect2.maxes[d]
+                rect2.maxes[d] = node2.split
+                self.__query_ball_tree_traverse_checking(
+                    other, results, node1, rect1, other.raw_nodes+node2.less,
+                    rect2, r, lower, upper, p)
+                rect2.maxes[d] = save
+
+                save = rect2.mins[d]
+                rect2.mins[d] = node2.split
+                self.__query_ball_tree_traverse_checking(
+                    other, results, node1, rect1,
+                    other.raw_nodes+node2.greater, rect2, r, lower, upper, p)
+                rect2.mins[d] = save
+        else:
+            # split node1; node2 (if it is not a leaf) gets split on the
+            # next level down
+            d = node1.split_dim
+            save = rect1.maxes[d]
+            rect1.maxes[d] = node1.split
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.raw_nodes+node1.less, rect1, node2, rect2,
+                r, lower, upper, p)
+            rect1.maxes[d] = save
+
+            save = rect1.mins[d]
+            rect1.mins[d] = node1.split
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.raw_nodes+node1.greater, rect1, node2,
+                rect2, r, lower, upper, p)
+            rect1.mins[d] = save
+        return 0
+
+    def query_ball_tree(cKDTree self, cKDTree other, double r, double p=2.,
+                        double eps=0):
+        """query_ball_tree(self, other, r, p=2., eps=0)
+
+        Find all pairs of points whose distance is at most r
+
+        Parameters
+        ----------
+        other : cKDTree instance
+            The tree containing points to search against.
+        r : float
+            The maximum distance, has to be positive.
+        p : float, optional
+            Which Minkowski norm to use.  `p` has to meet the condition
+            ``1 <= p <= infinity``.
+        eps : float, optional
+            Approximate search.  Branches of the tree are not explored
+            if their nearest points are further than ``r/(1+eps)``, and
+            branches are added in bulk if their furthest points are nearer
+            than ``r * (1+eps)``.  `eps` has to be non-negative.
+
+        Returns
+        -------
+        results : list of lists
+            For each element ``self.data[i]`` of this tree, ``results[i]`` is a
+            list of the indices of its neighbors in ``other.data``.
+
+        """
+        cdef list results
+        if self.m != other.m:
+            raise ValueError("Trees passed to query_ball_tree have different "
+                             "dimensionality")
+        _check_same_box(self, other, "query_ball_tree")
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        results = [[] for i in range(self.n)]
+        self.__query_ball_tree_traverse_checking(
+            other, results, self.raw_nodes, Rectangle(self.mins, self.maxes),
+            other.raw_nodes, Rectangle(other.mins, other.maxes),
+            _distance_to_p(r, p), _distance_to_p(r/(1.+eps), p),
+            _distance_to_p(r*(1.+eps), p), p)
+        return results
+
+    # ----------------------------------------------------------------
+    # query_pairs
+    # ----------------------------------------------------------------
+    cdef int __query_pairs_traverse_no_checking(cKDTree self, set results,
+            ckdtreenode* node1, ckdtreenode* node2) except -1:
+        cdef int i, j, ii, jj
+        for i in range(node1.start_idx, node1.end_idx):
+            if node1 == node2:
+                # only look at each pair of points in the same node once
+                j = i+1
+            else:
+                j = node2.start_idx
+            while j < node2.end_idx:
+                ii = self.raw_indices[i]
+                jj = self.raw_indices[j]
+                if ii < jj:
+                    results.add((ii, jj))
+                else:
+                    results.add((jj, ii))
+                j += 1
+        return 0
+
+    cdef int __query_pairs_traverse_checking(cKDTree self, set results,
+            ckdtreenode* node1, Rectangle rect1, ckdtreenode* node2,
+            Rectangle rect2, double r, double lower, double upper,
+            double p) except -1:
+        cdef int i, j, ii, jj, d
+        cdef double save
+
+        if min_distance_rectangle_p(rect1, rect2, p,
+                                    self.raw_boxsize_data) > lower:
+            return 0
+        elif max_distance_rectangle_p(rect1, rect2, p,
+                                    self.raw_boxsize_data) < upper:
+            self.__query_pairs_traverse_no_checking(results, node1, node2)
+        elif node1.split_dim == -1:
+            if node2.split_dim == -1:
+                # brute-force
+                for i in range(node1.start_idx, node1.end_idx):
+                    if node1 == node2:
+                        j = i+1
+                    else:
+                        j = node2.start_idx
+                    while j < node2.end_idx:
+                        ii = self.raw_indices[i]
+                        jj = self.raw_indices[j]
+                        if _distance_p(self.raw_data+ii*self.m,
+                                       self.raw_data+jj*self.m,
+                                       p, self.m, r,
+                                       self.raw_boxsize_data) <= r:
+                            if ii < jj:
+                                results.add((ii, jj))
+                            else:
+                                results.add((jj, ii))
+                        j += 1
+            else:
+                d = node2.split_dim
+                save = rect2.maxes[d]
+                rect2.maxes[d] = node2.split
+                self.__query_pairs_traverse_checking(
+                    results, node1, rect1, self.raw_nodes+node2.less, rect2, r,
+                    lower, upper, p)
+                rect2.maxes[d] = save
+
+                save = rect2.mins[d]
+                rect2.mins[d] = node2.split
+                self.__query_pairs_traverse_checking(
+                    results, node1, rect1, self.raw_nodes+node2.greater, rect2,
+                    r, lower, upper, p)
+                rect2.mins[d] = save
+        elif node1 == node2:
+            # both children of the same node; visit each unordered pair
+            # of children only once
+            d = node1.split_dim
+            save = rect1.maxes[d]
+            rect1.maxes[d] = node1.split
+            rect2.maxes[d] = node1.split
+            self.__query_pairs_traverse_checking(
+                results, self.raw_nodes+node1.less, rect1,
+                self.raw_nodes+node1.less, rect2, r, lower, upper, p)
+            rect2.maxes[d] = save
+            rect2.mins[d] = node1.split
+            self.__query_pairs_traverse_checking(
+                results, self.raw_nodes+node1.less, rect1,
+                self.raw_nodes+node1.greater, rect2, r, lower, upper, p)
+            rect1.maxes[d] = save
+
+            save = rect1.mins[d]
+            rect1.mins[d] = node1.split
+            self.__query_pairs_traverse_checking(
+                results, self.raw_nodes+node1.greater, rect1,
+                self.raw_nodes+node1.greater, rect2, r, lower, upper, p)
+            rect1.mins[d] = save
+            rect2.mins[d] = save
+        else:
+            d = node1.split_dim
+            save = rect1.maxes[d]
+            rect1.maxes[d] = node1.split
+            self.__query_pairs_traverse_checking(
+                results, self.raw_nodes+node1.less, rect1, node2, rect2, r,
+                lower, upper, p)
+            rect1.maxes[d] = save
+
+            save = rect1.mins[d]
+            rect1.mins[d] = node1.split
+            self.__query_pairs_traverse_checking(
+                results, self.raw_nodes+node1.greater, rect1, node2, rect2, r,
+                lower, upper, p)
+            rect1.mins[d] = save
+        return 0
+
+    def query_pairs(cKDTree self, double r, double p=2., double eps=0):
+        """query_pairs(self, r, p=2., eps=0)
+
+        Find all pairs of points whose distance is at most r.
+
+        Parameters
+        ----------
+        r : positive float
+            The maximum distance.
+        p : float, optional
+            Which Minkowski norm to use.  `p` has to meet the condition
+            ``1 <= p <= infinity``.
+        eps : float, optional
+            Approximate search.  Branches of the tree are not explored
+            if their nearest points are further than ``r/(1+eps)``, and
+            branches are added in bulk if their furthest points are nearer
+            than ``r * (1+eps)``.  `eps` has to be non-negative.
+
+        Returns
+        -------
+        results : set
+            Set of pairs ``(i,j)``, with ``i<j``, for which the corresponding
+            positions are close.
+
+        """
+        cdef set results
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        results = set()
+        self.__query_pairs_traverse_checking(
+            results, self.raw_nodes, Rectangle(self.mins, self.maxes),
+            self.raw_nodes, Rectangle(self.mins, self.maxes), _distance_to_p(r,
+            p), _distance_to_p(r/(1.+eps), p), _distance_to_p(r*(1.+eps), p),
+            p)
+        return results
+
+    # ----------------------------------------------------------------
+    # count_neighbors
+    # ----------------------------------------------------------------
+    cdef int __count_neighbors_traverse(cKDTree self, cKDTree other,
+            np.intp_t* counts, double* r, int start, int end,
+            ckdtreenode* node1, Rectangle rect1, ckdtreenode* node2,
+            Rectangle rect2, double p) except -1:
+        # r holds the sorted radii (as distance**p) still undecided for
+        # this pair of nodes, r[start:end].  counts is a difference array:
+        # a pair of points is recorded by adding one at the smallest radius
+        # it falls within and removing it again at end, where the parent
+        # has already taken care of it.
+        cdef int i, j, k, lo, hi, d
+        cdef np.intp_t n
+        cdef double min_r, max_r, dist, save
+
+        min_r = min_distance_rectangle_p(rect1, rect2, p,
+                                         self.raw_boxsize_data)
+        max_r = max_distance_rectangle_p(rect1, rect2, p,
+                                         self.raw_boxsize_data)
+
+        # radii larger than max_r contain all pairs
+        hi = end
+        while hi > start and r[hi-1] > max_r:
+            hi -= 1
+        if hi < end:
+            counts[hi] += (<np.intp_t>node1.children)*node2.children
+            counts[end] -= (<np.intp_t>node1.children)*node2.children
+        # radii smaller than min_r contain none
+        lo = start
+        while lo < hi and r[lo] < min_r:
+            lo += 1
+        if lo == hi:
+            return 0
+
+        if node1.split_dim == -1:
+            if node2.split_dim == -1:
+                # brute-force
+                n = 0
+                for i in range(node1.start_idx, node1.end_idx):
+                    for j in range(node2.start_idx, node2.end_idx):
+                        dist = _distance_p(
+                            self.raw_data+self.raw_indices[i]*self.m,
+                            other.raw_data+other.raw_indices[j]*self.m,
+                            p, self.m, r[hi-1], self.raw_boxsize_data)
+                        if dist <= r[hi-1]:
+                            # first radius that contains the pair
+                            k = lo
+                            while r[k] < dist:
+                                k += 1
+                            counts[k] += 1
+                            n += 1
+                counts[hi] -= n
+            else:
+                d = node2.split_dim
+                save = rect2.maxes[d]
+                rect2.maxes[d] = node2.split
+                self.__count_neighbors_traverse(
+                    other, counts, r, lo, hi, node1, rect1,
+                    other.raw_nodes+node2.less, rect2, p)
+                rect2.maxes[d] = save
+
+                save = rect2.mins[d]
+                rect2.mins[d] = node2.split
+                self.__count_neighbors_traverse(
+                    other, counts, r, lo, hi, node1, rect1,
+                    other.raw_nodes+node2.greater, rect2, p)
+                rect2.mins[d] = save
+        else:
+            d = node1.split_dim
+            save = rect1.maxes[d]
+            rect1.maxes[d] = node1.split
+            self.__count_neighbors_traverse(
+                other, counts, r, lo, hi, self.raw_nodes+node1.less, rect1,
+                node2, rect2, p)
+            rect1.maxes[d] = save
+
+            save = rect1.mins[d]
+            rect1.mins[d] = node1.split
+            self.__count_neighbors_traverse(
+                other, counts, r, lo, hi, self.raw_nodes+node1.greater, rect1,
+                node2, rect2, p)
+            rect1.mins[d] = save
+        return 0
+
+    def count_neighbors(cKDTree self, cKDTree other, object r, double p=2.):
+        """count_neighbors(self, other, r, p=2.)
+
+        Count how many nearby pairs can be formed.
+
+        Count the number of pairs (x1,x2) can be formed, with x1 drawn
+        from self and x2 drawn from `other`, and where
+        ``distance(x1, x2, p) <= r``.
+        This is the "two-point correlation" described in Gray and Moore 2000,
+        "N-body problems in statistical learning", and the code here is based
+        on their algorithm.
+
+        Parameters
+        ----------
+        other : cKDTree instance
+            The other tree to draw points from.
+        r : float or one-dimensional array of floats
+            The radius to produce a count for. Multiple radii are searched with
+            a single tree traversal.
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use
+
+        Returns
+        -------
+        result : int or 1-D array of ints
+            The number of pairs.
+
+        """
+        cdef np.ndarray[double, ndim=1] rr
+        cdef np.ndarray[np.intp_t, ndim=1] counts
+        cdef int i
+        if self.m != other.m:
+            raise ValueError("Trees passed to count_neighbors have different "
+                             "dimensionality")
+        _check_same_box(self, other, "count_neighbors")
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        if len(np.shape(r)) > 1:
+            raise ValueError("r must be either a single value or a "
+                             "one-dimensional array of values")
+        r_arr = np.atleast_1d(np.asarray(r, dtype=np.float))
+        order = np.argsort(r_arr, kind='mergesort')
+        rr = np.ascontiguousarray(r_arr[order])
+        for i in range(rr.shape[0]):
+            rr[i] = _distance_to_p(rr[i], p)
+        counts = np.zeros(rr.shape[0]+1, dtype=np.intp)
+        self.__count_neighbors_traverse(
+            other, <np.intp_t*>counts.data, <double*>rr.data, 0, rr.shape[0],
+            self.raw_nodes, Rectangle(self.mins, self.maxes), other.raw_nodes,
+            Rectangle(other.mins, other.maxes), p)
+        result = np.empty(rr.shape[0], dtype=np.intp)
+        result[order] = np.cumsum(counts[:-1])
+        if np.shape(r) == ():
+            return result[0]
+        else:
+            return result
+
+    # ----------------------------------------------------------------
+    # sparse_distance_matrix
+    # ----------------------------------------------------------------
+    cdef int __sparse_distance_matrix_traverse(cKDTree self, cKDTree other,
+            dict results, ckdtreenode* node1, Rectangle rect1,
+            ckdtreenode* node2, Rectangle rect2, double max_distance,
+            double p) except -1:
+        cdef int i, j, d
+        cdef double dist, save
+
+        if min_distance_rectangle_p(rect1, rect2, p,
+                                    self.raw_boxsize_data) > max_distance:
+            return 0
+        elif node1.split_dim == -1:
+            if node2.split_dim == -1:
+                # brute-force
+                for i in range(node1.start_idx, node1.end_idx):
+                    for j in range(node2.start_idx, node2.end_idx):
+                        dist = _distance_p(
+                            self.raw_data+self.raw_indices[i]*self.m,
+                            other.raw_data+other.raw_indices[j]*self.m,
+                            p, self.m, max_distance, self.raw_boxsize_data)
+                        # zero distances are not stored, as in a dok_matrix
+                        if 0 < dist <= max_distance:
+                            if p != 1 and p != infinity:
+                                dist = dist**(1./p)
+                            results[self.raw_indices[i],
+                                    other.raw_indices[j]] = dist
+            else:
+                d = node2.split_dim
+                save = rect2.maxes[d]
+                rect2.maxes[d] = node2.split
+                self.__sparse_distance_matrix_traverse(
+                    other, results, node1, rect1, other.raw_nodes+node2.less,
+                    rect2, max_distance, p)
+                rect2.maxes[d] = save
+
+                save = rect2.mins[d]
+                rect2.mins[d] = node2.split
+                self.__sparse_distance_matrix_traverse(
+                    other, results, node1, rect1,
+                    other.raw_nodes+node2.greater, rect2, max_distance, p)
+                rect2.mins[d] = save
+        else:
+            d = node1.split_dim
+            save = rect1.maxes[d]
+            rect1.maxes[d] = node1.split
+            self.__sparse_distance_matrix_traverse(
+                other, results, self.raw_nodes+node1.less, rect1, node2, rect2,
+                max_distance, p)
+            rect1.maxes[d] = save
+
+            save = rect1.mins[d]
+            rect1.mins[d] = node1.split
+            self.__sparse_distance_matrix_traverse(
+                other, results, self.raw_nodes+node1.greater, rect1, node2,
+                rect2, max_distance, p)
+            rect1.mins[d] = save
+        return 0
+
+    def sparse_distance_matrix(cKDTree self, cKDTree other,
+                               double max_distance, double p=2.):
+        """sparse_distance_matrix(self, other, max_distance, p=2.)
+
+        Compute a sparse distance matrix
+
+        Computes a distance matrix between two cKDTrees, leaving as zero
+        any distance greater than max_distance.
+
+        Parameters
+        ----------
+        other : cKDTree
+
+        max_distance : positive float
+
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use
+
+        Returns
+        -------
+        result : dok_matrix
+            Sparse matrix representing the results in "dictionary of keys" format.
+
+        """
+        cdef dict results
+        if self.m != other.m:
+            raise ValueError("Trees passed to sparse_distance_matrix have "
+                             "different dimensionality")
+        _check_same_box(self, other, "sparse_distance_matrix")
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        results = {}
+        self.__sparse_distance_matrix_traverse(
+            other, results, self.raw_nodes, Rectangle(self.mins, self.maxes),
+            other.raw_nodes, Rectangle(other.mins, other.maxes),
+            _distance_to_p(max_distance, p), p)
+        result = scipy.sparse.dok_matrix((self.n, other.n))
+        result.update(results)
+        return result
+
+
+def _check_same_box(cKDTree tree1, cKDTree tree2, name):
+    # the distances between the points of two trees are computed in the
+    # periodic box of the first one
+    if tree1.boxsize is None and tree2.boxsize is None:
+        return
+    if (tree1.boxsize is None or tree2.boxsize is None or
+        np.any(tree1.boxsize != tree2.boxsize)):
+        raise ValueError("Trees passed to %s have different periodic "
+                         "boxes" % name)
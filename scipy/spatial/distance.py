@@ -16,6 +16,7 @@ stored in a rectangular array.
 
    pdist   -- pairwise distances between observation vectors.
    cdist   -- distances between between two collections of observation vectors
+   cdist_chunks -- blocks of rows of the cdist distance matrix
    squareform -- convert distance matrix to a condensed one and vice versa
 
 Predicates for checking the validity of distance matrices, both
@@ -111,8 +112,12 @@ Copyright (C) Damian Eads, 2007-2008. New BSD License.
 """
 
 import warnings
+import threading
+from multiprocessing import cpu_count
+
 import numpy as np
 from numpy.linalg import norm
+from scipy.linalg import get_blas_funcs
 
 import _distance_wrap
 
@@ -140,14 +145,6 @@ def _copy_arrays_if_base_present(T):
     return l
 
 
-def _convert_to_bool(X):
-    if X.dtype != np.bool:
-        X = X.astype(np.bool)
-    if not X.flags.contiguous:
-        X = X.copy()
-    return X
-
-
 def _convert_to_double(X):
     if X.dtype != np.double:
         X = X.astype(np.double)
@@ -156,6 +153,165 @@ def _convert_to_double(X):
     return X
 
 
+def _check_out(out, shape):
+    """
+    Checks that ``out`` can be filled with a distance matrix of the given
+    shape by the C code, which doesn't do striding.
+    """
+    if not isinstance(out, np.ndarray):
+        raise TypeError('out must be a numpy array.')
+    if out.dtype != np.double:
+        raise TypeError('out must contain 64-bit floats.')
+    if out.shape != shape:
+        raise ValueError('out must have shape %s (got %s).'
+                         % (shape, out.shape))
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError('out must be a writeable, C-contiguous array.')
+
+
+class _RowRangeWrap(object):
+    """
+    Stands in for the _distance_wrap module.  Its functions are called on
+    the given ranges of rows of the first array, each in its own thread;
+    the C code releases the GIL while it computes the distances.  An
+    exception raised in any of the threads is re-raised once they have
+    all finished.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+
+    def __getattr__(self, name):
+        func = getattr(_distance_wrap, name)
+
+        def run(*args):
+            errors = []
+
+            def run_range(start, end):
+                try:
+                    func(*(args + (start, end)))
+                except Exception, e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=run_range, args=(start, end))
+                       for start, end in zip(self.bounds[:-1],
+                                             self.bounds[1:])]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            if errors:
+                raise errors[0]
+        return run
+
+
+def _threaded_wrap(m, workers, condensed=False):
+    """
+    Returns the _distance_wrap module, or a stand-in that splits the m
+    rows of the first array over ``workers`` threads.  For condensed
+    distance matrices, where row i holds m - i - 1 distances, the rows
+    are split so that each thread computes about as many distances.
+    """
+    if workers == -1:
+        workers = cpu_count()
+    elif workers < 1:
+        raise ValueError('workers must be a positive integer or -1.')
+    workers = min(workers, m)
+    if workers <= 1:
+        return _distance_wrap
+    if condensed:
+        i = np.arange(m + 1)
+        offsets = i * m - i * (i + 1) // 2
+        targets = offsets[-1] * np.arange(workers + 1) // workers
+        bounds = [int(b) for b in np.searchsorted(offsets, targets)]
+        bounds[-1] = m
+    else:
+        bounds = [(m * j) // workers for j in xrange(workers + 1)]
+    return _RowRangeWrap(bounds)
+
+
+def _cdist_gemm(XA, XB, mstr, dm):
+    """
+    Computes the euclidean, squared euclidean, cosine or correlation
+    distances between the rows of XA and XB into dm from the inner
+    products of the rows, which a single BLAS gemm call gives.
+    """
+    euclidean_names = set(['euclidean', 'euclid', 'eu', 'e'])
+    sqeuclidean_names = set(['sqeuclidean', 'sqe', 'sqeuclid'])
+    if mstr in set(['correlation', 'co']):
+        XA = XA - XA.mean(1)[:, np.newaxis]
+        XB = XB - XB.mean(1)[:, np.newaxis]
+    elif (mstr not in euclidean_names and mstr not in sqeuclidean_names and
+          mstr not in set(['cosine', 'cos'])):
+        raise ValueError("method='gemm' is not available for the %s "
+                         "metric." % mstr)
+    squared = mstr in euclidean_names or mstr in sqeuclidean_names
+
+    if dm.size == 0:
+        return
+    if XA.shape[1] == 0:
+        dm.fill(0.0)
+    else:
+        # dm.T is dm in Fortran order, so gemm can compute XB XA^T into it
+        # in place, which is XA XB^T in C order.
+        gemm = get_blas_funcs('gemm', (XB.T, XA.T))
+        if squared:
+            alpha = -2.0
+        else:
+            alpha = 1.0
+        G = gemm(alpha, XB.T, XA.T, beta=0.0, c=dm.T, trans_a=1,
+                 overwrite_c=1)
+        if not np.may_share_memory(G, dm):
+            dm[...] = G.T
+
+    if squared:
+        # ||u - v||^2 = ||u||^2 + ||v||^2 - 2 u.v
+        dm += np.sum(XA * XA, axis=1)[:, np.newaxis]
+        dm += np.sum(XB * XB, axis=1)
+        # cancellation can make some of them slightly negative
+        np.maximum(dm, 0.0, dm)
+        if mstr in euclidean_names:
+            np.sqrt(dm, dm)
+    else:
+        dm /= np.sqrt(np.sum(XA * XA, axis=1))[:, np.newaxis]
+        dm /= np.sqrt(np.sum(XB * XB, axis=1))
+        np.subtract(1.0, dm, dm)
+        np.clip(dm, 0.0, 2.0, dm)
+
+
+# The codes of the boolean dissimilarities computed by the C functions
+# for bit-packed observations (see the enum in src/distance.h).
+_bool_metric_codes = {'hamming': 0, 'jaccard': 1, 'yule': 2, 'matching': 3,
+                      'dice': 4, 'rogerstanimoto': 5, 'russellrao': 6,
+                      'kulsinski': 7, 'sokalsneath': 8, 'sokalmichener': 9}
+
+
+def _is_bool_metric(metric):
+    """
+    Returns whether metric names a metric that can be computed from
+    bit-packed boolean observations.
+    """
+    if not isinstance(metric, basestring):
+        return False
+    mstr = metric.lower()
+    return (mstr in _bool_metric_codes or
+            mstr in set(['hamm', 'ha', 'h', 'jacc', 'ja', 'j']))
+
+
+def _pack_bool(X):
+    """
+    Packs each row of the boolean array X into 64-bit words, padded with
+    zero bits, for the C functions which compare the observations with
+    population counts.
+    """
+    X = np.asarray(X, dtype=np.bool)
+    m, n = X.shape
+    nwords = (n + 63) // 64
+    packed = np.zeros((m, 8 * nwords), dtype=np.uint8)
+    packed[:, :(n + 7) // 8] = np.packbits(X, axis=1)
+    return packed.view(np.uint64)
+
+
 def _validate_vector(u, dtype=None):
     # XXX Is order='c' really necessary?
     u = np.asarray(u, dtype=dtype, order='c').squeeze()
@@ -919,7 +1075,8 @@ def sokalsneath(u, v):
     return float(2.0 * (ntf + nft)) / denom
 
 
-def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
+def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None, out=None,
+          workers=1):
     r"""
     Computes the pairwise distances between m original observations in
     n-dimensional space. Returns a condensed distance matrix Y.  For
@@ -1133,11 +1290,20 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
             The variance vector (for standardized Euclidean).
     VI : ndarray
         The inverse of the covariance matrix (for Mahalanobis).
+    out : ndarray, optional
+        A C-contiguous array of doubles of length :math:`{m \choose 2}`
+        into which the distances are written, for example a
+        `numpy.memmap`.  If not given, a new array is allocated.
+    workers : int, optional
+        The number of threads which compute the distances of the
+        metrics implemented in C.  The rows of ``X`` are split so that
+        each thread computes about as many distances.  If -1 is given,
+        all processors are used.  Default: 1.
 
     Returns
     -------
     Y : ndarray
-        A condensed distance matrix.
+        A condensed distance matrix.  This is ``out`` if it was given.
 
     See Also
     --------
@@ -1153,15 +1319,23 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
 
     X = np.asarray(X, order='c')
 
-    # The C code doesn't do striding.
-    [X] = _copy_arrays_if_base_present([_convert_to_double(X)])
+    # Boolean observations are packed into bits for the boolean metrics
+    # rather than converted to doubles.
+    if not (X.dtype == np.bool and _is_bool_metric(metric)):
+        # The C code doesn't do striding.
+        [X] = _copy_arrays_if_base_present([_convert_to_double(X)])
 
     s = X.shape
     if len(s) != 2:
         raise ValueError('A 2-dimensional array must be passed.')
 
     m, n = s
-    dm = np.zeros((m * (m - 1) / 2,), dtype=np.double)
+    if out is None:
+        dm = np.zeros((m * (m - 1) / 2,), dtype=np.double)
+    else:
+        _check_out(out, (m * (m - 1) / 2,))
+        dm = out
+    wrap_functions = _threaded_wrap(m, workers, condensed=True)
 
     wmink_names = ['wminkowski', 'wmi', 'wm', 'wpnorm']
     if w is None and (metric == wminkowski or metric in wmink_names):
@@ -1197,28 +1371,30 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
         #       (mstr != 'hamming' and mstr != 'jaccard'):
         #    TypeError('A double array must be passed.')
         if mstr in set(['euclidean', 'euclid', 'eu', 'e']):
-            _distance_wrap.pdist_euclidean_wrap(_convert_to_double(X), dm)
+            wrap_functions.pdist_euclidean_wrap(_convert_to_double(X), dm)
         elif mstr in set(['sqeuclidean', 'sqe', 'sqeuclid']):
-            _distance_wrap.pdist_euclidean_wrap(_convert_to_double(X), dm)
-            dm = dm ** 2.0
+            wrap_functions.pdist_euclidean_wrap(_convert_to_double(X), dm)
+            dm **= 2.0
         elif mstr in set(['cityblock', 'cblock', 'cb', 'c']):
-            _distance_wrap.pdist_city_block_wrap(X, dm)
+            wrap_functions.pdist_city_block_wrap(X, dm)
         elif mstr in set(['hamming', 'hamm', 'ha', 'h']):
             if X.dtype == np.bool:
-                _distance_wrap.pdist_hamming_bool_wrap(_convert_to_bool(X), dm)
+                wrap_functions.pdist_bool_packed_wrap(
+                    _pack_bool(X), dm, n, _bool_metric_codes['hamming'])
             else:
-                _distance_wrap.pdist_hamming_wrap(_convert_to_double(X), dm)
+                wrap_functions.pdist_hamming_wrap(_convert_to_double(X), dm)
         elif mstr in set(['jaccard', 'jacc', 'ja', 'j']):
             if X.dtype == np.bool:
-                _distance_wrap.pdist_jaccard_bool_wrap(_convert_to_bool(X), dm)
+                wrap_functions.pdist_bool_packed_wrap(
+                    _pack_bool(X), dm, n, _bool_metric_codes['jaccard'])
             else:
-                _distance_wrap.pdist_jaccard_wrap(_convert_to_double(X), dm)
+                wrap_functions.pdist_jaccard_wrap(_convert_to_double(X), dm)
         elif mstr in set(['chebychev', 'chebyshev', 'cheby', 'cheb', 'ch']):
-            _distance_wrap.pdist_chebyshev_wrap(_convert_to_double(X), dm)
+            wrap_functions.pdist_chebyshev_wrap(_convert_to_double(X), dm)
         elif mstr in set(['minkowski', 'mi', 'm']):
-            _distance_wrap.pdist_minkowski_wrap(_convert_to_double(X), dm, p)
+            wrap_functions.pdist_minkowski_wrap(_convert_to_double(X), dm, p)
         elif mstr in wmink_names:
-            _distance_wrap.pdist_weighted_minkowski_wrap(_convert_to_double(X),
+            wrap_functions.pdist_weighted_minkowski_wrap(_convert_to_double(X),
                                                          dm, p, np.asarray(w))
         elif mstr in set(['seuclidean', 'se', 's']):
             if V is not None:
@@ -1238,14 +1414,14 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
                 [VV] = _copy_arrays_if_base_present([_convert_to_double(V)])
             else:
                 VV = np.var(X, axis=0, ddof=1)
-            _distance_wrap.pdist_seuclidean_wrap(_convert_to_double(X), VV, dm)
+            wrap_functions.pdist_seuclidean_wrap(_convert_to_double(X), VV, dm)
         # Need to test whether vectorized cosine works better.
         # Find out: Is there a dot subtraction operator so I can
         # subtract matrices in a similar way to multiplying them?
         # Need to get rid of as much unnecessary C code as possible.
         elif mstr in set(['cosine', 'cos']):
             norms = np.sqrt(np.sum(X * X, axis=1))
-            _distance_wrap.pdist_cosine_wrap(_convert_to_double(X), dm, norms)
+            wrap_functions.pdist_cosine_wrap(_convert_to_double(X), dm, norms)
         elif mstr in set(['old_cosine', 'old_cos']):
             norms = np.sqrt(np.sum(X * X, axis=1))
             nV = norms.reshape(m, 1)
@@ -1260,7 +1436,7 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
             X2 = X - X.mean(1)[:, np.newaxis]
             #X2 = X - np.matlib.repmat(np.mean(X, axis=1).reshape(m, 1), 1, n)
             norms = np.sqrt(np.sum(X2 * X2, axis=1))
-            _distance_wrap.pdist_cosine_wrap(_convert_to_double(X2),
+            wrap_functions.pdist_cosine_wrap(_convert_to_double(X2),
                                              _convert_to_double(dm),
                                              _convert_to_double(norms))
         elif mstr in set(['mahalanobis', 'mahal', 'mah']):
@@ -1275,30 +1451,17 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
                 V = np.cov(X.T)
                 VI = _convert_to_double(np.linalg.inv(V).T.copy())
             # (u-v)V^(-1)(u-v)^T
-            _distance_wrap.pdist_mahalanobis_wrap(_convert_to_double(X),
+            wrap_functions.pdist_mahalanobis_wrap(_convert_to_double(X),
                                                   VI, dm)
         elif mstr == 'canberra':
-            _distance_wrap.pdist_canberra_wrap(_convert_to_double(X), dm)
+            wrap_functions.pdist_canberra_wrap(_convert_to_double(X), dm)
         elif mstr == 'braycurtis':
-            _distance_wrap.pdist_bray_curtis_wrap(_convert_to_double(X), dm)
-        elif mstr == 'yule':
-            _distance_wrap.pdist_yule_bool_wrap(_convert_to_bool(X), dm)
-        elif mstr == 'matching':
-            _distance_wrap.pdist_matching_bool_wrap(_convert_to_bool(X), dm)
-        elif mstr == 'kulsinski':
-            _distance_wrap.pdist_kulsinski_bool_wrap(_convert_to_bool(X), dm)
-        elif mstr == 'dice':
-            _distance_wrap.pdist_dice_bool_wrap(_convert_to_bool(X), dm)
-        elif mstr == 'rogerstanimoto':
-            _distance_wrap.pdist_rogerstanimoto_bool_wrap(_convert_to_bool(X),
-                                                          dm)
-        elif mstr == 'russellrao':
-            _distance_wrap.pdist_russellrao_bool_wrap(_convert_to_bool(X), dm)
-        elif mstr == 'sokalmichener':
-            _distance_wrap.pdist_sokalmichener_bool_wrap(_convert_to_bool(X),
-                                                         dm)
-        elif mstr == 'sokalsneath':
-            _distance_wrap.pdist_sokalsneath_bool_wrap(_convert_to_bool(X), dm)
+            wrap_functions.pdist_bray_curtis_wrap(_convert_to_double(X), dm)
+        elif mstr in set(['yule', 'matching', 'kulsinski', 'dice',
+                          'rogerstanimoto', 'russellrao', 'sokalmichener',
+                          'sokalsneath']):
+            wrap_functions.pdist_bool_packed_wrap(_pack_bool(X), dm, n,
+                                                  _bool_metric_codes[mstr])
         elif metric == 'test_euclidean':
             dm = pdist(X, euclidean)
         elif metric == 'test_sqeuclidean':
@@ -1357,6 +1520,10 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
     else:
         raise TypeError('2nd argument metric must be a string identifier '
                         'or a function.')
+    if out is not None and dm is not out:
+        # some metrics above build a new array
+        out[...] = dm
+        dm = out
     return dm
 
 
@@ -1696,7 +1863,8 @@ def num_obs_y(Y):
     return d
 
 
-def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
+def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None,
+          out=None, workers=1, method='direct'):
     r"""
     Computes distance between each pair of observation vectors in the
     Cartesian product of two collections of vectors. ``XA`` is a
@@ -1917,12 +2085,33 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
         The variance vector (for standardized Euclidean).
     VI : ndarray
         The inverse of the covariance matrix (for Mahalanobis).
-
+    out : ndarray, optional
+        A C-contiguous :math:`m_A` by :math:`m_B` array of doubles into
+        which the distances are written, for example a `numpy.memmap`.
+        If not given, a new array is allocated.
+    workers : int, optional
+        The number of threads which compute the distances of the
+        metrics implemented in C, each for a block of rows of ``XA``.
+        If -1 is given, all processors are used.  Default: 1.
+    method : {'direct', 'gemm'}, optional
+        'direct' computes every distance on its own.  'gemm' computes
+        the 'euclidean', 'sqeuclidean', 'cosine' and 'correlation'
+        distances from the inner products of the observations, which
+        one BLAS matrix product gives; this is much faster for
+        observations with many dimensions, but less accurate for
+        distances that are small compared to the norms of the
+        observations (the distance of a point to itself may not be
+        exactly 0).  ``workers`` is ignored.  Default: 'direct'.
 
     Returns
     -------
     Y : ndarray
-        A :math:`m_A` by :math:`m_B` distance matrix.
+        A :math:`m_A` by :math:`m_B` distance matrix.  This is ``out``
+        if it was given.
+
+    See Also
+    --------
+    cdist_chunks : computes the distance matrix in blocks of rows.
     """
 
 #         21. Y = cdist(XA, XB, 'test_Y')
@@ -1938,9 +2127,13 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
     #    raise TypeError('Floating point arrays must be 64-bit (got %r).' %
     #    (X.dtype.type,))
 
-    # The C code doesn't do striding.
-    [XA] = _copy_arrays_if_base_present([_convert_to_double(XA)])
-    [XB] = _copy_arrays_if_base_present([_convert_to_double(XB)])
+    # Boolean observations are packed into bits for the boolean metrics
+    # rather than converted to doubles.
+    if not (XA.dtype == np.bool and XB.dtype == np.bool and
+            _is_bool_metric(metric)):
+        # The C code doesn't do striding.
+        [XA] = _copy_arrays_if_base_present([_convert_to_double(XA)])
+        [XB] = _copy_arrays_if_base_present([_convert_to_double(XB)])
 
     s = XA.shape
     sB = XB.shape
@@ -1956,7 +2149,20 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
     mA = s[0]
     mB = sB[0]
     n = s[1]
-    dm = np.zeros((mA, mB), dtype=np.double)
+    if out is None:
+        dm = np.zeros((mA, mB), dtype=np.double)
+    else:
+        _check_out(out, (mA, mB))
+        dm = out
+    wrap_functions = _threaded_wrap(mA, workers)
+
+    if method == 'gemm':
+        if not isinstance(metric, basestring):
+            raise ValueError("method='gemm' needs the name of a metric.")
+        _cdist_gemm(XA, XB, metric.lower(), dm)
+        return dm
+    elif method != 'direct':
+        raise ValueError('Unknown method: %s' % method)
 
     if callable(metric):
         if metric == minkowski:
@@ -1986,39 +2192,39 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
         #       (mstr != 'hamming' and mstr != 'jaccard'):
         #    TypeError('A double array must be passed.')
         if mstr in set(['euclidean', 'euclid', 'eu', 'e']):
-            _distance_wrap.cdist_euclidean_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_euclidean_wrap(_convert_to_double(XA),
                                                 _convert_to_double(XB), dm)
         elif mstr in set(['sqeuclidean', 'sqe', 'sqeuclid']):
-            _distance_wrap.cdist_euclidean_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_euclidean_wrap(_convert_to_double(XA),
                                                 _convert_to_double(XB), dm)
             dm **= 2.0
         elif mstr in set(['cityblock', 'cblock', 'cb', 'c']):
-            _distance_wrap.cdist_city_block_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_city_block_wrap(_convert_to_double(XA),
                                                  _convert_to_double(XB), dm)
         elif mstr in set(['hamming', 'hamm', 'ha', 'h']):
             if XA.dtype == np.bool:
-                _distance_wrap.cdist_hamming_bool_wrap(_convert_to_bool(XA),
-                                                       _convert_to_bool(XB),
-                                                       dm)
+                wrap_functions.cdist_bool_packed_wrap(
+                    _pack_bool(XA), _pack_bool(XB), dm, n,
+                    _bool_metric_codes['hamming'])
             else:
-                _distance_wrap.cdist_hamming_wrap(_convert_to_double(XA),
+                wrap_functions.cdist_hamming_wrap(_convert_to_double(XA),
                                                   _convert_to_double(XB), dm)
         elif mstr in set(['jaccard', 'jacc', 'ja', 'j']):
             if XA.dtype == np.bool:
-                _distance_wrap.cdist_jaccard_bool_wrap(_convert_to_bool(XA),
-                                                       _convert_to_bool(XB),
-                                                       dm)
+                wrap_functions.cdist_bool_packed_wrap(
+                    _pack_bool(XA), _pack_bool(XB), dm, n,
+                    _bool_metric_codes['jaccard'])
             else:
-                _distance_wrap.cdist_jaccard_wrap(_convert_to_double(XA),
+                wrap_functions.cdist_jaccard_wrap(_convert_to_double(XA),
                                                   _convert_to_double(XB), dm)
         elif mstr in set(['chebychev', 'chebyshev', 'cheby', 'cheb', 'ch']):
-            _distance_wrap.cdist_chebyshev_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_chebyshev_wrap(_convert_to_double(XA),
                                                 _convert_to_double(XB), dm)
         elif mstr in set(['minkowski', 'mi', 'm', 'pnorm']):
-            _distance_wrap.cdist_minkowski_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_minkowski_wrap(_convert_to_double(XA),
                                                 _convert_to_double(XB), dm, p)
         elif mstr in set(['wminkowski', 'wmi', 'wm', 'wpnorm']):
-            _distance_wrap.cdist_weighted_minkowski_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_weighted_minkowski_wrap(_convert_to_double(XA),
                                                          _convert_to_double(XB),
                                                          dm, p,
                                                          _convert_to_double(w))
@@ -2043,7 +2249,7 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
                 VV = np.var(X, axis=0, ddof=1)
                 X = None
                 del X
-            _distance_wrap.cdist_seuclidean_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_seuclidean_wrap(_convert_to_double(XA),
                                                  _convert_to_double(XB), VV, dm)
         # Need to test whether vectorized cosine works better.
         # Find out: Is there a dot subtraction operator so I can
@@ -2052,7 +2258,7 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
         elif mstr in set(['cosine', 'cos']):
             normsA = np.sqrt(np.sum(XA * XA, axis=1))
             normsB = np.sqrt(np.sum(XB * XB, axis=1))
-            _distance_wrap.cdist_cosine_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_cosine_wrap(_convert_to_double(XA),
                                              _convert_to_double(XB), dm,
                                              normsA,
                                              normsB)
@@ -2062,7 +2268,7 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
             #X2 = X - np.matlib.repmat(np.mean(X, axis=1).reshape(m, 1), 1, n)
             normsA = np.sqrt(np.sum(XA2 * XA2, axis=1))
             normsB = np.sqrt(np.sum(XB2 * XB2, axis=1))
-            _distance_wrap.cdist_cosine_wrap(_convert_to_double(XA2),
+            wrap_functions.cdist_cosine_wrap(_convert_to_double(XA2),
                                              _convert_to_double(XB2),
                                              _convert_to_double(dm),
                                              _convert_to_double(normsA),
@@ -2082,42 +2288,21 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
                 del X
                 VI = _convert_to_double(np.linalg.inv(V).T.copy())
             # (u-v)V^(-1)(u-v)^T
-            _distance_wrap.cdist_mahalanobis_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_mahalanobis_wrap(_convert_to_double(XA),
                                                   _convert_to_double(XB),
                                                   VI, dm)
         elif mstr == 'canberra':
-            _distance_wrap.cdist_canberra_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_canberra_wrap(_convert_to_double(XA),
                                                _convert_to_double(XB), dm)
         elif mstr == 'braycurtis':
-            _distance_wrap.cdist_bray_curtis_wrap(_convert_to_double(XA),
+            wrap_functions.cdist_bray_curtis_wrap(_convert_to_double(XA),
                                                   _convert_to_double(XB), dm)
-        elif mstr == 'yule':
-            _distance_wrap.cdist_yule_bool_wrap(_convert_to_bool(XA),
-                                                _convert_to_bool(XB), dm)
-        elif mstr == 'matching':
-            _distance_wrap.cdist_matching_bool_wrap(_convert_to_bool(XA),
-                                                    _convert_to_bool(XB), dm)
-        elif mstr == 'kulsinski':
-            _distance_wrap.cdist_kulsinski_bool_wrap(_convert_to_bool(XA),
-                                                     _convert_to_bool(XB), dm)
-        elif mstr == 'dice':
-            _distance_wrap.cdist_dice_bool_wrap(_convert_to_bool(XA),
-                                                _convert_to_bool(XB), dm)
-        elif mstr == 'rogerstanimoto':
-            _distance_wrap.cdist_rogerstanimoto_bool_wrap(_convert_to_bool(XA),
-                                                          _convert_to_bool(XB),
-                                                          dm)
-        elif mstr == 'russellrao':
-            _distance_wrap.cdist_russellrao_bool_wrap(_convert_to_bool(XA),
-                                                      _convert_to_bool(XB), dm)
-        elif mstr == 'sokalmichener':
-            _distance_wrap.cdist_sokalmichener_bool_wrap(_convert_to_bool(XA),
-                                                         _convert_to_bool(XB),
-                                                         dm)
-        elif mstr == 'sokalsneath':
-            _distance_wrap.cdist_sokalsneath_bool_wrap(_convert_to_bool(XA),
-                                                       _convert_to_bool(XB),
-                                                       dm)
+        elif mstr in set(['yule', 'matching', 'kulsinski', 'dice',
+                          'rogerstanimoto', 'russellrao', 'sokalmichener',
+                          'sokalsneath']):
+            wrap_functions.cdist_bool_packed_wrap(_pack_bool(XA),
+                                                  _pack_bool(XB), dm, n,
+                                                  _bool_metric_codes[mstr])
         elif metric == 'test_euclidean':
             dm = cdist(XA, XB, euclidean)
         elif metric == 'test_seuclidean':
@@ -2181,4 +2366,90 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
     else:
         raise TypeError('2nd argument metric must be a string identifier '
                         'or a function.')
+    if out is not None and dm is not out:
+        # some metrics above build a new array
+        out[...] = dm
+        dm = out
     return dm
+
+
+def cdist_chunks(XA, XB, metric='euclidean', chunk_rows=None, **kwargs):
+    """
+    Computes the distance matrix of ``cdist(XA, XB, metric, ...)`` in
+    blocks of rows.
+
+    This is a generator which yields the distances between
+    ``XA[i:i + chunk_rows]`` and ``XB`` for ``i = 0, chunk_rows, ...``,
+    so only one block has to be held in memory at a time.  Stacking the
+    blocks gives the same matrix as `cdist`.
+
+    Parameters
+    ----------
+    XA : ndarray
+        An :math:`m_A` by :math:`n` array of :math:`m_A`
+        original observations in an :math:`n`-dimensional space.
+    XB : ndarray
+        An :math:`m_B` by :math:`n` array of :math:`m_B`
+        original observations in an :math:`n`-dimensional space.
+    metric : string or function
+        The distance metric to use, see `cdist`.
+    chunk_rows : int, optional
+        The number of rows of each block (the last one may be
+        shorter).  By default the blocks hold about 2**22 distances
+        (32 MB).
+    **kwargs
+        Further arguments ``p``, ``V``, ``VI`` and ``w`` are passed to
+        `cdist`.  If they are not given, the variances for 'seuclidean'
+        and the inverse covariance for 'mahalanobis' are computed once
+        from all of ``XA`` and ``XB``, as `cdist` does.
+
+    Returns
+    -------
+    blocks : generator
+        Yields :math:`k` by :math:`m_B` distance matrices, where
+        :math:`k` is ``chunk_rows`` except for the last block.
+
+    Examples
+    --------
+    Write a large distance matrix to a file on disk:
+
+    >>> XA = np.random.rand(20000, 3)
+    >>> XB = np.random.rand(10000, 3)
+    >>> Y = np.memmap('dist.dat', dtype=np.double, mode='w+',
+    ...               shape=(len(XA), len(XB)))
+    >>> i = 0
+    >>> for block in cdist_chunks(XA, XB, 'cityblock', chunk_rows=1000):
+    ...     Y[i:i + len(block)] = block
+    ...     i += len(block)
+    >>> Y.flush()
+
+    """
+    XA = np.asarray(XA, order='c')
+    XB = np.asarray(XB, order='c')
+    if len(XA.shape) != 2:
+        raise ValueError('XA must be a 2-dimensional array.')
+    if len(XB.shape) != 2:
+        raise ValueError('XB must be a 2-dimensional array.')
+
+    mA = XA.shape[0]
+    mB = XB.shape[0]
+    if chunk_rows is None:
+        chunk_rows = max(1, 2**22 // max(mB, 1))
+    chunk_rows = int(chunk_rows)
+    if chunk_rows < 1:
+        raise ValueError('chunk_rows must be at least 1.')
+
+    # These defaults depend on all the observations, so they cannot be
+    # left to cdist, which only sees one block of XA at a time.
+    if isinstance(metric, basestring):
+        mstr = metric.lower()
+        if (mstr in set(['seuclidean', 'se', 's']) and
+            kwargs.get('V') is None):
+            kwargs['V'] = np.var(np.vstack([XA, XB]), axis=0, ddof=1)
+        elif (mstr in set(['mahalanobis', 'mahal', 'mah']) and
+              kwargs.get('VI') is None):
+            V = np.cov(np.vstack([XA, XB]).T)
+            kwargs['VI'] = np.linalg.inv(V).T.copy()
+
+    for i in xrange(0, mA, chunk_rows):
+        yield cdist(XA[i:i + chunk_rows], XB, metric, **kwargs)
@@ -16,13 +16,14 @@ cimport numpy as np
 cimport cython
 cimport qhull
 
-__all__ = ['Delaunay', 'tsearch']
+__all__ = ['Delaunay', 'ConvexHull', 'Voronoi', 'tsearch']
 
 #------------------------------------------------------------------------------
 # Qhull interface
 #------------------------------------------------------------------------------
 
 cdef extern from "stdio.h":
+    ctypedef struct FILE
     extern void *stdin
     extern void *stderr
     extern void *stdout
@@ -53,6 +54,7 @@ cdef extern from "qhull/src/qhull.h":
         facetT *next
         facetT *previous
         unsigned id
+        unsigned visitid
         setT *vertices
         setT *neighbors
         flagT simplicial
@@ -64,7 +66,7 @@ cdef extern from "qhull/src/qhull.h":
         vertexT *previous
         unsigned int id, visitid
         pointT *point
-        setT *neighbours
+        setT *neighbors
 
     ctypedef struct qhT:
         boolT DELAUNAY
@@ -74,10 +76,13 @@ cdef extern from "qhull/src/qhull.h":
         boolT NOerrexit
         boolT PROJECTdelaunay
         boolT ATinfinity
+        boolT UPPERdelaunay
+        int hull_dim
         int normal_size
         char *qhull_command
         facetT *facet_list
         facetT *facet_tail
+        vertexT *vertex_list
         int num_facets
         unsigned int facet_id
         pointT *first_point
@@ -114,6 +119,25 @@ cdef extern from "qhull/src/qhull.h":
                      void *errfile) nogil
     int qh_pointid(pointT *point) nogil
 
+cdef extern from "qhull/src/qset.h":
+    int qh_setsize(setT *set) nogil
+
+cdef extern from "qhull/src/poly.h":
+    void qh_setvoronoi_all() nogil
+
+cdef extern from "qhull/src/io.h":
+    ctypedef enum qh_RIDGE:
+        qh_RIDGEall
+        qh_RIDGEinner
+        qh_RIDGEouter
+
+    ctypedef void (*printvridgeT)(FILE *fp, vertexT *vertex, vertexT *vertexA,
+                                  setT *centers, boolT unbounded)
+
+    int qh_eachvoronoi_all(FILE *fp, printvridgeT printvridge,
+                           boolT isUpper, qh_RIDGE innerouter, boolT inorder)
+    void qh_order_vertexneighbors(vertexT *vertex) nogil
+
 # Qhull is not threadsafe: needs locking
 _qhull_lock = threading.Lock()
 
@@ -131,35 +155,22 @@ cdef extern from "qhull_blas.h":
 # Delaunay triangulation using Qhull
 #------------------------------------------------------------------------------
 
-def _construct_delaunay(np.ndarray[np.double_t, ndim=2] points):
+cdef object _qhull_run(np.ndarray[np.double_t, ndim=2] points,
+                       char *options, int triangulate, get_output):
     """
-    Perform Delaunay triangulation of the given set of points.
+    Run Qhull with the given options on the points, and return
+    ``get_output(dim, numpoints)``, called while the result of Qhull
+    is still available.
 
     """
-
-    # Run qhull with the options
-    #
-    # - d: perform delaunay triangulation
-    # - Qbb: scale last coordinate for Delaunay
-    # - Qz: reduces Delaunay precision errors for cospherical sites
-    # - Qt: output only simplical facets (can produce degenerate 0-area ones)
-    #
-    cdef char *options = "qhull d Qz Qbb Qt"
     cdef int curlong, totlong
     cdef int dim
     cdef int numpoints
     cdef int exitcode
 
-    points = np.ascontiguousarray(points)
     numpoints = points.shape[0]
     dim = points.shape[1]
 
-    if numpoints <= 0:
-        raise ValueError("No points to triangulate")
-
-    if dim < 2:
-        raise ValueError("Need at least 2-D data to triangulate")
-
     _qhull_lock.acquire()
     try:
         qh_qh.NOerrexit = 1
@@ -171,22 +182,11 @@ def _construct_delaunay(np.ndarray[np.double_t, ndim=2] points):
             if exitcode != 0:
                 raise RuntimeError("Qhull error")
 
-            with nogil:
-                qh_triangulate() # get rid of non-simplical facets
-
-            if qh_qh.SCALElast:
-                paraboloid_scale = qh_qh.last_newhigh / (
-                    qh_qh.last_high - qh_qh.last_low)
-                paraboloid_shift = - qh_qh.last_low * paraboloid_scale
-            else:
-                paraboloid_scale = 1.0
-                paraboloid_shift = 0.0
-
-            vertices, neighbors, equations = \
-                      _qhull_get_facet_array(dim, numpoints)
+            if triangulate:
+                with nogil:
+                    qh_triangulate() # get rid of non-simplical facets
 
-            return (vertices, neighbors, equations,
-                    paraboloid_scale, paraboloid_shift)
+            return get_output(dim, numpoints)
         finally:
             with nogil:
                 qh_freeqhull(0)
@@ -198,6 +198,101 @@ def _construct_delaunay(np.ndarray[np.double_t, ndim=2] points):
         _qhull_lock.release()
 
 
+def _construct_delaunay(np.ndarray[np.double_t, ndim=2] points):
+    """
+    Perform Delaunay triangulation of the given set of points.
+
+    """
+
+    # Run qhull with the options
+    #
+    # - d: perform delaunay triangulation
+    # - Qbb: scale last coordinate for Delaunay
+    # - Qz: reduces Delaunay precision errors for cospherical sites
+    # - Qt: output only simplical facets (can produce degenerate 0-area ones)
+    #
+    cdef char *options = "qhull d Qz Qbb Qt"
+
+    points = np.ascontiguousarray(points)
+
+    if points.shape[0] <= 0:
+        raise ValueError("No points to triangulate")
+
+    if points.shape[1] < 2:
+        raise ValueError("Need at least 2-D data to triangulate")
+
+    return _qhull_run(points, options, 1, _get_delaunay_output)
+
+
+def _get_delaunay_output(int dim, int numpoints):
+    if qh_qh.SCALElast:
+        paraboloid_scale = qh_qh.last_newhigh / (
+            qh_qh.last_high - qh_qh.last_low)
+        paraboloid_shift = - qh_qh.last_low * paraboloid_scale
+    else:
+        paraboloid_scale = 1.0
+        paraboloid_shift = 0.0
+
+    vertices, neighbors, equations = \
+              _qhull_get_facet_array(dim, numpoints)
+
+    return (vertices, neighbors, equations,
+            paraboloid_scale, paraboloid_shift)
+
+
+def _construct_convex_hull(np.ndarray[np.double_t, ndim=2] points):
+    """
+    Compute the convex hull of the given set of points.
+
+    """
+
+    # Run qhull with the options
+    #
+    # - i: output the vertices of the facets
+    # - Qt: output only simplical facets
+    #
+    cdef char *options = "qhull i Qt"
+
+    points = np.ascontiguousarray(points)
+
+    if points.shape[1] < 2:
+        raise ValueError("Need at least 2-D data to compute a convex hull")
+
+    if points.shape[0] <= points.shape[1]:
+        raise ValueError("Need at least %d points to compute a convex hull"
+                         % (points.shape[1] + 1))
+
+    return _qhull_run(points, options, 1, _qhull_get_hull_facet_array)
+
+
+def _construct_voronoi(np.ndarray[np.double_t, ndim=2] points):
+    """
+    Compute the Voronoi diagram of the given set of points.
+
+    """
+
+    # Run qhull with the options
+    #
+    # - v: compute the Voronoi diagram
+    # - Qbb: scale last coordinate for Delaunay
+    # - Qz: reduces Delaunay precision errors for cospherical sites
+    #
+    # Non-simplical facets are not triangulated, so that cospherical
+    # points give a single Voronoi vertex.
+    #
+    cdef char *options = "qhull v Qbb Qz"
+
+    points = np.ascontiguousarray(points)
+
+    if points.shape[0] <= 0:
+        raise ValueError("No points to compute a Voronoi diagram of")
+
+    if points.shape[1] < 2:
+        raise ValueError("Need at least 2-D data to compute a Voronoi diagram")
+
+    return _qhull_run(points, options, 0, _qhull_get_voronoi_diagram)
+
+
 @cython.boundscheck(False)
 @cython.cdivision(True)
 def _qhull_get_facet_array(int ndim, int numpoints):
@@ -283,6 +378,193 @@ def _qhull_get_facet_array(int ndim, int numpoints):
     return vertices, neighbors, equations
 
 
+@cython.boundscheck(False)
+def _qhull_get_hull_facet_array(int ndim, int numpoints):
+    """
+    Return array of simplical facets of the convex hull currently in Qhull.
+
+    Returns
+    -------
+    simplices : array of int, shape (nfacets, ndim)
+        Indices of coordinates of vertices forming the simplical facets
+    neighbors : array of int, shape (nfacets, ndim)
+        Indices of neighboring facets.  The kth neighbor is opposite
+        the kth vertex.
+    equations : array of double, shape (nfacets, ndim+1)
+        [normal, offset] forming the hyperplane equation of the facet
+
+    """
+
+    cdef facetT* facet
+    cdef facetT* neighbor
+    cdef vertexT *vertex
+    cdef int i, j, point, error_non_simplical
+    cdef np.ndarray[np.npy_int, ndim=2] simplices
+    cdef np.ndarray[np.npy_int, ndim=2] neighbors
+    cdef np.ndarray[np.double_t, ndim=2] equations
+    cdef np.ndarray[np.npy_int, ndim=1] id_map
+
+    id_map = np.empty((qh_qh.facet_id,), dtype=np.intc)
+    id_map.fill(-1)
+
+    # Compute facet indices
+    facet = qh_qh.facet_list
+    j = 0
+    while facet and facet.next:
+        id_map[facet.id] = j
+        j += 1
+        facet = facet.next
+
+    # Allocate output
+    simplices = np.zeros((j, ndim), dtype=np.intc)
+    neighbors = np.zeros((j, ndim), dtype=np.intc)
+    equations = np.zeros((j, ndim+1), dtype=np.double)
+
+    # Retrieve facet information
+    error_non_simplical = 0
+
+    with nogil:
+        facet = qh_qh.facet_list
+        j = 0
+        while facet and facet.next:
+            if not facet.simplicial:
+                error_non_simplical = 1
+                break
+
+            for i in xrange(ndim):
+                vertex = <vertexT*>facet.vertices.e[i].p
+                simplices[j, i] = qh_pointid(vertex.point)
+
+                neighbor = <facetT*>facet.neighbors.e[i].p
+                neighbors[j, i] = id_map[neighbor.id]
+
+                equations[j, i] = facet.normal[i]
+            equations[j, ndim] = facet.offset
+
+            j += 1
+            facet = facet.next
+
+    if error_non_simplical:
+        raise ValueError("non-simplical facet encountered")
+
+    return simplices, neighbors, equations
+
+
+def _qhull_get_voronoi_diagram(int ndim, int numpoints):
+    """
+    Return the Voronoi diagram currently in Qhull.
+
+    Returns
+    -------
+    vertices : array of double, shape (nvertices, ndim)
+        Coordinates of the Voronoi vertices
+    ridge_points : array of int, shape (nridges, 2)
+        Indices of the points between which each Voronoi ridge lies
+    ridge_vertices : list of lists of int, shape (nridges, *)
+        Indices of the Voronoi vertices forming each ridge.
+        -1 denotes the vertex at infinity.
+    regions : list of lists of int, shape (nregions, *)
+        Indices of the Voronoi vertices forming each region.
+        -1 denotes the vertex at infinity.
+    point_region : array of int, shape (numpoints,)
+        Index of the region of each point, -1 for points that are
+        not vertices of the Delaunay triangulation.
+
+    """
+    cdef facetT *facet
+    cdef vertexT *vertex
+    cdef int i, k, nvertices, point, inf_seen
+    cdef np.ndarray[np.double_t, ndim=2] vertices
+    cdef np.ndarray[np.npy_int, ndim=1] point_region
+
+    # Voronoi vertices are the centers of the lower Delaunay facets, and
+    # qh_eachvoronoi_all numbers them in the visitid of the facets,
+    # starting from 1.  Facets with visitid 0 stand for the vertex at
+    # infinity.
+    with nogil:
+        qh_setvoronoi_all()
+
+    ridges = []
+    qh_eachvoronoi_all(<FILE*><void*>ridges, _visit_voronoi_ridge,
+                       qh_qh.UPPERdelaunay, qh_RIDGEall, 1)
+
+    # Ridges to the point at infinity added by Qz are not in the diagram
+    ridges = [r for r in ridges if r[0] < numpoints and r[1] < numpoints]
+    ridge_points = np.zeros((len(ridges), 2), dtype=np.intc)
+    ridge_vertices = []
+    for i, (point_1, point_2, centers) in enumerate(ridges):
+        ridge_points[i, 0] = point_1
+        ridge_points[i, 1] = point_2
+        ridge_vertices.append(centers)
+
+    nvertices = 0
+    facet = qh_qh.facet_list
+    while facet and facet.next:
+        if facet.visitid > nvertices:
+            nvertices = facet.visitid
+        facet = facet.next
+
+    vertices = np.zeros((nvertices, ndim), dtype=np.double)
+    with nogil:
+        facet = qh_qh.facet_list
+        while facet and facet.next:
+            if facet.visitid > 0:
+                for k in xrange(ndim):
+                    vertices[facet.visitid - 1, k] = facet.center[k]
+            facet = facet.next
+
+    regions = []
+    point_region = np.empty((numpoints,), dtype=np.intc)
+    point_region.fill(-1)
+
+    vertex = qh_qh.vertex_list
+    while vertex and vertex.next:
+        point = qh_pointid(vertex.point)
+        if point < numpoints:
+            if qh_qh.hull_dim == 3:
+                # order the vertices of 2-D regions along their boundary
+                qh_order_vertexneighbors(vertex)
+
+            region = []
+            inf_seen = 0
+            for k in xrange(qh_setsize(vertex.neighbors)):
+                i = (<facetT*>vertex.neighbors.e[k].p).visitid - 1
+                if i == -1:
+                    if inf_seen:
+                        continue
+                    inf_seen = 1
+                region.append(i)
+
+            point_region[point] = len(regions)
+            regions.append(region)
+        vertex = vertex.next
+
+    return vertices, ridge_points, ridge_vertices, regions, point_region
+
+
+cdef void _visit_voronoi_ridge(FILE *ptr, vertexT *vertex, vertexT *vertexA,
+                               setT *centers, boolT unbounded):
+    """
+    Record a Voronoi ridge found by qh_eachvoronoi_all in the list `ptr`.
+
+    """
+    cdef int i, k, inf_seen
+    cdef list ridges = <object><void*>ptr
+
+    vertices = []
+    inf_seen = 0
+    for k in xrange(qh_setsize(centers)):
+        i = (<facetT*>centers.e[k].p).visitid - 1
+        if i == -1:
+            if inf_seen:
+                continue
+            inf_seen = 1
+        vertices.append(i)
+
+    ridges.append((qh_pointid(vertex.point), qh_pointid(vertexA.point),
+                   vertices))
+
+
 #------------------------------------------------------------------------------
 # Barycentric coordinates
 #------------------------------------------------------------------------------
@@ -840,6 +1122,12 @@ cdef int _find_simplex(DelaunayInfo_t *d, double *c,
     if isimplex < 0 or isimplex >= d.nsimplex:
         isimplex = 0
 
+    # Points are often located in batches along lines or grids, so that
+    # the point is likely in the simplex found for the previous one
+    if _barycentric_inside(ndim, d.transform + isimplex*ndim*(ndim+1),
+                           x, c, eps):
+        return isimplex
+
     # Lift point to paraboloid
     _lift_point(d, x, z)
 
@@ -879,13 +1167,87 @@ cdef int _find_simplex(DelaunayInfo_t *d, double *c,
     return _find_simplex_directed(d, c, x, start, eps)
 
 
+#------------------------------------------------------------------------------
+# Walking the boundary of the triangulation
+#------------------------------------------------------------------------------
+
+cdef int _hull_ridge_visible(DelaunayInfo_t *d, int isimplex, int k,
+                             double *x, double *c, double eps) nogil:
+    """
+    Is the convex hull ridge `k` of simplex `isimplex` visible from point
+    `x`, i.e., is `x` outside the triangulation across the ridge?
+
+    A point on the ridge itself also sees it, so that adding it splits
+    the ridge.
+
+    """
+    cdef int i
+
+    _barycentric_coordinates(d.ndim, d.transform + isimplex*d.ndim*(d.ndim+1),
+                             x, c)
+    if c[k] < -eps:
+        return 1
+    elif c[k] > eps:
+        return 0
+    for i in xrange(d.ndim+1):
+        if i != k and c[i] < -eps:
+            return 0
+    return 1
+
+cdef int _hull_ridge_neighbor(DelaunayInfo_t *d, int isimplex, int k, int j,
+                              int *ridge_k) nogil:
+    """
+    Find the convex hull ridge adjacent to the hull ridge `k` of simplex
+    `isimplex`, across their shared face that does not contain vertex `j`.
+
+    Returns the simplex of the adjacent ridge, and stores the index of
+    the ridge in `ridge_k`.  Returns -1 if the tesselation is
+    inconsistent.
+
+    Notes
+    -----
+    The simplices sharing the face are visited in turn, as in a 2-D walk
+    around a vertex: each one is left through its other ridge containing
+    the face, until a ridge without a neighbor is found.
+
+    """
+    cdef int ndim, cur, nb, kk, knext, u, m, i, cycle_k
+
+    ndim = d.ndim
+    cur = isimplex
+    kk = j
+    u = d.vertices[(ndim+1)*isimplex + k]
+
+    for cycle_k in xrange(d.nsimplex):
+        nb = d.neighbors[(ndim+1)*cur + kk]
+        if nb == -1:
+            ridge_k[0] = kk
+            return cur
+
+        m = -1
+        knext = -1
+        for i in xrange(ndim+1):
+            if d.neighbors[(ndim+1)*nb + i] == cur:
+                m = i
+            if d.vertices[(ndim+1)*nb + i] == u:
+                knext = i
+        if m == -1 or knext == -1:
+            return -1
+
+        u = d.vertices[(ndim+1)*nb + m]
+        kk = knext
+        cur = nb
+
+    return -1
+
+
 #------------------------------------------------------------------------------
 # Delaunay triangulation interface, for Python
 #------------------------------------------------------------------------------
 
 class Delaunay(object):
     """
-    Delaunay(points)
+    Delaunay(points, incremental=False)
 
     Delaunay tesselation in N dimensions
 
@@ -895,6 +1257,12 @@ class Delaunay(object):
     ----------
     points : ndarray of floats, shape (npoints, ndim)
         Coordinates of points to triangulate
+    incremental : bool, optional
+        Allow adding new points to the triangulation with `add_points`.
+        The arrays of the triangulation then keep some spare room, so
+        that they need not be copied every time points are added.
+
+        .. versionadded:: 0.11
 
     Attributes
     ----------
@@ -942,7 +1310,7 @@ class Delaunay(object):
 
     """
 
-    def __init__(self, points):
+    def __init__(self, points, incremental=False):
         points = np.ascontiguousarray(points).astype(np.double)
         vertices, neighbors, equations, paraboloid_scale, paraboloid_shift = \
                   _construct_delaunay(points)
@@ -960,6 +1328,10 @@ class Delaunay(object):
         self.max_bound = self.points.max(axis=0)
         self._transform = None
         self._vertex_to_simplex = None
+        self._vertex_tree = None
+        self._incremental = incremental
+        self._points_buf = None
+        self._simplex_bufs = None
 
     @property
     def transform(self):
@@ -1027,6 +1399,9 @@ class Delaunay(object):
         belonging to the (N-1)-dimensional facets that form the convex
         hull of the triangulation.
 
+        Use `ConvexHull` for computing the convex hull of points that
+        are not otherwise triangulated.
+
         """
         cdef int isimplex, k, j, ndim, nsimplex, m, msize
         cdef np.ndarray[np.npy_int, ndim=2] arr
@@ -1064,9 +1439,9 @@ class Delaunay(object):
         return out
 
     @cython.boundscheck(False)
-    def find_simplex(self, xi, bruteforce=False):
+    def find_simplex(self, xi, bruteforce=False, start='auto'):
         """
-        find_simplex(xi, bruteforce=False)
+        find_simplex(xi, bruteforce=False, start='auto')
 
         Find the simplices containing the given points.
 
@@ -1078,6 +1453,26 @@ class Delaunay(object):
             Points to locate
         bruteforce : bool, optional
             Whether to only perform a brute-force search
+        start : {'auto', 'previous', 'nearest'} or ndarray of int, optional
+            Where the walk searching for each point starts from.
+
+            - 'auto': walk on the paraboloid starting from the simplex
+              found for the previous point, and finish with a directed
+              walk (default).
+            - 'previous': directed walk starting from the simplex found
+              for the previous point.  This is fastest when consecutive
+              points are close to each other, e.g. points along
+              trajectories or scanlines.
+            - 'nearest': directed walk starting from a simplex containing
+              the vertex nearest to each point, found with a k-d tree.
+              This is fastest for points in random order.
+            - ndarray of int, shape ``xi.shape[:-1]``: directed walk
+              starting from the given simplices, for example the result
+              of a previous `find_simplex` call on nearby points.
+              Negative entries start from the simplex found for the
+              previous point.
+
+            .. versionadded:: 0.11
 
         Returns
         -------
@@ -1093,15 +1488,21 @@ class Delaunay(object):
         the point in N+1 dimensions, the algorithm falls back to
         directed search in N dimensions.
 
+        The directed search alone needs a good starting simplex, but
+        is then cheaper; the `start` options other than 'auto' skip
+        the search in N+1 dimensions.
+
         """
         cdef DelaunayInfo_t info
         cdef int isimplex
         cdef double c[NPY_MAXDIMS]
         cdef double eps
-        cdef int start
-        cdef int k
+        cdef int istart
+        cdef int k, directed, use_hints
+        cdef double *xk
         cdef np.ndarray[np.double_t, ndim=2] x
         cdef np.ndarray[np.npy_int, ndim=1] out_
+        cdef np.ndarray[np.npy_int, ndim=1] hints
 
         xi = np.asanyarray(xi)
 
@@ -1112,7 +1513,23 @@ class Delaunay(object):
         xi = xi.reshape(np.prod(xi.shape[:-1]), xi.shape[-1])
         x = np.ascontiguousarray(xi.astype(np.double))
 
-        start = 0
+        directed = 1
+        use_hints = 1
+        if isinstance(start, str):
+            if start == 'auto' or start == 'previous':
+                directed = (start == 'previous')
+                use_hints = 0
+                hints = np.empty((0,), dtype=np.intc)
+            elif start == 'nearest':
+                hints = self._nearest_vertex_simplex(x)
+            else:
+                raise ValueError("unknown start: %r" % (start,))
+        else:
+            hints = np.ascontiguousarray(start, dtype=np.intc).ravel()
+            if hints.shape[0] != x.shape[0]:
+                raise ValueError("start must have shape xi.shape[:-1]")
+
+        istart = 0
 
         eps = np.finfo(np.double).eps * 10
         out = np.zeros((xi.shape[0],), dtype=np.intc)
@@ -1127,16 +1544,350 @@ class Delaunay(object):
                         <double*>x.data + info.ndim*k,
                         eps)
                     out_[k] = isimplex
-        else:
+        elif not directed:
             with nogil:
                 for k in xrange(x.shape[0]):
                     isimplex = _find_simplex(&info, c,
                                              <double*>x.data + info.ndim*k,
-                                             &start, eps)
+                                             &istart, eps)
                     out_[k] = isimplex
+        elif info.nsimplex > 0:
+            with nogil:
+                for k in xrange(x.shape[0]):
+                    xk = <double*>x.data + info.ndim*k
+                    if _is_point_fully_outside(&info, xk, eps):
+                        out_[k] = -1
+                        continue
+                    if use_hints and 0 <= hints[k] < info.nsimplex:
+                        istart = hints[k]
+                    out_[k] = _find_simplex_directed(&info, c, xk,
+                                                     &istart, eps)
+        else:
+            out.fill(-1)
 
         return out.reshape(xi_shape[:-1])
 
+    def _nearest_vertex_simplex(self, x):
+        """
+        For each point in `x`, return a simplex containing the vertex
+        nearest to it.
+
+        """
+        if self._vertex_tree is None:
+            from scipy.spatial.ckdtree import cKDTree
+            self._vertex_tree = cKDTree(self.points)
+        d, i = self._vertex_tree.query(x)
+        return self.vertex_to_simplex[i]
+
+    @cython.boundscheck(False)
+    def add_points(self, points):
+        """
+        add_points(points)
+
+        Add new points to the triangulation.
+
+        .. versionadded:: 0.11
+
+        Parameters
+        ----------
+        points : ndarray of floats, shape (npoints, ndim)
+            Coordinates of points to add
+
+        Raises
+        ------
+        RuntimeError
+            If the triangulation was not constructed with
+            ``incremental=True``.
+
+        Notes
+        -----
+        The points are inserted one at a time with the Bowyer-Watson
+        algorithm.  The simplices whose facet on the paraboloid is
+        visible from the lifted point (i.e., whose circumsphere contains
+        the point) are removed, together with the convex hull ridges
+        visible from it, and the hole is filled with new simplices
+        joining the point to its boundary.  Only the simplices near the
+        new point are touched, so this is much faster than constructing
+        the triangulation again.
+
+        `vertices`, `neighbors`, `equations` and `transform` are updated
+        in place, and the other lookup arrays are computed again when
+        next needed.  The order of the simplices is in general different
+        from the one a new `Delaunay` would give.
+
+        Points coinciding with a vertex of the triangulation are added
+        to `points`, but not to the triangulation.
+
+        """
+        cdef DelaunayInfo_t info
+        cdef np.ndarray[np.double_t, ndim=2] new_points
+        cdef np.ndarray[np.npy_int, ndim=2] vertices
+        cdef np.ndarray[np.npy_int, ndim=2] neighbors
+        cdef double c[NPY_MAXDIMS+1]
+        cdef double z[NPY_MAXDIMS+1]
+        cdef double *x
+        cdef double eps
+        cdef int ndim, npoints, nsimplex, ip, isimplex, start
+        cdef int i, j, k, s, nb, s2, k2, t, m, duplicate
+
+        if not self._incremental:
+            raise RuntimeError("incremental mode not enabled")
+
+        new_points = np.ascontiguousarray(points, dtype=np.double)
+        if new_points.ndim != 2 or new_points.shape[1] != self.ndim:
+            raise ValueError("wrong dimensionality in points")
+        if new_points.shape[0] == 0:
+            return
+
+        ndim = self.ndim
+        npoints = self.npoints
+        eps = np.finfo(np.double).eps * 10
+
+        # The barycentric transforms are needed for locating the points
+        self.transform
+        self._reserve(npoints + new_points.shape[0], self.nsimplex)
+        self.npoints = npoints + new_points.shape[0]
+        self._resize_views()
+        self.points[npoints:] = new_points
+        self.min_bound = np.minimum(self.min_bound, new_points.min(axis=0))
+        self.max_bound = np.maximum(self.max_bound, new_points.max(axis=0))
+        self._vertex_to_simplex = None
+        self._vertex_tree = None
+
+        start = 0
+        for ip in xrange(npoints, self.npoints):
+            _get_delaunay_info(&info, self, 1, 0)
+            x = <double*>info.points + ndim*ip
+            nsimplex = info.nsimplex
+            vertices = self._simplex_bufs[0]
+            neighbors = self._simplex_bufs[1]
+
+            # 1) Locate the point, and a visible hull ridge if the point
+            #    is outside the triangulation
+
+            isimplex = _find_simplex(&info, c, x, &start, eps)
+
+            cavity = {}
+            ghosts = {}
+            stack = []
+            ghost_stack = []
+
+            if isimplex != -1:
+                duplicate = 0
+                for k in xrange(ndim+1):
+                    j = vertices[isimplex, k]
+                    for i in xrange(ndim):
+                        if info.points[ndim*j + i] != x[i]:
+                            break
+                    else:
+                        duplicate = 1
+                if duplicate:
+                    continue
+                cavity[isimplex] = True
+                stack.append(isimplex)
+            else:
+                s = start
+                k2 = -1
+                if 0 <= s < nsimplex:
+                    for k in xrange(ndim+1):
+                        if (neighbors[s, k] == -1 and
+                                _hull_ridge_visible(&info, s, k, x, c, eps)):
+                            k2 = k
+                            break
+                if k2 == -1:
+                    # walk failed: look through all of the hull
+                    for s, k in zip(*np.nonzero(self.neighbors == -1)):
+                        if _hull_ridge_visible(&info, s, k, x, c, eps):
+                            k2 = k
+                            break
+                if k2 == -1:
+                    raise RuntimeError("failed to add point %d" % ip)
+                ghosts[(s, k2)] = True
+                ghost_stack.append((s, k2))
+
+            # 2) Find the simplices and hull ridges visible from the point,
+            #    and the ridges on the boundary of the hole they leave
+
+            _lift_point(&info, x, z)
+            conflict = {}
+            boundary = []
+
+            while stack or ghost_stack:
+                if stack:
+                    s = stack.pop()
+                    for k in xrange(ndim+1):
+                        nb = neighbors[s, k]
+                        if nb == -1:
+                            if _hull_ridge_visible(&info, s, k, x, c, eps):
+                                if (s, k) not in ghosts:
+                                    ghosts[(s, k)] = True
+                                    ghost_stack.append((s, k))
+                            else:
+                                boundary.append((s, k, -1, -1))
+                        elif nb not in cavity:
+                            if nb not in conflict:
+                                conflict[nb] = _distplane(&info, nb, z) > 0
+                            if conflict[nb]:
+                                cavity[nb] = True
+                                stack.append(nb)
+                            else:
+                                for j in xrange(ndim+1):
+                                    if neighbors[nb, j] == s:
+                                        break
+                                boundary.append((s, k, nb, j))
+                else:
+                    s, k = ghost_stack.pop()
+                    if s not in cavity:
+                        if s not in conflict:
+                            conflict[s] = _distplane(&info, s, z) > 0
+                        if conflict[s]:
+                            cavity[s] = True
+                            stack.append(s)
+                        else:
+                            boundary.append((s, k, s, k))
+                    for j in xrange(ndim+1):
+                        if j == k:
+                            continue
+                        s2 = _hull_ridge_neighbor(&info, s, k, j, &k2)
+                        if s2 == -1:
+                            raise RuntimeError("failed to add point %d" % ip)
+                        if (s2, k2) in ghosts:
+                            continue
+                        if _hull_ridge_visible(&info, s2, k2, x, c, eps):
+                            ghosts[(s2, k2)] = True
+                            ghost_stack.append((s2, k2))
+
+            # 3) Fill the hole with simplices joining the point to the
+            #    boundary ridges, reusing the slots of removed simplices
+
+            new_vertices = np.empty((len(boundary), ndim+1), dtype=np.intc)
+            for t, (s, k, nb, j) in enumerate(boundary):
+                m = 0
+                for i in xrange(ndim+1):
+                    if i != k:
+                        new_vertices[t, m] = vertices[s, i]
+                        m += 1
+                new_vertices[t, ndim] = ip
+
+            slots = sorted(cavity)
+            m = len(boundary) - len(slots)
+            slots.extend(range(nsimplex, nsimplex + m))
+            if m > 0:
+                self._reserve(self.npoints, nsimplex + m)
+                vertices = self._simplex_bufs[0]
+                neighbors = self._simplex_bufs[1]
+
+            ridges = {}
+            for t in xrange(len(boundary)):
+                s, k, nb, j = boundary[t]
+                isimplex = slots[t]
+                vertices[isimplex] = new_vertices[t]
+                neighbors[isimplex, ndim] = nb
+                if nb != -1:
+                    neighbors[nb, j] = isimplex
+                for i in xrange(ndim):
+                    key = list(new_vertices[t])
+                    del key[i]
+                    key.sort()
+                    key = tuple(key)
+                    if key in ridges:
+                        s2, k2 = ridges.pop(key)
+                        neighbors[isimplex, i] = s2
+                        neighbors[s2, k2] = isimplex
+                    else:
+                        ridges[key] = (isimplex, i)
+                        neighbors[isimplex, i] = -1
+
+            holes = slots[len(boundary):]
+            slots = slots[:len(boundary)]
+            self._compute_simplex_info(slots)
+
+            nsimplex += max(m, 0)
+            while holes:
+                # Fewer simplices than were removed: fill the holes
+                # with the last simplices
+                nsimplex -= 1
+                if nsimplex in holes:
+                    holes.remove(nsimplex)
+                else:
+                    self._move_simplex(nsimplex, holes.pop(0))
+
+            self.nsimplex = nsimplex
+            self._resize_views()
+            if slots:
+                start = slots[0]
+
+    def _reserve(self, npoints, nsimplex):
+        """
+        Make room for `npoints` points and `nsimplex` simplices in the
+        arrays of an incremental triangulation.
+
+        """
+        if self._points_buf is None or self._points_buf.shape[0] < npoints:
+            buf = np.empty((2*npoints, self.ndim), dtype=np.double)
+            buf[:self.npoints] = self.points
+            self._points_buf = buf
+
+        if (self._simplex_bufs is None or
+                self._simplex_bufs[0].shape[0] < nsimplex):
+            bufs = []
+            for arr in (self.vertices, self.neighbors, self.equations,
+                        self.transform):
+                buf = np.empty((2*nsimplex,) + arr.shape[1:], dtype=arr.dtype)
+                buf[:self.nsimplex] = arr
+                bufs.append(buf)
+            self._simplex_bufs = bufs
+
+        self._resize_views()
+
+    def _resize_views(self):
+        """
+        Point the arrays of an incremental triangulation to the used part
+        of the buffers.
+
+        """
+        self.points = self._points_buf[:self.npoints]
+        bufs = [buf[:self.nsimplex] for buf in self._simplex_bufs]
+        self.vertices, self.neighbors, self.equations, self._transform = bufs
+
+    def _compute_simplex_info(self, simplices):
+        """
+        Compute the barycentric transforms and the paraboloid facet
+        equations of the given simplices in an incremental triangulation.
+
+        """
+        vertices, neighbors, equations, transform = self._simplex_bufs
+        ndim = self.ndim
+        simplices = np.asarray(simplices, dtype=np.intc)
+        T = _get_barycentric_transforms(self._points_buf, vertices[simplices])
+        transform[simplices] = T
+
+        # The facet of each simplex on the paraboloid is the graph of the
+        # affine function interpolating the lifted coordinates of its
+        # vertices: ``a . (x - r) + L_n``
+        L = (self._points_buf[vertices[simplices]]**2).sum(axis=-1)
+        L *= self.paraboloid_scale
+        L += self.paraboloid_shift
+        a = ((L[:,:ndim] - L[:,ndim:])[:,:,np.newaxis] * T[:,:ndim,:]).sum(axis=1)
+        norm = np.sqrt(1 + (a**2).sum(axis=1))
+        eq = np.empty((len(simplices), ndim+2), dtype=np.double)
+        eq[:,:ndim] = a / norm[:,np.newaxis]
+        eq[:,ndim] = -1 / norm
+        eq[:,ndim+1] = (L[:,ndim] - (a*T[:,ndim,:]).sum(axis=1)) / norm
+        equations[simplices] = eq
+
+    def _move_simplex(self, src, dst):
+        """
+        Move a simplex to another slot in an incremental triangulation.
+
+        """
+        for buf in self._simplex_bufs:
+            buf[dst] = buf[src]
+        neighbors = self._simplex_bufs[1]
+        for nb in neighbors[dst]:
+            if nb != -1:
+                neighbors[nb][neighbors[nb] == src] = dst
+
     @cython.boundscheck(False)
     def plane_distance(self, xi):
         """
@@ -1186,6 +1937,131 @@ class Delaunay(object):
         z[...,-1] += tri.paraboloid_shift
         return z
 
+#------------------------------------------------------------------------------
+# Convex hulls and Voronoi diagrams
+#------------------------------------------------------------------------------
+
+class ConvexHull(object):
+    """
+    ConvexHull(points)
+
+    Convex hull in N dimensions
+
+    .. versionadded:: 0.11
+
+    Parameters
+    ----------
+    points : ndarray of floats, shape (npoints, ndim)
+        Coordinates of points to construct a convex hull from
+
+    Attributes
+    ----------
+    points : ndarray of double, shape (npoints, ndim)
+        Coordinates of input points.
+    vertices : ndarray of ints, shape (nvertices,)
+        Indices of points forming the vertices of the convex hull,
+        in increasing order.
+    simplices : ndarray of ints, shape (nfacet, ndim)
+        Indices of points forming the simplical facets of the convex hull.
+    neighbors : ndarray of ints, shape (nfacet, ndim)
+        Indices of neighbor facets for each facet.
+        The kth neighbor is opposite to the kth vertex.
+    equations : ndarray of double, shape (nfacet, ndim+1)
+        [normal, offset] forming the hyperplane equation of the facet
+        (see [Qhull]_ documentation for more).  The normals point
+        outwards, so that ``np.dot(equations[:,:-1], x) +
+        equations[:,-1]`` is negative for points ``x`` inside the hull.
+
+    Notes
+    -----
+    The convex hull is computed using the Qhull libary [Qhull]_.  Only
+    the hull is computed, which is much cheaper than computing the
+    Delaunay triangulation of the points and taking its
+    `Delaunay.convex_hull`.
+
+    References
+    ----------
+
+    .. [Qhull] http://www.qhull.org/
+
+    """
+
+    def __init__(self, points):
+        points = np.ascontiguousarray(points).astype(np.double)
+        simplices, neighbors, equations = _construct_convex_hull(points)
+
+        self.ndim = points.shape[1]
+        self.npoints = points.shape[0]
+        self.nsimplex = simplices.shape[0]
+        self.points = points
+        self.simplices = simplices
+        self.neighbors = neighbors
+        self.equations = equations
+        self.vertices = np.unique(simplices)
+
+
+class Voronoi(object):
+    """
+    Voronoi(points)
+
+    Voronoi diagram in N dimensions
+
+    .. versionadded:: 0.11
+
+    Parameters
+    ----------
+    points : ndarray of floats, shape (npoints, ndim)
+        Coordinates of points to construct a Voronoi diagram from
+
+    Attributes
+    ----------
+    points : ndarray of double, shape (npoints, ndim)
+        Coordinates of input points.
+    vertices : ndarray of double, shape (nvertices, ndim)
+        Coordinates of the Voronoi vertices.
+    ridge_points : ndarray of ints, shape (nridges, 2)
+        Indices of the points between which each Voronoi ridge lies.
+    ridge_vertices : list of list of ints, shape (nridges, \*)
+        Indices of the Voronoi vertices forming each Voronoi ridge.
+        -1 denotes the Voronoi vertex at infinity, for ridges extending
+        to infinity.
+    regions : list of list of ints, shape (nregions, \*)
+        Indices of the Voronoi vertices forming each Voronoi region.
+        -1 denotes the Voronoi vertex at infinity, for unbounded regions.
+        In 2-D, the vertices are in order along the boundary of the
+        region.
+    point_region : ndarray of ints, shape (npoints,)
+        Index of the Voronoi region for each input point.  Points that
+        are not vertices of the Delaunay triangulation (e.g., duplicate
+        points) have no region, and get the value -1.
+
+    Notes
+    -----
+    The Voronoi diagram is computed using the Qhull libary [Qhull]_,
+    directly from the Delaunay triangulation that Qhull constructs.
+
+    References
+    ----------
+
+    .. [Qhull] http://www.qhull.org/
+
+    """
+
+    def __init__(self, points):
+        points = np.ascontiguousarray(points).astype(np.double)
+        vertices, ridge_points, ridge_vertices, regions, point_region = \
+                  _construct_voronoi(points)
+
+        self.ndim = points.shape[1]
+        self.npoints = points.shape[0]
+        self.points = points
+        self.vertices = vertices
+        self.ridge_points = ridge_points
+        self.ridge_vertices = ridge_vertices
+        self.regions = regions
+        self.point_region = point_region
+
+
 # Alias familiar from other environments
 def tsearch(tri, xi):
     """
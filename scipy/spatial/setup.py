@@ -10,6 +10,7 @@ def configuration(parent_package = '', top_path = None):
     config = Configuration('spatial', parent_package, top_path)
 
     config.add_data_dir('tests')
+    config.add_data_dir('benchmarks')
 
     qhull_src = ['geom2.c', 'geom.c', 'global.c', 'io.c', 'libqhull.c',
                  'mem.c', 'merge.c', 'poly2.c', 'poly.c', 'qset.c',
@@ -129,108 +129,58 @@ double hamming_distance(const double *u, const double *v, int n) {
   return s / (double)n;
 }
 
-static NPY_INLINE double hamming_distance_bool(const char *u, const char *v, int n) {
-  int i = 0;
-  double s = 0.0;
-  for (i = 0; i < n; i++) {
-    s = s + (u[i] != v[i]);
-  }
-  return s / (double)n;
-}
-
-static NPY_INLINE double yule_distance_bool(const char *u, const char *v, int n) {
-  int i = 0;
-  int ntt = 0, nff = 0, nft = 0, ntf = 0;
-  for (i = 0; i < n; i++) {
-    ntt += (u[i] && v[i]);
-    ntf += (u[i] && !v[i]);
-    nft += (!u[i] && v[i]);
-    nff += (!u[i] && !v[i]);
-  }
-  return (2.0 * ntf * nft) / (double)(ntt * nff + ntf * nft);  
-}
-
-static NPY_INLINE double matching_distance_bool(const char *u, const char *v, int n) {
-  int i = 0;
-  int nft = 0, ntf = 0;
-  for (i = 0; i < n; i++) {
-    ntf += (u[i] && !v[i]);
-    nft += (!u[i] && v[i]);
-  }
-  return (double)(ntf + nft) / (double)(n);
-}
-
-static NPY_INLINE double dice_distance_bool(const char *u, const char *v, int n) {
-  int i = 0;
-  int ntt = 0, nft = 0, ntf = 0;
-  for (i = 0; i < n; i++) {
-    ntt += (u[i] && v[i]);
-    ntf += (u[i] && !v[i]);
-    nft += (!u[i] && v[i]);
-  }
-  return (double)(nft + ntf) / (double)(2.0 * ntt + ntf + nft);
+/**
+ * The number of set bits of x.
+ */
+static NPY_INLINE int popcount64(npy_uint64 x) {
+#if defined(__GNUC__) && defined(__POPCNT__)
+  return __builtin_popcountll(x);
+#else
+  x = x - ((x >> 1) & (npy_uint64)0x5555555555555555ULL);
+  x = (x & (npy_uint64)0x3333333333333333ULL)
+    + ((x >> 2) & (npy_uint64)0x3333333333333333ULL);
+  x = (x + (x >> 4)) & (npy_uint64)0x0f0f0f0f0f0f0f0fULL;
+  return (int)((x * (npy_uint64)0x0101010101010101ULL) >> 56);
+#endif
 }
 
-
-static NPY_INLINE double rogerstanimoto_distance_bool(const char *u, const char *v, int n) {
+/**
+ * Computes a boolean dissimilarity between two bit-packed observations
+ * of n booleans, stored in nwords 64-bit words each (the unused bits
+ * must be zero).  The metric is one of the BOOL_* codes in distance.h.
+ */
+static NPY_INLINE double bool_distance_packed(const npy_uint64 *u,
+					      const npy_uint64 *v,
+					      int nwords, int n, int metric) {
   int i = 0;
-  int ntt = 0, nff = 0, nft = 0, ntf = 0;
-  for (i = 0; i < n; i++) {
-    ntt += (u[i] && v[i]);
-    ntf += (u[i] && !v[i]);
-    nft += (!u[i] && v[i]);
-    nff += (!u[i] && !v[i]);
+  int ntt = 0, ntf = 0, nft = 0, nff;
+  for (i = 0; i < nwords; i++) {
+    ntt += popcount64(u[i] & v[i]);
+    ntf += popcount64(u[i] & ~v[i]);
+    nft += popcount64(~u[i] & v[i]);
+  }
+  nff = n - ntt - ntf - nft;
+  switch (metric) {
+  case BOOL_HAMMING:
+  case BOOL_MATCHING:
+    return (double)(ntf + nft) / (double)n;
+  case BOOL_JACCARD:
+    return (double)(ntf + nft) / (double)(ntt + ntf + nft);
+  case BOOL_YULE:
+    return (2.0 * ntf * nft) / ((double)ntt * nff + (double)ntf * nft);
+  case BOOL_DICE:
+    return (double)(nft + ntf) / (double)(2.0 * ntt + ntf + nft);
+  case BOOL_ROGERSTANIMOTO:
+    return (2.0 * (ntf + nft)) / ((double)ntt + nff + (2.0 * (ntf + nft)));
+  case BOOL_RUSSELLRAO:
+    return (double)(n - ntt) / (double)n;
+  case BOOL_KULSINSKI:
+    return ((double)(ntf + nft - ntt + n)) / ((double)(ntf + nft + n));
+  case BOOL_SOKALSNEATH:
+    return (2.0 * (ntf + nft)) / (2.0 * (ntf + nft) + ntt);
+  default: /* BOOL_SOKALMICHENER */
+    return (2.0 * (ntf + nft)) / (2.0 * (ntf + nft) + ntt + nff);
   }
-  return (2.0 * (ntf + nft)) / ((double)ntt + nff + (2.0 * (ntf + nft)));
-}
-
-static NPY_INLINE double russellrao_distance_bool(const char *u, const char *v, int n) {
-  int i = 0;
-  /**  int nff = 0, nft = 0, ntf = 0;**/
-  int ntt = 0;
-  for (i = 0; i < n; i++) {
-    /**    nff += (!u[i] && !v[i]);
-    ntf += (u[i] && !v[i]);
-    nft += (!u[i] && v[i]);**/
-    ntt += (u[i] && v[i]);
-  }
-  /**  return (double)(ntf + nft + nff) / (double)n;**/
-  return (double) (n - ntt) / (double) n;
-}
-
-static NPY_INLINE double kulsinski_distance_bool(const char *u, const char *v, int n) {
-  int _i = 0;
-  int ntt = 0, nft = 0, ntf = 0, nff = 0;
-  for (_i = 0; _i < n; _i++) {
-    ntt += (u[_i] && v[_i]);
-    ntf += (u[_i] && !v[_i]);
-    nft += (!u[_i] && v[_i]);
-    nff += (!u[_i] && !v[_i]);
-  }
-  return ((double)(ntf + nft - ntt + n)) / ((double)(ntf + nft + n));
-}
-
-static NPY_INLINE double sokalsneath_distance_bool(const char *u, const char *v, int n) {
-  int _i = 0;
-  int ntt = 0, nft = 0, ntf = 0;
-  for (_i = 0; _i < n; _i++) {
-    ntt += (u[_i] && v[_i]);
-    ntf += (u[_i] && !v[_i]);
-    nft += (!u[_i] && v[_i]);
-  }
-  return (2.0 * (ntf + nft))/(2.0 * (ntf + nft) + ntt);
-}
-
-static NPY_INLINE double sokalmichener_distance_bool(const char *u, const char *v, int n) {
-  int _i = 0;
-  int ntt = 0, nft = 0, ntf = 0, nff = 0;
-  for (_i = 0; _i < n; _i++) {
-    ntt += (u[_i] && v[_i]);
-    nff += (!u[_i] && !v[_i]);
-    ntf += (u[_i] && !v[_i]);
-    nft += (!u[_i] && v[_i]);
-  }
-  return (2.0 * (ntf + nft))/(2.0 * (ntf + nft) + ntt + nff);
 }
 
 static NPY_INLINE double jaccard_distance(const double *u, const double *v, int n) {
@@ -243,16 +193,6 @@ static NPY_INLINE double jaccard_distance(const double *u, const double *v, int
   return num / denom;
 }
 
-static NPY_INLINE double jaccard_distance_bool(const char *u, const char *v, int n) {
-  int i = 0;
-  double num = 0.0, denom = 0.0;
-  for (i = 0; i < n; i++) {
-    num += (u[i] != v[i]) && ((u[i] != 0) || (v[i] != 0));
-    denom += (u[i] != 0) || (v[i] != 0);
-  }
-  return num / denom;
-}
-
 static NPY_INLINE double dot_product(const double *u, const double *v, int n) {
   int i;
   double s = 0.0;
@@ -326,11 +266,19 @@ void compute_mean_vector(double *res, const double *X, int m, int n) {
   }
 }
 
-void pdist_euclidean(const double *X, double *dm, int m, int n) {
+/**
+ * The offset in a condensed distance matrix of m observations of the
+ * distances between observation i and observations i + 1, ..., m - 1.
+ */
+static NPY_INLINE npy_intp pdist_row_offset(int i, int m) {
+  return (npy_intp)i * m - (npy_intp)i * (i + 1) / 2;
+}
+
+void pdist_euclidean(const double *X, double *dm, int m, int n, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -340,14 +288,15 @@ void pdist_euclidean(const double *X, double *dm, int m, int n) {
 }
 
 void pdist_mahalanobis(const double *X, const double *covinv,
-		       double *dm, int m, int n) {
+		       double *dm, int m, int n,
+		       int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
+  double *it = dm + pdist_row_offset(start, m);
   double *dimbuf1, *dimbuf2;
   dimbuf1 = (double*)malloc(sizeof(double) * 2 * n);
   dimbuf2 = dimbuf1 + n;
-  for (i = 0; i < m; i++) {
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -358,11 +307,11 @@ void pdist_mahalanobis(const double *X, const double *covinv,
   free(dimbuf1);
 }
 
-void pdist_bray_curtis(const double *X, double *dm, int m, int n) {
+void pdist_bray_curtis(const double *X, double *dm, int m, int n, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -371,11 +320,11 @@ void pdist_bray_curtis(const double *X, double *dm, int m, int n) {
   }
 }
 
-void pdist_canberra(const double *X, double *dm, int m, int n) {
+void pdist_canberra(const double *X, double *dm, int m, int n, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -384,11 +333,11 @@ void pdist_canberra(const double *X, double *dm, int m, int n) {
   }
 }
 
-void pdist_hamming(const double *X, double *dm, int m, int n) {
+void pdist_hamming(const double *X, double *dm, int m, int n, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -397,24 +346,11 @@ void pdist_hamming(const double *X, double *dm, int m, int n) {
   }
 }
 
-void pdist_hamming_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = hamming_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_jaccard(const double *X, double *dm, int m, int n) {
+void pdist_jaccard(const double *X, double *dm, int m, int n, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -423,25 +359,11 @@ void pdist_jaccard(const double *X, double *dm, int m, int n) {
   }
 }
 
-void pdist_jaccard_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = jaccard_distance_bool(u, v, n);
-    }
-  }
-}
-
-
-void pdist_chebyshev(const double *X, double *dm, int m, int n) {
+void pdist_chebyshev(const double *X, double *dm, int m, int n, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -450,11 +372,11 @@ void pdist_chebyshev(const double *X, double *dm, int m, int n) {
   }
 }
 
-void pdist_cosine(const double *X, double *dm, int m, int n, const double *norms) {
+void pdist_cosine(const double *X, double *dm, int m, int n, const double *norms, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -464,11 +386,12 @@ void pdist_cosine(const double *X, double *dm, int m, int n, const double *norms
 }
 
 void pdist_seuclidean(const double *X, const double *var,
-		     double *dm, int m, int n) {
+		     double *dm, int m, int n,
+		     int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -477,11 +400,11 @@ void pdist_seuclidean(const double *X, const double *var,
   }
 }
 
-void pdist_city_block(const double *X, double *dm, int m, int n) {
+void pdist_city_block(const double *X, double *dm, int m, int n, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -490,11 +413,11 @@ void pdist_city_block(const double *X, double *dm, int m, int n) {
   }
 }
 
-void pdist_minkowski(const double *X, double *dm, int m, int n, double p) {
+void pdist_minkowski(const double *X, double *dm, int m, int n, double p, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -503,11 +426,11 @@ void pdist_minkowski(const double *X, double *dm, int m, int n, double p) {
   }
 }
 
-void pdist_weighted_minkowski(const double *X, double *dm, int m, int n, double p, const double *w) {
+void pdist_weighted_minkowski(const double *X, double *dm, int m, int n, double p, const double *w, int start, int end) {
   int i, j;
   const double *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
       u = X + (n * i);
       v = X + (n * j);
@@ -516,106 +439,16 @@ void pdist_weighted_minkowski(const double *X, double *dm, int m, int n, double
   }
 }
 
-void pdist_yule_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = yule_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_matching_bool(const char *X, double *dm, int m, int n) {
+void pdist_bool_packed(const npy_uint64 *X, double *dm, int m, int nwords,
+		       int n, int metric, int start, int end) {
   int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = matching_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_dice_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = dice_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_rogerstanimoto_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
+  const npy_uint64 *u, *v;
+  double *it = dm + pdist_row_offset(start, m);
+  for (i = start; i < end; i++) {
     for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = rogerstanimoto_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_russellrao_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = russellrao_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_kulsinski_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = kulsinski_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_sokalsneath_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = sokalsneath_distance_bool(u, v, n);
-    }
-  }
-}
-
-void pdist_sokalmichener_bool(const char *X, double *dm, int m, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < m; i++) {
-    for (j = i + 1; j < m; j++, it++) {
-      u = X + (n * i);
-      v = X + (n * j);
-      *it = sokalmichener_distance_bool(u, v, n);
+      u = X + (nwords * i);
+      v = X + (nwords * j);
+      *it = bool_distance_packed(u, v, nwords, n, metric);
     }
   }
 }
@@ -726,20 +559,6 @@ void cdist_hamming(const double *XA,
   }
 }
 
-void cdist_hamming_bool(const char *XA,
-			const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = hamming_distance_bool(u, v, n);
-    }
-  }
-}
-
 void cdist_jaccard(const double *XA,
 		   const double *XB, double *dm, int mA, int mB, int n) {
   int i, j;
@@ -754,21 +573,6 @@ void cdist_jaccard(const double *XA,
   }
 }
 
-void cdist_jaccard_bool(const char *XA,
-			const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = jaccard_distance_bool(u, v, n);
-    }
-  }
-}
-
-
 void cdist_chebyshev(const double *XA,
 		     const double *XB, double *dm, int mA, int mB, int n) {
   int i, j;
@@ -853,106 +657,16 @@ void cdist_weighted_minkowski(const double *XA, const double *XB, double *dm, in
   }
 }
 
-void cdist_yule_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = yule_distance_bool(u, v, n);
-    }
-  }
-}
-
-void cdist_matching_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = matching_distance_bool(u, v, n);
-    }
-  }
-}
-
-void cdist_dice_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = dice_distance_bool(u, v, n);
-    }
-  }
-}
-
-void cdist_rogerstanimoto_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = rogerstanimoto_distance_bool(u, v, n);
-    }
-  }
-}
-
-void cdist_russellrao_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = russellrao_distance_bool(u, v, n);
-    }
-  }
-}
-
-void cdist_kulsinski_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = kulsinski_distance_bool(u, v, n);
-    }
-  }
-}
-
-void cdist_sokalsneath_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
+void cdist_bool_packed(const npy_uint64 *XA, const npy_uint64 *XB, double *dm,
+		       int mA, int mB, int nwords, int n, int metric) {
   int i, j;
-  const char *u, *v;
+  const npy_uint64 *u, *v;
   double *it = dm;
   for (i = 0; i < mA; i++) {
     for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = sokalsneath_distance_bool(u, v, n);
-    }
-  }
-}
-
-void cdist_sokalmichener_bool(const char *XA, const char *XB, double *dm, int mA, int mB, int n) {
-  int i, j;
-  const char *u, *v;
-  double *it = dm;
-  for (i = 0; i < mA; i++) {
-    for (j = 0; j < mB; j++, it++) {
-      u = XA + (n * i);
-      v = XB + (n * j);
-      *it = sokalmichener_distance_bool(u, v, n);
+      u = XA + (nwords * i);
+      v = XB + (nwords * j);
+      *it = bool_distance_packed(u, v, nwords, n, metric);
     }
   }
 }
@@ -37,32 +37,38 @@
 #ifndef _CPY_DISTANCE_H
 #define _CPY_DISTANCE_H
 
+/* the boolean dissimilarities of pdist_bool_packed and cdist_bool_packed */
+enum {
+  BOOL_HAMMING = 0,
+  BOOL_JACCARD,
+  BOOL_YULE,
+  BOOL_MATCHING,
+  BOOL_DICE,
+  BOOL_ROGERSTANIMOTO,
+  BOOL_RUSSELLRAO,
+  BOOL_KULSINSKI,
+  BOOL_SOKALSNEATH,
+  BOOL_SOKALMICHENER
+};
+
 void dist_to_squareform_from_vector(double *M, const double *v, int n);
 void dist_to_vector_from_squareform(const double *M, double *v, int n);
-void pdist_euclidean(const double *X, double *dm, int m, int n);
+void pdist_euclidean(const double *X, double *dm, int m, int n, int start, int end);
 void pdist_seuclidean(const double *X,
-		      const double *var, double *dm, int m, int n);
+		      const double *var, double *dm, int m, int n, int start, int end);
 void pdist_mahalanobis(const double *X, const double *covinv,
-		       double *dm, int m, int n);
-void pdist_bray_curtis(const double *X, double *dm, int m, int n);
-void pdist_canberra(const double *X, double *dm, int m, int n);
-void pdist_hamming(const double *X, double *dm, int m, int n);
-void pdist_hamming_bool(const char *X, double *dm, int m, int n);
-void pdist_city_block(const double *X, double *dm, int m, int n);
-void pdist_cosine(const double *X, double *dm, int m, int n, const double *norms);
-void pdist_chebyshev(const double *X, double *dm, int m, int n);
-void pdist_jaccard(const double *X, double *dm, int m, int n);
-void pdist_jaccard_bool(const char *X, double *dm, int m, int n);
-void pdist_kulsinski_bool(const char *X, double *dm, int m, int n);
-void pdist_minkowski(const double *X, double *dm, int m, int n, double p);
-void pdist_weighted_minkowski(const double *X, double *dm, int m, int n, double p, const double *w);
-void pdist_yule_bool(const char *X, double *dm, int m, int n);
-void pdist_matching_bool(const char *X, double *dm, int m, int n);
-void pdist_dice_bool(const char *X, double *dm, int m, int n);
-void pdist_rogerstanimoto_bool(const char *X, double *dm, int m, int n);
-void pdist_russellrao_bool(const char *X, double *dm, int m, int n);
-void pdist_sokalmichener_bool(const char *X, double *dm, int m, int n);
-void pdist_sokalsneath_bool(const char *X, double *dm, int m, int n);
+		       double *dm, int m, int n, int start, int end);
+void pdist_bray_curtis(const double *X, double *dm, int m, int n, int start, int end);
+void pdist_canberra(const double *X, double *dm, int m, int n, int start, int end);
+void pdist_hamming(const double *X, double *dm, int m, int n, int start, int end);
+void pdist_city_block(const double *X, double *dm, int m, int n, int start, int end);
+void pdist_cosine(const double *X, double *dm, int m, int n, const double *norms, int start, int end);
+void pdist_chebyshev(const double *X, double *dm, int m, int n, int start, int end);
+void pdist_jaccard(const double *X, double *dm, int m, int n, int start, int end);
+void pdist_minkowski(const double *X, double *dm, int m, int n, double p, int start, int end);
+void pdist_weighted_minkowski(const double *X, double *dm, int m, int n, double p, const double *w, int start, int end);
+void pdist_bool_packed(const npy_uint64 *X, double *dm, int m, int nwords,
+		       int n, int metric, int start, int end);
 
 void cdist_euclidean(const double *XA, const double *XB, double *dm, int mA, int mB, int n);
 void cdist_mahalanobis(const double *XA, const double *XB,
@@ -74,13 +80,8 @@ void cdist_canberra(const double *XA,
 		    const double *XB, double *dm, int mA, int mB, int n);
 void cdist_hamming(const double *XA,
 		   const double *XB, double *dm, int mA, int mB, int n);
-void cdist_hamming_bool(const char *XA,
-			const char *XB, double *dm,
-			int mA, int mB, int n);
 void cdist_jaccard(const double *XA,
 		   const double *XB, double *dm, int mA, int mB, int n);
-void cdist_jaccard_bool(const char *XA,
-			const char *XB, double *dm, int mA, int mB, int n);
 void cdist_chebyshev(const double *XA,
 		     const double *XB, double *dm, int mA, int mB, int n);
 void cdist_cosine(const double *XA,
@@ -96,21 +97,7 @@ void cdist_minkowski(const double *XA, const double *XB, double *dm,
 		     int mA, int mB, int n, double p);
 void cdist_weighted_minkowski(const double *XA, const double *XB, double *dm,
 			      int mA, int mB, int n, double p, const double *w);
-void cdist_yule_bool(const char *XA, const char *XB, double *dm,
-		     int mA, int mB, int n);
-void cdist_matching_bool(const char *XA, const char *XB, double *dm,
-			 int mA, int mB, int n);
-void cdist_dice_bool(const char *XA, const char *XB, double *dm,
-		     int mA, int mB, int n);
-void cdist_rogerstanimoto_bool(const char *XA, const char *XB, double *dm,
-			       int mA, int mB, int n);
-void cdist_russellrao_bool(const char *XA, const char *XB, double *dm,
-			   int mA, int mB, int n);
-void cdist_kulsinski_bool(const char *XA, const char *XB, double *dm,
-			  int mA, int mB, int n);
-void cdist_sokalsneath_bool(const char *XA, const char *XB, double *dm,
-			    int mA, int mB, int n);
-void cdist_sokalmichener_bool(const char *XA, const char *XB, double *dm,
-			      int mA, int mB, int n);
+void cdist_bool_packed(const npy_uint64 *XA, const npy_uint64 *XB, double *dm,
+		       int mA, int mB, int nwords, int n, int metric);
 
 #endif
@@ -35,19 +35,21 @@
  */
 
 #include <math.h>
-#include "distance.h"
 #include "Python.h"
 #include <numpy/arrayobject.h>
 #include <stdio.h>
+#include "distance.h"
 
 extern PyObject *cdist_euclidean_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -58,7 +60,17 @@ extern PyObject *cdist_euclidean_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_euclidean(XA, XB, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_euclidean(XA + (npy_intp)start * n, XB,
+                    dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -66,11 +78,13 @@ extern PyObject *cdist_euclidean_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_canberra_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -81,7 +95,17 @@ extern PyObject *cdist_canberra_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_canberra(XA, XB, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_canberra(XA + (npy_intp)start * n, XB,
+                   dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -89,11 +113,13 @@ extern PyObject *cdist_canberra_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -104,7 +130,17 @@ extern PyObject *cdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_bray_curtis(XA, XB, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_bray_curtis(XA + (npy_intp)start * n, XB,
+                      dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -113,13 +149,15 @@ extern PyObject *cdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *covinv_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
   const double *covinv;
-  if (!PyArg_ParseTuple(args, "O!O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
 			&PyArray_Type, &covinv_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -131,7 +169,17 @@ extern PyObject *cdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_mahalanobis(XA, XB, covinv, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_mahalanobis(XA + (npy_intp)start * n, XB, covinv,
+                      dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -140,11 +188,13 @@ extern PyObject *cdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_chebyshev_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -155,7 +205,17 @@ extern PyObject *cdist_chebyshev_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_chebyshev(XA, XB, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_chebyshev(XA + (npy_intp)start * n, XB,
+                    dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -164,13 +224,15 @@ extern PyObject *cdist_chebyshev_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_cosine_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_, *normsA_, *normsB_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB, *normsA, *normsB;
-  if (!PyArg_ParseTuple(args, "O!O!O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
 			&PyArray_Type, &dm_,
 			&PyArray_Type, &normsA_,
-			&PyArray_Type, &normsB_)) {
+			&PyArray_Type, &normsB_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -183,7 +245,18 @@ extern PyObject *cdist_cosine_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_cosine(XA, XB, dm, mA, mB, n, normsA, normsB);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_cosine(XA + (npy_intp)start * n, XB,
+                 dm + (npy_intp)start * mB, end - start, mB, n,
+                 normsA + start, normsB);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -191,12 +264,14 @@ extern PyObject *cdist_cosine_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_seuclidean_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_, *var_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB, *var;
-  if (!PyArg_ParseTuple(args, "O!O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
 			&PyArray_Type, &var_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -208,7 +283,17 @@ extern PyObject *cdist_seuclidean_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_seuclidean(XA, XB, var, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_seuclidean(XA + (npy_intp)start * n, XB, var,
+                     dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -216,11 +301,13 @@ extern PyObject *cdist_seuclidean_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_city_block_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -231,7 +318,17 @@ extern PyObject *cdist_city_block_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_city_block(XA, XB, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_city_block(XA + (npy_intp)start * n, XB,
+                     dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -239,11 +336,13 @@ extern PyObject *cdist_city_block_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_hamming_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -254,30 +353,17 @@ extern PyObject *cdist_hamming_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_hamming(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("d", 0.0);
-}
-
-extern PyObject *cdist_hamming_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_hamming_bool(XA, XB, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_hamming(XA + (npy_intp)start * n, XB,
+                  dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -285,11 +371,13 @@ extern PyObject *cdist_hamming_bool_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_jaccard_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -300,30 +388,17 @@ extern PyObject *cdist_jaccard_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
-    cdist_jaccard(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("d", 0.0);
-}
-
-extern PyObject *cdist_jaccard_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_jaccard_bool(XA, XB, dm, mA, mB, n);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_jaccard(XA + (npy_intp)start * n, XB,
+                  dm + (npy_intp)start * mB, end - start, mB, n);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -331,13 +406,15 @@ extern PyObject *cdist_jaccard_bool_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_minkowski_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB;
   double p;
-  if (!PyArg_ParseTuple(args, "O!O!O!d",
+  if (!PyArg_ParseTuple(args, "O!O!O!d|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
 			&PyArray_Type, &dm_,
-			&p)) {
+			&p,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -347,7 +424,17 @@ extern PyObject *cdist_minkowski_wrap(PyObject *self, PyObject *args) {
     mA = XA_->dimensions[0];
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
-    cdist_minkowski(XA, XB, dm, mA, mB, n, p);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_minkowski(XA + (npy_intp)start * n, XB,
+                    dm + (npy_intp)start * mB, end - start, mB, n, p);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -355,14 +442,16 @@ extern PyObject *cdist_minkowski_wrap(PyObject *self, PyObject *args) {
 extern PyObject *cdist_weighted_minkowski_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_, *w_;
   int mA, mB, n;
+  int start = 0, end = -1;
   double *dm;
   const double *XA, *XB, *w;
   double p;
-  if (!PyArg_ParseTuple(args, "O!O!O!dO!",
+  if (!PyArg_ParseTuple(args, "O!O!O!dO!|ii",
 			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
 			&PyArray_Type, &dm_,
 			&p,
-			&PyArray_Type, &w_)) {
+			&PyArray_Type, &w_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -373,191 +462,55 @@ extern PyObject *cdist_weighted_minkowski_wrap(PyObject *self, PyObject *args) {
     mA = XA_->dimensions[0];
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
-    cdist_weighted_minkowski(XA, XB, dm, mA, mB, n, p, w);
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_weighted_minkowski(XA + (npy_intp)start * n, XB,
+                             dm + (npy_intp)start * mB, end - start, mB, n,
+                             p, w);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
 
-extern PyObject *cdist_yule_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_yule_bool(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *cdist_matching_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_matching_bool(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *cdist_dice_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_dice_bool(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *cdist_rogerstanimoto_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_rogerstanimoto_bool(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *cdist_russellrao_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_russellrao_bool(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *cdist_kulsinski_bool_wrap(PyObject *self, PyObject *args) {
+extern PyObject *cdist_bool_packed_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
+  int mA, mB, nwords, n, metric;
+  int start = 0, end = -1;
   double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_kulsinski_bool(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *cdist_sokalmichener_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
-    dm = (double*)dm_->data;
-    mA = XA_->dimensions[0];
-    mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_sokalmichener_bool(XA, XB, dm, mA, mB, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *cdist_sokalsneath_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *XA_, *XB_, *dm_;
-  int mA, mB, n;
-  double *dm;
-  const char *XA, *XB;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
-			&PyArray_Type, &XA_, &PyArray_Type, &XB_, 
-			&PyArray_Type, &dm_)) {
+  const npy_uint64 *XA, *XB;
+  if (!PyArg_ParseTuple(args, "O!O!O!ii|ii",
+			&PyArray_Type, &XA_, &PyArray_Type, &XB_,
+			&PyArray_Type, &dm_,
+			&n, &metric,
+			&start, &end)) {
     return 0;
   }
   else {
-    XA = (const char*)XA_->data;
-    XB = (const char*)XB_->data;
+    XA = (const npy_uint64*)XA_->data;
+    XB = (const npy_uint64*)XB_->data;
     dm = (double*)dm_->data;
     mA = XA_->dimensions[0];
     mB = XB_->dimensions[0];
-    n = XA_->dimensions[1];
-
-    cdist_sokalsneath_bool(XA, XB, dm, mA, mB, n);
+    nwords = XA_->dimensions[1];
+
+    if (end < 0) {
+      end = mA;
+    }
+    if (start < 0 || start > end || end > mA) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    cdist_bool_packed(XA + (npy_intp)start * nwords, XB,
+                      dm + (npy_intp)start * mB, end - start, mB, nwords,
+                      n, metric);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("");
 }
@@ -567,11 +520,13 @@ extern PyObject *cdist_sokalsneath_bool_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_euclidean_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -580,7 +535,16 @@ extern PyObject *pdist_euclidean_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_euclidean(X, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_euclidean(X, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -588,11 +552,13 @@ extern PyObject *pdist_euclidean_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_canberra_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -601,7 +567,16 @@ extern PyObject *pdist_canberra_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_canberra(X, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_canberra(X, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -609,11 +584,13 @@ extern PyObject *pdist_canberra_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -622,7 +599,16 @@ extern PyObject *pdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_bray_curtis(X, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_bray_curtis(X, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -631,13 +617,15 @@ extern PyObject *pdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *covinv_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
   const double *covinv;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &X_,
 			&PyArray_Type, &covinv_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -647,7 +635,16 @@ extern PyObject *pdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_mahalanobis(X, covinv, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_mahalanobis(X, covinv, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -656,11 +653,13 @@ extern PyObject *pdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_chebyshev_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -669,7 +668,16 @@ extern PyObject *pdist_chebyshev_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_chebyshev(X, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_chebyshev(X, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -678,12 +686,14 @@ extern PyObject *pdist_chebyshev_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_cosine_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_, *norms_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X, *norms;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &X_,
 			&PyArray_Type, &dm_,
-			&PyArray_Type, &norms_)) {
+			&PyArray_Type, &norms_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -693,7 +703,16 @@ extern PyObject *pdist_cosine_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_cosine(X, dm, m, n, norms);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_cosine(X, dm, m, n, norms, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -701,12 +720,14 @@ extern PyObject *pdist_cosine_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_seuclidean_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_, *var_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X, *var;
-  if (!PyArg_ParseTuple(args, "O!O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!O!|ii",
 			&PyArray_Type, &X_,
 			&PyArray_Type, &var_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -716,7 +737,16 @@ extern PyObject *pdist_seuclidean_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_seuclidean(X, var, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_seuclidean(X, var, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -724,11 +754,13 @@ extern PyObject *pdist_seuclidean_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_city_block_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -737,7 +769,16 @@ extern PyObject *pdist_city_block_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_city_block(X, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_city_block(X, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -745,11 +786,13 @@ extern PyObject *pdist_city_block_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_hamming_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -758,28 +801,16 @@ extern PyObject *pdist_hamming_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_hamming(X, dm, m, n);
-  }
-  return Py_BuildValue("d", 0.0);
-}
-
-extern PyObject *pdist_hamming_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_hamming_bool(X, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_hamming(X, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -787,11 +818,13 @@ extern PyObject *pdist_hamming_bool_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_jaccard_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm;
   const double *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  if (!PyArg_ParseTuple(args, "O!O!|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -800,28 +833,16 @@ extern PyObject *pdist_jaccard_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_jaccard(X, dm, m, n);
-  }
-  return Py_BuildValue("d", 0.0);
-}
-
-extern PyObject *pdist_jaccard_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_jaccard_bool(X, dm, m, n);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_jaccard(X, dm, m, n, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -829,12 +850,14 @@ extern PyObject *pdist_jaccard_bool_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_minkowski_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
   int m, n;
+  int start = 0, end = -1;
   double *dm, *X;
   double p;
-  if (!PyArg_ParseTuple(args, "O!O!d",
+  if (!PyArg_ParseTuple(args, "O!O!d|ii",
 			&PyArray_Type, &X_,
 			&PyArray_Type, &dm_,
-			&p)) {
+			&p,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -843,7 +866,16 @@ extern PyObject *pdist_minkowski_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_minkowski(X, dm, m, n, p);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_minkowski(X, dm, m, n, p, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -851,13 +883,15 @@ extern PyObject *pdist_minkowski_wrap(PyObject *self, PyObject *args) {
 extern PyObject *pdist_weighted_minkowski_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_, *w_;
   int m, n;
+  int start = 0, end = -1;
   double *dm, *X, *w;
   double p;
-  if (!PyArg_ParseTuple(args, "O!O!dO!",
+  if (!PyArg_ParseTuple(args, "O!O!dO!|ii",
 			&PyArray_Type, &X_,
 			&PyArray_Type, &dm_,
 			&p,
-			&PyArray_Type, &w_)) {
+			&PyArray_Type, &w_,
+			&start, &end)) {
     return 0;
   }
   else {
@@ -867,176 +901,50 @@ extern PyObject *pdist_weighted_minkowski_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
-    pdist_weighted_minkowski(X, dm, m, n, p, w);
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_weighted_minkowski(X, dm, m, n, p, w, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("d", 0.0);
 }
 
 
-extern PyObject *pdist_yule_bool_wrap(PyObject *self, PyObject *args) {
+extern PyObject *pdist_bool_packed_wrap(PyObject *self, PyObject *args) {
   PyArrayObject *X_, *dm_;
-  int m, n;
+  int m, nwords, n, metric;
+  int start = 0, end = -1;
   double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
+  const npy_uint64 *X;
+  if (!PyArg_ParseTuple(args, "O!O!ii|ii",
 			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_yule_bool(X, dm, m, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *pdist_matching_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_matching_bool(X, dm, m, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *pdist_dice_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_dice_bool(X, dm, m, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *pdist_rogerstanimoto_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_rogerstanimoto_bool(X, dm, m, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *pdist_russellrao_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_russellrao_bool(X, dm, m, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *pdist_kulsinski_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_kulsinski_bool(X, dm, m, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *pdist_sokalmichener_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
-    return 0;
-  }
-  else {
-    X = (const char*)X_->data;
-    dm = (double*)dm_->data;
-    m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_sokalmichener_bool(X, dm, m, n);
-  }
-  return Py_BuildValue("");
-}
-
-extern PyObject *pdist_sokalsneath_bool_wrap(PyObject *self, PyObject *args) {
-  PyArrayObject *X_, *dm_;
-  int m, n;
-  double *dm;
-  const char *X;
-  if (!PyArg_ParseTuple(args, "O!O!",
-			&PyArray_Type, &X_,
-			&PyArray_Type, &dm_)) {
+			&PyArray_Type, &dm_,
+			&n, &metric,
+			&start, &end)) {
     return 0;
   }
   else {
-    X = (const char*)X_->data;
+    X = (const npy_uint64*)X_->data;
     dm = (double*)dm_->data;
     m = X_->dimensions[0];
-    n = X_->dimensions[1];
-
-    pdist_sokalsneath_bool(X, dm, m, n);
+    nwords = X_->dimensions[1];
+
+    if (end < 0) {
+      end = m;
+    }
+    if (start < 0 || start > end || end > m) {
+      PyErr_SetString(PyExc_ValueError, "invalid range of rows");
+      return 0;
+    }
+    NPY_BEGIN_ALLOW_THREADS;
+    pdist_bool_packed(X, dm, m, nwords, n, metric, start, end);
+    NPY_END_ALLOW_THREADS;
   }
   return Py_BuildValue("");
 }
@@ -1081,50 +989,32 @@ extern PyObject *to_vector_from_squareform_wrap(PyObject *self, PyObject *args)
 
 
 static PyMethodDef _distanceWrapMethods[] = {
+  {"cdist_bool_packed_wrap", cdist_bool_packed_wrap, METH_VARARGS},
   {"cdist_bray_curtis_wrap", cdist_bray_curtis_wrap, METH_VARARGS},
   {"cdist_canberra_wrap", cdist_canberra_wrap, METH_VARARGS},
   {"cdist_chebyshev_wrap", cdist_chebyshev_wrap, METH_VARARGS},
   {"cdist_city_block_wrap", cdist_city_block_wrap, METH_VARARGS},
   {"cdist_cosine_wrap", cdist_cosine_wrap, METH_VARARGS},
-  {"cdist_dice_bool_wrap", cdist_dice_bool_wrap, METH_VARARGS},
   {"cdist_euclidean_wrap", cdist_euclidean_wrap, METH_VARARGS},
   {"cdist_hamming_wrap", cdist_hamming_wrap, METH_VARARGS},
-  {"cdist_hamming_bool_wrap", cdist_hamming_bool_wrap, METH_VARARGS},
   {"cdist_jaccard_wrap", cdist_jaccard_wrap, METH_VARARGS},
-  {"cdist_jaccard_bool_wrap", cdist_jaccard_bool_wrap, METH_VARARGS},
-  {"cdist_kulsinski_bool_wrap", cdist_kulsinski_bool_wrap, METH_VARARGS},
   {"cdist_mahalanobis_wrap", cdist_mahalanobis_wrap, METH_VARARGS},
-  {"cdist_matching_bool_wrap", cdist_matching_bool_wrap, METH_VARARGS},
   {"cdist_minkowski_wrap", cdist_minkowski_wrap, METH_VARARGS},
   {"cdist_weighted_minkowski_wrap", cdist_weighted_minkowski_wrap, METH_VARARGS},
-  {"cdist_rogerstanimoto_bool_wrap", cdist_rogerstanimoto_bool_wrap, METH_VARARGS},
-  {"cdist_russellrao_bool_wrap", cdist_russellrao_bool_wrap, METH_VARARGS},
   {"cdist_seuclidean_wrap", cdist_seuclidean_wrap, METH_VARARGS},
-  {"cdist_sokalmichener_bool_wrap", cdist_sokalmichener_bool_wrap, METH_VARARGS},
-  {"cdist_sokalsneath_bool_wrap", cdist_sokalsneath_bool_wrap, METH_VARARGS},
-  {"cdist_yule_bool_wrap", cdist_yule_bool_wrap, METH_VARARGS},
+  {"pdist_bool_packed_wrap", pdist_bool_packed_wrap, METH_VARARGS},
   {"pdist_bray_curtis_wrap", pdist_bray_curtis_wrap, METH_VARARGS},
   {"pdist_canberra_wrap", pdist_canberra_wrap, METH_VARARGS},
   {"pdist_chebyshev_wrap", pdist_chebyshev_wrap, METH_VARARGS},
   {"pdist_city_block_wrap", pdist_city_block_wrap, METH_VARARGS},
   {"pdist_cosine_wrap", pdist_cosine_wrap, METH_VARARGS},
-  {"pdist_dice_bool_wrap", pdist_dice_bool_wrap, METH_VARARGS},
   {"pdist_euclidean_wrap", pdist_euclidean_wrap, METH_VARARGS},
   {"pdist_hamming_wrap", pdist_hamming_wrap, METH_VARARGS},
-  {"pdist_hamming_bool_wrap", pdist_hamming_bool_wrap, METH_VARARGS},
   {"pdist_jaccard_wrap", pdist_jaccard_wrap, METH_VARARGS},
-  {"pdist_jaccard_bool_wrap", pdist_jaccard_bool_wrap, METH_VARARGS},
-  {"pdist_kulsinski_bool_wrap", pdist_kulsinski_bool_wrap, METH_VARARGS},
   {"pdist_mahalanobis_wrap", pdist_mahalanobis_wrap, METH_VARARGS},
-  {"pdist_matching_bool_wrap", pdist_matching_bool_wrap, METH_VARARGS},
   {"pdist_minkowski_wrap", pdist_minkowski_wrap, METH_VARARGS},
   {"pdist_weighted_minkowski_wrap", pdist_weighted_minkowski_wrap, METH_VARARGS},
-  {"pdist_rogerstanimoto_bool_wrap", pdist_rogerstanimoto_bool_wrap, METH_VARARGS},
-  {"pdist_russellrao_bool_wrap", pdist_russellrao_bool_wrap, METH_VARARGS},
   {"pdist_seuclidean_wrap", pdist_seuclidean_wrap, METH_VARARGS},
-  {"pdist_sokalmichener_bool_wrap", pdist_sokalmichener_bool_wrap, METH_VARARGS},
-  {"pdist_sokalsneath_bool_wrap", pdist_sokalsneath_bool_wrap, METH_VARARGS},
-  {"pdist_yule_bool_wrap", pdist_yule_bool_wrap, METH_VARARGS},
   {"to_squareform_from_vector_wrap",
    to_squareform_from_vector_wrap, METH_VARARGS},
   {"to_vector_from_squareform_wrap",
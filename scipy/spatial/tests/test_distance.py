@@ -41,11 +41,13 @@ from numpy.linalg import norm
 from numpy.testing import verbose, TestCase, run_module_suite, \
         assert_raises, assert_array_equal, assert_equal, assert_almost_equal
 
-from scipy.spatial.distance import squareform, pdist, cdist, matching, \
+from scipy.spatial.distance import squareform, pdist, cdist, cdist_chunks, \
+        matching, \
         jaccard, dice, sokalsneath, rogerstanimoto, russellrao, yule, \
         num_obs_y, num_obs_dm, is_valid_dm, is_valid_y, minkowski, wminkowski, \
         euclidean, sqeuclidean, cosine, correlation, mahalanobis, \
-        canberra, braycurtis, sokalmichener, _validate_vector
+        canberra, braycurtis, sokalmichener, cityblock, _validate_vector, \
+        _threaded_wrap
 
 
 _filenames = ["iris.txt",
@@ -461,6 +463,85 @@ class TestCdist(TestCase):
             print (Y1-Y2).max()
         self.assertTrue(within_tol(Y1, Y2, eps))
 
+    def test_cdist_out(self):
+        "Tests cdist(XA, XB, metric, out=...) for all kinds of metrics."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'sqeuclidean', 'cosine', 'seuclidean',
+                       'mahalanobis', 'jaccard', 'test_cityblock',
+                       cityblock]:
+            Y1 = cdist(X1, X2, metric)
+            out = np.empty((X1.shape[0], X2.shape[0]))
+            Y2 = cdist(X1, X2, metric, out=out)
+            self.assertTrue(Y2 is out)
+            assert_array_equal(Y1, Y2)
+
+    def test_cdist_out_invalid(self):
+        "Tests cdist(XA, XB, out=...) with unsuitable out arrays."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        shape = (X1.shape[0], X2.shape[0])
+        assert_raises(ValueError, cdist, X1, X2, out=np.empty(shape[::-1]))
+        assert_raises(TypeError, cdist, X1, X2,
+                      out=np.empty(shape, dtype=np.float32))
+        assert_raises(ValueError, cdist, X1, X2,
+                      out=np.empty(shape, order='F'))
+
+    def test_cdist_chunks(self):
+        "Tests that the blocks from cdist_chunks make up the cdist matrix."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'seuclidean', 'mahalanobis', cityblock]:
+            Y1 = cdist(X1, X2, metric)
+            for chunk_rows in [1, 3, X1.shape[0], 100, None]:
+                blocks = list(cdist_chunks(X1, X2, metric,
+                                           chunk_rows=chunk_rows))
+                if chunk_rows is not None:
+                    assert_equal(len(blocks[0]),
+                                 min(chunk_rows, X1.shape[0]))
+                assert_almost_equal(np.vstack(blocks), Y1)
+        blocks = cdist_chunks(X1, X2, 'minkowski', chunk_rows=4, p=3.2)
+        assert_almost_equal(np.vstack(list(blocks)),
+                            cdist(X1, X2, 'minkowski', p=3.2))
+        assert_raises(ValueError, list, cdist_chunks(X1, X2, chunk_rows=0))
+
+    def test_cdist_workers(self):
+        "Tests that cdist(XA, XB, metric, workers=...) matches one thread."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'cosine', 'correlation', 'seuclidean',
+                       'mahalanobis', 'minkowski', 'yule', 'hamming']:
+            Y1 = cdist(X1, X2, metric)
+            for workers in [2, 3, 100, -1]:
+                Y2 = cdist(X1, X2, metric, workers=workers)
+                assert_array_equal(Y1, Y2)
+        assert_raises(ValueError, cdist, X1, X2, workers=0)
+
+    def test_workers_error(self):
+        "Tests that an error raised in a worker thread is not lost."
+        wrap = _threaded_wrap(10, 2)
+        assert_raises(TypeError, wrap.cdist_euclidean_wrap, None, None, None)
+
+    def test_cdist_gemm(self):
+        "Tests cdist(XA, XB, metric, method='gemm') against 'direct'."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'sqeuclidean', 'cosine', 'correlation']:
+            Y1 = cdist(X1, X2, metric)
+            Y2 = cdist(X1, X2, metric, method='gemm')
+            assert_almost_equal(Y1, Y2, decimal=10)
+            out = np.empty_like(Y1)
+            Y2 = cdist(X1, X2, metric, method='gemm', out=out)
+            self.assertTrue(Y2 is out)
+            assert_almost_equal(Y1, Y2, decimal=10)
+        # rounding errors must not give negative or nan distances
+        Y = cdist(X1, X1, 'euclidean', method='gemm')
+        self.assertTrue(np.all(Y >= 0))
+        assert_almost_equal(np.diag(Y), 0, decimal=6)
+        assert_raises(ValueError, cdist, X1, X2, 'cityblock', method='gemm')
+        assert_raises(ValueError, cdist, X1, X2, euclidean, method='gemm')
+        assert_raises(ValueError, cdist, X1, X2, method='blas')
+
 
 class TestPdist(TestCase):
     """
@@ -1401,6 +1482,50 @@ class TestPdist(TestCase):
             print np.abs(pdist_y-right_y).max()
         self.assertTrue(within_tol(pdist_y, right_y, eps))
 
+    def test_pdist_out(self):
+        "Tests pdist(X, metric, out=...) for all kinds of metrics."
+        X = eo['pdist-double-inp']
+        m = X.shape[0]
+        for metric in ['euclidean', 'sqeuclidean', 'correlation', 'seuclidean', 'yule',
+                       'old_cosine', 'test_cityblock', cityblock]:
+            Y1 = pdist(X, metric)
+            out = np.empty(m * (m - 1) // 2)
+            Y2 = pdist(X, metric, out=out)
+            self.assertTrue(Y2 is out)
+            assert_array_equal(Y1, Y2)
+        assert_raises(ValueError, pdist, X, out=np.empty(m * (m - 1)))
+        assert_raises(ValueError, pdist, X,
+                      out=np.empty(m * (m - 1))[::2])
+
+    def test_pdist_workers(self):
+        "Tests that pdist(X, metric, workers=...) matches one thread."
+        X = eo['pdist-double-inp']
+        for metric in ['euclidean', 'cosine', 'correlation', 'seuclidean',
+                       'mahalanobis', 'minkowski', 'jaccard', 'dice']:
+            Y1 = pdist(X, metric)
+            for workers in [2, 3, 7, -1]:
+                Y2 = pdist(X, metric, workers=workers)
+                assert_array_equal(Y1, Y2)
+        assert_array_equal(pdist(X[:3], workers=10), pdist(X[:3]))
+        assert_raises(ValueError, pdist, X, workers=0)
+
+    def test_pdist_bool_packed(self):
+        "Tests the bit-packed boolean metrics against the Python versions."
+        np.random.seed(1234)
+        # more bits than fit into one or two 64-bit words
+        X = np.random.rand(20, 150) < 0.3
+        for metric in ['hamming', 'jaccard', 'yule', 'matching', 'dice',
+                       'kulsinski', 'rogerstanimoto', 'russellrao',
+                       'sokalmichener', 'sokalsneath']:
+            Y1 = pdist(X, metric)
+            Y2 = pdist(X, 'test_' + metric)
+            assert_almost_equal(Y1, Y2, decimal=12)
+            assert_almost_equal(pdist(X, metric, workers=3), Y1)
+            assert_almost_equal(pdist(X.astype(np.double), metric), Y1)
+            Y1 = cdist(X[:7], X[5:], metric)
+            Y2 = cdist(X[:7], X[5:], 'test_' + metric)
+            assert_almost_equal(Y1, Y2, decimal=12)
+
 
 def within_tol(a, b, tol):
     return np.abs(a - b).max() < tol
@@ -2,7 +2,7 @@
 # Released under the scipy license
 
 from numpy.testing import assert_equal, assert_array_equal, assert_almost_equal, \
-        assert_, run_module_suite
+        assert_array_almost_equal, assert_, assert_raises, run_module_suite
 
 import numpy as np
 from scipy.spatial import KDTree, Rectangle, distance_matrix, cKDTree
@@ -137,6 +137,19 @@ class test_random_far_compiled(test_random_far):
     def setUp(self):
         test_random_far.setUp(self)
         self.kdtree = cKDTree(self.data)
+class test_random_balanced_compiled(test_random):
+    def setUp(self):
+        test_random.setUp(self)
+        self.kdtree = cKDTree(self.data,leafsize=2,balanced_tree=True)
+class test_random_compact_compiled(test_random):
+    def setUp(self):
+        test_random.setUp(self)
+        self.kdtree = cKDTree(self.data,leafsize=2,compact_nodes=True)
+class test_small_balanced_compact_compiled(test_small):
+    def setUp(self):
+        test_small.setUp(self)
+        self.kdtree = cKDTree(self.data,leafsize=1,balanced_tree=True,
+                              compact_nodes=True)
 
 class test_vectorization:
     def setUp(self):
@@ -287,6 +300,43 @@ class test_random_ball_linf(test_random_ball):
         test_random_ball.setUp(self)
         self.p = np.inf
 
+class test_random_ball_compiled(test_random_ball):
+
+    def setUp(self):
+        test_random_ball.setUp(self)
+        self.T = cKDTree(self.data,leafsize=2)
+
+class test_random_ball_approx_compiled(test_random_ball_approx):
+
+    def setUp(self):
+        test_random_ball_approx.setUp(self)
+        self.T = cKDTree(self.data,leafsize=2)
+
+class test_random_ball_far_compiled(test_random_ball_far):
+
+    def setUp(self):
+        test_random_ball_far.setUp(self)
+        self.T = cKDTree(self.data,leafsize=2)
+
+class test_random_ball_l1_compiled(test_random_ball_l1):
+
+    def setUp(self):
+        test_random_ball_l1.setUp(self)
+        self.T = cKDTree(self.data,leafsize=2)
+
+class test_random_ball_linf_compiled(test_random_ball_linf):
+
+    def setUp(self):
+        test_random_ball_linf.setUp(self)
+        self.T = cKDTree(self.data,leafsize=2)
+
+class test_random_ball_balanced_compiled(test_random_ball):
+
+    def setUp(self):
+        test_random_ball.setUp(self)
+        self.T = cKDTree(self.data,leafsize=2,balanced_tree=True,
+                         compact_nodes=True)
+
 def test_random_ball_vectorized():
 
     n = 20
@@ -297,6 +347,16 @@ def test_random_ball_vectorized():
     assert_equal(r.shape,(2,3))
     assert_(isinstance(r[0,0],list))
 
+def test_random_ball_vectorized_compiled():
+
+    n = 20
+    m = 5
+    T = cKDTree(np.random.randn(n,m))
+
+    r = T.query_ball_point(np.random.randn(2,3,m),1)
+    assert_equal(r.shape,(2,3))
+    assert_(isinstance(r[0,0],list))
+
 class two_trees_consistency:
 
     def test_all_in_ball(self):
@@ -336,6 +396,27 @@ class test_two_random_trees_linf(test_two_random_trees):
         test_two_random_trees.setUp(self)
         self.p = np.inf
 
+class test_two_random_trees_compiled(test_two_random_trees):
+
+    def setUp(self):
+        test_two_random_trees.setUp(self)
+        self.T1 = cKDTree(self.data1,leafsize=2)
+        self.T2 = cKDTree(self.data2,leafsize=2)
+
+class test_two_random_trees_far_compiled(test_two_random_trees_far):
+
+    def setUp(self):
+        test_two_random_trees_far.setUp(self)
+        self.T1 = cKDTree(self.data1,leafsize=2)
+        self.T2 = cKDTree(self.data2,leafsize=2)
+
+class test_two_random_trees_linf_compiled(test_two_random_trees_linf):
+
+    def setUp(self):
+        test_two_random_trees_linf.setUp(self)
+        self.T1 = cKDTree(self.data1,leafsize=2)
+        self.T2 = cKDTree(self.data2,leafsize=2)
+
 
 class test_rectangle:
 
@@ -399,6 +480,28 @@ class test_count_neighbors:
         for r,result in zip(rs, results):
             assert_equal(self.T1.count_neighbors(self.T2, r), result)
 
+class test_count_neighbors_compiled(test_count_neighbors):
+
+    def setUp(self):
+        n = 50
+        m = 2
+        self.T1 = cKDTree(np.random.randn(n,m),leafsize=2)
+        self.T2 = cKDTree(np.random.randn(n,m),leafsize=2)
+
+    def test_unsorted_radius(self):
+        rs = np.array([0.5, 0.1, 10, 0.1])
+        results = self.T1.count_neighbors(self.T2, rs)
+        for r,result in zip(rs, results):
+            assert_equal(self.T1.count_neighbors(self.T2, r), result)
+
+    def test_consistency_with_python(self):
+        data1 = self.T1.data
+        data2 = self.T2.data
+        rs = [0.1, 0.5, 1., 3.]
+        for p in [1, 2, np.inf]:
+            assert_equal(self.T1.count_neighbors(self.T2, rs, p=p),
+                         KDTree(data1).count_neighbors(KDTree(data2), rs, p=p))
+
 class test_sparse_distance_matrix:
     def setUp(self):
         n = 50
@@ -419,6 +522,20 @@ class test_sparse_distance_matrix:
     def test_zero_distance(self):
         M = self.T1.sparse_distance_matrix(self.T1, self.r) # raises an exception for bug 870
 
+class test_sparse_distance_matrix_compiled(test_sparse_distance_matrix):
+    def setUp(self):
+        n = 50
+        m = 4
+        self.T1 = cKDTree(np.random.randn(n,m),leafsize=2)
+        self.T2 = cKDTree(np.random.randn(n,m),leafsize=2)
+        self.r = 0.3
+
+    def test_consistency_with_python(self):
+        M1 = self.T1.sparse_distance_matrix(self.T2, self.r)
+        M2 = KDTree(self.T1.data).sparse_distance_matrix(
+            KDTree(self.T2.data), self.r)
+        assert_array_almost_equal(M1.todense(), M2.todense())
+
 def test_distance_matrix():
     m = 10
     n = 11
@@ -467,10 +584,201 @@ def test_onetree_query():
     yield check_onetree_query, T, 0.00001
     yield check_onetree_query, T, 1e-6
 
+def test_onetree_query_compiled():
+    np.random.seed(0)
+    n = 100
+    k = 4
+    points = np.random.randn(n,k)
+    T = cKDTree(points)
+    yield check_onetree_query, T, 0.1
+
+    points = np.random.randn(3*n,k)
+    points[:n] *= 0.001
+    points[n:2*n] += 2
+    T = cKDTree(points)
+    yield check_onetree_query, T, 0.1
+    yield check_onetree_query, T, 0.001
+    yield check_onetree_query, T, 0.00001
+    yield check_onetree_query, T, 1e-6
+
 def test_query_pairs_single_node():
     tree = KDTree([[0, 1]])
     assert_equal(tree.query_pairs(0.5), set())
 
+def test_query_pairs_single_node_compiled():
+    tree = cKDTree([[0, 1]])
+    assert_equal(tree.query_pairs(0.5), set())
+
+def test_query_pairs_duplicates_compiled():
+    points = np.zeros((20, 2))
+    tree = cKDTree(points, leafsize=3)
+    assert_equal(len(tree.query_pairs(0.1)), 20*19//2)
+
+
+def test_ckdtree_parallel():
+    np.random.seed(0)
+    points = np.random.randn(500, 3)
+    T = cKDTree(points)
+    x = np.random.randn(1000, 3)
+    d1, i1 = T.query(x, k=4, n_jobs=1)
+    for n_jobs in [2, 3, 7, -1]:
+        d, i = T.query(x, k=4, n_jobs=n_jobs)
+        assert_array_equal(d, d1)
+        assert_array_equal(i, i1)
+    d, i = T.query(x[0], k=4, n_jobs=2)
+    assert_array_equal(d, d1[0])
+    assert_array_equal(i, i1[0])
+    assert_raises(ValueError, T.query, x, n_jobs=0)
+
+def test_ckdtree_max_leaves():
+    np.random.seed(0)
+    points = np.random.randn(1000, 10)
+    T = cKDTree(points, leafsize=5)
+    x = np.random.randn(100, 10)
+    d1, i1 = T.query(x, k=3)
+
+    # a budget large enough to visit all leaves gives the exact answer
+    d, i = T.query(x, k=3, max_leaves=1000)
+    assert_array_equal(d, d1)
+    assert_array_equal(i, i1)
+
+    # with a small budget the neighbors are real points, at their
+    # correct distances, but possibly further than the nearest ones
+    for max_leaves in [1, 5, 20]:
+        d, i = T.query(x, k=3, max_leaves=max_leaves)
+        assert_(np.all(d >= d1 - 1e-12))
+        found = i < T.n
+        dist = np.sqrt(((points[i[found]] -
+                         np.repeat(x[:,np.newaxis], 3, axis=1)[found])**2
+                        ).sum(axis=-1))
+        assert_array_almost_equal(d[found], dist)
+    assert_raises(ValueError, T.query, x, max_leaves=0)
+
+
+
+def test_ckdtree_pickle():
+    import pickle
+    np.random.seed(0)
+    points = np.random.randn(200, 3)
+    T1 = cKDTree(points, leafsize=3)
+    x = np.random.randn(50, 3)
+    d1, i1 = T1.query(x, k=3)
+    for protocol in [0, 2]:
+        T2 = pickle.loads(pickle.dumps(T1, protocol))
+        d2, i2 = T2.query(x, k=3)
+        assert_array_equal(d1, d2)
+        assert_array_equal(i1, i2)
+        assert_equal(T1.query_pairs(0.5), T2.query_pairs(0.5))
+
+def test_ckdtree_state_readonly():
+    np.random.seed(0)
+    points = np.random.randn(200, 3)
+    T1 = cKDTree(points, leafsize=3)
+    state = T1.__getstate__()
+    for key, value in state.items():
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+            value.flags.writeable = False
+            state[key] = value
+    T2 = cKDTree.__new__(cKDTree)
+    T2.__setstate__(state)
+    assert_(np.may_share_memory(T2.data, state['data']))
+    x = np.random.randn(50, 3)
+    assert_array_equal(T1.query(x, k=3)[1], T2.query(x, k=3)[1])
+    assert_equal(T1.query_ball_point(x[0], 1.), T2.query_ball_point(x[0], 1.))
+
+def test_ckdtree_state_invalid():
+    np.random.seed(0)
+    points = np.random.rand(100, 2)
+    T1 = cKDTree(points, leafsize=3)
+    nodes = T1.__getstate__()['nodes']
+    n_nodes = len(nodes)
+    inner = np.nonzero(nodes['split_dim'] != -1)[0][-1]
+
+    def corrupt(key, field, index, value):
+        state = T1.__getstate__()
+        state[key] = state[key].copy()
+        if field is None:
+            state[key][index] = value
+        else:
+            state[key][field][index] = value
+        T2 = cKDTree.__new__(cKDTree)
+        assert_raises(ValueError, T2.__setstate__, state)
+
+    corrupt('nodes', 'less', 0, 10**8)
+    corrupt('nodes', 'greater', 0, n_nodes)
+    corrupt('nodes', 'less', inner, inner)
+    corrupt('nodes', 'greater', inner, 0)
+    corrupt('nodes', 'split_dim', 0, 2)
+    corrupt('nodes', 'split_dim', 0, -2)
+    corrupt('nodes', 'start_idx', n_nodes - 1, -1)
+    corrupt('nodes', 'end_idx', n_nodes - 1, 101)
+    corrupt('nodes', 'start_idx', 0, 101)
+    corrupt('indices', None, 5, 100)
+    corrupt('indices', None, 5, -1)
+
+def periodic_distance(x, y, boxsize, p=2.):
+    d = np.abs(x - y) % boxsize
+    d = np.minimum(d, boxsize - d)
+    if p == np.inf:
+        return d.max(axis=-1)
+    return (d**p).sum(axis=-1)**(1./p)
+
+def test_ckdtree_periodic():
+    np.random.seed(0)
+    boxsize = np.array([1., 2., 3.])
+    points = np.random.rand(300, 3)*boxsize
+    x = (np.random.rand(50, 3) - 0.5)*3*boxsize
+    T = cKDTree(points, leafsize=4, boxsize=boxsize)
+    for p in [1, 2, np.inf]:
+        dist = periodic_distance(x[:,np.newaxis], points, boxsize, p)
+        d, i = T.query(x, k=5, p=p)
+        assert_array_almost_equal(d, np.sort(dist, axis=1)[:,:5])
+        assert_array_almost_equal(d, dist[np.arange(50)[:,np.newaxis], i])
+
+        r = 0.4
+        for j, l in enumerate(T.query_ball_point(x, r, p=p)):
+            assert_equal(sorted(l), np.nonzero(dist[j] <= r)[0])
+
+        pdist = periodic_distance(points[:,np.newaxis], points, boxsize, p)
+        pairs = set((i, j) for i, j in zip(*np.nonzero(pdist <= r)) if i < j)
+        assert_equal(T.query_pairs(r, p=p), pairs)
+        assert_equal(T.count_neighbors(T, [0.2, r], p=p),
+                     [(pdist <= 0.2).sum(), (pdist <= r).sum()])
+        for j, l in enumerate(T.query_ball_tree(T, r, p=p)):
+            assert_equal(sorted(l), np.nonzero(pdist[j] <= r)[0])
+        M = T.sparse_distance_matrix(T, r, p=p).todense()
+        assert_array_almost_equal(M, np.where(pdist <= r, pdist, 0))
+
+    # a scalar boxsize applies to all dimensions
+    T2 = cKDTree(points[:,:2] % 1., boxsize=1.)
+    assert_array_equal(T2.boxsize, [1., 1.])
+    assert_raises(ValueError, cKDTree, points, boxsize=2.)
+    assert_raises(ValueError, cKDTree, points, boxsize=[1., 2.])
+    assert_raises(ValueError, T.count_neighbors, cKDTree(points), 0.1)
+
+def test_ckdtree_build_options():
+    np.random.seed(0)
+    # two tight clusters far apart, and many duplicates
+    points = np.vstack([1e-6*np.random.randn(500, 2),
+                        1e-6*np.random.randn(500, 2) + 1e3,
+                        np.ones((24, 2))])
+    x = np.vstack([points[::10] + 1e-7, np.random.randn(20, 2)])
+    T = KDTree(points)
+    d1, i1 = T.query(x, k=5)
+    for kwargs in [{}, {'balanced_tree': True}, {'compact_nodes': True},
+                   {'balanced_tree': True, 'compact_nodes': True}]:
+        T = cKDTree(points, leafsize=2, **kwargs)
+        d, i = T.query(x, k=5)
+        assert_array_almost_equal(d, d1)
+        assert_equal(T.balanced_tree, kwargs.get('balanced_tree', False))
+        assert_equal(T.compact_nodes, kwargs.get('compact_nodes', False))
+    T = cKDTree(points, leafsize=2, balanced_tree=True)
+    # each split halves the number of points
+    assert_(T.depth <= np.ceil(np.log2(len(points)/2.)))
+    assert_(T.depth < cKDTree(points, leafsize=2).depth)
+    assert_equal(cKDTree(np.zeros((100, 3)), balanced_tree=True).depth, 0)
+    assert_equal(cKDTree(points[:2], leafsize=2).depth, 0)
 
 def test_ball_point_ints():
     """Regression test for #1373."""
@@ -484,6 +792,13 @@ def test_ball_point_ints():
     assert_equal(sorted([4, 8, 9, 12]),
                  sorted(tree.query_ball_point((2, 0), 1)))
 
+def test_ball_point_ints_compiled():
+    x, y = np.mgrid[0:4, 0:4]
+    points = zip(x.ravel(), y.ravel())
+    tree = cKDTree(points)
+    assert_equal(sorted([4, 8, 9, 12]),
+                 sorted(tree.query_ball_point((2, 0), 1)))
+
 
 if __name__=="__main__":
     run_module_suite()
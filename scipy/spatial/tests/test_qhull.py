@@ -1,5 +1,6 @@
 import numpy as np
-from numpy.testing import assert_equal, assert_almost_equal, run_module_suite
+from numpy.testing import assert_equal, assert_almost_equal, assert_raises, \
+     assert_, run_module_suite
 
 import scipy.spatial.qhull as qhull
 
@@ -30,6 +31,25 @@ class TestUtilities(object):
             j = qhull.tsearch(tri, p[:2])
             assert_equal(i, j)
 
+    def test_find_simplex_start(self):
+        # All the starting points of the walk give the same simplices
+        np.random.seed(1234)
+        for ndim in (2, 3, 4):
+            points = np.random.rand(200, ndim)
+            tri = qhull.Delaunay(points)
+            xi = np.random.rand(500, ndim)*1.2 - 0.1
+            expected = tri.find_simplex(xi, bruteforce=True)
+
+            for start in ['auto', 'previous', 'nearest', expected,
+                          -np.ones(500, dtype=int)]:
+                got = tri.find_simplex(xi, start=start)
+                assert_equal(got, expected)
+
+            # hints of the wrong shape, or unknown start
+            assert_raises(ValueError, tri.find_simplex, xi,
+                          start=expected[:-1])
+            assert_raises(ValueError, tri.find_simplex, xi, start='foo')
+
     def test_plane_distance(self):
         # Compare plane distance from hyperplane equations obtained from Qhull
         # to manually computed plane equations
@@ -224,5 +244,151 @@ class TestTriangulation(object):
         assert_equal(tri.points[tri.vertices].min(),
                      self.pathological_data_2.min())
 
+    def test_incremental(self):
+        # Adding points gives the same triangulation as constructing it
+        # from all of the points
+        np.random.seed(1234)
+        for nd in (2, 3, 4):
+            for scale in (1.0, 1.6):
+                points = np.random.rand(30, nd)
+                tri = qhull.Delaunay(points, incremental=True)
+                for j in xrange(4):
+                    # some of the points are outside the triangulation
+                    tri.add_points(scale*np.random.rand(10, nd))
+                tri2 = qhull.Delaunay(tri.points)
+
+                assert_equal(tri.npoints, 70)
+                assert_equal(tri.nsimplex, tri2.nsimplex)
+                assert_equal(sorted(map(tuple, np.sort(tri.vertices))),
+                             sorted(map(tuple, np.sort(tri2.vertices))))
+
+                # neighbors are consistent
+                for isimplex, neighbors in enumerate(tri.neighbors):
+                    for k, ineigh in enumerate(neighbors):
+                        if ineigh == -1:
+                            continue
+                        assert isimplex in tri.neighbors[ineigh]
+                        assert tri.vertices[isimplex,k] not in \
+                               tri.vertices[ineigh]
+
+                # the updated arrays match the ones computed from scratch
+                assert_almost_equal(tri.transform,
+                    qhull._get_barycentric_transforms(tri.points,
+                                                      tri.vertices))
+                z = tri.lift_points(tri.points)[tri.vertices]
+                dist = (tri.equations[:,np.newaxis,:-1]*z).sum(axis=-1)
+                assert_almost_equal(dist + tri.equations[:,-1:], 0)
+
+                xi = scale*np.random.rand(50, nd)
+                assert_equal(tri.find_simplex(xi),
+                             tri.find_simplex(xi, bruteforce=True))
+
+    def test_incremental_pathological(self):
+        # grid points and duplicates
+        data = self.pathological_data_1
+        tri = qhull.Delaunay(data[::2], incremental=True)
+        tri.add_points(data[1::2])
+        tri.add_points(data[:5])
+        assert_equal(tri.npoints, len(data) + 5)
+        assert_equal(np.unique(tri.vertices), np.arange(len(data)))
+
+        hull_area = 2*3.14 * 2*3.14
+        area = abs(np.array([np.linalg.det(t[:2]) for t in tri.transform]))
+        assert_almost_equal((0.5/area).sum(), hull_area)
+
+    def test_incremental_disabled(self):
+        tri = qhull.Delaunay(np.random.rand(10, 2))
+        assert_raises(RuntimeError, tri.add_points, np.random.rand(5, 2))
+
+
+class TestConvexHull(object):
+    def test_hull_consistency_tri(self):
+        # Check that ConvexHull and Delaunay.convex_hull agree
+        np.random.seed(1234)
+        for nd in [2, 3, 4]:
+            points = np.random.rand(30, nd)
+            tri = qhull.Delaunay(points)
+            hull = qhull.ConvexHull(points)
+
+            assert_equal(hull.ndim, nd)
+            assert_equal(hull.npoints, 30)
+            assert_equal(sorted(np.sort(hull.simplices, axis=1).tolist()),
+                         sorted(np.sort(tri.convex_hull, axis=1).tolist()))
+            assert_equal(hull.vertices, np.unique(tri.convex_hull))
+
+            # all points are inside or on the hull
+            dist = np.dot(points, hull.equations[:,:-1].T) \
+                   + hull.equations[:,-1]
+            assert_(np.all(dist < 1e-12))
+
+            # the facet vertices are on the facet planes
+            for j in xrange(hull.nsimplex):
+                d = np.dot(points[hull.simplices[j]],
+                           hull.equations[j,:-1]) + hull.equations[j,-1]
+                assert_almost_equal(d, 0)
+
+            # neighbors share ndim-1 vertices
+            for j in xrange(hull.nsimplex):
+                for k in xrange(nd):
+                    n = hull.neighbors[j,k]
+                    common = np.intersect1d(hull.simplices[j],
+                                            hull.simplices[n])
+                    assert_equal(len(common), nd - 1)
+                    assert_(hull.simplices[j,k] not in common)
+
+    def test_square(self):
+        points = np.array([(0,0), (0,1), (1,1), (1,0), (0.5, 0.5)],
+                          dtype=np.double)
+        hull = qhull.ConvexHull(points)
+        assert_equal(hull.vertices, [0, 1, 2, 3])
+        assert_equal(hull.nsimplex, 4)
+
+    def test_too_few_points(self):
+        assert_raises(ValueError, qhull.ConvexHull, np.random.rand(2, 2))
+        assert_raises(ValueError, qhull.ConvexHull, np.random.rand(10, 1))
+
+
+class TestVoronoi(object):
+    def test_simple(self):
+        # 3x3 grid: a single bounded region, around the center point
+        points = np.array([(x, y) for x in range(3) for y in range(3)],
+                          dtype=np.double)
+        vor = qhull.Voronoi(points)
+
+        assert_almost_equal(np.array(sorted(vor.vertices.tolist())),
+                            [[0.5, 0.5], [0.5, 1.5], [1.5, 0.5], [1.5, 1.5]])
+
+        bounded = [r for r in vor.regions if -1 not in r]
+        assert_equal(len(bounded), 1)
+        center = vor.regions[vor.point_region[4]]
+        assert_equal(sorted(center), [0, 1, 2, 3])
+        for j in xrange(9):
+            if j != 4:
+                assert_(-1 in vor.regions[vor.point_region[j]])
+
+        assert_equal(len(vor.ridge_points), 12)
+        assert_equal(len(vor.ridge_vertices), 12)
+        for (p1, p2), rv in zip(vor.ridge_points, vor.ridge_vertices):
+            # ridges lie between neighboring grid points
+            assert_almost_equal(np.linalg.norm(points[p1] - points[p2]), 1)
+            assert_equal(len(rv), 2)
+
+    def test_ridges_equidistant(self):
+        np.random.seed(1234)
+        for nd in [2, 3]:
+            points = np.random.rand(30, nd)
+            vor = qhull.Voronoi(points)
+
+            assert_equal(vor.ridge_points.shape[1], 2)
+            assert_(np.all(vor.point_region >= 0))
+            for (p1, p2), rv in zip(vor.ridge_points, vor.ridge_vertices):
+                v = vor.vertices[[k for k in rv if k != -1]]
+                d1 = np.sqrt(((v - points[p1])**2).sum(axis=1))
+                d2 = np.sqrt(((v - points[p2])**2).sum(axis=1))
+                assert_almost_equal(d1, d2)
+
+    def test_no_points(self):
+        assert_raises(ValueError, qhull.Voronoi, np.zeros((0, 2)))
+
 if __name__ == "__main__":
     run_module_suite()
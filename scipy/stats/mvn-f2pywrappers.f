@@ -0,0 +1,12 @@
+C     -*- fortran -*-
+C     This file is autogenerated with f2py (version:2)
+C     It contains Fortran 77 wrappers to fortran functions.
+
+      subroutine f2pyinitdkblck(setupfunc)
+      external setupfunc
+      integer ivls
+      common /dkblck/ ivls
+      call setupfunc(ivls)
+      end
+
+
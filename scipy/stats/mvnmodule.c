@@ -0,0 +1,699 @@
+/* File: mvnmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 22:52:11 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *mvn_error;
+static PyObject *mvn_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+/*need_typedefs*/
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = mvn_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = mvn_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(mvnun,MVNUN)(int*,int*,double*,double*,double*,double*,int*,double*,double*,double*,int*);
+extern void F_FUNC(mvndst,MVNDST)(int*,double*,double*,int*,double*,int*,double*,double*,double*,double*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** mvnun ***********************************/
+static char doc_f2py_rout_mvn_mvnun[] = "\
+value,inform = mvnun(lower,upper,means,covar,[maxpts,abseps,releps])\n\nWrapper for ``mvnun``.\
+\n\nParameters\n----------\n"
+"lower : input rank-1 array('d') with bounds (d)\n"
+"upper : input rank-1 array('d') with bounds (d)\n"
+"means : input rank-2 array('d') with bounds (d,n)\n"
+"covar : input rank-2 array('d') with bounds (d,d)\n"
+"\nOther Parameters\n----------------\n"
+"maxpts : input int, optional\n    Default: d*1000\n"
+"abseps : input float, optional\n    Default: 1e-06\n"
+"releps : input float, optional\n    Default: 1e-06\n"
+"\nReturns\n-------\n"
+"value : float\n"
+"inform : int";
+/* extern void F_FUNC(mvnun,MVNUN)(int*,int*,double*,double*,double*,double*,int*,double*,double*,double*,int*); */
+static PyObject *f2py_rout_mvn_mvnun(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,double*,double*,int*,double*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int d = 0;
+  int n = 0;
+  double *lower = NULL;
+  npy_intp lower_Dims[1] = {-1};
+  const int lower_Rank = 1;
+  PyArrayObject *capi_lower_tmp = NULL;
+  int capi_lower_intent = 0;
+  PyObject *lower_capi = Py_None;
+  double *upper = NULL;
+  npy_intp upper_Dims[1] = {-1};
+  const int upper_Rank = 1;
+  PyArrayObject *capi_upper_tmp = NULL;
+  int capi_upper_intent = 0;
+  PyObject *upper_capi = Py_None;
+  double *means = NULL;
+  npy_intp means_Dims[2] = {-1, -1};
+  const int means_Rank = 2;
+  PyArrayObject *capi_means_tmp = NULL;
+  int capi_means_intent = 0;
+  PyObject *means_capi = Py_None;
+  double *covar = NULL;
+  npy_intp covar_Dims[2] = {-1, -1};
+  const int covar_Rank = 2;
+  PyArrayObject *capi_covar_tmp = NULL;
+  int capi_covar_intent = 0;
+  PyObject *covar_capi = Py_None;
+  int maxpts = 0;
+  PyObject *maxpts_capi = Py_None;
+  double abseps = 0;
+  PyObject *abseps_capi = Py_None;
+  double releps = 0;
+  PyObject *releps_capi = Py_None;
+  double value = 0;
+  int inform = 0;
+  static char *capi_kwlist[] = {"lower","upper","means","covar","maxpts","abseps","releps",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OOO:mvn.mvnun",\
+    capi_kwlist,&lower_capi,&upper_capi,&means_capi,&covar_capi,&maxpts_capi,&abseps_capi,&releps_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable means */
+  ;
+  capi_means_intent |= F2PY_INTENT_IN;
+  capi_means_tmp = array_from_pyobj(NPY_DOUBLE,means_Dims,means_Rank,capi_means_intent,means_capi);
+  if (capi_means_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 3rd argument `means' of mvn.mvnun to C/Fortran array" );
+  } else {
+    means = (double *)(PyArray_DATA(capi_means_tmp));
+
+  /* Processing variable value */
+  /* Processing variable releps */
+  if (releps_capi == Py_None) releps = 1e-06; else
+    f2py_success = double_from_pyobj(&releps,releps_capi,"mvn.mvnun() 3rd keyword (releps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable inform */
+  /* Processing variable abseps */
+  if (abseps_capi == Py_None) abseps = 1e-06; else
+    f2py_success = double_from_pyobj(&abseps,abseps_capi,"mvn.mvnun() 2nd keyword (abseps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable d */
+  d = shape(means,0);
+  /* Processing variable maxpts */
+  if (maxpts_capi == Py_None) maxpts = d*1000; else
+    f2py_success = int_from_pyobj(&maxpts,maxpts_capi,"mvn.mvnun() 1st keyword (maxpts) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable covar */
+  covar_Dims[0]=d,covar_Dims[1]=d;
+  capi_covar_intent |= F2PY_INTENT_IN;
+  capi_covar_tmp = array_from_pyobj(NPY_DOUBLE,covar_Dims,covar_Rank,capi_covar_intent,covar_capi);
+  if (capi_covar_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 4th argument `covar' of mvn.mvnun to C/Fortran array" );
+  } else {
+    covar = (double *)(PyArray_DATA(capi_covar_tmp));
+
+  /* Processing variable n */
+  n = shape(means,1);
+  /* Processing variable upper */
+  upper_Dims[0]=d;
+  capi_upper_intent |= F2PY_INTENT_IN;
+  capi_upper_tmp = array_from_pyobj(NPY_DOUBLE,upper_Dims,upper_Rank,capi_upper_intent,upper_capi);
+  if (capi_upper_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 2nd argument `upper' of mvn.mvnun to C/Fortran array" );
+  } else {
+    upper = (double *)(PyArray_DATA(capi_upper_tmp));
+
+  /* Processing variable lower */
+  lower_Dims[0]=d;
+  capi_lower_intent |= F2PY_INTENT_IN;
+  capi_lower_tmp = array_from_pyobj(NPY_DOUBLE,lower_Dims,lower_Rank,capi_lower_intent,lower_capi);
+  if (capi_lower_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 1st argument `lower' of mvn.mvnun to C/Fortran array" );
+  } else {
+    lower = (double *)(PyArray_DATA(capi_lower_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&d,&n,lower,upper,means,covar,&maxpts,&abseps,&releps,&value,&inform);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("di",value,inform);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_lower_tmp!=lower_capi) {
+    Py_XDECREF(capi_lower_tmp); }
+  }  /*if (capi_lower_tmp == NULL) ... else of lower*/
+  /* End of cleaning variable lower */
+  if((PyObject *)capi_upper_tmp!=upper_capi) {
+    Py_XDECREF(capi_upper_tmp); }
+  }  /*if (capi_upper_tmp == NULL) ... else of upper*/
+  /* End of cleaning variable upper */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_covar_tmp!=covar_capi) {
+    Py_XDECREF(capi_covar_tmp); }
+  }  /*if (capi_covar_tmp == NULL) ... else of covar*/
+  /* End of cleaning variable covar */
+  } /*if (f2py_success) of maxpts*/
+  /* End of cleaning variable maxpts */
+  /* End of cleaning variable d */
+  } /*if (f2py_success) of abseps*/
+  /* End of cleaning variable abseps */
+  /* End of cleaning variable inform */
+  } /*if (f2py_success) of releps*/
+  /* End of cleaning variable releps */
+  /* End of cleaning variable value */
+  if((PyObject *)capi_means_tmp!=means_capi) {
+    Py_XDECREF(capi_means_tmp); }
+  }  /*if (capi_means_tmp == NULL) ... else of means*/
+  /* End of cleaning variable means */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of mvnun ********************************/
+
+/*********************************** mvndst ***********************************/
+static char doc_f2py_rout_mvn_mvndst[] = "\
+error,value,inform = mvndst(lower,upper,infin,correl,[maxpts,abseps,releps])\n\nWrapper for ``mvndst``.\
+\n\nParameters\n----------\n"
+"lower : input rank-1 array('d') with bounds (n)\n"
+"upper : input rank-1 array('d') with bounds (n)\n"
+"infin : input rank-1 array('i') with bounds (n)\n"
+"correl : input rank-1 array('d') with bounds (n*(n-1)/2)\n"
+"\nOther Parameters\n----------------\n"
+"maxpts : input int, optional\n    Default: 2000\n"
+"abseps : input float, optional\n    Default: 1e-06\n"
+"releps : input float, optional\n    Default: 1e-06\n"
+"\nReturns\n-------\n"
+"error : float\n"
+"value : float\n"
+"inform : int";
+/* extern void F_FUNC(mvndst,MVNDST)(int*,double*,double*,int*,double*,int*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout_mvn_mvndst(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,int*,double*,int*,double*,double*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *lower = NULL;
+  npy_intp lower_Dims[1] = {-1};
+  const int lower_Rank = 1;
+  PyArrayObject *capi_lower_tmp = NULL;
+  int capi_lower_intent = 0;
+  PyObject *lower_capi = Py_None;
+  double *upper = NULL;
+  npy_intp upper_Dims[1] = {-1};
+  const int upper_Rank = 1;
+  PyArrayObject *capi_upper_tmp = NULL;
+  int capi_upper_intent = 0;
+  PyObject *upper_capi = Py_None;
+  int *infin = NULL;
+  npy_intp infin_Dims[1] = {-1};
+  const int infin_Rank = 1;
+  PyArrayObject *capi_infin_tmp = NULL;
+  int capi_infin_intent = 0;
+  PyObject *infin_capi = Py_None;
+  double *correl = NULL;
+  npy_intp correl_Dims[1] = {-1};
+  const int correl_Rank = 1;
+  PyArrayObject *capi_correl_tmp = NULL;
+  int capi_correl_intent = 0;
+  PyObject *correl_capi = Py_None;
+  int maxpts = 0;
+  PyObject *maxpts_capi = Py_None;
+  double abseps = 0;
+  PyObject *abseps_capi = Py_None;
+  double releps = 0;
+  PyObject *releps_capi = Py_None;
+  double error = 0;
+  double value = 0;
+  int inform = 0;
+  static char *capi_kwlist[] = {"lower","upper","infin","correl","maxpts","abseps","releps",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OOO:mvn.mvndst",\
+    capi_kwlist,&lower_capi,&upper_capi,&infin_capi,&correl_capi,&maxpts_capi,&abseps_capi,&releps_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable lower */
+  ;
+  capi_lower_intent |= F2PY_INTENT_IN;
+  capi_lower_tmp = array_from_pyobj(NPY_DOUBLE,lower_Dims,lower_Rank,capi_lower_intent,lower_capi);
+  if (capi_lower_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 1st argument `lower' of mvn.mvndst to C/Fortran array" );
+  } else {
+    lower = (double *)(PyArray_DATA(capi_lower_tmp));
+
+  /* Processing variable value */
+  /* Processing variable releps */
+  if (releps_capi == Py_None) releps = 1e-06; else
+    f2py_success = double_from_pyobj(&releps,releps_capi,"mvn.mvndst() 3rd keyword (releps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable inform */
+  /* Processing variable error */
+  /* Processing variable abseps */
+  if (abseps_capi == Py_None) abseps = 1e-06; else
+    f2py_success = double_from_pyobj(&abseps,abseps_capi,"mvn.mvndst() 2nd keyword (abseps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable maxpts */
+  if (maxpts_capi == Py_None) maxpts = 2000; else
+    f2py_success = int_from_pyobj(&maxpts,maxpts_capi,"mvn.mvndst() 1st keyword (maxpts) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(lower);
+  /* Processing variable upper */
+  upper_Dims[0]=n;
+  capi_upper_intent |= F2PY_INTENT_IN;
+  capi_upper_tmp = array_from_pyobj(NPY_DOUBLE,upper_Dims,upper_Rank,capi_upper_intent,upper_capi);
+  if (capi_upper_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 2nd argument `upper' of mvn.mvndst to C/Fortran array" );
+  } else {
+    upper = (double *)(PyArray_DATA(capi_upper_tmp));
+
+  /* Processing variable infin */
+  infin_Dims[0]=n;
+  capi_infin_intent |= F2PY_INTENT_IN;
+  capi_infin_tmp = array_from_pyobj(NPY_INT,infin_Dims,infin_Rank,capi_infin_intent,infin_capi);
+  if (capi_infin_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 3rd argument `infin' of mvn.mvndst to C/Fortran array" );
+  } else {
+    infin = (int *)(PyArray_DATA(capi_infin_tmp));
+
+  /* Processing variable correl */
+  correl_Dims[0]=n*(n-1)/2;
+  capi_correl_intent |= F2PY_INTENT_IN;
+  capi_correl_tmp = array_from_pyobj(NPY_DOUBLE,correl_Dims,correl_Rank,capi_correl_intent,correl_capi);
+  if (capi_correl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mvn_error,"failed in converting 4th argument `correl' of mvn.mvndst to C/Fortran array" );
+  } else {
+    correl = (double *)(PyArray_DATA(capi_correl_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,lower,upper,infin,correl,&maxpts,&abseps,&releps,&error,&value,&inform);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("ddi",error,value,inform);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_correl_tmp!=correl_capi) {
+    Py_XDECREF(capi_correl_tmp); }
+  }  /*if (capi_correl_tmp == NULL) ... else of correl*/
+  /* End of cleaning variable correl */
+  if((PyObject *)capi_infin_tmp!=infin_capi) {
+    Py_XDECREF(capi_infin_tmp); }
+  }  /*if (capi_infin_tmp == NULL) ... else of infin*/
+  /* End of cleaning variable infin */
+  if((PyObject *)capi_upper_tmp!=upper_capi) {
+    Py_XDECREF(capi_upper_tmp); }
+  }  /*if (capi_upper_tmp == NULL) ... else of upper*/
+  /* End of cleaning variable upper */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of maxpts*/
+  /* End of cleaning variable maxpts */
+  } /*if (f2py_success) of abseps*/
+  /* End of cleaning variable abseps */
+  /* End of cleaning variable error */
+  /* End of cleaning variable inform */
+  } /*if (f2py_success) of releps*/
+  /* End of cleaning variable releps */
+  /* End of cleaning variable value */
+  if((PyObject *)capi_lower_tmp!=lower_capi) {
+    Py_XDECREF(capi_lower_tmp); }
+  }  /*if (capi_lower_tmp == NULL) ... else of lower*/
+  /* End of cleaning variable lower */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of mvndst *******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+static FortranDataDef f2py_dkblck_def[] = {
+  {"ivls",0,{{-1}},NPY_INT},
+  {NULL}
+};
+static void f2py_setup_dkblck(char *ivls) {
+  int i_f2py=0;
+  f2py_dkblck_def[i_f2py++].data = ivls;
+}
+extern void F_FUNC(f2pyinitdkblck,F2PYINITDKBLCK)(void(*)(char*));
+static void f2py_init_dkblck(void) {
+  F_FUNC(f2pyinitdkblck,F2PYINITDKBLCK)(f2py_setup_dkblck);
+}
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"mvnun",-1,{{-1}},0,(char *)F_FUNC(mvnun,MVNUN),(f2py_init_func)f2py_rout_mvn_mvnun,doc_f2py_rout_mvn_mvnun},
+  {"mvndst",-1,{{-1}},0,(char *)F_FUNC(mvndst,MVNDST),(f2py_init_func)f2py_rout_mvn_mvndst,doc_f2py_rout_mvn_mvndst},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "mvn",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_mvn(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initmvn(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = mvn_module = PyModule_Create(&moduledef);
+#else
+  m = mvn_module = Py_InitModule("mvn", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module mvn (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'mvn' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  value,inform = mvnun(lower,upper,means,covar,maxpts=d*1000,abseps=1e-06,releps=1e-06)\n"
+"  error,value,inform = mvndst(lower,upper,infin,correl,maxpts=2000,abseps=1e-06,releps=1e-06)\n"
+"COMMON blocks:\n""  /dkblck/ ivls\n"".");
+  PyDict_SetItemString(d, "__doc__", s);
+  mvn_error = PyErr_NewException ("mvn.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+  F2PyDict_SetItemString(d, "dkblck", PyFortranObject_New(f2py_dkblck_def,f2py_init_dkblck));
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"mvn");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,796 @@
+/* File: statlibmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 22:52:11 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *statlib_error;
+static PyObject *statlib_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+/*need_typedefs*/
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(statlib_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = statlib_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(swilk,SWILK)(int*,float*,int*,int*,int*,float*,float*,float*,int*);
+extern void F_FUNC(wprob,WPROB)(int*,int*,float*,float*,int*,float*,float*,int*);
+extern void F_FUNC(gscale,GSCALE)(int*,int*,float*,float*,int*,float*,float*,int*);
+extern double F_FUNC(prho,PRHO)(int*,int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** swilk ***********************************/
+static char doc_f2py_rout_statlib_swilk[] = "\
+a,w,pw,ifault = swilk(x,a,[init,n1])\n\nWrapper for ``swilk``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('f') with bounds (n)\n"
+"a : input rank-1 array('f') with bounds (n2)\n"
+"\nOther Parameters\n----------------\n"
+"init : input int, optional\n    Default: 0\n"
+"n1 : input int, optional\n    Default: n\n"
+"\nReturns\n-------\n"
+"a : rank-1 array('f') with bounds (n2)\n"
+"w : float\n"
+"pw : float\n"
+"ifault : int";
+/* extern void F_FUNC(swilk,SWILK)(int*,float*,int*,int*,int*,float*,float*,float*,int*); */
+static PyObject *f2py_rout_statlib_swilk(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,int*,int*,float*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int init = 0;
+  PyObject *init_capi = Py_None;
+  float *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  int n = 0;
+  int n1 = 0;
+  PyObject *n1_capi = Py_None;
+  int n2 = 0;
+  float *a = NULL;
+  npy_intp a_Dims[1] = {-1};
+  const int a_Rank = 1;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  float w = 0;
+  float pw = 0;
+  int ifault = 0;
+  static char *capi_kwlist[] = {"x","a","init","n1",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OO:statlib.swilk",\
+    capi_kwlist,&x_capi,&a_capi,&init_capi,&n1_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable pw */
+  /* Processing variable ifault */
+  /* Processing variable init */
+  if (init_capi == Py_None) init = 0; else
+    init = (int)PyObject_IsTrue(init_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable w */
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_FLOAT,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting 1st argument `x' of statlib.swilk to C/Fortran array" );
+  } else {
+    x = (float *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable n */
+  n = shape(x,0);
+  /* Processing variable n1 */
+  if (n1_capi == Py_None) n1 = n; else
+    f2py_success = int_from_pyobj(&n1,n1_capi,"statlib.swilk() 2nd keyword (n1) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(n1<=n,"n1<=n","2nd keyword n1","swilk:n1=%d",n1) {
+  /* Processing variable n2 */
+  n2 = n/2;
+  /* Processing variable a */
+  a_Dims[0]=n2;
+  capi_a_intent |= F2PY_INTENT_IN|F2PY_INTENT_OUT;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting 2nd argument `a' of statlib.swilk to C/Fortran array" );
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&init,x,&n,&n1,&n2,a,&w,&pw,&ifault);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("Nffi",capi_a_tmp,w,pw,ifault);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  /* End of cleaning variable n2 */
+  } /*CHECKSCALAR(n1<=n)*/
+  } /*if (f2py_success) of n1*/
+  /* End of cleaning variable n1 */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable w */
+  } /*if (f2py_success) of init*/
+  /* End of cleaning variable init */
+  /* End of cleaning variable ifault */
+  /* End of cleaning variable pw */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of swilk ********************************/
+
+/*********************************** wprob ***********************************/
+static char doc_f2py_rout_statlib_wprob[] = "\
+astart,a1,ifault = wprob(test,other)\n\nWrapper for ``wprob``.\
+\n\nParameters\n----------\n"
+"test : input int\n"
+"other : input int\n"
+"\nReturns\n-------\n"
+"astart : float\n"
+"a1 : rank-1 array('f') with bounds (l1)\n"
+"ifault : int";
+/* extern void F_FUNC(wprob,WPROB)(int*,int*,float*,float*,int*,float*,float*,int*); */
+static PyObject *f2py_rout_statlib_wprob(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,float*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int test = 0;
+  PyObject *test_capi = Py_None;
+  int other = 0;
+  PyObject *other_capi = Py_None;
+  float astart = 0;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  int l1 = 0;
+  float *a2 = NULL;
+  npy_intp a2_Dims[1] = {-1};
+  const int a2_Rank = 1;
+  PyArrayObject *capi_a2_tmp = NULL;
+  int capi_a2_intent = 0;
+  float *a3 = NULL;
+  npy_intp a3_Dims[1] = {-1};
+  const int a3_Rank = 1;
+  PyArrayObject *capi_a3_tmp = NULL;
+  int capi_a3_intent = 0;
+  int ifault = 0;
+  static char *capi_kwlist[] = {"test","other",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:statlib.wprob",\
+    capi_kwlist,&test_capi,&other_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ifault */
+  /* Processing variable astart */
+  /* Processing variable other */
+    f2py_success = int_from_pyobj(&other,other_capi,"statlib.wprob() 2nd argument (other) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable test */
+    f2py_success = int_from_pyobj(&test,test_capi,"statlib.wprob() 1st argument (test) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable l1 */
+  l1 = (1+(test*other)/2);
+  /* Processing variable a2 */
+  a2_Dims[0]=l1;
+  capi_a2_intent |= F2PY_INTENT_HIDE;
+  capi_a2_tmp = array_from_pyobj(NPY_FLOAT,a2_Dims,a2_Rank,capi_a2_intent,Py_None);
+  if (capi_a2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting hidden `a2' of statlib.wprob to C/Fortran array" );
+  } else {
+    a2 = (float *)(PyArray_DATA(capi_a2_tmp));
+
+  /* Processing variable a1 */
+  a1_Dims[0]=l1;
+  capi_a1_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,Py_None);
+  if (capi_a1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting hidden `a1' of statlib.wprob to C/Fortran array" );
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable a3 */
+  a3_Dims[0]=l1;
+  capi_a3_intent |= F2PY_INTENT_HIDE;
+  capi_a3_tmp = array_from_pyobj(NPY_FLOAT,a3_Dims,a3_Rank,capi_a3_intent,Py_None);
+  if (capi_a3_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting hidden `a3' of statlib.wprob to C/Fortran array" );
+  } else {
+    a3 = (float *)(PyArray_DATA(capi_a3_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&test,&other,&astart,a1,&l1,a2,a3,&ifault);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("fNi",astart,capi_a1_tmp,ifault);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_a3_tmp);
+  }  /*if (capi_a3_tmp == NULL) ... else of a3*/
+  /* End of cleaning variable a3 */
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+    Py_XDECREF(capi_a2_tmp);
+  }  /*if (capi_a2_tmp == NULL) ... else of a2*/
+  /* End of cleaning variable a2 */
+  /* End of cleaning variable l1 */
+  } /*if (f2py_success) of test*/
+  /* End of cleaning variable test */
+  } /*if (f2py_success) of other*/
+  /* End of cleaning variable other */
+  /* End of cleaning variable astart */
+  /* End of cleaning variable ifault */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of wprob ********************************/
+
+/*********************************** gscale ***********************************/
+static char doc_f2py_rout_statlib_gscale[] = "\
+astart,a1,ifault = gscale(test,other)\n\nWrapper for ``gscale``.\
+\n\nParameters\n----------\n"
+"test : input int\n"
+"other : input int\n"
+"\nReturns\n-------\n"
+"astart : float\n"
+"a1 : rank-1 array('f') with bounds (l1)\n"
+"ifault : int";
+/* extern void F_FUNC(gscale,GSCALE)(int*,int*,float*,float*,int*,float*,float*,int*); */
+static PyObject *f2py_rout_statlib_gscale(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,float*,int*,float*,float*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int test = 0;
+  PyObject *test_capi = Py_None;
+  int other = 0;
+  PyObject *other_capi = Py_None;
+  float astart = 0;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  int l1 = 0;
+  float *a2 = NULL;
+  npy_intp a2_Dims[1] = {-1};
+  const int a2_Rank = 1;
+  PyArrayObject *capi_a2_tmp = NULL;
+  int capi_a2_intent = 0;
+  float *a3 = NULL;
+  npy_intp a3_Dims[1] = {-1};
+  const int a3_Rank = 1;
+  PyArrayObject *capi_a3_tmp = NULL;
+  int capi_a3_intent = 0;
+  int ifault = 0;
+  static char *capi_kwlist[] = {"test","other",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:statlib.gscale",\
+    capi_kwlist,&test_capi,&other_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ifault */
+  /* Processing variable astart */
+  /* Processing variable other */
+    f2py_success = int_from_pyobj(&other,other_capi,"statlib.gscale() 2nd argument (other) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable test */
+    f2py_success = int_from_pyobj(&test,test_capi,"statlib.gscale() 1st argument (test) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable l1 */
+  l1 = (1+(test*other)/2);
+  /* Processing variable a2 */
+  a2_Dims[0]=l1;
+  capi_a2_intent |= F2PY_INTENT_HIDE;
+  capi_a2_tmp = array_from_pyobj(NPY_FLOAT,a2_Dims,a2_Rank,capi_a2_intent,Py_None);
+  if (capi_a2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting hidden `a2' of statlib.gscale to C/Fortran array" );
+  } else {
+    a2 = (float *)(PyArray_DATA(capi_a2_tmp));
+
+  /* Processing variable a1 */
+  a1_Dims[0]=l1;
+  capi_a1_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,Py_None);
+  if (capi_a1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting hidden `a1' of statlib.gscale to C/Fortran array" );
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable a3 */
+  a3_Dims[0]=l1;
+  capi_a3_intent |= F2PY_INTENT_HIDE;
+  capi_a3_tmp = array_from_pyobj(NPY_FLOAT,a3_Dims,a3_Rank,capi_a3_intent,Py_None);
+  if (capi_a3_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(statlib_error,"failed in converting hidden `a3' of statlib.gscale to C/Fortran array" );
+  } else {
+    a3 = (float *)(PyArray_DATA(capi_a3_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&test,&other,&astart,a1,&l1,a2,a3,&ifault);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("fNi",astart,capi_a1_tmp,ifault);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    Py_XDECREF(capi_a3_tmp);
+  }  /*if (capi_a3_tmp == NULL) ... else of a3*/
+  /* End of cleaning variable a3 */
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+    Py_XDECREF(capi_a2_tmp);
+  }  /*if (capi_a2_tmp == NULL) ... else of a2*/
+  /* End of cleaning variable a2 */
+  /* End of cleaning variable l1 */
+  } /*if (f2py_success) of test*/
+  /* End of cleaning variable test */
+  } /*if (f2py_success) of other*/
+  /* End of cleaning variable other */
+  /* End of cleaning variable astart */
+  /* End of cleaning variable ifault */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of gscale *******************************/
+
+/************************************ prho ************************************/
+static char doc_f2py_rout_statlib_prho[] = "\
+ifault = prho(n,is)\n\nWrapper for ``prho``.\
+\n\nParameters\n----------\n"
+"n : input int\n"
+"is : input int\n"
+"\nReturns\n-------\n"
+"prho : float\n"
+"ifault : int";
+/* extern double F_FUNC(prho,PRHO)(int*,int*,int*); */
+static PyObject *f2py_rout_statlib_prho(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double prho_return_value=0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int is = 0;
+  PyObject *is_capi = Py_None;
+  int ifault = 0;
+  static char *capi_kwlist[] = {"n","is",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:statlib.prho",\
+    capi_kwlist,&n_capi,&is_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ifault */
+  /* Processing variable is */
+    f2py_success = int_from_pyobj(&is,is_capi,"statlib.prho() 2nd argument (is) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"statlib.prho() 1st argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  prho_return_value = (*f2py_func)(&n,&is,&ifault);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",ifault);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of is*/
+  /* End of cleaning variable is */
+  /* End of cleaning variable ifault */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of prho ********************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"swilk",-1,{{-1}},0,(char *)F_FUNC(swilk,SWILK),(f2py_init_func)f2py_rout_statlib_swilk,doc_f2py_rout_statlib_swilk},
+  {"wprob",-1,{{-1}},0,(char *)F_FUNC(wprob,WPROB),(f2py_init_func)f2py_rout_statlib_wprob,doc_f2py_rout_statlib_wprob},
+  {"gscale",-1,{{-1}},0,(char *)F_FUNC(gscale,GSCALE),(f2py_init_func)f2py_rout_statlib_gscale,doc_f2py_rout_statlib_gscale},
+  {"prho",-1,{{-1}},0,(char *)F_FUNC(prho,PRHO),(f2py_init_func)f2py_rout_statlib_prho,doc_f2py_rout_statlib_prho},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "statlib",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_statlib(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initstatlib(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = statlib_module = PyModule_Create(&moduledef);
+#else
+  m = statlib_module = Py_InitModule("statlib", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module statlib (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'statlib' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  a,w,pw,ifault = swilk(x,a,init=0,n1=n)\n"
+"  astart,a1,ifault = wprob(test,other)\n"
+"  astart,a1,ifault = gscale(test,other)\n"
+"  ifault = prho(n,is)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  statlib_error = PyErr_NewException ("statlib.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"statlib");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
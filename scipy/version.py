@@ -0,0 +1,10 @@
+
+# THIS FILE IS GENERATED FROM SCIPY SETUP.PY
+short_version = '0.11.0'
+version = '0.11.0'
+full_version = '0.11.0.dev-b3b531e'
+git_revision = 'b3b531e50fcd331e03b9d835186a8d581e1d2aca'
+release = False
+
+if not release:
+    version = full_version